@@ -0,0 +1,7 @@
+CREATE TABLE vocabularies(id SERIAL PRIMARY KEY,
+                          extractor TEXT NOT NULL,
+                          vocabulary TEXT NOT NULL,
+                          created TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP NOT NULL);
+
+ALTER TABLE albums ADD COLUMN bow TEXT;
+ALTER TABLE albums ADD COLUMN bow_vocabulary INTEGER REFERENCES vocabularies (id);
@@ -0,0 +1,8 @@
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAZpdAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xoNsiEbBEA+MB3yYostCUhUSIr3f3rmnxpjUw5Dti+koTb3mnfRUZzPVkhvLv4BR+lXGIwTvnKS3z3cu5cMrz0+Lg4JY54/cQhmwaujGjKg/C/UcHuOa4pGsOznvL4MzKXdjyCO/HDhl5SxvX856zy41d/ObpYw6PjoOqRdlUU8HWk72HOF/9q723s9QKYjX5vjeWnB3o1BDg24UQ8OzKLrO7sC30Iz5oeNq3tWzhq1mYJ9eF2PaRbymH7hanlNLuoUSZIeFlKAO7zKCv4DWi9LzibSSxWU9rSlnEUOoCpLHoXqDmo8cDXb/mwrbu1W6UFAglQQyc4wTQSeQZ6otFmAP0pplAAkC6U42dI98M9iAhSP6adCSfDbnOkl1xqdJsOnZAAAAGO0KXMC2tD8AAbYDmAkAAKGsQz+xxGf7AgAAAAAEWVo=' WHERE catalog = 'CAD 3420' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAPpdAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xoNsmEGMOY7nERYT/UWJtveNKSxqJOeRE7TSB/ah7NYiJtI2DvFW3JwDoyHo3olluR2ZrM9x8t5mfwbeTtp69AzO4msPY3EMxrVb/59ziTWr1nQNY2puwDu0rzxXDFOcNcXXbCjPWE+TwIEaMy80h2B5QOkFxLGdbAXaLmffp/+Miw8AAAClXLLKpRP8jQABlgKYCQAAJ4CPBbHEZ/sCAAAAAARZWg==' WHERE catalog = '093624979357' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAcddAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xnkNbcKAjCHAqvJZIOSjraIeVQdOGQI9RBIwU0PZyAe34y3085yrktoxtfGuewdiALL8cTEuQj7TwjqCMI7b0ydqeprm0vCrTePQFWO+umQXOwEq11La2REkTBSHdrDhBapETp2wBv+z8IdOJVSRVE1mJ9oAelMZ68uMXfm30uaTuxXuQdGPwBNQEbJj+nRj+PeAuIlqNvMXFLo4QUYWDifBV47j5Fz/W0IAcDvy6ld3kgDjSh98HycURb0ejnIGt9p7b2qdULULcfvqd6LAzbxU61XAccWLySi6y6Us1//4DfHijv0ZqmYy5LAFVJPJ6qH8uCdbDASOogQLVsiGWX9nUrrTm67nuiZ5oLRp1WXgpc4qj3wBaSpomaGng1xQ8I58QST2iKSSv6l2wuGEUpHWCE2a5Ar6m8BFutZuREb59M2LGMG0n98rBB4B8vRbAAAZHmLAetoItgAB4wOYCQAA5TUAY7HEZ/sCAAAAAARZWg==' WHERE catalog = 'TestCategoryNotaReal 001' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAeJdAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xnkNa76wJXsa6IZGljavaVxxc3IZyIhI9YyIKk8gdO/JWepDESjPm3+sN6ZqH18GCFmBZADBQzrAAAGG5/snsO6ZN+xzzMWJaK+uHLU4HLty3eFhXvZihY1AnBa5YvGUrE3zA8+A8WQ/RwXVnCuzg8p8Hmrkysw/a7q2BaruecxBy0V8sLkFWzkKkGliHCmDaFmzfIsJcU5k6wp1Kw+KhK7irVB82mbDxMOmqrc13W7qEqrWHKrGVcLe+eFX4mJb1jTWNj4/r6jZ7PAeOzHwZbdBpQiTwy5r1zIHOJCQbnLRZdNDjcUfwaZKGbY40A794awTx8FmfAvpMpXws7A91ui2qIaPFIFXZPR/S17cpgUEvpvZjjSPTAR6FcsijutvTh/Rd3c+Gevx0LMcNrlJYmGmhEu2b+K+isKkNIHVFJka446AJQ18rqfzn4PQ6gXs2FEgcc5OZLH6VKYSWmCVUuu9wPnXF4vqxaV0AAAASuXK1qHmKDEAAf4DmAkAAKAkSNyxxGf7AgAAAAAEWVo=' WHERE catalog = '06・5P-74' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAbVdAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xnkNcQ8D+VdVyMy59iBxotHpXCBBNQSW0m3QgVugnRqL1aCQsBLTbn6Tx65N7tRJ/jaQAE8qkfVIGQcC31lE4L9va3/rZ7Hz5mUCmTWDa+VCy+GdMaaKaxC4X29ULZphXQFhLIcEJbaO/FGwqQFOGrJN5KYFoQf9hziWa89ng8Gpa0xzNQWJyK/7TOQnFjQnMeaUtFoO3YuTlb+qd7aScLOig4taLVG88OGvaEAtlKdrx4dHvCbOnZPR1lVn/FjIXDXaHPrSbr1YXR/yOJKlvnuNx7Ib+Xf1UC48CFr7tJh4rxobsloYZRQABXDUEVLlKoTH1TjpKagguP8DPR8NSS86gPqn5hbtBeMzs0X1M768jngziyunOCErnzwYoYnq3YuDxKQTD34nDITl7syv4RQmY/2ZWg3FVsBSNIO7AAAAANmXjwYV6EH5AAHRA5gJAABDk7IqscRn+wIAAAAABFla' WHERE catalog = 'OL 5670' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAgddAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xnkNdiMFECG58v5L/nGWwV1+A5eH8bO7pfUbywmZGMyGhvwnLwNiodWdOhjKy7+gGdBMnIGwnNTlH412BQDG1EOXSHA8Z0H/PjCgXo35G9ryhQn2mk5hJWvxaK4R3D5R5Y7siyY24wKm/LzQFMtp6oXdcBoYGGMioSLDO1IutVxcFHTIKEf5KI6+xJXP01yV/SHSWUCWMIhT7PGb0Ajf6KwCaQirzK5VQkOlRELO1EO8OpEt0lw8XZX2rKC2xHQUwN48wC9CsUjv7ukliNZ1PuRfsftrwFcX2yESRDE9+u/4KgmW+sQKi1jnGsLAnPcCpOEjCbpx0ZNYsb9+KrtCjaySt4aZ/TZkiyK6LMndfU/l8AnrgWV0A8GegebH0b0W15xwI84ihGTcckCpu287pLCKZLaJWi3uxTpk0i54n5N/wK2PeQkYhqbNnLGxkClvZrpnOJAc3fD4EXSKCrGr9uDZYybD/y5QJIQF+lpoaRLazntaGGXrGzvyaMHFzrZdAqHfoCg906rn2optD3NCAAAApbiwvNJi4tEAAaMEmAkAAJnjeN6xxGf7AgAAAAAEWVo=' WHERE catalog = 'SP-70040' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAZ1dAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xnkNc9u81BtWD3Xzl1udxeIHF0zbbywHs3d6pBxHxPtIM5FLzigPAmhMOMzBUBihN30FRhjGwocwUGMpvzeO46PGrb6Qhu9VdHJDPTsA2ENC+J4wUA7Ij9MjJQy5Ch4COY96qvSIXhHT8phCGRoE4ud6fkwTAQhnkTrY93P/Nt4LRi8M2hrCt7Zn5RSHzmwZhVjNajMX7uJXC+wdiYdkdasfWff56zpH/QaGvBCtTua6BrH0+vcRBR2vbAePZ+y9iCuxhCfEQflI/cME2tj+1rWUvTWgNfFtTksao+RB6ZpBlszAmKO264bcw6uOzeOIU4oPfO6X5GwlC5KLdHXObRzftLhcu4Eb5ibDsM3YLNVIqGZGA0odtIpZM2O9KsLN87g8z3oAAAAAAOFStOSLcUTZAAG5A5gJAAB0HhXOscRn+wIAAAAABFla' WHERE catalog = 'TPLP101' ;
+UPDATE albums SET signature = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ASXAaRdAEABDnalFK+McwL5b1OXC0JaugwcV0UbXP84+MR/18JVYWTvLlX1KFYzMlKT2mlHpIxIpzTTa7hki6yjXAWVCddOq885ohmk3XHB60VL6AvydL4RchXLaZ3CZ6qzMv3dLD42zalSCS4GLd0hNxxieg8o6THJ0GF9xnkNdODtxkQ8z7s3xQdcjW9zd/pJckvQ32LxkWKloTkCudzKILJRRA93EQDlepknBgYWINgk9aq4dk4Cnjy6R9XFnGL19vOTYs/UAhuSAnHTlppvk2HEn31ZBIRf6d7LO1dkxDdfxPFMbENxqatOpA9J8s8bkb9pZ7+vO1ELb96x/FsFbQCNsHDSUdjdQumGtDK5CZa352ZdJEmM3G5lDc2rAjH5pyfF1HpvU93qZTwc4UOoOKUrfP/PSp+TiS2yUHxsIRXuI9Omy5g5wCa2CuqTWHfEnS7J9teicsHz3Mb+e/sabk9N0jPu1S1imIKBNXX9a+RACswfHYgxGr/t74pFXtc9EJO6jJ8onPURWw4MAZDlFDCRygza/xa6NrSHWBxIQDw2vFvhgNDGnwBtzKAFCiz0iQABwAOYCQAAfUI44rHEZ/sCAAAAAARZWg==' WHERE catalog = '19075965221' ;
@@ -0,0 +1 @@
+ALTER TABLE albums ADD COLUMN signature TEXT;
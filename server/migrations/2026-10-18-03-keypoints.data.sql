@@ -0,0 +1,8 @@
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AF3ATJdAEABDnSMPSUE6+N9ce2rbujgm4iBzLetYIfqdz8e3qcGDO4UQgmhFVr2HHNh1FL9OKBVkcTztHHuE67S1ciubeeCNSOZfgDZA2vHxOFpfY0XXYJFZWI2PvrLKqw4te+c//B0zlRey2x2PNif77Wyh9m2EEBA4jrKWiZKZ1QpQPYDV0L5KTvsaQ50QHVfoSzuv3QbZmh5yZNeJDSbq+8OhnSuI6hHQ7RG7k3Lyssc/z3bEgxe65sq+xulx8EyKdpHA1Ji1qEgUG35qBmVOFznWggst6bQjvw9cHl34mDTBgxKYTW/u7Pwi6B01sxavsbXKMhjjwT1+1DObB50kMy8qRn2woLEYTnIMtN271MJ1YM/X0k6DTiazpR1rgDlHfBencDuYcgK2yRbzHzq3q8c/ypphQAAAOYQbpkWcnOCAAHOAvgCAABfEiHSscRn+wIAAAAABFla' WHERE catalog = 'CAD 3420' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AVKA+JdAEABDnGQNqnE0Pg0nEuaNM8aiOHs2TxHFrkpKB98Pnu1CJBWHu2texH0/0T1HDNUfCUKkzDsIsH2VVKhLspCvh/syhctBjcN+6OlRzi5K/sYH8eBjtdQEpVZIbC4/rN3sZsw0Gz8W7lphBZ6oFTPE+x5mI8NWXr2gAup1okNC9APpxMQ0KmGgHsEPDW8O1Y1mkaeGdxCeXZ7U7zwuM0wAvDtVQJY8oKR4AfKfGZUe71HB6dMexA0b8WJZnsr99LC6KIscjSDl5zi2BsQUxCleACiv0gP4w1KF9Ya2hzoc5FDvS+1B2i/wt2Wsnv3XXDcS0Qxv7Tbl2O9H6eLPBt3WeV/LhysZHxtBjkqo6QJ9D1CBwjcOAVJTeEZA8+7XDNlbrAJyNHSWCj3fxxdIKvLkxr+vkesZY8Enf8bvG/J3qjkvBLzXYuay1JFGKVx1WZxcb1dQe6CqRr8VVqvCcs085XiJoSuezOSakA1re1VWj8g4/k+o0IhoMfes6rrEJG24xaSRxnTG1Mgzj6JbWmHpSDXAI08CKSWeKuLYvGN2PjrIgTHS/3k02lWBIyvjAcSOUw8/O7rV9s9/zp90DQWrNB6UAvrH/M9la6Et6WNOopGEQ1RIelImVuufBWnmjqofMtosGizKVW/hm5XTg1r+sBP7teR04rJEnaeDCmPSsxPgzMqm9s4L+g243smGA6LfzjSCzsj0Ul35QjIwfeSsaGYTg7D9dxJR9eU9X0cfsb6GkeAu+5FH45kNp4+Dy4rmrCG4vvLfsa7JUofYz8rt+hAbfEvJZVgCd2uNzxffBICtNZYeAn49WR47gI5WhLEltP/erLORPvBz5nc8NsUr2byvDfIKvAjBtoC+L5NKhJ01DznNJQ3mK0a+EJM3+BpOd9HXAjSZRie6LzXaqegEu0bE4TGTmW6bkZ+5vo4wN6ESphB92f1E/bgR7HLyibZ9PvF8vc9G90xjlWOyIht7TkDEmISHfnz1bkMK5IbGppqyP01U3OfJqsG/UtKgL+Qv4U/qx/S5YGh8yHoXFqSUUL0r0ucRvTzypgI8oouM0drNqNfsCPreFBY2CYos8aW6dJ0BMEYBogB1fDC8sFDbnVjBApg7vbgCzCNpndm18CjNbi+EOzPPAdW6ZzUfK5cKa68EEx39r/M8MkZvdg8+MwoSHXX0X3p8NYQTe9eVu+v2Aljsr+hA9PIVkmVsBmruVTn8XXdrWX5O91dPnWMDXjagrZL7jfI7LLGvDFevWcRetU0okYH5N/ykK7tv6esGJDbZltPfP0cyhqjuQRGTAxtA6HD2AiLrRKBz5V/+ezPbyQAAABWP6N1fTZTNQAB/gfLCgAAdZw28rHEZ/sCAAAAAARZWg==' WHERE catalog = '093624979357' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AISAZ9dAEABDm2pyEm7bQ+4R9oSYE7J4YFRKbypiSmYAqn8/mecY+B8LD6eV3B4D/LI80uO+yhTabV2ffOaj3zFddzrUz9gyJOg/y56mzGMiiz6SIKxG7Alu6HEYYFS/hrQvs8iofj+bk5aUlr9TbKq8JkPFTIFidG6PEHLTSkoSOaT+KBRrXy9h3IJ+Thgq4ibThecldA4pVdNvPIsoQCcThhCdI2Fgkta04ua/tBgChPS96Og0fpYo8X5t/PfHcS7a7fvFySGGM5H4WvqE9ep/eSsPuz3j45KLBB4wKi9d3HSu39uox13KqMpau7EJgek1ROQtgPX6CvVVxIIwHJHtgnj3z1aG4IgD3GsrE32w711w3g1E6szxwnWmCGQES7BEQBGdU/hsVNOXoaRlPEd+JhoEglHt4l71ndCW772MDi26h5f9tWnNUDzqqlHdl0jfMFJmo2fSZ05EVoDCNKCcnoXeqtTvToDLcWKFXU7G0iqnFTrIjreVpCMp+IDbTz3c4CR59v6P8hXfJ8Ef0zcXBHUsPZQG31xiUnRMyt9No2EdoAAAF3fCDcCWzk2AAG7A5MEAAAtqwRcscRn+wIAAAAABFla' WHERE catalog = 'TestCategoryNotaReal 001' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4A17CSddAEABDnTQk7PE0Puos54jMzNDUCj4zLetYIfqdz8e3qcGDO4UQgmhFVr2HHNh1FL9OKBVkcTztHHuE67S1ciubeeCNSOZfgDZA2vHxOFpfY0XXYJFZWI2Txe1QKp4iu/0Z8PdWaSTVm44alRypaGTM6yd0UqH945Wr2xSnCJMwpvbEMe2MtZqHkQWlaDaBIiQMgIB5NUyUqFzENO+sA/Fkg4ppWwygvizwj4ztafXoQMBi4C89TYivEAalxU2H5Y94rJdSkUDZQSx6YD8LAWy/08n6xSpc1AFKEXUlBX5irE4Nfn+JVJL7umUmBghgQaBBz6lpV7cBWsP1BnrrMUVKPJLu3KBHxZTJE/JGRakZ4fXOeSjN6qZiTUgJkUGH0U5U8ghyCCvDvulwy399Na25wzKJK2oLtmuV0cATCyxtjT/r1FMTVH38CcEL3zHoOOzOKgomk595PLzXiID5fFcmiGBsmqyuZEI94XP9sKlvvZihMFaARQwZnI3OZ1hIpUF5fb2HxlRRipdPtVaYAnbxxXPy+kyWHExrX6SaYr2ENVW3N/V5cCBCkzPIDCKucN1CxPLasXa/ge8cap+m0awJJ8omUJPf9IEFZ7EC9Vpi5nP3rQkYF193lm6RyN2H69Cv0Rk2rbz/ObyLNeGbGXObL9sJkMkTGx8mOq5UjpD6ktWvQM3fNOTfraSwalVosVeHWLerqF3hAHzijJMmFvZv3u+TuGYrS0udGQnc3Ry9ALrD5NYYINnNEg360QxbO+17ntrsTDmy4F2KTnQ2XhbQoCARWB35Cn42bo49XarJgvTMxqKDZVoESl3tStXnLUSQik1volfaeyQxeuyvaJ1dQThYwNEBOepfH4hMH2OPl1bx6sgV4bFceKuTZdQNIsxMc3gYFnz1ucKvJN7Jv9Dd9JKL2nkXZ6QbvXiSmWpP53A6er+Dj1KX+Fzp0ChrZCfLOg1gA8TqCJMmvwSYe9mUZZAXDIXT36ot0+i0srtsRuV/PMT3Dgs46hhCZrCir8gp4VdoqNzcrlUSxWTQjaKc0naWRnp2QwHzvMOlkq4WM949aYAw+2pAGoBsze4DEk2CPbZhkalw0XpHdGni+cfpo+nAaEK671y7HCPU/QweiD1O+5mOrBOVSb+KU6NKF4AdTd+Rb6LLW/OgZ+pYMvvh96dLg+mMveN2A26cqZsreWKtzZ1On7mBNFhx4tu6AjzKEYYEggNzshhQN+pNQCsFuOxVaZ4X/lUWHqIQ4aS1eAKgIvwguXY2MV6Pxh6YQHgQ3/V4g2JZoY5PlIxANeV/Nd2V6hC8VA2OlyMDW265NVHjPV1xtATE5YT6GwCUwWiWDVPgVNgpy1zBvLXm5OfBPno0Xgd/LT6ioGeekzcPIFEcB0KZCfa+kW+TbDOIaAOLsnwzRxlXHocBmz5Uz2zlhy2Y5BwC+UmDecz6gMrq48rLk5I/E8CP0Q0itZUEyiAb+BxhT4Cm27jBiZ51A0gVpYRlmncTqY1XCKOGLpFrM82Z7ZhG9BkzB5ZqrBIt/sQf5atKjWpqM6SkqAFRFm3/ZGbeyDNgzNNYb6cOzon8TCJMA0V4RgiJnpEHUxN8n9aiZRd1zmbgTgxJQV6Xfz+1OesWp7Mu02NkeXQhAzr6ktp78QeEQ4LveyRiPwmqZzE7ftLBk/212VIZq7Y8l47DBVzKy2Vf6I5PD6hLSmhq2jeKbLwVf+OcgzzFeqUhWLu7/oxhAzm3jd2+ZDZsz04xGKMFBWwFmQzSQCjo5wskslcMmICw22sylHYFFQEYa7gXICuhLhCT0OjC4P6bAQtBKC1I7spuGMMn3ExbI9dVkFRgit35F1iyQyoSVI6nYYetGAoVrE+MX/Hj7t/RMwu/M1tXCn0c09UWvugPjauq9ne7jOHyQBpeN+6U0JZHJWMl0h3E5Rz6Whvd/C1hhQ6XVDgb7S60o9rkxBLxJdF6wFto1QAQqlvQ46BtFKx0fAcV52P2pGvF7HgnZnuETBDhjSztX93ilaTNES52WyBYFWuA06Jk62W3bhKnmU+MEb50s/cHyg0uSCy9VrXrChCYZPYgA+5Vl2PRy+/dO/CRz0I3KObFgteXXbHQLYE+k2Tm09n1m0UNgpJVLYOyQ1n4hD03Hupdr+ofxN3Pg7SiWoywSK3UXT4mpMNTZY8rUlUYS7boDDuGpehMK0ZqB7gUANUO757Gw25yPYsjO9p7YsfDHSGYhOj0fIUbkBqoCMld3BAlAH0eQZeoMZlYJnZ3vMmcE8mGlsZwXLyVCzrRGEm544+292gnnlNFWzHaVVuye8pEhzejxIesah3hI/V1C/Xa7FBK9zrlTyj8tXoSMtXzn7iuLzjrAb7JWHE56T9i4Q3zDAprjvU0QebgfcY4EKtMmo3vTqIGRFdXuNq0u8kJ3OiCYmE8BLHkZ/XRP16la8wFrPU9eJygoAY5BiELOD/pVG/k/EsZ3CTkT8lYlmkIdMHDIXb6hBnoQa1UdXne8ansFZV5uu8LYnbT5+VXJp4eo/0raIyN7yKxDrh74KtdUj2CIoCj+24jAKNQJH3r1zfY2LZNKCFxauy9DQv9KjvFd6y84YjMcYlPq74E6K+v2vguJL2+smfABzpsYN0p+gRIBZOkJ9iYNEs1cHAsGJMeSQqqWbJ5K5cNE+DaCXTLNtm8/WGAEa2YCj26qQxP+4PpxbCP7uxun8dvskjXZwOiOTc1dXYLR49Uc1FQnOXljO1rGjxtN7gFTC0v7dCGess/AL4iVu+hl0E83A5n01Eo7X1ndiP6vm4K3SSIPPx+M6ff0+1A9VjcPvZdRVCDlzqOohjRgrSAkZbhShT4Jf0hSdkGyxiOlq0Fus2c3gLWbQouY+/tiXfbO1rHfO3sVPObNlwPf61ceknNVOwREc/tRcbFcVQXiZ2zewJeYds0JVVCZ7SDB9XRJmsGVWbvxkj1hKhZnMXBbSZKe1iNyaqHOoU+s+HG+TLEDz7Yn4k9npXcTCzX32E+k2xq0pHxBxK1ikby6vrrFTj94FDYABD9rFgcCKeU4o9FHKBsRCjq8RGLB1TU4RK5RUtbQIZ8Ct5YLhAy5PHn645tDCq7Dec8bsVpXDcAzJLj6tgM8rPtEmJ6RxAjQAAXz504Lq7eLQAAcMS/BoAAJzzCJOxxGf7AgAAAAAEWVo=' WHERE catalog = '06・5P-74' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ApjB2RdAEABDnM46fKE6+AJPpcibKe055+i73HuScrkMZwpJYW9AdSHUPozKktlzU/xynQnya0he1LXNO4EsUNeF0uuw0VNt8S5osKpvTs0QeatR9y0rvX61+ES5WXU1mgjSOWc1o3+VlKmRpHMwG1ikaYrxdeAesrCkootHAK/Y3TurgiqYwkJmi1AFWwrcIQSf68oSjJaKkOvXV4M7gvAiHrMzOOROxCQaiqGVvMKBGrRTqI6IS5TFZAFyDFK8PJQ/se7Tk15qQjaGSnEOp4yY7Xkyi+0WO/yDe3E6fdE6Byi8mTf++qWufTYniD6wlnRyk03e1jHxwP1iMdYgROl7Dm6LmEHmh3BMoVDvdskt/YrO3hXEcmwqwALT6GkdRk6/0vq+PVG7ResAoewHM6vNHrOG4sNhxPCd79IHz1Gy3wBKhqG7ehCEXAViCii6xejWWn4Zkm+09iJI5Tccxh23JYngE/6jZdhArkunW69Rf+Y+uagmAofCl0RuAO8mtaknxGu9JOYFf0+qLieOoBG2M+/3IWvKluqkW1oGDqyJBkhXcKxmCBoH/JedUYMjLSb0Fi4KTarLO0z7kbW0OlHO3SltrwbyHh+Z0JUjr5Ze4qOJV6477FmWvO+9ExhVPSKxdssdHHAIUDtW/clNVXJweQW2XLD9KCDAmffoxRS+m908y+en5E3zLOz2zIbgq2tiFIilsdCxZJD7Xth57wvdbeAZduIPx3JP58TbVENwfP7uFy3eFaf9Uw37di9PFBdqmxITHGMK6fzSvg9lbflrM54lXEEwh6IDLNBKAjzo+S6BK+fp1xiQ6ErrvlZ41eVoqRhWoRPzfkhtn0gEJMduefA0Xat1hh82/llbjlmefVQ8HIW/PNvL/FItAopJAuOSmiIZoOyzoT9tAHNDnWjNEHfnQyT9wtOdXoUAIM7NqYdte9pLywvJ/+79KoXM5+oeK6+7mdn+9jWLUzPG0xP9gBPkqnJaJm6rg6sP4ZhUa48xRG4y1H0oSny6d1haCp6fH/Ahj8W6DMJQqB6+S4AtByatRs7GnAADWSog3ecmM3/boDxaLwO/C6XUAmtW18+WYT9uwE6OosCh0gzqEJcwRkkrxlV34jkzbhA50AIM/+wMDg4I1hxqOmEkB3u3hYss6AM4rl1dAjy5GFNoaSSc9EzexTJ2PAqS3QCMBWLQDMAL93yxoTXeFj9dyGhb3ZiTy6MpXV1UGDUrOiJ2uQuw0H5r7rs0T6zJIM8vDb6uE0YyiL5kilJc/cBkAFUtYz7Fforiy1oqwLX1oZOGfHWQm7FCRS5H7jw/n1MrknwgmUq99eHoT+13n+qKXSOAJB9YofCkYx3vnrn4iNAK4C9J3rRsyk2B0NhC0d6RVhs0aebExVPjQ8cC9ebI17ZsgywYh3l4Hpi0gpdyzxAqZF0Um3HAVml0+ggDxcLRTeVZrBAE26CNVjFZxJ13N2QB8nOclAEQtgmkAHSzXXi2d266J74cnYF8xmlBvb++qVEdDUd47JAkyMChwjGBvEIFHIfLDa7RXKx5kl5T2qGPICCisupBVnE56Gr3CEd7PO0mfE0fRjkPoCSS3nFMafzD+ldiq4eB5WbXGM7D2wqfuW78vz9SDZhX7PHzjFhprfHnobvSI0K796MVrAQG3ZI2nNuZiPuEjIEdD/+EPPp1Rzfbh0AtYExMKXK7LVur28ObWxKWUK/GCET4ju1uTARypmPIMZYyOo8qFk4yBFnuBLdtZjHznXV8C467BropZC5bzWyrLzvUPxXd+AkIExOxmeSPPmSnp05mtUrcxadJ9dCPW68k7wIoze4wBRGOV1Io2JcAlLd2wYtlenMbT2+qWTzKSre80GO4Fg0h31zTJDQz2iWuzcpoUGLeKM//jCWiKVSjGKZqGTMbssl9eULXnZptlml7ixK4MGeFFAiZGMogU+gUmfB+bwSTmiltDAAF7WhGU2To1ygeeB9EQCK1e4meqUteSmTGU6I41WJ8xvXqUzLzFVrZEgFR4cX3N4fRb92izZ+iwoq55fShiRR9guuBzW4ApnGfUnfYQkMyY6yx+M8YAu8zTuPF/89Ta+TJZl7402czsyq1zDRV7SJx0xGr9DGh7LexoU4ZC9NtPRjhsc95F3Qj6/LXoKb+KUiclwGUNKKSNzdT997bBOECcPzCY5WyAXKy8040m5rWJCI//i6kdF0MZi+So/MdCoJxtZ7yqi2R9E+jvUBQxuOB49fqkIZzel+aC+2C/HzLGf7FRlvxeDWO2q4PVyqeTidAQtILGp/YuC8A1QRTAMzh3Cx+FTINcaRn37CTbPbTd09gvpsfl/Fs5SSvxvBozz5GgrlD3jYM1jY8u5cukDQLOzMOcjeYbs0WTG9gOrKnamcu2k9P/AFA9ExqKbobb31F2oMf5ot+s3X8CpSiVIsE/wQ6c77A/s4pB7mscIjBtJ0YnzGUeDTUSkG8gSdhe34+eEm2c2hBE+Rjk1z0CE+a/pucMzKcOxctLd8o2DFQDYrEWNwVQJXhnezADsYU2BUcyq6AAGAD+QUAAAXiocdscRn+wIAAAAABFla' WHERE catalog = 'OL 5670' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AaiBOxdAEABDndaS5YMtQGyJ4xZbtRlAsQoo4r12+dAHBmGzO0bf61+E78M/K7MfLMwi4FSff9pB0kLgLATjvRlrN0+BiqI5ZUXGqzFEQOLobiEw9fvmkxmCC2hcqr0j7u6Wotfc92pv1AC3FlraJrmjFbuMJ/gJJyECjIPWfBRKzJOwG2MxHn3mY1THX3oBhdwWLzIe5MC6/UO7deLel3Mm7QO+APnb79Kw73EOTdirQ3LFe1RJVANGv6a0GfchhyE/6QR0R4SQUf5/qmwimdgXl8D8ihPOuwc7sItakugVOq3K/Px5RGQmKCzi2jmKlAuNB2CbkApVspXPKJW+usIkX8GwxtS14nIRg+VqRn9f2vyxPtS7RUq8726NFC0h4ZlCqlPOSvi62p3JcvGCrNucGK4pJi84QIHqQ9KdAal7F5akHK8U8hSD4L/QVzvzDutPSLDQfC46YBNumwqaglH64lzAOGSdnukltkgT9ATzSQ70C86mt4JLs7Zbt3stsc+J6F/LfnnX9gcSlmwE27ivw1z0vC43nGa/+Q1EGU81JRQME7aK3L9yWz3wGTUU2eO/peYZuKWOk8H82IkJo9Lf6mptir98DLsX49ibgKef+mzNjJacJwRpf9n96pKf9NtHFk0FqqyYRLjZjBZ051oRCtg0+PbWiQdASUXJ5/kAocWuxAXbogMheLTVMkiU+yQPL/Utu7fTk956pV8u6KQEjJGuw9QhbD94z4M1gpVWuwV6UOdDBcDEVIpERYFV1Jp5Za1x2HO9TNpZmjL6GCajtrfLOfaJUGNeZX9SksJnUVRbwq27mb9K/icUeefQb34dow6nWvkoXnH0o1dquVPvgLJ/CgksUEEc7ZLWzVdJr4DLErH8nv1ihRSbPl4iM+q+EBQJ1xyTNFQt0IaUEmPG4aXggts0H81e+FWz4ELLK64kE/q2Os1aUwgMc3zwdLAkjnl0irwaOHWZqJrCyU/SryaGPn1vNws5tpHCj+Y2BGeI3Hgl/P9vz7QTm66u1Rz7WGIhlcu9tOWQhRHbLQJBDBXHbpLRcCL0PmUuidycP7KJYjUczrnjYuYE1ywXKjljR+bT+6SPDndPpKPuQiS3ChNqEVdMHm2Q+pQPNjuDPMpkyj7B9mcPOb0w1covOLsYck4ayIfd6+xaROAt+qfVF8jmqbIIWlck/d5TrtNEaD5Atg668qIzDSzHhzx/toMMAJFaj6LEsQqcFdYarWvYHhBWYB81K6TCgTkplVwyXowqg1HcbdkO7exYmrfjy4NojUj1UV2TiTczfps/H0IcJ1aS94OvywVuhPJxOwuaGWBFnxpBW0pqrwGp+1Z36OUP6uJHq+zXjLWT8T9aOKQF7aocZZSrrQfeA1Lm/6D3GN8C/uf0uEd2M1wV/eCgQlreGOXu9qdDqZBAbNmmwq3/wcd+ZuH4gQ6mksmLpMtV6aa1hUJjEMD7DVOKuNN4aJKTinefCWl0QCa+eR2/IK1cacFaCH/mDetU3/8HSSIVjMFQ+jCgTbww5AmqYF9UJ2NsXHCeimwdmbJysH131aQwStLtleou16dFVF626Ax8v4eVZBfcCIrc6hoZKpDmNjv5NxKF/RZsfDeWLDc94nbn0wEDOCpdQLJrqf188xzzJenIerSehZ1tNbMlOtsT4A5Xwphpai2MbkVVTht/NvvAADkjNFQ3GDG0wABiAqjDQAAcX8ALLHEZ/sCAAAAAARZWg==' WHERE catalog = 'SP-70040' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ArDB8hdAEABDnl5zmpphHtjVVAyZ2IS83jEtsvia5u2OcgwvtXdtAfefXTGFqzaPIZtaWGO4mMtIcf1nF3JMqyzqEZ3KU7wYZu1+IUHoDUozPMQsRP6E7ZwZjr3VCNCRs+qH+fib4Ya9k0GLJBHOQ9eflYS9rWpukN+ZQdMi7ZVuY7VPJ1bQrTvhXpnFPZ6JzZagKwOVkGOAzTAWlq6f+/841S8Nkl0oVCaslODeeyvq2PxPvAjP6iWmOlCjFzjhGt62HOiK6ag3K2QBf/K3zG5FMoKoQKyQcrGwl28NKcufqiLnKOHrE/4aYaLBw853G+gdk0SP0T9Mj0Hofpy7yG4R0o53foOzH/Ka0DaJ3xgOV5LNagE1xVwxYRQn1kGdv+Yup6rr2PAxJm2hDmIeknc6dY6ihhEnItqDfi6LmzIAycX32oUupstmr/z75RIM0sKyteFwI/LB20S3Ja2PE2Nxf2aol/yby357KzyuBKsoqFkSgv0uhh6HUtdOFE1gHTWp16Wfa+iZczzWLS8qlb6r3UNYlEOxRS+da6QTTVfE8i7x9UtlWa0b8ZLTkx04nnHc4CNFXcCAc70J4xHzL4QhXn5bCnMatm2Qc/EkDh9oeTOpfOv7QggBA49pQ8a/SKOuE4p0FmJ9euglQQOW59oZHFrIjj0aUhg0INGKgawdMvPowlNBdFMvUhcjtUyeE6PFg02VoaQF3b7EXPvhpQQ5Xw72HUxBCeiU2jTObl9gfWE82zCPzD3cN6JZSNKfQbjNiXEACJUE5vbXBp24HL6Smd8QcYX9imwjHt1P+k/sZ4WBalDv7ocjdaytmNu3jElLeZQ43YOH0ebkFKH42Qo9b0iH8XmNk40mUG12xjjhyMvjWop2isd4ROtvvcAeXNLwQBELqlRkjIVg8cj1mWxM7cMuG/5RWjQlxH0G15KBqlI8A9wyhSRlRtqKERkB7BYu+6KsfDARxhITFHYN6p71Hws7MGQyLJTNzFPkjjgpEWam/48qbOYi6/4RPWsV2jw67HQGijNVhup8WYaS/zf5/8LtyH8fX6E5ibfH4O3jlje1c1qceloKzM63t9DSObJujJLDPNqUZKQ/UyAD3uMJ5smBiIBRRUQo3uAdTq7REoraG8QUlP9zsmvb0Y9zltiVWj/jKCH+YN8EyTgDEUR9hWDUu6IObqza+S0VIKtdRGvDqS9Hk3ZDa81SiqXC+bBF+WxCxaJ0NG6SXBe0XQ7UOdwky/SsmD2d6QE6BrXx0eGi/Qs8NjXPZWSKpB9XVLBwFCs8uSgNIiGvG2N4hJ0r7iqsyhGT4JqZ9SAnhdHJx7NURxVzCdMAO8c9I+NEj9sFcg4CqXTUIDO1KDEVUd/mWwjDDYkcbDSwiOqlhmA17MUBBJ88KLWdeElMBsF7mWe8/pVZM37U16qAf1MJZ2sRS7sf/G7F8itX4w/0E4rJ9abGkXmxs1tCqlqAsEv4gM22mRbxWdJYtMU/w9kLxp1AAhTopfttO6P1iX6pC/ayV/waoNfmOuc0uA9kZNIXaaUfJdTkzAxL/0z3kJ2C/FbJ6qHuChrpEdXFiDD8rIKayQD+OqYEIAUiRK309RFPyOPfiPfg+w5Wi1Y/WjdddO2vDvpZQINBhK6xuBXTkxKPKJkLt6U5hwbf3d/3tpw+anliIkbeLnYM97mhUt4wXxsJp2d5nQiNmejqvs/tx/apzNuMuvcUT2NZfcY3Uj9jsP7db6zW/FFRESPO7kWarOGrNonEuxo0dhCBClEhXH6rmnHFFqnyJCbQ5ABMclMAx1ywHRudT8v83dudMEPC0CZwCNSdYOaoc2ajhP3/rcaoU4A6KNs+ye94yV/mXBsTlWl5LVXRg4JmKbrowQoLeE44vWLdpgyi6tElq6E6hApI+48YHQkP4JXkfXnBz1138WHJOBJo85vGbjQTK1AMzG+wVXD66ULFLw3X1ILOomeLli+9c6dVKswJLYnoNtseYF24qhHiOc+T3/lnlLgS5MzTFXUwKHNFDFuZ25dS+BpeF3VvLaXfPZNJQbYYICnw69US/4ilzULrPPBtpoyc+RU4BSS+W5qqlsfBUjkeGiGUionNTMrBuNOmaJsfNiQl+Ve6IP6ruNVCSbhqtWcrReoc636tmTtsLjilX6zKrh371DFD7DKuKLRaVN1RalquR9Tv0JGoAcefpEc9PPy3CjWDNJCZTmIsSWB6Ivsv9bqIMl8rvoqup728Aluo33KLAUh+65agDQRWKBrBv5HCrAjUc5M8hFYPHi5SxlhOAnjmpd6wxu3o9h0vCUgMoFtn5CCFsctXhhHmlf8i+6RwB1vEQqwXDEAMZ5sDFa5RRPmQXefBYRmub32Csj0Q8fndPry0a2Qu5pvZNDBBK0FD7lUgUSOWuozF11gcIPp2TfregK8BuGkI9zObTFQ2szW9BNRbWITo27rOkiuBVqzCwTGqkkDOz2T1AhEh3Ij2+L1tJ4TRYRq5bB3oH3TySSHP+2gWP9hoizWf64f7+EfudKKmbc2sJ9b8q9tvesfDr5FsBIkR0AaocOdY2hl4JxLrkvT4uMGIV642XXZ0HwywM/2xh/qOU7NtXpfS33tBcSRziyp1egugd3V7cn/ra1wDskwFThZ0RFQTv+FMvkxHMMbIEPX6Fy9fXCr7xcUFwA0H3xAkxk7zwAB5A/EFQAAUgISL7HEZ/sCAAAAAARZWg==' WHERE catalog = 'TPLP101' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AMCAnRdAEABDn2G8v5phHtjJvt87vJVOirph7vwoHypp7fJF+guMpRXnNURZ8qayOah7WSRGLTDct75GBgzEdok5+YIWYnHBwAv5n6PX6I6VUCifws58trajJGKoLIh6pI8jPuLMSOssg0QsNzFq/3pRRh4zx80Oo6v5w7qLM0Ge4Ybtn3P/BZ78wVvM+NAuGLr+Z3jZS8QEq5R8a4iGvgFHoN8SDLtwXNsrJXdNnIoYFe6y1I3sodbLJ9SE/cNJW+M7K9IV/oJb44SrtwbiBamwKozMjpvBp91CHy8Ynq/igVSjj3cbPn6k8iOW1vLT6hiFiOHfgMm5ikv/YBSNlRX+Z7pfuEJjIbE52wkkJ8qyEIfDba9bkYXz/HPQSN4FLa9sGNuMfREU/DacmtrYE6TdnU8AhI2ruYMoYCGL+bbQDEUUq4ykoI216BOLGKaOXBP+YO/F6IuNvDcMJZRI/z/NF0q4pljDY310qpdoxWbtNRcM0reHgvZgN6P3ZC7CkW+sCYBU5pQ0MdQWuScb/XX2IluCOG8XkDRTQU0BUzR0TUUQmS7gtlXPzxUtJZSRRa/LB2r0cLb41b07o/BAhxcVcotY/KiUqxVXHCaoHRp25QQyCxFMsqNp9mr02AyW8m7G7BayoWSo07tkEo1CWQXc9OalHhMMY6TiVyi1100pHbqszbYhx8bX4cNwVoTWPwEEPl9lUVG4TpZ6kO38UEfkQ0BauuehRQFYOXGMcewD+WDaiPfeIS8eVcQCN4zbn1rgTmsJIrfmSbaeGIM28PxWavgwLkimAO/xs/Z+XFOIuq3GSll8GtKzrG1T2xNxaqge908V5+9S1YA3yng4GrBWXIAAZAFgwYAAIkosu2xxGf7AgAAAAAEWVo=' WHERE catalog = '19075965221' ;
@@ -0,0 +1 @@
+ALTER TABLE albums ADD COLUMN keypoints TEXT;
@@ -0,0 +1,14 @@
+CREATE TABLE match_jobs(id SERIAL PRIMARY KEY,
+                        username TEXT NOT NULL,
+                        -- queued, running, done or failed
+                        status TEXT DEFAULT 'queued' NOT NULL,
+                        image BYTEA,
+                        k INTEGER,
+                        min_score INTEGER DEFAULT 0 NOT NULL,
+                        result JSONB,
+                        created TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP NOT NULL,
+                        started TIMESTAMPTZ,
+                        finished TIMESTAMPTZ,
+                        FOREIGN KEY (username) REFERENCES users (username));
+
+CREATE INDEX match_jobs_status ON match_jobs (status);
@@ -0,0 +1,21 @@
+-- the matcher daemon listens on vitals_library to invalidate its cached albums and collections
+CREATE FUNCTION notify_album_change() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('vitals_library', json_build_object(
+        'table', 'albums',
+        'catalog', CASE WHEN TG_OP = 'DELETE' THEN OLD.catalog ELSE NEW.catalog END)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION notify_collection_change() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('vitals_library', json_build_object('table', 'collections')::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER albums_notify AFTER INSERT OR UPDATE OR DELETE ON albums
+    FOR EACH ROW EXECUTE FUNCTION notify_album_change();
+CREATE TRIGGER collections_notify AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON collections
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_collection_change();
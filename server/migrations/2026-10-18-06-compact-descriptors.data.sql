@@ -0,0 +1,8 @@
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4A4YCfldAEABDm4nkFz+L+x6KLImvsQXvUTtyDzTMPGteFWaDbGznXryxtl57fhPMLIGvY1ORAhLBStAMqKgkUl0iZwWa0k37DiOuWZbY2yjuDbN8T/+uOqnF7MazpCNoOmn7BhZXKn42ZmXxdPO+O/by8+OAYCuSYmfJxDyS+W13B6gqkf09kdZk26wRqpD99EqRR0BuDX9xpuenKk8FtEHFZs7Wk68vO7CT0xitmarGQHRSUjgR739T0pX1yb305IfRMS7qPGRM3wryldmMb9O5AfgtqoxtfzbhCd/gQitgNoWk1gnHR8EXfKCvEe9MqJUDftfAFj6OuKGnCp+XQFJlZfXoT6QIEjlnxCkplj+NZjSgiyGcGD6swXp34FQebLnfUVlJjgirDksm9BBdvCGxXB2WTMBPDBG8BW+1W5Mmksr2sjlEH2hv4XzQa9OK6ua5OPp9IdhtjT4pwwHOw0oIwXESt5B9/P7cCt9oA2uooV9JP7QYVGwairxDvdAvmWtPsyP7PzzwwVoFWDRILVCVaWlZqxvVFnhIASKskmulUlyK+6cPlEtmAGXRFmBJ6nTnSAxStcRTDEfzaBtwnm4mq/E/qOlf4KmA9X29rv+4dbO0vFHOORnNiIzpYks0f7VqZRgW1DTsEO7rsfq9FKNi5TO9tTsE9+8Ec8V12mqlHOf3AzpidDtsKXQ68nFLSeQa66+p9bCgmr4YrCAzwi5zVYFbM0GNvTJ3tTPR7y/GubF9A1a2ZsL960pUgIr5ohzRWRIv7RLQOU07b2wvlb+XC52G/zogiZJe0X0uEeB7fP8jKjIKD5SaTmFstd26pF5IPahMGb+Icy0QdKlBmf1WKyvS9arNALBbvy6KMOnS8eH+2hzC9MMnmoOTV1GvGH0qs/Nc9h5S9Xp0Dn8R05kttEnmVR9hc+NAJ6WXsHp0c3Q+G5uI0ZLVUcJ89PBqN/ah1hrkeA0ObEeT9UsnDbvCIpD3haZA9yqc8P+JOzqJsZfWW5FUM6sSxHNTRWoQa1ksOIZdIMoegtFYE0Gw0yRXTXD805BrpIaZttpQa5NOqivKEdTPT2HOvuzBKJH3md0IsLH7+yAg2kDDLQH10lQmaZuJJa7l4HEUvtSnf1XAd3GH728ltk5GvLDiCb5DO8C6/l3QYNCwjckP/V3qoBa/u9PALOkmPIVpGZndwZMMpHQjyN2rebVcgbDTBa8IXGRC6KHN2EAvQfSnzltwD6R8didGIvQB1pR7RaHpyI04+fk/RwzDWsCaQeGvYfTDYO9OjcBy5UQ716HNsNc6fYLJk9wQ6IBgQhKFs8fvjMHE0rCSY42zLUiH6Il7undtvYRFBVAVujMeyWm1gWANBj9OpWWjI/IiML4mfveOIGsvVnW/HJ3wsK763HNTFTWW4vxVWPVv7KKiwEvxRg5rebPkjGndPB7Ps+FhsJyoxf5/Abc+gh3esPCbo4G1JGGrpj9hdqlsTLDcp+kk/y4NcIGHTVZ60KfG3sjV1kRfruvUT30rxpkO76a/T/1nYA1y6rvfW9W+HlApcrMTcdWhtqY1cdS5avVS0Wz3/L2YJI9vaqiWRyTSnPXOR66PP6M8Etn7jZMQedhIiDl7XIBT3548LjTS+SQAMkGlBCQ/rrnweOwdr847V5mA2mIwbJLIu/jS4+KUkMDmUlG+UoNYl3lYVOVxe5wQgukuQXrP7DBlZOv/iYunMfzqq+JlF4q8R+yRDEsu+jKaLNsLa2R88b2PgtxdNsl7VW7uPchTJOYu0FtnAyVCNDLu38KzqYYfSmcCjQWhvfMxAqchtE8dvlRqIsrM11KBMZhMJnswRiklRWViryOIMfprjG0nW2W94nYa+XItEqteAre9oQe8NSYqReEpuVVH1vC4PsPc831KvBWI7D/N9foaxsWsdeyCV0gtHOzyXMjW1pxOoExUq7NdJQUB1PjlcTG/JtI7lVM2nlpNOD/vZW1KQFwHEMhudUntHmjf18S+k1bJbaJY2FhgzI/JZ2Qu0nkQMZ/pKP03sgD95TamxRNn52D/OrNWOc72+58hdVoM9Y8ThLBRnTyKa7+tVOFBnaO60mIxYLX93ogk6gEmZFsjb/A8KqM4dsby9L90bztFDMSeMYe6M4/LM8WsN8USGnmSyXuEYXjwNCFD8m/2utRw7oEY9XEUINpuKgLIEXs6noObfvqoO3C++GflrBMwMW7LSQMdTsju+aYT7RVIFxFienxqf23e6lDgRqqrrAz2pNrpIeOLFFWC0kC6PNU5n5UjQauJUYApoGH8IhCrvJRllCmyxOqAQ10MmbYWsP4A3zOEJ3qI6KPJI/dc0p6LEYaXW/R1+RheVLXo4xO8zLJyVgvYNjaTRbeVOIpb/UPvgdLwDwLX75aNtDu2AK998cPZNQIP1Us+oT8ldQ3QVCW8hKDShCnKfe6Ruw5Ie9e/nOSFQeNup2hiY0WCRenKVJsCsDVHNjVPxMk9+c1O5LOuH1vypt1erAq0yPMy1ZaR6m8Iz9e3J9BkPUrcoTtOsolHUF7f1cl3k66XaJgSqqEG8Y8gr3GnJA1/5SJPyUIppseM1XwfOni84hqi2Eqjo2+B3geatxvw54ZOwLT3UvOHEUXkN4vVFJO4U7W+ZO8kuwKgTw/ROfAhWUl0swwn3SiPQma9T1Csdf19FaypFi7DjbZ4RVr0LlkYfkDcfxOWEWy24N+qCoXbQou8Wqv58yV9wrMjf5dyT/tNJIcXfDgTqrQ+6d5mhiAdPc6oNoMGJ4y1FRB87fSuiK5/R6BmofAdAh+DQxVrSkaOZCD/TViJCp15sfxGssl81vfiOHHr5JI68f2gUQTuRxo+Sz1UC+X8XlB2HjruJ53BiQtvmvQpdqgvYj8wbao/jk6bp+I+8XiWzQgBfyW+ZOkMVgWDPqGhWKhRve7w1q/6olz1Ud+n/KT2qfHY8hnO5JubbhxlB/4ydQnRkDAG684abZLe0UmQRctFSvZuTnaLrC+VAlrXZ2WfAvdXQUpSRKhmMEEF5lpnCSAOEHKwbQiff/i7KFExfxhcRg/2ZdfO41WghLSuZlCk+5NHAdRkQXSzQ13sjz0wW2FlBfSNSgbgyWFeb/Wi/qFI6Z3yk9ETFWgXWaWV82ifLgA496GGIVijxm7O4yNHt+AvFmXgiPRw18fEvBH/sqoMpAhUoNxnGQ/1Iotb9YdOBKnbopdtZaaL2DamnOMqM8EDVn6+S8h/T87fTVGLdbi2wxKfpPCvZkBh7lzlBQ7UCP5BHCofZKNAyHiOe7NVs9Pbz/KO4RSMVrmM/CVRF2jqCQ9uzDyHQBo1HoPTPQ2yOxlp7IUFC0CfHqftccTK8raq1raDCj0Eh3INu0GW/keFKA4GYNzucsAhGoe+mu5jX7HdOCuz8L166LeijIGEywSKQAAAACjatfwLYpwwgABlRSZHAAAVZbqzrHEZ/sCAAAAAARZWg==' WHERE catalog = 'CAD 3420' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4EsYM2RdAEABDm4cFvDcLalHE09jCSm+O90f2xH+aHEJb3kDDihRbpv9JHpWb5jQmixj5tr9ioCCHe4Gkmk1lV5Dj6wWRiTPZmvRnDHNbf2n93rsllGd6fvP4l07n9ZIpj5AqzVhxpq0rN6gR/6IQhC3/5TCLHIZ63N1ee0l40pDXMLYGKPRTI40ae6KiE3mXKUUL7eJoF2K1RAZxScwgyi+gQFUTgjPLqXstf5ceiDjfSIWw3/sdwYmRUXp4IHNDkNPjiMWiaTQiRO/eEJtwhBZk6zW2qumL69SIcF+J8hi3TB12nxUiuExxjZ4fnid1RQXjsKwTaL8tm6rrXas4fmirM8Apo3jtMjYKnUWjIepV18PzPiW0Kv6b3M/I+FsoYUKRD72J46J6o95qLWnZqj1rhepUj8SgoQuCVjEjDxQq6B5aJniDDs/9CDwlP2O+bnYkPC+RwJg/YWR388W2GHyt0yo1foiCjIpDm4+HEh3YO2/69a068+EqaTj3gAzPjyUcQeQY/CQ5/wsLJg9pNPGbI7eRnA2P1Qjm+yEGCCntoVfe1wZ/kZWo6U1lUzt5OaqPj2Svo+QkNJPq/cBU/oFmq1/Hv5l12NicGNvsudzngqpE0qvpHZVe08TKVBTYNyBXuw99BpjwANRS2AxvDTUXI8ZJlf0CpW3pCduJa27VyjZGYJuG7N8qr/+Jf2p+6MPoNPYvSm+m94HQJyZx/2WV2LiUkV3Z9ZZyVDaDn1HhIQZSQ9S/7c7VmLph6J6bfDKtkdXf2MQtc0w+tf/KoyXn/Jl/6Yve3yVTV730VPzP3f7rnfvlwfmst0U/VIqO/MlQMCf7gxpzTCpkIpjDEikEGMK0JK46NWtAU6V31RpPavdkiMmguYmuvy2+HvbSJW+SuVZ3djx+8msHB/VE+Djo021QEmBY1Yxx7PWjyMonC9reoclKF4TikJrk53zQUNpUFGqSTdFWIT5tKjz/A3uP/GCRA6siYu/njF807slz7sOGWBW9yCwU5Re9UXdmhuQEhmbVCYRS5dOv4pbWSsZibXxG9RDPLitQRkwQl6WQPPk1N4m+pHqCdGLDVgllMaHgWCZ1h7wPKJA+dTtZ07nRHoFF5243pRonLM12g8aFTjsETU6zLFlIpQJsWNI/cFkvTocY0v90NlQYQaaMzyD6bAStY5ykoFESuMO0m8O1IPxzsrrbZ3oTpAcyeQJgRKlyQx5h4IHCyB3NstlizU3abQfzwsNHTyPi1G25w0RhfttGh4gvOyjj4jF5OSftpgL0+xtqYKOK952q3lPTNi9gQFWL7OpP8iyw9h81OwvqYPbI5Sm+ActOL/+LAfsTjUpV827Qfx6Rx3wBPYhIXnUryCPQpu2OHx5UpC4IzlDn6stCmpei1hA7jig/hA8jeux8bN9nYRNOnWokmvVZdIhh6chrahWkXDK6pdh6jVpvLcbpszz+Kcj/m899B9n7k32UusUkc/icyDEOHfvuzwlqM9wyL+jU+jfd+moPAltYMTxmqz/oHTM3ts2XTpHnQKINkhPkP+kFQjPnmjEzH/B8CRm4PiNhUg0z6+aCkZPjalvoQO9yx5W7OTbmOpnDfG9d3zu5/7vVqQQJnRyk8QtyKAjSyLtBhwajX2V6MUChW7aF7/gHy0iMZoeTfc+6sj1nAcHmgg3SunUweqA4xpx3ICGUdAsoUcq6vffpqEGQ8SlKB00JKgXMTFqL5+THbKqELCNkPtXNFg/6V1owLzcOs1ufDI1EMfYlWANtaPuIuX4BYUfBQYMh1cs9os02OFBTVdg5k6sydKHz2Bd3U6ycivBXmqSWcj8clixmki9dVLlzwzA3Zc9h4G/U8h0FOwymABWZxQSa9GwmnUcmj1phvxdtCBcAPCz6zIjNb0EKr8c8PhyMXSXVKK/lVdokURXF/CGWBUJueYscOJKwfpLU4YGr6Uuv5CJGwOf8Py0ryeVE2krNQxGaT64+VWh7+2PxGliFVo6bAAdacW48mPibEDu3+AS1IKL8+CeyXyL1sMKVOPcegaZcWQvCdpTEzZx4v746xwyIttmPLw0KJ908I1QTQm1jHm+sK4VQfsiAlLEa57fI+HMdSMeLcYNm6a+M/EzV9nFvxfhPnV+UviDeSLFNy0melmrhNiCrduL6nUqfYfJPAd99sEyEejro30dyn2QBcw/mt5SYIQgZGlrbCuidmKKxhB8Np9QT0a0bQEf08ySSQAwd70dVNBywjnL4y1+A1I9BT5rSctEVY+RBrsXd2q2MoCkCHKtfVN34pLfDmxsh61YkapdahMH0UA4B1qrL7s3Cxk8M4EYOSW3UHd0bWjbfJgfPIRHFc07hIR5iarzdHmRPSHURKqg5vGzg2HYYlh91wT06kH+AloLz1N58Q2VVR0rpRmfFKL2MAifv5VIPgOyn/U/06oV3jUv9Boz3db7zx0l1sLV/NZSLKIoBDZ7rLImx4vR6XU4E1vzdOYmeuks+buCWLsWiX2Fc6GdPAHgJLIqKmHnlMLQD7SKhoyqX1boR7OL51yVB+UNfgcK/TnabvqG51/fwVBVFmUrStUcWHAyrgFpKSTyq6uAjmuxqtj8eNXvFhrQfTFIEquYMD3CfLhQe8UKbaMaIj9Qo25OrO7ICezTCTf27IaSuC2W1bvq7UbNekzXAsb0EhvER9aXfuWguPhMgPcvKRdBBY2e+n0gtDu6MuymL4pQgKRMVrVXxUJudl7hhaSU+9zKLZsKNQhBmMgDA4/2Oe6OdcOBf3Wym1y+GgbhPZES0ZowOb7P+miZWh6pZzsIA9BAMkSYzOCYKkvBqrDfr7JkYE6CFvEKsBSfPgqZ/mOZtgYYchOYoYvdj4sriQ/2/qx4oejW4oDtTsbag7b1nqxr02Rc+dX9Iobm5qYEvBestLMsAetxzvIsF1qJJWqqsAIdjZXEOWW+88XXgo/UWv/YH5V2ktQYru7kWTC8WF7IMXzcDVwz4rJbFC+9ZTaYgIokaG1WbN+8NG57/NKLoV0uRZHbjAyf843SNJounKei8LAuc8qBd+lcguZZ2tagx4ATeqAHJ+RChkDPpzGVsxh2uLjcI5qglwvATIXirh8b2x2oNXrbDAYIf4PW8IyFLSJ2c6U82vs5gPJtgjTzVzjP29ias2RECgYa9Tsks74tpbIgY9Iddh+65kWIX1752vgdMCHE7leG3XxOrVAcMLVfVd3vXVfv4AdNwPeDIaMGSTGE4LJ0ag8+2nnFODG0DkNnp+QYFWCVAbeFqjmCe0OYixo9fIsX5czbgn2ovsVXRUwaw7d4Gp1i/ZYvZfmLwzLmcfbyWGGuSdZFCbspbIyK+HZ5RwbJ7/xCW9Ngsvf/n+AhJ96NibPJ/h6j3Gz7oFLjjF05lZ2sgQztTIzNDZ+Mqj6KdZBKDhQAwfW+KbEoB3s0ZwTIexAPZ6yRWhDvZOJQdpjBYZlAyBuCh+vE0+Wj6klpA0rnYf/FOVn7RQ0PLAh3JxTEEGSva90JuwgDKmTT8RbEXcVVG8kWf8CtJm0gznwvp/VuL9arTKQ0Wb5RMokwxcCZRVFlyc79HJPS6qyVuXtRmVrRD214Pc0YBDhGsNDABRg7BB2qfdg9YpBlnVWL66HQ+Jkdk4GJqN2mmtJHbkTz4xVpkrxcek3vS4SD6/Kh5cn6I2wxdvlq5wnNZzSnIW9Xo/V1syAvXLRNVt97esDqHQgj9JoP9svrQg0X3NyX34k7MDbnxi7skuIWWSeFxC6tuZI+yJX4i9FrBxtnRzDuoWFPFUHvTyLfRN5TkN1AEWUGteHFvGLIsC3seIv08+r+J3fJGr1pnhjV4B9y4vDrHMcvnPrAdmloSIdUygGM2ruP1iMwFgNkY3AkE+bGHW5xbSvEOPbNaw9NmB1o4AnKh1qcML9R8zCb85L9G5xr+sLI1bJD0IBTlDOL+qsL9kUTqkp1CBQrNTzYxA/Q1ao/5m1AdwKlrciQ1I6HbmMxlGQV6oaqjN7wAWOWwZhPRGz6Y5TkZHfZxkIG9dXWx83oO0Y7tf7Mu5/vdvG1Ex1K5PPu7YDtzGGbj6yTh08iRXCX7mojND3oLcMTXiBs/AZ4ZSnSFAWAEtsIVTq/kSzazNHDUNGngKo3HfU1TL8QH0T2+8h38+xEoy8woRu1U0+8RsIPVD43rDkH2pdpQ5hmGsWe3oRdqC7YnKkuS0LAreMCRbMHq+Ew/Z8ZZnRzHVx2GP6aPBkRAkYee0Wnh/ruNSjX/A8zrUI94mOXBPLJZF0zxlI/mgQO/vTZk1xmKhy8ad5uqYm2V45ytSk2rrkUSHTuE0jUFqS1PLZwg4RqzcSjqO/hs3OkwssfWjwe3BxAWMaCegpVKIDke1xE7wWKVLo6uph7xj5jQtxFoWxz0WWz1RvxPByDUEkfsVq/WltXWW2Ma7XHAt4PLwOZmLXEBCTJ7+DVVJ5Zkf30jb00uLw6iPFwViOAnaHMscGevptcrsDrLHdwXVvyqtGRFV4rxxDkCP2PggHym1AqWbH4sL3qxL43DzOQM1rJxWUDm9ceXGzGxZDffrXqVVBcpFkZ0qzbqZJjpcg4/at0t1OZ3vJIoeqZ2cyxnn538rKBsE2ZDTvBxuJFyy9IMeXg5NuAgkR6o6JoJZfuxltHd5nKVPKo/DzbZP+8F2cSRXqNyQu4eQnFPN4DPOuBZrFmw+VFuANntZX/Dm1vT3oUwJQ2KXP+73i52TL9swEi8ZL52ryng4MfSFZd51n13Ho4WT0ZqrQ/bYIi0A2NkC3vH2jB1WVdN8S2ioUzk9hvHoR6U/7kyojgz+PZK+6iQ0NX3FIYU3rz9YUPaeHEUzQ/9FIEN2BHRpaY7SVRoggCcttuFXH5nio5FvsRuY32hKiqyrsw6V1QAqoXsVCYTgK3GGcjW8OP8m0gctWaKctzXUyFsCrbb+pRz0zKnYVbhl9AqPxnyq7K9017t2S3Bcwrl+rkg/ZuV4WE1OrUJfFiTcPFZV+KPeTr0UE4JjGvd2PM5sczal0SJRr0Wd9JYn1mbCL2dgT026n1A4tnNoSNq1EqrBal1v7DTwsZZP9g9H+edl0pjQJ7i+mrVTHdT3EnQ+FbSTe59VP7f6BCgjWCP8sJixDpENM/F0Pv4YuqvdoHthdLpn8twdpY34Eizd9uDnTUnEojlP6ICOCC3UNbUtP4KSS3gFDslAbmgRdnT+Bhli63Qih5Rn42yPCUl2D+QOb6JfW9Q5OYD8XCVJ3pOChXCmnQrieIkuEf19J25UPxI0f3oMNOENyXaZzdlrE7DDTZYWtrpRpIZY23eU8EJidIO1tS3/bdFxzgFiXjIH8pA6JAcCnVRkjfnHWkuTasR3vt3B7OE25jF0Er//8+o0AB1AA5fEisJceph2pDo3+ZMfzvKtsXATtDiVRdg2u/lk6o5TpoNbLbFMspSQzStaGja8iCBO20Eb9u7MJXQ/zHKDQTVTCJlTA7/A8HC9JroYqxUxnIBXPrWtaPjS7VgTUR5IAtxHcHrzthjpmw2IpJ+Z8Tds+ZASUTBshPIcTPxGF7veKwJJrlfvG+Dhx2Q2zXOqTBp+P+gT9ICZLcpVyVlyYAPDvRydX+2d34TLjG1bY2JPbYRhrJn4Yol4Gcv19YvFCLHbbMNKUegR4d87f7B4AxmIfCCAi9avlFGzTtboujHhv5p4f/dMac6Uw8/mnExJfNkBOocFmNQkzAtfpXuhfyvpSVJkMAuSq+z89CXjFnyDYh0pnw2O7XtMzzxY49Hed9QfItPjfZmOjyd+UUmMnn8ES1Y3w5PcVY/AcYJOARangdHvs8+e2NK5KUPXHQeQoNb2rkkxofrepWgAPnUyJYgIHEW0y6zpQq4ejJDlk2x407jDvQLs8kL24RpzvfBJMIMqDC05/p1llSJQEU6gAJcvvx2NRCwz9KUkWB7x5hKTZcgGqZGAJ7NpL8KeVc6gA5gu5xM0KwC1knyyDL5pOTtdmPjB/NVwduLMnyprcerOF1GKR4umkCd2h99yIlFs0w6r0z0SGsFTkDPtDHhiDnCI7DLTLmBlBMeaC2wK1Xov/tpWPqWbgE+7cS7oZhYATBBMdXmjjfVMVhWhtOFWBOiQ13zy0KxRte8ysoHGZtAHQDaL+t265NsTyN7h9VoaprfKbP+IS6Tcn3WieQxzBm3ADTWHN4j+C6aGmwti8pqOR1nzcPiREan27xGJki3glWraqZALQCQB4x9In4WpHEuoVo6BrmZcfN0vrP/cnO2NUQiji6P11Jex7WJT0GqphwaQcwV812kqXVvUEdjA87NRVDkggQE0NJ2Rdt+j/i1vrkqPHbsMP8WI4AAsGps/oVEt4psxoeNgbVNE8wiFGg16I6tDM6xF2TkY7S9wtf9Zd/T8pkpF3lBExidS8y7IUX93J3yu+CR/wbZzpX7pbiCUKr556Lcmle1ALm7yYoIZbPJlb9dhCtrbN0t0VS88/ropsjR3j2MpmBjHBDdK/KAXhnPmxPoPosbxPKTnd6CnFN0+ln0LxbC6SwPjExilN89cj0iuiKWcZAsKIWM/oymE8a2whzzkWBKCiYa8S5NRE1xb6Czr6du9nNro4Q8iE/woAXvfKBhCJioNATA72Y6JHIp6yBBac3N9MfPO/5WZg1jkeQ2Yck+hyVf868VBI0rBir3VsjM06bst+/1xDOl4HY0LlBo+AJr7yQ1fVFJaHGK/mNtVlMn058anjZU1ErXB2kVOjzU9TQtu6jtFN05u7YLXN0ZX11kE53yb8C0ubwUu3gR/xbTJgdVWihIz2q8Ji6MTIcBaBgVZDgtVZ9J3n+q9LYm986HKD1awrK8q5aLzrecc8DJWfgd+06iLxpWKZnU2MRmVUg4xuB+HWJQmbdLZ0+TMgbCCaahxh8SheprueEABFHYI5aL7SPzcqZNqX02sJokOf3evfxGdhGDIAGqeGvclbqmSSRRgPrsHmxqtWRLnHAqMz/IXR3JF6ROBYz34laQEsGaFpPZ/oFGzRrz5VNb5psB5HqliVsjadnmiU7T4sl8sognG6MGiP3FKdAI0nr81gA22lrJfU7ng+MRZE6Zj9528iphdquydrOr2oar/PTYajasOVasBr8XeCmyre7SrbspM5ygZw1CMKJRNBT2dVqeRqwH5mh7IDYvMw7jjibSen58ISDWbB7nK4H6eF1e5NN4mmC2yu0b0BPJpHiXqM10g7y317Ko6/FbygtBY8c0Fd6hdghGKar6bqeMFfYAGBZ1yOe5ojYNXd9thb1Eblq2VmBfK0v7tHdgt6s+UxlFidgxN7tFXHlxsl4E5xlW1YeSf6b6Q0UXOnne++CkYxNTzVPUjqDfwEIKAhk1J1ZgaDsOfumrnUpoRlBjY93lDV+5R5kksE6gVJ2w2ys2ZI8A6/Wl5ZhapytUlGDbaims8usgwgBiU7Lrv+rHzUxqC0WnLWenhCMm9ZaLpa+JVRzD78iaRI/YKdHYrjPxAq7NxZSQguMo8DAu36/zSfLoPRvenet3r21YdI/X0Pw0jt2cWA3rsHntXIGlKxwSAuNYmZPnoyqOwM0u2G+sdLHVVQd3XHml8fV+RSYTffLf7L2RIAVCmGXCyHF52hBkQit0vCsZa9uOxwagJjhxKYTMjYTnRvIlo5SCtXQHJgBQFh9VNrlFsXo72Zd03uMgYmx3BwK6y0cwP6912eWEoqaj9QDm1J2EABWvcLUxtkHSl5aNooa6QG1vZ7ZxfVZ6BzSi+eM7FKRghWt/t64UpRX9JZVduKrOiM4jicTNT3OiQ3MwbEYRfXUfO4XgW441KiHUEDeCMDlgpc9QQgFbo1MtrQldjjLCOzvii3/WMcwNNRUWHqS3znX+3+Sg2lSWdsm43rn/NGanoBwpsb0wMbNlmAevMmTbPjYw4mj+zabdw4KIPiteeEXDBzsnr7Xias7P+nZjiF0rbUqFMBtvQ6WyxiO8ApV1nBkOHJrgMRB8flsSP21eWv2WW3nwh4VyKtKlvinJPnQqm2brN2P76QX146P+91wCFJxggxUUBN0v1BScegRn5Jym+OE/r0ETbv0S4x/hU4wkvHJTH6tO13TRQG3ftj3lrF2lAIjVB9Tz1whqvgaSQQ+uUjbQAPSFL7Uxxooe6crxCWU2jHK57e8dhM++fmFNcBjJo16NWfxdshIy1tJZRExGgmzAJJzDabQ2kb2G2mK6v6WamR9DF5wc8TckpWfnP0kceQBTKqrxODUDCwqs6N/mJnE1heVc5PpnUJFp2J7ssxo12jb3ripHYmukrCUF8uYSfKfEC0CCQd3gAeGz8vzmXtbToySjR/xCoS4s9PNUdK37CxDzHQaDsWKs6XdSaDzEFdKPVGIGAJpyOYpr3AzKhhBVoDjuhiERXf15+E/ZXXwb56v1Is7qQWGLJylJC44fgxMXmlXqbXGn5aUjH56N7N+1OLh4aPnVdFrnuVyHy1SYM+SHCP6PiE1E3NkfB6y/OLUlp0GKoazcMJudUC0e8ejDVoAoFI6xXX2uAdX2x2/rjzxJu0i5s6yuaHTeWgAWP9bOn/P3Osm3vcoaYoPDPQr51s2sqmzxgOKYISFdrQfOMaLIe6hE2tMXumxCDIRL3I6mhZVsnJjCAIy9Js23m9OPUqa5rUrOoP7NMnMvn7HfGV2hMB3on9pKfcm9ETJhbQ08Ip7u4qNmMQL76kn10CSIrWBKKK7PdPv0AXCdjiYd4H5EmvzDXgk3oa1+PQ6gnC9H2t5i4/5BHG/VStlIZh/FnLzpqo7HbF3tmXR6CtF+MLALT0lDTepPLMtoCDKzo2MKjp16EryD5dN9CejA0H5GI0T40m8uIHl9lPU+6tnJyCToY/H5WnUUcGqSmiWgUUj0UYAgWOpqtbGv6D8MjIMwEaIieB2fPIaYrnNco2/ivL7jFdU5cWFLxWWUWSyjtlVZb40wVclXT3yEUs82G5GG4D1ZdRrybgTOiK9Si0k2dihU+QTXf5tCh8kmybBw9uacb+2iDxRgOOTjmUNoEU1MdvmatoftjkOH4rkSCHMtPNiGJd+4DqLw95VFPO6gF9emaLMETJM9G5abhMbLt1pcqLmjUnFlmkkNiFqFr8RxuAVDcj4jT72Zx87u8noEql3cKJQi6lCFZQLL6dj0+jj0fI8OJn3YKGRr1+pEKj368yu3Bj/mssr9e+REkR7ph9fYOs+F3fdT498oK5FoRfdSfcvyQrXXlKpRJIWQUrpA+stQuL911t9pCOHCy6QFleMFAe5Z23XEA8tgMRDrN3CIlJSW233vosCGnXK0uIMnmfaYXtpIj4WDDkYDfdXiHS3eAu+X11TJFCeq+Oi0zanMey8YQDbi+JEpejKMhdugObI6h5NvFnRlKVD8YgbHgZvZH12U6YuRgT+AGGviLCfG//aC0TRDnXc/QkHQ1dF1t6uqccePho9ZcEpgeCfBoikBgW2zZfi6TDUugOjlskuGNHowghMaNNCv4FwEW0LQS5klJyhLxAfFFC7H6jKkQGV7+zZb/QZXWY7E4ckvESUnnIV0LZG0NL6RaQQzmcN7fG/E1rMD1ullCx4pzSZ+dJBbpd8/Uib+zB/YO8vPvdHz8/tMYSGblUoekOFUNT1GgBpMNI7eAWBu/LEJTCkRGqlmcL2CG677nAqmXSPOYRXeTDeSJaVpY1IJXNcYyrWd8wYLvgHPRusCv1R+f9WI2WncOuqOIKEPIa4lWkTa4VmoYQGlMK89g2/8RPIynazdXcbwiCR+8klGd5UOc9wXJGA+ns0iUWTqkiIaMdGHB1X5IYn/EeUgFxVfVEl/y4Lw2FeQ5/erVy93WHitcMHDh0LK8aekLUa6zWtGEih+QEgmtNb9dUEaFqQTYoxVNNtOPlNK08Mh4Cocv4R9Sa5LB2GCU94i8WN8aY9nqBgEoVBsYd+1Zrm5z8ZILWNQaAtZuSQwEGjOQ1GulElZ/5CDTgXGFFGJXiXbs6UB+9I0VCT3N2Lr5znwPhwrVzeLO/sZPhhGlsf9gLGr/hVPJKqUBqvB1I9W0y78uGau1HWHKfKS6nNFAkLQzoXg2pgzZuU8Z1YTB3c+Hl6VkTS10MAj85ac0kRW2a4AYyeDRdRLGJ/F/ACdtEEaoeGofEO17e785UAI84yWnYC0kfk0pWWVsAtkVw34958Zl79s3xkNAHxEQMXY9ZdmvksDus2Z47PzsCa6LM5e/bmve4W1ZSa+XOiQ+3UyRblaVcntAsKzPLeYRBAZxsOaFl0kDyNP2JkINLfLnj300fkUY66VTGh9IJ/kCLUWLNKtIzpv80tDZFihHxFg3iira1y6Xu7XrPJ9L5T48IL+eGj5o0p4zmN0FVjgED8vVj3LxzSDCsPSZEqiZDfkTX6mCUW8/JDhFTyD9TrIIC1jZw1s2eteEd0/A5JznLXa+7Bsanrjab30uSEnMo5yjznp8ivoAnlN1w52B2Xbg6e9PNvD7mvzkZFzWkhzHAHoNaHafNoXtl1SL2PAfV2pxtLf/F/bMbMKc641txjE8lICTUTEJxTCz4ywHoLgKIYUbIrrtTmpVImd7OnO2dBsFM1P1vDNXsFia3uGuVIo5DVs03w75HXk04DToofHSERLu1h7UAeHyx/VPBgju6ZVLgDyXzVctnvau9/tOu/QrMVmh9k0RbAnehPZW9FPxV2xZNzCy4dqjEL8MDACRz9k3kB35jlnr7DBDnAvz79Jw8SMwbavXw0DefKX8bXJMRv3aSdCO5ORZH3rjG8bZ5lpvDJU+KfYdtjgDzcjDhJDwPJ55DWABpMxPAJ2fVQpufC7OWiMYSdFQPuHkw4rkogpSO9vDKDFMVUhiDg044HE6LJgIRvi4H9blsCSRucvLWDWagas3FMHxYMLlKJfkq14iXUCdNRp1/xrK+y5pljEdPhcPG6QZQbH3sNjiVl9HrZRFhge5rnY2D9v6zabrWpcidQmxRzG/BAwkfD8Pd5uGj0G0HFMAXli5KeVuPK+IIO7WBCGcJJN5STQrLJGrOQ2gHBE932j5sLmWjkBALoXKp53YMDju/6IIh33UMcTtsKMu2PCkirmCx8p+HyHjkxNBNGSQ8aLEtIYuWdyCG63KqARukcwN1rNfStOIJWwIu7fy/RG6FaXy1KPZ6d1VTv+TX964lICOgsD2EMW4bAptg8eAmCyZ4Q+wDnVwJfcZEB3ZisejudKrf89zYNyVD0ThRjBjJ8QFNq3aFf2AikzDabhnJtOhPFbw9GeEsi6u9beDeb8W4fJWOudu6cEly65o/vp4VkPxqe29BIzv2Z/Fg04gTuGu/3IOqFO1XZZ+Q18qV+3hADPtTYs16AAMWldBnbSOkhgM6UMEbFnUY9lFxObzwf1+VsbZPCuj/5YxC1BCIs+lJdaP2z75PE4iWvfh3d4NkPh4009pnq+ZVc07HJllbOJv6+pLK/eUgBzRCl6TrYUmJBnXXXOKLRaEZI36JMhaRgK2RV8XdHb56FO/PwbDh3lkOiUms15BQWDE+r0IdQGbAZNvOBe1I5alXVN1vAqC3ZHFipePtc6tvZg/0jFOx/e2FNMaPFgX6rH0qfVcyAEMcMOgHOkP/2KhdJfSt0N/RdhAnAgJx6FL9St43fFQij8/OwPdKGJJ/usGVflYIBiASUJ/wW4M6VnCVsNsW7DMM4WmSW13ZPFK/P1RgYMbxAAa+H6RNhDtCk17Avqb36hd5CT4V9350LiVnnYaDND3fSUc9Kv5Z6IEQkMx64HwXmxxAQcV6OU9A96qia7IXxLS0hfCU9+5s3aVS7XGdp8WEuxz8Ph2DHyDC7+u9/a9sklLxMMArNmWmWRvXIHzprbDMRBaFH29IhyDLquTc/85KfDqWVnuvL28fKjYojk1Rr1pQ3rQi0EsGTyLhXkroylTUfO1iH1V95Da2ELwNM+SsvL2UkPdQt7zy5zaVFD+H2YrxCngBCGUI+QRDmLDqpNwtoXtXzGrdqSfaqhgnClOhCT/UymFigf8YpA/g11D6mNVqoqJBsG+tJ36sHOI6g3uDke2Dcz7O7M1Y4mEoM9CsipPYunATb74dVwgs5nFfUJnq4d2WmOWBOYLKgsUqMlCxgsj/MWHnV0Q2U2r5jqatjygjOvcOhIM47aVzZut9J/nKeCRmzAyvRWgb/WyZ192EtFINsJC01tYOetnIyXNmOTJm1dE19p+ZW8T0SySXU6pH9AodTmF1fHO7C+kuUIps80sDzJSKs7o4NHAaZqdnBndf92d/To0vFZCA+C40CiX6g1oYlw6cz2m19qjjNr3oCcFRGtAfm3umgnYO7ncw0IC/v/z/fXIJBKesCTK8bn8KYxW/6xaroIJK9CnXCIYby4TN+UEW0W9U9ZC7+9Se9LaGFo/MuCHY5PgjkkfcCvZXAZ6VBzjL8mgh5XJteIeSL7OOPFkmJVZRi1U21+6lybkFbg/cV4B8m96yOTJaIuaXvfRT+tLhboz3tPqOFGLZOg6NVi9aVfx7xj95HR7O/5hYQ85KPPlhNrjlHaMY8H5noiSWtFTb1E/p6LrrXs44w6i11eBZnz9SflCHsEXWRccCsBxsoBss0IY7M+DhmatrwKRre+RvcU+dz8zR2CcF3TAK+AVFDiEiUHxRUydYUXs9Tch3jW85DB5pqW+MN+EsirJIp/uf5TznT5Z2fDUrI3nToftdI1EMccDSvBf6f1B0Pq0t1En1DCdx8ZoypXWhXxUMWjyp4tqc7pdBYe6/oEakACSftLV6OFVgs27PVxoXWjiMTQfXqqH1qNNpD+F2pPxOLYTltcWgDF3vrY5wnK3PDtfrbb4xhpFpchvs4NCE7LpigQGZ6oMIUA4bk4lzdoZcvmru2ozcP31jNx9QfSg7ley6BvQPm8ZNaqIJQUazKGA6NonGYM3nSHsrZiJ/BfNcKI+wo5U8kDig7lMuDwVJ/KVzhpefezco2qqxJFKkUXIzmUCLX5gOvjx2+t+mep2HMDu0uoU+oXkTopnszXIo3lDT+hrvvLPHTDQvQwWSqtco+qYVq5mpKTH22bSG5uLjV+vrcsUq6mS2TBtIGXt/MozxVTOl/3AboSqDCvI5MQZowz3AQy9LzOLj1cMMheBO2OJ0YEtWBEYjIr4iL8ESAiA5cHwHrHVbHBcBtIeXsLQmFMGHCKgGmpHg32hTjpjYe5RfwlIZLw7w7GHCwABfNEoLpng/ytYM3BUwsHZbHpCsjamUKZ3rz1WLcPEGURQCtycv44HUQlVi78dXmNeXwjb3pvsubYvLS31zigQEgKEUHLC1eU5uyKjHS53n3ThbSwsgTYzXIFJjRpyB98ihJfL1hmjDwkwPKvTCN7A/F+bOGTviAIvQYiSoi+0gCtx0WVzWT9EK9+nivwl4g9ew4Ff3W2gQenddQhXx+qL1Bvk4Z7D6y3rsHfiAHlB8Ed9TOhKTVJJOdWTgPoJvheFni3xxtsCnxwObNlya1Jez3DgX2sT53nTkvjC3qgkCXZ0VfA1gpB+3iAp3NNlWtLY1jgKr+nJrdbYa860G303Wef1LlHR+NwX99lfwUvINJVZCPSEusHumWw6QFPOiIVoVage35fEifvWm72StA3Io4dPkzALSUtFLSItrPd9rtlJf98KclzZ1NNmrY32iAkOx506y2JWwDWCyT6Mg9XaZo+ziqovGrbpHji9Z/13DkR6a6SGfrbGJ0ynSq5ofzuKiZ3Ha9rENGM/1SfjgKCJdJVVG86QT19tRber0TO/ldRjNRK3x5zOw2Ys3WwLoSp5Rw2ph04M3/m9YGz3LOL1HL2cdi1VxwbVE5QUd/TClNPc0EIE9QBWjX18iatM1Yj+dI0zRXKTrGh7UDyso4AqVj+EEfxBo7ZefQzD01HBhOHOmJzLQs5CE/gyboynNC1at623r8xI6zNQFv+uUtMVOks70uWVbYV5HT5TxLv+kmUx4JCBL7Gl93PtrUT3n08WMjDEqX/SdKQUf9k7O8p5x5Rrwsz7DN0ACLW1TPHq6vWNiIdkevXxlQ4eN/QIUJSDoJVt9gW7YymYWMgoioU4KueXzP7KHshiRYwVhA9LgPBk23YVefNZ6NLHLcgj25mz/KSNOS93oWDk5LptPulVI4IJ0lBS08kGRe8pq09AssauHVNQntd/CI1jnF4Hf7C8+n+UrtiMXz7C4p6CX8IKtNltrhXPkQof0MDR4wEgYafgMVafmgzU0tXyQ/rSk5CttJBZl4cx8DYzQFsiZE4Sq+CS7GLWDi5jeaxCz80w/nL2Sw7Ak0R5M8NRKmKHn0SABSXlkx0u4PjAC43zIZe3bIjmvv8ozTx9Uh1w5r++SCe9wpb+Pzok2FrIymKTwvOIC6WQJngxLSWIUIbtAynLXva1XEe/Novmg7/hTh5KLmx1CdxswU0SWeCppVxKRGzixFQ/IDuDLTZlQszqQVuf4KVMxESr0AXKNYZs3fxumwF77yBnUeo0G2ej+3wYTx0PGYUfMQWUcOZQuk+guJrjL4Tk+VvjgF2OOwYOvofbljM80BZtwHYgI72Sg7YMgdaJHjuIHyn7mRBSoF3XpFSY5oiUdyC6y+ROvjkAHWUzJUBF+aNZXbBGcgr7ZnlnOtICpibUeLSKjIrxJ1ZuVUTIbpUP3ZUr+ZL0mNrEH/cpgCca0CwtjmD1OvFPPEjvAbQGMZ7OMeLcr1kd+DxjxLAkigwF1cEDFkvz6kfFAj5K+pkss0ytRriKrXOpOvnQcqzloaWdVk5advV+ragFSGmmT5engpYKemJ/PZoLrobaxU6thdof0JLYYQ6S5GBYM3knR0UyyQ+nngaX9n+IgPZOjMJuVHG5YP3kgLAsAjcbA0NfSa0EWyjDCiYv/sNdYacgoGa+JlRpAnR3cPyEv3ObcBuMZT+z37fnSZ8tUQ8AvA9QeIPNtp1wI8zEoZ20gNGFlELa4jS4CE1IXeXng+0XUKZkRkrWVrnYqyQDgN0PDZTnNLL8Nir3zdtkAvFJkrOrDmyIJkadRLTfWNpfkXmhhuPvIPSDuQRRp6hS7KZXC6ntFM/zKLS8XbeSBEonhMDc6qjk/qhLgruUodQjpgF24+lg+SPHy5CWYrNFLbhqewuTB9NMdUKXL8xntOcXrWd0o2WYcCCSAgA26y69uaT0sxeKmrP32plqJsRKkiEbDs7IyBNKkLkDwo88G8ErLyNUD24am3le1JtSmtIYvXwLz90R5fqaVRKXk8A07JJ//TjvPde7XeP2/bw7Qd3YEyFMbwDl3+1BEA3cOkHtnAhMybXigyeD5LtmNtG2CCh91yoIh9kXqlf+PMxU7giQqNJdVLipCg0zNyu6IPSt7WYAoWcM8E7KVO273xXzExVVup2WQ7SyI/SVzvBPL9U4szVBFOI8RyKV58ItlNmwBkb1vHDbZB4ELfGjgt2qkeJ1yeIEOLEo1mIEKPyvkLezULcXROm2WLYOchKliKEwG03PsxPuG9Gz6Yx+DSnBdEphukCUVUu3I90SnsS+UdXL17PT/lJua2PZ3FsdjNpMK020QY1HwIru3oFPdaygXnlnU/T2R0H8U9+pMtQ24zmMospO+wAnGhBMKzW4JLiyrNGO6CsLAeHIAQajcAyge9Ob1XG5oE5m0w39srX7EJi7OdutSmT0JbFCI8h4ZmXn2iVXcDbilqN/GyBef6AtxrIhQ4HBa2gjbyeQDpupUgce+jqoLYvAdeZQbdIfYBhXQoij0wPEzU+VQttluBz16cfyUYLf1AhVNGUB32m24XokHg5Lw7GyCkp40JmtnYB0FlXs7tD10wEs4pOm96U9pZ+SgMVa+1gT4jWFjMXN8iASAo4eV6+xjTcum1DqGmNUNUKHft5pVE/img9mLx9iU2JiO9/CsmH0M+To3ZSjK06Hizi2QfFJiUU2Soai9N+vR26DjLV95n1KfgGYRbpESSrzfSegqMcx14CePw+lF63OmyqoIt8XpvUAyg6ZRTsCla6La1aIBSJWjXeSGSwIzIvDM8x7MvjwcPEC6blRfDuQ5gUD8JZeSO9cZ+rrDR4a1zR4GyVxvkzOudTxjJxYA2aQz/Yg1PUJivEQpsnAByjxj3qBctfjuNjWB9tU6Fzk0o2gaGIOz4EQpc+bhy91LTiSB2TcisehKfij/v/uLhu4vENkxjb1oYf9O5JYCPGT3S8pnmbjv9vUnfFPNpaWdfyPAoz+1wYqe8ZvdpSEjb5wJXLeFvlL2Kpz7k1zQe/xh0i2sNjgo7Ic9iVW3D7NXz3b8Wa6OVXTCY685fwmGhs7Dt+qiaa5FXxHKF1AFc09k1bomI8SuhC3OyA/2iqtgqjVCAE37TJaHC+wR3+SlHX3SB+AL6Lbnj7aSGXGXZE7+OWwkgq8hWCAvkrTAkFFkV6BznsnUIGwCu3+lNuu4IvKaFYoSmL1uUtIzwchqI8/hpFt+GZytj2uIt8SdzWrf/Efm7KG02rTIv9fqRvFjMkFMj+JjRWYtMZXspFgBkCvIoeazvoG1YmnDs3JxoyXceK50AaIcQHPZnheGIdtjncImWAeh+SOENNXr+AL3udJhKKWvnnpzHMOYuKMAizLMFnDgKzi482/vM5fF5asEEoPn5zAf/B8uVZ7PeAbooecwGgCRkuG9lANtPG0+ibh+ojWPEbnhykcW+p+rC0nzMvvG/z0KO+pM5RQ5YfMoak94fWVc0/a/MR07OsVwGobg6qNNRERjVIQfE96torin0CY1cFksMUecb8jA4aoj7FCB7EZlAR2XzOlm0ZSL7cwF9W7kJnm4U0ekA8RWXxEdW5UDmOyTmwplNHZ9X0Rz/EEUGGXXSWexo89dEL7Z/7DlOvTA43eFKzV9AMUbZMSaadmlFRyAbPNu1bYBSlMUxiYwwsO9xXsnjmgfQiKOPC8UVTJZIIcc0N4E9K7dh+sbd1KaanA6JRM4yIo1NTyoyZK5lYpFdtDf9OhRMLDROMBE3HB96amG40Gr4D0cLy7LYUeAiWeyCJnxFNPVogU7gA9Wqshml2rWRwZTdw9LxyhBrnleh8Je9Z/djBKsH+hBAuTNIfbiVIxPteqnPay26VpjsRLmL0EYFJkCvtkUev7tdlLWBWnT4PbHp2ODKhVGq/q2s2/I5Qu9DfEMyEs1juTQs36LknNpNJc4LeO+pSjaNGs1QOIaC2xDjh0IR6dcnPy7Lha55Vrpgc8PGTqfgFx2/ZBBX/SPpC5F/ouQ1kuNgQ0gweRl/rL3dnk5N0VnJVy9ph350VzJXC8zGVKQddyp7PH6ZvrUdD37Ny9KrOBZiSKYj6Fnu8nRun6khXwJqswqbhAvI7Q7ulnKGrpobJO55LkBItzmXVin2pntzwf716w0w48L63EA0Ku4VCJXpYAPzcTzb/c/OhQjFDmA9/ePdSlyM7SRbxEvKZxEEzVDMFErrpbO37r/NfjiD7uWIhITtqrfPzWxjogvphLds4DwTbhjYbMTEi0BJIXsl9JeUiIf+fFXoq762Jk68SL8QRnNd2+LQHLee+aY8WwrMab1h8JA65DzmijlONUOfgML5c2cuT83bfZNcZRF+1Aybd69mx8cwzra5I8dbxOZNdx6W60K6nwz0F3Ka+SqxxyLsFbFL1qsGbNUAnF73jSQQptsAAYBnmZYBAHUwOtaxxGf7AgAAAAAEWVo=' WHERE catalog = '093624979357' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4BeYEIddAEABDna2OQMXSBl2IgBAphCa50VdN4wi3z8WyqKuBSupwOvz9u89eC+oVd7Y9T4bM+TtUiurH89rGh8ErPLC0JSk8d2k/i5b2UPm28f7sIT13kX5hosxXd9jtugCS7p95jbctyyCelsaLL5FYOpX6oF7rRv3+L7eAsy7KjbCjU1MmLT5hslEYLixnFGNfQMFgQPFJEtI4OzcKaAnmIyROoodiGfbdjjCpqIneqG+gynjqBvqH1DMp6qBf9kiQ7B8+Bn6tUXaGP0Rq+JoXddb7nI+FhxtdeQZH68XZ3HICxx0RRy05xP8zmIj1o4iAMW2kfPA7OGhOSFPORoeXeTsSNrAO+k1Lo8Lp32ziy5lCMQWHsS8N89cRKwxHDBDGzjGfUcWjpy6hdP+1bAm0U50VW/TmEuvDBeubXnXLLACsB54uD+Wa6Qx0w+eUlhVbN0CfMoybDPgEreDrvEPWXNow3HVS/ETFPijRxItQm7/V/tTRE3ftATydl+xZPkj7m2z8wdaAairkyVajJ0l+hBxI3aRlUNhK1nA43xlNzUhaZxIXfxGmL8qkVXwSwH4A99Xesn/+nLxpZRxTjRhS5N/2aG9lRLTiVqwPq25MQZQsgoI11CaQwcY35Qf7uE/NONddPVVVhCr3Qsk96bSZ2033N+FHmLlDA+uBl6SU388FK4J2t/LEgArq4fZAlWTfuTjQqjf6Wg3ZGx4oVPlK8VVsdYoUpmpWUjg+4vDZNu8eRfqs9/SK0WFUSMFNoPd8DCMN68mx1JZ1204K7bEjep+Bf2cSorpIHRuBgeKbmKkybAneBqmlAkq5BMIILtMNMGM15vENyRTKQ2tda392L3sCg3Cr0CasulJjviA2Od5WLFMkagtD6ruONHPwRKfR9JuHt4ZuCy79QyACkjyaIRarxZmDPwZl5gLLAbxS+52RU9cuzmsfLh9XXZ37Uztb9vU+ykDWN1WU+dO91bkug/09bXBXpMWtKCpl4wI2XdWAKRZx2pwNynHVr0PcwDKr/zWSU5X4MxLluFCwQtuJQcAIInBQZhAGc7vIgsmxOu4AFxdHGCi0v9wKWp//kG1+1CxbFMg/qprGkrKjptRwiOZpkOwoQxuqQxugy7EDD83glTL3rxMWW7KYoYO4GH89MaHQ+jndm/kiDFOqfh2Ml61Tp699NbswJQbzoKoQu7Qyykd6oVmBbBCxDabrtRmK5G/5Hn+CuTSdB9V9N89QDx40MyNYu/nQN9pHbFLmURpLE+U/NDqofgDxP2QSyXEw/kROwu4xQf9y+MpO+E5U9deXk7+l3hbH+CAZqEZWCNo9TKl4/4pDqjLFR2ZeMqIXGoFG3zV6s9B6br+87PZ0p62CK14QQPg1xlKttwVIWtxytOm/E5UsrWJqCupt2BlaQ6zZ/FAaWr6fJ1p5LtDb0riWpOg4OFmSDkN6KebC7I66qg0ZcXG4TE0pallRFCT8GtZF/ZQxUSWxwa3h8aO2VzSCvfiDMQL0NnurQABrXezlBEsTbPfKzSsQuz2M9RzbRKp/PHAF7xT33jzLfM4+6iqeAboy4qxJn+rnc27f763BylRJTgpcIiKZW4u4WWNBwTvCWSnyzOgGZXS61yHPx79/obkaFMfAFxk4z6NWOLNekTFsKC6DHhbnqgg8QkH2fAu4nZ4k3WgrSV+QgQYQ5eDjCF96iMdF4lWBLQOOqtUb4hk210odCYk/DNxOyC4g9Uz3HTU9n9CMM4Q24Ju4db3n8A9HOrgpiuG/whrtX4r8+iIMcLNQxprx+1usKw7BxAwn10BVvRoYw+OMkb83K7mzBniGrwqDPv60XKPiAmrypl1OcnK7GtEfuP5uWTwFGvl+QLRXhXWiBhAccbyrg6ZYKtDLr389o5JKdktBwKXIZDTczsvkQ5HJE+E4Aeq7SpvXiqvHsfvw2whobfIK/l1hUtHK3We+Y/c85CJ0v2wY84edorT/Mgdw4NGiFuLZzbTHFNwNo4OSQ7k3mBGcJp8fmNgY44MISzA1Zp0GssbE54fQfqytCNPpLK/qnRTM4CD2fRBjz2kijATKEzUm7z9cqch5OplNCgTH3jwrHmKRO2LE8LMoBSJpF0NxfgKgNterHpZIDGidvkPAfqczWfsb+g4447ls/MKxEnqgL8DLfCllojBZt8+YLAF18JjBmbZF/zPsv4i6E27GkRcukndxylV/NQvA/jUbgA5JaUidX5Cd42QK/m5y3XPRfpW/LTKKyCM2gs0dCUoddz3VJonoMsw/26KsZmiJEO1tA7ghN5SVKvWFVBN4haEJEeMBOgeAxtlxK/SVjc5QJWM/0bl3MSRg8X3jGO+DajSsaF3p3Xbn6Qef1rEB6YRUFsMHSpxo1W/oQVwc78wuyBLZxg6VmMZMF7SQdg2uOcCRojDR/9PrMMR/dPE1jTh27hVyH6aDTMMby/CuTUkieYKMw3rY8sWcxZUpZyX3NYG/3zUzbK2k/ZSDOSJzSSHlyPjzEcxGJ9Yy6S90yesAklwi5Qm4OTbRV5gAo+UtNND+HaafZlWzjaMZ1yNz05sh/nFmAksSwDPmwyyAo+teF/Y9Qs+SZFpxgxFu/fv3MtLJTtCenV5u6tU7qTpH+pzTRYrUXMSpexyTwo0Kyj3YxTJYoe1RlxwEFdYT3Kd/1c3LWl4c4ZelpPhTz53RCz1cBHTQXqBcvXuNDI2cOcmPZu7iHhZwJQknNd1QeyhEvmoRgGP9u4PzNU+lEV67J4RwxRQ28tc2PE/xhvSBBa1pu5sa0saF1b8lJODpkygHl+IMLsb7OW33YgilbAgI25OrDi/kpCIQjatgCa0ouWFxBIMnL36YMU0zxyfMCPkMK3eD9Dfb4bBVnxr8RZlUScs4bQ7wjNTBxMSL0W3icreordHKW33noJnN/93sO8fwVKh4GevvpYYZDZthgUm+6u80ubHCpKk7HbACPLrlnoL5F1DAfzdd50dUhC6e6ZXbOKIAZiitrnOeAYMqegFyPUqsWEzVL9ZVpGk0v5sBqOxavN5PI6G4u0/zxX31dcfz+q6h1vK5DbRLkNI3+25vnrTmzpOdFWPiE+TtfqyZAzmuahgVeL9BwNbvgovMMtwNZ2GFZyxHj123SWtc/bdOtDBS7Mn14mRubGSacC2lJXU5M+4YQj1aK7o2qliVByhKycB0ZwiwF4nJ3A9BRR0R+FL2xLznMx5P46oHNoH9+c8PbhklskPDzf0C19eRnavWw9C+UEyTIyHUu1j6ghKPxkQqUyMzSuxRK2wMdtctRchtn5js4RN3Pwv05KOyL8PHz9GGpaJ7poIwsGILS6ChgFpE9YsSiQXIPF5e0uI27hj9W00Yd98bIf5ROc1D56u1SBOxAI8I2EbJLX30plyX+2GB5rtCobiJr1eiB1CL2AD6nLAyqap8hpVOu5L4z1Cp+/iZ0p/0vQqE2/DLvmTP4c/rbgm5WhogAWWeW0HYU7wUDXCM/RcKj6MsIMpflSRuaouZYV4eX3CxYzhfn8p0Bh/TFkIoyd3uGtM4+FpsS0YcwMDTAYIGGKZHCvHXoOxagU9/aBm+la90y2DZAH6QvarlVZunqZuwBIuqlMzbq0egzSpdt5JCw6A6JGQSeV99GqYhQKp2VT/oLON4gStFDXwmkyGGpbtNlH0qHmSclJFXS26dA33hjPylFIGRxa5kO0mA2IS2q2MR/bz+F7BLNtSkNG8kiF+dpJYrnVDnZHxQhRmT4HIkFDtvz81dcr8gS0dGVprqJuJPQ4JF5Ioyp7lgjrdfOfgRrq4nl2Zjpxlc/EMiEpx8+NuT4WoNeYAa48BvJnbTLUvzmmMQGRRug3aBkREYhwGmu6JAtLJPXaFUYF9l/cIUcTUCG6gbEudpuk3gq6qEIvBrt0oMhV2YyPE1M714QY6XgYW4QaN3m0KZZzXsjfluEVQyM6fSLwa2XzbrBxjl5PaKnYcYAHvnJgJNIrDnF5DsO6nsGQ6j2JWAVMT3CbJCmXwaLc+/x8FcrBRiyhjY/B6R0Ab/c96beZtqb27jsXUqNFI3bisvNBxjCHpazI+XPjAQPOgwHTSKZyT7acCxdS76wWvNq1rFDIFUpGqbjLljI0MOMdmZc2V1HCE42cvrTkaYDTghhEYZKjbmNX7w/YtLaLHXNRqQH6neJ9tVWKpIig9EXSJm1FHjS8Is+6fkLBp2XKtubPFFzsofHLKo95YvIDyvsiX3tPQuGCDz7KYM2+PNJRmUqxlAuY06TLkeuig3EUwety9cuitLS+LhZMfTn2+RwufCUoapWL/jXov/FgwrCty2KlwUasnWxR59mj5gqFCoARx9xra1h+ofHs+gMTPXc8R6F3pAC6n05Q8Knxb8qj7VxVKL0Zy7DBW4za6OhtRSx9U0wC5EjBgk18eP6NaE2INwccu7aTYZ4yD1t8Cr07k+9s6I0TUgM7Ng6KSB97XE+T2RquTJ57Pej5V8xZDWSGYsHrtDunQLmsjqf/MO1dY78hEyqAsan1EEwOwAnRymKnEYKFMPgpm/ehG4r5Yhyx5ZaJiljgFVjNJboMfMEdmzP/AATGr043DCuOa9rkm0g9/J3kjmChrwoEmbcOro0UAgRIcK8ZkHYfNM6LBl+rVvVrUQQtILDvLoiK0sX/NlBa6Vn2srk8oTvYxgzaNcBpWA1mAOQSmC9+MUZjAHsLrEDLz8PQpU4qi7s002jQ18NJQKEUFQWWG5LGQhkb8HIIXszB+3hesvpNkX3hyAmFruaEDvkz1rsnIgoRv6zpuEi3Ow0QtIriJm+hQJAVkrgLZIFuVTQt+6RgUBlIoqxlxbfbV9MG/DgUHhET6Yg59LJ8XRfoygIi7IQuQitZXR9SQglI4H/IgAtpY9RQQX6I0TjAX7aLjVgTNHER3ujJElwHXZ7n1AeDoMaKir0/j9cBsKyMW01K76Och3sCHAO0nRnLhRwX4TcYamJ91tDMGoXx6l9A1Xg/7/V1ZAi+XW9pd2YxnNnX/m1fmOfugIxJrqO5wKHpOnW4D83e46qoPbmnlrTreekgVx6W3hdNvvyCvkb8ontZHr2BL8Esk3z4JVZ2n6IODID0RBE+PcFl1mQ/geXtzMjrKhMsVNCieIKBvUz8L/cdfv+1UPPGJjM7paq23EDSEXL2xagbkOaGd/WvluoD8apet9OMWaUPKPK+4e5GIPs2lesK6tZeHZES8HLH76+br69IwtjhhPiuUeIBZdDw4NdZhzwmuOY32QOqLxqIxL/vp6snfvIZNjTEzjCNEBbwG3ZxNstGnb/4VlQI67lSeta8aMolhmXDRWrBJH7wQjm51ltevvnB0ngXTHSjwuwDoAlqUCHpKXTkU6dlZD7ORmNL+ZhdIjknzlgYtMLqSJXKokPb1QS/9SHX/Meq8/oVdMng4BWCCi4Q4RgcT26ZjkvrfkihMhnUYPMtqAibs2yiZnqHc3k/Et8ZPubXccXBUFRgTqC3tMNPhlKpWoCes29sDYN66BTtpioAOUkTTasaVunIuz/WpiXf7zmRx/iclNWAQHHlH0Igewt4EhKW5xd/nZ9fbHzv3WzTey3fLlxjAOr2xE5d1OAb6wQKaBE2TK8guvUj1x3yLYXm7vn2CwgWllFZr7nDnjdMoYb9EOwNZ8aNjwjjDRU+GgwAAACTMOIOnyzuMAAGjIZkvAADaHiVTscRn+wIAAAAABFla' WHERE catalog = 'TestCategoryNotaReal 001' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4M4Zmu9dAEABDm4zznLI62iFTdl8R+iX5Ast/GICwEnFarHwfbjPUZQR4x76B096RSUzabi5Q0zXZEVScHJV8jquUOhiaol0nKAelcXzn9J/rvx1U09nljM64bci/sWn5TsQy2k/zcsDSTm1nQV+FodJUXSC8UTQi9rflebVST3XKdHK4rgAo6hd5SP7YvWtmwUuKMQH1zuaTA29/3stFmNqNzfpCRRZHuZexZyaVYtX2mY/XGqXNaNsFvrCxoVOR1sl6ib3iM3AfTy1We/hUPQNhz9HZszlKdnoCVN0OFHq9ehGHKRyHoAOoUXOkaxnPgLZsyEmiS6CrQyl7WS7Z6IscDiEmRK7QhaegNxxyzJP0Ct72ibiYNdlWHh0WunYuJaAAKfPlXPgzJc3UxaeqEDKsWvzFTxATY4Pcu0lEwVOjX+9TEDaB6wSPRbyS9gSiWhUvSV0I2smmOuzgCsU2SS8GTkqYNwB0Z9eRKIqDYE18xAA/bZZBIg+1WR13kwq+ykGsn6EMAvoYojTxQADEs5dY58gv6gRDIagLXSHst1VhOdEnU1AzDyTCYfAY3uesWE3g5h8kCrv/y2oZlZUwDI110rOTJU99Gwvb7vAV6+ZbD3hGwb+TnNAyHwV+BW3WpbzRXFmLAvVpR+jmd19+pcxEr883q2qCGN3Afw8O5FzB2z5jm5buKwtyVHDf/goxtpRHBC/n/i60A1zBh3ihDBrdSsasE4zGDSH/X1JxwnZAV3hoPpy8ScAtDOYzbWdhapZAyfTMWGqCQ1KuZgnf7Mjvnb7MBgk8m4OCdv8FCaNxgOOKo4uPHYqaSC5v5Pj4HtbFi45FqJz7X4h+6wGRm2b2Lj+aOIeT26XK8JgGO7OVVUf5APMu2YRGvtAmaVgHcpMBCSVZTypg/gOEjrbGYVyanh1MZ/tsA5TYhU0qQfbhCEqCdInLVQ1LT5EJpjXRpRDDCoMEYnZMRiaj2M68YesxK4akQqxbBKMYd4XYak52guNP4cOWDZ1bwZbPJFs0XMomhzuUdcA3E5H/+YX4riGyRgauuuzafzko1bZNPAv+W720PUGI28QaVYSaAjtcYOsf9q1RQsvmSx+PuAFZlDfs+D6nAo4PErBBgRqrSzxqtm1tmlj22Xncx80bnC8K+Xp1R+15B2OwmTY8Mv4frzG8IZwmiqDUTIlUq3/vD06on/7QOKkSDfSEmMawb065wEWYuB1AvVoM0Sa2wyaR/vWcwrmMeJpxU1PDHJTHHILJZJFQ5MJRiTHWGrTlZXe4xrE24YxUEhfA/O3FJPf2qAxZ+pAvlJ7pCmm++47zAnVDrrbOqHYjulmUAz3o2olMShreKNgoHbiRhcE6CmTGmWvXmUuLgr+Eg0Nho9xBP0fg8SKeT4Ro+TUO3lBDOTe8+n0m7oyR8xbKa0rD/Sx2H1NsOaOYGDJySLHLoxAz4qLQeq4P7If2OV41ILzKf+uaaA5HO9uLsFKXdRh+7vh5iYpJOri0adUlqlnj2UshCiv3238fVq9QRqOgQoneiuPJE76BL3fDBRV2eCdRwaZy/A2QfSMaLkX7C7pqJnkThHpyMN9BtmYWeOgOioUS0rtS04gnXw11nXKvKi56XsGyg7x5gSFn/dtQImC1+YtAIPxiI5uUQJWSryxb2ViefTtKVD2MkUFIvRuxG/cFo2aUsOCjiAgtX2QEQRArnNir179PznOMuIoM9deip2DSIi1jBDoaGiuiKgnx0vvMmjW3JczGLRZ8yZUAOoN/K1BioTfnwgx02KuGEVr+bk2wr7ZO+KgUm1ZFLVTpzzo4pmHlGaBaBxAHZGJ4jlIlcZtZqe6uZzVb80X3P48rMZ5HOVNCY0TfbZbZ79KRAZP2DgHlDukIOACaUiKxUFswniOnuxQvg+SpvDlScL7tZPu81ZPxT0sfZZZ7Hj3ikzIJIAwkhfqGtoBuxbVY6EatafnY38J4+jY1xcL52E9zhLb49icZ6xmJGgPhDb2Iehwy4usiUl3obzlhP052HOiRSUHshoyAwDXuPtJttX4lq7n+DEmYVD8Sq1edH1mMaN/zJ9RPuvGBABDvkWmdZZuCLooIQK2960Vo7/2feAB6RlccKcbskDDV3/ABRe1zaeZ4+EukaTHBB1oFVBeNnKbDZ4P1ksM1exDsqNwKVlGcAJhS24ns9Es8UVniO7/zkuZhJf78uAG6rkM4VW9klPMcDc/cd4xQ/4+qxKrGmzx9h3wqpP5ZYmVzMfOt5wl0hvB3Lgf7wYQrppfXSrko6SwvmBU85G1fNh29hyXBRAzeHYjaUyZFt1q5gS5WYv0KuCYngdqHk6TV7hIY+4rze4YDe5PoZ903oNeyFfHH16HgH2q6103uzZJy0wK/728Q15aAXP2rgotufvvT+cRTZ8iKinlp9O9k6sUl49hIPHfQ9SFai7Heu0EM5EVCV9qi/JmT7vGiPthAPlanjC2RL6bzN8fVI8P+XnmpKhpr7LF/AL0zL3WQcAzlPn5lZV6etoixOObb6gV9G4nxIX/q60zO7YehGWJIB9h3wZKsgfz610MWJPsJU7lKtu60ot7HYmgzggnSLi9Ov7oqhAgI2tSYs73E3VFQ//2vwDMKnJJS9NGj5RvSvd9DViszdhRYmhwnvwtAZjuAxTFYAZw4MDlGmHGewsD0adIQ+KSVZBN9c9qbbspw6yiw8W28TCeQFwuh3wbRmuPADSTBrSM5ukAlh1bSDvrdWDfIyRWqRDG5HwWDDibtNUDyK1o1UUGpX1t7Mo3wD1PA0pzA5LZqLELRG/Ah9EdOAQR1zVtax83PNsD06BaCByM9Z3vnUXZJ0iYiebR86U/izREsn8dPX3XoF1sA88B+dKR6gzp5W8s9eE/vZ6CUdoYMhn3VlBK+7C4TuUjEbrGfz3KYU3snfsjQRFPLawyivLklVS+szivzZfvIv9lUK7Dpexjdp8iu5GBpl2tr/CHxIGoEhqTFWeXgnv4PEnj8g/dYr2QNrcIbcYcNu+e5215IEJxqMFgiSu5yQqR1qN8wm7UEx8M68ioUrdmGFuCyWdNjW4kb2xiIG1+0GnyfCyySCsP0AuxKuPRn2H7GBLoJJQBMWybzv2SEVidFESHys0h66w9W8RsYaKjCnA4uSD+sETNya+Tvzuwpvg7VWXdCnhBmRf2Jl13nlGggQI/6irUsY8hYFGW0dMWXZKqozuKP1Ow47aBXqdE/j9Tg1RIQxDmKz1jM+Ve4+gG3zYouDfky2XRRLKKJqP7vzFbIJZjv8BNp98sCZpQZl1cBmNIfi8Y5H5Om49ECU15HraicfR0yrkII00a1qPbwnPbhquO6Z47Eil7Myj5znkalFVAW3C6eeCu4RYWIJ9eNHE93NQUV5ujBddMZrLf5Pjr3TEZtZ3BpMsEebZ42pHi6YZmXuqL7Uohm9quhaM500vAxiY9Junp1C6KYEs370jDUXmyFhB6nEPZWkwwC0kgNYssE4iPTOlMerE3PYItDFYYOg4r0gU2vVXLQsy0hBgY0bJ8OjFcufc1/cuxfPHsMNlRyeJpDW4IWPXReIwkJvVHh8hXTKS7hQM1+OGV1t1mvnhvoqi04Gvy5AsafFF/Ht+RmIG2+Cjp6pBTFgYwJnUuUsx3/D2U77wawK30DNfGh3A9GKiZUC0Tq8SfPDPXUl9G+yIZ86pC9+nIWsbtJXJ6pVrPq/ycDB4C8JDQ0Zrwid69asIp8cUJCUdcDVtE/bHS8pr3pPmJQ35yoSPhAGXGoH/JcW+fZicmLKv2eOFRHxPFNN+IPYM6l57gdICInSqP/ffa3N7PWHwQX2WtzxPH+I63vGAqUkhJy5afn4X391EVifviJrqUZxMXCQqPkRdDjipZCdnEI/nNGb+nEF5KKAWR+SsxElR/Ep0Q4YFUPyaNCwlppCzuJUniIRshAZCon53+TGJVMwlYJ8ikzny0GlrIC3EMpZzi9Z8ZJQW0scC6SQaCfdN/qcExEeRvinPUfbmTjk/SYIAsaxoktDzeCWbW/wNiigVol13V0PSyYu6xmECubIBDY2Ixmimoz72lo8Q1mow01wKzTwh0t7V2lQT2n2ig/6enAYnF2+uLKCc2A4Wzjrevliw3TzQWIgXbghxsUbxhlp/MMfwoPkAOOoJqaOsVe5btylXSLx1CcTQqVWvqSlesgNPRSlO4z35NH5j0NEAMzSYlhnx9q+7xrrvI0Bre8WcWtmYenXSo/lN8WyyDQI9du/VGxjrtGs0HpB2zwjETO0fR39D2AFsZMTSVJos4U6i7YJ/WiBDwp39lgLCXkpzi+e4bK8JNVulkdYxSTmL0jc3V7Yf1ySc7v5pqMkC9JnbsJhMEXKsLiKeWbMSG1IwT8ERVFkuAOn0iVvSdCxgqNVYKPZCd8MeakJBI0sfmHcNS1gKpxTUrx8mobPw2hCX4Z2rxJ9l5dgIT1K/wc7Qrr9ZXE2On/wZHWCQjdc3xeAYvs7B/+L9rFLJK6fR/3e8prsg71XZe+D3GuXQNG2mtLk+Yk47202/LqGnbHDi6L6rp0a6rk9dXfvdVLTGRW0K5F91I8toFLJ3+TglNeuNH0bNzTHr/MAeQO11ytzC6nu8K9jDBcZq1K3952GrVkwTxcOn/6lwAEIWkru6v7GMmyR/LKXMk5+MqOruIyANr0IwALJYLgT2MksVVbFPm6k1FHd7LaubjZXwG/2yG+puaMB5TKTfnl2UlisZ3Oghe2EkNTPFLIhAbVCoFtoKQZWTNwpuZIArurLxeZZJnsX5tl7WRYwTzVaQNrlDWExJVHH7ANo+1VQGgfvvUn/u1ZyDLhxBIJQmqthoojLq9wQGvOTJfFLZegonM/Hmf3cgMqdw/ABsIM5b38f9pfZqVaZSmquGaI0TENKzHGOjuvO2/M4hDQs4FaKajJ7j7uiZ7m/lPBNo2UPgc8l9OyK40lioTY9BWEvvODSIxiHQ8HQK4+Srs63PTVbZJodErPWrWehcMR2BWNUeWFQoZtDXqjB1A4sy+gouLGeMnE6mguHDKLLrIqWF7IglERZrpVxPQXVMlbcdklLQrKaCIUq0mWlKAxD5lb1np0bRfEZ4rpxjYHCQph8edpRTz+D9+9phM3qH3dPrU9bU+F6YXlPXWUAQrI+nY3ByHW2QqPwaAUDiWJmUlHzAinaDd1JlrBvfWJlZKyuV5r57w4L8Knvcq1rAFMq/dl6YzKIn1GJdilkOeVQIHFxkqE7KqxJ0quxy+u40oL7vB0i5R5ZxNJZJIvX1XQs/skTz/0ffF7BTpMY09uMt71jMKgk/MIouB2m+r9cIz40B4YlBgTMuh+Z87baIKllpgS1fISZJeCuxSZEMfag4QgbqzKnmRsGUeZHmRsLgTUCtzr5m2jL5/f8tcGzVm9ADCHaSizKFJoov3utm7pveaZU2OcnT4c5sg3XlrOXuZk/fGskN8zbnwi0NqJuAZVcHybD/uYrdRCKrdOhX94JIQ+dXL1VzpjZ4iRfuXziT1lgm2NJgU7TlJTjWV9XWELhAFWt8FulKLN+5JJ2UrNk59OmwE43soWw5AHB/c5Vg+VzIVqfX50+4TO6Z2bgw1kqJsBGzy6655d4XqFxy0Se5xmKciitoLm5R3PeKHaCON0AANmbo2ma7ydmI1+ghBHhbevu+X3PpcTnipoSLLIb96N5sSNQL5jiaUXVa9CoagFsHeGacYdY6tYjKmmaWVixgcm6CcHr9aoAf8dw2zIM3OEymCqhfGEq4sdzg5ajlBNNBsZ2Ar6tDa4UZSnml1cC2dl9qqKuiE/YqvZ0q77ATea7N9TO64nbJdKaKCjjaJ+BM0HQRNTOcyV0Z6y6G0IRfCJBoIS8wHdeS5sc7s2GcDSviN6KoANSVF5KTiuH/E2iIuY8noMmnM3QLS19Fpz2seGnetAt8FK6t1mvJmFLhoF/9glNRHC7zt4cisE15PC8vGR4/kR5tqOq0x7gi44qJK8x++OVkXDLky9Kp2XA7YroQl74I2otl5nCMIoWmtZ9Dsn17q6i7V9uTg1sDKWmy1pF7aXWTimtolY7lBVNfd48PNvDlXsArzOxHRCWX7a/gEstUOu12bQ4IBnT9p/ySJpB1DeYRMneoGM3qbIyHC/9WpkyXZuOVYt77johQH5OtyV1ZF0U64qTdVjNoTydJVmTNU13NXMr4eFGGSITuNGEIeltoYE5S7O+r823DCqnHM9XybbtlONojb0ZraPPIY4Sd0kWt50PJw6ottThKeFyqVFHX9p7EVxCGrvYH77imK9r1Nebu+1reBiAuoLKXfExXxB7sHK3EZmnt98hkrRDhgB2YkyyS3xGlFV0G4Jr+d4uWa8jp+V2jXpv+mYDLfzj8+zUcKOWZHQm81AQnzmyC4F/IiATa5mB09/mQ9e8UuJ9GI4ZXcppzWygaPAFk8mzfmqjlovaRWYca7c/YSroWZ01pemY4xLCvdaxAwQKIGVSPyG6B7KV+zcZCjCT+YlpWRiTc458ahD7qqt4Q+GMNYwmtrRnCH0jaqsODiugan2YmWHmYzmWEH9XgDq2/UwHCX4E0/szNTohqrZZsVK+rskhBC0qxA4n9fb9sOlS8zEx9agsXSBN1/DsUDkd1Wql53jdQ1EjYMFT8Xz5jQnFyVDV7hW+MKI1r0BNhLJdefyloAoS/wjKNBHI6gCwA9KZXkEVE01jTikemiHzMewAbs8Sz1WKou4mbc0dgp3SwFCqxVnEQ0QCPKCOz6zE53Y6oxkWWYpImV6o4pnrGpNX8MiczRDglTWRj7xrXgVukSVQZm9xWloq4ZaY9D8dkK73/HNBrcaYXAPu7+k6e7z/RhRgP5U1tMm0yhXwfnxr0JaiDTEtqMiQDNP5L13VfTaC7vJDdYTvTEVyZ04VH9SiZZMgDMfBNvMjB646xSljM5kgq3q05IZYf0kYcVliel8a4khWikViwk7YM2B7WnSxWNm5hSHwbti6P3vrszXNBfgJG0DtJ1dKVc/+vZgxEVGOglJst8EOAPwPPX3t227UX6dlM7kEpGpIP6L0e1RGqTbWnH7nvcBP4KNcyEyce96SiM9Ej1zkMsrW556CjDNagzEtTUD7Zbptu1hsxWZ2jaLzYDXQDUjp9kuBAIlHCruOm3evuLV9d36EAKu8/STfZI7dUWE582BpNo8eZJLshYglzXvD7etJyya/3naqBZSU94v7bVKAw8U0rGQGsqgrRG6mMco4C9rBcPbrvJWpdxzsAx+AQhCF7OP9wnVSel3u6T9sMINVRd3/2ycTwRgm6ldiRbig3bSbY0SN7Pa24dU+rP8toE0tql3po4T+WzL5Jx/OkEDyHgZ2No9QMqRULmM7e+rnTMQO5lhz6Es9C0O8dHx5AW5O5VeSB2DHzg2UGaoxO7TRFmDTI/VsruCniREYBgmC2TWxzgT/o/gDJa5Dojq2hZzOFnPee0LthnmzN4Uv9nRBQRzz5lXOnAQjjxNlCnxNqPfKyGb6gM2cfGMJQ9+yedt+mXwm6O/Z48WsCzYt7GXGCVo3ebs+xQVReXflJygSZ59sqKlMVV5QWYyl2JF4lZ6EHgAQ2QFkKsm5dabOCdRLAgPRaqXvmHzZnwdKAeg7rJ9hwhoNfCZSdJOQ0uP4CDK8V734eNHZSLDVJKKLYApzVlbBfzKUm41o3gV4MkUcQ0F/zNj8TBA6fgDm70qOwWdPDZXz+SuhgRRnGebNiaukQOYZJP3OZ8eeck714Wlsl2rSqqasZyPSJn4X9yyIavhVYqgbnuxL5KYk3J65Fg//2cf157e/CruiIF/nOkBORPJHhuGyzS63kki7SB0OatKrEH2Oo6AR/BdctE4Ba8Nli1XrshURDSFIdfuD7i1ZF5hSqcc9lk5S6zu7Z76n2DzPKLuPn8Q60dZ291Gd+hQT7Qdogl9fP632YJ9tKhEFx7b1frU65d2wZusEdfzJfa+xxSTbvisjjVRYp9ci+ZvJNC7DYc0bWoxGdP7GDYVLMk/YSzuDoSvyjoZsxn+/RzOtrUgJF3nFbkILOnzzPUdW3WxOjzRX2vm9a1zbdcVtg6NPx0CrJyS07cKRg4pAf10aMs+toooFqwQ1WmdL2AvdqcvVklOPLHHI30dyTpJCFn/Pb24Z7UtpsDlbWUSf9md2NJ9kYDzCtXYXEk/InnOTm74OcUYT7WxyFTogM/8BUfAyUSfQ7uQCdtm0DkkV5H9lvN+GA+0C9Un05wtlcASE8Zu46j90+bkg2TWrfQS8lrZnpVn+v37+zTTCYRkcVxaoHX+TV6Nj97yDwpthud/N7BQCUohW5t/zD3js59R1CZlg2pWpqeDQbX/ZgQc5IO4tj86bip3Oct88j3EYWtJPOcE6BxOtsxxd6jW0ck2p6vEQ1dgeI5GkUQmvwO5pnPWu5V4zEcpGaSuahwrRssSH8Cvso70ib8aT4HFFmDTBJVlrISFVY7zy+aaXEEOj06IkXJuu4X6dpwerE0x1rXuxVLSW6hd4ybjpP8A2zQ/ygssTPDz3Fk7vxgwvwssqVwsPS2zObnNAdzovrw1zISKfneeejURTZOsv8rbbIb34mmAidQX0CYIcgqFw3Jcud7rlQ1XnkpKywhKcK7dNAXDnmNvJ08DSptoLxkUGzPcxec8iCJNqK5Gj0SfuGjSO5nFEnTl15m6VbUpCZqFswQbYnbkCys7XTPKfzkeJ4CFWyUJzS+zyLjDizDgPL1eJhYT/LgBIIo5Jd23X/4W601YCB+PGlVOSoVAUbio0qVNz+AM5VSQdNvHh552GFeVxo9QojubAs1OahFkaa653fX3qK+PxEYv84di3YsnN4Rmv22dcJT1BJ4kcUUNexJNSr42ZNb7feHJUdqm47WSYZQxinS9+yUuTSnbGyx89OHXlwYRs5Ie/69pjdyHer+iPDJ5FsGxaf8s61eMDmzW18RNapyNAShu05l+x7KQMxbTM4OyrWDpUK/ldG8WdwXAUEF2RsL+KecD1P2MXNK4mpL0VMOpKAjtokFMIBRUz8lFDgWhIWQwnEBSddYe3KHh7kQ0xLQaUg+fDEP1+8q/W1RGR5tQZZKi9P94hDtf8Aum6i1s/7SFqz/GVHwzQg5LMKYJHMkrnmPicCg3MB/c+FJpu77kbF1YjToRwdPgXVg3DWikVW8PDZQq8dWZ+3oqrwf24kc/7vkvfZyzFIlos/gYj85TQg7EGrVX7edjFnM5wuGOTl9UHZ0CR53W843Bz9MPxFtSCA6xEPzS/IlS8cizL9QkRRuV/VSNl3+JL4cs56hVPa3mNKsLxo53i1Qazrva+BBXLPsd+Rz5lPg/gaG210PgGrpuunlaQBoLRCNtlswHjE97z+yeXC/rdLVfTfQs2zNPu5UaI6YilVkNkdaD47UHJw+gzeAWLRzFTBAtXdb+aRyQmOFdadyIUE6zt8y3IYwsxuxcjdo1eVe4Seou7myVDqHn0VIKMb0FauMT+nj/TW5kn+qrD7rpE07hgrDBbBzh12bm6CxoAjdjs/+8l0Ufw4sQupG6RyO/NFCufmIvqbEdMJgyO6GOVuxOZEw3u84EBN3G+vytuPkqtdgTz5eu2GaWL/NH/mEYgq7JK/D3gUxI8iRJMhU2qKlM/oE4jRwSvRCIgHCNA7PtkvNqJdbYacAP4QntNwXIuGxbNY9sgcjznbXWkLaxN8BTFrlETw+Yv0JEbaFiG6vdI5xqXiElkkmWjk6NY5HG17GMXEEgXUFwvxXfvhRnZ3Nm2hOuqyk7e/XEy/8NQe7RGjktHIWl5l3s58WS2P0aDqCqLRkgYHccEmwjYImbZdHrutL1VILQ6hzn3qUJzfSq453oejTB79dyClhbAgWexmY0uzmpV7zuAjMvaEzL+o5akRBZWx03XRg3PRtp6ypzYOWeG4zoGmTaN1+N0lSAM0Ps4jinuonBQTa89d8h+bVTB828KibgSctPAQFipMt9z3NhaEPez5wtNs5E2TTgEOVBBK8Yvrbqw0cIdc80KvCZ4sqQqbACFrE49Vg2dkR1ppaji48Bw3Y3Y9DTNwdkBqcH1LAPVrXhFyalVst+dJ8WRDl0Hy7ndSEO+emJGiZ7BGlPxHSzzDLaJXM30RnReUTVnU75ozSQlvPLUVc8Ojky7Mp0rIePG+lHX1iIWXfRbKKn3MKMVWgrN1VPA6KRZkzbixNClhOcJdLGE07LCLY93pocmIAxD/xczh4NzXCyaLMRC96zrn6gAcbeS0F16h+ceJeSmMA0B0/DEeJHxHSUWldW2jhKMngeUoOKtFPnuJsTMobnd8k7GM4r2Ha2Yvi9x3f9TkTxO3+foP0M/NlFI4rSLV05c9gNivADw/sj3eh0zknYtO0NtbIbNFo9VdePV342Oc2gDCxzuKyEd3Gkmt8AL6fGDXfqj7AIW+V0ZXhisYpA8OyMZJLkiVQLLo0slTsaLyaKFW5MlYyqW1/z7N3hh+bnIXCJUrciZet+6D6zNlPoZYjwRFmT3QUwiL6zi1HVaS5u+zbhuxZbtn4a6PSBCmuGxJht9U76dQhk4UX/D7gQZhsYY303MVKojD2NUg0TClPygK3qfHbgGmzIjPbCLSeBMbzi8p5FARDNCGbfhsB5bXf3JQj4U/VDcyh3XIaUbuZvbkUgm+P6s6ABqcXTk7gAjdom7CQ/NLZ5tVc9ctEkbI5ZWk4cC8qWNaE+K8au2rs0FzUTWGLEHpddag8jqE3pVYYXsVSHU85eL7HdYzZbZqN1HFPSVxN9ZdNpXtGa6XkctT5nD8J6ghAJgSAUJ1WynR7EepXXNtBoHiObYWITivK/WKPBMps9f91bvnqR2ZRS3QZacnBVSrjCPWsl9ddFZUGOyY3H672kNd3RHeui1r9amEKXiGNB575EB6nHBS5URp5AKmKKSEyhWJyLoiJvZy/9uyZSTD8rMKu1avrc+24k7gmh5oxMzxTlCfo8SPbYXiE9d7G9Fs2XmuTaZJlzisKjnIJu48/7DQpTwOQDTM+M23NNjLaBA3r//T1k9HoTIi45SA7ThVpI+jPU0XeV0CF/pLKnuqMsLxYVr+xcg96XY8XpcxrvsbCze/RAuUeeeP64ilMznVmKZa7rOiZyLZiok8Mhh6TQufnQeaAdODsFev5TEwLjitH8vJSqWSVdkQquG1xW/E0Zkp//zG22JDHJgsFc7RQbG4Es/MELEiyPFeoy3+C2Rs/pwtRX3JMkfkmWAiyUd1xp007++rXeYrlC0ptscd6ywkShvhGARTjazezqvszM+M2yHYK7hwX3xn/1yeLpJYUT94VK6vdRmcdrWO8B/SE4mc3FeQUHitFKCmWvwWOLqvkhnJY+TdiKBskZxPcpBanxQhIfVkqjMMxKuMgcj3iTQre48SIyj8zvi2wU3G+/HglcdCHPmGybGNSOI0w4y1DSOOt0uVX7+dMyISpacWE8VJH8uOIDHHWrd46W/uyAIyyw6l3b1WM2y6sIIvXRf3H7bCrB7XZ5nf6Mr6wVSJT97nWnfntq8twtpZ/fUAbKjNchzdJ9aPJNkyOymQi2pTeJW0vy+PPKY/cJGD2XwP2AGEhGGgHm7LrBYcf5YZhqSMyxLMwRWC0pYFOrlqzQGIjEmRA+cEsM/8B/rmQTsI/VsEdi6UdZLoBeRoeVGRTS6FfJCny51ZLIgIxI+uArbM2mBu9XCCoQE/yKt84PE6r1nYUujel/dsVnQbfcZNqmRVJtlxj80YYYkGDPjQJjBiFbSAjTYu2Rg8F6n3o3BI7m6YTELGnnXefNKKkXqOi8Fihitsce0mMbTWWcJOuzWQzF9uNv3nQNnJdmjnQeknAh5lNo+zU7M1e4HX3CvIHKurBAml0zcSqHbOqd+z8/N/zKnxrlt2y5m4IZWamn9JqPCRhjaxQThWjhkNXS+5mDAH3/6UpG7HABkIQlhKureFC4LIEmK4yM4YGtTBrDpteOrKaoXEhw9O7+OEm5484Nqtn4C4PCmcZ1qC9hiaovJisL0ZMqkFwOWq38IWXkx7fx2ynxlfPLRypcr0uDYL1G3rPdP4gGbAyN26QQ6FDv7FG3Re0S34vT+vQSBBsjE3MaKv9ocyxWlyv0jaKkRyWLcH7f+yjhuKQ6wFqxd8Bv90VHNgiMww0VwTangNHUgWgRO6a+yPUEfD9SKlG051vITSuWfrYlxa38u4ZtdwL6bSYI7fDMLM9zsFRTglv1PctVK83OvfwOwrD2a7to45gXAIhiX5GG4VK5uaZPADTJT5IsObbpG+OpKhhiDNc/HVe0VRETaMRe2OStDg2IEo6kLXLVvUIMZAUClkHAzaQ849qZjlB6PpRfOzdtqdxH/p+quSsLMc/6IVxptoi+hkQAl+k14wCEp1RA3O2bPdzhMZ9NXGQisrpKAgPyjCJ1Ds7OhTMeArfzH5YuIC1ID7kKIxky3sWSCY8p3lfTTFxj39BeHRnkLN1I5Jp/iTF5hk9pAbt0tV97lGF66deHF9JHLpqEMIZoZYnOzHtD4FzpjPI6em7NRAmH1AxP9K5hgngqt3P3wZ9muDE59cvnC3v/CBgMdnVBuiSwxKmeZzSGBEvA/O6jb/VPOPBQ0OIjdOXtP6LMwS2McAHcmy7psvWWpavpCA2Hl+htr0yk1xjN0E4EDWrumOA5crAH72/25p0GxMJuZg9LznwOa5Q4YtuJU9u/0eounMdwwS1tQ1d1oP7WQKydCm5kSS4mrs5abUARWxkCfwrPSjXFPKu1Nz3ZStdbOa8fK847ASGizXg5i4uuzDMMwQ6h1yO9uoNCcNDQARIDQaYZo6hsZqByQqHg7YZFs9nEPgafHyI76O8BZGqnVPoym42d89cIJiUO7AVPPRvb03YaTRwgvrRRMb2BjGSC+AgywFuHhZ6OHV0XCwa3DQ65TSODAUTLSu3RCw2AHY1wQfyqODtpaftdtzcnAaAEuudE0PAJOTgpfZm+8C7vStPE4HXT/jzbd6sGUOPYb2jU90ycIk0gTo20wFS4xhYQCxJwRGL0HdPNvbZM0Vzn8SWktyT3xtpU7XoutYgx1Vs/wo4g8KiVmFIFgrE0NUiBZd/1MJo/OiDv1daWiBSY8QZBbgGfFkA4qRMs6skcLfMK3beJkiQFTSJQefz48pFKylDf88NME0CSfUYk1Szgl/q2tPa5c5rALAbcPmehvIdf+trwFPqtvKg6ogFBtui9qCA6xQZpR3O4v/Zan2mQODjwchvoLbjlJ/qqFB9e1YwjaKi1upMdKPnyDlC1H5Veyd5QNBIVUbHedbi4g2jITmJ6JgdtxQhNiQDS2ENJfE5aWMqqSYnH3USVkgXE8E2X/c2PJEQz8ktJsakY9ZIJ/nT0WnnTb1ktY11/e1U+BrSYEAfeM+NVL6cYDheOFOtAkxh0eqggFNDXgbf4zJprHhufnOkzlCuRrcyPbm/yiy6Sni/hyeUwpY1+/6tEH92jkxD8uJAPH2S7CfnCYC52ZWP98ploh5fpARWrMJCs72iZJUVRWNLvb9yJr5j18tHwl+1vZyJn7f9tFErm97EquXFnlsLCZ3+WDeft//Zh5V3pKvzt2dD9J21m83u4EY0dvrtDtvtc/UOZk3KpV9zVdBQjAjI6qEdlBeVtPBV15MuHnvOsqaUCA+iqECVKRL+l/YsXvkdj3JNRaacpVF86BH3gbtIdqBdSgePAK1p2UR01GxceWFaaum9QmScZmM5E2ws+SteTJh8bGBQ2cebTtOUIszICfezLI88lStmbpbLsJ8A7QLxYQ7jz1qnwGbORsKBl8L3rMcu6ghlSu3WcrtbhKcmuLC6AL22s9/MtV64s63GbmJ8kUwNAbzMaTD21SbELcLTHDovDsClklf1CPqBV2PvASinCCaewkiEexdTWa31oijVgbETn6RHKoZyDUbB31oRsYHlvYiC/ujnYMlhesija7HN1Jp1WLrpI9VWSuEUX/J5pn+sBmo4E0ScIKRK3DUcZh9nSX/7XawK4b+x4teVru9rJZ7GaRD76Rc93gb+sA5UoZDoUCo10/Z4MdhRdUeVEm66sacFzq3tjYqLDFYLaeXeNAO0kTHfKfgGDqC1Bad3xY1k4xmeiHZb52KdDbxIHlHTnUx8La2aQzShdwpMaAW1YRbgLlUdvy1XPboLp3Wuesx7j922vFefsmfNtZ+5HWPMKJdFxEF14yQC75sGnIvmTehqbKMVSguTZZ4dgC3ExEE8zgFwKzKRtkPuT7xU+GIN+SM7XYJGdkH6q4CqhAmZR7i5B9zeLxJTesGdEO9hJwAFzXbnYowyU4WSKg4EAqr3irM5vc1A3VctzlVw+FuGwB7YLldxXrB9QXPT3alNU8KsHbeiF0uN6oa0RpxlmBvbxyh48dDhLzNK11CKQq1HnAWRznXeDKgykwN7LKSXBMAyeMHH1RFSjfWtO2fdA2bzXjvqwvLlZQ09bNkcSPf2bHJkahZesHfrt3nYuXKyFnWvwQXnPEdaplJt2yPftvbt+9JGWB3zcfP0WoKk8/kOuvcf7AcoNtX3Rlz6wRE4Y5bg9mRYkqif6GIqVfPRs4DDkdHUx8k4Gesh3tGHPNo2PuOHX2eTw3iMDia+DIcg9JUc+QZ+1n10EUgmu7q0nMJ8Ee1eXZ19f9agmC2dPfznHP9f4kmXDBO6e1u6V21b/Ng3xxUECc4VaUKPrrYozzxfvO16UB5s8LVwb+wS5LSptYHD1JFWL06CeFXPVehtbZiZc/fV8GCKidwQeDX6VBqBwn3XmCHmGqSvxsHP7NvMFwBzfV0vbXqk3Ket08RVOQCP+m+dDdTtL7nE8wkBosv+NNaH0iVHgz3skc72mIAEabCwsMfY5tUNnHzsg/W7w6aC2+T56MowrNzkO5+McjicBFEk/2tbBjaBzJpCbqPFHB4IMEbDXYaHexFK/vyaduAW4ueL2pT/AqFhB+msHbI9lwkBkS35cAKeB/8v4omPKwqcYIprCNG18ZuaqK0FMM2hkzo9zD6JEDDCpiCQk3ByZq3cjSYFqAp7WNwgNfXPRNawnSzggZh+VmINDh9bzfJ8/odqZSv+CvfPa7zzPTE/eJXE9I2nW2PIAM/M2aBRNtEB7JnoD269/ygPFUT1VfDIe8gqJDypPV5GEDYQhDts4S7/EGCzcNTAS9EZDT7We+GIjxRC6JeTIRUW3puBosOcLO98GGaLvq/C4tOIif3x/uGxvhaOCvyt3H5VG51RAU6IOgf9XV96GC1xnNtlpbnRqX1o3nqjFpm3S8ShjqlqfDovr+dRDMNaNV9pSndC5qpT6kFOinttiIzZfzSxhshPXVD3aEbp5bU13Ckglnlce04vNtErRwUiFSimI/uUcII55lDt5dgW69RQGG1TMoU0QHfqOklF5czS1Xg6VT/wyBOSffeGu9sJf3+XGtIJ1vmTgBN/LNpI0cucuneai1UBUR68vJxIKfipMZUYfWrblH9Cw0sXdCn7QuMVDoN1l2lOoZkoBq4IZrgKN/yeYEq9fy8femopf/tB+8i4RafbnfdkdeuRBCnnT/+9hY5qNP1kRCkNt4FOQpydHygGqqyZk2DTlomw28PTIUUKFv+e4YhQL6znR6dtfwKzu9FA9moQnTTP4NTzuXgTrgmwlqtdncoNk7utdpyEBC2OMpzErF25ZDBwcK7SjVQFEpOMaNZjOZsAUI27dpi2jhH6gZLfSTHSClotkLeasckVVLRcu1izxU4/u2NS9RYr3gIaPOQY0b7oUkDBvQCpK9jxqdN1h1uW0QMKN4irJn97TpvZTytySZVwrIYC7GXXS/X0u99VX3EUy+Gtk8pWtKyVASQ91B7N7YkyFAn8w9bgkj6bZmQbofmvZELZ5sM9a7TpnTKqOWs1KkKNZWdx0dX7Bg2x2FrZeEF7I/aXUCYgZo8lVbZAvG+aDXv16ocWdk9vbCtvDkMUDD0SNYAC4Pt9Z0RsRmz4gWCBQ4hXKNgoYkDcqy+UTHuqNMPdItt5+udxEqt9ydxjIfbf4maP4Ynyki+nUMhIwVOtA13B/e8pPvZ6Kqc9c5IS9XYltAkJUU1bnQWZz9IEdnyFw4sPnc1f5JkE/hABBJ0w8QwzVMh84o0kEu2DBHvluX5c/yIIsSf+DjckEMC6LH+eC44pU4vkjp3Ta2GfbCHe1w8Krxhzo0f3OmS4f/XQp0j5UBpz6TrwLhpPzvV1yTC0e1IIvQRHN3H3w6eQsnIgSdnMetqwhcbL/lOpuJ9GXN/8yfGSV4JGu+wC2+Bvk6wf7Pogt5YA/cRybIRjiK1GYXfzGfd1pbnexGrYmLZ3QpIrUr7lEN6VsxFk2T9irAsI+e3wZi0KZBWajEqEHVMhW2sSV4xoQVojI3nkQVP1LwGRtK9Pg5gI+kif+DMEgkP+CwdjxwEDju2qLXnwJ4qpXsMe509fguQ2VcF3Dwte/nrsJCY9kLsvI1hjXEXgFuhjQrumGzm0mzwlSTMNpHslcT49Lif6eZ3nytl7v7Lsm11xNove7n4UZOwaLhwsk+vH97RYSEr6itvrVuTIQNVTjBg5CVFDjh2lveg5n4hLUI3i038iFwwDv8MRAok4TD3MSft650sxfggVOslY9W0N0dKyAAMw4uKdihmg5sa2UCL/OpH2nLlLX2eFkGRyZN8oEw+9zCUeQ8YLMnjtUoV0LTS8fG2KirBrn5h1JbilMNh3sSHpGXrrTAtBBbmdkOTwFoc82q0xIfwneyZk4PKTnZALj7eSUKhBnLn2hdcztjmPSTFtIsTJ7w+8Cw1Tu8puu99H92N62PVvSQxYkkhqpTLoqwsDfWSD6zwUp+SkxvbAjFNswitXjto1MpVvKsA3khfF6vYv5loEAQLNxik/sb72RZ9rm6cNDDr8Cz01vWnnv/pRC6eIXj8jsDz0UD9okE+yeldmtxnoa5nfcKmJtVNnkveIf/hsq/1eZESvotblO+3OlQa+goNGTHt9ODpvowf3T18dcEEfAyakMNy/ptXewmzCLQGujLH0m6hWA88GkKJxBwBi4hGilgtVTaJMRweBp6GR2k0IQLr+UYfuBto8VF/ieeSr3/yREXv/y1MFx+y1hkeEx3NlvRG8qTr5Ij9lOc97cLwGd53uhEABilFi1fXORHYWpWIJVLFptIRxxunam9IA2wKDF9McfKSGwUIZ1oKfH89Cs0gjuZmt9LANxn3v+LKgdNwRvkd7BLd64RqKLFYV6eU80bu4eEteSlFz2JXMkxni2RcnF0PKZwVM8dptwmLSoV82u+LMCNrWHGfQqku6xAZYBtDgjY7LYv6efexMotdFkBeWMIYueSzZq4ZtmO8n27xe6BNnfWR46Om+J+W5yGcF4ml44s89orXkBoNLzT5jcxlu00kuMXnp/dT6qU6/d3bX9NA9AeL8DSmufZSI7DY4CHka80ESLlm6tbKQbHZpU6RHuLgOGXkkOUW8pJ6z2RM+ZV5bcB6ZAEX0f9ami8ZX8/m+ZHvGi0qWIVm1lxp6WoDNd7dexMbZYEoP1GpUSA+mZ/3mlspk4yR5DGhkSRXaWI6iMFSMjHmgPzvzBIxd3D1RpNewmctq37avinbhdTKHOzQbwPpkoe2cIvimDRnSeZ89JfmhECbfqzhufzqAIgDkh34OpFheJDbZb7ZXQXgY1yR7mWp0jhCT48e5C1ZA6mvZjtzypN9ZiBaRsJ43FlBprHoDZe1Om0Q98pW0M1oed7oGAYI/N4FMGoIFuIDhP4s9PPLsQ2+Qi44LSDRvktQe0GBYg+qsMQpD3RB/5RbWmUwTsjJVUqH7mL7Bv2SrmulnmGXWkQDwMuFsU2469JQl4pRDUm9hT6IBmwhfrltSSnDOxLypSW5VNcPwy8dU8AzauonCeU+IVIUN5oNpQPmugW95RB8QxxBj4uHPQsjzGMG0/dMBIJvQlximDsuvoZFdzPoHXZpn1fkgCV3Mi/xugMLTmOACTewWM+KjQUlb1Ok2vV0nJuIp6hn5Rg17IO5ZMDuNJAI4LJgZ9ttYeCNc1UMe8jGra6cbEhVCqq35m5+6W7IaIzagChjS7z+I24LSgd5/+FkF2mCKbTj1ZLhu/Vlga+GgaP7dDn831LCyIqyhJ7/HZgArnaIjGpOtL6WKlX/fiY4/Z7NWz5RzXteAX65G1dO0H6v0Oz0XMKx+aTLJHQffz7PR7b5xdiSUclig9+gxKZr8PiMi3PNzeI0+hPeDOwz6qeIBr9wwv3TKA27xmuDkEF6+z4YVsnKRoneT46QeT+9QJcetPyfN062/mxv7PjMBnL7VnLqGHB30bUFl0rIargXOboB7t7P0yT7s6VBBcVq5B+6IGCx4IAJnOSiZVhXRm311x9Bcb+6qYo7ChFjMTaaLlJv63xuvhoHu5bSL2UCntf6hDFvte8ONoIpiENOQz1tTSLh3OSSLOGSU+cTbnA8kwLRC7lZfPuWWmf/EhUo3Nk9ez2VJLa8/RoSE0wsosx0hQ2kdYqUYgpg42jebe9SwEUGioLgUR1C7UhwliUFi5JQs4doAgzvbDM1Dzg8kJ/UTB3iD6E2AQxXQb2gqbGs70Kfxnob5WUIihi50kHnfUMR9MuXAwEOxVGXmhG56eBnbBixcLlby+VHqpV7jPZIRvTvpa+wbs+/O1TP+1Wg4lvpqlE6Li20F7axmcMCDQxd5uoSwfPr8e0Q50RNWk+m1LmVO24T5FksgzLW+DXfQEUqBACqUqgQM/eJ9bbwS5HTY7FemF6K89ql1BT8z5XWGNAGfWB03PEmEIMmqUBk3kL+EKBBFpQ1V0sTBzbJhEDOnS14TmFuSwrEuuNEsYYoI+l4+aQVWl0KFeSU9t1DNCV8Z01qBPSILBsEHYzIWYw4D6DDkSbfRWSi749tncf9t3VmdIYZszzp/CuXKU9MI67g+87VF1GpCe/Ksrmj1C0vrz/bv8JHL/1Or1ElLYRDtEC+RU2k+tO8Lv62LjyPFQRdlh+TbCqF0MfPzy/Bmi0ImT9X/hdlTbXzbqf/PeN1OaVreBG98pcX3PvF4f5wXs9nV8hbrESyDhRo6MhtDa5sIT1ZRh0LQduPImyOuQs/ZXDiK1NBzrPIXQ7/qfLrCnSA4iWE1YIgOTdfo0bR9vNgtCYTw/FwZPdKN4loPlUkj2YvxJCfZQlzT9TkzrEntiTRFBF3/FdEti6QMLC7npk/v6698Bu5Id2KIyr/Yv+NI0Lapyfsyf2cm9SwUpHcIgMhavvvdT+oBOnnHcDQbwnF07NsUnvcIjb12hvssiDpvVIqc9mbhDv6aQXR5nG8+mxbR7+xQLoTgIgXzEWyyNpsBSjmSAn/ymGIKNlDUymkjMG9ESOaCOPnCel6oiwQ/nfuohV1/brKjSR6d97VNYSZrR9dzOFmsXgvUSBTmOHpPQ7sXf9z7Luic2Fbb8rTIqAmV/Zo70BxJymhAJMFU+2lcKTfh5dRZ6uVwW7v+F8c1Asc/AEXk+4+2JW+ogc6w7cvEZoPv8+vC8ZGSUjgyFFoFgLpp3jzd6Y0o3HW/1DePrYJsBibO4jzQduqUR+mr7+ZfuPN/b4P4ugQ1XoTTZNuZjK3QZBkCNohvkXvL0HLz1eLqe+yZd3JNus/gc5polmgUkRGRgx4otO9H0ZJPH58pGsF/sKhaPqxVuK2wCliIvLGNtQ7/YY6paAJRBXXuiTi+FmQLfG7uIyQE0DZxNhZuSuu6O86JKjrn0CzWsa50KZn3dJ+e4LjYXRpkuTRVoTXweyrDUCWeAehE7e6m+N37xt2dWWdkuyD2ibrOhvnK6PaNjwXFyYPnoi9fe/20GN60Bln3HNKMexIz4D01ZVTE5qVlobhvQnbFyBNkP8AdsN73W6+Su+1SsU/3JxtXe1HJSRifWwU6jLBbKyb4a7XgjQUIFgLrfWweE1XlRegMaXBdxrl3J8OC5PHiAEf5/4hTstH3FKsKiqLLV86dq62bnHYaseT4n02GbaDwYslqbW0+f8VnrTRDuCD/v8VJCKRzx1UOMLD4DMa4ibH0hREhISb6wxHs0xZrjMdIJITK6RbJRt35o7lEUPrl+kAH2dL6dplYOqgzzLiqovP+3Aokvl2ziLOyMU6bMshYpYZOk+NRnNp4UT7EyNl9OhUqwdBfmkfSGI965xKruhwmlEYdrrDgGu1BdsU8wJAn6tanYLSrT36YRtV6XLH2KEzepo1XAjcG1jAkAzO/LTlXZAT+93SHohGdi/1vmEl6RnJ10eEduofXeihsbT27GnCKQZfJKuP7M6WzIBMvoAgD8EUsM+80WzZgkH6cEju+7az4oTMyeVIp0LHQbpm9bHb1MsB/r1qs+HQeVn+NhbLHnU15lvBhhfCD7kx3WQKdvUHLHnoMk8HLqHv3m21h4UvjR4LCpQ9eTSFDJWvjnDBgTgRYR2l5sfjyQPeWtmD9MKWYGshYadZo59ttiC0125B0aIWG1Pqc0najnkO6X8of+emJZd3+UW0bP3yc6TiXjD5FYbb4AHbrQIC0nOFEY2V7XlNAKhV/ny49TKdu7La9mEiW/WWgCmp1rTeDitMlkpi3AskJC8PvjEFvPbE2MfHlvAMvpMffrt+H7CzOhMA5tEPZdg4vHyS2GWXtZ5u1jxiphZDjHBPucjubkiifrqR4bkZRkXgGeFajP4VjkJ6HKTkR5UTCEjI+Rpzxap/v+gJQ613JyQaRTJ/zbEfoR8FkOC37kBkBQQSzT/VSMAQM93He9FGkcwL+oXAszQes0H4IBWgA6kG13sJjhxEIJtXOClMhq97sCyLAPK+qeF6Per7pdvU+D7MkvkGjdr2uxdLabe6NSfugmZ0yksoTU7PbFVG83OAGzLmkcUbti38Js/NjHmGi3aGBscWZ4eehaDnC/LtjNAp3Q4CHjvYfG335NgykaWgb31wJUhWroHZ3vznSmfJzdqZqODJtozIwrcxHePT+ElO6cMEKuL6et8BSmmzLuCuYRrTGXNBRQNvF1HF5hPtd56IqmxWY9y0ZxQkp+Fv9dEEJJcyv/yrqyAO+2K9crUtfj0iRwvNSztzDO4OFvx0zptQhPm1ybCM9F95u89odrxHQnBw5Po7LK0tY7bSwJAn8nyBtXkg5mLqDNPNoj4jQnNT5heqfMh2SNB6k1NNaoiiiN/PMxYdmOXfE/W+y9BiMx+WCKD9JFtctgOnri/rIoRjX57/zSs/sA60DG4Qamkv9EHCGkKj3xqpfS27UkXt9o6NIg72me8sL6kE7DThcmQBnjtI5eZBqRM3KKtE7FH99o7M2e16lfmvl6XwyS2dybSeSx83/LVU0t9mR4WC9+or2cYH3y7OF4XY78BxwfrZ6FQIGLbkw4HFWG90SIGIL+H1rMx/E4JKpwWC5zpWTYkWsvEhIlsOFbkvD09SGC2uDiAX25yRcRTtrVKpZYuKxm88+yTP98oB9n2LspDec2Jlqs+KABju0DcFPOXrS+/dw+w1ewdpC+jmbitWWJvglW0PCt6YRoasvfPLm1lwR6O2hHf9BSQn7tZgHw3jHOUTj+72QC1A0SwYu94NbWDcg9eI4g2jtvboyA/+wYMOKhoQMn52wO2qEFYGwJhXHfE2PIIvHaEkV0lw2Mc0vimKNRDmbdynJ+WE0NL43pQ17i48IQAl8Kga/knaR+LgUZeQGrRq2S4d/tGnHO2VBgVVC82C3yTtg9gR9xiZ6zGVwKkQoCYgYQtEGZaP5Io3bwpvdj89d5CD6vmm7TiZrnMpOAn8wromqaKiw9Z20wSLryhYs/zeGFwsIwXs+SOdYviBsQQMi6vD8ecz7Y383o4aaFkv9dABvXusmsm9yawwbatOr+CzfpQKRoej+vUJEAI8pZFhcjTj3DReVJrEqQ2bjUZZPcX5qLVaLv3d2LrWnThW5xavoPoFc7TFrtiaQD1vXoZoFzKTpmh8GOT6zOKtyKte+HdT5/GM+9grs55hdwuc0ubzagvXNc19d1l3F784JNabXD3ggYSCgoFyEUr+gR0bi8jidJTW8cXQkM27vMtmEHhsSpEzLX6vQcFcgrcBMWKi+fKlEehJkbQ68nYOdHGN/l1jMkEWFi1uh3jG0EwhE/hAt0rVddmVk4eZk6nUh2J+oGd80rvwVTsYknjFyQyHmOFxl9+ln8e5Zrfe4ACuHJOIG+u93Nbhsf/w+6vjIpNxybyRgRx7OYPfB5seVxpfcrXxVB31mLuOJ2WxEBhL7+yVYD9zcNVlIK+F4Qdc0t7Wr4lijWN+cMWXOC3hdNR8jpcQKgtQKehbe7RSGhVXzZqRJtlJaeic28kiIKRd3tYxTpBI8t+/rpRBvjF1FVo5xFnJAHL6JxMnllNpSnIAhy/h9fu4SCiWXVtvIaIZ7ZBlB4zTfKkbVyY65p/O39sCxKFeV2pWn2IMLfq3j7H8W2bxN/WdUE0PIz0QBTO0BUeh9uIL3WRBeuUlefTiCMPJH52UTRN1i9MFIjmbon09hfKzx0VMO38L7zx0PdxvyI6k7b9QyNUW1JTFIm/Ztv3WCn5YQgUjPQgHrh7RNrvtgZ7BuiAMFzOafu2e+usfCsSTvAOPIrxDSjOZSNZ+Ywd6CVnFGuTdE2XoGYuDIxfQZuZMVnHHvXeJxKSA0MpQj2JiwnLdPOVzGxBzleGbMBE2ls8mc0EP9srR7P9gcBz8/guUxanMyjVjy16frlVz1LMZO1ffFm9ZvCUvYVaQGXsOJPJ/5wXfPufReteIj2+U5W0S7lEkYDXsmHOZIVf2txACZ1IK3ewkZ7uJQ1HJSMUv/rlgukv9K7M2XBH6LSAf8WV4ndFRxFvblssDc/FsT44wO7c3Tpx4RRD4S6i0LJV9oeptNlfiyF9AbrV1fUNGExCffSlUx74wyI0yf1s/PMXmsynsu+NTg8OmvFkUA7PUvshusIJ/Tpgk+85VBhnRFM+CZZOmF+Pl3uHBUDaCgwb5sW5mr3W6lufuwknO43s4PKj5MNQIweveZ79Yy0/04az4NC8zVLjSWJbZKzLMkaITP1IL2U483+YY5bwWIwbKftU3SHmV/wUYOvBUacOBYo6qBCSPPnG89rjJdsSsXBogebbbtVGIZZikojMZhNp2i+lSGSuxrPImHWImMRFvg/PN3BFbTw9mDigPo5//2sOUSYwwGHjpv+4pXQpa4jH0E2DVV7MWR2edHE9qS466J0ufP0nI+LbPFEoHJu9wRGUx7LLJVkzCt7LtClzqvqKqdyb+GBRm8yTLqZ0CPsDsM++fBCtV9QHg+SRek9joI/OM9eePnFPobeyHeHdCu+CdU9/hI73T/aG9WwUTpNM3JUrRfN2//BufI/vo494jNj7LMdfkHF7n2eAOT1ZFT8JqU5VMPX/MAYmHUEx1k7Y79hZ3YTVZDKtxxUnD0M5ee8EqsxXN/cX92PeJR1/TRc4vgaleiDSARShKiIzIJBfJd09PTOALnaEp+S8/5S/U2GWkzFCiV1h882skqw2ScJN7HO/OtV5KlgDV+WCrsx1YPoUEF7O/pSxoINSAmlMJQiSshpbjtdZ4YaNAQpXrEzn2UR3Ya4KWekkU7yuyPBLIJzFHV5tSqPSBug9rhATCZB3H697pQj09cWVe82gcqP9tDm6z+UViU6VSo3/kHIQYgWqbXLrGQVlnqjci+iCpBI8NJSdsiiTsj/tm/GK0jNtp4C/TMzkQTHfEiz4z825vcJxW7FXVhXzXDKXdOM7FGA4+gSDso6vc1L169BoUXtqrhkXXZSl44AmiPd5TKZNSVbBvNY4ZsXJns9osRRXf0Fy0icSFDGK0M1U3Wq6+iDnce1HI0J1a0BLbfxrl5Ld7kGykHHmKruzPMs8UZW6wdgKIKLtvyOtu5Eq2dFX3fG2sFeotsHoJYWzLzdur8PYx3nMwt0NwO4UxikpSK85y+VGZ0jJPIwy73n+8HcawvhyIBULMdJY7HV1tU+c87V17zGOWqfEJ8xYt17qUdOYSBHYn6CDwkPCCcaRy1dB75QUGETkwJqDswv2HlHQy64ZrfGshAgfuB1p4kCvftMey4ssFdNQKepeTu5CGxZgftmj3vwlqEF2vItDyQwVLRPE8lK/7uuWG1SmkKuj5fOQTxgsCc4pSLtnctBLDWd4K4eH6fdrMM8FgalrEL0Jnj6CUP0hBaoAW2Sbea8Qljo/W1mx5ZEP9o+JISrMJRRA4QmSmuCBDNSmZ7F3ASWcbG/XiumpLuHAR3IbRx+KQp5g8ZHNEExOjsbt1mfE+lfoBHekRiaqwEhBSJUSicwgRAuthnywpTiNIiac07jdF45GEdMWUCwNwF1GEnAbwC/p6M4zhNu7kM7PHiF8ZULUlEv+UwBgPUXV7q6+2Aq/7bhchJcjDbhDjBKM+CVvdrZwgM6F6DRRx4xpoQg/BMW+o8rSK6bBjHBPo6JcfO0+HAxw7P7Lc53djBfh0ccAV+uHqUgVl0yuAiBW3P7f9D5h8i2t3D08bE6nzFJED3Uga418dETaQaE2N8chON78sZ8kTECfVQYeLlCdP4Hde/WPiiYFTwxRxVHjN3u8DPawwKQaD6utCF88l2+cu2vcXUBd9Ov/OsDvw6q1mUDgIYQBJm8vuBbWNgIcYiyB/yDYLYhVPqnwLECcXm2NrOXlBKhaV3bwde7T/t0a0vbIIipqsrrKaLcEZ1w9vVpbNggLPpYuQdY2Lq1EwiMJV55SWogNIt9B1ykGSuoKziYB2LXKz3HHYy8FZ7NyAWU9FcS1l1seyysNj9anfPsXUWo2NO9XRNO7My1ZR5RIUksiN5EX7w9t3agS1ZZBy6gn5e5eW6qqs4+FhDBkKPnXEc9ykorkvQVh2jnXVA93arKOKaTx5P7nDDzIHiwo7TKDkLZ6ss8T/SSygbHEmWBxZ9IdBIAdBGWWWGxX9MwGU5OOlwbJvkadu2OsgjCyooRXM9/YNF0yUEF50lE289S9HklWUnYa10LIQbLeCN7ByG/P51Wg0LiLuWePvFZC+p+EZwZBmx1JG2HXa1J0snI0lEXB1Eqo+0fJy9C8ALmYHQ2GxN2Ax3X0HkW6N5X+K9Ql22arN/6bSKZFhpSt31+tcan8MmmEUqCBRHjkOXLVxJqW4grwKj4rYHbcAms9uhnRXCq73TeUsld96JZu7I2ep6dRu1s8JlycRzyq1UWbp7CGhn9mAsLxb0Ze8OG2ECZs6Zow47LQW+/Qm9CEwhnecXhLgVW4S54/YNcSC0cxv+V1dARGUPo2oe7EiQmfuwvIvzkSRNlwWt87zMm2SULFy0BdwP/LQpABbOhkRzvlplDwWy/7rnIDirRGUm7dcGQdQ2ABAgj56KStPHx1kfqmkK5n2ddQk+BYCrzouAbt2cSMfCCBQBrYgDH9vg1HMoe5VC25CRXo5WiwVcjw2oZA0l8rtLGH45R1XdpV43UI54WoRBnnoXSEVez0HJKOBK9z6nvzEU2hogjrzitlqL7yhZRF9DXZ/Kq7Zb+ci4t+4H9NXkEgGDR9COsEtDZNkcOL3j/A4zQF0Jlqz8qkXtLJqmY7WUACdbSGJC1fJQg8ffhAgsovw9nXqCh3RZo9tMsxq2xcLmLGMyFkaTd7CHs/Tpa6Al+g5Wdy8s1H6WAu5WyF60dMvqQuf/pmESsq0Fq9IbsQEJQsoYDBa346rTNA6CT+nXlS3umih9rRvw0Bdsqnxkz1x+xl+3O6RBYn5cpYfMydmvYJDXhWTvqgoB7gTP7atIEDguUs/RKtgdF5yvAAJhznE9btheXassF00Sn2oh2mRelbXA+0mEXejV2Kw5g8q1BaSWXZ6ltPgEXdUOYawkdhsc/zhhPWAstr4NJpLFmxTjsKh/Y7OO8Ghk9usTYbdBPOrXq9ArGJEzHoiW3v964q01RlksyH3AmleSFpOldG6SlIGg172sRmSZWJGQWhTDbLr3nwrUFr123TbqsmDhcxV+dzpNSkIqmMnfp35JZMPtuiURb5wBMX6zxrrlECHsg1St4+Vc+Xh/6rOs0x4EttsLC4tKJqJ0DXcX2Bic0ki07jjqks4DZhZnrLBUWpngLtm9iwkWPqeHqAoNOnQ6l5INkOjfYYVWij949CxKk6etjtIRol+jKN3epPNMtaAOLGlyc9p2fWq1EKSFNAKx10mmjlvqhi2u0I25CGA+IrOQhMF6D4Vsxu9OQ4fhhckrnQMaFBW6tmIHrRX2QT6YsmP/oMs8GmDViEr5RR8HR1pXA9yJTeBpn3wiFQXTshvyVEqc4pDnFkdnkE6F8ujtrEeJ1/j23rEix7UkUHSz8t3F3KA/+Usj4TPVWAXeT5h2nlj7bi65JN1hoZpfwoOyeyzOS0cQ1NcPk3bCvjGUjcixRo8EYQyugWHeuWftWKVInx/mLXlpD1GRVu7sR/PjvD0PHmdoVyKX3xpQEyj+7lvO3fmi9d6xcgIXr22vRwy31wjzoDsGFo+meFohwTCJvhJEqUauPy4y99UNABeS13Qy8+SrZGCDqROyapv7jq8n4BGimQcRR0ZYVfjTxfTpsjbyR/j7PH4pzt13ZYOdduQ/snL+4gczt4NYZkMZzkv+PxBLLLKPN4RHyVud9d/E/JIpze3qz1Lx4L4dLQ+dqI48GMsvWtwBcb3HAFcvA8tPVHhEBlvEornAr8OATRlAYcssNqIKs4u/g6L5bz1evk9A0LVddtzcGiJkAaCzibDUwjxXuwT6CRlCJR8fNSzK6FQD+fUtIEysmvGZijr3Amr+94Bl3fGfuvkKGWVft2H0g3TczjO1Wt+RnlIZanVVbBH9AsLqc+2Qls5C1XjdElaCkQVlnuAaYbcpKdoAUGYGmXEiDICsZ6WxCNulKO+b6XIgfGtPSxODmmijKruZIWsfPcVKpDAVVGcwt02HxC2Eq3r44iVbR1jv4jpOr7QaNMHPwhL10z5PSw43VJXk3m/WXTlxBoaDgy7t+YOun3qclCznLfEFib9mJEfmllpM3U4oO0tQ9MbS/X8CzjzbJ9v4GPgxir9h0dxPv1xGRS7EqEGG5p8+0zhuZqVNlnf4WwX4ZUwvH1YCCbV7+1E0M2SjJYvvqAkDZ63mKXBs6dMh7n0WQu/OAS5XGgMe23eD8OmhPxqxvzADHJUBeFCnqNQbJf69WvCCk9I7Ub5fI4+lJP8a8J/VUMwuObAOwThSrtVAE237wf7dn0ceqsJ8dwE1p9AeXthZ1Vra/LDD+/5lL54lDXetzJGo70YjZl5AuDVci1s87uMLvQWlq3k+toYYcMQfJ3bZDVQtE1ikWxC0DU8aED49O2IKpxWC7eKzxojqO/NBRe+bN/ERMPodraEqUmwfuOm11r7DFtMzrMe657xjR/FjoxO7NvcydwyKWTQNhT/JhZTgNIrhmCZkm7IiDt8Kde394KaSObFYLOLhjANpjkF9UmMkaHh0wGij9alcru5cqP59Gf1ynIvgmxp9eOpyy7KTHBjzN+Bty/erL7Vp4xFLMg92NIYeBpDa5DxrqkcspWXVHJmlBxDqnkcvYNiEoU0F66B+GZ8XrRxZHTfIaiSI3vFoeiwy2lBUXyhduWfMO8pljYUxpPmOuTsQ+VGrhJXwiy5IZ7ZHv1j+W6tfHlTBIRQhHb74dmEw9m1TlvoFF2pu+Ayrq6Q0aLYf4b3x2ITD0pJiRMnqsJ9XA2ltgD81fVevVpJHATpzxmVeAE9v8pcGDucO9r2Nz0AC7iEQxUjKdIxHuHj852pW6uNWsNjbSU8/nKhTWE36+EFDUJTnD24ViDenircy3PeX62u8NKQqy6C7oUzymgl2SpmlVbZ2Z+KdpoPPt2wBZokklVKEMXqvmdNsDjyvIGP7T0mbSZtIfxCixm635NMUwPcj34nLq0au91NwalYjbpj1rcXxTAbEVnTUhHxUyJP7Peg5xkcvAB3Kq8j6eA/C9hSl7Iy4yGRw4S3MoLF+XGPOEnHkZ6n95Mjq/b/jEeh3og7OJeMTpsyjxN3gL7Ojt6LcxSA57FMhKRQt8S/dvuu/qaQeMUVD+rCYp+fwJKQWir0FID7PCXpq1XWQWKoG4iZJRdir6RauDOPpCprPXpCGf+OPGLNz/9rueQ2dSxLlPtZ6m8l6Rt84bmhlWkM05YGA64ABmznWdqRrxMatavLLUwgoNl89bao3mMB6z7jon+HhPVo6linDEXtG2OlvHOG3geAATE7LL0iYLodiZGcmaIPu0IpSHxBLT1AKLWyTdUlTTFUJj3f0G0wHlkegsszBuhIdj0rGwAlRMUJtQeAFlbD0IcVRBO2Wqe80cUbBWfVV2A4Oi2SrczIHyMvVI0eguwiiWtw0mFd2D94P7leFd5D2mZZuGHnZBVGgIF2LEt5AIco3xGao5j/E+cU8OJTnXe/pJLAEfNp/ySW9dRyYlQjMGztuQEG6RHEUzsBQq6D3kM4DDz+cChGY7ktxpVM1R/Bg+YpuYIRKetLShduIswbVz80dnPV5x9fSpoPttf8pWmmHDfNSsc4GGY5fAYxH8F0GM4gSucRvGsGeDMt3cgYp/5goCCO75ZJSJPJKw6F67De0+wEHgMqJl/HrTi6Rayqwdk2T1q0YQW5JvAM0kwm6ewoXfUhAJ6GFr14wttoSXh0UcV7r3u8cLvHDrW7pZyZXLb21h1hPJU7so38dX0gAIbLMQjyD8AnEjkXCozwA3hy64pykfntKJcy8UCQT9iOrgc0AScGrC6jiM37/mc18seoKeGiVfyTJZmhB303pWLCls85TaL5ZpV8utZ5/qWS2fj1vuKg3heOfZ3D8z6j3nb52tde3781/gmTWFaupLNQakfiYXrQpi0embcGe22082eXmIwUAnNx2K65CvQWDB+7xRCX3qjrLEdluf10P6zcrHYSKN339FZ6QPCJteKtbKJd59Hc3/U6fh2OmkS5J7TPkZKh1S1UPddYMj7WzcJAGppkLTW3YA1zes6bVoLiphOOF1oAxQ5rURLCAQjYxz3UDBAOVe+7KwB6ATBQY15wUfuvrW09lPGVSkQdEoKydB68aPtnyDPD3fpwDqKoXGwXxtleo3HqXrg2ljlHjLMXgbaDvopoSo1Xq3txmWnfbVn6YG//VN8HazBbFpDOPYoTqYTinpwMwFY8K5qla+z4Ga89a7y2+oNuPBI9O7B/cgAXp4i7BlsImJ5i0zvnX/d6qNB15BhmpPGQ7DLqPq0WwJYAO+l5wGb/VCpZxu/MW7VHbBgz3XnZ1++qr/9Csln0yESi3bO5EYEOpF/tZMbupcG+eiA78q8QzkGRg7lZEC5ThzUXebdURREp+G4KFNGcc44rkKchilpxyV4ByOjIGtSU7ZkWEwXd/VInS6GGMC4D945ihGRXslVR2Yhmdw5yCmsCTRwmMRIcOW1aIICvQru2alPaU096D2U+yX0u+0m/KaT4WQ9CQgSEv8fxVQKtgFiSsi9h+3L12406ktCJladNTgjcph+AmbWgQnGvhm8ZQcNFwivUOYdZJPKReUplEn1+XtTG3KJLNsaFBqb3wNDiB+kjiVHQYIR7yZ3BjNVnGoff7cH7vKNr7tNpPa0wNYwxkbUz2sPu60kxoguNBmBsfUhRVZiBDAIBzSm0qPBCRNslD0BGYSkW/BXVR3f7eHxwi3fWiMuHeJMbf+0k/YpST4u03axsLfxOYbclA00mjpCg5XHkykqDs9UpeMf3lyctGnSq8CW6flR16xZzdQ0NzYeXq/cq0cl8mK/4LLhh/Dc7k66hirO2oaGsCWdH2I/LRi/0FVjFhsND/GmsdcDRNVt99QcwEwiAh81b60JQ5U1zmstO9uk4A0U+EM035bthpnkTkVb2VozxJzKXKpWWcKQw27j84+OR1ffeisID6TKKduv+nDnb8kK0AX/2VbtLyO7wXqGv/IqWYwPuOLqYbu0SosOCBbgDH78K43t1fuapVJOBrsig9Eh4XM2OkTrGCV4MnzzMKjR7iSh9RguJNMyNWjFTxofTUupkz8Gs+Jo7+c7IOW5Gg1v9x6EVSChsWiGEo48yxT/08UDyMIR0U7kZSrCzSiDi7BDfZfG8bV6BBOaBrv5YUOi+eR5fm+XMGGUxNfZAlWKJIDEWEFefzkaPaIuWXOTiajweHozc2hkKKDOBBkJOqc2j3DQPAMrvV1iebFU/Q/Ciz1+DUS4HtndNKBrqVP1cySRwfkfXCs7asKL4DJcVczA84rJvUe6BoV2KS/WRuHI31FMIjRmBJ/L+xrl15y5gblpazIH5zXCUhTbMTuBEeCpYd734Ss9yMbHDsYyJDgf9abd6VaG5H8dvofRURrUIbk9qYNWo7vB6oe4mPBT6Km9VxpSAc922aReV3erIgMyO7q6WZ6ZgE00LCkJGUSmKzifREazcd0OfwkFu+aUXkLOsW1n0b/EeL1dmCiw56ytiszOndTkkV7luVpp0MYJHhHxP64pnM/5eBoUzNiBGXG6cc1ghCaw/7qbfRBeCOFpL4tPfY/L4SQiPOZ4I85tEwJfstpwnb90C3OCtUN2DU4+JMpcd2gWIawhhY+t7kTSh0oUCOGlizGExndlzcDH6UEpFOsd7+uHjpv6qXY6/z/kPJAe6uUjqwkg/DY+mJCpdq4xz/o+GPhMAFfO95Fh+YNB6/px7Tm07lVpuPsE/vBGmCALvxnKhHcK2BxqxPMBQElevRYRGderCkoiCUKAy+h1hejwfhBC22IVx57wr+vjNhBYlLyizbMm5VwR0Nz3uz1d+KQ+topIECfmurtZC7ExU9Pyb3OyFeA3LCDkqYJ81UUFuiJH+UfECtUal6bE5e6/VY/QiyDvfdmMrJ0m7aOvJk4CSLStdjnxGn/SedejwX5SosLpi+/7aG5nQYSLE8ZNMhkCcjkypCUQFAX3rmrkZJG7iC6yM+QbYXNfqoE2dyOrA26hRO3tKaYG3MU6/1IxW5tMfOdY7g/eCOPEzuIkbEK689NeSIIVA6/t18dkzItcMyLWKldT7KZILY/Qy2ieWdJznQHklUmnI4S7VaNeg1GLmi8B4DZXBsDc7DfYDtO+JRbFqqqFfK6CmVPzj8TSGtVYmCAutS5OsEzFIL6SHksZNAOc75aMBm08AN6IRvGaxgaa7bX3dRmzCHkkAmM86eMqGo4kik74IpoWPhOPWw/qmrPNJPgrpbqf2poJRydKYsqN9vY358xAF8XyUKoZMdmBm32QZuxC+6cJVayS/zBQffFLd0x0fPKRYlN+4t6ktNdMIV47FWg345XFBOP1nTXGSLNNlUsGRnyCGA9+dP2c8tmsm5RspYkjQiyRUAEfhazT5iJ97uJ9g2Xyom8MVujFMYjpjevyfPob78vFN9wuicqfjauvZbLh8ge5DWmgh1hSMg4LzspGaiFXlWjTs2EQ/zZSSJbM91Mj4r+guUM+IfrQZHyFaxgv6jypbXnpyzOBjZlsC3slOZNLTBpblDRDAsyewcaiRn5GmzrrNCQRsWUCw9FpAdSazrxhFAjYa3YH6mguUqXcMf18sRRVtEgqTIpi9NfiJJf5VX1hu8D/cWRZMEdNPTG87GdCmjknUbcSmoq8MZA+rtuNmgLBKDOLAFZXfB/nKQHlREGI8H9UybkmN2Jx100O9fxIAvZkd2Zcd2ewoo+7IsfVuvmXYbTqcuvom4U//ADHF6Rz7rhZFZx13aOtFTvAeutGGQj3TkKJP4G1wfHjHasafvmEOcR1hbB1VObfnJYtoZS/9jIGjdbYXWuJZ7TNWox2pSLwylnXQea/84du3tNOoXTq1XCuIFifRyRoAx+Xfje4eAG4/beTe1iReQQmmmPMfyJKu7iJ4VEv7+izoUqoFmnkNu/GnlCqjAolBuFh3Eppj6g6H1aRJeFdGuhZbUsF2XYmvChot68h+Q9QjzAhAfznrEmHcilQESvGjsUdlei+sjgzsUcV5a3K2xLWg5rR/NPEzUr8anVaQEGPtYL60etaXdXXztN7H2Lgbz1/10H4x6Io8CZWyTiwacsZRg7a61QtI2DYdP8HLENYBWTRMOWCvohl4IpJR1W0TYjGDGqLVISBut5ZeA8rZun8UwOHPNOr2+uF7CIdTdDXLez2eLPJcKWoZs0D5CAR5PMxKZnugy/EjHecWdwrODFbfzNMQ/2uB51hqdGsNiTKUksfOi5A9I2uy7yxg34nEFK5DUjs8tC8BbuGzTT05ysXzHjiIid4joBVK3sLD9g3H8UT0/v169wr6xCCbd53SmOBe44mRLlbH0xuFwdfctIlNGwGsP+XI4ET5xbwYCKNvYCDuPfqrpjJsMKtsUx4Vvlk3nJOFKKvHb5SpxU6Rfu4d09CvJx/pDsjoTGpKCBQW6uMvkDy3i0Rb2GYW80G8kD9IfhUVLow9kDUWpqYId/YR96ioE5rPhF6T7nzYBv1Ih7l6ZOK/84XOIMBEm4YDAaRM0jirv/0EYTBHkeyXJ83SCdadIDziWtbzyaoLTeKSqWV8tNEFNPn0r9mnEVBSq2eC00EHrgghyhVQi0tiplWwJainMkYkMsySgyl8ncHQMWDDpclpZzEPoHDr3O/Qm3dKqUWWSSQfS2GCw7e5dHmKTRiz/SZeK3tpUiw6Op1DYWM5oyyK9CNFDYrrI0sRsmomqc8voFseoqDcRij1E7WpkwMfTp5vrY8iqECu0qW8pc9/376d/OpsnXj/wh/hw4hkWbQi0UTM/bUvJbPTJnG6dbq/iGQHbKc41LuGUejJ7UKbgDFPiPGSfwYXpPwrnzvGnYYchlsB6Ov9B+JrCINw87YHNgeHV1J09fPJO9cH+dwR9t0FjV/jo2j+henwoH6PLJyPQaNtjWQ4lHNAmWYOyKVh52BLYNAO7GGiGabAqd0V7GeNecl9aLKyHdKC/V85oyrsj+pc4xacN+6v8QvW7qgLoqsWjnUo9yDV2ErAgfpHpnpcKDZW2u1ejveBQonKsQvGidEAkb0+4LiOVzhN8FTmWJyYeDWkUpoQg13/EtFdff+JE1YApz5HuzO+jJHhKI1e8HDWSt9BTWaHERj8fC7/fheMvA2pBx+qIwfCSQaY/Yi5cPHgy5NO61bH/ZMNBwPRiKIu9kqv2CPhFbQNwG7OD7E41AxNg5DIIrhCQT7oz/mcoJ/FznOarUOnIethvOdmm2vz9YR95hVCo8HU2r+pnrWqmvGn+OqStKIMpt3NbtZqpRtvvSf6OEDOieTPIVgIJWY5pyoWtIogbjS1eu+wscK/ijn8SxH0YNxs0YmrRiKMYjYrVF+CGS30u2KIFpDcEQ8zlEiweWkLfldQEzZXyMNTsz37kV4LxxqHOZQqmTEu5xPNN3Bj70aiS0Sn+PM6cbgBG/N9Y/6NCFD/Vt0g+LldALOy9WKLga4wNA+q38knPzBjdv6yHFp/kOvwOvg4zhNyv/OkeYXa8RXdHUoSGMXjNSAhH7/9/1a7kvZHwdaAuZZpf0zY/j/ExJsbLQe2S16oMTaRo6lem6ZBdraU72y2GtNVJoPvwx+KPPbAkDvsYJKo4T45LP2GkUFefSa5uUZ06fdkSFb3kLaxQ8l5Z7IxuuqEGG03tW4gEKqSFrD7PpRTijVKVareGPPA6bzfmfLGInNdJaeIZoyKXSuowiVis8Lc8VpvYARc87RXRPJBIsGpqde0CuEiM8U7AhokVOQbQwMOzP27lBRTG83Pyj9zFY9qp18MOYFB8cjkkBeQpmCLavyCaT7uG+IYrZYes8IW74hr1TT3W8rQ0V4zgWMH8qJ02/7sMXAeIgcCyqOIa+tFVH4U9+Fqwk7n9Y10SjDlawXH+46YWJz0LtqpSOMi7e2kiNcG/ephm3htoDdNMIrqut5GDx8hdPrw614k3Xg4Hvq867H0VwIv6mwau9rhy849VlAb0yodtf/jEjpnVnzOkOsfjcmP/XItyrf3NKDXn/HDmIjnxuerhs6qDmJHb0eID0QqqH56VS7+BThwzkZo8lXO0MSB6wRYiwX+aPJOYErSRUyT2GGnifzEOatT0/1d5bvsbFhWPhWKbXiaG96VyzzS/Ta7WCuASl0sR0Ny4uvwH4JcmG9UGhrRc2b1G1iQjioQp3kfSFOnoexxcXnpjT4l27ssFN12qib5wGaWkqzcUwcuU6UYNRKEWPEssTDHrAxCviO9xTmXJvSd2s+Scx4HIv0w74KZJhx4gL3rvlbwAxCnuuCwH0egUxMEPcyUqy1xPJC8qHQrDd+2X9ZGBC3PTbxfrCnxS1F3PNCTi+5MukDs1xiEu3SQwd1i6FhZZc0T3YjKDkvvJMcFtTOexJIMTy1sO9TEC6UuphcSf3TVyyX3ixAg0yi7yGtVObDmi46SeGYAy79hkFgyeFlpO4rv1I4IWftGNDvpcXvpeD2e4ZobEU6MMHVlEUYME5yBo94f7LxIJ4ChxoxCyEB77J9Oh2BsiU3bdKRb9IKwjdxug/UVZWsOczkGgUIu06jS0jnYfyWTTY2NSJxcVZg6IiDcfOq/OarVT1v/URpvTkQ5X3MUSLdS3lMIyHpyNfMknnvsz4ZgBwVYRTr9jpkbxrllKY1qWuXT8uYoPgJbKC60rjaOioC2JJ1/tXIuwZNxk8qtly9uh2hbigSYpdZAv74JNducaGkFPJ3n7biOCad5twJUc591gOUzAlx6u0VeFKxeqZ9q8L5xH7nHmXWs7MlhmsF1eQ2N+VW+u8K+pm1XtvUKRZ9bRGnAqFBxPvu+HICOW8ZeJVVxqOmsNtxRpbScQUNW3ALMQfn34DLVE7CeEK16LmMo0yLFB0mZEc3W5K9+HZyVTbfXeV4rxgKlGkZo34tMOJupWwQ1yVp4t3AVfKPuG1ANxpT5ILvMcM4s1bxXtvFEES3knXnvKqn8kRZdWDnz31n4UHx5gLJR3Ej16r0Cpo6BRyXBQ5q+yx1QHJU+y8MNAEK9E1B6W30judNBNrwvE/6bA9Y24A7ilQYaTpZibhTVnPeVzhilPg4f239nP7pvlFUpJXObOhrIAgVX3RTnSHZjJwXtlw/mEcyeqCxnyCfYJUorPBS+Qa+6CFe3nMQ+hijN3a/YR5xvk6To3266/JMG30x+8wveypg/ZHAR2kN8TG4/pykpfk8aPstAeEZHHfLVnsUBU8v80Ovmyifz7jzOFA5ydon/z988nBOfjWFsdpngri9Yxr/hNZL6Qq3YrTxi7XX/6H99HPORFj2w+TcZr3c4Z8D4gTHCOQK5s5kBDyPn7v9f13+t94JbaJV16fKT+UA6l/5iKgeAgg839teTpIJlC54wM04ze4ShReckIU4uiCcKScSbmFVB7pjA8RDT19CLUjzTNmcGCWG9bPVaRBzVHjvMLZhPG9wFEHyQndo87O7pnJ9rYymfkFzvLrCqbN2AXA/NL9B7/jaAEJZkyYBGuXvuoWlGJT/PwgAuFVAk8bPlCilvhr++1lu78EIi97yzpPJjT5HwOkQKsIW4tscyL1fhS6DH8xkoYiao3YYRX3tHiH2WP4K4EPmrDFeb6SXpjLk8/dW8gNu0dx2s1abC8e1hllIVw8QMbXe2sHHpeA4Y14Hs/ttWNCajt5uG2aq0FUloYhiyamGtQ0aWo29IJCwwkP8MilwP2zF6YdBGX7aX12IgNTSeQwd+q/82DWuhVbxhWSy8rWtLmtx10diIfliIEcQfTtrqKyn+kPMHUrB0s61XE2/GiwGGnCnzF1yklSaJx018OE4pH3CdDqsWbJSj8dOCwB9B5opcxfwLhBMDXTEd38B8wvglzW7XA3i+btgKYastyxWDswWIEBiNBeBr20jeV99SXHxnY/82K0Dq9ofCtAy7SgUfW7MqHx2fOUyhBUkGB3HjMxReBpiq0WpLX5y5EJjZ0iHTgdYCDbuW7Wx81ASgqUN0RqWDjDYlrzuoh0PX2+Xs9Hom2KLr3G/tWJy+xlPkQ53uyhUGYh1YOrV8w09Nt4LH/4xx0aKx97cMGuOEZe6Znj8Z5MFGPo7GqANyp8TRvYpKXO9FZ6mdz0h5JMqzA3S71svpBf87T+8jZO4vLC9iuWCkR+TxRioJykQUrT6jmYZN+05GWNkMxmPk2+jMT+dSsECLI6VIvPFxym23khFvPYRozSo1FDzPsQpGUfTBiyAL9t/K/v2T+/8u30zWjdgJynCzeMiKlv5YPYitOT0E4sDCunUA7m3OtQYf+NyGfZ9vCUG0oyHK1q3/Ytt41akQwayUxygINM7nG5159YIuafkN1AiUznaR/3abiT/0a6ZCFyN1+aUfpwF3KpMxGs64phm24mKrbViPzAuH+hocVELdk3ogvwQLkfndlsJtJRSQWn/K7wwkNA5RX8SS/pfyMDvbqM4yo+GEe0NxD2VZ2/8OWQAzh7Kx4Ckss8AmuyJ368rLmi+5Lc++bkqgJTsnFMNd+ArX14E7l+7lpfgaYrVjBh2mEZo4xVwETjPlViTZTrjLdQz1Y+Wnof70RpFyHlLUUbFRdecA3Zq3vGTSIXkFEQ4r6BCqKz4y5yXz4oHjUaNo15RjMe4ep94iF759NjugUnQwc55MfLlCMGDpSfGjh7EXpF6s5jPCjE9Vjh9BKqi6FYa9e+Yy5D/ctJ4srT+ROT2BVGcptppvHXmjkB0G3/l+M3GhlGQovBn/9YvLQjwpBEZsTxYiWyiGXYsiMVOGQlu3duO1nc3rUB3dwSKNKPb2/kB2TBAqYkrRALBDZdxrYdy5XEXc0YTXqxmmESDbJsclvTEqBVyb5ZqbopK04lJ9N7yF9LpMRvjw61dv3AjRABEHs1mrG5/zOlLYczMwmzvJBKcQH/U29iHzOBz3cjERZILWfdEu6trg0kA3yaPT7KMLGIWmIF3CzHGHDNFkm769P5fXRXEswrg2Fex6LXh8L/9PGXijvAp+X4yqJw9iMPUVHBJXpXcY6tFAh03cuO+RQxeyy7eR3I/j/FiJlG/MwctMfY4mrxzfun0RZif+Geu6nH/x6nHjpCjAKt3yzFiF2cB15I1B2M6y7AoTzKREjRA0eJS3ElFoQVWH9G8L4XP9+bGPlrXl2tX/nKJzv6/fcDnLKyTEUJ8fd2NGOuiPlS713PDDnTgSH4s+rO/VwftO4xg5GIG6g14dsAQh0oHa2WRvHdLr3CLutloM9qDFmL8ohuHx+54JEhxPewvSCmHwxlhK3NGo8d3jJd/3pxWOt7OBwGzqsWrdXTwTS1rCt91UU+ZxthpyBffrNXjYGSddsf1oSVMuKobyNXb/cdr48jHqOTcCtoUUVVu975ilAIsRSHsCe6A1OUwMW49B70Obnaj9ETz8CV5lH8PLEdEqiN8lTva7Uwak9TP8N2Ta5/6nBCQ5CzD43W8SInRQA8P9Jox/q1M+2Br7qfQMzA90B+5x28IXePswyzuCpDXql9QehOWByxgnhxCentAMh9A0cLeWHPgSZdIR2MOyUz4x0W7S93HhfySUUzAQGYCN3EaVDZU1mH/HkzeeZwGk08af9kX+8uV+wzOSo5Nzdvmt2OnD/XlCIY5Zgp85aGhnezXDYTEoDJLIPXUcm6OTymFGV3VXNd5i+N5qWepf+X0Y00r+AJCvTTD7l8gWmuB5nJs6q2yBvMrCnG5Mnjj1vKzFW+csAZU0RzROVpvht9JW7/5UtkDY6y2nUVPG21JTq/GCCGabV3MRUokCxOi+yHLlxohH5id+irAOxdIzM7JWNpRer/yHhLj+MTDlR/Ff5CKRl9hy6YufDminao5rd7JM3hDS/YKp8I1W3bSgzldTpC8uSdMhFTcuBM8I3SAd02VNEZLeBUv8cMSPfNpnFwjJi/aT9yoo3v3CL1XMaZqgKnG2dBSdrD2SrkMEVWKTto0j+HJpLqvyKuRhTZVDB6jT5RdslYuuPhx8nOimvwI8aoWmfW0hMR0v9facEbKci0bj/NmWiXvzlrbmIDNZkLbIQiJuQm6wDh5NqRS9F+6NTeAqIg3kChNwbCF1+tvBvcts/hICCThbUoT8GTqtYmTAC7Yjvz4QhHLQx2um7mAbeW2nMcbvDRnDXrtBUKAUbpXFpn96PBCIh9dksbvPtFxomFFQ2mUiBFVUVUN+w1tzFBVuKNyQiOVlea4xucgQdywj4w0Umqf1ECvh+k+7OMjcPogcjeP6CJCM5HrsMuHzch4Kfut+jjgxpmJfMQ/Fci/51BCwX/YCb+Xdip5bht/QWFxbxRcvQtCToPdnNheLceoESidekP7n1VMqr7WJnMoWzpgh559BwaffLp8PQH2qGEZtyuVqFZDUVPcZHBDX3f17RJRhhcs6JRRzYqKWue7drK8i4L+z1zYhzBJY9xmQk5AVf1m7LRXXYONmB/pfUdTWs9tYn41mZEqXwJhG6BwreZz6kcCvAn0MenQeLGbMIETDik9q+Wm2HLrgLmUIeY1a0Y1hwP42y3Rjc/IjE9fUcj1nVAIgq24SvcyJySxurCm2oCxjF99jPChy3//chyzvw7DVxRIwL2cjyykvbbA+OxkW4qELar74Rf6Q1QS0j+vxEi3afiMZUm16IqnhM4z0sEtYGIqjIJVFUGLIcULXQ1X9VHhnmKT0lVZaUzou6hT787fNemgiwiSfI2N9jCWuUkHBms8mJifsmILj0M3DTe41B85EaTSxtv3YXCBx58qZXu6jSP3JADEPUVi7cEPxWULTjSEFk6CiTMcSS5BFrGX/a62beBIBJVvhE3itr6cUliLQ3shXboBWMPjv/t1uxXn7SigG3U871pnH74SYjONFc+VJPcz0uzCQaMKqmWY9gB0xDL4vQyMoSpvhNeyuTxUG2pztwWM6Egfgq4QGXuGsN54m+dop5y0G0N8TtXiWtZ1gcFs01udnA00YUEy5mVWfWq0iqGqhqH6FpaDIkBnVYpHquWbaSDTPlvElVNA9H8/u5t3zVgz7MgTadaKzoSNjwA9y/aUXP7/IW3Hjas4WCWkjIdSbum7gSpBP/RIh/vEeldUYAkcinfJ8OxwAv+6X/a6KUH8IAGK89NV89ApnJrXRJVl8JoKcmoSAdORxWpH0yiLpRgk1PVmRpMU+yMM5God8OuvCznfoxV63c9+JPI16boeQnZVQTEefuJMt4X+VZwx7HmG+X/gPVBDLOjV/m84GfhZFxmThoWL54yhDhUWTvDe34wFkcf9Ik0wIUJ81gEOL+PVX09DVvi7CibViH9sH0qFKRV40PQ03xQ+NRbA0Gyq/r5lsNj5HIvhP0fpeLzGQ8ZRlxGQQThN8lCU8JkqhPE1po/Wdy59B/SnCP9scS8zQrbyRJbiTpR6bpstmjiqDduHLknsWqxw/NeWeRSw6aR4W8VT3aUobZsFIDqOfkyfz/sFbMJn2IHxZXmaA8KVxCGXPh3h9CbECrLTcdkNGhfHCZF2mTyxIsYZDE1x7wmq2OMJZ8BHNaX1L50N/3jZX7L2do3++2EYQ3DRyjRB7gHCiZEjuK/+8OedEiq4j4eC+xysc944AR6COWuovLGahHWkXuBpUUZJhhxBf7PenJ3qksnF9aUSuLm/byY8a3VG8AuvH38l+UKREMs/NkKg1WLPEl/5AY3EDPAv6nqLFXuou79k/4a9nCWDpP0na3C1auVAOzNlJZFEbrgnTm15Z03CpxmofQ9OOGeQ9kTO6EryHwUoBZTYhubhE5fniy/vdZJKqg1EkjHyOjRR04vQ9mihOvM7dInAg8kslfmVH7EVqUWMytbB+Gxn0ctPTXwAd8tYz4ZpnQS6LnBbj0iJmTEXpnylhGy9Ux52Rxmh691rX5G9IPH5/DxdeepAmbcIH6k2n55dbSWvkmSmtF2TIFES7w1eKr19/eddg6TErsJL1x1qUOnEAOL6hwCrD98+qTxLe7cPipMHwGulWBjRqMPOfokSar2Mg+YRmsQza/BoGIuiWFcDhXzpqxynuHYfyIgjJqBjETOWfg3ziZEcQHJwlPnF550dYLHf8w59lRAyxmGQTN9eX+NFxRJ2v60Vo9QEi8PRE5AprEmtXdEsjppMvCTz0M9g6ROkC7xixq6htDr5/9AHN1R6q7hB/VhWj8MFu5+s5vsX6O1xuYKnaW/vPFxgUd1JgBpcydGNdv2Frq/x5iI2PaG5my+uC07gWrrNfD3Q1cof8WmpWgMJ/Uw+x1Wi7rqmBGrNIzGqfun5RSFlEoRgZXntjvEVwg6CZZyE6jdwLcwQyqFalh+fFc2VhpUHp9O87nfnGqBpSw4SxFHCdurgoNeZYwxkO0l25hIlM8MLtNWk9SEoOIFmAVbg8b2nFkKrf3flPpDadKU9xIF2UzLpZOwO7OOAxlwnBcwXdsVR4hPeDEPX5sVEoiLMWaOAathQAPiTi0ftx8ofFtVWYqyIdyVEOqoaSpqinoxru8Le9e+mDE6njXl6rIHiY0gsK4mTw0H4uDJFkY30/eISaXSsRfCs4oAuiV00qfhVQnhgXPiFBm8sndvaxt2fupn5nCRDH8QQOI4IDzRM9n55dvSk1bGi0AN39fX8y8qXPhwuMtRifnI74G+IptOqXDaxLTJBdYXuejkKsTFwJ3PPJSr0ksRQgV66A1idvECFERPLSRUKZJKUXvOX38beOzUu0gf2eLrV2SEewYyVfwZ3QKGWq+MYjUZUtO28uXhNa444UPZGjiaAagT6/AiVErjXnT9aXIkaCO7H3qXw36GqnXFz8Qa96mRs5Hi93ZShU1njQ17xyBaIlZq1L0YPHWqMf21Bbwg9UFY29BlIEJyz7ug6p6bHyGKPnhlxzaadZoYdcCjTRvnDd0kCoqT4tZeZjYEAIYXMtDiXn3x1N41mr3RkK2Ee0d3LT6nXaUf54LXr+qhJqaCJfCD9AZ3v/yUpCY7EY361DkQBRY9gpxSKnZ564tjDeu83vGZbt8u77gcbC1xwMTksUNggi5rNHCdIe8h+5nxDnHBQNF0GQ7Jrl2zYr4ofTNwzDI3t4USQxeSBjJ7rJSVaQB+vjmr6LEE9nYX53yW4yw4Nbpzhh5e6IfTNQCKdMXI6LHSyxkTktritDH7urpV91JFtI8ioUAZF9jfJYs5Rlx3N9vDY4PPPqtMgWlM2ot9EjzAJrdZzvPhv4xkL2KO0St0RhztenXx9awy1ECAex29I/1NzKZbDFF/wFonTqQ9rdxkhAYm8T0ONjG7dnIAga/KCp2WTuw9oiQqlUhD6Ty2wCZ0VlrCZUpxpS5OlWoM382ef3pWun0iaEtuCHDZG0Lh9w3MpEI2KhVrY6VuO1vVP3V2fskShdW1r4I/wtdaXvf9jvLAMzCr4r6FV0MSMNTJUYSa5pXFcN3sgtwgn0tf9eIspjfTmtu28w4CFgXajyb/DtshfaweyshE/YTxePKQgrpCKYlypgt8/1ELFrRyFBvYOGiH9NCyl2qT9q1dA+zgNaj5arAeGDxlR65q3GVW1LL7wU9uiSpoAGwM8l/TsKiOj2FrRzRn5hVXBCoOdiABegq0kQZgac70GBb1xiK1J9rAVwvtmWcoEdluJUwNuAGcPpRvCXAPNaJ/QlzrPUK03feE1hJT1kBhQPovP0MvexeaDQbKChK803bpVA7IyEPbwH9mAqZsCjlrFuJ/Gl8pV7H/Dt4O8ONbGOMQ/xmvgDL5Tllma1ghj56t2ABhZ62Mh//pcIKk3MO7lHLtQfteZLP6hqQORBr/3AuGUb3TWGi9iBWUAglH4wFosmhZqLVp0R7Djk8OKgO9D1cg5ukasRFB9cJ3H54QUDtE6We8S7dUzJWkS2pVidEnNvkgNuIsk7GU90DbiSr6jIm8OknX+cuAdqsG2iMb8n7hSjo5M2L8IBZTfg/5yTXZzj3r2z3GlVWv/xpNfi8Ov75MV9zDrCWne22uRd5A8j72uAvOBTZDQh/d3yeJ5e79hwZMn62SNXIsJdrAvubofKg4e97mO8aedD3xb1IaNjSTKattOHoyuUDW6/GdPxIquQj94eFMpUtUhU8ZogutMjFkV3p7IYnVIRDK+MRNRuS22tUz1QQ2HBLrsBvXqW7LEO6XjLeZSmv/xOoB7SbvYEF9UqH4YZXrtjPD2NbnLtOnXtqghGuoslKw6VJXXMtFGWNd83kEbbHra5khL9yihaURHcD9xAbjSYxNhMvhvStXroAraY+q4mPwfDQN46duAmoFG/I38oY2K/qkYIB79iogwCS9cLPr3yLtDr9vNgWd+4w137i/JMAVlXtb5ujVWjDGdAX2HqZx9z8v8GwfH8SUAtzu2mJgRoJem78vNzKV+u5Co4daq0J5iS9jncwMHTcTCxArbp2//KHr24gbJtT9vY4MBV38Hyt+kCdG693wTnPCsu4jC5xEwLyuB9QHAZPRlfkECRFLj35WHXMlGk+sirkkGrdbO2GdtuJLQcdWMe1hMV/VDVY0W4ZnN4vAvwcEjSLRCowTR2QsvLyhO43jnpSSPvLMtJrfZgBszAZk4LsVIhJu3jjUWsxdDg9+O9tD3iDXrLajvP+VBb7vP5bPq7+rSXSt4ibw8LimGZhg97G2i2rOvc1vb37c6tuaSKaB3UdbMLdZ3xuczsGG3K37AHmz8tNAqMZdFHtm4UO0sN37f+xKUI4fGFNwabGXzD0NOOAsfGF98Y3ojTF+1A+nDdVq9emgeKWXHDCHzOLsCOhOiHahxkXt9rhPgrkWjqWVMmUttBe+VJGykXYzt2ZCRfUK1jtgYUPoYQIrf4J2rcqgYN7mQC235yIN04AeSP89h423xDpMRNkSYyffcrYNuv5pY4vH7oGb8yZEV2M9lLQpUWYr/WC0l6/F2d4DB6uupxqGMakPwyWsEMe7cWTmgYZWyjQJBRbDq7vDqmVNs3Zs52mMKyBkavaB6P+BSmuVOqrjZUriKDYcOFm/TskWWM8Z3kQlXjhoLiCbLx6mV4ECwamvLeJBDSQymr9o2FlBsB4q4cQR9sGZ3MWjjQxqkMQ4y7MWLJ1ZTttdB5TYPS663wstLWZNf5TyhHkbKsqMcg+X20Ig0npRdvLwH82X+TKUOtW4wAoIYyYAMjVE0xzZiriNikfbZi/BczCg8BTsD1jDkDPvdjVpGxKJTOsh4ubuF/H2unbYxMKdtTLLiqBKf0X+unJr+yeN6/5JnC4cXL0o918cD0DuSi5+1RbObEzBmlnq7xES42573htR6rj0H0wBgM2IwFb4HfqDGUKfD61Mg2AFxnD3D0zycoHRxeo4UShJQBH9Sb75krDst0TBmQWwNjoc4NrRJOZlHYJd0HNeR/3RggK61GcPic2tfTqCpuAn1RdeGxRI9sm5GJn8ex5kxNdKSr0swtgRuhNoV6G30O4PgcujZ0Mt1DOz2B7C+Viovl+sTvc3AZ0Pa6ae9zEhMuRlFphh5T1FTApRS8sALI5VH7efGAHVZhl6REZpgmjhndN50clijiQdMA0Do07QhwzWPR2yyA8MWln8MGD3KQQhajvuZKe5ZyIMVq4Y9opu2fg/86pE81PvSlDpLFjpQ1Yse8zg4DZX7DNRF1pRMfggxD+d0Ty5qnag+Ie8SZyqqQEZ/MAcPot9lEOvfKNPrFqLkGUgUycWedrFxm0n3WX6BOqJ8Udlbcsy0BrixJwxCVq1aJiS40a6YAeTephrNnKwxSjjdvTdbc04bIDJCAJO8s7sovsitiLEr59oSAeIIxotsGq2uDRuK7KHpxp8zdPbJoEwTZmPl/QlLy5qQM47bod2uC1htVYpIdv7jwufKu8qe7BtsrHjdfsQikAhfuaFFUt31HOLJqWbUYjPgk3qLmb5XznB7XBbxiZfqZqb21u9a3WHT24IvTlRqzG+/J1SnbpMdgcnduAkhIOBDoDfYma0RkjCl6K/iERlU72V+HqmbgN2iaPyuspao1iBfplq1KAoMo4AbL3U2yFmMfc2gCR0F14gMRPqPcUpGtQHrDszVYWn20rmCczlm2GISSApsRoMx+tUjGec0Sb9PKwWvdq4HuNpQGzZW1+7TydjeyDiqphFum0O7BBAXLsii90mR/ON8NowccJsyi0i0ydB4BZKQtlVBRMEC2CHsBfU22r5EXtic2B16TJadunrDt1+7BzgibhIE0wExjSZbeOTFlY98QRwesuRDm5rMlvhfUFKuE1XKgIR6cel8qnPrJ1iUHJD2lWYxcgJhVfw6zlnp/+mU7TcBbU6Ht36DJ46AaQ806N5r93TpQtGq3eiC0mht276MbBSEweiQ0e2sM0s/GOb1RU+POh9b64J9EtDztZi/zf9C1goadb4o+STD5qj3jet5VGyX63JAaVqj0/CNAz3QiSyDbjmqyGs0lqjCsrcl3kDIU9j3TA4IQLGRpXDNKw1r1FrC+tejwFlJF8a8cB7FAM0p1xmNXQMRwtgBi0SdEHHsO7H5i6kVgmj3wDkQuFn7VK2wE1D0tZrLO6ZqmKwCkJGuvYYAkHsOxx+YRxdQT5+9csufhL3uR+qUZwWFNgzgOgRUajfnKblUhPW19Iaqm+HQovNdx9R1JTRSiD2pSWWYlGs6Fr7lDj57QjnrTS6uG+AOEC5yxbnOR1NRgSldoRQU9hIxxYH4yR7wYjov7qIWAgLTOQ2mGZ0mGxBeH3jF57Jzd/VbKVNws89m/ibIilnW0h7Zl29Bs+deTwfzr7Qxn1I+EeNXXO8WMhdpg9OrBaK15luJz0fDmZ1et4jfM5zFlqA2rVYktusteDF3UVnMLVwiS6GxYKZlU6PEpKMBfl6VJ71z8pojv7xyq2krDn/oHAvhw5SUsKI5P+KRjqYxrg3ebtycFnhhVWcsPgq7Xrdv2iyiGdZfuyPyKTstiV3xZwJd8vECv0neoAdm7kq6f3yHl6wh5ajbg/mcIVnaP5MErkEFBtJrJLqOh6L9HrvEXKD52OMDi7bIkMarXacHo+k88zKq0EnowBDo38chkFmKAoyb/T3Pm0CZ7KtkB1CpTvwoReU1LABHxNoi5ATt0cQTGOonUjPT9D3mJiAowRkccU0z7DFpeo3Kz9XCaMG9zrjPihnwpu/guEfTn4dV8RYBd+nWWsE2P9udxBSTM3ZYx0rxP/IKJt4McFt4ZCUpuYtUE4iGU+7meCURqaf5/MrIJaGGcYuYxkqDAQ3EYdKK+hh/Ys/Js9Ir8UFr8uKOlxYPdPgpBQOJvq3XmX8NcGnVCpgyVyRlK8S59GkxLAaLU2TGWMrzNHLt5vtRFcPnq14poKo5fDha+Zb6kDwmFh01/rKQ9zPOv0rtS0U5LwfnhhEuSmLtngfhY09cZW9Miup73k6vn5uAWZPybeqt0zHgOLkpxzK9T0ZWViyquFZ0z3PMwssxcs01x34I1LQ2LxVWIP/JUWxKTmd0tCG6o1mw0i34yT6XUQ6sVSKY8aP6es9fYfI5q8wt2u8tPLJMj2wpubSS1Krhry9oTuDuO2SGAYlpUR7dBMv4UyNHcCRM02z+8+Xno1YBE4TntaXkKdCVO7CXn58aAAG6q1QEBBNNVGq/IFTRQeKzWAIzkRtfzzeho657hFIX8iUOOT8YTRKKH8pcamr6Do2tQLntZ8DSbhjdtp4iGuxM6qSNv6JuAXMPH/KVstJ6ZYO16MY0/UyhE1H+6I7zYichBbVuQvqg8idJkdzfn1txv/8LMJ5eOr/pR37VWNWN86mzlAzdOh2F1DxUWnp0i9p7LIYJKVij9Im2KNwa5UbGceUxtWm1XUuqybgxGJceoYOUMGxPmHlUPqjALOGwmt/LNOU9XH4SUfb583OXuzkKFPuKFZ4ShkPgOX9fN9gDvqJlvAH447+9TFF2shfR0+tPTocfvBs0KfajQMK5eQvs+bOIzTaGPKXfylwk+iiePTtpoy54YVRofbMbaJDReqggCavAbXp+7K2CA/CpxMZPs4tNt5NbbesMz6lOUzFX/zcObemAaXsTkJcKo3N8bJf63VB7q4olhvdmPUCDF9RrT2nTx7Ggbog/ROyx7i2s3GCfVwBp5ATAVjPgroNdVoiH6wq4rpj5sSjnnv2Rd2gYWcUlUBu8t2qt+jmhh+/NSTNjMGOHCV+Au+ROXQN1c2DMkLJAqZTrDkJjUmaGvZwleqnt4S/FYKa0rQYrDddQIMbE4Z8kBbEiCfHCHCoeNdjnogceMhiE8spLTpx4LFEJ042cVu3tyTz5U4kxcuSMBI9sQIUfHywNloPay8t3+bD/sPP8ZVUDSvbp6aq7CfUtAgm9LLhmmVM+fUg55ELf0GyhhR85rzWG1d9c/MrWjvzeuCYGNRkCVyMj6+BfS2ESqrVjZhg7yr1H33Znx3VxTvNTEvqFC0bUOZlTXPTFZll7FK2Wid/FBeByvCRtnFh+oIrtEmM6F918ro2cwJ9sZOdPvNJx75oWalA3pJwitdo72KYmreTGfm035VCFsLK5V02FPik7aRxs2tsNY1tOZiXbQC9UF+9E/kwD5IpiRtLCSMK2dvmEwTUcwJSRRdzw9KxNBc3eOAwkLHwZegmAiQLC6iT/MKPUzyCFvAvKH2WTOgsvojPL0IQL6hskyiq5FFNcRMi3V3fhYl5p3iDh6X8u9CCDAZLKID5qbXSSlAzMKt3pdkJzOiGXwVlpzNHXzFn7B9A4tBtj1MADHlUGT7a0SOaXgM1H4KZBoVy96PdXB+TBdMt58K1FMyHBUVXvQn9OegJ2lqyBMwU16/MOQZphoYraPrt1Pu+rwgHT2AXJdsmvFP+yAM7K0B6PUUC6cOe1J7n2nHrYkgDAd6InzDbnecE+Kua2VHxLQMUxSXgwwCRqLyE4e+mA0wkVQyG79R/x41NUAk4CpNtyx70cslinCur65K9G44XET5P3ZVrTT0TeQfQorrn3OMMnznACXF30Iah4kO3wZ23dJijLe+cvrJxif+JMXtyqaCVrvImjfa3CbfwMu/yAKYs90DWng7g7rkzLYjOAAf2vVINlXxGNUtN7/TT9Fc5I0KDuySEJXhz2MNNqeNgPg57M0+l9o4ObEqbxjQmkZmJh+vtUkSssrGzoqpMst2TQPUGExEql/KgUm0MNhewPdXsTqI87CWQOuAMqI4JF4chMInO6fhHj5NDjirCwnwWwz448SV0Q996wJ8uGjJM9Xqgs9HO5r424tsI0w5d0DXaLlHrV4R8lMUv2vVtJvc17tfvMX7/fbdJ2Tl0Asaukdnemz8Oz8zSn7tcXsUOoHgFKTkGLbYrIffGVycfIJoXEkZce+TKa5u30urZFz7oAokYZgH/lBhA9nmy1L8zgzSYH8xLS8H6Oaqe+Ufub6wuDTUmAc7mm44vNOQcLbnoL4bFVJvkaX0aQxWlWq8U4bM18RNIKhZOP8FQqMkevRuVFjJwSa4oP0ALdRQUgsECS8VSc8fdrV/QNPFqGxhGSZNRHeVTprxyDtqnedKCpyuxilkvRcLhAu3lN1HFK71J7/GqBwudWq9enp3yEGmYCJf2lEc+2H/0g3MEgsu5ILqsKGPbpDHApsJH/XvWp3wTLUlqmuzHilBDuUwZ1tQJxs4oKUuRkVE3KTDHkBBZjQVnKpMoYw6d6Vdzwq3fTdooM+M2gRsEv8qg+rgLOOMxVCl5cQeyZQL/1m9UAD7zQjgIDWk+1NHy694NV4tJAvWEbXaXo+OHQuUQHeDgIm3bX8JsmD/gyo7Y/6Y82e93enIK2aNe8PwmpwoP+jR/Q0iFhsEdsrrgBl8dPY+I3d91ooZNMICuMoxAZNh5Se0tYkYvsF7kJVZuqWi8LhEG2tk18/uiagyMLv7Ly/b6e78ETWhADpSPL4H7nu+xAqDXSoHxB14UzU4HoMDX6z2cdcPjTCwJ4D6MyJYWffjKS53h8uqE6jfX1U8o25NRy2MkbyGAucxHH7GonfEmpXiPVytWSyoWmY5fH/5EtBvpDHq8q7v/iuA2ZPLkaXJfsu4SQXTk6t0fUznEurLfAdQvtZLfT0nFyuW8O3HZu9QXNsnGQYPXoTx+POuRAKpdykHqQQKlc1HkeV5atAkHo80/gfNfsOL5Y6VOR0trQHPgn3bIxRXXdqgbiY+LTTHING0DoJrfGX90tY42U0QRkOm6C4TA8c+nv7BQwirbO4e2MtsqpZ5ib9trZnzIMXuRIqf98tvQjUy091myvaWyPavTy+1Zt/vQTu6ZGcY6MBz1U2lfbPuph/Q/CQwk9Uh1Wq5qSrqOO9tU3eM7LoH0D+FQsJgATt7Mjp3w0NXVAJhgic1LFDqpY84DrPiOOEDCo6FiF0kj/3s4atUBHlad7KhvrxFCdIdFvc5Ct8vVj6hO7UpK2bLxYIoxeEIm6l0LiS9wdZ1kFO1HrFuscvC9UzDfInh5hRvNFi/E0RKIrrK+qSINliD8KH9zaejhthgJqrm5vvjmCx0K/ZJIpGwNP52Bqi/4rnVv33a+z+FwlzLMdi+G5OOUufd/TFodNHPDInohTdGGDhwd+vrSVDkPjbxciBzkKBBmOd+Bu7+038kvynh2hopQbb4Za7PwTg81k6j6NyDEtslQFBEJwzpLGJXOqrXJ6h3i1vAB/P9zJEYjC4a4xJBhR6IaRXQr6pWk59hfXIkRTapf9cnC0lKLIlzyjcCxHw7zYEoIrFYg/NpfC6JhtQ9XXwv+fTIfEu1yU9BFBoCeD7+pv+i7blJA06dff8tg72JDoetA7a1CUwsf402//WB5UXBIuSP+xihNC4qeJg7XAkSpyoekZH0EjAm9M4zCQ09D1G8GyythoDwJcH4H1P2sd13MC+j5KtTOm26l81dWI5+bOuanUv3jJCBAf7XPphfwxsOeWS8hH/JnCsTmaXMtIW03v5vOgdvmg+HuTt8ja3+Vu6W720NNC6SzdBY2BiPxx2QD2oSCv0tWTHQKO8vjlwzQckZu0mwjjUpGAjqF+FZHIRQSZWlrnmMBEOashwOPqL0ATlS6B9vQ+qHBFVzX6TlKoOUvyi+Cp2Rq/rn7Q01FmuhFzjybTckLFdEvbBnspmi+Duk/ZF2oz2aIR8r8Q3X/4DffR+CPJjZiwmb322aVtrOPPWEmZIA/BeuGaPBJ72d2YTSYkLdx1cSfU8TQTh5cdiS4rdRGDJDvuU1UguQtgkIFjaB57XETPlD455uRDE74j3jlpcpRtgyvxRvmCH2FCSRmufQam3zyxt+hDrn2cCw7uWIYJUzXND0vCSjJiYaePZUOvyeuYyRqtKcq2gZUxAWTxN5Ci02J/xxCfBq/3NJYv1jYfp8+xt3FHrQEE6efAv7g5cysmwu9JR7c1TMm75k1nLrZMNC43wXt5u5aRG1DVXalyiRnOq77hv3RdJqcZU9wRMPEV/R1MNDwA8i55cf4mo09Oe/oUi4yNJG+O38/ct1MZBELtflXWeJJdR5L4nrNDw6tC/FC8YJnCrhRD7Ldnm9GdaUeZMz+7zI/W04kRiGRBTRX5DgqGmQBJMA22hCLcI4+kM+AyARIMbDp1Vs3tqB5ZbYwDyqOJh590RQigxUY/rz9rhtbz7KoGlUcqnyrTZ36NeN/2HFnmzxg4WTQaiPLUa7PVsiIWFzONBcQE+giDLbCWtAehLteZ0+be9TbPrcczaaXtYcTK/ODGILZem3gY7E0l2eDynfbkr/5ZbsgcJhunP+fhqQwhhMs1c8J/x70gvgZrvP3EKw317z5s5S8W6yOrgk7kqkMZNDutT6n/3RHuoCFTHH7xEAdgQ6PohVd17CPYaO3NR4AXXHULhs2vR8DSYQCZQXwjEK3OAfAGgFaXiJMJASPMnDrKB1iEqCE6l830BR0jIcCgPzxROeJe5X/k2CNjKuQgZhbkaBkVV/UvP3oVo2t4CPAbKl131qRn0OkvgnhKf0T2uDbji25C3KQK2elOAAdmK0aa298QU4h8Ok3bJm9DUclkGlh/j4NvR5fesbpIlExVXy1xR207mxOaz8OilNZM3ynsZyMcxz1OQ2P9TkrNjBSb34HPuhH9PiMMGO5Xek9wSxIHWW+6npT3Io/Ko5oqDDoUcFifQO0kx+o8DjfTsOutE0wErRG9+gihXx1JMHHilEeqdMD9iiDUFCYo00u+wL0dJC2tU0Q/hOG0TaGUa6bruQ/CY5uLmPpTuh18DjWFx26SDf6U+zIINb9VFoMZaq2e38446rMlUYoWrheF2hrbY8DlcnpZ5WskcxXciqZwm0sTjhBsjjbJKi2D8I+xOm6ScoaJwVLJyvHVWiPD3pg/H4aI34deJW9nXLEMYnv12hzGgJrcxAD6HooKCwfR2HH5vwXCvgigJTktBHfpedG7B2FDIGA/Vm3F12YsuRl9pzhHBe4z3VgeYNWP+CNpoRttm3freRpyiKe3a1/gRVvJimsslxS8ujHdlhcb+DJvgxAWGZqOIDN8ekI224dv0i64keSPX8BwiJfLTigarz8zrVlN3AxFuSEaMuZsX+7oOyCXtDiQSWa15YyLhm7j1fIp1z5HmOnrKTKdzqXNkXM7MRDoesMOk36WjWN2jKxvvZJhieqc9p94aHdM/EVowoPQZEpuV74/K+jOJlsKhleDyoR8hw90E1ZYtI/uBc3x3ekc46rZjlPjLNh/HV5b1eOyhEOXPqnAWZZoIzeM0RQguKbKTzliM0vtaCvo3vVAvFh2YtQpey7yulzKMTp5O2sezN2GvbQFFJ8pUd1wnIbyDzvfl5sO77zSBk0MWO/yg/9meZqRdmvM0QlSXMKftfKyDvHdt5Pijf0emtpS2ba2n/oavIn7DlFgN7IjAY2cT9q4Azs9UyMA7b2MuFYEWp29AyA1YaRzqv9CKbc/CaATzpgUm1+GALuYxPU7bbJ1q+srr4O4gpm6ROWUkvLAfV3rc2gSk9VfaefurcV5zBj7apILO4gZ1J6T/ZQBvTyZCAd/exDVbNO9ODolSR589m5ISpO93Kmw9li0QoQEkAkCug8R1ulcsGf8OaDyZKn0nLcZHU+atCsT+QLrHcUwDoViuIy/qXNqdCk93V4SSkRX725kYAUkBfoKaUcoU22YA4+DX252CpsfcWbDsLC+0HKbGhGRtdfxSRWiqLkwGwK1WFmfUHl7Fyfx3jzJWHSw97zyNOwZlHM1Kshyps5wgVfxS7+Et/+vV2a/Sc4F4IMdM0mF20qzRBmWwVDyc9kwYEifTct2l/y/x5IJkBzWoSkPNew11+fISlWFiHa4127XvQSqUgeQqkK5S1yeE2YEsAo+/8zzdGNIPJt4egJZF5Ea4w+hPvcakHbVdHVG0EX6cJS5+SpsYaObjF2M9x0y7URO/GuBohv2esK5UvupfbGiHl6DFABZd3owobUFSNvXacRp9fnO9ZPzUm04pWsNbCJ1rAytwQCsUEfJ1CDYL5ZaF0IyKgFZbP80iunqgaAcfQHUZfW51bY2kwpy8a74obXmMXUu73JCrjPExdPkR1lgdmphiX3KN7LCMTzms04qUGd5P3H2KTIOuC5O/8GztmzzY6MBTJMn2t5G8ofeKMO/Y+ffjdm3X6HDyqNiLiFb6pO+paQH1g1Pd5TZSrBeA1W3BVSb2UGWOh1HGYt/ye/v+sXwFyVsTPN/qUztl91gLT6yM3Q8WOMMmcOeQDJcsCv3g2g083fBmTrTW5xpJ94MTBl3Qnl/9FgRDfLru9k4MyLC0iG0L9674QwkdPPKM0s30xG4O+UhqFXQwvVzH22Fn/ulmG9aL8UkBnmG3t6qnimHYy39X9WHpdSIodL6l3TqfMamciDARyPUM37blpO6SKDZb0quLawOGEO6w5IfOhxhh/P1J1JCe9Wr8h6qsNf/SV6/darJ5MGAv/hWD+XLnfc75cZpjnlXD4uSfdnYGpmUJciciteogZSonLY1mqCDj6vOCW6QN4h1n0uMV8eie7tRkCC7aB/6Mrn8h96yK9cphvtGlcnZ2uNAKJS90AMUrFNkgAPW3uunAxXJW8+bpiu/4CxopHNXAmt+HLN8hQdSwTqiIjvOmT1IgJBhJR085fiardOH8NEiRetL2alBmpsacIId74k3J64KHxQuivr4XfLT0lpumCLGht6Uk6AXI2iYyR1hwO7Pj/2R2ZpeoNfVU1hw7UAKYmMeqHNH9dUayHUxuDZAo9PcUXfV8ONh3XKqnr0KLXKdgENmf4/sWgHQufGjslktFpoy//fDS2WNS7s3jIcfeaacu0UDbad9N7kPKzsmjTqOIPjDlj9vpUBfxrORzNlo3F1ObvTaAn3Al0hlxPovEwDxWrC740Q9klJ+rNGyzY99LAl4YcDWHOdssMyu6UcKlgbv0toyYXQ6Wz81mIhA8RCBMUHxkNdO3ZKiguN2Qdt3j/RMrMoUwXHzkcRRjhOi6fWtw3TtwQKXlIW/nKYvEOdUJrVfoPkYzEPxR2MHXmBQj7bLvYzO2zF6pu2juS9JirmKpv9yFyCub0dN47mZ5cLEMAQcFKf2iO91lMCbvwuanfYwwWc42NdsFmqzQRGk+4qs+c11oxSGQvTzbXOJMS32+SF61PJUnO/WP8AV8iV9PSCHDEJ8G7XHEcXLlrITmjsOvYhYtb/RJKQxDEX0n8AwThLKByyVrTNJzht11Ob1xA7W4ViKgn2r1qtnQDIMi1rVkbTFQHUwTQHEG1LFhZwjiFuFLPz/9R/h9lmeUXOT6Zjfuxy9zWPfIrRSkXOSFmMKHvQLogsqdWWkr+HzMAFe73fVxELUFAbK2vH3m1hSFCbPNS27ArveDqDYBoI44PQ9+SjM/EW6AuN3cnxIzsBZMKsReg3Jsd7NO+ukzKxLUt6Om2SKTRFf3JXQnvtBPwcXVxrgaHXWkenTaDi0R+t0jZ/QYcFblk05dzXa0saJHfHxM4OIuQR8MorQrxRY5rfixsm0dWXSnutXCx0/SATJ+5DdG0TDY60N/rBsgm3lUkCBcp5XoPO2bSbfRoCTZD5S3/gc93k02cMmRGiHEabzEP1fEUgM5qYzGv37r6jm8g7wHqdU0xv+O5FexvNVt5pJg3faT1q9CEzuDZYpOkKJm4Q2/sS69jOziIEXhKEm36m5JOqoNbNN8MLTv9vI4n/0qXJysXjSqZ1XeDg8AKx+FhhRtFQpfPnZ5QPhUQjJPAWuhUiTcKMgIYNnaX5WyhpKgAIivx04TqPQuiRNWVcLXmxRxdZ/GiJDFjEAgKue8KZegpbGbX2zsAbEHbeNAJl9Ej1vtyXcQY+dN9GwAArZblkrnKQ88AAYu2ApqcA3Os1TaxxGf7AgAAAAAEWVo=' WHERE catalog = '06・5P-74' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4JyZdM5dAEABDnbLGnEwFsbmckKxmb/eAnTOUPHlqu5KRP+5p9YDDU2WepgPar0zJCBeQgXjRovcb+5LENx5qBTJ+IrPS2srJYDA5PqlXtPonMaITAKgo+DiLjI7z4SPX6aPSOfkPQ9lueeq32yC4YeqLogqlQlroHOSw8LyKnywRzVpks3N3FzBYhbfFVg6D8PNStpgZDbwlU+moy7lPm0meXf7WX9aqIr/Qqs7nJNLAk+1yXxA+Kg/C5MLiKAozq4rBXJW16pJWgfwPfG/WYSSO9k1jBKDopsBBxdnsnsfNqXiajML6jszXp40HT72KVKFn/ocvzCgk2SHDUsCACoTeVkLVyob9YxGTnG+XSTs7vnm/k8aqtcY2KLwUD45DQN8lmOshrLsK+fYaZ5dm7RP+ShXBkww6/u0zIxlc8GBJ46m8b4sC/G3kN0KqI9lpStUvVm8wKsM5m2aal3MyVkWiEjB81qrfP2m3Xw+AKJ5Bh5+NKvPoyMxG4Ckighl9VuPLwQj8ITdsVw8q3rzdNXkH2MmB+c0WmOI7vddcUuGp167vzYbad62/1HkUYlOMwcdFbPyp6/XBaLG+HD+RPxdayQsE5+cHnB35rtuWlWfLD6wC3UDJC5+L7TVRU/HOaAp0h6HFbkhzIp5XYYDczUrSnKAuw9bkEob8jEcLzUS2ivMp+XkQWKrRvYVj2GjsHIvEgt6qXwO+EcUBs7pskB8IiY7kVMF6VQ5zus80Uc4PJMRVjyV15JVVXgGnwr43seOYIOME0M7NF/CRMKkgUvUijH8kn5GTVrsd7j9uupo1jid004yYM1SYNBzeeZwB6KNPrs84zS7zWDzNESSnd+InUCF9s7Ye8scpTBPcrhWz4+/pdcCgKr7IhyGSPMUCW1PeYqqg4tupu/7pn+r+o2vpiF8FWl6/nPe8RAABqf62GZV5RapKDHmzkoczcTfDUw8/0Fmm7PpTyGgCNuiVdB/BPYrWe6ofsCA/WZB510XJocNsKX+xINyTyj/H40uRXoKR8fZ/pZrDQ7dnXKK2QiVPobMuFeRn3NlVsBH+mkAGuKYtocN5uJvBAJnEVNmCp1BFsdWO6i1Ex5zw7rxvuUNDfbK2IcqmfNP9I6QbSx3xEcVbDzD8Y91EED8VV9R/NM8U7FURro22GJsmAF/r5hGJR8uIGA75d1VkcMrxkN7FQVHoxnaJaOmoqSjZQl0sk2V9uF+5DbEFHm4LjgC36OibK8VlcrpJ2CWpNcakDh/F1F1Dk0H0BBy+Y98xyIMSelWnIjAVx+sI/U/ISYejtKt+qdzhLjMCLe6L3U60C0PKNtBtacrpaF92TnQU4su3y2//IZTBHeLP1mr3JJlLYkcuCL//MOWbHdhmUQ15OSm9Rcjjy1HjQrXFkBwKORAqAEMjPROYWJo+0WnlOebyQp+PeKIPMyVWgLEpysYGj2UGV7kCDy405cSgLyVlAxn2ykB87f+lDSkynRJfJv1ViaWvv25bb/y7KfufCC1Tvau+k0ViPT8soKir1yWSWu65y+G/Q1gKgBMhPVcE/ecPKY/NPPu9bHfE9jNFX/x8yDRAzGyUGYoe2XTAgfum0RbVHNlAJlEsaSLY1pmULCoS0dU5HJHgDi9CzjUf2qBzWq9lkEOr1BtfeCzhdctILA6fMw/atkN2cfbTmrY9BZDMJH03aWwwsaLaXB+k7Fe9OrNJotMY8GjikmIzOf4P7a71hLYMFt0fdEfeaWk4rZ0wOQjiil0bDesRRFI8TthcR4U7t03pp0gnUIkqjkV+ElqW+SgMLLq3QVFvFEyVdfMchr8Sjo6Y/8HCIIeQ3LUQvFc+Dv1rtZg0t33336BrXohd7xaCpQqLU5NAiCBv66o2XKRproEUX6NDy5gqSugF56rD62XKZmrsClS8jMblH5QehdFPAuMl6Ty7tuSdnJA/S+uvG2ZtWTMI9nZdMBi8QLqJTdqDySf0myvk2PeyzvlB3ch7jXvdnR8opXrYrVfvUEbu6esdadGAqU2eBhfEBU9p3vka7EH7434ivBvTaVYxn0WxcUyVyB6eAAOMhZOppht/64oBAm8D8cBO/KzZqkrmYPP9NEZRGIdYThpNIeWRl94Vy0LUurFs/uwTeKqMZNHfxL4VquaNXm3BlYlUlbQVTeNIwPnPfP0TKzJJi0iv1B6Ym9Ld+fvkVZ94edVrTbTZmIYo0d9SeCeTsK8M+HQ7ubuFhlXOU19ziYfPgftq4bUkcIZglqAhEjqd2T6LeXYbvBljZYxFLhJ8NFXsZQb1RO9PR0rP8uw0qB5THZQ7UP3qkdAvMEfpP8MGiCUXTXTvAWNF6N65t09NVp/ttGxUWTFr/8MxmY02cNAg1/2MqRNnDT7907Sle0c2ndEh2PqozZ3T/VSWoaYolqRle2rbGVZExJ/6taZ5U1FXC91zL+Mtno9GhAscHidvn61R3VNQZ/X45aJOSeGwcg3e0i6cu7AKZx1N9IP14xZdoUbcjcHcmzWWJQlPaOV2Drb8Fy0sWexUi25WSIjqxENtJ3o8rb1VZnWJgwr8qnfZOPxsync0dTxuuq/iSnxzby0phlGMolYpwcnD0EMX088Q9RUrpRBbtsDh5C/zxTntGm7Zq1ha1O8/8p6vrjVgQ+shI5vvz3drywXeJcabZxChe5nGYbjeY+M2+hC1gooCaKiu21X+aE0ijXDVdRLoW+z3gT6CFTfs5tlQpi9wAQ/aPji1YascZV222/vu4MJVDhEjkEo/Go6cyrEDXW/7yFW4BFVyDFhDwazYP8QxLo4kOuFBASdiYAehhtTA27cFhp+IB/MR4bIL1RvQwrYPedwCu1Hw8hGLEk+Y4S76JwUziNpV2qt8brcyaiDT0P19J7BmLbolzXks87rVk6ONtwqxaMAEjsn1Iu9yACb7l88oR35HLWpdzlB4CrpNyLy0rQTHn0x94u6y4/3hmbIHOBU0Od0b+Ib7qxNVDgPLkzoWbjD4ifmnTOYxgW3czFAoJI3nSLErdyoXUYNole+1/1sDuYHPrqd8BxSWb8FyUHa7d6Powtx+2uN0nbmvjeHZuX0ePlmHtx8RICr91RvewIn0UnSXqPtDBCEpFnv78fpgzmCZMSAkmTI6yk4RbFMEDwjETCR201u7jQXEaYIoc0kXxwt1Fo+1rZroYpVOSAg/YLe9T0F9h+j7ryeGUsIGddnej+lh4Xvpx1sJc9qQ0R4RlJ8Y3d0KL0YR3GHBsXmnREOR6hir9NdrL1OGyGAa8TStYwZwCLU3xzQRFzXJWM1AJAf4PM4JXyzHEUpV4e2CWMieHt7/6iLKXiDBoljm2Gt0ULPu5qjVniqWGvhAmllI8jXl5beuRCv0fWzk/1KpDP32d79jpIbXk3Axjmmr/QJLMdE7HjOmMJMg5gI4u4ZS+NH6l0JL5QMuJm/pvXSY+G7iTww2Ucuh6fQyRD7+V0lHfWnPNe2Li9xdpdgONUAkhbztXOsUFEbbYhk4I0e9h84OFGP4vBKWZMpPwO+UlkAYGyzmxE5Tt61RGS7KECW+vF0+BSWo96ctSyCRuWvS4yp9CPSYFP5+BOO5nrh/sJasVI9m3TgMg+cg3kWhUsOsYELEEeAnCWbgveUNLGL44l8wBCfMyjxM/i+8G4cQVApEYo6V4A8zcSSkX0kvWqtNXseoNIMkBBRMIb6ZvsOltzJlD5p64PrGICuhfhq9XRtbppR5kTTFMXPk+uCtEEB5q/xxC5X+29snqDGldT2dvuo0Yqyy1lKLSNVkM/sdggtEadHmkozX3DbWVN3VNJAGdR42Riu8A7dUs9sOplki9zwlqAyrHA4Tr1DhLwFJ3fUPf7+XQFMWcbIl3aT5kraC0zdWfEjWMhFklvS6gp4s4JlcJwuN7rGgnqgIB8hI1Phb6r2CTp9b8UvH/PaSeH9+QUm35T3DiCx6FmeAjcyE7cd7KWjwnQtqO3z9henfu3rQvH3wgSr4K6TnRoLDU+Q0xD9Hv1gbSjqjyTMTnNYewf1iVQZAqEdxAv6WrGNRB5qYX8Y+9d1CdnnjL4W3KVThxFQTk5SeGYkCX/aPuCDv7/ybEwFLJ+Gui1irkL3M5seEnYqlD9GpgB7Vsv59M74kGLXH73JVmk9poVhrFBs/dd+R/w7dZCKzHu3ojoPJufmgL4tOfB9mzlsjf58VfGCQtWAg9Wpx7tLPtHw2g4I5mQAEVhSTMfE4t+9sKvA+nqZN4Apy6Npzt0EnxWfzWWghhh9F8pfm8JAEO29P7qLiRyeZv1AxXdKQbfZTdUIVF0sGUoNnMtSFb15BXx5InpxBU6C3hvsJtB0q9YgFyJlhi8C9lkX0T9+Pvzywukg8qHVevDh4Mus1h3QE/iPGj391Go0kNHqo8FqPzERBkE8sOGav3o6cFyNUxCF/1yehCYsqjApOCSC/rZBaSR8T3MhNvhbMOQoYJsh2RPGS3hVn/FafuwaL9MIJwZdBdYY5kI1ja3H8BZFcRgpBASDon3H5NS8gZgPnoSRNSWw4+IX8zqqgCeaKRANlyRj6wRmNguSWtf19S4jtMPftbunCj/Gto7Nyw4JKEYBmOXgxD0E8+YHHyzMck9JjU9i1VxMKZCeaFmec0riWrNbr6OBjx6qf9tLOPk51ByRx0mhXSjqYmhfwe8vXHnDojc5Yvl13BKlQHS0z8klfZYDpqP9pffKc/rKnCQh6QDJW+8mU3T6EnwsdnCskiX/GXnEencg6Xn+3yX7jILQaj2z5ekPdi1PRNr5d0UZ9yxvpIWX4hiYnwVDOdpwHP8rb4GnyGnp8xkQ299ye+qKeISKXPKIWpWZM0ew/cN//7QCJI2Pb/DCreKpf7pbCECFZ6V+DFJg50z7y57fjJm0YoEGvFctVRX+Y15pFGTiAG9siBYZ6qL0BDZMAtr76CSLL63KUKUXYzvaebxtUB7BNdHFfjFvHfSFOmg7OANR8v9X6PuC5YHMMo+4/vkX1F13+/9lZ+67bwK775FuItm2RZuKA2CLY5VASALi46pBcCfaiqQOeXEov8j2wAaJRtGkg+yLC3I7k0tLOC73D1CYUjzCWKr1rIEuzA3WIVTZVkVu/574vAgzDaSuoAh/y4GAqGsvuKWCKL88MPcLRVbJCxFSlqHW1Dka86SttF17ZRcoYps9XS1Cz8+qj+tt5QoMO7OiIVMOAOmbW8Yje//v+giVvvfwroXyoN8/6BxCJRkIfeYvClhYKQWotM2ge13AnY00FLXPi8c6wYgNtmdCBVmI8cTTmWA4HkzEC518EnXll0SelRlmEex+udLWMndMT0ci0bawnQpER+AVAEy7UKWvLk1LDpXglXgPnK1jqhb1EHWVi+2GF4/j3s8Jod1edyEvs/qdQ9ohqZY60z4GYzmZwul5BGayoafj/D7rzql0pBdiawTf5bOK5e1QGKDM522r/qnb08szxrMO7AEib7D/Qd2wH0t3zPn9VnOyppX75D1JVws3Xkraf8MdEAU2oJ2f2tkW1TJR6AnE1lOoQLGFgFAew8+oWTJZbp62jSLa2lT+zOu3+YL10BvbcsipT0vFoeUln9gLJLH8ILQ2cjJmNv3odlhbQzteAKFO3q57MUrqE/6SvM6W0SAnG41+f7UozDOrKyBHTN2F2lwL+fUSEdC9oeafDsREBGctfYA2VBI8TOyNvrQTtTIeTfTC5PRf0Zee371KaKfeZXk5ieOzIG759q1nNfugVH5QWO0+2aNhoGfzoH1edrF1EkvGhz6Gc0qVo5Cq+ZO1pqrwsrPs1txE/Arz9XhiTXOg2nE79gQheRiDPjt2KYNk+LENJdglyeYW0p6e/rlDhr8rPsDNzGAsmGNjOrESphatKzG9hATaOJZsqXZnkY7A5yw1s8ljn4PxTt8R+UJU1mGHFQx7HvAi1oWadBnEzXvb4vEJrlNMu4uyAcwHQCRAqKYFFIFJ+UufymI7iOtabEzdV0ljnLg5gSAZDJ+B5Xlo+yq9id+BUxyXzeZQ4BaryttkxspjYkKrQIXpoqQh0g+WMW42Yp11/fmonlIJXQ63LQ7FLo8VR+FmbKDbuiiJX9384TmJAcRlOEU4kE6wo/KEeT1UnWfXwJ2ZPxYlPv5GnvdMATF6vhm15z1m7zDmyrKeAhgkrF6i3wDLh9lcCcXWXJRTJUzPAIR5G0QWOnc7I6toWwXLfcVI+6kkHkbuxZWOGnnKaMRg6Om8nX0tL5MHW9tV7YHe95LdYT2d3BpfsZ0KvgcgR5CbQZebho2QrSXoHm8iltoLUbQQsNovq7UurzOjjJFBQ1L9KquBiYHywkzyI/B8c8cuOlKnOeypw7dzOrd8FuI8UwrdQdUYfCwL7Rl0tyXVXT8ePPT1FJdEAe4aOVZObEqrmSoDfg1RpelY0yWfS2VtKF7j8aPrnVLLXTVU0XMaIlDqe8gl/CjslY9/CoCp0WIS2j+/AChVatIp1heXVGict325hCn321XrGGDCUd6woAyrpBnxgdXCHl8HCpHEB/mxeFHNnRj2n8xC7A2Q/LQSfMC3lmGTjKzYYG63KzOJLHB4npOXFKXCGrNzb2FNQ3D86b6OqmZHdX/vPwaq/ZTofdyYi9ohLLaT7O9bY1+G1P9vnXBM3Gxagnsn7VnGFr2k9WrDN+ZyX00iiZ/NMYwhVJgu/Lsw0UeifSp31/hxhqrDZLPmtKkEPj6BMEF8gepUSrVmhT/s6amLuatyoqhCXhDW8mKAr2BbjLaDX6pdHqGJ3DnLTWKBCgMgsSQbcEziRgY93RsDmhxPZ1TJTMSzwLEk7myQ/Fm9uUCdkmlNHEZCN8Yx9HnqTTUie+ke6SYjt6F4qvxwMICkarKvmG1ylSgwvSqttkbPQoLFoRgbeuWjLyIVRyrpWVWSgqWiVgvRPLvdh84GsRRFyavmEUY6Jl8xrtPzwuCxBrgR9lnaZpYYF1DWMrexGi4MlJp4Wl43uPkvfOA8PD1drTIILeP5v2S/DTepUw0IKTnoJsF3aVrO3Vv+Pue3nUQ6T+97QzT9FYZhLEAJrIojLfSsMNna10jcqagtAt9XPUNI2JuQoNOThShCu1Qi4/vpsYel6tFja6kVtItQEj0++n36jtiKowBt2cGTxtbxwnJcv17mWQMYTIdoaUJvVe1CN8weA/W8S3R33RAsKWdlDq9Ki7GMWa7QkRnX6ZmimwGQCHtkprsFsM70G1m9lv+f+fmFjWV0jW1SQUWw/nNar0kaeQfcmgQelbIvi5rXdwtMNJnK+IDSntgBvSNWtTsx/MkUNf79Ya8GARnoC3q+kgvHV1Noe69O18oqUX6niAbEQDBvLFzw2MqWZE8GaIOOsGWQ1L9x7ddaWONjt/S9HmEGBTO2Cde+QyDTWX95e0PJLBWiKLtLj8CIbK/0LzTfeBuzVgQ5vngCBXNA9ImX+G0BKtOrmOrTwP260QYYTm5IH7kygk80+m6L9ps6VlVIh9efCWouNdJTPgDrz730EnI0FSqs83var2GW7F1mwsZOHhB6Q49pzaolNVH+GgRHjc8p7NRJTBtA7DTy3p9izmCM9vhf/R5RSpGOZqf/PV7nUZdFdA2qqCkHCJ3S4HEQnK7dvzRSxfVWRVVipUF7NoqmiV7U24yofQR6a1le8LZd1csDONwGsbsXiREiZniV1q3pnsD+y1866UYD9FjdJuqbcSpJ5UsjEohhUfDfNr6i8ebEr+oZmU7Pck6GYOVvwuOkt1LeRsQ9+XQAgFQj8IHHHS1Se6gQg5Ul4SoVoYzw+ZE484PaPdDY+AF9n0vvo8TKU5hhAk16Zg0PVr18sMKKo4YTlJJ7QVWX5hmgSIiCCGXxuOulF9ntedu6I2qcggJdZfhLrezAvdD5kLAD+bM9BWFL/Jsch4C1xwB9OFhaXpQCRtphcFsOT4r4Hyt0VStC9umT/0pTK6Kb//LbwNIeG42PRHP8k72qGgP8jrgS2WlHqYcwBq3cTDGSjVX5UNse40gIkrWc+0+MFzmXOgOvD0QsYNUbPQxOHd6gdEe+EwcK4Z+/EyZ+Ik9Os/wflK5J5Cf36Lq0a81EcfAiOavultHnFe/tsK9pD5qRB04fUEVIQJcudNuFU1zFeaMdFj4K3CRD7ci1l8G/CQ8MNhz2v05qfiAJG6ycgN1Lf8fosk5aHcw6pqFYoQkucgm6pf2O1Au8xCqkh4Mr2JS+eC8cYLFO5VFVXvFBS8MLwIzqHQgLsEGLyIz4fK0jIiP+j1OComz2xKsTwJ+VqXUONBaiMoExUzs+Wvvkao40z5eZ0qOvkfaLpMdFr0BX0yuPMFQ2jZ6XLRizuDjtbO0QML4k8bHKPt+Lu1Vnl2jsLY6oaoJnKmuBxc1Fa0I6MlCv5CX273ha1+4zZgi3nnIYZjVsnCholrS2OZLZS23loMth/64a5UGrBfSu1lfK1p3fdWUjE2X83KXJF45Y4plGiFHyjxXG5agfrh+LND35ttlhHz7nc6ncy9P2nnw71BHrcHgCa3Bs821pP5nPQ2k6ISl3/fLKyM4UPuOart7bnzwT2XnZrgF2q+lnwyvmgJFToE0V8ChICfgq6wBsSrdqpUsTuUR2bDyeqLItwyWyvbHQ5iGEdV4gkITF87tZwux8DGGB6B1MOsgNFya1QvSpWiS9MXebcxmHVyIbZK1HJ0HzkZL78ZG8y+73wtzmW4UzcJcPZC+6gb0bsY9LjeeFwBquLG/fb4tIrb0xptyqmumxQ9KIqA8RZRjZ5thkwzIKEKzIuYN246auiE5ttYDbPsB1r70iX/LFeUTvffGMVIfVWwBNs1Y8TLU4cO+SzLxbY+sEH73zGD14y/1pnly0eFG9YPPuJSrZwrlxT7vAgSQW4zStExT/UOw5/ep+MWvAL1cDSMVTd0HVLsI2Oky/kyVT5BMLuWUr8tFN3gFZq1znB8CFrhuwpWEt1llefntW0Cy8Wp6XU6sCxK/hGzeTTq2RKyRPKhGMnJLjBFOjRDKohc/EcPOdTvsVEDrAOZKCqqZskzfKdgw08+d4QdPgQZmakQjJJ9utPbkrJQlqNkooLWZsotpZHzIJxDOEzYgNMRq8i0NMCmFvLyvRBXE2FsSyP40qyE86ARDpxgkmNQIzP37umlQecO6DP8Jq/gZMzYaiKvLHwmk1DT26rqaUbx/88ueh9Qt/pGsdIIJhhdhI6Q+qoU3LjSD46MwYDKm76FWgjbgN9KniMat/vHzqHnNVJTZA1RyVkML8/+aGIfZC1SyuSnweA6tMqAZZW2wlMzBaF0l8UJ+urjaZJkbo5BgdfFLpUQOTBamCoVS6ooWHvZE9ad8J1NHZHeU+3K5tyRmWCReAQ89pSvAcu3s4MlsAHMNh07mvBSP3MejtleqOfLQMiksNjDOnAOzszfcbLm4XxK+rTcoLaTcHKENegnene7N5nbDNQ2ge/g3OizyVr3j71JBCDetzJvg76pEN9H6n0sSctun/rBCLiA6QMCgILiKb0Brw3yvX/1FTHE/UOMoveJLgmqkQBgqlvAYMk1WkBKHJd3Uu0zVOe1L1xMWP4Mvw8LdEthsjCAAnyw/y5wFdfQXdgWNwE7by+GkxUNq41phL60TC62X5kMgHoMQPehnl7Qj0Q9ox8hXwPozpcDWz9xWQ8MY6CcKk38i3gXVxpB0pGwoaQ351Ynle3ujMX09WkXc6NLqYpNuZWq4Jcd/6mPIOS9EdRvqslMtqojojyPK4A81u0bV/ZFB1kSq3Sm860otrh60rBgZjMapNHju3EH4CN7s0iacAjKN540YDz+lm26ZCIAQ+6+A3xKWWIhAX0YK/vEuxEufmzm66tIqzheCO3uVQxrG3CD2YkheF2n2ahsbVN3HVcf9zneS5IE7FKZvycYkY8S+0pzN4lk6LWoj8JsGQFy9NwSbLhYAr+uToTcYeNVni3YN17ARqGLcrznWYnAuCKCwgHuFvLNj2V2u+ohfgtQBNS5kNULl+FMdLQuHQeiO4QII3n6dSfoZF9ZYLpeSiQtuhnuWuaHLL76ciXkQrnb64srz7EeBbLL153T9aVHYQzGIlzRIs9dzKq5oZ6MLNtw+oy5eUmfLMjwxWVu7EWchMXEvASMJbhb25FEHu7AA7rW5zSjM9wrKMJ/sH5Sj+Sd9FrvlnqAawD911v5oXXMJ1ZyYg/RFDL9Hpc5/5hB7EQspbuN4EPGnYIwmnA68ATpwSWs4sMICb/zbzP0xCjfFuyYtMXW76Vl/SpDI/PYfyFMCxO6LfVwzrerxfysskjb025fmBCvRunKkg09/IqG7uWopHkX/x9xVzldfLlzAvZH+nILR+OoHwMug1RH0QuKGMW/1U59Uz5a8G24my+pZasZMasNpDf916iJBVDHx3yALejt8TTblsHtcKm6JeLuQ2W8srHuI3hUir6OWH8Ar8JLYofIu+IfdRyvnXhKqDSErB0glNqm27WxbjSF7Tvjo85YmGtowohshHodIwzUwStPZSQVYXCsDokV+fClW6SvUcWXVxHN2NxiHl0ASNW7X2zDJuBUTrmylODv284cScX3pLVtGEJxf5XN7RGj8aSX9gL4jd4DbUug17Omt5aM6GMId9xGCSFg0Yag8hwUQwknHy4QYNL1cPECYEOWNGHiNSCzJmVJw2tGMvAw2Pe6neYNbxXEiNSVGs2UIYI/Bde0/oPgXpm7fx9hAwbH35MJmGuQ+y0RA8qraar2XEwhtyNQRwfUB/s9xQNRx8Edbe9+yadvUJAjAq40X3EmmZxbOZCrnqBRj/jw0EiX5u0pZiHBhMrk80IpKwPOZ60Ctf3BkRV8SRSupVWAqcrTcBRtDkKBfTAFClhWdG2myNV9RaBYYHyxjemhmsjrTMQ+541KSJqkBRcooQCLc5mSwMMx1/a4+xbWvyJ6GadMDMFzUMVfMTUkpRdzQOriKPpyseTKprdSF6QKtSR3gpooISlH++OuHSKcCAcgLrbzvZw1Vs7BMnqNqq7seg2zgQL8Cc8KsFuCW6Rnl7M0HXuPQKuwGcR5+02yIApoBNC4+2AdpN8U81E5UVY/tqXg+VPv2A52OhHqVdyXoC71YptZr8OsulK+sVaJ+8n84UIj/wHmpiVPfJceugxN3APPqMFU6VRC2wvaoUJc8jVHQKc+w/LICkDIp2bW34aecny6lU2v0q8VGcjatDAXx3husNquz68mct2TfGPS0Q3fcYDvQ3EE04ZRjq1YHpX/3jgtuabqeLU8wjPWceJDFAbCNu5hBgnTQz0ycH1z/vFr6lp87VMV7DuyfuhztCYWX2DYhtDR4iY2t5mwr91K99WYqGUqu9JxQIEGEtW1hXcPinSnk26sDwwF5FufykQEDXxR0EiU+zgprmra7rLBreu8s0aJpnTLp5UTPyh+JEQaJ7udYS4/kP28hVkl5bRCgYKPhDz5gecfk1hQPIUdcWVHgooM8pe4ZmdRSeEiZmhnOipHxYV/69fUk2Ng1OEK3+s2+vow2gcFPgGu3kEFfPLlfc6TaaWFHHECZE+syDaJX4EJe2C2P3sTyhqTlq3ow8q6ftIEmGL3uFetIjikhpO0yavDHKuhPDCgHI8zwyJnRpuHWm/gdMyRHUgZzAyXwRPdkOOdyYpettK/hwBENUhC+R05DBaUSOTe3fJ/kKS/fCXrychWRqQAClIuu4BpxS74KZlW3Hx1CxGluFl3nhEQu+FSmkhFQTEmJrfTFeaX4N3bJL6a42Laze7NC5f6mzW13jVjYvCYObAWtoRrV0pAzL1pfVUrKO8UNeow2kFGayPEx2la8OA15AbNk1xnJqLz5XxkjOhn0yNpwDLTX+ktA4n4vrXrSAlbRJnd1v9ZV+l0w7iUi0v5ya/UqAZibX9EoPIAC0ib7H6MesPBg+XkgzJbclZ7efS2BXWyMEO9DZmasdGoYbBpI5ZyuIdfjGbzQYQS9q+itCSMWOBnfq4rAyxnMeUyKelmvqeiSsxO/YcNediWpULCnTU19+WfUutj1zptGUmXwvOInxekyrG0oMWaAERtpmanZYL/4gKG2e+PELAOCQuWOdnXSf5/vtcuhxh16icQ0/bfc9AHlNA5CKS7pclLp1rAsle5idJrLWwiyvIBOSbeoymk1zif8BkEOb235RcNfSADefTYEO+0RKmXnGWPioV0pX5de6x3QR7zuQfwvNkgx6U2rnVkfVFHLoEIsdojpYBSLodiFf84RML+8cv1fMItOl89EnBQnKCnAMF1yga2QvFIJJWaLP3+dyC34XfbgxiQOtCtfD1oBtOU4mFu+K4PhDL7MxjwsFJ53uV98kmHIJ4su+M1lJylixpJ5IIt6heEmS9Bg8/llDJu0mtVvHFR7mYQ76nVuP8pgq/I7S7MaVXQPfOiX0izzVOqg4i7donQnzVEycKYek71eWbvlmtfhtUFtrmc6bo7kPRmPoB7Kzgz8pbhai1f+1Fu4wGv9EPAEoP+/P+T841FYeyIpaosE9JKH2lomQSsWYz2GgTl5l2deXqAeIGJdqllXgFdg2EBH4nuZjvfBKINcYiZv2uSmiPIxaE2GRwadA2sX0GhJ7X2j9rdYBK/yCol9G6aEgQC3ZxXSm1gj/ZTTDqTdRg1mBZw3jKje9Dyb39jXy2SO16mZOHwoSj6QPBZjc78gLvZ4nm2xE5/KHy9hJ8OjASMhY2mJ/rjPcMQjR+yJHp8MlhajwK2pDv0j8OSPj1vauqOo1s4fUUJJ3kev4Naoa/loRfCjF42BRNXoaQnu9eH7hr5ooh0p1yA30Jj3ST+aZP4uis+lWx0ydGljtOFvS7U0hiGLMe0sSMd6f8uy29PArK294CvK5KGZj5p98gzI/7WyOPni0WzEtxQbxh2645YWywf2s+l+TtY6yjiZZD4GyOSxwMu7+uerf+7r919qNalgSYSEDHmW0VdjJvHThN0RS680JD1D5h5dxh0rFa46iXySCWNvaHqddzvHDVPKPNqs1lMIlHXKkuDK4mwQPD8kl2XKh+tTF/cEFfU7c/G+FWIcTj6x660kUZMbBol5930mtpJAZop0JNwkdJuFT7eC0uaMhw48wQnDFjCotEHfF5rvpAilzVMqIkq8bO22ATDTZW6xr1XAnIZqVxOlXIK4ZZ+p2qfgClmBggNENRKHvk//Uc9HwNexUBaHLkGGi0PoYLa47BFHOYf6A3hyiqyEom9iN6YydOP3IIw+dXLXX/hzUJvxfO/9MGSxQrBf/QjAvjZB9GCvG7yqMo6W7bEzIUsxQoyU7yS56UVxY4chh6a81pQqEvW9bTaXkdqdRuxTuMdn0ClwtEl2i3WNo67FsQNZ16MzxDA/s2p8jMe50GFBB+2fopaILGnnq2n+9R8BkWu2f6bOeVudGCRPdx/CXZv7XRw5BI3nm1fc/kPou1ZKzQN+Uv8uNfiGfNKD+xWiRGm9uX9oHOcinf3loPN9gxD79+k7QeDKgme1d7hYJyac9xHxD2KPDq4najPcresPBwC+k7yo0YTFvGS3dMFG4KyzAEIwtizXCZ+35/Td3zStHtErfHlLTXLkK8upH3X/1z/dt26cTF23GYui5v1pNTeg5bIc/KWrw9gF/i4B2awwAof5uDNsBNnDrH9p0PenXOxYGl5K422jORJKru6NmDhmfCsIbULVaI2IH1FmdilpaliiwXOPIJMPyrADw1hYc0r3pFMWNWxspfo1BrZjwShXpEX/t8d/fwGvOq8VG8Fl6zZsGGypOAbd3nbmaIL2jhJM9/poSnbIC2UxZvwt9B5OOiIsnsrsyvmk38p14yd7hYVIR7cKpKw1rhWOq8ua8yc/91AQ1pjKdmQPXdLJ4TLkqdQuM8Qn9oETaFyY4Q2qpXJhHR2Qa/uu2dEywe0sUH0dsPCmqe/n2gCeJvwHmM1uNm5eUcUMdrIwdc9fch7u1qjZeVpEqk/aJLzv8rap77NwazrRy+6l3O68b/4xnu4748adT8i3H+5bCBAvsVULK91E8cZgi+N1TywTCq0uJF1zvQQnMCd/geV5XECFeciiZuP8wnIsE2rLMvRESYGw/I9XQpG/1qY8wfo9VGt5JshvkK9zMcaw7Y0n1jmG7/uGIgPAu7PhMBx4NsIohjz53is/OQb1mMLmHP3XOhLHxl66BHKMjmd8G12oBpqd6htPspdp+SRSFMw+lZjazfjZp7Fn3ttc1B2I7HzY62ynWPuecMd2Ar3RWxg6kCGL2V3l8qQ6+U/XoPkos+6kMhCJj9U8kw9i1V/OdXqydzuEfjn/fxGmI8ZBeShMijBB6GFmnPLYZOSa/mSdUHBYuQPt9inzstbCGWbAJi1s/OWndLGyT5tb3JkjCydIYbb3V7bqVtu5jp916TTtH8izSmqYttTynQ9n6kevbtbhtNl4q7OfUzdDl25dQxiWjC31y6Ox32oGxGQvVvzc3MbWWjb/MBTdG3F0hUZGC72A978dI+Hsq/CqDpQ7njn9/7mv0Qd+JTXgGrf4AjM0zw/17zPbbERax+urGOvCb8r3LvZ98uFdeX6t7GgTXt3m1KUhojBbU4CApaJkopnhK6azhgyAC/3Dm9l33qRo/4UFI2GQBrG8JqDlD/PK6FgrnrSjaRdM6hCtyEsdOCpZF+Y1v4tC33gMpU7CTRYLee06m0mwj2pZaqaf9tbWtwPoWSZsbVzCO7tYhENCByQiQTck1wmQI1VRteKWH7XTo2uyr7Mr91Z+gdBr549LLYlGz6MjGvn+TaPcf0YsQ6ghqOBBBUoDr74uaZZ73dufL8MUCokyvfqOq0EbuI1LZ2QxXEFe8OblJ8W006QWGDwoNzIjHAPT0rX7MRcroaR9yJnj0dvIlQwVl0nCKxHw4vGdKnUxlpoqyk2ztIYcJFvIRaVgzzB8B4ASJTXDsfd3REpQcIAdvLw293yDT3tEzBfb/Pf9jBesB1gfT1v01rpkznBMXUMtlBuYSILAHTdCeE4tnMDcWolIT4lv3ErzIeL0Y9F+SIJAC8BJ/nOtxg/orEdWWvshP75wxqPsqvN8lfCQ1On2osuAw6sPxc7ubgXYp2sj92gZ8QwDY6GJKdCfyi0EnTVp1Nw2f3Z2Hcp0hwitTjiXof0SrvL00E2rn2lvI7SEhonjWruwDdzbK3xpll6SBIHYuO5x0X7UbAoTgT1gunawaDI4Ayn/yZefgJRa7NCO2kVMs1l6jV/wY5fzjeMG3NPTVLCsK5+hcVJZzuMgMAoFrnYj5dOBtLX7cDb1InvfcGzM/TYnCjVZzI1493830eXyfxsU6Dy/L4tYmlC6QGToZNsM14zH39FzoLZeIrSPqEEM9iAjEjCX7YarZW7dKALd2m7OmldBM6mVwintzVVwv6zkS3uXW9tLuBPrewHpvOwgKfkDkFY0JU+eod8MdHpZuFjdQEIRO9qutYcEJVsyCoV2AtoRzZpnS+mCKIQtUkJKOLQ3SdK9YqZyG6Q9Nd3+zjlTI7zXZZekm14bTejWix7S/71HZyedhSAorDqSj0P3nE7wCbPNnLqoasGaoO5lEZHU8LteobPWuSf4ee50nwO1oi+FFUEsGN4wliDk9STU4NR1dT7w+IvAkwTpF818JMQDx2IfJd5cszFYc0rTmfnXrS0KnV7/bTWcCtFhOWjd+2If529Extp1c7XEgNa96aJPyH+9v4ZjZL4ELyjpjjAnbkQez0CE2LdZG6b19Hnr3JZpQ8jYllQj1PBMm/IPk05MrfMlX4RoBTNUvM8WwJXLV/865zt43RoR6yhBe7AVbBDfYXXmHOueanRTzBqTGcQKNsQA0Gb28raRCnV/d29AAxFLx31MNvoA+3fo3eLD1KQkICBrep7BalPSuqWJMVX+zLHmPPXqZpEkF8153vZod75pPRj86DO8lWROVbji+DRcZumNV9aZqzM4KbSKggpXrJ/kCmnPtMBnvMQV2dKtJDCllHJPSsCSoPMGGy9JX3kyCp+eDqzxykklyPJr/baaEhUjc8z67XgJA3ciVkGYrZEgQrv//KDey7KnK+s9UVYbU2uDk8tUvAyy5q9HXeQLyRvXyHqLb2/EhfXIjNWY2qx5X9T9clobeUTya2wa0/vAPICnvbJ0Uf56oMchltJTIREGhI6EO/0qC520g3twiG8Js+EkjoBEdAN3gxVjWvdBb908gylDS2rPHIMoHPb3wGBGdVyy7fzze/196m9A8LdN6DjwzUfTHJwcu3GMQ/U4OkGqROwl0Q54V1Ny8RAbymKom6IWbafPwvtN4kvYfsOQwdVi1Au4NUzNUF9DfciOHdMZnBlPGBHR6w16a1H9rEOiFUQBUnjwDb19HsTEAkJ+7uKxCKto65AYFzjyFy+zqNhQOnP0iOga4YYxXhS0C0RRFS1arfOoiUeIAC8xXofjcHFSwN1LRC6jw15flPkgNkvVp9slOLmKVWI1+bm+IS18/JGwqTckU87KrY/Jy8B9KEwFtExOKpzAL8hvFhY/UowZsVI3GXVADjFQL+RdxrV+hoLvXJyU/Fy7VBWtpQQdKPNpE1hALl7HjrZn48GPeug9YF6s3UfRCeu2toHpCPdzr87zMpp4TFbg3wTiZFHh5ocuU5ttKPJlJtqUCdUDocaLqZr/JDgjatd52hmWuZq0r7tzBGTk7j6IyEtqOsQRxwCtvIbhuJKnc+cnP63OduAYwDL6Fakos1zPsYcG0AT20eaerUmXmnB8Mj9g+euBX3Pc6d0Nka9AUb0i1BiKYGNR9vW4LKA05xEMfasEF1AuOMBX7pmxiTUjebpXhtq3yfluci5XL35rt8kgwrz8TtfO2wVgROJ0Z+rNb4VN39cVcnFGfz+7DL9x+1C2ZYur7pcBqtZcNUXEsek66rVIsd/jDpUvyhijs18V/f51n7qJpiPAVEsJ9S84qaw99/p0ees1R2prywe0SoOFPzRjpHEpnxaFDRx70vgiTW4/geyZykqO+p0iKVPPNfwuoDrfXpab4Fvas5rbtFwoLjd+VXlkkFFfhZno03mqeXGIjCP4H670S8cQce0YusFhQsBjOsBgavNCxLpvR+PQApLfQPhuX5fzAgVXS7T7cZMu6/oTnbe7vBA6sxDzg88GZJXRy8crvSHdoO6P87IySlykGmMPSDEYGjLKVoGDQnLEIkUkaFoVSwtHFF3Of21YBrAmh0NMjfX5Ia6VGRWRBCiu+nFuqHBcz0srbpk7YLigwa63bDYJsSSQMrVJDplpgcXiRUfnOms5X1ZMXhMLcRQOY/47ZQDm09SUwC8fW1x/wyuYLrK2bDOvhb5HjlpIu9ih13S7BgweyuaCoknleCrXz5sELXYOZPnd0UvuuLzz+WrCe4RMS7BOaD2KCHdYgT7yng8CTsTXVh/3bVIqkEGIF4gcQ9IBuulSSfXpAsgzA/hs5sNbo0wnyBinUALJQbWQN6Hbes6Qu/2Nk4lmDWCJzcg3kMAzYUXqgcwEEyM/wihbBlVfWcafML0Juqjl6bIQ37era16Z7DpF+5n4uA/WROpTfGkvZJiTVkW5DVLOPEjNbgmri1D8oMtVCjyxPg8D3NuW3gYyTbK13D28hS7vryoNizrSZtszBE0my5VlYwa9pJutcYGmdDKvn+8zACNLsyXZ07kkWhsw1wIxVxexqmAUzQEkMREJL0AiGU2SPV4yDFlDpTuPZini4khnusikj5WZGFYYk8tVhsbS15CTVBOGtCKmE+QvZ+6vretk76HfMoHByggrU9wRPxATPVP77/Mr8Ye07JCiUYuVjj42i+1iMMa182sZfl/Vh5BaatjPRLKM/e3bZfNwhvYLntU0IA+DPE4dErZWnE3pOc/zt3iuLtWKIzYXpKkaDfEiOx8MgNjQeAOaPOGNAVB4aRx7vx6Ju3CiFeqSJPl9Kk9JHujmRvA2gsuBIv0oKxoOd2Rf0I7iwZJHDWnjVbgjFU9Qe6wyl0heewgsJmffcShsVBKY8jYXr5PeMyFNoic19TQw8MmyJZw5nRDFoDzyZAXfwQmODRQps0JsfomGnk7X1QP4A93VIgbco+bGqlu4HbzPNZpXOy4/zNY/o1DLig+UJHHibN9j8N21XyOkbm42ALB4IBGRivdMPBvSyFF5OfL5R45f1CgD4oDIlk+UsKTa3PAkC78Arlwd5zo8F8ryp6yrMP0JDwcBW+LbzoJcMVfbuKHsQQaICHRQjQZRS2KdiVbdtmUSAVlkA590aY2k/adef4OfBDR2MzgHRkNwpx77eL7O4E2XgbCWQa5UP8TPD+Wg2mWBB6ldYdC5yvDyI29KRzLRvExtqEuOXP6RtusNoJQBVMvpwL1+I0DVuBp8oB/2R9gn6cbc2eLHjBgzzGDd8mr9kv81dweNzI6b0CYTiAR9HKd/l6+nAzWG7JHjzxQErqkXzABXbxz6Zccew0ozKUki/+N+Ju2/LDmgxaVbXaISSOIs2BE9JPsUVALaRX5rN81efzVqJQvmAvjHvxEYcL/wUpaopBfGs1GOi3kLWMQnnd3SdyEZZLIRpme82OLpq+wf3kd7HlkQvhKMUsYqd2dBU/fEN2BYLA6YInDZesgSQzWpHACBuh+vnib7tygtwoYIzSfLkiqHiuJcqtczbIBruq/AQMg9dr00s+82N31r3slfQLqTZkQcppF+Ya/yGHbNSBzXZgs9uPA1Kv77ebd7AglD1y6266lvVvSt8bZuHZNOLUpcs9hlsLlVVkL09uOcXE/0nqPtthvkDgaGYLh3a6LJEIwjlvavgSVuP52Aqt1wi7hLDqQWbMrcqe20GC0MzUG8GlA4VdyUMDCdMBcZ0+5dhaywtwYCvqDKy4isVK85HVsZTEVI0N5vbszHkaBcsA80XTeLlQxm9MsOZeM1tBFnIC9PlFDWGANxtOePqH9lejUAvVRBudRyxRE4iqZwVp2KPpVN0JuKbiOhR8XvfzS6cBKeKzTNVIJEjkmt0OPV/GSVsQL7NN3aVX8zk39bXD2VqjZPg3cU++MMdjGvo/1EQKQJUxXmx1dxy7czemF5dr20IFg+5EQhS7JDmQrHpzZNfi7g+gTeDzh8uPLEJn42l0D1IqIJEYpAp/ehB+lW8QmZkRm5wcxA0Pwx948mffvgzXwnJE6Uuw2uLlDwn/mbUVJLS2/+iJ6ixWrA5OIx+IV8M+IEOlJPWNZRJnGvnT4t0+XM6TTPz8uTZvWoYERUpuBX6oiE50Dx3fDNgyssGRJeoHS5uFBHjmYf2SvD49t145Fg7PBmJZSVQyh1qtVHhJccmrKOcgAUXgX2nwkcpSvdzbdmQBJ/bMskmy0wwaPOVbzG7RGCzOBT/ZIDpgBL0xh+IWFcxHC7336uhD95XhtH/Ooh2qOZ3zsN9RloAcMjYTneMpM+jiCTwNrC0KFSSifZqWsQCu6gmvjzVbOvKMtAiVhVDf/6VdpTbKe+yTpq03kcgmD72TFAWRuLNrK3gyrbQaDg0wUatYFh9Ub2EGgV9mCYYhOFBrBcjnR3IcG+JIYDfkM99mpaxCeVXb9cGlkrUMjshrIjpywZKZPmPF3KVvuassvenaW09PoMrtU9lrSIt9mKft1ODSaZuaxPWvckdJDFz34qEmdqqjhUcwv5QMhyLTqbYfBHHNl68nuDQwHq1N86pyUqJOjUx2IcXOygRKhX8CmTYxtrJtOgaZgqlYpczm9hcmULxngH90TuqphHRTUdRsh4SgtRLtv2IwPBkfNPHMhceVtbExNRbpQGejWL7ZhdJjmCbhbsaSMFEevsYnqAwg8MFv6d0UqaJnMEoeK4fMCsRWo+Tui7eCNhS3jZycFtTSJr5/VyfopEeEY1TI5gtxqC3CYIutGakw/Sb53i1XZgZTIIwa6E7aBqxElj916syS78wVEqNnhhLMbkqHMpDqGBWPyIFQhr99izrP9/nYRASk5Ke1LlgY4h1EO3b5UVDlXimslOxEDvdDrbh+AqHhWrJsz+Q2FJmGH1xsmxSp/75lRPfPXZruGEctL2+UKaEnGJIADWZ31NKTFcMxTgqt2Q23bRKrdDHMAvrITvUHngqreD5gp9RJnhp7Nobw3t0ixZ8fLgd+RBeDisoVnBMtNd7ZdafBVGH/FP0Se9bQxwlYCnGthIs/TxFfeFy3qnp6DJMaOSO3gpxLBp7Yy1Y60gEWdITnicy6HLk7/4Jdvkud/7whNWOP3XiDlpotQndpPT684390KQUx/XlCTozt+J+NPztBkiF3lilZH5gJ5uELX+FQLwZ0AmUN//2Ww9u6V4SI/uhroGeFVXHAERECY6adYZUllAUv70hp3e2Lo7IvyQCIzk4mzC17EF+Z0syCn5KeJafEvx5HoO67hEw5CQLOzv/Wxu4NR5mWffTSMJTGxFUJwEtmPGaL7zyAZtEqv51w2hod4cyY5nyB95BSMKsM6jnSBK2hDRX8cUcWZ/gF2z/GvC01btz94F5AXpOebeT1s4Pp3O/IgGRpvJJxKiO5S9psOCf0bYDeW0orSCYVkNKqBxqiKY1aKRrKJMmK+Qjbb6t3N5r3Wc2kz1aRQ6VzXBCnXdsoib5wfpyRLGdUt3CeRoUuDGPOiXap5g9rY8nHLeROCNFn6l+0UG34TK3nFwv/8a6b7UnJMqNbigXEe9w+dhnt07gZnkz1sgucp9Jc8y0HCBaOUiIYD4iLTt1aL9q1mZ4f3/gcIBnEUSaOhs4ei349ng7mhRlU2W5W7qQ5wwcm+bNlT0lpaMo762LgY6UZG20XGdUpeXQiXIQvy6hfrWY/Sa59v11wHuzE8w1wBz6wHVLVimnas0wzXHCaeP7civKEhaLaUN6nynYMKvK2kqMyOyzOCy2uzYdwTHFtnbzI8kzaDxGw5wkxN+ygui+x/uaqwIVw8URSyUruFmuuv3YgVMsjcIdVxp2FqFXUsM6/WlxjK3jWA124edtiUYgFasg8KmuXiPu5BYzwyhy7cKfjhlnvaFtKuzPoXhjbyNk7jQCSqoCgE1ky60lgPWaAjjM0ssInqOnT/PaxLyTHVNxCp9tstKuU88iScUDit9WhdwocJ7HMnZoEdDdI94ymubTe98rzHSvYx3NnzwZB59/SMayHOcU7A1EQ8UlZUK7RMBVECMGWJcCTzxwxdjzxBpnPxBuhyOVNxzEnB/YVWxtlD2uZ+FzviIfy7K33t0JBtKGcN0mNdiBytmoy8uiJnLosuH6CSFjlLwPlZDMXs0z0S6L+BtWl6xUGU/fDrLghcK9BAgt+ih9xToJJC9LJ8/FXuuJO8UJUb/R8LCmSDZpHyLfuVxBQeesCpHp04bmFQU0jqSyDSOHS1XsF5O9V4XCDfXjV5VSPiCB+U8jW9u+1Lb/7v2ZMZWo27khF/mo0ioJ2WQRNQNvi47dvl1XQEOxJakeXBppso4x4TL1elqV6OWZ1HFQXA1jDz7B6wwDvkjGeyjoIX7xO6MmM8bbcrLU850JlhNtYml3rf8clTekjRxy3mhx/pSs/w1UN25VwVy7++98weS9TKv+oAeMV2ffkl9JypYhq3QQGbKeVzVXS1hh6KNBpLeLgxMZJvepiY6qUUu8p7tDo4zJAFbMuLIWaPL6Uj4j04+Ugw0+LfUSXCe3YdWPVtxphfUOGJTJpSlGj4cUvfNVULP0KOPGyo6Ttt9H3dAdvif9xVmb8m8cZYTZn6BkJ725UPhMrUmnb9fMb5u1xwbgrUkzBzzj8yWcGbzS2HzVigmQB+uGeAo2Z6yG0K7YIG1zw8/0L11jSxyKbXH273B7GZSXU4TUN3zAVBc9Bh3P4Nb9F97dzjH3HvYhrxlSi/H59KBwaaQKn9NdW3528VblZDUrCZpXVyVejNIMv42SL7w8uhFLk52s5kHKhhZ/EKGJJzLSACvsmB/l7jimcN69/qNrV3lhAMO01txEDAtajPCt6uDVSw53+yTLWoDCsshXpPmoqNqeWj2NijXSmONwD3rB7tRl/slitYVkLybIM5S0kbKKLxTNMaF7bmhQUgqN9yQ5Vrm9hJiiDxwwykHqv1NQcqgYoAoBsvUd2fzDTVzq/bEdV1HHX1qy3iW51Fug1xSvHKhZct0DtswghVQKu25YUUv7XiHIz1xjvaSVq2tdTMDf9/m5Ep+J+gUIvo3iN3Q4Ct+KznInTdmPyvTq2l5wk8MUDn/R6HGgWuQ9Xs4PdfPbkaCGnfyzs/v+HvWltIMy9a20DWifO0U3gj9yRUiM4rRLfN+PDZ+WyoCtQMio0DsbbAi6y2LoPuvTonOafTDjSIhClEOeOChVmxCappxAnFqgRp3LUtOlgR9Hr31ogXpAd9+2YzE8zJCQ5Ngq0jmT5BWtZ6S077EjM6gHDsGi7aD+AuSmYQC3hBrz9CG6cgXsS6IlfbTjyBqILXTPnyf5ZUaleM8LZWSjU+4jWjVLROUKc8y1IRki5j+LWykvTqhofQk8WJdHgNu2KuSkPcW3gGRNP//j8DqNY7kpWq81vLZAmYsJiSjzFL8Ar5wooUjveOyQs5/1Spktje2celSh+g4rdDqjYm5izSqsiRB0cvHjCnWLQy79wm1tWBrJnZosiv49Tcby15jmpy2eSn89GVXHU9CTeo/PGRII1BJqHEhMOEnhy333fYT3NDY+prEzYjHiswTVAHNCWVBpgCjPtEOekawI6WLL5x3MHksS3nXtl+fycib67nUDwW4atmDQShCmsafx/tzqcFF1gkZE1inVmMGbaZ+1N9rR8B5W+pThhcMElOxFc8nCDXumXPsj1B/T+C5fBbLpf1948VHkuLtWO9SCH+eKXAx9A7KPItOO8VWBR4xRKR3o5jyXulCnatUe5Tm6J/3yWy5bMfYAWvjU2C38WWYuKqEZyGtttkd9908Wiz/eStgwBMpNw8kiHJtIM637F/jWdrs977vrnElwdFoWTJpLgtWRtH1GRGh43ldj4uBf+SwoxTfku0fyZP7GDbPF6AOJVKqHMthYmwsHSBn1WbT5XFcL3Q+819nPhTi7T+DkYrSDeXvcOKgaoNwvMxUXvayMIWoq1StWDKwOQJiwRXNBV19MAwxlEWUOqFzpZBzr4IjSFXxsJXaFralxbIyL4djHzv+xyV0jkqN7yosbaOov+VVr6RFSGlKm5NwMEk+dPqrPzYMCd43DfTnnN8gU16PRucWgPdHLmSN4FuURWVtmvOKPJUar1CHrxg9dd1z5bKIQX/HjYS6z3bnTzqyCCmq86FMnaAuexH7Y+lQG38XC8umoOZHBRhV6Ezu8QVAXYS8wqaV8oyqAKeiKprYimDu/Mb7u+22CmsSYT1h4mDagAjdjuF4XkzGQPQyFuHsPX6z1/sqV7dRsOT5oIucYZn3d1rImPUnkC+QGkqjMzWZ/WdPkAMufJIfR0/utlMJ0S5fsOizHEH3eBVXv1ph4bX9xWmxAwH7ivJb/+um3HmFZhwVtRGnFnR/HEl9FS/6DnCczuxGsJo2US7tX8heIxtG6mJvUEa2qmRykMZFylsRNBBIMphbC1cclwsgSC9rJB0na21DMfMnxi7kZiwp27vVcb7h8ElcX/MSZfXIFGUP6AumEnAseEUjcwJ9eva0Dq/kb+w2V9dJnzewc5xTMgPp/rv04BGn82RaGO3BnGiTSQzHHSaX0gHYlJ5zS8zCjJ+baKxs2inBunq4HJcSLdJa1b0Wd7vuWgLggQ9JjX5H9nfvbKaLrws38RbpO1vOI781XfsMPwpqQE4+Z22BSorESK7DWAszD79yJGofS1IvswguUemhZ4MqRa2HO2WioSloj2YE+w/RKbQLKHdQdNUxQ9QgoQYwT1k04uOhbsq+XC0Jxo/HDDtKI2k5JPp38PFp7de/eurYWpsLg6KOARBKvdosLlJ8jgpMLrLewDfbn4JM5/slEcWtZDO6NoTy/2CW5UA0L0MmjHonTCTqL/rEYdWjcP/OpDM+PXrcskmyYtYu448rv2lRaYi5D4UUxVJ/GkJ2GiUT6bTzmk9Vg9RgZywttXaagSZ+28IK1dQNyw4JT+DO6dgsXDreeRDAOzpUB7QrXi4n1GYKBIQzNb41Zybzcyp0ZxBkYonL6Rr6qV0aSMCFvK8KjHV6/stnMnc9vjBjPTueKKBNLaoaKRo4cAahOQ35GPLiZgyulr9hA8uJEWh+uciw9IYQMFUdK7mZNiDZ/hDCkjODGfKDNXjoKlD7qKSugWIUrQpJlwFxBV3WWy7fJvHUBuCzYl3i7pGhCOQ5NOJF6Va7FHNNH3YDBfZQKy4zCEx2X9S9mqN9pzhf1lEUqg/3Jyfs0tbclcBnwwhC6SLr0uLifVkqltivhWDz1KCPc3aExHnGjGe9qgjU9LEfb8LNawT6n3VTywbE2/qdiJ6WIjQB+R6XkXDMSl61103QPxIvTOcU1OFQ7LW0is9/bvv+kBDILOJghv3faDpwbYCcc0LRpgJKas/QYgBvFWgoaTRvoVLWtYIil6XMbyAzc/2DfkDoLe07D3YlF0aT4rTqXaQA0fu1/vR8UkXrzpqd5SwqVAx4WnSnJFWdb0uwmbxwSMXNcb+A029BtKVUMqYc612MD+aJfuicF9yMMm8P4fWVx4E3W/Yi8OQcYSTmdp4BERgIhUSZzcnneORWUzY0jb5ffmykQNf6bNujgIPQPiE4GSkO+Ls20ix9uIvi/KS0Kb0wzZpwwLdBji5XuaPeHGuQzxkwCBbrmp7pkAbC4jisgiHxhRuwqhuK/wqG7DMZdVOW3Ohv4AWlLJgHWUpDRwnEGSf6/QkZTqNjp4NQXP8h3e7fatdnpPdTIU2/RtPHO+bbF9R2Aul+aVTvcK8U13L+h0s26rzSqx/B8tUaUTX+TOpeUEmDmvybqGuhyO5a8Z0dEspV2CxlkANWgaU75kwqiaSDJRUrgdmP2rZCQ5Lp8j0CZFgGvb0xUQxGOapXx+xcOfpx5+NJrBaMfcQl0mQhl4UjIKUwovfsZZs5aJd+8HQb1D3k+zRQrubxIHrHuKcRO13vlkQnA5U4w6ZCwJt6zfyUTWkgHrt3OjZ4tOgAlJuPui6bN3hq3kgo8LnqmjMUjKLVem+I0XxAIVjlJ40dkcehvQ4tx7cCMozM0sXQ74HwVTOCSNjto9rdqoud7WfMfqqAnlWP4yyc0MkNd2eLR+RruV/R22TVIZz5pdKocjuRM3tJdafsvgwX4+U2jxiMum3JVW2/VUpRImoZ/0+CfQ4BhslvZsDuCHsa3tib0kvBnldfVrai37mj2o7CRb5D4nqRTTyWb38Fb2B1X4Z11XrVDWpeYA8PPwBH30cZbKtb2xVsZBUkz9GLWBIcLdAHvSDtsaI2ZoX23yvWf+2D1dqfDgkxKkw+604h7akF6vD/2g3+GjshmzEv4xds7TlukdiKSgBhtrAbwUyEv65Mp4VYPJG14XM22SXYeu5cHGlDie+jgJCn2DnuGM+ZwE7ETp3T6HRfYBttomCf+Ovdo2Z4KQxE0pkC+Q9x4/PHUzu30o4FHMMt4PgEmdPtBfGspx4LAQrHA1WUM6B/mZNFdveQ5ZnDlMSzRkFvI5JWI53zdhHjnr7rm4radH9ewQSW/icV023t4nWoIrPA+L2ImYEGGurrzucZcPgG7JZ2M3Eucjl4xsLSv9A9v5Aw1RPr3YxLK8vn+xzcf/wbG/2Mqh0E4+Surfk0Yd0GDQ6jEMqYO53GEl2CgG6LclvjpsCXp2MSPjJmZGNTMqL8NZwF4ADXc7DsUTHXt81JUs0tA3oaCz87ad7Ds2hlaVxEeI6aPTJXr5uiZUZyAznxbJWjArp9i2neMhP9hObCpBJQpfZwmTmMslaZRt0UDvq8NqKtYLcJLmR86i5qiqyzG6GbAIlwl8WTccQbp/d2C8ieB3vIZbZns5tq7n6OfrnLq6MyG9ErGT1uF0Y7Kn4qT+2McGh3tcPBa2PxJrd19lBHum2NrRcteOUlIeGV3Mr+759LgGo7SlJDZOmgTFy2YWb2I6jv6ZztD1aKxqIMb4hGlxJFsDcEzvdxbV/ptgdfclZ5XtD4rrLCoKfGTDbvbWwGy6h/OxJnWecFn6Fd4k1WPJx8vmc94BGu8uT1H0OxBLCjm0BFGfC8RS8i97lQhA058In0fcisLa6yun0agYznXI8nO66HQzb4znEJEW7ZT4OoN1G+wuOK3QXoOSU6CV8PQ4xlY4BHErX4aXbeu7qQzCm17HPx0O17bYp0CQ0LOrRuX6Q/zY17RHTWt8uWgWrtGoO/qqyBdEX575wv4HPgEIfgTIsl3gNfrhf5tIn3xOS32tQwfQgzT9TxRwJoDWnMXDd5e4mE7dmWLdH2sFzBwHpT1HWhfviPLPkDqNtpop449VjbyiXMuQrsEMbZn+fj1L76Bag3dqCJ/gMlPBqxH5/Jgl7WS1+1GOtMZcMJ7IsLi3z24CFGtxwgUlGgcWmSgHzL6kufMxj1jJJTGIs1TLAhTH5DXGqSsyK/eD3sU08De+eEA9cCg3Ql4wx8a/u+c1Sdoxm8VjQoDcOj5kJa+5/NGmPWdguRSacEj+hCcWFBQUC5atnGo0Aan1rJ9XgJUgzjELYpXVw3HzmFxa/tTxN0JnY9jUn0waeOFKCFT0+31Ztogqls7OsXE2H/LCgmP7yUHJmS0OK9VwTlAbCCvXr5UN58r+J1gsjKvv20TkcjDk8xnDMt6oFBBAPfILZ/cvs0a6ZqE+xLfrlciaDvF+QxcM5JzhzpuO4tUgOu0QQ4ttkKZX1oCiAOwjs+xW9YRgqMgrjR+Kko2BuKtPjNwpEehSG+BMloDglUWCDpVd7UGclSSJc/0moYVPC1VIl8YxGI5mguEGi0sXFNDCuCu4lNgARmwTMJntOosjkKh7gUDtSWP16PckjIK0YjLpNZ3qheSAkTxIX4kip4i+FtVq6xFuzxbm7Nu2GydgGqpyB6Kz8PR4JnKZtADzsKhlX2xOhHcZHObhEBJDjiIIM95QiOk+KidDsRWCaQ2CSza16fOSvuMT86Hx2+Hb/I/FU2rsHzz4G/WBNs1R6jeKzzQ6LmH62fKrwUcQkFnQTJX1kM4IIpsdBg8eYQMIUyZe1LNorq6LmhU7qi7t9UiJ/V5Gp/RrDGS/4uowS4D0gucnU4MV11U8YNl/UsYrEIjCyEQiirZZVKcPcz/ytTCNu6X5B2s602NTCXrmOVc0JYo3R9MY8mONa6Ev3kBDaOcCHvmS6MZCssRGtk+nDuR+QyN0fiK1Fmc/HOLDBfSi/kxzKz6LG6MK4+zcsSDGHUPOVeuMKIEAZ+OFk/T1W74C3gtrvEPISXMNwLTmb3JWE0EWruQMqVOQA0IeWTnNa5wju6SauBw3bTxkldrVeQ3fMS7hqwp8TJM2P5dDZeHt4DbnvpMlV1sMXZb1RxK+edca85Kac8ShBqOgSoCGrHgnP98TiQclfCNfDpo5xCUf82dxIEWplYJUai8W8Op87oJchVafTzGh452dj/C6kVRvyLJ9hSYT3VMxo7F2n/pDNiCsnDA7khebiF7RjxxBxMq4fADLRfyOm92PsVK2kLHzz/5b1vEuyLL/paXkl/AmfeYiALWZMstmjFj3OPdZQ+TYkm+2eSVUBkKFU+/U+THmID7y4rIuF9dELLKbXVpLImJ0WrxqESypfKt77907rdsFiXIh05G/mOUCPlOr1NUWElcEX791db124I3RjiDtTwxgItWb8qjOX70gXfxGOPpmjhTmS5eok/ujY6n7NLRVGzKdCwoKstpuh29aI/6fejJ1Q1nIMtc6jKfWwEVDsF9ZhsYCC/SGPJt/QnBYh3+qc5aA5PbV+wznOrmfpEsf5YM/IxRJ3tjG24ovUKu4A0RiElb67erdOxK8R2SUcYsXSzQpKOs8Gk7vv4vQvBLMsKOE/CLbv9lZvU5ASgRLWfIWptQQ1/P9JZWwxipicI7vrVgg9Rea70N7DiPCtKU0Uzh7E9nr2R+izIB/Dp5LtU/xCR8Btuc/SHxtLaf2uQnZfZdUmjcnM2/L6vKquK31gzSKAoauy5eg5tgcW9PkOur7MXoYQzLKlOC3K2inQh4EwVaK9NyFyNvCiS8wjAZCFvqDtbcFPbZZj1/4kfy8psPOYq4shI07SAHw68DqOcxbzhQF9z5kNI9id9hMMjMPm/xk1LxJgOq71Iiyu6pGn1Yl0pzjFSFTAenkiLaJcn4q8YPp+GMR4vGW5kGvzirHnemRzoPDJOc03QNiLyAZnSMa6H551XMn08eFxOkagCVU58aJHFUuomtBnkekjMe9xhh2GKdSe5NnRht/qjta1B62Bik/RG2FqZrfADUYfC1EtqWKLYsdKElfrlwpEyJ1C0w6XuKdMAxh86URM1fH+A21VuuGSKVmruaC8vUKfjDvU5lygkLYl+vFNBCAZtdZHPV3Dwpsj4VgJTWV4sDJgQgdVgh4mDzcqhh2u9XNSKpH1Wo+sOteI1mBlePxcPWXGUPUUKLu2xahohYvKJ1ErSEGhI379FXlkYGBz29m2IPqPzE8FzHhjnLlxDdEXugKie3VB0zvBy5UDRa5HMT3C+8s7t9bP4KJeKetkO3OREanfoYHhFU96k9Tx22yOkPeMrsakCBcUmlDEyFYlUV4MbHWW7HHQBM0goOy/TL8f14sdu4gADs15lnALIWP+FY1Dt0mRt3zO69XzXHkVt5NWQvgnENbL95RqhcHgaR3y4NB9KBXSxHbOZQCc7oP8l458qYeBNY5BE0y/km5KvmsUR5qSk3UNmZr/lGa0fHu8030vkStDy3UfGH2asQ0wlcNnnXVQreBNZokGbVoG0cvjsKwFiVFodDsKt+DGUcnrCJWaqanksLiguhSX5Uygs7iw+lDX+iXyuw0b8YKH/0IS8hzHYzgkSKbkbAWTEOxTCF4dWYlb96UTWWaUzW+OwsATUFrVPtt4LqFNYX/awFBrtlZ7rQOOF1khnbEFHHsK3ybOk2/9z/5dTZL1Ov0cuWnmq9QwZZmkzaWLUt9bv7KxOJ6gUFqQ/OwhcsPGYyQVbaaGONNQT0ucxqOGJcPL3vAZ+1GKMuZaVoQJJaMSAhLb1iESzFJ2cBlzBpQ8WN7XG2EBnc6ryulLUo9MumIEBjIGEaxDci44DLFDD7CwzyxF4SzJjVT6j24X21yN/QmCs0QZFBQV4wpxS1WsvPpZeBUdPYo4JFR3PULiszqKlMt0nh+zDgMvGt+Sl+JU7+5x/XKjgZLW7WxBe8u8S+HLmxS0nbX86LIO65riIxIadbUfeZA5fhkkpaRXujqHE0i8clBqTO5m24zSdbvrzoJUGd/yb5gfw/SXKdMOzT7e1qxFy9yc2CHSz2B8Bc38IWkd0a2/39uVSdmfPtOR/WrNhpAaZoQMUMWxSe84Qqa+/2yw2Zo5xf4Y0IvmRzyj7Mrq26he3KY6TkzoSkDEJk8jFyw6/RZ6GVHTUWZRCk2CVGFSi9IVE0YpyEb7vLHagVUb7nzsxvR8q+vo/9vFsOY38kP1owqhMQcukYJWF/nGR48q14m7iPPkJzsjqmDWvEeC8xgxrBBp2pzzXpNt1YTWY7z9ZPZ15Gl0yYEkMQtvUJCFo0UrxuhQcRo4YiZ5OBXY472irVzFCyxLxiEpHO3gf+47UOVtTw89RCZx09v4OIittCxL1IzzBZ0n2nGzXjQ1w7BQFZrTltJsyep5nE1Xeba9joQnjv0wY6br8kRXlfD8nJdmaX5IBzayScZ1k4IxUHz0YH+YsEzwUHgpL4YHh7yV7cI790ZITguP9YxLTn4fJzyZSdiLd4u/9jnQ+bs77hmFSPLl60ylTOEBAOUO84cFbRfvdQNIUqB4YthORHaY9RwBbdR/uTV8czwFMw3KKAy46rv38eb4xl8ccCG48Zskgqril98kDtC9X+XctE6Bwl9uPgQvxtYenVux3HFsnmzvQ7ko4QMrsodkk176WivsTEk2VdsQ/sl6tWs5LD61xKfCvj1qR7JLL3aYhWLHSXRBs0cHlERJyEFyxGUkvG3voDC6YnrR14mi4yhYxX60WNc4EP++4kzJxiLnu1Srlb6zNUdGV+13+rBgYX08cT5Bfqp2DyXTETQf0q//O/92easzeIG9t3taluU32TnQ5yYFhAhYBJK823CgLi35Gb1bDcuBXfvCjc0lMT9O3ugf5vGLoTUfHEWjQqpHeTEQrii0ZG3hOnsVz99FXpzbET3OlsVLWzZcyJmUx8VjGdU6UXyInodLx/6dL8Kyc127SISFsm70W8h38ZL6YNwZZf3ahj8pRsQdmKNSftbXT4kajzjkUG+kfBeRoD2MHSGMb7O2cjvp1csL5UsS0WSfSDT2d1MIOjpaxzHZNZOw3bBNEBEd9iXpausyRI5rfdbnMFbPFcwEH57ZdK0g8pfNHGaH4ign7OEGBaTSQ1/iMfzuZ/gNGZBBcjW7CxLI5Xg5J99oTkLRPTG1Su4j205v8ZvCfcEci6ZWRH1aJwcwI7URMZTnuCdQwHaZcQfGGKF1nm4c9MQRyaNASgnFvz5ilKWjpI2DEaNm+mijT3q7ccca1puNZ5HSbrq8frJyRS3P0axuj9/d10Fjc74XG4bkgTfm7RgecvJn0ZmpUfqhWw9pRo2tA1X76iFvJkbUpbK2CjMaiNYzerzMQNgwRlKaOZzT085CKAH6hja44uVdrJQ1jGkgZfm08lpUBSxOdKMwVlUMWMrun9m7JS25YzYeN7IAn5jw8QuPmYS+JnpVQNfy4EJGAR2jCeIW9WVn99o1DgFoRVnhbwzq8+uhcvyc+aaj/mvutVHnfz/46HJr+wuoPfNdlYwBKlqyaTlN4YzCjnk5mFM2KhK4qplig5xvziFBkZbOXiNE12ED8FIYlN15E0AX4dxsxtixDQkKzsJ514UxGvNDIsSZY31xAmEvW7gpaw1w/QB+B6SKgm+RvPgBDipiitRkoM0s/KjHQAGEZxebuNuyzTBcI29dyJeqKwIFAaFodvJ6SR/kh2qBhVlsUeS8zgB1II4Wg06qpEDHBas4XVzOu40dzQvJWs5bfjs16WUUQjfOEwwthKmlKx9tq1UOAtUhdPTL1oVofM5bLM58GSij3nBCYF6VXHOpPLG2nASKz16LTQ0zkDeykeme6KGiYsM3v9HtWsXbGeHSQZfJzx9UkhYLgENm3BBiByMJ8Ly6E+y9SxZcFplrEbOTQEIv/HqzYVeIytX6ISu2IzNDsK6MIWHFGmdfpmfbc6GyO5IidMDiDI1m4EFfWpoC1ag0CIg79qW7Ab6dF4lGWNywCnfGCW6C8dctUPz9PfdreoejlXj/c7v4uV3s8i0PmKDQDpMsC3NgU4IidnfrC+dvPd7NlCva8zJ3ipIWiXXPotVvX50s8KOxcKqFBsTZk1oRZNwlJuCtFjvSz13KezIb8oumVi6rjIhSdJnm7SldbKHDZ6e0iwuQc1Q8TYYqWwfDk4DWiH0jcXPaaC6i9ZizzfVvJCkgogsydgd7I6znqNG9kVr2tFxJo+ikMp+8Vo1RgxpOPnI7qucuzNlJgDUNukUc3Bc0niojRv+5Ri2Kve1ITEjW+pUCIHeTQwyef3XInUpC0d1k4XsRZD1adE+HEGQb8dzHvvz1KErR2MGz5VDcHXmyz0n8VyJkldAol6W5lBt2S0lUilW6kjLsgKOrzpCuQIeozFXsvznxVv676ZlOw5rvOS7CgDtzcwkyfDSQx0YeQ/G20p37i+FST/B5WOqsgJDyh8GhluRtvil6N6/oplcHTa7emFaTcZAL1JmDkeUJM6N5tx7X5LV0CPVWHfJ+ElvGlvsMqw3w8X8Co4W27EyHMKnd2r4tTucZzEdLPKM3zKukBF7cNACu8f1cSADs4gBv+AFOCkmPAV9v3R5jndzwz+xZ6NFfofmw4Pa5738WsIY/jyUYvgoWyk1hsDvPflcW0UIIC+tD0qxCa+F3T07woSR0Ce3g/K7FiQnWp9dL0F/2L9kdTOYDuD7CpSp6bHjXqPeqzBvIa5FkrIeVFRFkqQ8T4itw+4xjzCXr/XPMreN8uDnZtXWl2LXSeICZv7LXwYXSrHtCGoeIVwT1102VZ4EqI31C2W9bX+KVtwcy0KEfe/55itMMlTXMbsJynlf7xBdLgDXUcZrrg6xUTO0zLQ0mHdUhFrIsWY3tfQu7Lgd1wkzq0ts3rkNTXv1GBUYHsG+5YWHZZi3QZ2H0hykj6JbqBMOC59QgBKkLYqC/FSpzS0NdIcxb/OQ/z10hGNYuaLfAGHu7UWcVkugvYsSB5ZtyTkY4w3DvoNW32PUnaTYzapR+Cnw2Fk5OWq/Mhvs//ZbC8I7PWLXFP1HEsDP2XD+46VhhYE/4TQ/xEz/HCGwS6SWZSMN/vULYhIuLvngyTed0bBL7TaPRVskcIlqMpCCpDNR6WL/nruVh+2u8kVlXpHRwMeNBpgEgVfDu8PvWg3fPa3HE/iCpZiok3nB1Zgtg6hEtJSTIVC1z5HWH7SquvK/qF47s163JV9LI9F1x+ZOl/WQOjEFgmAt5i8QAQv5w32x92IcyAfuunu5uL7TQguu5QAzw2ZP7ZutComQmkVwRabYJJrNKESEhGF9oFgoHDZere+VTYryNOT3A60TNGde9Mph9b3+kqHhyswFHnnyPO+i9ezJ8hNWKm1UChNodtxjbl1eS6wWdxi4EGZ5RpZ/2wIvWxeUOtlPIBeJ/3z7nsbPGrTWPfqkRCFh0gy76RzzaAvVhaWGivAzqI5OI/cZJDVkHoVGiy1IR8JJkRGI/FjAtKnGLbNyrdEQRUrRAM7gl3+cxOc8NZs1DwItaOHWi5uawArgCZEl+uB4rjT32CMCPT25/sqC2U3ZMt51AXuwiSLXjKHhwTA0lK75s2rup8EnzlxzRbw2vQ0wyQ9QTu2f2ka2SnPK/6J6ByOKsefTaWKny7DaN7GOM+vW7F9Y5dtLFSkp4Voc7TKc5XD5LSGjmwRIiVE7rBBVbbEr89yo1MQN3onjnV4J69RKJpX+k3B+dwIhYqVN8yziu7fOeg27ZPRmEozGjjFuHdJFQ5EP3N6H7c9qCLu1mqQtaqvd/QQQ/LhGtts27i8EpHheQRVoMTIiamX/kD68GO4w830jicNjRWYvqGgp7sTz9ytVRq2Fu8hGTOwr8hk3XEon9OJDyRqPoygETBG2YF2Wmdj/0Lk1TxrTEGMOH4a2cacJ94hEbWhUOhG+BtsJ2Q4vQBteE1GU1eHtZa45U+7yck3KEF+fTaCPnKBvMpy04TfcI6ZQl2AtFBpQnDtCFvhoQ+TIRNw+Ko74GYRH4zrf2NqaY1+nqTG3/j9gGWsdJ0Y0YNzkIkTyItolb6dZY30QjeqYzQIwRfojgxvLlJHp9IK8uyezudBZCbQOl73iyk5OVJ6fVL/NWYbuXdgUnNRta64SCO+JpflEi0X0OpAd45LEFqpE0cN7VRIs+P9IB9oVIT6ogI4Yp0qaJtkodN9I1QNPv7Ed16YXOSxG0W7wEXo1312T0y0WImWlN8ETasyLB4wVtEtGZN6fgI3YYfZUfgSR7hzKRtnR0QtmmwjdibXp7PfQsmUWdHio6HdLAbCseDmWpCXDDs0UeGNBy+8aBQYZ1z9yEl74gJRVxmll7gSPydWIOM3gRqtwnt5Ff4F9iTs2YJ2r7gJou2fcgN/WOsPpDew9WO7Y8qTvpK8BqgWHQ0ZwXUaqf1oWwJbLkv1HhppoZNWk94aRvjuVjXglI5R39kOW2l5k2HGYHiT5+2DgTkfv20v8GgPun9QvTeFl3S4r8hwWCEeQllaI3IuuK/+ngvG7WSdwd1KI5dKdGDTsVeb0SNPovNcF6j1jApp4S1CUnFoQtzb9MbBELybBs5/zsFeYZPfhUsHuA7bZ681emH6S1iTMkY6wzIAP6XwNCwV9Rel0ZtJuFZyxP+vPcokBkDzKOUqh60OcNAxESpLWHN7PfrHaKDTWPdvIS9xbZGAtrLRcVysTYEKsyKIhgtB93mKg5AXfV2cUpwy8GX02V+Hy5T2+PdmHMBPAwOleNUwtt85w4FJcqDd+ck/6t4b5sunjv9j51zmq1qrwyuXpviFM85f1AvBb3frTCcL4UCSl0/Ajx0qmS2h5TkgMutozet0DM/fNOtMSi4gmtN+xzOqNO+FhaUN2mzPZSEO6gq8PUTCu9O2mtK8AY34r+DHfuoG/Gn5otYJovwz/nGP2DddcvxHeu8nc1RuRowGNml2oeuaktOkQHaz5W9EG/a6TW+lD8NCWpomG9ix4idFPa1hmZ3VMWVGFmmw5n+dwGcfcIJPFlqIe80NSiqV953pkZogBBWXlg+idplwavY5h/GYHZGUNhTljQjTg25gS34JEArdwAeaDEE0pdoK+gK9xiH76NR0NwgXwoMdOI0ZdsU1TxxwSOlqYQwidTL9Int8v/PO29WTkBEowU08R0rQK1rqLOqb4FbM9A25zY/qMka1CVoHQ/swyVoVrafm9oLLVOsJYkMHku6UBxuO/i9xijLqxstLbsxxzXfHrnp6CjlR3AK7wE9OCNcywHKkXO8WL3lz/7xiM/hhGZ4RX8HnjkwahHG0rHaAcweyjw8PxFV8p7T8u0ocuEuOw/7VBjNn/0YncSLU+ObChr9LV7P3WWtItCR8eyZy0T1tW5rinXCVYkGOS9LmAYsr1n43br94SQLa8zyH1B2oIy8sR/l3hP7k1ZMmgy5lFR0ZMs1Lb906MFLnBNNGujDwxcQ30TMcQaaDoxp44LCzNelzv5s40uRUUYoiX6CFiPcJbal0HXQssl8jrq6W3qIVPnro39OMunZDmLNunhLkGECVUOHJLtp2mBZc7VNPIIw7SiDe/W/IKvQufS/8YzKpT+Yz3GqUKMv3nRzuIWAFyK1uhhasheGQDfmYAaMkWHJad7Qm2KmcPyd2pi3+pTQ1TIb+IbK6AGjCSrp5HVX770Fr0edeHC/ZQMOpT6SnaTzdUMOaB24nCABKt73kBtWSbau6C+XATeBlnu3Gwp/kjyw+Q0ybbglLsvmUOFVnfirJntwxbGYuVnYfnv6Wi/b/rSHuyTH0EMt7ECJcT3ytSq95/frgvUPYXwKKq4Gi7lBF6/XEGg8EuqXLsZIdIr/tE5VSUWwZ2rkRNDsumIVAil3gfvGmLdp1oqaO4BeGm7UU/d8JreujBoGzgSydqWkj6mmQZihdXXzO/X3VdFKCXf/KDkwjnhePNnT0hyI2eO8sx7Yvw9aBFg4tyEgCFS7snSoO5THEUNOcCi9UYA0bVP3bo4/s7DG056hUkS2j3DbdUb2fNt5qza1Fte9fqjoeENUYMColRwcA2sG6X2bhq1GweG0HrQyBzEyntieWf5vlupxL8PvMKM1Me8xcYxchkfmzRmLlcA/sMji4UqLpvewq18zyBxh0MP5DR+y960Aw9QmzHmNckgpvpXszmVNUQmf01/GeMaeQYU+MwjDZ4xLQqRFmv2nzA+eUK9EDx54VYAcvexkH2D8bCREVEzmckU8x7XY+Q+fVR+JFRkVh4Nda6mpWSoFbkyvU/V4Cxw3XdCs+/xD9rQLzk+/0tSpRCBa8l+M8OIC0tbPV7RKyoLvZO7ja66qfZ2T4/P+hGc3Acj18x4EI2KZEQmK9djfpDdEYTw9aG65oO+yExpWfFIemTJchVFLQhjtvCMhGM4csyNg6owIcnXShWA2m4G5SZ7RKanKfSEoUe98M87KJ4lH6ebr9VXvtprz+iSKdg8b8hOr/0W0SeVyX2bhpk/gjzxqi9CcU2w2DHJugovAobW5pEnwdvboGmyTJKz9YAxwXX4kYg02PFJaNYyzKDcJ+YwBGc+2jn5ppKHVsyJUzGLBnqZvrkfCX2yCNjvkzuY2ewKQrPFP1yQ+yTl8820CIGMX8Zx0EbwK6nva7ihE6kJVxGyHlbcjQ87s1LSiEvSgDe9jwXc5P7jfkKw0Ri9FyKisfeY4LowT2M0toRqCtvrpKPhcG6CPTNl26zXm8Mfls6xY8ZlmW6qB8ejZrKkOTE1SfK1U0o8f6UgDN4IyUjMv13eZhvR3fXbHb7v6eAN2FE/rZNT4AJPfLx3cRT+P+JlhgDTJp5gAQBshaVdegWT8f2LZT+7YOZW9eRflUdEjBVProDuq2BqdMpE0iK7/jAi1p+gGD5SsRxkyDEygRZgWZVnfINGSiz5ihC2/zK9KPIb1algOltgTIhB/il41uVhLB0Bt/p07tSHL5MFL0QtXp/BO7bW2eqsrF0JRjpZpBgruDEZKhVjf5oxkrnEqfrkLZxmm0EmUgnAqgXvIATTA9beHRpfgEi3I2pFi+hWO1eCaCqwNQb4JIXWun84xTbtvAWRRTDl79y9EQJEbZga9mwUvDX26p7MbAv1AultDFkhnEKlr3CJGtMCvWdDufyigIvkRg7BM0G+KKEwyQVAXV0GgjhVklfcnHqIAytjJSfz9VaXvXUdAxFpCcpj+Yla0QAhlAUMgKFWmKLFmPKrjiem6n789RtIglbLVNihlxr4S3kolXD1NlA+TBWHPQc/0UggHtYKcZJpFzFeorkNJ8OCw8tDEtUH3ReYUK0J8eeOvXt5GJBLVP6Uj/712zcnTWUXoQpmMoSq4uDiiHVUO5m58HKB7NTPPMplPlLA7BDczh4dvX2zu+4JKKdAyPDa9IIe/F//oPfX7Yrj1RcU3UOpqq09lgXnTH5019cwAafohepROUf1FIfIVRQ/ZvFAt1QJPCVj/Ih3a7l79LvsOtVOuCqnYn/OGkEbpKGN79iETm97PbdgYhedV385XYNXVExg7Ymt+e8O9UffT2BSLKRuZZV2LKbG7BPeA51x7JoosxOXYn8Dk/0j4/Cft+DXIMcNzmdEaQOebY2uGNP+FH6MGjsIyU9xtXnVvfbtSgRsES1vezkBEkv+McxnJRMUL9TWBkZ78xtXv9nZPk5CBoG0QY9y0AU42vkCiRzGVq20JoCLoyR9g0HkD9R3MZ8s6YvQ0o/U69440Sz/fl/SxJctgUC8rS8UEkcPqmkhp4mPg48rcQdBbTA7OJyHaeYvZvqh91T/oNT3AjiCturzJ+IXNDgf1lm24tNgVSwbhyD7Jq1MPZZKkD4Xw5rp/1eA6fGztp0ag86wevY+Wbqgc5WD92FrcbvZIspoNvZl4bExsRAHUTasKFCw1JO6qWAFFYONxGehUezxsjDR7FkQ5NHmpgbNfSOgqbY8vCdLMbDwij6UfbdmhtqIyAbR2SPDDG0UdKjIXNuHfo6EUvzxDE6xr8P8unBN08Egd47rNUgNvvSQMFer24gsTO9t3YLx5gXorgq34HL1BOkRDeK1JTOQUondGCWtQ/AFZY3KIRDzBZjuimH0vBWpkxhfIqQuFBX4mbn38CG3rvIOrBp9am7YiOGt5IWe6Rlyboy1JoBOAWwtRJqj+Udx/qZvBTSz5UJ5s9i/2ikW776H1dwGQK03oPsEZo3byuU+QycSdhsT+L/+QCYHrWHhJd11+UKh4g/FY+betfdnb/VO9e3mfcf0QdPP4EGHggnNL1RXk7lfZxzpHlIrBrt1s7CGTL++UlBcDSEI5llhodaXRScTXg/OGppJG8gRPhXdLGoRaq/PN07J1eVZNx3yVLal5uXV+IrgVUUxAeIqVr/roGu+VM30bBZMPP3cymhOmIihGao4BXz8KJW5764TV/YRY/X8HVsnBX+w9Z/qKXCFxwQtZ2i0PY0GGmA0qBKiRPeE5vkDBe7V5wtjB3Bk54Lyx3E/ss7Ugq1m25rphOv9rUISpYVXZ2Q9ceThJqjaeLSRwhlIimZBh0XUHSP3TZMxqMeGzZesX43EeewOCwXDBCE+LNTxxizAzyF9B5+OuLzKKc9981nQLogvs02w4EhUgZdIRzs+d3W/i37lj1XH/gB8UyalHhKIH0JBWiE+gtkU+G8IMir5l16QfS8+0tr/Yq4y9TSlZQOrs8JfnXJR5BZlMidMXf/K1wrN/knZzUvhleEn7Hnf6VNRO/+Dxv7Tg9CmCB21hoMdtzlP1V0Ok3LeQhzTdzZPxTUrchgPRUoea2xVSxhUHPPoe0Whhl0+hepzZUPKAIq5Bkp0VkC6SqfxZHHbzyt/7NSgus9vf6wWtwE/Vh+kilcunSI/NKb/i+qOOYCpTd5IyOocToGii60bBPdDPMW/uw1jkUAlriJYAHgQZg75HxV7SHdwcV9Xfn0SbYTLAcT7o1V3XYRzmjg0bszDUS9Mwnl4CnAscNKQ3YTchuE/QLEtPjeF0G49yUyEsckXUknljYKxslqRjukRIDsfbACXtLpjUJPhILJpZ9TCsJmJ0ATYfJ8B35jPDLPmn3lszhhKUKdyzeW3XnHShFMVEuULbY0VVbXHmIQl+S8TolUgB1rWrTi2LKYHDLxy5MwA66oHlncK+4PS6JlOsAYM3vof3UiQtcOTubBNPAX2Hy6ZmkYezxgYaGdT+hAwgEVMAHh3qAhXNM+IXaaxmc+7kV7ZlVq7je2+wrSTUSvfJ1MjUGfoTkqPWI/fKz10V7A8fz4Bcnf4CM7wWq7yeakAbijMYA9E4epd7em8kO2vXEvmKGoZERcvMyyZ5EGtz9kxwGipv+NxxJOjmHSXO4V5F8txVul+J7LDaiHRd461+KXXfd0pvbaebhyrZibdhALjJpNsMDXWDYzFN07b8vocM4u92Gckljk/Nkg1iIqvY2CaIJt87tuOE37tXEMlnswlP8/cyWZckZn6JTDFFaOwh6Fp2v6S0/kvqJqRaERgPTC3nZXDgyjEW88ftaHFaaGYOLuQ5LKsX295KIw38+997W2Fa0Y0vmHtAIIR4yfmqqPgC8KgUtonza6w/O8zbQGosNMkQyLo86f22TmXV2Yu9LvmLpCQWDZ/dKDLhOsMg+RvNFVEo3SuzFmHl5aB1NYS8gET38tI3d+WEOWPjL6losydmYHPU7t34RvSsP2cADe4P78FXnhstBKjVLA5zHTSugego1nuheQKpICWTA0HDAu8N5yMa2B565SgNlA8s4bF8Em90g4fr29N5Bc1RDB2j+fvc80e/BLH2EfQapLYhltSmLqIbILKihzuctXboPCNVQ1Z1UaCsONntdQil0EEMdtq6l2UWaPDJ/nTo1vDr/1JL14Z6I4tLaJH7TkmiuQ0kR92RiqrtGaL7ZLOfcReQi0aI+pxGymIokcF30/u06D2zfxSoGi29+fpxBqUXA95vT19D/8MLRm7tb1iTJNRLUY3mvH82/x6B8i776bYtAx1csOZO1MXhsCYD29iw/R9d6pDUFgr64SZDguVBBnIhksj/EFDXuM2+pHeHLGo6oxoTkCUkH5cM6y/ktEu/0EcPiqAZu9cA0H+w0cmzMCtNzKqYThr689nPEfJM6BcshqKCRNzexqQ3Hy7IdrEUcmGTNljTVR4ubTWhDzPsh84XthKvdhre2oYzhmGsiha0Sa5x9XEv3hMZpx7rgRMSB4N2l5A27CM3YPaABMHivf7HiEqDdqRlE4WNFmzRNsXmroiCDYD9Mosfxkcn08WX5KzYtAY3MjLinp5/6SWggA/VnpZyNaMJI5rqzF7AjY6A+6I8ks0uChrax7VzXhuRuTkTQZB5qpkql0cJl7sZmJvPhDA3/RYGNHnCzimwrTeHD1BYQW8lr1G0Le2uCv8ePr8zGiYJYeOF0DwdItOBnuupBc9PpMSjg9hKi/0E/b5jeAG9KZZ5vnC7G7uEw07BA8VbVvC4NuTE+1ZDlfQyXJKNiUpinwYzlzeGYrFWvVrh4GQKdAglA3+fQnmCcotMph3fgYxt0/xasuGHz5tE5jMp3UH7X0xwcPgA1VB6tvV+bRgkEZxrGS2Gu9C8AcEIQUzzBe9aCPV8FG4oW3m9y154C5lPCiBRmKln7/a5Br2ZouWDjf5g1J1AygOVoQvhF2tZnUFBlYba20PPHl+ziH8URKKbQs2CriS1A9rw7Qfb2btNrUqCQ8/K65244n8bbRG6ANSPJJV44NdMx1q7z8hK6l3Vs+YjMmPyes45idF1bj1r3cW79OlGuTt4LZw6Iq3VE6gAAAABq+Ay+kIGjMwAB6ukBmrkCCWd/wrHEZ/sCAAAAAARZWg==' WHERE catalog = 'OL 5670' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4GCYRU5dAEABDna4ncpk8qT2P4HPGHDQfw78KKkvEs8nEfB5h4XX/sTOqrh/HiewYYXS9MxvpY5OjVJc7G0EQ9by1DeBlxMWN/7bLquJDCv3ekV1Pr72nJrCSC6PzcVPCmiLsPMfhtiGRbAUWzkJu2W0/2waETDCcstcnjOWvU5XTQyRqajz7cQTQd3lFD03cJ+LRuVNtNw4lOsQXW5/JrOYK1udJ260yYpNpqF88gSraI++we98J0cCUaJCBfZ012loQhScjFm9MKlzf/ZmJtZRiinB8ppVIZAVZMu3Pskv+pFX1Xm+s+N4WU5WoH9IouSWnu+192AoyZZs83j3ZJT2A3MGpUy8eMF60Ob8UlrNfZG9DlVQ3CXzaGV4YT9fuLNCGdFKsjg1R9wLjqBI/X6mltgJaiHLqeOwAtlP6ITSIHH7v24IEiu9pNFJgvF/Us7JdBd48nKMwtRkBQKDTAb8xUSzgTH/cvsVasQDVVmoCBegWHVxiGG3RJN/nmEwGNszs6v0kETWqWaPyQ0y9+hvGNBKllauiJiX3RmnY0LArX3ZT8NLNoSHtsHqMkaFo0aQ3l9StMyQ6Zg0Gv8ZuCx33wm1CjkZjXJjCn4pUCF/L6HjxyYbl+xkaMN65TKfF6ndTPlIKiVj8VOQmL0ZXR/7k5j7l6IPRi/fUK6VlpwF9IyMzA787rf6zgK+EXTvYWGMEGl6egiZ+HoVW/JbLP/t7DfjqVNTlG2yCwt4HV7H3DC1DNoZi2CoiXqgeB+ca5EQ8rwSzBRaO1XxthTJ7DYm+tZ7lJWLffqS404AE1yz9o9VWN969Y8Xr/W4p+GHKAhy/gXuvqmrgWBVU2IvKPRr5DQt/evmkxNrCJBiZSDDiPLCKDxoktr7QQqyE96BlR5MJ6/UAdzr4VrRgWdQk7SsRwqBbOATi3sBqA8Lo74yj5OG7k9Zw8BIdW9XDhYMJUP4emOaNOsaFEAI8JaahTjJ5vJcR7zCgk24fsX+MyOpnKj0D7kHXJNvUseUEaTvqNB3e7cOxH9tLvpKTkdHT3yntROL+7sIkML0Ixeoi/bAlk787FnHNQbRP4AqmntjsH+1TT591qGW3b3PKWOrieVeSxT5PlUyX9qacd6FZokgWC+7Irvm35Cg1V99dZvFRgt08kogXA+aWhi4ZkddcKCUx75OmrcOe13aJiRzWdgoi+nWlmk3dLIO8IdSrUJSjTlekaxt/fONwyg+Nv5AJ7wAl8Xlz+llSrF51si1TxNAmkqmDtVEzfnQOHsIAqVj5RFvEaHYhwAncoUM4hOfefzKQ/BvW6ZNxY3Soocu9SWihiVXOUQNlok29S5eIq/Agz/FIpEkHdCNj0+VNukmaCVwCvaLVSmO/H21jMUTagjIhALXAG3SI/RvYKjHfqlu08wVh+uGjgZoh4uQUCree2JYMbc8WeUDJ0aBSUriG6Dru1oE5aek3KQXutJiemqNGI3/3Rg/EPwUNghSTHTkirXUw2N/p1Xp7dypU4Uj/Cn4XxP+G3DfjsZSD/tPhCR0uD6OqFvT/rvDnuXOTX3fH9kW/9lBByi6OzWaC3eGlGRRdMOJOlHop7ykm5wQ3pAVtkNHFtWydHKaGzhqdzyq2MLBIDhPxagor1iDDSBGBXEsguOKcroPjnIOXzmz2TcIW72XC0h5vl0wVq0hc/lGK8RxaspXyzrTNc4e8SZrMen+DbPp5XZLwoZIN2asLsd1X4tw1sniQV6dhPO3BoOkNs57pfyk8neb/5CeBH970iOCDL5vRBR5bOzf6IKOcmDGzblCKERzDTd7CD2EVgUxmCiyfdh6Zegx5cDtA52BQVH0CYY6Yfd6/GCdBRbS10AFQnTK4HBGiI/6URBdjFIsEp7RUaJ614lgVOf2y3gs/AUrG1OV07jL2BS97iizYWo+ZDjzMPkQgF+Wa80EmWMjtBTYkncuqwprN+7cowGTOuIwfGTTWt4N29Isbb8k1TZarFF0DGdlfTrreQMCbnis1dPpxi9l4lLnOpeWm8pub0lelZr3mE9vZymVjcx/DF5KHojvSz9OPexO4qeNf2lfmT5MAyQyFNLV/uJyD/3Q9qXJmJHcI4tHQhDtRr21qpLgY3UvwD9cEDqeY2upjkpVhEC5islQxhiJA6MskasgOPYjKJRXVI2UrTg9jriXtIJHyMt5EnYirf9hqt+IsdT0J0VE0VuFijqo7UTNbnukHqIMWc4zxxaUJqR1+2qXH74HQ/ecob3D5NfGe4QMxMY+IRQDUq5+as/kQ6XoY9ENqRTFKSdU+0fBDrkTOXCzbB69kDBQrKUgp2oPVAjslDM763r+NShzAcmzGKcl0QzG7ufQWp0p8wj97ocwTI8FpprBv4PPDO2XocUR6oLgcUiJ9xiBB4Ge7rLyTMZ8/l2HX3P/6FhbRAcEOELQqCLDd0rS8g00Lzis+yCHHlifWVwqBs85+uO8ufrr85+NQ5+VEPem0by4IgK3OYxhWHraz7zbcg0V/XaDvuOo386AShft17oa1qivS2ZnX2fPf9i1IVlEIoZLScFoqymNPrX8GFAeDJ/s4Y0NGvF+L4k3rEP4t6BVufwnzmAuu3ggNoWDnGLAxXdm5Vm35Ndo/fh2dkbbl51z+V/25gpeiL+LAYNyPMMNPoetU7x1b0wSjVBS954S3IHCg1iMTyEwbXyFK4GiEwFQc9moSYH7F0kJRhFC3t2cZNTXdatNjQRih6hcsqMLZd7YpsMoEqCJhYinc0KMWDdMeE3OTpiNKDgfAne+4ktGT1oNb3Cl0iB9qfwEzfRT1SByIEAf5s/X/zvDxC5UQ0fdZlR9qvldMnfPUIoCy1AM9Yo3zBQIiXhZMt1VX0ZhiZjRI1HQwHfLVuT3rT1Haz54nHdj3Mwz+qMGlL/fnUjao3tX5kQqeA8tZB8VkEiA4P2zgF9ADzyZoQMue1917ErKN/qCkugZsVVYaAtcUUT8oY3E7H61Nv8ooDqarjHksmfaLS9vqKk88OCIzfofgN3MY8lQTZACNZHYEuopSahiKwTMfBE6ROI8qC1tUJf6PtyeBDdWJNeSdmu0Q18GJcYwbeOD/6wpTeKohI9/+3phi7brTshejv9TxSHZhg1HqjHetIYJjGQeBSqfpqYTGzILopcyDHSkGHySYgmFnVHiMF8P4OQwN+0IQU3fFfQjhduo3lBQBMI1YpKCGE+CN6HxcSDr3GZaw0xKthNgJa7oatNwdKbQ+KNKPd6HMAOayggXDMa59lndiFn5vcMURGrIpQIOcKHclzisUOHGzhbI6Hk6SH1vu8NjGLAqhR61rCOZDBUICLwrZn76hXzlXL40rduHCjuwygic2hSWSv/LAwmJxgJO/i2cM8ikTXMTU0aIaiH3CJvXOWhHCVCilF9lAY012HBvXppEOKt4rM+XJIe4Wt9FJdsM3Io6XEHPDg4QooW3xc/pLvhZ1yZk5ojQOAoKyxIu5kPby/2gL9KKapOawKfK1CKZREoyLFBxqCCjKp/nzOCg3savfgKNdAAMqfGLJECDKU92c+b1zXGQQHxQ42nOe09lVwh8Vyt3l+NKKzeWT/9x0FX97ZFX//4bj0S6Fi7kp8Ub87uiQm4Kf7nV2GH1Yy6ouGLtKXJOcu71uikGyRBJJ48OmdwyvHtzQrQpVhwVzPftoxZia1oTqp9qGK+DRqpKgqX23LSK2gyYK2+VyGmBeCWLvx/HLTBvXxZMCDzaFKbcRfBRqAdJWuibLfULvK6e8MuW35cDJQXsde6PUhs6clfftwLIHPpYmWWtEtMdeMuIwH8MOlMG8rmdgKHbNYi1RDL9qdkfUzIAq4gH0+1ofp0MaKSkJ9VKi+Axoo109GRK60m19mq3gQIoHgDyoWpjKp/U5HFJgRLJliTfOfb6oG0fQy4bmIrNkcuvJqXMxR/gPg2p1+HdqsuHDY7GV525xuN3lSMCHeeYxGqATYHkto+gop4uXacpHFQjOt9PjdzFvYe9ZjLr/LTQmeR/kFXw2JfNKKnlz7R23Vf85X1m9fGI8i4k8vusDZZJfK5bWcsKKj3p7adMXzdzhaUv/mbnaoU5tjucvUygcTUM/9/zeyzy87emgJypcVzPbxb/F6NutLsQiRPq8Ei5xiLs/bcEOIgIy1beAvIVrD/kUcg+wHC9SEyFKqfMr/GubbZEWcBYPcb74slzcQrgUFy9ezW1s6rie6BGyEyKRgnsuqh92AvUJdWVU2BtTGHuPizTI0mIE+Ef4428FFqlY38VdARaNWFBtNzasvkvOG3U0ZwYVrsQ80SwPRjQCubtZceCsLgMhYs4cBLGOGRe/qINzoy+Ycjitub+TK/kBnmgUvcO4RjgFnnxqdSRpWCJR6aoEvuWsjkNYFIzKMWm9XJB4xJtldkPz+pz46K1sDfGRWJBUQ5FPq+lXqcQzSTeSIxsETmzgKLXabPDrbFAy6xFadSFWlvMhNK4DfIrh9Fke8otJzMaXejjYbSogJYep24i9feqHtmrNfsqngYHfRGMoVuN/lB6Q/am1sqi8FSFGzjqPXu2sJV24FLhvjr5mnenDXo+oZEONQC90q8tB3o93ysohWJ1kSVrf56CqiNCj+j1YUiP4szvB/aUck8d4A5sfPMPYCNlt0lG/9IkBLsi1FSF8T70TE2FDMVIkav3vxjtOY8laHB/QBaeZZKY/20p4I3Y2TwuvAxWoAm5GlFq0MhX57mbQpYM5zpo2H+lsUrZ0XIuWIFfMXIHtit/n92Zy7ZRt/bWoLthQ0mIludBr2JXkmuLJrOxwF+HsvAUCvp172eGuhlcmsAloJ+KCWdFnoRoIeNj7ew/GyN1dnrCGngurTLeo99g+yKFwu3t7r4vSpHmnP7HqGrkMDADqBk7XedWaSMbPwIPlkHH6FB7Odx73yhuqQk7npBKXjgxrt2DsCbUln2BJmPgvmmyx2DTVuSf6mJUzaexU7lOFlqtr26YJFeQOth1mUryvN62SvbEz7JfpmFkAABWE13VNO06HxgE4x6ccC990kfTIenHDBgLGNsiYV/QE+L8fuydRDlmszHsz4+mlO46BbvLHUqkWF3tfDw9oKqwqrkNNVxXTFhKTbL9mIF8eDrMlJkdAEoWIrHlSYcWlu/HOrzlZY8vmI/k2LFMWzHtscy0VF5iG6XwMeKTaDvfh4ZvQE63HGeX6s4lNndNCx2p46+9EV2PoTAaCzH/5+7H6icqBPZ1qDFTdujaJQkUYNOM/YbeSAxVIVEtqPkYPc4kNqs52JCa5dEJcO2dsEndKwjrqfIoxU8mAC5iWLTmoU5esaN+ROg7kbKJnRz1zKpWfacQMueKnuVjCF4VcznYsFkVFxpnd26MKX3RmcAJ/GsiIE+0Pu6fR20N+Sf2hSr9xyPsRBzNlDov2qD0y8DaDaOuX3tHZMxckSn0aCNvAdrzqozXmRHumuGnPpk0CcQMv8PEq+lDOaHAKy8My12t5A38ktOBxladi67cj0RTAPmrOHzgebmSSwSRKW622YYsg1rwE24XwnaV7kQRNyck0PYc3+IrH+x+qRx3iVw7bN9Jt023oT+qTU17fT8fZWYU6+tb4PXz8LkfpxCUtoaKQ8g3EcXMn+hPnUYgcoHL76qT5PMjay9aCANOR+ij7UPGmfgipEUUYgNFMfZgC327xNxNHjOpM8YzhHXin2HxtCFj8XqMeQG0eD/7tXXcPq+JJciYRMT4KlxoAtL5J6GwOhe5GZ8M4fKaWhyxkcLzVoV9X3JrgH0Eg+TLxgiViOhA4CtJ+xtfF1B5WrXFZ71DPeMjNhy/WkHNbL5C1Xj8gdBNP34RXPUd+8zowrJ0ngl7XZPtDXxrql147E9nhRiH23KM29C+T5h65mZe3xhkBHjvho6G+2LfDU0wZmrdNIfyEn3U/x3IVSfksABy/szokVA2KMnlieIssvR+QIpb4AEduj1M5gSjZ7qy7ZEx/mZccZimU6ecjkRrv4CxrXahJFheyO6KJdGcXSXHz7ZIK9dGtukT3faUvtlK0RDXzr2L2qSVe2d6Omuu5na/5spxEKed09v7PQjo7Jey3uSbM5RSGGVEEuU1IQqH5RXanPOETZQQ2S/Qj2TpEw05oyGOcyda6NIohVwxHwftDUgpb7QmqtXid1T25CNmblX97fBVJcdOgCPyopVLQ0csAWk3a+KvTy5gNzu+ZiiR16iR1HVbUw4lohKe8Gh6p8u29iWO13ASjHNblv633N6u8BNHN6F7sXFzJDsSPwNK87oO5qZbPtM4AU9SNYd/+FftNsWSxnIca7hsGJ7YRhfKI9HYQI7yPqHngkCRmB3f/JYz21kaK9e/qeN9l2qjgj2tMZ2hIR/hwuYX/c5P6FdisocsIq8LDshmDIFvqjApiPySzfNorNFDNTwjITT+dRyaydhr1B/8zBorZcADt6lnp2Z5CE0HMQnZea5iBJme5dkr3fbwRNclC9jksOYsDxjBkh2tnVGoh2j05j879XljgMcWpnRkZvVwGiVeBHTYTvScNU/fckD0ZylK5rBwafrrKsKcNUdE2u3dJgRU62qgE4caHm8YIRSn3+MUoQfVcZFGOwAoPywaLJS7WiZgHf3xey2Xf39gKIoNXEcb9GWroOCXrxL6cJiJYbeqTih5RA1topYW6AzsRak9HFLM84mC+AmurfMxlqb5yfyQnznHtBy8/aIpMP46bvex9SuqbieaXHCwGGcPw1vraRY3zwBA0ua9ptctjneSDJawhhxUAkM9CzGfbfxOo8DKGgO7Q03PUvUi3mQelfA3+E6g93XXrhllkC4V4yCRTOI0p/1/mYpjh/YDZG4/M9bb+gki8q9PwOx5p7ZudoSIGs8iKnjGaum4WgFG7rbKjOaZrWklQb569WbY2FLUiYWqo8rrimKwpIqpQ9OkprOXh2CBmMdo6EZsHkMwetJPjFuOgazepdAURbIc4ms91q83hXq3ug1c5lI0XEqFCAjskyL1iF4AibKiYuWXuIZhaxRYac7Wy6TfPzt1CKbz4MP3SkDmbdkkMgMJBo4QTgGl4IpnQxhgHuFxcmWPhXMbfaDHEbkWS8yWnqTwe9Q01DwSuq5eo8F7lj6wfpA3A9/viQ2tE38+06UNVfhYgv54ml7iYTw/xWiSAY93MfqKGlQaNrGl4tpJ1B4uU6Fdjy15OOjqYu1YG3aTfJBQr40hSav2a+zL2KKVAi+Xs9dJ5MtHI9lj3MGIp6w+M2st8MPYPoIVo7DswsRSgu37+OHFhYjcsbZlMPmvMxqjprixBk8Trzv6Jvg3lMJAhwnPCVxHxDruyw+Q3g1chTKlmJG9k/SzE8s5ZJxxUOivKPWVTqfmScAl+6UfNnEgwEc/1AFBEWavQkvRlt55rWZn6uJwmINbEDEQz3K/GqHKmPiMtbtlY5v6GZM2P/fYcC5ouBV74AOgVS8uJgzj7cBlcC6j4FifaI+BLLp9W8JVCtW9C/CVcNeQFXGkB2M+Aq+nWegFELzaLMFx3tqg7fiyQ63w6Fit9dBO6DDVXWAvt9P69CVGa+6alU7eHm+8uizyw8N1FnN4OYJBYEUTKNEjpwzeRnD0+iy4lPsvYEaTA/pVMG2ydviDWPQt8jbwb6L7jRy6E309LgA5bb6slKD+wpmZSrnUqfOplyqFPtEy/AsuSkecxXYY00+twLyoOdpeCESBjDZ9AVfZfdAMTfqFm05WTVJfULffwUtAfQWsotDF2kI3NW4AdLHlwR+OnQ3U2ce3nCYwzZl3nJ/32gP7285dKJ+bOMpAGFjDvd5onePYMDyv9ICNgxAJCA8J1HGhRsDe+sYthIO/uFOm09BKZ6oUpRx4bkPj35LExbTnqiBTFEI+C+H4m/3IpXgaNIoX121/NtwMw0HdR8LfWO2u97vR3aKLIQJ+SmlpIdlqgfQ7A/NcthgspmwlsXWbJyjXpxS0f7CPaog7XshJjjkS3zBV/Y3/X2NvgKKa7CQx7KGQ7NPTYiDm4Z+fiSwzzx12fcIcBL/LxLKRpeI5AFEruOPhO5ymaT56I2KfJUN3iHXZJWKdOLv3VWlhDY4ftJtOtfxOLrCoUWG4/SjVk6m4lqCaf8vKc5D7pvNQD2lCUUvvz1KUufTJQc/mt/GdJOHOvdOjTab+/5xDky1g0687eZ4zNzEI0UnqauGtIDKTgXqTUR/qWfjSYbfKCYEiSxIMW6+CQcaj2/48tJKf1Su3v60xS/DBPT9Ekj6iGZMc6PFtDXaugT2KkZ18JlRVmhSwsDrPiiVbTy0s+GNwQnlkI+ZQUtOGwUgn+JsILCSf5TjlOTvKlURWK+BzJD7+izd2S8xUFVmP3LhKUVXyjc4x4kWULzT0oCl2v/AP7F1kGqCrq4n+VPEwoa8ENi+MwCjBAiOBb0cIfCo6+L8FoUzHBFtNwMNKYeqtnsVltfwpqX6TkaXZmecjvZoO41S9i/zCWWugC9N3ve604lJgI+r7Q5f/1yLgACa1ot4zwdWCG5SKD7WhKMN/qqq1CplkgiSylLP1ZA3eDpVizrBhoIs6+DrW+Zhhzb2fxo3QTkNHdmDcK0ygJjn129E1gXgQC8eIs00x3hG3eVxS2uDH1p6Ag2ZvUN3H6Jlc1NBPfGe/FUknUdPBmcK0Tbo3sgo+Gz3coMxYDh/7WvKYQIekHAs6iA4d56xxAmo3eSKEL9PwBx4aAdr4+Bv0KsddWE3KLNmTMg4dvznU0kqjXaQIsGOMc/M9G/zKyDM6fna8joVQMKz70F3E3cKDmGeKC/sbO4dKymJrZu4fimLpdv7UjDsy/ryLsw3XrrJ2j5GYAkNoZmU+9DLkD3Fw9hbGr/C1CHZIzZL501I0oMCyLbNFQzjAr7TK4ejdh7dEHnBT0cQtP4AkrgdGN56wwrhaV48J1Ji5yCP15jRWV+vkJplyLTPmE5hH6TtCKhF2xcFU7thAQmCItijwH0MiFDKQhvydqSt5c2FcTgNOp4rgSaS8Q5IEIcFX6F+9O5C8AYYWtu0koKSLd4BfUIgX3mLTbz8K0PfdykML/mJyjVSw7CuhXxNIha6SXI6yJcOkaIoe7+b36M3GtUyhV+tsVJyFDZn8hcUDwaCWo0EI/hvFn6Hx8okyfLs/h9WwOLt6qEIvfb8PXy95vKGD4OS52aaGnUTmzrsMV45pAiVrldckykVTwxEYFYFa8Aws8H2+4k89BjK9+ueoOM79j9RfTxBu76ZznkS8o+cG/mdF2vfeVjYT1Q49trYtaM6c7tG9B6e5m3afESe/vfl2MKycyBQbXA4IX7z9eCgiohGK9C4g6UOn0Jd8th3jIiMHQfgPk5gGILojG7CAeGvw75sJc3lTUNTF5KZ7f0+eY4L9ZnfSJV17a8uDU9nIKfJijn+sZS0ZIFgatMiGCs2dpnblnfmDerA7vgY8mq3ETuaoq47ky4rrZuTUREC7oamb8b1b4Y2H1dwddZybRss41L3V5G7BxF1rRCQczkWpWwNPirEZU/SzqQFLKcWkBVyH+5fwlxLjFnhlTEhfWiBulLmk0o9AV34HBfAmz3FpNZ4bG80Vr8RF8UDXoexwgbmCUQJm7Mv+rK0vAR6WWc6Hs20MY3Y5WSg9nBmb380YBi7ZU+eH+LVSDpHGy15ryIICMAD0A40vj2sgIyEwMx3F2YcvD03RMEO4wHrbEnLzx27NHheMEha4bbW8J36yffxgNnt70ayqPjpxWdcmCvDBJmwOvwX952LqwKdzfKC6DpILpaE0sgbYZMml1WzAsmUDodUF/YADmOLfythMPxfhxOhXGm3Bf+DhCUTQbSXuk8/ZmxxB1aCaCPaUEknmVzqbnTTdlI48Mq2i6AU70ms1wlJlwrJ2b7t+gL3NZ4uSRCK2KlVcE2r/lCIgMwNVnRZOq3JNZrol5mDLFarZkiXxWuHdrRaKpynOzGZnT0sf5MvMxMH0d16K3Sh0Nk40Ynp29Nwzw3UPplJlPtgeIYUeSnDnenw7fGXHJ2v0Eu1w/7C0Z0UJwgw/hNaJg5VBz0wrRaTnZDw18ZnV2MglAxjKJAbhKIH79HTuwlljmhIC60X+9z9lnIRNAW1CYTKYnMUS8OssN3QikgB06hNCtEsi5Yi2ouKiUUMuwtOKMg7F4Qg2ZnDsaffjaa7c9r/Ij3F8jSIRQIE2IujeEasTmRfod/3EVwwWKehekhMuFVw0FZ18ipnWn2LI6HR1vtCxrGqgoR6Ij8POlli2uYy8k3nUCmC/PvxjmcF7e/ZJt6JCFlQLgHEfEk7OPMdlIZdkbnQ9wcsBce/hJKiDgfAJMANdSTPJy7tRu2MErceZFX6zB+82udDewD9y+PDXAbu3Z8PtlSpAd3sDQhNPkBZrzkZ90NGJEnQLN/CfwbZN7P7jtiqbfZKyUWpLeqFx6ECQFFBnpqkxEGU1MfNQuR385A7bXm0xgnIBQBm/CO3zVeuL3FT4kdOrV9kgEi0zt05nKWI/Nbzcoa6G9yhcRagWSSE1gB8SePxC7auJewKzXJQIvnDR7LcdToSah2E+oc6F29ZPF+FEMzbsozNzHhN5LTkwwyEqCx6abGuRdF7b34jnGAefNrtn+dQBgBPVOMEk3yPbPBGzLXPnpab2RxjAumFs4UHhzX9ey3mZOYcxfqWfyM+N04INQBHrFG3dBvb6XN/DhYNNkzyaIFvhKzxRHFAwlFL2cI6Ye39ohkcVtNL7Is0SRvxJCL67HtbJ5BtexnsLRzOP8v0rNNJEpTW8EdCtCT1cvrc7XyPpPdPqhcTqjE7+bnL14WPGY+g1I4+5dkyPY6mfd7lNclVo8YLN/eUqdg0WlO4GRH3nYzXKMPEooQsMXq1xXrjZDCquqXo3H+zfbVpqccyCcM16dhaZC0BH8jrJCW8dKyVidGUqQ+XpkcTC3FTDn2OivK2Ej4YGdOU3xsC98NJBnw88b/Ou3brb+r9pzMtZanF6wQUeu6sbjJlc+IH8yuPfvTddtoD1L40qRLX9LwVSaATrdDGfIT46WHiw55jAVtk8A9C8i/8Rd2a6Qh97wB1emetOGky9Z9R+ZJv1M8SI40Pq/H7t/QMvWgW1vqd47c45YMbgVo6CLnZAHyRnoz1plBQRW4BPi1Ybrm4rnDm7Uc37X2ZceuNOUtgcYOsrjjGL3rj7QHKP5/muwz/a+TyZTaA2qi3ep/KrDGoWLNGY9EMYPMTGng0i9ZCSSMHgAH0BUuGfamachSaD+nzp09h8eTUgfoxM9nyWZxNuZpzSn5pLR3Oer/e0yTDO9fKEneuI97f259Wew8F4q95z513EvhqQ2G9lO2p5t+rL7O/NyxNmwPaqfr9UnN7kzvM7TrKkGb4vGK5tDtpajygd72Li8X+UhyECRtxi5vxsH0QuyiniyNjU+0IegkvUMjSdV+qP9rQ9vuNBypkmohZeKugoQAnw9ox/wpJeoqafYjaGe6D/mGZfvplWmbyzr4t2ttAj+pF4nfBJftkFjsoAuRAzbR1JP6Gm1ItZQUAnKL7E6duT0kixi3pwrrTgF9VgoVlPdJ6fTbWrkxantjvRjRoAo9QK4BFmDCUsw+hnlGii2jNVlYbajlM496UefqaSrYGhV1kd9xyKhWy5KyGNdOPgL4Y43olSpTVJy3tHYqLzdzMvWekMstOhkxUOwtySwjaoIDyz5uFAiRm/kxebFTc+yNdArkAupAEQlylZ0w/n4o/IKoVI2Tr0VYsQQKPqBfXj+5Jzq0O9vOkGR+nlvQfuR9nKgsiK08u/gCVEKv62M2V3QfZ3I3neiIX4bQAgBmATmbf0c1FCx47Fg/NrRwHCNdS0nwHdgMumW6M2D5gwSaWb5UVjfVgwfJV+7STJSu07lbgrGjCHZ80YawvPTLKesKahKeEwA+PPPO1lKRj4oepTvPwNrzUkzZTI+DWCgtjZZhmWDgdfpfnyUQVVL5+cil2iOSiW8RhhhfxjKaaT3wj0Y6n/rRxRHh7ry6YP0fDEigF8lmuhgtfhAiyu/e1a54bOS3WDY00Q/sfy9xNXFyzk96+aFXDH3RoOKP45h4O0oRwdL4H1Y0sIreqjQTK12HCIrzs5twDd7i9MlMd0enTuGSTAimgH7iMpLdYPtnb3St0c+vczjmiBvUJowZgPK0GkThYCrOBfND+iSYmBUKp2J+l0KOhwjOttCT2UjssG0A8Adw9raoOJuGVg/J2nQZG86ju+b3R9R5+vlbSGTqBD9D8EHs3jn8ZLrFTWJEwcI6X5PEEQtnh7if/2SIx2UG4rkkzl3KRVeDlU9V5FJVWq39spEz/ASmWL3kSeyeSLxtBOVexb9xAI7d9bV16zWjkstPfmi03k7c0dodr3Zer8JkZY3lv86k/gyaV15M56J0hRUjHPoWjKbTGmx02mR0v3nLuBI2mBzXoWOJrRI5rmMQcmaaGAaPP3KDYP+AxMpTF9tgCMhX09tsglRe3dMwOEfraV5bCl58nnlxtI5za1PhKucP7IIm0QNmmX1fEL9uKyl5vd14R7zSK7QTFZpJd0sOooRQ8B6KhL1HdeIDZt5s/jp2M2xCdb44sAnGia9r5vQET87a9duWSE/cm+bWRJIThRL+gTt7g71CCgy2/Ew7lYSsseRPKCh6HAnAPx/2vu2ps4mg71oywnS/MMyXfrkdweiJwFcgUagqqImwLSd/lJBjqTxSBsMdkPsRWcCfSqDkVquHReeYtWhzm2zajTtltDlNzatt5pQzee4iv+xUpPtJN5NUWGLzSPc4s2Wp251PzIF6OVSz0RvE/3hCTX7QM7auB7dlALDdq7/D1u2+hcxvtimjsmwsSyDL+kvmYfu8W5YRTz66G4Xbi5sJ4qCnSfGg2HZyU7YB1Jn294EnTicVPt0DTyIwbKAF9eLW06jIBuvrj/iqeW5Uf656SJiwyU9ITW9dY3QsYOCGI/Lk676tDMtLNWtrmeUjhTQd5AKhSgLfbC3UVVGVqsdtY/yzzXIh8C1olwmUpizIkOJKBI4xnLADWDPmRM5JV1xQtibJVAqjPt2X9SuwKhCPkOjC9axySmLOMyuLA6FqSrQk6X8OKfor5oNplj4vijwEloyaetWsZe7sUvA0B9qqZS/aqqogkbhcON18+OuJFcjMyi5QS6zv9mZc2Jid6/0ilUwMJtuFzgnekmBZ7JLjHrvMXVimtlxY8AW1wgx0Y3VNKWOExyX+AAET43GKKV7lyruki/QDpQirXJO0Dzc6ySZgX1S0VHig40e9zyY20uumTyEmRhLWV7q3tcWtR/sVh4K56/wyQmBJ3QJXREwP+IqR3pAnF47O49dqP59MMv3cfg1Yb3GSwkZtUmiH3aKLlJ2sQ9dGVPm7SS/2Jh+e2fE1TlO/gmyHLHdRu6epyJIno2c84SsDCdt2NZbHzMLrJx3JE4WPMbTdY7DK4GZQJfLekZJ9bjs8fBQtQhD9KDttGfgd/bD9NT1nmmflvj4ZUvrAPOFICGYV0ztP73sqqHU81m+ZrtDtOM81cO5zKan7aGN68AcvC/tJOa7DrUbzAsyZ0/pijR88DAX6ZIfxAgx+0Q1G8iNUggCb/Cq3Ln0fbHpl9pKPrraIY1uFama+MGXh1fXDfxsd3wALuQBk2p37tZIvrROzx/hdxURjPlu2opKsckmqajBymYPtDdmt+s4Mq/fDa6E8cTSl2jxBlLCjF6jIyG1sJhCFihfd0Jvykvhy3z8E7GB1nt/ydhTXhWgxlcdofWVmro43eSJ9+u6Gl3eM7zGYb6CptzIpg30mLEgSyAvDNBZ0/McKxNs+i8uinoNviVF964ULXVMy3+FaIF/MMbqU1wqL05plgVpOUUdV75j857QosLxjfqpdKIE8yxIc2r/4MV3eh/pXL9uWcKnh7dK7pltWnZc5tazpSuQmwsOJwrdjcB8Jw8Y3fGA80viWXnbC9xl7DwkMQdSL7CiIBYfoUGNlJUGzpWgXCk88O21v5tC8E4P5IL+Ty+O6oEQ8S0aMVanD/CtWqZm6n53zUjzhwFUGWmrGeRpshkvN5O8Q6jLNpFFlLTwqOSUstwpOnJAT3MYsO0JGjxj9wYhjn59cLh7PqvsGn3s4Yskrv2Wc7eb7N8aY7KdruAh4UaTJAIUsOaSn92abZcDffYvw6ByMzE4uXcA14fT8E84cNlxTbrOJxX1V+mL5Lv3In7m+hOS+ExwXQWrU2p+tHr6KZv0caT8hRJZhBa8ifzU1jTS/rqJngyBvfZZVjZCevtDs1wQd4uPIec9oYK3pGTnjiaJiFfxlIG7TYxnRpg6h29xk5Hxlr4v3aT4wto2bKrVZqHyC9kHx1em8u3sEpGh1vKu/mKSWD7/8en3Q0zUwo6JPBYQK6pj0WzQJGyLIrQPdWVR/G9z953qpmEpKnLFwSqFsD5xFP57yDz5wYbklmYXI+T1CwB5AXWjtMXQS/rl3fZUkU1nxuHqu5vSocACswGcm5TceSB/MSFfjLFUVajn1sj5BJb28paHAsnkg3YsGUJrWx0TpdkKOwOz1Vyj5m00AHutUqBYMHBmHh7iZ5kCQp5SXok2xmTwMiM3ow+HNT2zOPGt9ysK7hfP/U5r2BNpuK2t5RO30XMAQFVeBXJvNTiZr24Nkc2JO/3h5lU5P8T30xxlAvVJtlqirmLuAWkWlVegOFRRxixfDby7QKIhz8tMwTdVD9PMODxIhgA+nq6jlabZmpcGaoOFoeuDzmh4ntSNQk6J4dKMLcBIuXkl6OPHB/e4QIVgipKy/ULY0Lw0UlC4raW9uMQq2hR2eN+vfCTcwhWmQQw8Gt3rs571CSHeGdqEnQ1BP6AM/CD5XPoKBkCTqQtsgJQtQaT4Mc6v0/QRptXpcLRAL0C49YBkNl2qevtFyw2BHsbMKYukA2/7zVZuD+SlvwcdRv4nW1kCCzUY8NENvoTnICp4LHHIkbXt9tbMKmzbTZry17l1sKx5WRigVou7k+Yf9hu7yLHnbbWfSTBWJVmapUfzBNpWSrSWcsVgEYDM85RPY+xVEFAI91kJ/y499nYtQoccRGn8wnKiE4pixFXTpy+Xziay8qPra/g9CT8kCHag/MKTMNsilNikNGKNc304UlnZ0FdKn8WWcgoiyfSxtwLBbFtEOR+xsDyyfIzUTglQMZ8Lz94iMiithwbmu5/QIlb/OaGqHQ36VtmxPzioEq5PZMsZHiX1bT2Kz/mE1EPdEbJq2QxvqHrjcFQA4Ud61cNkgDsWPeJpVCt9Ul5+RLFIusXJThqqhMLlbpS1RS1hR+/5UWlvLW2bO44kto3ysbzPvMQlFoUqRf5fD70jvq139lSfKoSaeOYh1OZPSTnMgNzZL3FEBUFZ0gLn0QMX+N5OXKGv62XowHUZdenhxUnQArEKize7mJ2K1cp5XFt0/sHz64khhngS1IYUXX04daOu6Uz6VOUEaycP9tVt1z1qdxN+DuxpL1Ul4R0js1vSxeVvQ/r+T6v08zHHd14K7QRexmJrVaSSV2HDXx7GHnjiu/bNJq2zB75CVUQEIHwvvVhQ3heKv7N0dnwUKk22nxYtk9bXGgFaaB4DRGxoIXCJsjjC+dYAqkLzPopAj+UXfag1ny354QG/wCosBRGDVF1n1MVyLx6wDWM7uKs7kBfHBi8COdIO/8F2MEmNW7Op/OJoVifMHgoYfbH2xBmqXxR86/kivK7fzyLDgOmLOTU1V1JQx7RvXH/Re2U2LcolTlu9bQEtbO7IXS0mtR9alhFuCp4OF36sCyrEB3nzvB0Uq7Ivipi4W+zkopSkp5hDsfNR4gpEN606F533slvyFpBDXCs3QnSTEZlBAmBhpWa0CRJfOE8xD4mABLyQXwGgGD46MdcF+qPfospBv5WMZmQ4spW0egsYfrJJ5FjjkEXGa2QPgooersGH6LLLDmwyVKT64FaIBuWJTL3kSsoqTynk3u/9erlWICskQA5db2uhkpSzihJ9V3Q7nAkryGF9xoFRZ+6sE3sb0WqC4Mbnvs5pBbb9M1VXYx4dHXAK3f286pcn2FdmsLf2JOEg86Ys78vwdMl3ezpxQyrm4JPzyP46hWEWFAdblUE0uCUn7z3rZoAr1RZiACEQBIyUEM57xeQ3R5/jsFl+ddIexQTxD6VLJwa/H/J9z7kxhhZjB6+G7OXODet/aIw/l2TP0i0YRD2sB0ZJO/M5FhtTJJvEt73p0rHXaVfKbEf8sejQCdO81AbR0LpLJgbOwJjcl7cjdsddOkSp88AnejPXi+4XkFu+Vz1wNCrO4noRAcAyr+sPjrsVtBpdIEMdnZBjakB1V+rFPapTZpQ2Uep1XufSD0raTRBniNTxQlygsx2E/C1GBmj40rQuBqPwpOT0FDAiDbqzqqpSYadR1A5uGpYs/BUTHW47v6X1LcAmfTnPnEBf0ihLaX2Ck2QdwRUHIVcLR/qbU0y/bbnCVmPwm+8QaUUrsMDNX9ITZSx+XYWd64tDUQB0ufHhadW6dnKGdTG+erZuHQ8nPLI5OdBmsSKkrVVI7bIf+R24fyVYIVQ4n1aeKsWre56QMhm0SmC37ARNhsYaCzP5K0WtPauPsUocYiLg6sFDdoDM11cAXSrceVulO75xamw8usgl+ppkw3CZ45a2doO86R07ZH+Q7RYnignFXI0f1FgF8ThRN14kwGGYOSzT4G3lFO0KOhBcb/aLKmDyYtoO22RRYn1di4bsoHAB61K1sRqRsF8yqBISFnsNOAptTCSpVfXi/urmz0r/wRmYi/WOwqEt6ImJ9xebX8bzmCqd5gWV9VA/hyyfOnXnDjAN8dBb/oxNlCc0OUrANTGFJxCUhVx/sMRZKyweDnWIDfB1O87K+U42ATJM6/wojOaASzjlG2EXW0oG70b3GBClhV3Osg3Wtz2FmU9wZfi+6EY01LniWY6TdIwchcb4gjVSQj4tYvD7Pkl5do26GAZOqvwEDkuau6E+KbkBSLkOLTJBkJBzc7Jyi8dCVd9vZNarL5flK/w9lxBHXXHcNlGx2SJi+DO45j+/UlQZGPHpkfnBkUzWVtO+bmrNljLhoiAyelGoJm15JlO+3oiwp7a8CCPpd4WhEXO/P1Qg37V8DzIh+op46cz/QanOmlRFpS0zuAz8gRDGnBU0TI+aNEI4cNbyK4qpXC+yy8RdBPCacnvQ/+qA/xblwNk9stAiVyikCORSLsNEfIde0x/1PF3AjVdpYEASNMgPxoP5zsjKTpf9KYAtSPe2H9AN+bx2Sjb8HHqtLni+Btt1jxAeK4b21DKmGoqIobbN0KC5iOzxf1nS1tmEpcRAJDRDl6v6pZDcK/jpHzqhxiyTOv7+KdzhWB51B6Xsy+Eq+dR5PiBrNEp0hafLimOShsAczGlGSBhIxGJIGEq5q0DM4xk9t1aIEBOz74+oC29Mi1z/jJbgMf/fhDIw5COq6L0Imqk+xjDL7JjtWpdoxGe0K8rn0ohWPMPq+xXZOKJYqK6kVVEt7oN5r/cqkgQDu9TADor/3ZXv4m9fCMpsGYqPM/pghVXwg79sOg2HVVNHNuDcNH7nM/OlEohoDv8Sk1SNOLBDkYHX+LRizMdiL5XdlcjpDdLQQ3S4X4H5Pl8PbU4zcFuXdjwzUE+MzMc0cLiXBkGtDQDA4KavrF0qqmCsiejgtBiH33oyREGnGRfDJOwkA7g5hxbYPmGUo8UrdYQNXLFbQEBxsAeQH/PNG4F4sqZ47KZhI0eizBIZF85WZTNJFb+i1AapNTZFq59xIFzwFb+IMmeYULwHJD/3juWxgOPZT8xKMjlr9WSaworhiHRjJM5uhN65GSMsluigBGHG8DM7Y9KpyZ4xSCLU040u6dGdBx/KL23fJ7GujQ0dzstpJha+tAmx1qQIDMByiCy7p6yelSz1UgvsgULDF/B+D8YymNFE0zZQeCIr9dCVH2P7M2LI4t2n9R9lmGZjtsUDFuaUClEhePKwZI+awJ40DKLFtUbYTv0fvg+xXBJOUDwcMoAXOLYZSKtOqJ8alJf0aQNP/NxzWx1uR8SFVLYAsdkSkfqajnwUFcYIW3pKPvDIPGUIZ0kLIguCcp1Kwcqbiz9MR7KpVvVBeqE3jdSOVZEALMk3mbSk2j3R+fszFBOt+X5fN5KEPX6XHRNjL/QG9c+m3hVpA2Sk6uT9jXI+YfmAc3zB7SPUc8HS/cZXbZy0KXRj5V/wKtt0Ndvxy92KDAaBjVFmqiW6ySKFM0GWyiV8AGVMC+B7NXK+6Xv2kzc+4mVbVeEUewfusN2cSHVdNMm1KwbibgvZZ6fYcc3HFpBgWWR3uCaiRpYbPM3NLj+Sw6q7Qy6TjRAfvmMk9rtYAvb1UatjtlEb0TqQmVvxfCQL/H+BVvqs2tP9BWq+/w4bAg3CoKgavvJvDMpI4LSOc+JU/Ru98yLuqZny7J5lJHt2wmivHtygdxx8VmCz/UK4E2BRnQTe5xRjwue29Nxh7oiJuqhabME7+MG2Hi+x47sInfcxX2lD9Fe3L3bKFlS0AfvwrJUYNPZTL3cgVwxVAj8GkOdn5lThE46a2Sn8qfz/3Ou1mWp0TSPC2ygj/E9yM1KcWe/Yi5HuSvI6sf3rPSnPCQZX84Z7TzsmNPmwEeyTaV0E7C6fKxb6q2+3CeK/WI5fq/GFRtVeWbvdxwpBMnWBGBa99EUbxro8mEKpiekGZi58trACAh5Cf7PexiHdrogC8fwO5/dkkcO20z5lVAOgGlngZH5mvJyjMAM6G9jB0Bv2jCrbfA2XsFiLWGa0iGVyWj5BmB8jERjzBDIbMjzpFyiLctDORdgUhSxPPPSUmv8kRRFXdGTbVpQhKOztQ3oyXnMtClRJ3BYnq72OqEE83InShABjY9KnpxrfwlJfBQWQ53dmtBGM8JqfXeSYEApurEr9iLvvNgnPNII0DOGGT81XiB49GNPYL+j9ZY5q3twdDwj0gKsb6yreJ7JlaSw7gfDh6v49Lm9i6e9QOd4OnKK30+QdUfYglF3SgKy3ci3LR6bj0Rnq42AiQK0IhioVTuWr5FDZA7kHeGHpab9BRbj7NGUg+0SbIZL+BxD46yEbaXrPUC6d278ZKuKke0L61iZZmD9X5IdEL7oAVBieiPcAoo+TaTMgpslWKS0liRwjWMUh9fkJsaTrQM2qFg641CWsxWdI+l2yPLydIzXX7/qw/loSPic+XA5XD9eDw2qUYLOAXxvjuJ9dUw1Iy912JfaXfdyixVY2OteAWE986VBSkhIh/kX5uzlsoAgMmkQZnvMzJv1khfhvCkItwRLMyZUF8TA09pZ4nBGqmWD8u8y3k04mfCK/wgiVKHr3sFGLW8D9Pu0FRAa3PaFwVbV/euTjGU2/w2RNfpukzLQHMdlconDmcuGs446G5aAkPHG/6NSdE9uHXzpE009FoumL3pZh5aovFGoasCKk37kZUQanSWH3auiG8A8cPi4UbzU6BJLy72wmfLgl5Ota6rsPjNwv5fUoQxMk2pKBjAbQlAZG9qlI7OKI0C0/jMMqxSti98yJtHCMH/8A/YDO9Y+ofDsGVHa/EHagTay4Q3530UvuWfq8r6vshjjaee6HKeU2wvGfRomTcHxpzGml412hOFIMIG0PLU65dYNAqILCxqgnar1T2qBJirDESOoR5er5cMjDCe1+YepHyV7t5UfSww9a88zVQy7Rq+ruerLKS6s0/pl1YXPwLjV9sb6IaMEHwXivhZvVBysKde5z7wU3CVI/l+IZ28Ed+yg2QXWEv0b9Sd38oVlxS5o0eESpKTHIIxG4usZJPCiGOoz3qBJKfsFxKkAfkCTX5y9JC2vdn8qKGIMbBtu1XjIERrmgb8bTVdeujFwilTbqESmQuquHcQ03yNK8sYWKN1Ug2NUCLDZehsRbZU5TojcTpNNHAjSPxZ9TmDVCIuPhbM0WCmo/qTL7Hx/snZN+7MfjLTWizZ6NS6/oyqnIxRAn26XC5lXpG7R1iLzFKD9ypuYEXhDx1S+bJev34XofLNr3CYtz2UYwJLEj8fONYyPA914FMrDOFeKbgnWccBDAsfquO8yf8vdDZ8Vqgw3Kan23hxmIkDu+3+MjlkYBcuAB+/OopSFl3h9qA/7VLRDXpqkOB4oKTAWTFCr1LTGIJHHJ/nhnk3kmKcqTR6R8pFGQafph0BWOTHk0onS5/f1veL+69Kvk7xMsJXuHCrmv+dTU7e9xFuGKSsVEVU6wNBJ8pZ0KKNe1CPX/G4U2vGrLC84lIqze/AfdpqjgAaMR/ewP3+PrNL+PzOGLxFtF0C1FEcgW4a2kp+O2B3TjZyce7pBEtMvAqung2gyvm1DUl4/VJPYU0yb/PBzNuFzgmJPngPhWnCrsbZfpRVS6FcFlasyQ/nkUV86B6+9M5+qn4lcfJKi3zKxY/VuUDTt7UN4eoucGTAXcWD8ZW7rSNx0H5jfzKs1yVC5jTJqu0DbC2mjsSQ3mx/ryf4gVfZvmB0TWhu2lxnRSu1bWSSIx3uoG8b9NKSJ+QFTv/3MP4K9UUVTetfrgg+7lq4/wbT8vY5uS3L9xkAxM68fQWm7azPHUOnTZrI8WpsKHEa4oRq23+H+7W2QPDhpnV55kluUpAhZ89MDcakHaCmiofW0KKXZqODIbxjCk34VKB6t1GYnGdSGhR5T+OsFqnnJPo6JLY7qVHVH0zsBsak7pv+HpSJrVs4v+V1u8ygzZ3ywsplI8o7Y3nnuqfK4BAJhBFqD0OATfhO1MTDT71z7AsYaH0551AUwvwlBt6/WBY15BJNu5NlnXNEsG0oVkvVFITSkWQi6buu+9SLoQC8iuIK+nycKSrlZijUQcOAFtOpzbL8HM7XpS5qq1TH/IsGT3SxjT2RBMRi/Vpb3SmwxJtg69u1otvD9yP/dpb93jpqf6rfFDdnYCog8nUlGLh/ZiiiUDuNowdlMMMV4kAVoSglSH5RKLpKf8ozkx4R4ls6gOaoK1V2qvGmSChIaHrzg75GUBZg06UlmZ4duwiAW0frB1/JIAlew7FCKbV9EuzSk3ueUwCwZpTQQKA7Rc4wQSxmxxy3shvqgONpupRSFTJ4rk887Rza8Il3Zly2193fzJWv8014tgVyctVZowAgNIlN2rmmTxJ0X64kRDDG1WZltx3qfxgxEcLuSyjkDtMZExZUU+1vPjhnosH8JEVd4jY+ZktHovDuElagFVFpa0OVD64TjJGxzJzaTPA+1rzSUPkqo6wn1JaRz/08RHg1Bmm+COQ/qNdPummFvQ9yWF0Kp7sz+oSZUR0SZVFKcKdUZtMLnp90w4MflNaRGds/eGRt5yYWhd0Ei2o1EUeQ9PaT/aGBFWTGUgMSZXmTuFnX4vyJ7KoIsejv1gasrIfSxx9Ty/OQO6QuAyp/r8yRelLXxcRn9Cb+Cj3GiEoXB3tAWJFTPI9M2uZ9oSJ9UqfpULPGGO+jvvkdur8DzjT43z7MgW6bFsCWsCYVpM8T6vGCb7jT0WzH4PcNggpZGrTX+rEa8yLuL2wbfrlFpTYFX0uWyKOqkVbQlcs/zmghYSfVs8mFENQ0ybvrQhNzyQ/RZZ22Ve09n++1EqnAHfnn3AXoOiLbhIc1hkbMdI9dNiNewmVBcvXF1CQmds6BGwf2+TtPp2wtsyxyUiqUQqh3dPiGDDMqHzPdoF9sMPLW3ly64JURgRJMLchgjHsFMoaGcvFEbL82Ec+LPYzK8tbTMW/hK3RybsDiiJ6UVkbxaAOHhR/uKJuo6pyNEbnjNBMA2VIzSO20dQ8//h2AV581jW8SvrlVNAF+ME3Xfft0/ZGm48V2kMgT4ztual7ZEAD10nGDn7v6Za9N9bTeAKeW5Uuia8oSeND800t95OQxHfwg/RpwxbJ6FXYu4ZuEa3j2TnH74cAOQMVDsgfuRouBbX4O9WXt6rXU0AgRdO8INw6IhLJtMyqFlGFRCSr7dLEqKn4BG/2oW0UWnW8S2MFg/fp9hGs4MPk8NilHu7s9gt8dNMQ0bbrHLMwCp2yrbA5+x2iCm+qmWyIuPHLfq4WhYX0H190ve+G1F31iJY2tMpIoggjabuicOtT2sLq8FGsyvSMkH9WxVyVZtZzFzs4DeZ4IZQrhVW6BvYUvMEw9xdqdB6bpdOuW2Br7t2DvTVtMqa6h980wDMb2ERAQk9z9qzOb9zpHPsszUbJ3+Ku3FDbs3YHOCzIJTVrBmhTbulG2yG2VwM4FHypTnUyDEZNywQGkEtl7p3LU8s9N32W1m2rLxXR60mBomfCuel4jUaW5W9rQp8Qo3lYzrtVw0I/hljida+yczjxmQ9y6KVnPDnE9KP2GD8QGCj5cBmLjnQmxkOqGBCmwmgvcEfghobywgXDISdzJnJfOSHKIIl8QGiu7F0GuNopO4v18DVs9wNGFjdp3Lo24vnjMi2NHMz8B8h9URjAuR9yLGLsDyAPRJ71IZ2Ear78UHkU/cUyFvpLLmoDUxtJbiKQhNSTsLQZCLBZnZQGTxGA0zN1R4gXH5cTwlsl1rCPbSi8tiFGoEtHnoakGvAu14UNjWFp4CtWZbd7zbwGuvhERmrizuxfMOjke4SCGow/FVkv4tXcmPFTA4+3ZCR0IuND7nqSAGyXgYkr0TQMQVp/9HlNX6zZPvaEtlA4Vq0jxNMNWh9fKQMS0nFpf5c/10bm4D4aguxjS6ZaXm5lkhpPlwy3G6eQ4tyAmsrI70hlfgL7ctAgDuhvSRUKqFTRI4PyiY6tg+3iVrlDCn3qf9jWIRjSWsxYEoOg6zIika647fThK6IoMCulvkoRpJLm3rzrKG4JjJJKJMwl2SdbXlIFv1eOxaeGN9iN5/KC4qUpwaDj3QP7SuD66EQt0AWIFfYpRT/oh8XGmWht9VnlPRO97N7EmNyXrHWrWV3g0JpDuWtFa/Y8MWYlYvg1Q2SX2OAAlHMO2mMAWfABZXTPCBoCc2nEowylA+ctdVHuBZcsvrPPBfPzovbvn/0gLs9j/nZBjKtrdngZbeOT0spfZcbJVs9pUAeTw1AvUu1LTLXjRQ8cfU2JtU1Nq7DSdKj8kWeVl+HWuZhyY96+EtdIWqsmHew2iIEG/AeX0g9etOHrvCDdDi7VrQBLwRUa7v7TaC2qOzCL34duODQqsSlh4sfhwrH1PxDlmD9/kpbmtPN05aUrJt8e1SvHpeqcRbZopOwYKWt9i2JWo0reZxaXSFg0Nk+Fe9daFYBmzqGWgelp0YVlJHUqmypnSG7RpkGYUw3jU1tTck01p9cgBIrmH3Whxk6zOiV+CX/xUCfpY7QbbNgSjEGNOkkxKC7tIY8tpFUZNShx2lnZdgRStqw0BANhq6d/gb+xnAYPVxHeT/g+bt6/RxPlSSpC5cxcOJ79ddQjSUz+qifKt3zutjMWchs9vFu+1deBbNJrtRZ68Nkp/8L3Eqy0PicEmxHcJ/PVCpekixraX0VWRsFG6IM1IERMxb7dBpZLShLYCocxMoNALDhtGaI843KPP7TIxDQWymf0kwGcgVdLhq6eAcOPto4YflbqeyyMf5dGZpZa+FhBEIkyjtPNZjiH4VDVT+fA0JQdQkoBipkJ6cJfAt4p2wCHoE6clnfvBGB3XRlhAkwhp4B8rH7sHVi+7NTMLfWsdjvVg5cxihYWIqenNaTs71mIQwGME0Kk/PyuVz8FVOJhwsMBcmqGtbNQsMPmn00R6yOrQ8Bv6sxFmgMOaHtA3aWIIN5wk1izjrzA4X6Xgl2VdSoudtZpq7kZrqzs5TCIkbAAAAAIrM0MnWUw6CAAHqigGZwQGJdkRgscRn+wIAAAAABFla' WHERE catalog = 'SP-70040' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4KKZecZdAEABDnbLTnKP9dPrD3NDOVb4sckP3x2o9MVSjgJO4EjpGP7BVVlvwpnktJUy9tqIa22fTDsxaElyAzyaDjOKPZ+b4IQLrB8aoTO7tV41fyigVsVZAcbn8MadLdOY33cWFpxChDB3yIEGfUDMUMBc/sLnYfnzgMWGFhWhxYN3GvOWng0UTE5aiHE2petMLyvrlXYzIzwmodUdn5NPF2SgHo3ZpgTs0W53piuQ7nOz4bbvnjGdeQHtknroWXYgv9wKZblmvr8Z7H91ddf8icOyDqMLHpMDubJvzqC+a2j4FX6r5VaxaETyXnynFdhQleV8BOfB7EFskwFuSCF+m5HcJcpZ5JY+hbuvmKKHwPAXYBDcenBQUq0MvcH614Fz8iW32vJvrehUQtNJWhHi2BkftN4vVmiiul0K64xEfe4gkPsoL+tmCa7eEnHcs/X6YxbKON/7CnvlGxlSdk+tob/Gecd+M1VetqGc7DRV4/bk7TuBIpWlOzN0zfwLnJwNYVy4C4s71qKRfrvertmV6cwMBuSMR1v+VEjcSEbrkEHxXzj4wiTbnsR9B60IjwLATTcxecy7HQxHXYlB/jSaxpGyNN6N4o2bf7eFswldvgMlSDm1quAizK13PLgabsK+P7XKaCe+qY6aWtPnZfevwbnpt/fZhPNOvFeZmlCgEbtXdd0aHk3mhzdrRxnhXsHEdofTrLo4ezl0oZZTKgyOmnvE8I2AleuylcLRKH6d68F2iDk8POIO7zeKfqGuJOWIQGNzttShyNahSjmHScG+pzKbzN5sl5cP6LHG8goh+K4VtgsEf78cLYYniSNgWEEnnsz6FM4nC3/L/iC32xZsPP+UPNpjzrDeS93auME7q4ulYSigSKxrAgezX5xbY5KIeAeeoF3krTk1lDMI/ze1XfsvBqHjrXEM8v5ilmjIK0A/Ttn6rFDP+ucdEIWRcfnT5msHi9+T98cTzpxLHgpOWCVECW0mH2Dx/ztmew1D5AkVl5WMRRaLp7JwxcRD8H958/mWhjAOP1lRm365Ihx7F8FvPnAX/jqnM9sZsFIrof3OjNp8X1d2RlqJ0PeGyBUb5vDjjUCpPs5yEg3j3xa1XwLQS9GHEnchw1wGxSeTLSnxouFE0oyLgCHaEJJPnyxCe/icWoB7jqLz43JglqFz6ROIV8kEROwwoajiCZ533vVAabQCnrQDNZp2GZrOKRetOC4vaiEK0rHCggXa78Yx0HnQWy5ki9Mfu2nq5+el7KrsvixYqxq9UURLiixDO4TTOLGeLDJ9ZynCak09QAORY999X+0rlG9zU0J9r1Ns7/GdMxRIZ0ZUxXojYrw0R8s1E6m1sVEm+Tt9uM9zOVYrhjubXnHTFV0oz1ZqrjqVih1tmtFyGE4ux1EchTWT047YUUwiHcmKDuviVTSmX3s27nH5YySzLT2Uq5IZFbOImiDoSJOeO0HDXdCWcXeIQW5Shr3PwUnCe6q5qqEkklvOrXdVo6QIzrx9lsxHZuItkeezUBuyok8DVCG7me88ZAKTh7IcA/yTcuMnejXXVYcTLZYq8M0b/uIOHJS54WmQ6VHmrzj5Fw+ue69xj0kBGAVXIs4jlxwSAgSvAO4ol2yiSn/9JbLkuZ3fm4jYkEVpxsnpVB4lqXtYxBc7jAlCOWLV+Do2jwuJbjnUwjMIzwqlIpuXSg3CMDbhg8iwEYWvs4XK3K5DXJaClx5ewMDmFLgPFNQG7QNVHILJthFkE0n0zKIP2Eytmvufls3ZKftt6F4TmnrqZkkwYtQ07U18bpBnTOJgcGijpRr3RjGw/2fva6m8KJV1aAAyOx0+dXghoOQwSNZZMmFOR6AKkAwwgXhXU6rWxu2I1h/j4acQ2SiKw2dcboV+2fgI38yqtzg/7Mi9bYj5yFE9T6C0hrEPs0KEqmULZ/5J3yVIcn2iidmgCyD627BOOmjR/DHhcI9cqccPfvtKYM8GBuuC5kzCNv5zWZqv2n0/oh7/IQpCGfJyxOEfqXg4M8KSzlyOvJE2C9b+2fMottVqReUZzVZ31NeNsbqNOIf3IM+BYqK3l9kWTt7sWy2AXzQEHHGYlVMA7SMxbSNj5hv5pS3VFqOgdRJpfu8scOkaGGaH28nebi68wI1k7k44Okw7vgmwqPFBNWVptsUvQ0hDfFw3P5QM9qeDHQMV0A85Avai3M8fdfwX4OO0uCvOx/wr4LZGkWRqLzC72Kv5/SUmar5tekv9mcafhB/uiA+pnnzITyzlCg+KQ1dJtjoVEPWLXA8f2HG8fbj2JPr9O2REPzHmrm8YvitEc8Ex1WORopubmPJvyEeBrFKlMfyKFaeHlCwgTBrewr/M4zDzeuI7JRu4aPju0eENuxUtx28ZAZwgSjlTo0vT0Ut1879py4j5UJIuTgrv0Xe+aTCHkzAsaVQh9buKXZuDMVH5cY5KfTKfMhtUrHRBbL+HvvUTwQWOj2b9Stj8w+iHI/IS0ttzfanjS2kGwBPxgUQDoFZkvOv5A5II0Ljzf6PBtn2wGbFqZBWRYmJPSs3YdTa0IBRr7j2eilTi8OIpxuOE3C016U1RmitGpvA2Qb1Rb5eH/Lqq7N1iNk31gaboHIHUijWpabV0vT7hEoFm/SFL8VY6FpDbjAnGDCzzJ93YkK7+hZGX1dBtDRZBQlRWtkYboFYDn1HRnydY5w+iQgdmxK3TyPuG99mcCZzS+Zhw/+wLOMRSmta7gAb/181Z2lFX2HhfveLQG29K/GQpIAK2lIoiPQ4qrUn+mFA2FVwWFM4gE0k8XfXsyMpJ+MJ9ooEgeY2GsRvTQy90OU4HqvUMk1Ya/O2EKabCYKe/fCFMpqF8FtKk/xNV73jF089f614Q23bwOO36J7uLD2DwYRvAs+BhXcjzxjCUlOErCHfgAKxfd5HCbMc2LnSaDldpHlC/wig5SL0cAkEyKxQtvxzWCYkS7t/6+DgNosRPux50cEfh0u0k2UD0KCTHShqgtdkMb5KY/IHFbz4fLatc7cx5Glz0DCe3Z8p7OdhHyna9UwNyXjR54RzeyK85HIaixmRUIJyEPv8FAW+nQdC0dITfEl2YrVks05wjUrh/VsGl/SUNzloUCSgfTp+porHXa+SQCJk0aLP34u5JOod2QiwBYT2KjW68kuiElzeI5iPuLF6PrvBJ7ltHUobDx29oFk2byqizsVI76jsy1QazOW1TF/sua0VIjfZv19pkeAash9WLWOpshv0F0DE8vrivuSgVGXQu9SjEaVm1AKRwWZacYhip5ILogltnngAxRkZaSLZAEYT5ssgt0bUB6AEeh0qLsasBBvUiN7yVLBxGcshz+5jjS9rb1HHM4KspAVow9PFMVv06/kBXtc+UzfoBwSaRZh+04y8eqyHLngGWVGWxOOAitQIbYOK2OccBAGHBeUSNN748c7HVDOiuGiILMcOtR4LE94u8NUadjIBgSzZGOGDwNZzODncFaxkr8wyaTOJ60GWYjCQBMw+HK8mnJSNO95XuwylkqmyekffuTdaqVB/65jTc0nST88C9JiWnDYHDfFoOCOraQxre9581kHOfVUmBOTbZN0WNe8sZdyDE3OGFfdkcqVW9aQyxqozqkoEJiXgqSNdOcZ7TTi04FFObM8F1s3bpCxIFNa8JCtPqDdZOi7+RI116p8rDlVgUFatbwsb29axM3DKgzgntWwtL5f/2nU5Q95WMD1wNc6CZwRVeuA/Dm1R2dwcRcT5Ds7UjVZ1LbZ2IGknCLLIFys4bR5JCDVr7KTGr/rPO9bQz2+0rjerNIp9YNsz2yxT7RlERWV3UrVtdLwzPBxnVA5rlfU5yqFwRoa6vO3GABqHlORe0rOM9E31bc4xIYBOmGLdy+Yj2FUXmGWTzOeU1MbMO2CD92ai7fbws3BRLSqYD7+4BAbHFFmnENJx+DMz4z5FWyulMoyKlHlsix9xWalmsd1OQTkzxklPFqvplDJe/c9jD/FWpw3+BTrhJRyQAtSghbiow0zlx9t+ogIDcWSsWoVPcDrYLbmTmzxoJc2Ene3o+sggDnQf3gdj3V9lPqQLE1xNkXg+T/rZKiHKxWnHeYsbtTMOiPX0Dg0znluFvYRd9aPPBHcLcBHdnAj7m0BCkWObBnLDwu5XQW1K5vibvnj5qUSXCffwd14WUbqAbn8rMJHYjAVc2dwEYN7JSZfTxGcrciXsa4IbPG2tOW7cFmcl0vhR11KHbpKpHGic1ydkCJqg/1lzjQT0lvd7EM9+MvIc1AffTYSjpUhyf/3qg/EgLsrkDgPd4ljW6qiVQxNoFU5Q+Jrue3Ezhb8OsqIlUXiQcgo1CHjw8RbAlD1c2Mwmm2zo+Lla9uk3m1gVYryQUabodmi7aauQGXap0b7dqRxas+ntyhIIYNrEUFFFLFBhfQuaJG4ce5eb84AAFZ8UgU2Tu9UMn+2o7Da2C2G5HOwhhKI/IMrAvayNxspKCDEh32+3ua1gfYIoAELRk22d/WeZVqFUH4svAXQ5trTdrThwq58HyIAczUxUnX4TtTlK2nsCLfBlyDNuEz+g9VOZtAxe93o8FUAW/LJ7AfwpXceMC0BIvCe3nihjq3yap0hwe2hEe80RejeKqt39NPd/sGkNyqE9qjX9Q9y9qFkHk0WMikvvHf/XaFxzWcGWmY1rMQVjGs1oxwCeKQJHSz6OKrEZjPwuYrsA+yWgHJybGzqkHucUqm/plpayHkS4x593/4WAmotq/CxzKGe4hdaIglU355Cx5lxS3dTrZ5ess57uOan4tt9tgqukpWCL9bSmvQPB8qVt88A8X9X7SjuGAnfjFMBg/xgM67C8nD3OabElqHU92h4mHn8qyVcQHHk1muLW1bleOxyRmXuXuFosAcY560yCEj5dONoVGWVw25e3Z2OvAfSI9xkfsioik/frtkIuZCzdFXzuh1A9GCjY3rAAonsjMNHpEiMj8oJnlO7isq+eSYTfghPc1dzk39CZjtcVXE7QwqTVa4AVubElacWcOlc3EUbexhHQzqgaoW9wWnIofUFoAZOuzA8EcfM08D2BWUbqtzN7Er7Yq2zG+WUnM7ger2i7eo33GSmooydvLCUvlL7jIb7c6o962s9mnRKRbE31fbBahvnVkezyY4WmCKducYlzKxV3bWPrE0yPWMXc2G44gtKH5aurXyWnmHlLXNMHUXq4PV3Hc+5QCkTcGU13RzA3wrtuXU069NHQsBwr7ovIBqTgmpAVL77GxWdP44HmolgfIMUXN0z+vWd4KiHNJ5oLOIdNjhWm8hEUJ15LefAcuXBXrJsq1sqZiBC+19sx7B9BkXtfNUPY17zyDQvSL6LVFoWZj1QymcvmkNC7JiEYLOhrVytsjUYJGbJdMBn4fBDTJnVtuvMoZHXGbEhibmesRoVroiVFEn0sH+arn77ZMLg1EovQOXjwJNeZkK2uz8NV60p69oYlhW0OFimqeby25UI4b27cpZI6xEUJpMFMknLKpyOG5w+67dHWeLeGUtx9xjaF1v/juV6AiUkGfabtCa4weCttoldidwTOfAzt7Didk0HH+B9vXgSeCR3CFqROYJVKicSDEko1o21zS5f4zYdd3EKd/TaPifgIGX90LAWFOofsqywUmvtR0EqvGcr0kCSu2+RxVt3TzrD3Ei2WjopqeVB4aZv1Vm+RhIcz6FYC9cSuJTHtpKrVFa4nDmsenJL9RECHFol13foFxGFhjkG05I2bqU0q0A8eozE8023xCAqeec/DJj5514I7oH/oQYMLcooT7LIZ+ULHEfmceqzvAx/NYOA2QKrnH16BNgdlP9iiHlOdoHn9zp2xjdzKEwA3DNfXm+z3UwiNPVHSJjrEBk1tIOmlAu46SzVjDiwfHNSJv/zmYmt1QNAEh9UCCcdw8Jz9j8Xt/vGOoHOwd2CJ/0PPqwU6Hl+zonJF1ctl6RQV9IpMI78HZoeyAmiGsVkIrUGBLaoKR6BBi7bDYHulSeYJk2+J7whe7WPwL7RnmCQMAautIvFnJKes+k+RJbmWoAsypSS6YtNhVDalezFlTKXWdnX2Ljia97nrhArW+x2szarjTte3iqQqsiFV0EYbIUBsSiJHDkIEUcoABBZcoCVn38dy+tbpVQo2IltjAtgJ1R5o6A5NpUb3cR1gGnsgs1o6QD1OiOyHi/97fkwaCvhKbbwWzKvkuolddz55qeZV3XyVg6muUUSISlEohQsTWDHyNeunTB0msWr6mkvI9+/0Jj+69WbqqlShFEAO5y+6GL27KCHxEHxNf4MoL/1od83Hxgncb4lLpUqiqrRgjKl2YqDmbdPPHNd6g0z5RgqPiaERjE2ZLA9GWp6WYrgTQ0okCssbtq70T5uB2qw7JJrvEYQDT4wEgUCEjlGDnfiBV15O8OrlfisjiCAJdIP2mH68TaWdf1/xa1dVZkwbb8jZjEsQhBFEQyi9kwDFYlc7oSw+JRrAjRUYFVGiEedv4UHW6VhEbzNCuqPUA8PANdjMDcV1OczlMclNecR9Oh6f0VPo+2dR5efhdcZOY5D7EAImYPBUISSWtUu/J4wQu3b43S2xjZ39CXiVf1Nq7h6tkXbdp13fgorp54TPdnJVQBIRh40cq/6FRgBoAMScbevSElwYruQIdhScVmmCi4Ys4Z7Fq73Ig1cmhdavP3mCFdIDMwZXjqB7hD6/yQoGvpFbpJaREH362pBFvEChVi977hl3/acbnh75J/3QIRDYSkSpNirKlkGmZKB2Yj9nAKdsuWtGg3qm3Z8EAwoEsU/202QotY98FHWfhRGtqhzE5xo/mWo5Wo0Iat2Qc5+1rO46oFMOyICyqnuBNbZblMorncdFG1GqO+ctKYiqIajJpOAEvRP/3JTFwiLg90g1qJeF0DbQOojMXCq0uQTzGBuawZ8rXl6QvYGCVi0Wp2KghtCbxxKS67NaaP0PeMMwBV9aJtvjsQpqox5G/pZSDp2DYrdDkke5QOaXMHExvVzJYZ0837I6rglcNICGP8zr9t402cVtHPlaT15txGN1GKdIIt8Kh8NI6Lu7IN9m0BwijBdDw0icqIF70Fq7Y3P13W9GVUgpkJtPJl6NuKcCjbrbLcxdBeVPOygS0Bl5MGuv1q3Br9f0JhR7gomd53hP0VfFJTGesrEvbHZAhPXqUQu6GQv8LL3Ek+btSoUEpTYvtfZqjSpFjMlLPFHggkIl9loo/h0iPLwxzsnEYR2dnTBQ1RtP5psbgUdlTNb3Qodak6r6gkaYUj0uVaQoPUWGMtx6rcxHoUUYREdvFL8gtrMY8bqsGfLzqhgVGqghmKgQKNfhxYqTFmLT8hd2GFWTcl+3FT6VVKhE7Rjrd6Sci0k+9Jhi3nEJndfcO6yDAtCaCxXus6OF9/IVnSV5HYqT9kpH32MEq0tXBwz35cSZZyZO2O71ZLUxBtaE1WfLygoWZmxtIXIghMMT5clCzF4WknyUS5k1KzKbzyCQUYF0ClNPqtlPCyuYi/NNeO1PEroojdGGrR5K1t7Uq5+ODEYkvVuprhRc+z6+Ce0aT5TwOjx6x4GPgDRUCCxFErbInLfARFhPgC5CipfTuSURnwnhOs2xixWdXyi3H/jloKX3K1IgmbiHrVe0vq/nHVpdrtPZ/ZKdURpOHyky7g8nYCdJvjf7+D0WwWgMHgA/P1d93DPdBl+xqn5bO78Li4gWsHd5jqGN0eXmXvN2tMSoL8ghflCuHsBI7TtlknUyWMdZhVZk+EbEKf4PN5KcFpDYwFlCLO7j2BBTI09Iiwl8ey2KtLNrZHs2cnnt2WCZAeKK+DQyd6TAqgmJjUKqlsSAEyvzWW8ufR1z0UVQtMmbuYtBPs1Ku2cp7W0TJGWsgkedkrpQ2h0dJoEsrd2zgN1xATGFlty6UTovlay/1ZDUsRPAO6mhLv9qz+yj3IJxlSExiXHxIlisYNRmANuHrxa3ziKKxawLi9nY0jZWOubAiRaQMrHDadYoetXnQHq3DPdj+InwCG9iFhgv40Z8oyWHLm8CnQ5+ErCJNblr04znvWj4jYbOflYWBu2qZQhieNCgPgJoH7+F9Dd8v1BlrVT7R3qCah4Eg+ZkJGiYjM+8a3r2kEZ/R5fh7rj61VOg9zUkauFVEVUQ89i9WYypvcEj1y6IoNqGiBJZU3MoPUnOlJalOGLg2ilNoYsYvdEnVDFEiVoV3n1NtWS4nG9HRqf1kVDhvjM6rFyVXuwmp5TlA0zdE9I8dLjzPoeq26WimEVVf2KkoRIvYuzXjInn9k/pyQviygp+LdjXp40YOab4mMrClChDb5lgKwhJGinyBCiejs/T8ZkgnanGaHu6IpsyAijoerQypEEX5P9hYltLxi5IAfR6xSkDi6lQq4cpRUgQL5ndoQtUKCYyJtlQkLVRgTjdNfqh6G3InPViDGCjvpXZ6QpM9bVF94teGNP4DkV0SPKZkZr3RnA1FIzI/o44XsDRllFUmkC5aL4/4EJvVJibG5IJEhctmXDAonhDpseHBnZ1aTQpSj6iJVRPnhz6ms4uk9KUkdWUT6tYDxpXPjG6sV4NnADP5QbEEQiTjim9ZTY4jzF4zkrtGJg48wUD6lHL3N5JV938V5xdfLIZaE6Yle2q6zbIg7w53dib2XhwRVPObTEn9RLbdgnqCs8w4Q3v14W4Z6G6L60WSndzPkzG0PDk/16u0edrpxdhcUiiQj/ADrfONHtsCH9J2dgGfAGJadrhSTPCiwBuRHeJVguQdIYQJ80E6cIpgrL9y9bSyPdeTzTU1e41v/zjSfSZt3JFUh2k2OJ/cRLAWL34eezAsi/KJQsePvo1j3ewzMJ9CKbn5XPaPqzoRD4Bqu+YZ6QCIn1CnT4X1KNAtWcNN9ll8gRoErbMuhpoel9WXnXDIx1z8dzcOyxxwSj65M2J1L7yCudr+2kBpDYhXXqZpl8M2d4j5r1jouudPRuAKXrtMQupYmQ6wcnKrrVG0UWrdlzz8iPLExvwQXuyCeYv7Bv3RaYd59Q0FKhGpS6USrDjlFAHa5m0YrdFnXCEqXTeH3u3eLxSpNnn5G9TxzRmbzP0+iwqLv1CuvoOeignoEwQjJwfSwE6UFaB8F/Zk5/X52xcQ+7a/NSF1u0oqSrBVgMnSBwvGJlg6AnCnWFmGrseqf9PQH8HKVKbVYzpScVk3DZZhp77ykOdeu2giOa/Svbno0N5T/L5v5oTeZofdteZ/V5TQp+IVz4eiyPNdJiTwt5ZNXtr/E/bS1JdiVgxy6JU3cwaX6hUusBNFdQfWjBHboRtKG66wTM0Q4dRxCwH+oHRFGodCP0hJjpXDo6xG3BvVspAGJU7wRjl2akiGZQlW+LZ3UsHTfGlPpQlVsW6J634FpTz1rv3IZJNwpOeuhuU0VKcA4ZbK7GkOEPQ6NucoqzoTcAgxpHGNGGrg9YuQVWEacAC3UxFORfbkxrnMSi3ahroU0yxuE9fpim+henH4XFPliRd5RIf9yYuMpvybxpubMBSCs+Z78Sk/DW78q3Ta1qtoYJojogp5duIpo+9cSPIeLK1tf4fesco5zSjMeIOwQ162uC/19SmhiZ7eSAeyonwyd+hrfVpufZbGGoud2VeT3rj4PWRYYLadRlHPrSoTe5VLsKw7j9uTqpu1Hf2/RxxeW3cVR9hO62wwrHVZEp0jUvtygbi8Bodre0xZnI02l+cHuq0P2uAcoargX2UhZBxZcrvvsS0kac7N1OP6+nP9Z5h+8Qn9KA7NLE8z8luMJMqbNDhBiieeHQZaUU4YT+XFzi4MrKAQ9vezzcDludDlHLqQt/A4SwAhQouQ+zs85ikoJx/azu80zpRJdN4M9JiO6Y5J9KfAM+9TuiKVEDT7wOT3VHIUb2Ax8jEGcfhLQetppSKYkWWq8OK1phLhROU9Z1yIFk7B5zUc0s0eZJ5DOpGMZBEijgB0N+8PSuZBusO9EZAThj3gSh/2zp0rk71s52FgXTlNkglZkUXnT/q0iyxxLtEt1eN07NhAtPwEc+vESR8Jnnv5aeXW5ugujQePU1ZGTCVYpT2pCBgIhY37Ks/hrqP1rkrUTEnazKymF/y9o9kTAeE9BcuZyjdZP37hg9IxBM8w5xV+13ztSmRKomgOTIBYoLC7oE92ARf2/R9cdw6SYayOgQ9CyY8Kkn+fg+GaxRoNvOhB35aaoVij+9HELzXlnXvhdNlbR1aAXF2hwdaqiO/42F0N40Ec7P1PMx38R7Cx7CeYmBQ7OZwfuKZ5hbkp2LHHVQtLvI2QUJqblvqIQQpMoTWEKtliGNv9HzMdkP+pT3We4osIU8Mm2jE+u6sNM0E9go/yh4wwmTOdt4oqDqQWh9fuYe2RXmEJn6S4LXJdGNQO062Kk5OlJPRdVmNymI4rVW+P1t5sDFRHJDwn+3ZEuOQ6HriWhja2rfzD8jLPLuNX/tPsUSdzRhRK5DKHliO45mQ2Pwhy7dO1iTBiPbRxzhSdtj1tlUQ53gb3nFhvd899Ig1ZlSN2TvgRAv63EzxsRe8AzNu6QQnFS/qIz280FqJyUt3NK5OCZRChvpPxaUNYznup0BQRVGAcNwdnFUZHoDqyn42yQ0yJBDbrN3OfTeFHHAJqxZe4KwHHvs1cufliumPosReRR20GUUPvoeer6Lm9TzI+oZ3hEYerSisDkT5kLook1w5u7BxmwxqDIu+NzrBfU7ZdM69eycHh2lWVqbY9eMTVyckV7jAiVprcH71Fw05htpN8KRxt2niM7V4q8RVXUWv3ltQoviMAHS/gT0BJMLsbz1eV+c0dUiBPEYqjisJWfOURUqKu5Iq9pUB6RDFBeDJ3b41c6cdfab1zbK+jysqs3JnLG0SSLnW+Dd6o2Cla6tvxGdv0LAw1Vxy5y9Md7NWDyb+9QmkDLNZinj/rYY38AQvuZ1cKYkx76Joiw9Ywal22SwIiuIXys7ePCLiF9P69Z1V6OxEpJ4pJFU8yQ9cV/VnSoMiYbtaNPqPEk1v6hCF7HvufdbxMpH55beN//kzsTbxakZDETbt/SVDrK4StTajPNBy4rYb99hpZ5jWII/4A0oaq8DTixsf+dvpEUvb25nVHQwJ5SU4jUg59/R9qCPzBMpZUKaAzKOO7Kve4bsw+Wo0NmDudVS3KZuhQxFAtgK42Snu/cMxUqK3ESrK+O20NO7MzF63S+Za3Orkwi5tChNcJzfFx9NyQWBIjR9Gjg3WvIog5DNOL4AThB+eY432DaQd0L2oXmNebjuv7OTc7yn2BVr0aQxNqBk9yQ4V0f3XsB/yaN6CpvaPbzsEzHQt5ns6MgmWR7AonMpX+Tz+8A36SnNmo5Uo3OvK9xI5Jt5hs3uav2D4eC0b0CGjPfsUB9wgbpwHe/w1W1HXxQtzYl9a9WmQrHgPPZNE70JoXI3hCxiah9UflyWvhpCxsOufV0sIdT7ngNd5vULlWIj4T1wqAoewQUxLiX6vt7lUw7inaFxWgr6Cb/GdUOopSoIK2T3h7VFh6q79rsNKYAq7rRxWB889EadTSoM/8ULpQSMJ6aXUqD2NzHrr9f00YcSbsSdW74Hwk84ZKm9PMmqbIxk2pGbOH/99ZpT4q0imV08GiMftgM0GJrubumIo2eGJfDS3Nu0/AK/iy8xICp9uY95L4q3+Jk9wEmX6xgbdMLzz8qvNxxPGVtISu+HDFMUSqkr63Z1Nb8zKnXPctXCjP+37yQiTZ0qdRuRV4QqzeD5uQrW52u0r96aBKFOvSr1wGzn914861LyCIqN1knALxxyfyv6Taauvco9dMtJ625bClvRyg/8R/+4ZZ5DJpP/ohbBG9YqxOu9faoyQkyz08+B6deMBEdNGR/3UMtToDKjAFDq21S6F4+yjlSLkd4PJw9Eu602bppUWEK1x9LNRmiiFVZe+sLpCZ1AuXTb//bVcEpxAUGvsMivBdGOT95q8mLprhyhHJ4d19li7gHcbiU7i1Pivt3sARKv22lJfgbX8/vWWIBZ3km/a81wzKZHqqSrnyYK5vOwpUtTB+DJNzeoto+afGtHz9diR9ih03R8WVleDLGAzcYje+0DJG5OlcqJsX05Cu0F+/jH9hwjPl50MnMan2F8qkzCrY+Fuy0dfGj6aGKjmXmpDmo6QdMkjfK4ePG/hjxGlBiI84DVP+BZSEE+HxlxLu75OnxexGlv+i5xtvPIYsNaHq9M7oGRLd/1zZLQZA4h379F3L1Jotx4+LuLPax0O5GbKpgR60htMCmZ0Bs4+C/52J39OaZyVKQ/G4kLAng2mjuu/gmc9Ay4hlO7flzyaLQAhqrWoPPWrB/yr8yVzwA37uNOG31k4F3chM4/gyl+hct2IYNjaxl5r6Ulvja8LF2uh3t5bB0XXHaHBdnLlw2IBvZjKXcRGYxJ6QgHiyy/k1OMT7ErE9O1FIj8J1OnODJ67jJNU5DnbaNmmo62tPA0Q+tRpsCJSqy1CyaQ56Uq1gMv+omGQE0kkOrbiIkJ5s+du3p7LZniKDvbuLorf6JdVToqVcHVc0uP16qtw+DQSMQp8/7HIw3fq2nmnEoWq2plVg5PBe5y1BkwdtIonAD7NaJezfdWVB1F8q1LCwwKV8PJhZN0LSKLZIrcXvdBOtPxf/88qqI24yHVxYa9jpxOcVJIg1Wnr08eHq7ytjPC7jaK+hgOUir+e086Ip/kb/XS0brwjiuVM9tyHaMng05vgQFOE3o3cvRLNezh1glyJQle/ocRiUZOsZiC9CGu0fDPyTsI+Ci9IuirD5diaXwYk/0F2dQr/SGaciF9dnQA1I/Tjxw2jVOh6cA+/BD2TaNFTkMaJCH9AkzQ0M521ESz9/LCMD+PbkX6oLenwjEgAxdqnHdUwbeqUjeftl9hUxqIMJILJl/GydSq9hpYKS6u7XObPBA4zJE3T6JV59vqpKRNZgTNkGsGVclvsNW2w7QtAmsHGxMdsSC/ce5rIFbj/hs9dI/FBjUbB8jzPgTugUicHc2OWxD/g0Jbidj1q1A7Xkumz6t/F4vbKlc8ugWOG63PJHi3Npa7C0BoKC4/1qfsvx/juGmo8c307gSb/eyjMJiBB1k6yp4hfSXAcT3Bpg7ftqozd8W5hcA/rdO7RZ/mgb78H+vRNUCPEDNh2gD+RXTeWyRiwRH6TpRQ7G+VQcTCM5Ywi9gImvlP0ae3rpB/RXukVUnF/NubWe89uygC0Q1lbZpB35+/eG1MXuf8pnrcDWocRzMMMc5EhT/aNvqEYpjD0eHH7//2Ve46L3Zmr3qy9BPpd/D9oMARMJIkRLZdU/2mVmUwk07qz4L1szQd66Z35okddKfLJynDjYJjFdSVXqtgM/YLM39k2IBtET7n4xGPWQBTpsCGAWq4OjiKM4bxhy8DX4TTsxYF1Tv5JlIPoyp03prejcB9Y7Nsxgum0dkYPE0MfvgxiqpPKVBdkIgnwpqWWlbNyFBCjUl9RDWg/wK+Nh/73BorohMLSbzyjunercOsk869d0lBx7f3nhfx33I7NWTAtDHwD2g4AHpkXkdAPke1/+E+YYtRgtocHL5Oh48wrIn1Mx8/EveFucN+aFQJF7qf7dXk+9deliUTE3QkmUa1ccOOCjyE+Wqg3NsSe29N8ZgS/0NwhpDomt3H8FI4WJ4eI7/TcnjkYzLyJHKEs05h/w0lBTCj/8ZfbaUVsxacbDQlF6MCgCyXIkj3GkUZBy+JIIilx0/7/1CVmb0FIwmhDb5tTzShtoHW8BNffwexSw4POD7z49tR8SRmQ3esJGBY8ejxFK336VSlvhc/W9jWSyj80Pxdvm20JSPq/63Jge0sbIjAHgBHjcVon2IW4ibd+4BK97sOHg6Y8tamvi+0Ew0wgLw8xQiDRALwDXSsGtirEsZUoSVeZAXq9CQIAtEK9sq3/jj3w8drlFrAP49aFxo1A8+7rEsEr5hHi4tHqxY8K4MhYJ+Vv7i8ZoOEJ4nw4gEAJLxYVl+4pHoiM4j8EN4lCiZQc01gUVROzr/sfyyJ4WjHlwGp76YFTkt28mXfoYOW1pBJO2XWC+4zixhmBAnJB/QPHxdQ51+I7/cP3JbcWl0q/cDMGprtaVJZKUe0uKOhwwuSUHRj39fnpMbLQOhs3bavLieQWZOPmeKzxuhsm8aL2z5UOQcmNN7UEI2j92zljHe4zQ0nRLhZ6o0UqXCR9j4SHUJdDcR3l8N9ixGflG/FT2+9YrgjPDCwK3OhbnG/2KNZAZUNNkuwdBpCUIgjWi2m95LAwB5dPIadoCyLJXxIgjuPgUDowawWXCAOjisuA1LSXvvxj7B8KXCUAcz5NHQ3l45jcRxW3Untajn0PONuoVM2Xk1XRpZbwE0IHSdytlN75jvRzA+C3+4k9pePeaOS92lXZnZO6fomB9G3Y+wchUWTC36+W9VHBAfS9S2LXYKpphIXepP/oPU6MgFAx1+KyX+DT0aS1SrCzTjnCCXnmEQXZtej0BnJL6XQg2YO22Hne3nlU9uMYXhPVGMjjekOpAPZwWC9pXB01O5cldYNUs7L/5THhdLrGKL5a0sA/iTNaH6V15owewl/87ndmyR+mW49bbRMMQ8+0je4+86wve1uX/DdY94GPCereIZVbNiA1q9Smrsk8sYjvrJfHX2QCJUoOx2XfB6bR+zulgmW6MzN83Wkud7h3YT0ImRuvnTOkMOUXbz2xqBbytxfu6AL+8sZiNgk1i5hKQC6KWVFvELcexoWOPhwp5apQCYsu2L19nF5+3NzMsWXUc8t/8dL6tPBoO4qWt8aCWxXsH5KRfGlOwkSUC3VrJMJekW9fwKndkCmdTdwNMQdXKg0QhNHCrSfDahvIFHpYAbSjKXtqf0aHb2re2GSvxiPHjQM/ED669N8AEL3WrbI9dbtH/fw/kcafzK/CgpHKrqHoQ4IRP/GVi6t8LMvuj4U+7Xf6aKMpcSPOnC/7qwf1hQ/o8qeR4IInfniF9hQs94QAJbQhIJCRRLjnyuQZDj2r8mgUqpkBNNSW9jDgGJDGHicvvf7brE97QouaLbRLH4fAnoCxYJNH9IWZ3Y6uIkcH4D8zPIskd6FjG+E7sbDnQtUcYggC6EbZ96XKzcGKUupsITiSF/Pr1Jfubz2cSLHDqbSK68jOwLJ4ukbFT2lkvOSAaZ7pY1ryMaE9Lve/cISmOWTKuePfTfer5e9+JanJtSuSn7VhPJQqsM/iGHHFFcM78cdquLBnQFCMy6mWwMT1Z3Kn2eNwmo9GKPSyXJt+/aBgaNYCn0iB2xZYhc1cWl0QoZjnus23x613GxeydX09HirgBWvtfc3aF1FzPFjfWCTILu2Msy4bUNsYFxoR3SVjJPylZAxPegG1NSQ5lr6rzilsTE3eoUd5dQX2VC3+Eq3F7OJOloZ3s5Rf0xFwbkiEJhVOFz84RaK2UvJdH9DsRF0OfHtHxdyfkmlGcrnSyEdV29I05y9odRlIxM7zXNfSu3Z99BOAvN6qWAKqogoDLpWSrihXsM5HQIU71iZy7SOJ1WdnKpaA7dTAitBY9LXZqANb837mH0M/2dKuaDC+tLK8D99zTL+iAUPGxx5xAUYOodFHm2j9r24c3laQ8C8nIyy2a5zCCJkTn6BT+kBIbhTrlEghbU6wFhstdFUoVdgmYfK1tOgcYLU7E4CZquQrlXWRYxrb0yulCw/ssF74G7y3tS+OsaA4tSv47xLgW+55afsfm0eU/k6a6cKJoH9KlBKGYsh5mTVJMbIcPKf2zNBT3f4Kj+fXTmPOXY5ld0KbHGkCVrTYO7z7F0viniy/xyh7bFRHQR3HzgdkiXWsIUSRIqae24/OT8nIlVY0D2P/L+dPQ+AxXkPXw+COppUEnwcUk2+o41h3KHaIz08//o/6j2P/VC+CmlwPAfbOtq7dxKLZ8zE5UgQvQYloFcqZQqHOjMwy9p7z8rnyyjFoM6Hu9VslZsq5GCt20QXgna+7Wg2ikOwbr4rcuAtOxqhgO8d6t13WTTRVKCCXzbIYVXo6QM4yvl1LWLuw0Uw8JkDJqMNWj+solAqLXFFKRKURjfk0q/qFC98M++rYQiY4SSPihVGmygwq5j3hsf1XobxPyHaaErmDGpAuJBdduAQecg6O749FqYDifp0rMl3Thw1ZDyDum0/kN2Y/u12cZHTg0uQaXJsrnSFMq20o2zvuNDKvUyenXOh6Dsj+52ab3fUHvKfxx4seVUvFsYcTYs1rd5SVMVh/dDQMqEgOXuLTNp+edyy8Vz9mhkf/177QxNNcLwO9kbmQPKcXbp1WMHkTS/Wa6/Ysuadp2v/d5NP6QDoomln2Pmmp2pF4YbMCIKZ+8TPCny4p1Vp9bQ1A4FfPhljFIBVdaNXxsh0zuKzJOoRR1nz8L8/tOPvZN/k/cIN0+5KCeA9shnx0nyhtNMAd50sThWz0LB0i8RO1NwbPn4JsdA1peBNPQUtV6FMdPkhSBmZwgDxC0qpiTBiyFvqh/eN52dZRC+oarPEwt/vNBvEKjdaDmhlgvKvAWrtqC/ujv1cQKT4DigLcTwqVeESnLeRx+e0D9hd657A0XHN5mDT305m4Wb8GttX7fpUCUiOk7VO6wBrUMvhg/ZggMHlFiXlY8o05rYI84ujr31ba7AWbGutyvFaUHvwNdfo3cJAFert4AABJ5K3L13UWCG3DlN/fOvNmGgCJmzvK3ugEZGIXDhi2osBBgqMXYiCQKFsgpTLqrtkjok4FrL7VD8nSW6hHulpwazYOll5gu0UvsqWJjW9Sw804I/UeWhK3PnizJUpnjcizcL2Iy4f5Y68BosMXB22W7v3ZtmKH1Yv3OJkdlTfqhVJ/y6XPjawzqs4BylBhv2r5y1FjiAPtOkfiqTLymTSoNVCxDrc5SxGqVNXa8om6g+zbmfOSP9FIfYzV/uBQjvNTaopzlHh7eK8nBbVtC8BTW2sHW24zq6kpT+yEUPl5Cj+OyD9Id9b6SuNzvlxyxUPaLiuqHK2WtqNmZp0yNPEBp7zlvr9Yj5xJ/ZMOpNALazHxc4EuyZ/pCeIwZOIvuC+02Xdl+Wkb4be2GEPuOtRH3h4lBCttxR0W7RSve7rBF+tlIrcSYOMeC6IWhjnFutTWAZEW28TrEKGRyebtEU7lZ7mVWJjuFgwnif1NY/MtWmBF2ih9jth3IadOvMoSNSVvBPSDnpv7QiHvD+9CU4e/N4hZfB9g03zyiAgzgbxjpi5lgDiAzn+GM1QB5o6c0BMXA4YJ8x1xUnilokLWpuBRpLeijTZRFzB/6PRxgjpx4m2ZXuTla3KJSXOp2xNQDimB9b0m3wIaz8c50YG9h8GtAhzFSK9lKXPtERINES56P8fQEFXtTJYIBBLOrcEot+SdPxTvRPhoQO8sQSAHvYeEFl/YghNfZMppIhYjx6RHzsemAXSdIqLY1a5cgTQ8dZUgLyQjDHINFgl09jtupCJRWyLO7USQd0SPYtz7Z52eWcFx25yJyHO62bZPRqdBH51cfNwW+SrBs9RuAhoab8Prqezbh3vRoX1rvrt7l9wk5VU41CCBGIi+joUpbGLgtAiUgFIY0NUVDm/qFsrwcygwE/3CamAov+lIDM3lmAvUvmB1zK1XGCm1FVGIRiZmhEuVa2JobFIlGZHqIL2BWmsl6VYd7VQ+99xk5Fmv46kKoOBJqJVt/6VC/yZ2qoBu2yf+4Nd0hELTL2rjp1JcPScdCfCBBgUWsokMtw1IgCFzCINAGFevDIbHqA3fyG1VzY9UX6JY2E1Gt3q3r+XiLDlktWNVSf/CZahGDjJfEolT7e2qfQj+Gy+ortXVUkD22AK2J9yzUPggLJRd2EJfU5Dn7g5LJBQ+4R1zKhhII6Sk+/WLetwaM4RCDRFiM9qw2AEP4jg1UdG5GyhNfi/p2cXo2my4AihFyOESTEnSE4lye8h40MB0P2fhf8kTkqhZb1B/E7HJp927/bo26DUCMspFCiViVFMjA6fy3Si/Nfehtiw5sfwMcRBXtOTkcGaEmucceoz8gl0Aybdwya8hfcSdS3VUKLCwNnhYvY7LWt4eXMBgB2qrcDvWpoI2vxb1hNq4pw6JT3C5tUBQS9ctjc+Kd2ILyp5X3rWvnmTtSK/lel8JVGEYD6kvdW5kQW5ATHK2bY+8GFzPW0pzZJD2VmnxCV39uHp+p9j/3OUbOjnlO5/B2dVrPB2dbFSdoXZzgneZHn8GSrjGyoU4q5MzoXj1uoC4RTA3kL0EeFd8tNJ64pj2LzzjnscYqTF6KOKo8A056R3xUiwAb5L+Rz9Axx+ihniH40q3qGjLIvuNbCIxzvs8qh65SKUOGBLNoUddPIsrhFZ/+uGPDPD6b4lfUn6oVWPsQOJrBMzAu5VSc1Z60/uQQi/fnbCY5ApaZIfVhbvHuGrHpXhvJu8RltjSBCGc6odbMNSH5lhtV2s0mUO1E3O++rC98O1RhpznYOXHuLcuZfCs9SgDyAYsVZifHr1MnC/PfD5cKmSWevHvPRmWi657V/cZLKa4cbT4GTP9mCpOd33wVjW75HPiEfYrEIiFgeNd9Bg8RIFH65GxHuKc9eV53BTdhFNMuie52ro+Ro01x9mWpdzfOF92754AQeFpOPU6O6A3vVSwXy9qekiusbfHY/gPH+o+PjDvnA7Rx+XMDJh/lWZDOUosxh6J/MYBJF5rSRhaWA81pAqzkkgSIBwaDTrhHIOVL0YmPbYm7Do0g08naIMdi+Z7goUB/Bmtht43MFgSj3SJbXUqdS66bqCk7EbsliX5ws3ZUJRZtp/gRKRmCKVnfnohIDH+dAlSWAID6gps7NYKktSuNQfgd0Zv9/LHZeoEok1NVg1+RLsjTIhX9rIgLe0/rvlyWQpHkwupIJG5kb2sHCwUyt2NOr1dYdnb6S5pjwtBSZnwwrY15YxfNS9UhImg4ZX/ZEb3TV/lCyxroI7HPQzOE13NBJAiTUZsK7GenNE0sWIW8fzAWX9x+Vfx1GBjsIhCgtSSOMrl6KklHuKA2a85C4m6+XKPglnrI1LR6qmQEj4NKM56SSIRdHV5nKjGZMaVVH+2KfQNbtWo0ssGSIzErdJf08Zx1fHD8rRomEjFUN55k6eCLCksaUVbpJqsOVZI7Pr4ZLgqvtL5u34G1cA1eKU12nbJyeN/f3AnOcDQmaF+PuiYBAr/1g2XJKNATQMQv8Y4TzlOEcYsrDn9cZEXUvmPlXUWoIGIh6fB1KR6/OBkGjJMACdUTGcMPh2/PTh+zj+rOSl9R7psteLkTA0w5v1+E9WZ86h9IM75I3YF0X2vFICZwHbUy8gg7RnUweApLBt9U/WANCyW82WvZb9N23drHmwzZ38Pxvp5aDNGJzLR9V0QmCjjQnRrqmT8VrlcI57tUD3RPqRpqKCm91lfdu2i64b2rvY2hVKcVxmOK3pRz7cQHOhoLERJKNNytYDqymxa8G6oXHvLRUv/ZPFQSS5RUKk9juvfZw4wpmDh2jUzLW07AX+cBWB1i7r41lCHWsbPXOKiQgcJBYrb1RhOrJaYf6Rcq3OL860IETiB4HGdo9QWscpUj1Hps9w9UQ/KRpVy/Cy2XGyzeKLfeh0JIx2iN7F5VtGChwLNDS2rSgvTWvYRr1LdFGNYukV/egfQeoietabbBbS9K0QKvEYUej7yc+sItyZfWhulPENWXQVC5xS0Qvk+11bxaJR8o8KmjMrwIfQWbYAJaJb5xOpswfcgVKfFRT2RUKwLNvdRKu8yZZ0pCJTvtEuAmsNg41mhPWgOsrFaOb6XLRx4J2nafyiZL8MGGXw9FJLYCyH3svLPdz5gSICuIKpKKDSASq3fKzLBz1fWx95YdTFFsd2ldYsqPtXQavgObDJSBSwC5d76ve7XByuW+j9k1M/0NRnL2VmKV1wyGmgAyzZT8IdLnwoX1JAXdLHdXOW7G7GbZK5Lt5YDR+2EPSwhZZ1yPfIFLPnkLcj9DoVqh9bA8YSi9Wv6+CRuLD8cD59j6g/u+vbrVR0lGUaMP29+AMZ2C1V9XyTp6RTX9EvTGS6dS6w5qmIG+o4KmHTt77vxCmTjkkya5MXNowCFaxXq+EX121APd+mVqpL0BNiJ/ao6ZI7DU78W0W9NrEGA7kgpMvdCNJrWl7b/wW5KyVSU8jfXsMRjrF4YVtZ9y7ETN3EJ52nBeP1wq1Cs+HS+WQtfk+AlVmzmMoHpWwpPJ2zAxM7R/AqqQ99C7Am345XfMRuqTkKMizIuV9Eso8IvD6mbt1wZwia/k9ObKJd0mo7jOAWXs9zkaLSTX6VImHNcXJ8MRh30rDw47l5ZEpTGU1IARlZE5RwPl+QYYKDGyHXynbY04de1ZSwdha3UD2nhmzeCSfyS08BxONEJwgEYGCq1m4+xUJ1+rY48bXQZl8lZJsPszXHii0kgT2JT58ibzRm8GLTacsYEukL0UhL6mBPwby1TX/tcSG2mgErm8G0VibkTKZ/6i7IDzR77QLQwO1EQrG+wuhw5f2aiIoJU/MHQnvji7vnF6/yz/jxRtuOk9JDRartAOvTCl70UI7YUrk3u+nZPfbiS1WSV3Bmt5FIkoavL5x3bf/GAULjkOPzpaNDD05CbMCBRpxdH9ocsoV86jFSQRlHNTWKtp5N9vXFv375J+SesbOMOSQbpAAbymvIVFj+v4Z1xfTgkG+Q1il0OmgO/iGbyfWotO2TmJtd0CoL0cXX2JOlGqqKuosNXurOqFRiOcfFtMOZ+mtErMMx9ax+wq+os2SfsW4FazbkjpyQ2+5bMC6i11MQXcZIyCleM490akFJEr/V3G1UeXov51W1yl3EjTYTzm5F5AScNMqZJrjFhvYXsGfJdwKPh4pQnr2ip6K3+HTGCOxR6qpsSGZV22om41Qi5futSJDb/o/GdVyilihUjbGsW/fPiaTBOkAgp1vGTRp+8WK3R3Ivcw33D+LMZe4w/5S1hqPhmRjCyjR3s1Sl1ugrwOin7Ldn3nZN74csJLaPgmyNGwSSSfKZuObW7JrCWFuMzKwH7iBpNwUv73Ga9wVlzcCA1rMLSMkXnLFyU4vHiWf3/bNjp/DyeAYbE/zoovqk6POaE874QT1JRxDi+US+zlE0o2k1mNE3hW4wrY44h0XgYak+sNOK7EkE/vAwE+1+z3SEHjd8XSZh4wYGBenQXPMxu5bBY7o1JkUwjmncukZ1BDN6Ch4XTnHanKcddydQJrIHazlYsUxQn8B0daXG1t4eh6Lcx+3ERCKnUsaX5aS2iYEcfpSiP8bCYEMocIOyVGUiF2iIrvBbaSsSHwT+8POri2KMywnQwAKGEonWWW3g/R/BRNtqGbaN2thUV29/jmn8nn+KuTAoNRNFJuLMFPv3jfob51D0BujQ8rm5h2yDVxEe0TEjSHEtpgg47wE7/gq4SDu+JbAVZUwjXlJxA0Y+aMap/RxSNLTHwJ+jDRiiz/er8j6pCtmSgZRLNxOPlsYujcAbcBI1//3ybVslQ1OlkKa0KZK/2dWj2DFQqH4jnXWGQiUunsBc58fx7pqj0jC3tLdosHat7uHuxTxyacrDTahTdpFQSsDrGcHg2e43yLTp7jAc8gEs8C2mor3aFpHfWuqeSXS6rTUlUGPM3f0xMV/PPyAE77e5xd0qOJEeyYBw1F/oazkJuALAUiNdBW3HYpjtFBYm4jPIFWq1ku7Pma48OF23qEkSrffMh4DSyllDPxShWl6fbySxB92VxQehvwVCZbuyHVWudZXVkUgTDYoznD7AtHvO3FlEJKtI8oymOPZiu0AcC2cQg0ZLZ3RoPwI8KnDJPr7PtoRwTJtvLdpOOAJDku+jJotxZSNXzIra/vWnAi9JYZfz+1A5tl8xgWu0oG9HkQ5ij0EfVKsP3bE/HPg7YcMqQyQeaiYemlFWIr9IxloXU24J9MzE4B0+v+t2ZMIN4K8Xfv1IVERhxTDIOCy2tCpTL5KWn2AWHHHMpS+bksYhVL2LQZ0TwUGhwCG3w9IOhB0Sk0AibXu4lBLmu2ldVPKamQDhNli04ExtXwkxl6EcvcOSZyh1B/fovEVXGQMdN25m5si7p0SRAiO3yL9iIPRmoBZpnMfV6YZdB7wfqeVaWpiQm36gWE3R+X57mMU7rStPWyLECc/13iUjDTBEwfXC8sMqFUYZLNZLyXjFAXGprV3wj3JVvFROXqU53RZYf0Bque4DZ1lHz/RfJH+TC0z0/WWM8AyX2/ZRxOlYaKhdO7WlWBVz7ItHBfsf21XeWwGegJ1J8r2n8rIeGC4mJK7S/xZzPBkesdGteh13bQ9cX5WDWvEyUwZUjupg1jAKpuRELVlShL2XGdKIRs5g2/jMaP6oGQ82XFEjhQGpFXFrOpQcljyW1o3wP0xoBWvZHH5+FaN7vbmwXVB4K2K5shrTTeKp10OS0CuBxnd/TfdE6grRLckWfkOE0J1NTwS3t+jCIXsc/z0Idw191qFBR/SgCmIVMOd2j8lV2UMrQ3vGuWiO9JyoSmkbCTQhTroicyS3QXNd+ULypU0t6kW09AD1igTi+Zq196yFchPYvuvo8kz54SCi0jBkq8pO3qysItHoJ9kgIWLXWf1k7/jvDQ94C8g80WJiYRKu5AwTImBzQX8NYPbRiaaSMaRZ+7Dd/qfpMq3jc+mbn5kcjyJcL3n7KYjw4ZV2DPIWk4vZ8hi6Fgb10pFW1i+6g5rUaFdRqqDuoyKkC6fLhgU8iIfjgBYZ6Axi25yd7YJLZGDlgaWp7RJi8tazKRO1HVUWMQfHqk9CV+hQTL5VoPFSnUi/ebw8MV9g3AUmZyOCfIyBlgu5OeYeKRUr4t7+/MFAsARZvEMn3RR9POpL6SWAZVidx8Xg0GxKeyOm4rXJ+LyB38bteL1qCN6FS5URdnHYO/JSiuruPvNcgCLwVSE3tNauQ+ypSbpUm/jg/2wbGbNEv+Ia4qqrNatzwjGcp26t0/95RyQiK6LDn4PmIanZT6bZ9mTGWqmfc7iMoeIIsU7yvOHerLN8FPWGS6t3jbh023yAlxgabzlE+W3GTXNxiLgsK3B284nq6gzHLAztFSOb4fcX0GTzAv2oqObGG6ahXLWpXrMaWsLynd6deMudKh3wb5XPu5+o1n9QE2fkuHMu2LJ0BhZaU1D+wZKu+pXdFlwxQVgi/+tZZa8fIBHgU59GiSKgHnh2Oeq70OeqaHMzvQaqMoqZcWZVAycTcYyb5/LyXdIlruwlSjw0N1ipdzetx5njUlOIladBl2TVkZUJDMbAd8+uR9JKJKdN3qbPWGjvUtqFPr2P03pCiX3J532HlR4du6AQISdso7fwflxfg69ZbJnG58QmnZkr97waB3nxWRJhLv19Vev3F/nL8Q6clOjLgBTcEFYrT9VVXP+7634PQ5kmTRgmkGUS/RCynw7tW9pXZEhtp1AQWO9HKOFU6sERdsU03Hd3q1jPPas58C6/mww/Ot5IxIcRsZ5R5NWZUuvZ++lL45NhtTt6Qz0lkpO8fe7waGoRZivWSc7fLPXfN4sxol9gocqLwYQ/cNlsYLn/hAbO8q5O3UiVNZ0qWeQTXXbuW6QVNT+yHjLmMC443OYiLY9l+ugjq77krukzkWIypWXbSoKNJqAtdF9jk5Umg9tmjNdqufUBn8KUIzTF5ciMf9ocJ3yqqIsQufWEH94RXG3JdiabSH5qnrJ/3P7BLHrVY9uWvgoeRhAZghu898OEFMGZGoTSdctOFYbz9OkbIqK8slEiryOYMDrKMgtqHG/zKXENf3DzP7s8gnUER3dhNzkog0KczPzmHM3b7F+d6zI3vmrOdgdf9tHVwFMc1OM5gJ3FFKwmlATVAMloWlpib7uCVjID+7HxU2ys/whfLHdvz52T6korQBpUeGC1EBKpHAIEa4Y+3DFD3QcQcy5NoLE9AwnzMppdhA7TfaXb7QFg8tSb69h4bnb1g8PQN1fTEc7vvzELdiLJFMHmpWDQn4AlpjZ+XVbXRsB1Yp5MEjLJQ0P12ixnAKYBh39hEe8tuWvbCl4cu2VOTJ/SGUHg2yZeKB00VPL2x8zWpOtukmmL/I1SFUWPnr1H2PY9701BL6DIfNdNwLyIhbe7wYFEai2r31/Zvba88jCGVASovkqHZw2lWl4uZ3GmZV2Ur+fQ4KQFBa1KQVbn19guIocL5PmoxqLUYwyDilsPYzd0mn2D48sso/Did+bzxefuOMRo5YsoR3Xen+Q9GW8x0SFUWyqkG6GY5iyBXeq/lv9MxgPYJ/vQs0LvnBoqCnXsQ/b/h9nexwr39pwxRpV+7pnvVI/7FFGrieEinVZIhkE4kh/2gEilXa62o8iWsXp+aBCCwxqzSHOpT7wnmGrHFEgnj3dZlPXL/vLY9cTdOdYUtxGoepYFMHo2l4WCUK+eBfT8gedQwYnm6RYdawXsOt5Cg8Pkm34SjRykbPcfbG9La2H+pcF84j3ewRe1D5qAZwTEiYj/RFbqTqfON55rGv3uLB1BR+QcgWNmnrDg2CZof+Nw/M9GizVoViRiNgQKR3x4dTqvLk/qcVPgbaopC+TLzpu0BeuEuKqL/6CDWjeNDD/9+dELIYkAThY7QmXJOEasbL74wiYnQPh5OHtdR1EyF89ud2aoib47MV5HqD5Pm+JPqrozC7DzSuYgvcmfLzdvpWzpe6U9bCFxrYlrfbF2rOHKQs/UsLQMExztdnOP/G8jxrYcSEveh/ZooX0thTHhjTPSC5zHGWkO2x5sQXu6c1zunWc6OHgSOnTzhumxqu44raHSUj91IMbLgDCLcJbbPeCcwBbOrDCpP0igeIkte2RrOrAMGJZOMq0LKq0Gey5qyOmep7suElIE371S5VH8xJPzj+DhzyvTwQ7NjMnhF/8TY/Y2FrebRkIwyiyC8Y9c4FrO3OspZ41rhL4btDcoFMr30UrsALjCQMgNVdiB2eOOyx8COXCZFjZlpgJLJAYPOCAMsGKDoP72MqAIqU5w4gM/SDRj/ROommdSy6EXb5xEq7IPm+u08fvkzvu1FXO/EgIeB8YC15JYDT4EJQNXUAu5QmQgO+DHAfKCzHcCULhsT9LEzVEHHCpcS48akwG5+0vG3yy/I6q6it80+BhCS6IkoGQxLkOiq2nfhDrTupy5PTnXDa/osEjWRAsj51GGk/GI+SLZw31rQ/XCc3HmPGnv/9lxjK9Ph/hLeh4r1N0Xp4Fi7+UhkeUV4N6eupQani2cQRyWZfk85oIHVPPHSOdT9tN1zCoFPVCfDE+4jpyZSB3eisCV6PtS1lhr/SxSxJ4W7qFZOO+S/1aS8Z753CUd4M+AbhqiflluV93qcpT1KXwkRwuQLqs7jBFpmOZ4Azxiy+BDfnF+7Xxi4f9bib/W8tnZI1gD2Ps8i7ozFbgFdaOzppM5WGINPL2jfH0WfdKhPB6PU4CgopOxn4TaB6R1tx0tnKyAIFgQ42H6yEIiRifzH/49upP0vqu6iNHRKkxS8zg1Q902QBFZqsUDltJx6f7tdktciTLjAhw/WjwaSPOeusp+otnd/xPvGp/Tlz/ju2OxfSmDJVVpkVAl4qwQBLdi3RhBa6xKtxg0Z55n6kQkyHTDjYrnjMFq7el4m367p/Ou+3Jc8QO7y5YGksLbzjLfywUcqSE6ikz0NxQLHaQ1sO3H6jepjpVXvvP3s/BY5pndKOfeFRGgzQBYh0b9N/bpSp5b0D9WN7IAkA7i5QGPQ9l/VgX1TVOYmLDGn4PtyDm5F1B6DnN4dWDYS+q3OwI9f9N2UGLJ1ibF6QTJ97SWn04nRrgXWX1ggJpQVagRbvwzOSx9v4Eo5VgmygPL98ufAZP+raAu/c2y8Mcc6pTc7E6uXJV8rncqSMc46O40b238Kzy6RuPf/cAODo6VxD8OoH4RX5sgH/XLfx9/eGPXSGdKHAJBCHkipgSd2Nv7f4RwnNlHVltyC5SSISOQe2UCzY1GenyrfnFLCg59VDUwAn/2OPJKGGldRRlAOb1XLClgepAW+dBwyIpXxFh6Wn+Vyr1oD7eHHWp5WbfLQPCylXZ4lOr1rlbMuj5t0sJg17seQKA7tHreu0rKDuXR5t5Y4XfQiIdApSgapmGrNxBOooiXHE+6SFUMThLdXwtldeIvFF5qaAVCZ59EL4N6hTdpyoVkXOrOd4EACwVVwJ+j2rC/gbcCr0fxaHtQw5GA1vcikTEL8C0YF2vyiMrQufmuI+Fuese+VP5E/dOkp65TbgvX/ovHXCVgg2etjXD13ZRiDhqkMOUCKdUhqYHykcaNwkK1StnUFV+Ar1U2P49jx/WyK4O9Gx28oENrscfgiCa/WgDGkCspKbeoJ0ajE+trk4eXAVEQfp7TD7FXvgyGAj44g2nf1MmrvLdKrny1nfQ0YbtUNPb2czalx/MtwnFz5Ta8j+cRtUQ6QBaeqM5B/wChSND0+KGIXhPba5gWiDO4rGAUNnRFAZVuKAUZv4m0YTWVyd8OA5XaMHVfpVkDWpD5hRf5C8xWPwn0ygshbQLCrkSSRTSg1mOwkDanJw9wn+nTppFi6nqja1qeL0Y+mt6jYLCPibo8MtR0hokA/MDRwiX2lzL7+oSKny5KVE58JnhQqUcu2UV+7ifT0UnKOh/YPwdJgHyTGxfN+FGPdwr7KBAC3DRFSZmMru7MNFLYR4MUIt8h8XXuo8cdUx5zQF8baEa73Sg6QFaxXz4EbhhFJcS6cWFam/o3z7/FDmMDA9FRg2EqpU1nB+tHcr/tFml0zNwWNSL+6nodr1Pm/r+sPzSDLR8omvuamJSzTRF2s+bJNuMfzBu3hI7YSJ4oSwUslJzC6MMzSvaE4T70GKvh6+CaIl1ZPIZmib76Zg0zosEyiWdWm7PYFjRGUHcw3n4O0Pllru7wLRc4mqt//8mM2lXR4A+P8Ip7z8BVhf1JrmiDjGmBcYtFaVi5IWB25s81FgeSSCb1oshHiu/VFXeHmBp9L/fzd1CgIbmFgwxKqhg8c5mKxEFLKUwZdnQJyvsL+GRr2Dyf6IoUJ5SxdkOcr85ZrwSKe8dIsFHYmM4u0viwLusuKw79rQzaMGSfrvmULqkXKzdKv81H8EIFQjdtOmIsjY6PzuBdmWmB7hUXSr8cFX41PkARMxF/M9IWK1kCXiN4xMO64nSUWIs31+kd8/P5GR0RN5Siu6BDctN/NZvPsLAT0uFPUpit1ZajD5oYecy1MXysD0NEalhHPRqcy19efBxvsOhEWve/Dnw4lA4YVo10AGMASK0kYg1UCEi/1dNV1BEAiSJZYBB6ts3dIyQYfzBqLcah2drdlpr9vvq1xlwWeOVaaS82eADv1lDBgqH9jDm+s0V366idruA5ZG5Os+rNaGtCye6zgEx6IWFjrd0PF5+50HAZ/NkMiQ+AESX7qhNbww1FmZEoJ/juxOUkMZLV6ulqj/pgTXteMkGJahyr3vP/6VQVRdlmHbiWND9lStSpXpXgykF1SUbZhNvRRcMqoEVD2ZBq6Gbpe/ZnKrfJteV3OpPQhWdUWurf5kMC4QSCjnHLJ7RSIhKJKtc8CZDTSwHDcAzYM3Iu195QKVU/5iTTLBY4z+fOkq1o8tQdM2rwR9qGkBmPfKMtvJtTeXKCYymSjzQPTFzBjKM6gspQOGY5KimahSoLFjoNx3epktX3qsaCcytR3mqZjxMPgGhzdslQ+7up4D62dnAXJPITfEOIXQsrJ8a0gJI1uxi1wHFqpElK6/8XHpeuTtiyXrseXC5hRjoqW/P9fUW2CtrEyeXeYddwR0U+58h5BTKzk3SylDaQLNHPDPcpr59QmmTDaJIesWi30a1hRKTqdGnPW7fY01VpGNkqKo0VzpJk0AAVnD7gTHOtau0dt+df8MPn+K+O1dTA0au1AVSGWWbZkJNxPoUhaUuk7fmBLSrYLCK958wtQqfQwumGu23oD5rmJkrOEBXGBaPssMm1YxusGE2DBzRo1g1pjLZyzV96xVlPJCh27fCSjyrJfOQJd/KKLm9PWJsX3kTk7Fl6SEmP8WurE7my5mW6XoI9ZuoiNXy2RhpMs4wNnO6sGMe8i/jPpY9TBK9sTXPQ3eWFonPAx9FqE7ZtxnDJedl3eC25rv/gJoOpTQNiaXTka/nN2K1Rv/tsL4REEA3OcwK3PDe30kuBXx46hqNFMaP+uVNSFIaSl0+uDqIrW4Rzhsmns6/tOv0Mf/S8v3srhnYT+46QHmqF1E2Nb7ktvJXfeQx/xCLCf0TxVn0D5mi3kcf0PX5Z3X+9SXe/EBqvPEPJz5D9SpLusKMkVpxwbk+xX+Wv+AxJI4u8ne5jy3V56n7z/2aIQiOrh/AACs9L16znnnNxZnnwRNqX5R1Jljgk0GRqeDEtsnyLZQ2i6vNvX4arMUNL3rcFZovOAyB5CkAzaOz7+htdzhTDyn4tRwzWmXg+6XLTZKIcS8eH2f2yOFwEea5AV6jJRPfwYRqYwNRLepBBSjNC0Q5LwtUldtI4oSHuGpkkksmnViHnM0ZCdkOmdg6RWKhP0PjDDsfbtOcPrqa/maXRbPEbSiAZUZMXPP8x8KPQy5iPKf+Iu8FsQ1TULZ+cAHyQ/3oogSnFd2IYXJXDy2Bvbo87Hk485N9LYQh2MAGTYPoJ9lu4+e9O3UoZZRNcef5Qr+WKXleZVioKltxgspr40W4ZhHPIkPIkpaKUaFWY5VvZL3hdaPxX93jxjoAcrNsGaCwF5IvTbUFCbMyHP4fAFapobgOGtZqcVNwbQ2Pj2vH2HVty4j5wHyhMjAjB8tve1fmg0wIzmdcKbcgE7CAOK5pmnFvrUfKPLHuxusYvomYgCKkw/5j0M8geS0bDkhGbbTAsh+O2/SAcvPPnnp/HKVOqDCJGCFat/XsItnjv3jBV0mo1bMvoIV6D/5U6SnIGcRl3K5ZziTSREJF95TZn5pPb8apr6AjrubepvKWjuDteVl+26VxPVDyKII5pjSUPWS5A0PKU8sNifaIOI/tjVtcFa2PzbNrrrzYwbyyEvK69tovBXv3MH13g7HP/idcow2t+0N8+XGEcM25LSqoLmqMmOBxTSPOiiF5LQ05A0HjVbswzSxDiiu4N8t9Ulebi7Rd6S3q2iSuvLMm8ELUGx2MQlwwCy5uugDG4oIeex796YBgWMv+hShYERa53ehIuwtB88jHO0/ceK/PGfQ0oP2jZDAOJqqTMSj0/LKPl7sXBMuTxU//PxtD83qj+4Eitnnq3i45tRnQKvJtpmBiViHV7qpFmhcE87jBte8tUp9/MOInAXH0UKP2cPxyswsgQacKphj0hk5el+JV/S6O5mbf3juPNot9JGHRNklPwSQazVLDHbZt9gpehxnwvk3mS7GBtP63KAhylPB5WlkX2yKubjK1i6Ge1wNHOYNDgZGYJsCpTKbk6npXlK9QHnw5yKsjZ/JtDJEZm+I5ZHJgmTapDZ8sJ3qKipX/Nh0EAQ9G4vrrYnBhlRCvC12GnxqxySRRdQhDy7CvjHlA2BTbbMtZ1VwBBmC51tS5AAuvFAR01BTswSmBpbEtU828YoBaXVZ4sLiHcrQ4XiHUKH0tGv1v0H60W0xvtL17dBapGbBojW/lttqdJoNo5LMh+4ZjydU/C9HxTqb3essr82IMUcGdAnc3FiJ0sUvHvyLNbvI5a5JKmL+l6+mlYAjcrpihEqoikGhNDBklIaotE1RXMFjatVn3rNO1kdxqRKb9GIey6vF7hLQAI7Ce6kbXexTzcv4SOu0MSZu9ArHmn0FyhxvqlAiqYPCi4AISKxWbMI6opw7SoSFNKhbqpV5zAvjf1Ot1kgMIIT//7/LLujxEyOZjQMVl3hbMPnOZy1bUpEr55GzU9a+Hp8/LeRcjlPQQkxxKir3rMhiRwRaf1ESwMgIMHx7vUZil6HoY3P7ObQP0lyEJ1Nu7yRVsvAIvRQsluB0R/6dleK8dB0rsJjF44DLKMVCTBEmsUW2owUdu3aJujxjnOh/p1VaQMgHkZd06Hbc95na5ML0zIOgPMB8sBB6Lc2ZrenI0g1bh5KN51WEO43gmYdnrRbiAmqocP2FaujC8YzAArNE1mVhgLBzxtjJrR8py9BOgHcwMQRv87jm2Qb+1Wv0sMgAub6WyT8X6IO1k2NjpX1VVbbg8vOnCVFCsoXjEUSjCqKlcaS5x/hX50tAbRxpGHJzmK0GAfJFtsw78DnvIgVOsYDxjynsBcATJ0yx51eQ+WaxMRh0agtgsYiOJPwJri0eS5jvceRw1lq+s8gcREVLE1YcbWOR/+SJAsFeo6PC/fRGmrU9g/GAkMolLOvnR2ef9B9uRPwrqMnFO2dfFg4AQCaKgwPjifuK7aoibJQogJQ69zOyvn9WIZuez6YpNkiUAMUs7aJ7uB8/4ZsEgfaXaQlvj0CJVOtR3tLWP6xyHMtSzD3FDKadny6he3d2yJkfAtQd/MjqKS9j3tDBokNVI/0Ac7kC0bkIZOm5XXe6aLQREuKUoK9sk5phYvE53GuqIRYYVcoNauODqDX9p8NMyx/+AdWMM186j/7X9Sxzm+EVX3fIzWsV8l4UFAI+uHPDBhqRtiCobY86qUl0KXYHSmsKk13rJxZYTzEv03oOKYZH+MNhwb9o/vMkVRirTQhDx410aeOqwo1a98P07y348vtyjDYSGYVJ5HuQj/TNkdUTP8sicp0yy7FYmIdkEg693/HUoRhVbBio7HufYM7zinys9qec4Fk/V9Ga9ukELVOHa0jy4HJK3VWvk/AiP376KCoBsDQCZ1mEndQHM0SwCe+zQNJJmhC0KIudMxp/UN9wEGgCs9U+Vb38NIbZqsnGkXNxitFpTu9TXi0nh6l9GM+lrq5RJupfzOazeB07V/dKFHP8gcD3wL9kIcyDQIrHnFXYFLuFBrQSSOltm7tPTkFG0th0GOD+eFBeMvlppSDI2T4ANVpg7gAqGcToRP8yYcrGwGXWGU+/h8JjBUXvMScKUlSY1tLlUwV6HU/7o7Ne8vcW53akuNLqNTV93lw/UlNslADi5Ik/DMkSucR6I9V9jc5Wby8BusuSyaWTcD1mgBjRTlRBsAJy+LpeOt5oAMmXeSnXPoVDLqWA9vtrCJbVmFe1EaocUvZtymg3hRA3+GFyY+Sf5lTa11l7aX/C62oyInyYJo/Vutld3fZPq9G0OI2Er3gnwmiyWrOvrSU/X7ERlZZEakptfXq2DKDfVsA4EfeQaPU7EStxs9Seac21JOm+fWhEkOGKAfUe6f4E10EPfEo7V/uVGyPygqbAEurs7bBtu0+FhZN+p6MT2nhsIyd70Xy7rT2ODR7ZcKu6i/B21vHCS4OShKrSluKcyQ69k3O39a9p7vabYj3iHuUH8hll3kX6Tgm5lj/Ut43z3AwcnoYQj1bJCT0Z63aj9iQYgdWuKyzXSl+Yy2a5htP/FtwAVUbd8esNNd8hWUKDaiTxXirHpV1bQn/li5+Go92dvqEgp83jF2fI2JvnDyHVuzPp+7K5szSOYledQflYlkI3NdI0sEzsKmAqmrj8ApzM95WTiDvkQfpiOePNMpb2xLeQ1MqjrRA0cUEux5Zf5SNlFcgwEVQvrfPNCr8ghoUol2yCu6ocCa9Xg2B2vRbCSiDjnz/oWSKKVUkreFWglyw8qVAR767JsihVCx+XFqgZ6dv4GJBNJlhPy8/O5b6A3vM8Fk8lump951F9a9u9M2b3YJKdDbGATyWA7ODa1KgyWWPxOWXx7JpjyWFXTUB/VvH/iHi4IyWR79mfVxKuJnEBp8nQ64tMp3ot2WP+AMECj60JedZsQsvbKkoUcoHb7cu7DRy5VYwYmGfnFMONaH7oEJP6RHSaBYpyfrzOiZgji6QEXjdMXDZL7Jj1U1sYNHS6Wf9qH9NyFL4w0rJ7efs3x+Z+Dlh4FweOeEck5UW1Khfdg4bpQax41oSlAcC34+8zWGQsctK/Ravak7rz/tQqiSVi6+efjiWxkACZcaYbVegIx8HopIHOrkoMJbpjUlKUn8o7bl3GLlb91Tw/ScXHZuk53Gi2a1c8eyvZ+jRD/aHbmxsyiqt4WFG5pBcR6aaQh2IXkFPpC1yOSLguXtmF2XdPKUakCz5OwQKcdylA7dIbyKCCdxLgWccdKLuAQvOY5IBmnXIxPHZVW7Ad7vwgu/5LDFoYSvu01KCc22LZ03OryFIPi0lmUapcebTNDAPId7bwjiPW/FhMQT9/3nHIYcO43VSjMoqRytSsCsFBGWOAmqPu1YhoNnyCiK5ZHubzfk+Iwb2GcwxpzhXWepYBCJZ7l/1wO/EdWmoSgspI0/1GHYqJ71i1JFkR+TB6eMJ/MQHL7Hn36V8XgUZIYwHrqjTh4Z2GCUHgmb6qaFl/dQplkDEIUDaS8TJD/cf6nVlx4v2wQ9uIhwycgKAsFLPPP62FAOFcloPxn27OjZTDq9GHp4E7w5xEkWGHbZKVMzgHGw9THjBleK054vn7NPBoX7jZUWJ4SNH+xypOj1ZgwFyv88SO7a+ZJApZ+WAdsz1GORyVcAyzIIuRleEMZdikcP1KmAeNXUWmYwA7JadVlltVmML4261/kdNZ/RKmfQdOTjoLzcccPvMZqde0tHyTW5fWvY4yka+0ef0Kv7nQkKe6mb1qtvLyh1TVrEspxZgZQOwoLtrBj5EHYmMCv98tPRBwSAEEZyjnPSu6iVH1YmwVqRovRiavtadg7okMofE0n/Rk8IY4PApf/17w1eT9ibmcC4Oq4mDX3QhM/nFBPxjuonKka5rrzISwZfMTMb5ZjawbnOKbShx3t6kArdVEcDzgFrfzavx+/ScN8NnZb2wQJsCyphISZuV8uEwvgzFa9EmKEaOHWSGyNEI5s4UIvSFY387t3/fiQRPr2ODOfQHkpNHZBCifTF+KNvhXF+bvnrx5avaAWLAuZEuCyuW4RhavMjFVYK0b9K1bkm4901CzKJZCa9LWNXogL1+0B3j8w0Kq4dfAWcvY3cTb28jh/YeDfU7baJwGlOvstNUILyMnCK7wOIodErlKr9rKNyb/E2beolCBe99y/GKltdcysvMnfrR7p+P9SqMrYuxZgiX27uRxOhZps7JPfv98AzLxUdyJaeyRfpDTfM+Q+27V8hmpOyh+pgyBZCDkT+Rdad8x6wmWK/jkKyF0QSmQ0WIXfzYXXLgCo8Pl3i1qxclw7vyQg2EuWw6b6pmDlQNUdQun3OhoGhybn76v4Y6XsMs75r50xnx7LBcthnDpOrQ/KscK1o9gKNx1DISLOH7/4i5ejNNNBEnJM6tA8SoAzwQvNJy1lFHJI6MjKa8MoDKreJpPGDGuhnJfQpeco/xIvoVw3iZvOQt3GoGZZ/krOEDXtAA0QpIROYepkGpTykzBVsXUgEzC743yCXONrPoLUs7Z0B+kAEyoXPnmbDstimFmpnq2ShKiokZE7DKNvR1EoSCyKMYeoXABDle7TZ9k7dCSxFO8EMK4TGMacvgR3sn9tEEiI8//kI3nOHY35YHCqgPGHQhO+UPd6TIqM60avkGFW43WMl6PBAu4vy3t5+LcT9xkrpsBU+IaRBfOGFQzQIDM0jtItndv3/leKhdPKKfyyaM6x7kWXX9BxVSiuJR1yJEcRJzFaOaKPHgIKjgBLQm3IATXDBhZjraEHFE+YPdgsGLPVerSG2cYlMSl9p6J/OI3CzZfO4u3+lWfxcsRP/KPzrCYvq68mGUM1hrKA1jWxtkyVNC26NNAYI10DHChUX175zMsi542/Sq+GhqqofO0U8bkK5LK2n84sS2k0v5wsCRGM7wrqJxIMcJvH+bfmoR6x2M9MgIzTUoPngW5NK2GvD565Fe+kkeiFVu8jmS7hBxOHQmcekhI1+41KUxC3VO8TI9yVrL00v0MJhL6/3C5PAgrNe/ljcJh8Dtp4SowZNGgo3hfVQpu/5CvLQeNeE1z0NreU2bksRFTAFz82AcX9l1rSeeDrJ8FF0H7jGv3z93fDb/wVVS/YsZqenvXkae2RmP8aum+4khR5fZKMGM3FUNf4/OUJAuTve84J1Wz4nkWiegj0bcu1+Ucd3SqVuh9BtWCLOtZfK3nfB0IQhlFdJG+4ZHokDChBfrO4tyogAf2jwEBQpOujm1GKoXmloDbbjHS1MO+DV8fjSjMtzTfH7QNnoe9g7Uwynmo3bMLGZUMqXFl/HHfetqgjW4e2y4Vt0wO/fMGhwp2AmBSXKP5fw2i8fKk3suTotJcPtQT7kHfziu/GRNWekpnCSInwrkkFDLkn80pCuM9I1DRbd6QpW3ZbEop2qh293GEAV3NqYwaaG62zM+xSXGT4zp8srHuKlIjNIQunZihJN38itsNVBjpIJfJLNlQGDyDKQJ5MLFDo6jybsM9A2pS1BzKkufLhi4YQAidr0OCzgcu3pohxYzOLYWpwcxzCa0/DJnUGdXSX32hY+6EFhMAhBCNtTvJxRKK2qlJctkU9SprzE/dYGZBhSvEcqJjdh0n+/IJbusWnkKEufQojMVlmi47AW68MIAIThWXn6cO/yOZ3EyHKR5X2pnK17AyhWd/BXZx2RSzQOzt7J1T95Um59wWuuNBVDB0VT72cCt5vpOczTcS8jXeSKGSMWH1e40envWZ6DkvF9fjmbO0E/bGytoDwL3+pSIWkn3AqCED3g5FYiKBcIsYEb6YspuekgACDqswJKL630zBdRhd3f9tY1HKOd/grCeJ5WE0orn1D47pryGhI+LT718m0pUgOCkeXqklv7pHJAcqfPoJyZ45gvr9QbdUTR8nbq/CL3UmhINkYIJ4IfVM64yiqfwJ937lmbziLtqFiOVkeTrbM9AQ+T6FQS/b79QQppU9PoMHuafxDSWCSoEOVG7cVIfCGQ9BntRvtZLJBGd61ZUfk2FaQuvF5tMpXvZKcmCHMLZIqZ8udphVFA9KU6CnGCX5EF+ST6Y+yhgGmlQXUJCTKywwBi+TXiaycZBgFNw7Ikpm7WGKOKwSeOH+B313CKvp3b0szakZ0T3lmdb0MYTlT1KauHexLZ3rY9JqnScC9OF2Nwl1GS3oTvLbL5Wgx4GTCxi/mydqp5Gm9TTswx7z7z0ELeTqA5pU2NayGC7duTkyR2M/au581kKE0rvJBZjscKPqCtvWFiCxQ6fSpQ27AemniQECBp7RixRtQApkg2JfZuH7kw9nNzM5ttKSccSorDsFuM/IMJVE3/POI5wPRBWdmHhKBX2Tvi5hcVrWF5+Hghm8byPS+6UHdbkJ0Q7llL66ho/X7uAcyMTTnrblGehk8t+XMTu2FAbYiMaWP0WsJsPG9d6LL1MA3n6yQdp9kUhRQbqEd7k2O/47eYKVwkcS6bknJNyJ7KNrH6+9fAD9MSKVdhzhCDCQNMKGGd8qKRph3In0PMTe6TBaOkHb2B2fOt4qM+CtC3xnKXZ8npGxaSRGW9hsse1zGnb+oc/T4AUrlDe5uKahxgmSklq28D//Dvy7ItxIC1TCcj2XbIB7aEiH1lmjPytWSGP8ooYQ1kQdih9xPCBZoPpL8q1qt8Fn2Tfr04C02sZ7l2mKBG9wyclbLpepDsMg6h8iTaGh7SAZ1jSfRdGxLsXLIJ1fJKFPZJBypGWrmI9A5LDj8xNMnKpICqPoS3oxR7A0kNdSW80FZYS8zX5ZbKoJsT9ifv1BBnAPRYh/1KOAQDtfehe29bIhwlQpG1/aWyTUw30D3hhskthTzsZ84ArGqerbC/p4d4u2rQevvxq4hq3KMiNeNOPDWQ5yWYRi5SNrYxhSVDah3ERmASeYPBWXqa/Xm5o/uxDE+5vM38/XnQXFIJVns1lqyMJVPdCl6xN0zvy74iW+l5ZoQOQkCbTZvlaHdFZeTdZlMgyAqZoVGU57zpzJbpzQgDv2QufDqmaLN4f+kdRZVYxehZcEwYby6Fg26wZCw8sL9KDrUlAcCRvYMhI0a285wFaQmj6ljCNfiY85fL/UXL4Sz2q5NeMsuNiUDrRgjKq17bYCXO0ylzQPfQ1qFO+8vaq4eT2SMuOZGmxof9BVPz28b0hG84DleXYLTM2pU82265iYXvgfXY03XuJhv9mdQxeFo0uIDuoyArCQfF5jDjQgRz8Nh3JNobScsyUps+/dK90vw9plXh5A1yo2ItjsBG7Qe8aRIyjHS3LRlkTCOuSpkWUt9tDPfTuC9f/668eV7PawOb22QYhbfOfHn6g9SvDGeYrepD4/EcCSh78OLsScZMDt+RtkWgM2P/CzrZdZH/ja/VD6WWX/fCOV8mbj4q3qG/W7xE9eHXMMwr5xOFo7wXdS7F+hjXi2NHfvGOtEW8CdX5LuB3W569z/QM2wpatOd3b7SlJiyoGVx6ebdNX+KyxYWvQx1BtniSrjP62QohXfzHJOFmS3EiKbP4dk5ppbvauLC2M6Yde2AAiHnOMscnmmWykSWN6wnUCk0y166bsJbWvyaFlDa0vTz9mgrOSPHnp7dQKQ7kI/Asi69ntCu+9RvcJSi6jobEUUCIA56y/LznDfYOcYG5/zCCAOX/sd3HTuEv/hTeT4hbxuNAr7n/tWbZp0rkOiqsQa/Inja8i2zQK1OEsHxlE6nW8UVkfcZdcpm8LHGauGNjVy6vOtYRf3xZXTRmA/xXPGwaGEOZivxAjP2rkEMdehXGXrayr9NJdLyuUySVdpYl20UvqPAwJIlZkbhTp1dUdpGWjHHZJWVZXrqKanVeM7JMFkCUMXUxP5ee6RRcQDYiH52gHDM1Q84ZUzGhBBk0bi/JqxQ+c5y+Y/jf9/ICXnKU52j026qdbuzseO3m8LRtupwwYysKkGYtIDuVqXjWZj/dGGrTpaJA6CdGVUogYbtzYCXIjkGMO38trpoYKOhdDOf1g506Hns7b3bebdK31fIg9JNODSku8VxHuRLr0kYajBBa+vcM4UzO/TH19WkpbXxQWWyPXO8E715FOw+OeyLRNBDO4cj2Ld8wqugEQhrfh32ZTb17Je0FA1wb0STn1yGrm65UFrt+DqeBHHhK1PErrIz5ltEGbbj9wyhRpd87AnIOdwivQfy8KQqUEyoWM2xafM4aeGTe5Q8cFTiUfZ1sOWl4IHOE32L90oPwGzikzbAuE7Gd7woArNBpC2lSw+sf3anFa6GWkEjF7k7YLuq/9aVxDZ4dYrDc8b7xgZQadvnjgOKYyGTPme35gQTXcQD04uHtMHrn3dPOnpphkOstNAm1LUNwXx8e5MbtbF+ozrPrpcjsTVZW3S4me7KJ7cIitM4wpVz+zm5ymuCtU8oV1Kb16hlWfJV9K8SHIUPk5Tu1QMUAFc5eOcz+5kV9qYF7td8LXWV8Gx5sRAO1PWvNoEpxXflirR7BOYkkn9Qq8cCgr/ClX4ZxRT8knn9jwsHNHxdSCRNWbN/Xz4WSNFzUdZ8UhHlxfsXSXbpv71O5tnpmyFpbRXNc4bPtZnoCngwwmzRB+LqXzTxFhrvJm0aiZROyCOPcaCSNY7Ep09K8aqZBmuxwR3hN5EPzWNs4QSGdgLdiBGPd1EOM/FHBbS0yto/zv98btATAS0yLRbSkDtrLGgqPGYvo80uaqMB5BkHTtnh0urjAfOjlwQ4EfUtqCCxhbgNQZx6eJMD/j2I6rMbuEhJ1sPwPcrPOLUofvs3ie8/f9FAbY1zmu151BFZ1Q0971SQ5emsgR4y+zXmju1wscpzgkM7Xa4cDbyn28Bx+q/IPuFNZWu3nEt348ZidybzLTXIAgHUqGrnMxTERxdWAZK4Wp/9ZEouQteQKYZdnUUE4ppEztc1m6XzkPdJkRAAV7S91pBcJyNdX4drTvzU9ZIHEPcSrQwGWWZVDyYBvRQ1lmz3TAu2THzqe65ywrKNSOhBZkm7g4xFjQuJl7hidjqWziRbaf4aWgK3YqfygDZsSWVKdK7FmAAVVP3cdvaplQXWZ4U55a/1Z4AQFQEjjEJXGoo2gIzSEG+bn0HcizndPuqc8TWUDAfvcCJSEJeJkOfFRLp8hitbsv7WV5tdsmlRWRFwMZBFWf3SUpfpltAcyBhEihWiL2F5Tvs00/iI/vSZrATUueHtOPmn2T+E7o7MuNyTEPgxZP8d5mCrp9969McEtBNdq3U2zNN+H7hJOCK2zKLs+AgxzyvlI2D3yoHRmqwTcQlcvN7rclbFrr5m+lrxDQ66I/XD34iATJ9btrwV6Sav3Hfwsd2sDwV/feNc4G64JVRhdKKz5w+X2HtPL41CX/oytT12Q/MqAvXSq5oxMK6jjZJWeW3CiUy+LgN1FpdKpRuzDkZ6yYmaIipDFH1elpXJSHM1z/Q0QulpUAs3Fth2QLlDAAdfS2P8ib1zVOyywXHHw+Cn7rCMYJscnt00BXTgmEkNl5sCkcOnpzCs3tvBb9MSm6gOhteiDwUTt0xnC6U+Ztq+BfDakDseeeW8kQaUaHnOVjldMleKnTpcyNuE5cQcL+/nb5Q39rRDJnvaMMYfwzdG5WpbqeiImLoQzs7rTKz6553SVafNES2KBxCP4i8OVNSAs0AHvCRHFNVPt0O5P/KNGOgLc9yaEPgap7Z0zmOypqmNEG/wccW9g2WsiVLrbjN8F+XwklSK2yVpNPnjXu7QSQHavb7YaNV0hOCX0WeMGbnAuhZ6hKOj9FpVlq9lCUdrKrP743f7MCe50FMmKU9ecV0TMLuBARynLCCxZIWtObk+CA/M1/cTRcmiZruu/T73Q6Rc9lO0ycjjLJHWkx7YEIv+n+YAm+1XM3i4V2abKuqY+/Fv54pqx1Z3eAh8BK0pdfMWMO+3eeaZiLojFjeyCgNei1SNgXmvEXkXIBg8YI+Y63Pc/DaL91GpinrYfaSbIuBLG5tqslQKkBffFhffJAPyDh2Nkc9x5A0WRMHxSmNAGA+vicgXrUaxTpOgeGJxVmO3bNFxA+ZFkEpTv/ZUkMFODdq6ucqqwqPnuvMXxu6EsNKTDnl6dLhlgcYe2ZXTPjY/roNHRk03SkIDm1CtnWyQ/UQSjXyBFYNNzMDy87y4WMSjdChr+L5McMPuFYRYAe7/ObTIHYBSKGJgzOeZhS9fk1+1yDATsZdIlizkbu7b44GWIZJgz13TyWdteLI2LX7ao46nIM1uZvJLthOuzd/9Xfq5W3Ji75P+KB2NodIxIVRPn4SVJp/5akcPwUCxmeDq2FyCvT76Lw1MF9d/shMWJoMXJ2HcZb1+KBC/i0sTKIzsF1yRvSMOVOxhWOOLwpYAZDMK0K+Glo92G72vuJMUBpipy4+ZD7KS27if3IQMCQeovxeLFLA/s8amoNUugrGvNXc4WZuQVXfgiG2xVrkxQwVXK5734C3svLyEytr1Lb1hldX83TcLS+qisREf9uRE70wl0vKsgYiX9PCdoMVq0fVgWAjPWSHXnxOiEBDucvjIe01CkKyyg33XbCVQ2+PgQfTgwktuXaIBcWumq6jVyp6YgTu6ODbXDVC2HuBv9MkihdkagFaGofi4NBGA38+XQLRjZbPVrmAlW5xMGOdGF3lePjCwnkn4dNlt5SUvweX+Ulh24klNBx4FO9wxIrjVeiRllXIA8xJOywLLGsgXosoOLJGk8Xn5WiZh3pPcPK7ACvnRV+fZwsA6JLo3Ca94JoqNlCMCxI7/wGKOxjVqOPWvNF6d29kwBn+mvBH72XQdUayG1qOKOVTk/lfTWHLmFAEPS/iKfS3XQO69Yl8OqwNCeshrLgJcjcRgxVExJCMRsL6FCWw2FCu3+qTBLq7yJBdR/0pq2tst5NpNEWpKVTe3Q7KqpwVZLnaHUKIOE8sRmiexsoZj0rYrKZZH+48n6jHsUVVDGFpFp47tJTGAM8aBwO2ptu/G1oAcjlyoltqNda2UQMT/kOto2DbzpqFoWnu2bKp2wbzyZLnB1Tmzjwe7Zf0wi3t2fw9/8AkF6a5qc7lf+Z6X97JfamVvseHS46O1Wr+oC3HNgNr4IwccuNr62CFw9xXyvQQDvIFn0w4O+Px34wP4/9eTDXDZauPjU0bYQwgfnTJuuLgp/Ggay6lbn3/zq0FcKA8fmOsEpFYNLWlLuKDGgVRVgNajiBiKTfekNuNOo8pKT44Ai9cqIGsovVRuciMPeiS9FzBjeLiNb+tO0mPGzbPWqiChaxc6NM9XN2V9ThqTAx17tyBcHe3Zi/T4q/aKmU3jAk3mKLHZwBMms/NPhzBJxSQ8T8akWYg09gKA82YpsvftWSGcdq/u7GL2NIkFuWnW2jSJVIPqADzs4Mt/3zgFF7tB4sU7RI6vJgwV3uADV4UwHNUyRycFLaQwVrHTaGVohKDiRT0fw3v+TssCFBXEl5JvpqKRsvDTLCHxoJtyvYi/sqFu2piM4YRfa5x2Pd19e/KT12tTncztys7RSas2sao/sjVWYDpOizX7SzHlXpR4tm+lrF+pCyntijz5Gi5VHmlsDvFJuke2bQ5YGo1WIV0hFO3Ps4KTaiVUllMK3Hu7m7NOQ/3TKGebkkaXJr1JyjJYEx+Pv23HCNJoG2Pe/8rvuFw5NHGb6iVzQTGbaM7E0J3/Du0QHuZ8Tgs11iO/JN0rz7/kAiaYag3loMYEzG9gJdkXIUMVzZlonvGt5ULQ1rKSSe1Peri1seHNXxTh7INHemSUQMcCA3P2d/c74kOlZJJFR8u2U1lLNZ426LjzuDLPVM4bS2saQs6lfdx1GWSBu8PSUB2LKHbzTYFcJYjQ6Rw7CGx6B8sJ3cadG2VFQihg6UkQjPwHVU2MfSMhPV4TpJw783Gj8sizvdMsyK5s9zDwQJJOvX1mP23LIkVoMlmVMl/h4YfQuDLiE0E1O0ziJe/CflEkb9kjFYbY3blINLQ1HVkS3qPIQG98coT3BnJlVnYyTzZqLGgnJuX/GzShWbDcHcQ73dVSzbiCo/j1IZNi0VDctMlI19OzYPhUKIaitY98YDkW03B4aPQ6javx7CGscu7paSQAs+NU6RxlJ1FYPNuNLUoIv7oaAbrsAlJo79ZER6xDu3BikJY+YDw667gz6wALcCXEDQ7x6lt7VyERh0yqQsCZmyysmAp6+Dg73DSF26V5d/r/bCd8W5twCgMIWKjIsRDu217bC932vx8qIcfs6osytBq8NzSPhmdcXh19Zd0CY8Mb/wlfaGxkyBtzOqOaWEV9hZD9SW2TipTFB4VoysB2tQEcGRzteIBRXNBzf0tGnVgE3IP3iY4R6b4OXgqeimDRpEbXa9/d2G4UEo5XoJr3oUr4/cKbx37XnV63C+PR6ogb04OV5DqI9wSTHo9lJrqoffnb+j0HhGv7Z5UaqFxwygtKTwSdkc20nralYPG3zv994P1PObmCcSQE4u9F5dHPT+9HGgPeq2l8h5Iwonm+cISGV1qCUs30WMBtz1gmb2eVuEHaADELNglYE2Qv28cCaNfjhT41c5LnE3rFDqIqTNGk1P3U9xrW7jDqQtaTkkFykVkqekgmzdpFkiOnL+Ee7r1OIXM1ysNlKP6LCn9rbodMrGBXccIu4z7ynIPt+YYQ23hXY+ifd3iP9k4Jn4C/PShg6gsPR4x4BU4y6qTDRIZrduRKMYNCBbg7irttjZOdDf+qcbDLpEOp9BHa6WK4HYC2fEd/Ex+Iq+bMIPsZPMwU2C5Sk+h070LmUP1hC21CLjvK+DOzaTJ51HmrZ4pNviszpFUw+YT91QXM39rjOedLR+0rc9lFIe8KW07Q0zr/nJFhyyCDSZmsrpVBTYLcpYc07almN2EIPI66AD9fpIAAAALFIlmY4vVnwAB4vMBmsUCvVz2h7HEZ/sCAAAAAARZWg==' WHERE catalog = 'TPLP101' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4CaYGW1dAEABDna2uoJhMF73Ko0yy9Fn9C4YwIU/WsNBpylI3suPMsPl0l3OfYidxe1zOeVcjYiqm2y4xxw+Un/VVku2bCru/eogNjLql7+8lg9kV7ntiyP5/PFm5NgmYK+uTowKroky1DaV4A0ovOn31C9oR9k/VHnC01BBAckYkZgQOWUibSvd+FdngmL5OhE4HjnYGmaAqXpafiosL9oOVpC/1WMiOad+6Zvt3N4k+GP35DbI4l8Fo0nhX1KuYA2bbJyD/dObigbrblOv9TYtpBS+MiO9ej8/lR8bg51GjAbnT8DZYKsDihDUxZLGFCfCG19+j6xKeSuMc+hH+w7RRguu4WCiJNQRd3eKRdi8RIdkNNEoGguddFxbk/Jxqy8p/43bLp0KWxnHo9RqG9Rsi13AAVVXGjb2o97ktmBC+m/pZSpXKN4YylgOf9rqACn3QI5mBj8OjSjjDqh0bMS/4/S8JLDP2JiUcgzypDU2jphuEiQhpT5nUYtlxbj1Thu/mSnu+j7y3sdf4/uuCXeJEeSLojeegvj9FTtDClGxrfMZo9nUWJTHdiDJQTxnlfi8afASivsQnouDeEwhkZLvRDRODi22AoLx1Yu06OimUxYxoXMEV5FK+YaWPrO25M+7TH6Sgoh6wOD62OH9GLuTEGZoBbhB/c+Qv7dXcRw/Wed5c3nIh0PsPDPzohNHjXo7cClQVXEZMOcBrdSDUNh1c264+uen2SiqnwhN2Qo/l2jxo0Z0KrLAzoDzC4UnK2jvwnLGBg+OOT6+yOEXb1MHX1f7Z0gE7B7jouFqYJypZTnqtYvaWaiZLdn9UcBQc37gsDA2fE52GhHNM3IYRlbiJi8IlqwkrBYmpD5CfQmCk3RmlfeYZDfpU3n8R4caDHooAt177/4jWb5VmKnhQMm3kU3UK/8F5r35pIqaqozPAReuJCrT00pX3bLEdFDXTpuoZggedBx4jZXygmwXWMdHaqXoEGyzAvTnMxcpzkEpuA1ZX+OS9wKP97RDN3v9gflpj9axkD/DNfSQ6cAOY6uStDVpsjNij7qkQ6M2wVWdbhvfiEyXaKgFNhRv2zqe+GrILTUweP3XPGbJyqyLwupjGq+BfkfQqdRBpJhZfqYxIQGt7VT9eSw8nX6hy+qBTzM5VURojh9t2QF/Z6m0iZh+1PCQjH/i7qBPfR4lBUGLyrZIM3PSN6Vl1fdVX0wdgl3rzaXBUzmvPQKe/M7rGvGb27zChyD1N9euy31dxFABHmYEzXYCCh9O9AURbKXF4f6bPffngS7gDmtRfwOrlu0B6AGyXFZrK8nh7WIXjq1LTDAa9WbY/IsOl9hA6hP2JcOsXIK8aq3fHgfoLPRScGWL8vvom9SDMgEQFvE0pihM8UEwCmYO/sQJyWWe8S/2XW4cbIWlWSiDl3dcKbCfUgMNz/golNsu8HfkV7hVOPcjvMuGxcvJer/9iXopg0PcV64yLowliqNIoNztkDZfZDyQ/E1NXp41mjPiWCpzOsX556nxo0DyX1/7aky2D1TvdmC3cQzPUsH2BOw8bAYZGXCkOTmGCHhIo6W/0JYvjaJIEtYr7wGmW7G5v9x/O26v12Efgtt1MZ0ax8A4vrOeMG/TCZCgOllJbNvwqHS+DkHnM5lpQcW/3bMKhgexc8buiQNeFvstcEcOGSUH4q4+KpUtGhYEp837UisWFxr+YjUPNgfZJX44A5FH97cI+WDI8y+baDAZwz+GRDVYYrr6EIJQ1S+aVhVMVSVDHB4ez13r4plFMzBR2UCFeSFj6LQRhMCZ80uF1sLuUMfkdruXdVKxkvf1zyuTfTEuH60zegX+4bszXUyZUuvwAg92fW4+tddNup8CysCQUZ3E/UrjRbcPHNh8zvftOciJTCg+dORAemwF3ci1uzOZvHKoa8tO2RIKjw2Ux9HjkIVC8qNsHMbRyySYzuYouXCuoHlq+uYlWqHmNUtK7AXqdwQMAb/SIJmTlRPghmzWj/b/YX6kc9GLwLJELxgyDNRzuC5BLsfJiDiUd9Wy10HnMcoAcS5us8NTwRP+Q07ohDlTZD2i7hsfg6dAQw0QvlA8EuOff1nCPsMdoF7YNN9to/wci2BQHIMqpMH1ZSVB+TQ8XgNSIb6Uoj4jUVO38W/jDClXuSuDVSmSvXrCE2y6RR7Jdd6cqtxOCYKvtPTlOpzujDBrl3Pv3nKsmklSvBgRiAyRYpJR9R62gL4S4xOtMCWj1EC1awc+pOHgWmBvb3lSqFpoJiP7Fh7TBSPUfe7Cwigx6izybCceFye1mySelAfbQPjpSrcx6SA+sQmTq0F6EWRrRpyLPQM1OJ0IueOh52FcNuYQcKVddD8BjzC8WtUkM+6jfp9XzLJA5jV9HwAjo+5dVWAq8+h1xfOeSbUR5fET+7GuxlbD5rhjVD6qvkCgmAffhxm1M8Gw/d9RvUD/zbnikdu8H32zBjHBbClLwvwAylXZBouJ5dnqaIDpoVbfY/OvqYNuY3nbWkeVwvHkQD+yHItXKcrM9iSW2Q35oCdbywqR8THsD/6ux653RpPAntlpCRYzbOi7bdgBPIX45IYzUAf2g3JcnVB9BC+V2+IkPWum6TdYh4ygT3SHkBcOPyIL8zJvJmnYZkOFtkHJYeH+5HFOcRkoAHIWpS+OVF1udAdnmaK4tifJPT3pnj/nMLbRjP6BzYYyeiXUKFkSfa1+kDz6qTOG+ubEtc4YuseHWUFCoEJ/OUXLdfwqa6vV2CRlzj28gZd1R2JU21KvMt/zf5N/XaUlQDHBJXANW5I9PQahmbXABncu4ybC5MevBYqW/6DHLW+xwEUSPSekssJ+Vko2bbaA6tma1wVttiOD6eVXslCJBTv3YKQb/5Wi4CqXNyqMBmxFeCE1bOzxUy3qovD+T3oOI6lnGmxsZc+Ep269yNIJ2N7w2ZNXtHqunVFpuhyBKEa47RowxIuRxTWul3r2hbkSa6G5pvEHzapnH3COrkFxMdGcEol8fxEpUDzIfYNprP+zUJ5rMZ5as8KYi5Ku3v3lEtAejcKrlJNZAb/U5XdY0sFnAd2k7JDUV5koTl9jA3bh9pHcaqT99oRrz7XyOPfAVQdsaOzCKnHOhD554Hj3SAc6/Y+j194XqjNK2yzfgw4x4GOmyR4pNsB7NisYrVbqG5cUbLqQvO6rxBfMMN1xCZgHuOc5XexRIibrNH7dSbhocsscekcmyMpx8HSIzkmZvxUuBcb/32Myxtdc0LaI7SSKqIx1TvvVd/yEoMN7f9z978bcxkh55aCuOBGdJVwTtHbm0vwNNKzKg9oXs3GwjRYPuQtHnN2MufqDZzTl/Zqb516nIYL9u5JWNzwThpIB/wWS7i8Acrt7o0LvxO0v1NjPkNmWEtWw9NUYvRLu+doSF83Fpe7BR3WarkXX0CyzkIoIpo4aarIL9gnj/2TfZxETffQqZlPHVIlSWO2ojm24KYzB6cVFGoc6bmtZcakpntTdwxpsQjCvBbNS20BHKot/8wewNYa1bbSm3sl0YNi3Yvrd8AvCEjpcDGwCAo1gGrf23jK9P155x81A68XyilDb7f6wNqOqLyqNnOItEe8CIEMGDykU4dlwLRYw6fdc9slXLaI6uQ34wqwEJwor1drIr3y3x2u/2cgc+edQGSHboYX1GrcKNMDztCAEs4zOFbT1H/h4FttAvQBrNnfbb+AQG5NN2aVCIqbE5ujk7qO7Nq5EDT5RVhnXVAb5mDfHLgYb01FuUVnKLad89WfVbYs6QAP/PVVzFFNJDhyiiUjX0AXnoOzCHu3lJJ7ukg87SJDeEfA3j7AgIiUP59HRKNB9CrE/QsdcVQIM/uPqGwXm4XBzvu4i7a4yTgaiOHb5xuO5mOPxcW3e/8N7ZiepJHSZZtYhRnsUUp7Px5iRfi5VK2N6Eds8jffRpf9ZLdsMHmKVcvwxd/OM4++zdqJceaRKcxwoByBv2NgwMqW9ZPsaloRN3iT7iU9XFI9TxSYmWy28F6cU23vvuJhjXaLtOYJG30rUO2sWaMPLs+SS48GtqQFO+dErOXKLOJ7KEbDadSTlm1ZyQv1E9ThEG2sAyuMXL3Z29f/ZSUooiW8b1t0rY8+ya5kT5bxhlZhcnR56HhHtnuu9S1k0wMs57ubrNWv5/tE0S79wPjeLbpoMYzH1uQwrtbttEzY+8QP4QgEG0iHgvaKJBDqa0i1UVVTxbK1yoWH03cQmwJybUjYKaRNDPK+2qaF1PDW7t53jqIX35P/3Izo28UPQve1zAXZeCk0RWG8O7CplLDN5MWLC5zIM2+CcD0ydvC+2p31PDpJM9MQ1coVXXFIacL135IViwGJkSHKFS3Wu0gGMLvPsaeIHwixjFfGYaQjK841CG727om6NPih7Ip2iY5N5hvLbr68bVNMScNPD133yVx+XmAj15eb8SWBV7Up09yiRIkHAnjn9gJqYQZHzSSxQ30ahDsUxfhDuYdXq5wkeZAbjtZ24VNSYnfJu9/WZepGeHwVJNS4WvJqx/ZSt1X2Kznu2fBb4CoK/6ALJCg0NsY+5ukLK1/fcoNnGjv9bhwHe+QsqfKL7iovdcEMiAMXbIy5eKrKFKOy+LX9oZXre85D9Rh3xELTsrHxO+OvpXCDbifn3JHJMmLsZIJy6l6jlJaungVjFyCpT/HkzT3vIwCB2vI+j8ZvbsW9C6yljr/d2qccjD8ZnHe5yH/gSiDxr+ujaZfEHBcoxW/G3ymeRa5aaVDfzGS8BO/CfEIZlPc+YFnpdKjgESOyJVhXfKUd6IEfpJbVxhdvfjp6Y663Ja2p3Gx3O3g8Po0MUidwD3PCi9ZyZUbVZV2eF/JXv4OaQzsehJ0fnHtCX8eqLbP7ARHS5dp//uam0mhRN2opK2ORuu+8KbypimN9w1GPaPlTdwPeuPL2QGYM/Q9Qak8uqrRfDC1ibD+hZ8u+TXwLai3gCoA6FjtbJ9wDYLke9APWVCt+GbH69aJVV4msQf5dWP6EwH+cvlvYd2U60GVhsujn4gNBOSoLJIDPwQ4jtMixS4DkxfLPoWq0Pq2sTzpk4CQj4QilPBGllRjMFr2HRdAGzb3J9fVmOXHA2PuDPqc0wc8G/b6WWWh8+Kix1YBQKOnoTJ3RDkyBvvFGvKb2yFz3N7A2fx3Yqq3XZRQ912XMkrLvh1Yft4+tsLNc5BYL1RA5LbGEshVQoSVY3+GmSrx4iTkzfkUCG8s17A8ULOZ3A+I1wJ0hMWpHagEAb5b7gwYXaG2OPmXOIltFlleRzwTFbGLW7N45CnU6+bJejUFQdfMIs7BLusmbv6TBGrDIDRwBOPetfSnB9oNjaENdrM8EQtIkT8sD4dF8aTWoIrX0Ouzfx+hZYubmuGMKdOgdTbz7VvCD542QL+s2Yk2h7glDP1lh4NfWkMzE5rgjA2ONpQJHyZsF4bsh4CevHg4A6GNW/6qiMKpwgRUORa4HXLTLWyMwPpEdRtHRNHFZt8uc+Q05ueNC6vpAeuvlAMf4DCxutHwrUgcaSxP9TGUrFiI2XZpZvkGgkW2beX0JAHbtcJP6cblqFAzdgVKOEhJTgRaKcqEHm4J6v1EA2L/n7Evb6oPrtM0fvRHdeeV+d0IvU7ksHSFt3E/31YNUuSiHkCPmIuLRnRtht/2DvKBkcmj0YdIaHKcQ+a32btmpAdVEUNXB5U0WlKq/eTDUTVeTMjoWo6VFfowZpdz3Jx6lVAj7Ln3oTGTUnLQD3rpviHCLLO5yYG1szL7WWUoboe4AK56q/eDpOKNdb+GbNJr4Cheg08NN0+y3q+0R1sEj6mzGoL451JHxPpr446yBGEhIHh86b+wcXLP8+jfBfRpz5ssQcRDUElEgmQR+jKrnm+fBeaSrf/FGzx7EqKNIpz6PuVRdg4iCI4qJy3LQwD+lli2WTsMhp/oszdsk3nq9Z7eWgJ/X1JxecQIGQZjTrhCNYO2Geefjj6k3X/IOwMeW4y8cKI2y2PLN/XB6kSifsFEzYd3EcP/37RqJhCrSAI40/Hbmp7v+Hj793gkx/UVvG0jZDtlE1Fj29mso24azEwcuTIb+t+lsllIdv4DPDbxX+6n26AjCER/xzn7ugfMj2L0TU49ID/GFpn6c1KinXRRE68TUwS5AwB8fvwwykQnGzPbftjErZPyoKmlRfIKqt644K7NYdu+kaw4JGyW6OOetvEl324lkJIDeHQsuot/P9IwzhBgwy2JQwTTM6CCdq+7GktqG5jrOcdbYTjO+DiRObStCnE98mSjAX4qfB4csisSN9NEUKvJ9wcfQogwIP4tVa+ZiMoVbqDW83uWcEE0pOMWl9awJ+HEb/qW7d+6WUmMkpQvLhcHO2z2DPmk2ndHm0QbPs2T2RR5mGTgLOowUYMWnF2kySXNwt3ZfSxl763jEonAwL1Zt6NDKvGBmBC0Wz04e7JOQAwJSD9Ne0G0WsXwsXlSCH7sGI/vhb9sccWxsguphUcmND2b30MWFbp40WnBLp+YyNEV8HBL9r7GoMDc1+8y/U7fLAuQe9z4L1ufjUYl5icPaQoyqgMtnZWeuL1N601M6EGJJDr35RV/iILtmsQmlZO9RAC+JIZCStfSF4u3TXJbKuDTY9AJdwKQ/IjOdV0g1j3/5rV/juo029trRHSpu8W/FOcXEHq+0lQhPT9h7d/AtV5yN4tyGszx9MqtLO1BQI8NOYfAXCwLgjyh1Tz+RlpPC5dvB5NL0rzeMJTspzQPY2zkaVJeGJaYwtNR8eW2i6C45rI3y5tipLTIsWuTbRDTXT8V8m0hM3fSz/JVjLC5Q9CQlBFqoprYw0ItgEdL0IoK9pEy7cslQYOgyHuP2CAvOyq9f58o738OQOiB2xY9kV+Ntx5BBPpdVZH8fm62DR6qx38HmP8xDHFb35ujrjazzacshjLfcGwzyDFClWAgOyS+jJoeHiku7VLZ70wf2p++a04gp7gX0MfrpMti+vwnole9Ana3hqWd9YlG/skHNUsPsmdUPVOP5bUmUUTuGmsy9efGXbEq6WycEmaiyoo9ih+W4Ym4U1oQNU8uIK8bDODrTnRn1GcRPdlLwSLK/yww0Dy+44i5TRqPmpupc92HSuTDVLJ/JmuvTl05X6jae6fcmZ98h6njCyTjPM8tk8aMDf60PMHpRNWrQ38jmv7LVVExYJtCk9hJAjlQMaK1fO4FMVCVL9GO5n8RyVwdLhkShwMoYI4C75qW+CWA0AvIA3/xU62DwYXaAq/9MSI/S2+rj9Ws+B7PuTJSzEOdm6xLWfUJK9iAWtDl+JPBUC64cUEQnsVuJ+K8Bawkf258JH4BUeT0h38hBZ4FiZaBgpH2/+kw4qjFHB1WkEkg+UJDPZd8KmYxVBgKGdavZlyWzRSGoWuAf/HWOZdeFnLSqH+AgBbD1MiSSaV8Qf5A6rV1vTTOWTLEo4AQF9P1gxZ63uL/JuGZN1fUx3Ud2dsPlvRxiwJjNNeVN6DudhmN4k91CGVzU10HCfg7PCJOSH9oKf5xGeoRMm4HXQEwEGOoEW1nnAP27kvvx84p5JN1T1xFB++IGcRgMXf5mUf1nn9Xs4M1H1cOwwt/44Oesz0Fsa+nFt6mgiA4axrbltnW1SucFFdMzxxLWGUROmX46a9KHnttWv3pzYGS7YIwqGwLTgueJx3DqxAusPEDz+EnmZKMG4Zyhybo5iY21uBck0DNBdQSatWEghl+j+qCR1vJOWIK2vgcsX7q2pOUOZ8lL/NfPhK9jMrLH3tSNyGBi5YX3ohWjVSYtPNoz9F/V4Yu/eXBcMPGdq9RRCLX3UPnY+R1iwRx31kxgdTVsyyJTpvrPsQqQ9EvRb1yu5J8dzTugqUo3cwB7YDtElffzSSMesYxk5haPY7nXGLhTTgAvAFgPCXcP9cJE7NC9fZAa36TgIdKNMdDbRdDPRQr6dp05BgKGO0pYUTVscuaMQJj2wIdloCogaDDTz0Q5WfIYDvPY1aiu5vppTDOfckwtu5VrDqopdd3PJbTvaBB8H+TzDrY3LweS2NgQ55zHgdcEM6E67Gklk1hsP4EeROON4MPJ/xvIr3XlO6Epb2JiZz2xw7G5iklNNnBR/M06zAknOZSJWrDHJEUTFGhEwXo/Gqasv8CSp05nJECtpzJEYmnGswA4KZybxkk+fP4TSuExtaHIzLvU+qgganBNakDgnoEQXDwvluee7qzRGXnrh3wLNowjG0jSUxjfCzuuQFVg33VMb80rRn2gOt4T3AYd1FCeslvZH3gaeAfKI2CsTva+Hy1Xl3+QCYA/7Z8vzm1tvIqTGAibGcrZeGld3pKsue+ObU9v2yyH81NVz/FGPAerueXdv7sygt9nbEyabQ0ig3Enwc9ic6Y4Owf0FgKlP510jGhrwlhZhYO9aDx1+uwcNSEYTMHu+pC/MRs1uGpnVfoDokxf9NKzyLQtnLrpJGiz7ERHAcYlf3mnVPvOd5VZXLUVP1nlkAevoRLzbO/0TV5HehORVrZ0HiQUrhGy2jt41BWAEvyhR0/2Vkd9SeRXU39AuM0szkbzROK8wFXlX0Mqaft1mUNewA9dV5LH8HPBq5rQ/NdISCSRXUlO47pF04fHh4zJqOw5Mvu4d8EzR67gHdrilB+ifB23k+KCtL40fUbEyUWhRDMa44rmMsENhcdLMiZLPnR9qWOi4hYVvOgnJkoqiKgup73rggJp1AAAAAExoa1qXPkI5AAGJM5lNAAAm42GkscRn+wIAAAAABFla' WHERE catalog = '19075965221' ;
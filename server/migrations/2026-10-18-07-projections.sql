@@ -0,0 +1,9 @@
+CREATE TABLE projections(id SERIAL PRIMARY KEY,
+                         extractor TEXT NOT NULL,
+                         dims INTEGER NOT NULL,
+                         whiten BOOLEAN NOT NULL,
+                         projection TEXT NOT NULL,
+                         created TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP NOT NULL);
+
+ALTER TABLE albums ADD COLUMN projected TEXT;
+ALTER TABLE albums ADD COLUMN projection INTEGER REFERENCES projections (id);
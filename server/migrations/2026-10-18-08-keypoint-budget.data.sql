@@ -0,0 +1,16 @@
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4A4YCfldAEABDm4nkFz+L+x6KLImvsQXvUTtyDzTMPGteFWaDbGznXryxtl57fhPMLIGvY1ORAhLBStAMqKgkUl0iZwWa0k37DiOuWZbY2yjuDbN8T/+uOqnF7MazpCNoOmn7BhZXKn42ZmXxdPO+O/by8+OAYCuSYmfJxDyS+W13B6gqkf09kdZk26wRqpD99EqRR0BuDX9xpuenKk8FtEHFZs7Wk68vO7CT0xitmarGQHRSUjgR739T0pX1yb305IfRMS7qPGRM3wryldmMb9O5AfgtqoxtfzbhCd/gQitgNoWk1gnHR8EXfKCvEe9MqJUDftfAFj6OuKGnCp+XQFJlZfXoT6QIEjlnxCkplj+NZjSgiyGcGD6swXp34FQebLnfUVlJjgirDksm9BBdvCGxXB2WTMBPDBG8BW+1W5Mmksr2sjlEH2hv4XzQa9OK6ua5OPp9IdhtjT4pwwHOw0oIwXESt5B9/P7cCt9oA2uooV9JP7QYVGwairxDvdAvmWtPsyP7PzzwwVoFWDRILVCVaWlZqxvVFnhIASKskmulUlyK+6cPlEtmAGXRFmBJ6nTnSAxStcRTDEfzaBtwnm4mq/E/qOlf4KmA9X29rv+4dbO0vFHOORnNiIzpYks0f7VqZRgW1DTsEO7rsfq9FKNi5TO9tTsE9+8Ec8V12mqlHOf3AzpidDtsKXQ68nFLSeQa66+p9bCgmr4YrCAzwi5zVYFbM0GNvTJ3tTPR7y/GubF9A1a2ZsL960pUgIr5ohzRWRIv7RLQOU07b2wvlb+XC52G/zogiZJe0X0uEeB7fP8jKjIKD5SaTmFstd26pF5IPahMGb+Icy0QdKlBmf1WKyvS9arNALBbvy6KMOnS8eH+2hzC9MMnmoOTV1GvGH0qs/Nc9h5S9Xp0Dn8R05kttEnmVR9hc+NAJ6WXsHp0c3Q+G5uI0ZLVUcJ89PBqN/ah1hrkeA0ObEeT9UsnDbvCIpD3haZA9yqc8P+JOzqJsZfWW5FUM6sSxHNTRWoQa1ksOIZdIMoegtFYE0Gw0yRXTXD805BrpIaZttpQa5NOqivKEdTPT2HOvuzBKJH3md0IsLH7+yAg2kDDLQH10lQmaZuJJa7l4HEUvtSnf1XAd3GH728ltk5GvLDiCb5DO8C6/l3QYNCwjckP/V3qoBa/u9PALOkmPIVpGZndwZMMpHQjyN2rebVcgbDTBa8IXGRC6KHN2EAvQfSnzltwD6R8didGIvQB1pR7RaHpyI04+fk/RwzDWsCaQeGvYfTDYO9OjcBy5UQ716HNsNc6fYLJk9wQ6IBgQhKFs8fvjMHE0rCSY42zLUiH6Il7undtvYRFBVAVujMeyWm1gWANBj9OpWWjI/IiML4mfveOIGsvVnW/HJ3wsK763HNTFTWW4vxVWPVv7KKiwEvxRg5rebPkjGndPB7Ps+FhsJyoxf5/Abc+gh3esPCbo4G1JGGrpj9hdqlsTLDcp+kk/y4NcIGHTVZ60KfG3sjV1kRfruvUT30rxpkO76a/T/1nYA1y6rvfW9W+HlApcrMTcdWhtqY1cdS5avVS0Wz3/L2YJI9vaqiWRyTSnPXOR66PP6M8Etn7jZMQedhIiDl7XIBT3548LjTS+SQAMkGlBCQ/rrnweOwdr847V5mA2mIwbJLIu/jS4+KUkMDmUlG+UoNYl3lYVOVxe5wQgukuQXrP7DBlZOv/iYunMfzqq+JlF4q8R+yRDEsu+jKaLNsLa2R88b2PgtxdNsl7VW7uPchTJOYu0FtnAyVCNDLu38KzqYYfSmcCjQWhvfMxAqchtE8dvlRqIsrM11KBMZhMJnswRiklRWViryOIMfprjG0nW2W94nYa+XItEqteAre9oQe8NSYqReEpuVVH1vC4PsPc831KvBWI7D/N9foaxsWsdeyCV0gtHOzyXMjW1pxOoExUq7NdJQUB1PjlcTG/JtI7lVM2nlpNOD/vZW1KQFwHEMhudUntHmjf18S+k1bJbaJY2FhgzI/JZ2Qu0nkQMZ/pKP03sgD95TamxRNn52D/OrNWOc72+58hdVoM9Y8ThLBRnTyKa7+tVOFBnaO60mIxYLX93ogk6gEmZFsjb/A8KqM4dsby9L90bztFDMSeMYe6M4/LM8WsN8USGnmSyXuEYXjwNCFD8m/2utRw7oEY9XEUINpuKgLIEXs6noObfvqoO3C++GflrBMwMW7LSQMdTsju+aYT7RVIFxFienxqf23e6lDgRqqrrAz2pNrpIeOLFFWC0kC6PNU5n5UjQauJUYApoGH8IhCrvJRllCmyxOqAQ10MmbYWsP4A3zOEJ3qI6KPJI/dc0p6LEYaXW/R1+RheVLXo4xO8zLJyVgvYNjaTRbeVOIpb/UPvgdLwDwLX75aNtDu2AK998cPZNQIP1Us+oT8ldQ3QVCW8hKDShCnKfe6Ruw5Ie9e/nOSFQeNup2hiY0WCRenKVJsCsDVHNjVPxMk9+c1O5LOuH1vypt1erAq0yPMy1ZaR6m8Iz9e3J9BkPUrcoTtOsolHUF7f1cl3k66XaJgSqqEG8Y8gr3GnJA1/5SJPyUIppseM1XwfOni84hqi2Eqjo2+B3geatxvw54ZOwLT3UvOHEUXkN4vVFJO4U7W+ZO8kuwKgTw/ROfAhWUl0swwn3SiPQma9T1Csdf19FaypFi7DjbZ4RVr0LlkYfkDcfxOWEWy24N+qCoXbQou8Wqv58yV9wrMjf5dyT/tNJIcXfDgTqrQ+6d5mhiAdPc6oNoMGJ4y1FRB87fSuiK5/R6BmofAdAh+DQxVrSkaOZCD/TViJCp15sfxGssl81vfiOHHr5JI68f2gUQTuRxo+Sz1UC+X8XlB2HjruJ53BiQtvmvQpdqgvYj8wbao/jk6bp+I+8XiWzQgBfyW+ZOkMVgWDPqGhWKhRve7w1q/6olz1Ud+n/KT2qfHY8hnO5JubbhxlB/4ydQnRkDAG684abZLe0UmQRctFSvZuTnaLrC+VAlrXZ2WfAvdXQUpSRKhmMEEF5lpnCSAOEHKwbQiff/i7KFExfxhcRg/2ZdfO41WghLSuZlCk+5NHAdRkQXSzQ13sjz0wW2FlBfSNSgbgyWFeb/Wi/qFI6Z3yk9ETFWgXWaWV82ifLgA496GGIVijxm7O4yNHt+AvFmXgiPRw18fEvBH/sqoMpAhUoNxnGQ/1Iotb9YdOBKnbopdtZaaL2DamnOMqM8EDVn6+S8h/T87fTVGLdbi2wxKfpPCvZkBh7lzlBQ7UCP5BHCofZKNAyHiOe7NVs9Pbz/KO4RSMVrmM/CVRF2jqCQ9uzDyHQBo1HoPTPQ2yOxlp7IUFC0CfHqftccTK8raq1raDCj0Eh3INu0GW/keFKA4GYNzucsAhGoe+mu5jX7HdOCuz8L166LeijIGEywSKQAAAACjatfwLYpwwgABlRSZHAAAVZbqzrHEZ/sCAAAAAARZWg==' WHERE catalog = 'CAD 3420' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4EsYM2RdAEABDm4cFvDcLalHE09jCSm+O90f2xH+aHEJb3kDDihRbpv9JHpWb5jQmixj5tr9ioCCHe4Gkmk1lV5Dj6wWRiTPZmvRnDHNbf2n93rsllGd6fvP4l07n9ZIpj5AqzVhxpq0rN6gR/6IQhC3/5TCLHIZ63N1ee0l40pDXMLYGKPRTI40ae6KiE3mXKUUL7eJoF2K1RAZxScwgyi+gQFUTgjPLqXstf5ceiDjfSIWw3/sdwYmRUXp4IHNDkNPjiMWiaTQiRO/eEJtwhBZk6zW2qumL69SIcF+J8hi3TB12nxUiuExxjZ4fnid1RQXjsKwTaL8tm6rrXas4fmirM8Apo3jtMjYKnUWjIepV18PzPiW0Kv6b3M/I+FsoYUKRD72J46J6o95qLWnZqj1rhepUj8SgoQuCVjEjDxQq6B5aJniDDs/9CDwlP2O+bnYkPC+RwJg/YWR388W2GHyt0yo1foiCjIpDm4+HEh3YO2/69a068+EqaTj3gAzPjyUcQeQY/CQ5/wsLJg9pNPGbI7eRnA2P1Qjm+yEGCCntoVfe1wZ/kZWo6U1lUzt5OaqPj2Svo+QkNJPq/cBU/oFmq1/Hv5l12NicGNvsudzngqpE0qvpHZVe08TKVBTYNyBXuw99BpjwANRS2AxvDTUXI8ZJlf0CpW3pCduJa27VyjZGYJuG7N8qr/+Jf2p+6MPoNPYvSm+m94HQJyZx/2WV2LiUkV3Z9ZZyVDaDn1HhIQZSQ9S/7c7VmLph6J6bfDKtkdXf2MQtc0w+tf/KoyXn/Jl/6Yve3yVTV730VPzP3f7rnfvlwfmst0U/VIqO/MlQMCf7gxpzTCpkIpjDEikEGMK0JK46NWtAU6V31RpPavdkiMmguYmuvy2+HvbSJW+SuVZ3djx+8msHB/VE+Djo021QEmBY1Yxx7PWjyMonC9reoclKF4TikJrk53zQUNpUFGqSTdFWIT5tKjz/A3uP/GCRA6siYu/njF807slz7sOGWBW9yCwU5Re9UXdmhuQEhmbVCYRS5dOv4pbWSsZibXxG9RDPLitQRkwQl6WQPPk1N4m+pHqCdGLDVgllMaHgWCZ1h7wPKJA+dTtZ07nRHoFF5243pRonLM12g8aFTjsETU6zLFlIpQJsWNI/cFkvTocY0v90NlQYQaaMzyD6bAStY5ykoFESuMO0m8O1IPxzsrrbZ3oTpAcyeQJgRKlyQx5h4IHCyB3NstlizU3abQfzwsNHTyPi1G25w0RhfttGh4gvOyjj4jF5OSftpgL0+xtqYKOK952q3lPTNi9gQFWL7OpP8iyw9h81OwvqYPbI5Sm+ActOL/+LAfsTjUpV827Qfx6Rx3wBPYhIXnUryCPQpu2OHx5UpC4IzlDn6stCmpei1hA7jig/hA8jeux8bN9nYRNOnWokmvVZdIhh6chrahWkXDK6pdh6jVpvLcbpszz+Kcj/m899B9n7k32UusUkc/icyDEOHfvuzwlqM9wyL+jU+jfd+moPAltYMTxmqz/oHTM3ts2XTpHnQKINkhPkP+kFQjPnmjEzH/B8CRm4PiNhUg0z6+aCkZPjalvoQO9yx5W7OTbmOpnDfG9d3zu5/7vVqQQJnRyk8QtyKAjSyLtBhwajX2V6MUChW7aF7/gHy0iMZoeTfc+6sj1nAcHmgg3SunUweqA4xpx3ICGUdAsoUcq6vffpqEGQ8SlKB00JKgXMTFqL5+THbKqELCNkPtXNFg/6V1owLzcOs1ufDI1EMfYlWANtaPuIuX4BYUfBQYMh1cs9os02OFBTVdg5k6sydKHz2Bd3U6ycivBXmqSWcj8clixmki9dVLlzwzA3Zc9h4G/U8h0FOwymABWZxQSa9GwmnUcmj1phvxdtCBcAPCz6zIjNb0EKr8c8PhyMXSXVKK/lVdokURXF/CGWBUJueYscOJKwfpLU4YGr6Uuv5CJGwOf8Py0ryeVE2krNQxGaT64+VWh7+2PxGliFVo6bAAdacW48mPibEDu3+AS1IKL8+CeyXyL1sMKVOPcegaZcWQvCdpTEzZx4v746xwyIttmPLw0KJ908I1QTQm1jHm+sK4VQfsiAlLEa57fI+HMdSMeLcYNm6a+M/EzV9nFvxfhPnV+UviDeSLFNy0melmrhNiCrduL6nUqfYfJPAd99sEyEejro30dyn2QBcw/mt5SYIQgZGlrbCuidmKKxhB8Np9QT0a0bQEf08ySSQAwd70dVNBywjnL4y1+A1I9BT5rSctEVY+RBrsXd2q2MoCkCHKtfVN34pLfDmxsh61YkapdahMH0UA4B1qrL7s3Cxk8M4EYOSW3UHd0bWjbfJgfPIRHFc07hIR5iarzdHmRPSHURKqg5vGzg2HYYlh91wT06kH+AloLz1N58Q2VVR0rpRmfFKL2MAifv5VIPgOyn/U/06oV3jUv9Boz3db7zx0l1sLV/NZSLKIoBDZ7rLImx4vR6XU4E1vzdOYmeuks+buCWLsWiX2Fc6GdPAHgJLIqKmHnlMLQD7SKhoyqX1boR7OL51yVB+UNfgcK/TnabvqG51/fwVBVFmUrStUcWHAyrgFpKSTyq6uAjmuxqtj8eNXvFhrQfTFIEquYMD3CfLhQe8UKbaMaIj9Qo25OrO7ICezTCTf27IaSuC2W1bvq7UbNekzXAsb0EhvER9aXfuWguPhMgPcvKRdBBY2e+n0gtDu6MuymL4pQgKRMVrVXxUJudl7hhaSU+9zKLZsKNQhBmMgDA4/2Oe6OdcOBf3Wym1y+GgbhPZES0ZowOb7P+miZWh6pZzsIA9BAMkSYzOCYKkvBqrDfr7JkYE6CFvEKsBSfPgqZ/mOZtgYYchOYoYvdj4sriQ/2/qx4oejW4oDtTsbag7b1nqxr02Rc+dX9Iobm5qYEvBestLMsAetxzvIsF1qJJWqqsAIdjZXEOWW+88XXgo/UWv/YH5V2ktQYru7kWTC8WF7IMXzcDVwz4rJbFC+9ZTaYgIokaG1WbN+8NG57/NKLoV0uRZHbjAyf843SNJounKei8LAuc8qBd+lcguZZ2tagx4ATeqAHJ+RChkDPpzGVsxh2uLjcI5qglwvATIXirh8b2x2oNXrbDAYIf4PW8IyFLSJ2c6U82vs5gPJtgjTzVzjP29ias2RECgYa9Tsks74tpbIgY9Iddh+65kWIX1752vgdMCHE7leG3XxOrVAcMLVfVd3vXVfv4AdNwPeDIaMGSTGE4LJ0ag8+2nnFODG0DkNnp+QYFWCVAbeFqjmCe0OYixo9fIsX5czbgn2ovsVXRUwaw7d4Gp1i/ZYvZfmLwzLmcfbyWGGuSdZFCbspbIyK+HZ5RwbJ7/xCW9Ngsvf/n+AhJ96NibPJ/h6j3Gz7oFLjjF05lZ2sgQztTIzNDZ+Mqj6KdZBKDhQAwfW+KbEoB3s0ZwTIexAPZ6yRWhDvZOJQdpjBYZlAyBuCh+vE0+Wj6klpA0rnYf/FOVn7RQ0PLAh3JxTEEGSva90JuwgDKmTT8RbEXcVVG8kWf8CtJm0gznwvp/VuL9arTKQ0Wb5RMokwxcCZRVFlyc79HJPS6qyVuXtRmVrRD214Pc0YBDhGsNDABRg7BB2qfdg9YpBlnVWL66HQ+Jkdk4GJqN2mmtJHbkTz4xVpkrxcek3vS4SD6/Kh5cn6I2wxdvlq5wnNZzSnIW9Xo/V1syAvXLRNVt97esDqHQgj9JoP9svrQg0X3NyX34k7MDbnxi7skuIWWSeFxC6tuZI+yJX4i9FrBxtnRzDuoWFPFUHvTyLfRN5TkN1AEWUGteHFvGLIsC3seIv08+r+J3fJGr1pnhjV4B9y4vDrHMcvnPrAdmloSIdUygGM2ruP1iMwFgNkY3AkE+bGHW5xbSvEOPbNaw9NmB1o4AnKh1qcML9R8zCb85L9G5xr+sLI1bJD0IBTlDOL+qsL9kUTqkp1CBQrNTzYxA/Q1ao/5m1AdwKlrciQ1I6HbmMxlGQV6oaqjN7wAWOWwZhPRGz6Y5TkZHfZxkIG9dXWx83oO0Y7tf7Mu5/vdvG1Ex1K5PPu7YDtzGGbj6yTh08iRXCX7mojND3oLcMTXiBs/AZ4ZSnSFAWAEtsIVTq/kSzazNHDUNGngKo3HfU1TL8QH0T2+8h38+xEoy8woRu1U0+8RsIPVD43rDkH2pdpQ5hmGsWe3oRdqC7YnKkuS0LAreMCRbMHq+Ew/Z8ZZnRzHVx2GP6aPBkRAkYee0Wnh/ruNSjX/A8zrUI94mOXBPLJZF0zxlI/mgQO/vTZk1xmKhy8ad5uqYm2V45ytSk2rrkUSHTuE0jUFqS1PLZwg4RqzcSjqO/hs3OkwssfWjwe3BxAWMaCegpVKIDke1xE7wWKVLo6uph7xj5jQtxFoWxz0WWz1RvxPByDUEkfsVq/WltXWW2Ma7XHAt4PLwOZmLXEBCTJ7+DVVJ5Zkf30jb00uLw6iPFwViOAnaHMscGevptcrsDrLHdwXVvyqtGRFV4rxxDkCP2PggHym1AqWbH4sL3qxL43DzOQM1rJxWUDm9ceXGzGxZDffrXqVVBcpFkZ0qzbqZJjpcg4/at0t1OZ3vJIoeqZ2cyxnn538rKBsE2ZDTvBxuJFyy9IMeXg5NuAgkR6o6JoJZfuxltHd5nKVPKo/DzbZP+8F2cSRXqNyQu4eQnFPN4DPOuBZrFmw+VFuANntZX/Dm1vT3oUwJQ2KXP+73i52TL9swEi8ZL52ryng4MfSFZd51n13Ho4WT0ZqrQ/bYIi0A2NkC3vH2jB1WVdN8S2ioUzk9hvHoR6U/7kyojgz+PZK+6iQ0NX3FIYU3rz9YUPaeHEUzQ/9FIEN2BHRpaY7SVRoggCcttuFXH5nio5FvsRuY32hKiqyrsw6V1QAqoXsVCYTgK3GGcjW8OP8m0gctWaKctzXUyFsCrbb+pRz0zKnYVbhl9AqPxnyq7K9017t2S3Bcwrl+rkg/ZuV4WE1OrUJfFiTcPFZV+KPeTr0UE4JjGvd2PM5sczal0SJRr0Wd9JYn1mbCL2dgT026n1A4tnNoSNq1EqrBal1v7DTwsZZP9g9H+edl0pjQJ7i+mrVTHdT3EnQ+FbSTe59VP7f6BCgjWCP8sJixDpENM/F0Pv4YuqvdoHthdLpn8twdpY34Eizd9uDnTUnEojlP6ICOCC3UNbUtP4KSS3gFDslAbmgRdnT+Bhli63Qih5Rn42yPCUl2D+QOb6JfW9Q5OYD8XCVJ3pOChXCmnQrieIkuEf19J25UPxI0f3oMNOENyXaZzdlrE7DDTZYWtrpRpIZY23eU8EJidIO1tS3/bdFxzgFiXjIH8pA6JAcCnVRkjfnHWkuTasR3vt3B7OE25jF0Er//8+o0AB1AA5fEisJceph2pDo3+ZMfzvKtsXATtDiVRdg2u/lk6o5TpoNbLbFMspSQzStaGja8iCBO20Eb9u7MJXQ/zHKDQTVTCJlTA7/A8HC9JroYqxUxnIBXPrWtaPjS7VgTUR5IAtxHcHrzthjpmw2IpJ+Z8Tds+ZASUTBshPIcTPxGF7veKwJJrlfvG+Dhx2Q2zXOqTBp+P+gT9ICZLcpVyVlyYAPDvRydX+2d34TLjG1bY2JPbYRhrJn4Yol4Gcv19YvFCLHbbMNKUegR4d87f7B4AxmIfCCAi9avlFGzTtboujHhv5p4f/dMac6Uw8/mnExJfNkBOocFmNQkzAtfpXuhfyvpSVJkMAuSq+z89CXjFnyDYh0pnw2O7XtMzzxY49Hed9QfItPjfZmOjyd+UUmMnn8ES1Y3w5PcVY/AcYJOARangdHvs8+e2NK5KUPXHQeQoNb2rkkxofrepWgAPnUyJYgIHEW0y6zpQq4ejJDlk2x407jDvQLs8kL24RpzvfBJMIMqDC05/p1llSJQEU6gAJcvvx2NRCwz9KUkWB7x5hKTZcgGqZGAJ7NpL8KeVc6gA5gu5xM0KwC1knyyDL5pOTtdmPjB/NVwduLMnyprcerOF1GKR4umkCd2h99yIlFs0w6r0z0SGsFTkDPtDHhiDnCI7DLTLmBlBMeaC2wK1Xov/tpWPqWbgE+7cS7oZhYATBBMdXmjjfVMVhWhtOFWBOiQ13zy0KxRte8ysoHGZtAHQDaL+t265NsTyN7h9VoaprfKbP+IS6Tcn3WieQxzBm3ADTWHN4j+C6aGmwti8pqOR1nzcPiREan27xGJki3glWraqZALQCQB4x9In4WpHEuoVo6BrmZcfN0vrP/cnO2NUQiji6P11Jex7WJT0GqphwaQcwV812kqXVvUEdjA87NRVDkggQE0NJ2Rdt+j/i1vrkqPHbsMP8WI4AAsGps/oVEt4psxoeNgbVNE8wiFGg16I6tDM6xF2TkY7S9wtf9Zd/T8pkpF3lBExidS8y7IUX93J3yu+CR/wbZzpX7pbiCUKr556Lcmle1ALm7yYoIZbPJlb9dhCtrbN0t0VS88/ropsjR3j2MpmBjHBDdK/KAXhnPmxPoPosbxPKTnd6CnFN0+ln0LxbC6SwPjExilN89cj0iuiKWcZAsKIWM/oymE8a2whzzkWBKCiYa8S5NRE1xb6Czr6du9nNro4Q8iE/woAXvfKBhCJioNATA72Y6JHIp6yBBac3N9MfPO/5WZg1jkeQ2Yck+hyVf868VBI0rBir3VsjM06bst+/1xDOl4HY0LlBo+AJr7yQ1fVFJaHGK/mNtVlMn058anjZU1ErXB2kVOjzU9TQtu6jtFN05u7YLXN0ZX11kE53yb8C0ubwUu3gR/xbTJgdVWihIz2q8Ji6MTIcBaBgVZDgtVZ9J3n+q9LYm986HKD1awrK8q5aLzrecc8DJWfgd+06iLxpWKZnU2MRmVUg4xuB+HWJQmbdLZ0+TMgbCCaahxh8SheprueEABFHYI5aL7SPzcqZNqX02sJokOf3evfxGdhGDIAGqeGvclbqmSSRRgPrsHmxqtWRLnHAqMz/IXR3JF6ROBYz34laQEsGaFpPZ/oFGzRrz5VNb5psB5HqliVsjadnmiU7T4sl8sognG6MGiP3FKdAI0nr81gA22lrJfU7ng+MRZE6Zj9528iphdquydrOr2oar/PTYajasOVasBr8XeCmyre7SrbspM5ygZw1CMKJRNBT2dVqeRqwH5mh7IDYvMw7jjibSen58ISDWbB7nK4H6eF1e5NN4mmC2yu0b0BPJpHiXqM10g7y317Ko6/FbygtBY8c0Fd6hdghGKar6bqeMFfYAGBZ1yOe5ojYNXd9thb1Eblq2VmBfK0v7tHdgt6s+UxlFidgxN7tFXHlxsl4E5xlW1YeSf6b6Q0UXOnne++CkYxNTzVPUjqDfwEIKAhk1J1ZgaDsOfumrnUpoRlBjY93lDV+5R5kksE6gVJ2w2ys2ZI8A6/Wl5ZhapytUlGDbaims8usgwgBiU7Lrv+rHzUxqC0WnLWenhCMm9ZaLpa+JVRzD78iaRI/YKdHYrjPxAq7NxZSQguMo8DAu36/zSfLoPRvenet3r21YdI/X0Pw0jt2cWA3rsHntXIGlKxwSAuNYmZPnoyqOwM0u2G+sdLHVVQd3XHml8fV+RSYTffLf7L2RIAVCmGXCyHF52hBkQit0vCsZa9uOxwagJjhxKYTMjYTnRvIlo5SCtXQHJgBQFh9VNrlFsXo72Zd03uMgYmx3BwK6y0cwP6912eWEoqaj9QDm1J2EABWvcLUxtkHSl5aNooa6QG1vZ7ZxfVZ6BzSi+eM7FKRghWt/t64UpRX9JZVduKrOiM4jicTNT3OiQ3MwbEYRfXUfO4XgW441KiHUEDeCMDlgpc9QQgFbo1MtrQldjjLCOzvii3/WMcwNNRUWHqS3znX+3+Sg2lSWdsm43rn/NGanoBwpsb0wMbNlmAevMmTbPjYw4mj+zabdw4KIPiteeEXDBzsnr7Xias7P+nZjiF0rbUqFMBtvQ6WyxiO8ApV1nBkOHJrgMRB8flsSP21eWv2WW3nwh4VyKtKlvinJPnQqm2brN2P76QX146P+91wCFJxggxUUBN0v1BScegRn5Jym+OE/r0ETbv0S4x/hU4wkvHJTH6tO13TRQG3ftj3lrF2lAIjVB9Tz1whqvgaSQQ+uUjbQAPSFL7Uxxooe6crxCWU2jHK57e8dhM++fmFNcBjJo16NWfxdshIy1tJZRExGgmzAJJzDabQ2kb2G2mK6v6WamR9DF5wc8TckpWfnP0kceQBTKqrxODUDCwqs6N/mJnE1heVc5PpnUJFp2J7ssxo12jb3ripHYmukrCUF8uYSfKfEC0CCQd3gAeGz8vzmXtbToySjR/xCoS4s9PNUdK37CxDzHQaDsWKs6XdSaDzEFdKPVGIGAJpyOYpr3AzKhhBVoDjuhiERXf15+E/ZXXwb56v1Is7qQWGLJylJC44fgxMXmlXqbXGn5aUjH56N7N+1OLh4aPnVdFrnuVyHy1SYM+SHCP6PiE1E3NkfB6y/OLUlp0GKoazcMJudUC0e8ejDVoAoFI6xXX2uAdX2x2/rjzxJu0i5s6yuaHTeWgAWP9bOn/P3Osm3vcoaYoPDPQr51s2sqmzxgOKYISFdrQfOMaLIe6hE2tMXumxCDIRL3I6mhZVsnJjCAIy9Js23m9OPUqa5rUrOoP7NMnMvn7HfGV2hMB3on9pKfcm9ETJhbQ08Ip7u4qNmMQL76kn10CSIrWBKKK7PdPv0AXCdjiYd4H5EmvzDXgk3oa1+PQ6gnC9H2t5i4/5BHG/VStlIZh/FnLzpqo7HbF3tmXR6CtF+MLALT0lDTepPLMtoCDKzo2MKjp16EryD5dN9CejA0H5GI0T40m8uIHl9lPU+6tnJyCToY/H5WnUUcGqSmiWgUUj0UYAgWOpqtbGv6D8MjIMwEaIieB2fPIaYrnNco2/ivL7jFdU5cWFLxWWUWSyjtlVZb40wVclXT3yEUs82G5GG4D1ZdRrybgTOiK9Si0k2dihU+QTXf5tCh8kmybBw9uacb+2iDxRgOOTjmUNoEU1MdvmatoftjkOH4rkSCHMtPNiGJd+4DqLw95VFPO6gF9emaLMETJM9G5abhMbLt1pcqLmjUnFlmkkNiFqFr8RxuAVDcj4jT72Zx87u8noEql3cKJQi6lCFZQLL6dj0+jj0fI8OJn3YKGRr1+pEKj368yu3Bj/mssr9e+REkR7ph9fYOs+F3fdT498oK5FoRfdSfcvyQrXXlKpRJIWQUrpA+stQuL911t9pCOHCy6QFleMFAe5Z23XEA8tgMRDrN3CIlJSW233vosCGnXK0uIMnmfaYXtpIj4WDDkYDfdXiHS3eAu+X11TJFCeq+Oi0zanMey8YQDbi+JEpejKMhdugObI6h5NvFnRlKVD8YgbHgZvZH12U6YuRgT+AGGviLCfG//aC0TRDnXc/QkHQ1dF1t6uqccePho9ZcEpgeCfBoikBgW2zZfi6TDUugOjlskuGNHowghMaNNCv4FwEW0LQS5klJyhLxAfFFC7H6jKkQGV7+zZb/QZXWY7E4ckvESUnnIV0LZG0NL6RaQQzmcN7fG/E1rMD1ullCx4pzSZ+dJBbpd8/Uib+zB/YO8vPvdHz8/tMYSGblUoekOFUNT1GgBpMNI7eAWBu/LEJTCkRGqlmcL2CG677nAqmXSPOYRXeTDeSJaVpY1IJXNcYyrWd8wYLvgHPRusCv1R+f9WI2WncOuqOIKEPIa4lWkTa4VmoYQGlMK89g2/8RPIynazdXcbwiCR+8klGd5UOc9wXJGA+ns0iUWTqkiIaMdGHB1X5IYn/EeUgFxVfVEl/y4Lw2FeQ5/erVy93WHitcMHDh0LK8aekLUa6zWtGEih+QEgmtNb9dUEaFqQTYoxVNNtOPlNK08Mh4Cocv4R9Sa5LB2GCU94i8WN8aY9nqBgEoVBsYd+1Zrm5z8ZILWNQaAtZuSQwEGjOQ1GulElZ/5CDTgXGFFGJXiXbs6UB+9I0VCT3N2Lr5znwPhwrVzeLO/sZPhhGlsf9gLGr/hVPJKqUBqvB1I9W0y78uGau1HWHKfKS6nNFAkLQzoXg2pgzZuU8Z1YTB3c+Hl6VkTS10MAj85ac0kRW2a4AYyeDRdRLGJ/F/ACdtEEaoeGofEO17e785UAI84yWnYC0kfk0pWWVsAtkVw34958Zl79s3xkNAHxEQMXY9ZdmvksDus2Z47PzsCa6LM5e/bmve4W1ZSa+XOiQ+3UyRblaVcntAsKzPLeYRBAZxsOaFl0kDyNP2JkINLfLnj300fkUY66VTGh9IJ/kCLUWLNKtIzpv80tDZFihHxFg3iira1y6Xu7XrPJ9L5T48IL+eGj5o0p4zmN0FVjgED8vVj3LxzSDCsPSZEqiZDfkTX6mCUW8/JDhFTyD9TrIIC1jZw1s2eteEd0/A5JznLXa+7Bsanrjab30uSEnMo5yjznp8ivoAnlN1w52B2Xbg6e9PNvD7mvzkZFzWkhzHAHoNaHafNoXtl1SL2PAfV2pxtLf/F/bMbMKc641txjE8lICTUTEJxTCz4ywHoLgKIYUbIrrtTmpVImd7OnO2dBsFM1P1vDNXsFia3uGuVIo5DVs03w75HXk04DToofHSERLu1h7UAeHyx/VPBgju6ZVLgDyXzVctnvau9/tOu/QrMVmh9k0RbAnehPZW9FPxV2xZNzCy4dqjEL8MDACRz9k3kB35jlnr7DBDnAvz79Jw8SMwbavXw0DefKX8bXJMRv3aSdCO5ORZH3rjG8bZ5lpvDJU+KfYdtjgDzcjDhJDwPJ55DWABpMxPAJ2fVQpufC7OWiMYSdFQPuHkw4rkogpSO9vDKDFMVUhiDg044HE6LJgIRvi4H9blsCSRucvLWDWagas3FMHxYMLlKJfkq14iXUCdNRp1/xrK+y5pljEdPhcPG6QZQbH3sNjiVl9HrZRFhge5rnY2D9v6zabrWpcidQmxRzG/BAwkfD8Pd5uGj0G0HFMAXli5KeVuPK+IIO7WBCGcJJN5STQrLJGrOQ2gHBE932j5sLmWjkBALoXKp53YMDju/6IIh33UMcTtsKMu2PCkirmCx8p+HyHjkxNBNGSQ8aLEtIYuWdyCG63KqARukcwN1rNfStOIJWwIu7fy/RG6FaXy1KPZ6d1VTv+TX964lICOgsD2EMW4bAptg8eAmCyZ4Q+wDnVwJfcZEB3ZisejudKrf89zYNyVD0ThRjBjJ8QFNq3aFf2AikzDabhnJtOhPFbw9GeEsi6u9beDeb8W4fJWOudu6cEly65o/vp4VkPxqe29BIzv2Z/Fg04gTuGu/3IOqFO1XZZ+Q18qV+3hADPtTYs16AAMWldBnbSOkhgM6UMEbFnUY9lFxObzwf1+VsbZPCuj/5YxC1BCIs+lJdaP2z75PE4iWvfh3d4NkPh4009pnq+ZVc07HJllbOJv6+pLK/eUgBzRCl6TrYUmJBnXXXOKLRaEZI36JMhaRgK2RV8XdHb56FO/PwbDh3lkOiUms15BQWDE+r0IdQGbAZNvOBe1I5alXVN1vAqC3ZHFipePtc6tvZg/0jFOx/e2FNMaPFgX6rH0qfVcyAEMcMOgHOkP/2KhdJfSt0N/RdhAnAgJx6FL9St43fFQij8/OwPdKGJJ/usGVflYIBiASUJ/wW4M6VnCVsNsW7DMM4WmSW13ZPFK/P1RgYMbxAAa+H6RNhDtCk17Avqb36hd5CT4V9350LiVnnYaDND3fSUc9Kv5Z6IEQkMx64HwXmxxAQcV6OU9A96qia7IXxLS0hfCU9+5s3aVS7XGdp8WEuxz8Ph2DHyDC7+u9/a9sklLxMMArNmWmWRvXIHzprbDMRBaFH29IhyDLquTc/85KfDqWVnuvL28fKjYojk1Rr1pQ3rQi0EsGTyLhXkroylTUfO1iH1V95Da2ELwNM+SsvL2UkPdQt7zy5zaVFD+H2YrxCngBCGUI+QRDmLDqpNwtoXtXzGrdqSfaqhgnClOhCT/UymFigf8YpA/g11D6mNVqoqJBsG+tJ36sHOI6g3uDke2Dcz7O7M1Y4mEoM9CsipPYunATb74dVwgs5nFfUJnq4d2WmOWBOYLKgsUqMlCxgsj/MWHnV0Q2U2r5jqatjygjOvcOhIM47aVzZut9J/nKeCRmzAyvRWgb/WyZ192EtFINsJC01tYOetnIyXNmOTJm1dE19p+ZW8T0SySXU6pH9AodTmF1fHO7C+kuUIps80sDzJSKs7o4NHAaZqdnBndf92d/To0vFZCA+C40CiX6g1oYlw6cz2m19qjjNr3oCcFRGtAfm3umgnYO7ncw0IC/v/z/fXIJBKesCTK8bn8KYxW/6xaroIJK9CnXCIYby4TN+UEW0W9U9ZC7+9Se9LaGFo/MuCHY5PgjkkfcCvZXAZ6VBzjL8mgh5XJteIeSL7OOPFkmJVZRi1U21+6lybkFbg/cV4B8m96yOTJaIuaXvfRT+tLhboz3tPqOFGLZOg6NVi9aVfx7xj95HR7O/5hYQ85KPPlhNrjlHaMY8H5noiSWtFTb1E/p6LrrXs44w6i11eBZnz9SflCHsEXWRccCsBxsoBss0IY7M+DhmatrwKRre+RvcU+dz8zR2CcF3TAK+AVFDiEiUHxRUydYUXs9Tch3jW85DB5pqW+MN+EsirJIp/uf5TznT5Z2fDUrI3nToftdI1EMccDSvBf6f1B0Pq0t1En1DCdx8ZoypXWhXxUMWjyp4tqc7pdBYe6/oEakACSftLV6OFVgs27PVxoXWjiMTQfXqqH1qNNpD+F2pPxOLYTltcWgDF3vrY5wnK3PDtfrbb4xhpFpchvs4NCE7LpigQGZ6oMIUA4bk4lzdoZcvmru2ozcP31jNx9QfSg7ley6BvQPm8ZNaqIJQUazKGA6NonGYM3nSHsrZiJ/BfNcKI+wo5U8kDig7lMuDwVJ/KVzhpefezco2qqxJFKkUXIzmUCLX5gOvjx2+t+mep2HMDu0uoU+oXkTopnszXIo3lDT+hrvvLPHTDQvQwWSqtco+qYVq5mpKTH22bSG5uLjV+vrcsUq6mS2TBtIGXt/MozxVTOl/3AboSqDCvI5MQZowz3AQy9LzOLj1cMMheBO2OJ0YEtWBEYjIr4iL8ESAiA5cHwHrHVbHBcBtIeXsLQmFMGHCKgGmpHg32hTjpjYe5RfwlIZLw7w7GHCwABfNEoLpng/ytYM3BUwsHZbHpCsjamUKZ3rz1WLcPEGURQCtycv44HUQlVi78dXmNeXwjb3pvsubYvLS31zigQEgKEUHLC1eU5uyKjHS53n3ThbSwsgTYzXIFJjRpyB98ihJfL1hmjDwkwPKvTCN7A/F+bOGTviAIvQYiSoi+0gCtx0WVzWT9EK9+nivwl4g9ew4Ff3W2gQenddQhXx+qL1Bvk4Z7D6y3rsHfiAHlB8Ed9TOhKTVJJOdWTgPoJvheFni3xxtsCnxwObNlya1Jez3DgX2sT53nTkvjC3qgkCXZ0VfA1gpB+3iAp3NNlWtLY1jgKr+nJrdbYa860G303Wef1LlHR+NwX99lfwUvINJVZCPSEusHumWw6QFPOiIVoVage35fEifvWm72StA3Io4dPkzALSUtFLSItrPd9rtlJf98KclzZ1NNmrY32iAkOx506y2JWwDWCyT6Mg9XaZo+ziqovGrbpHji9Z/13DkR6a6SGfrbGJ0ynSq5ofzuKiZ3Ha9rENGM/1SfjgKCJdJVVG86QT19tRber0TO/ldRjNRK3x5zOw2Ys3WwLoSp5Rw2ph04M3/m9YGz3LOL1HL2cdi1VxwbVE5QUd/TClNPc0EIE9QBWjX18iatM1Yj+dI0zRXKTrGh7UDyso4AqVj+EEfxBo7ZefQzD01HBhOHOmJzLQs5CE/gyboynNC1at623r8xI6zNQFv+uUtMVOks70uWVbYV5HT5TxLv+kmUx4JCBL7Gl93PtrUT3n08WMjDEqX/SdKQUf9k7O8p5x5Rrwsz7DN0ACLW1TPHq6vWNiIdkevXxlQ4eN/QIUJSDoJVt9gW7YymYWMgoioU4KueXzP7KHshiRYwVhA9LgPBk23YVefNZ6NLHLcgj25mz/KSNOS93oWDk5LptPulVI4IJ0lBS08kGRe8pq09AssauHVNQntd/CI1jnF4Hf7C8+n+UrtiMXz7C4p6CX8IKtNltrhXPkQof0MDR4wEgYafgMVafmgzU0tXyQ/rSk5CttJBZl4cx8DYzQFsiZE4Sq+CS7GLWDi5jeaxCz80w/nL2Sw7Ak0R5M8NRKmKHn0SABSXlkx0u4PjAC43zIZe3bIjmvv8ozTx9Uh1w5r++SCe9wpb+Pzok2FrIymKTwvOIC6WQJngxLSWIUIbtAynLXva1XEe/Novmg7/hTh5KLmx1CdxswU0SWeCppVxKRGzixFQ/IDuDLTZlQszqQVuf4KVMxESr0AXKNYZs3fxumwF77yBnUeo0G2ej+3wYTx0PGYUfMQWUcOZQuk+guJrjL4Tk+VvjgF2OOwYOvofbljM80BZtwHYgI72Sg7YMgdaJHjuIHyn7mRBSoF3XpFSY5oiUdyC6y+ROvjkAHWUzJUBF+aNZXbBGcgr7ZnlnOtICpibUeLSKjIrxJ1ZuVUTIbpUP3ZUr+ZL0mNrEH/cpgCca0CwtjmD1OvFPPEjvAbQGMZ7OMeLcr1kd+DxjxLAkigwF1cEDFkvz6kfFAj5K+pkss0ytRriKrXOpOvnQcqzloaWdVk5advV+ragFSGmmT5engpYKemJ/PZoLrobaxU6thdof0JLYYQ6S5GBYM3knR0UyyQ+nngaX9n+IgPZOjMJuVHG5YP3kgLAsAjcbA0NfSa0EWyjDCiYv/sNdYacgoGa+JlRpAnR3cPyEv3ObcBuMZT+z37fnSZ8tUQ8AvA9QeIPNtp1wI8zEoZ20gNGFlELa4jS4CE1IXeXng+0XUKZkRkrWVrnYqyQDgN0PDZTnNLL8Nir3zdtkAvFJkrOrDmyIJkadRLTfWNpfkXmhhuPvIPSDuQRRp6hS7KZXC6ntFM/zKLS8XbeSBEonhMDc6qjk/qhLgruUodQjpgF24+lg+SPHy5CWYrNFLbhqewuTB9NMdUKXL8xntOcXrWd0o2WYcCCSAgA26y69uaT0sxeKmrP32plqJsRKkiEbDs7IyBNKkLkDwo88G8ErLyNUD24am3le1JtSmtIYvXwLz90R5fqaVRKXk8A07JJ//TjvPde7XeP2/bw7Qd3YEyFMbwDl3+1BEA3cOkHtnAhMybXigyeD5LtmNtG2CCh91yoIh9kXqlf+PMxU7giQqNJdVLipCg0zNyu6IPSt7WYAoWcM8E7KVO273xXzExVVup2WQ7SyI/SVzvBPL9U4szVBFOI8RyKV58ItlNmwBkb1vHDbZB4ELfGjgt2qkeJ1yeIEOLEo1mIEKPyvkLezULcXROm2WLYOchKliKEwG03PsxPuG9Gz6Yx+DSnBdEphukCUVUu3I90SnsS+UdXL17PT/lJua2PZ3FsdjNpMK020QY1HwIru3oFPdaygXnlnU/T2R0H8U9+pMtQ24zmMospO+wAnGhBMKzW4JLiyrNGO6CsLAeHIAQajcAyge9Ob1XG5oE5m0w39srX7EJi7OdutSmT0JbFCI8h4ZmXn2iVXcDbilqN/GyBef6AtxrIhQ4HBa2gjbyeQDpupUgce+jqoLYvAdeZQbdIfYBhXQoij0wPEzU+VQttluBz16cfyUYLf1AhVNGUB32m24XokHg5Lw7GyCkp40JmtnYB0FlXs7tD10wEs4pOm96U9pZ+SgMVa+1gT4jWFjMXN8iASAo4eV6+xjTcum1DqGmNUNUKHft5pVE/img9mLx9iU2JiO9/CsmH0M+To3ZSjK06Hizi2QfFJiUU2Soai9N+vR26DjLV95n1KfgGYRbpESSrzfSegqMcx14CePw+lF63OmyqoIt8XpvUAyg6ZRTsCla6La1aIBSJWjXeSGSwIzIvDM8x7MvjwcPEC6blRfDuQ5gUD8JZeSO9cZ+rrDR4a1zR4GyVxvkzOudTxjJxYA2aQz/Yg1PUJivEQpsnAByjxj3qBctfjuNjWB9tU6Fzk0o2gaGIOz4EQpc+bhy91LTiSB2TcisehKfij/v/uLhu4vENkxjb1oYf9O5JYCPGT3S8pnmbjv9vUnfFPNpaWdfyPAoz+1wYqe8ZvdpSEjb5wJXLeFvlL2Kpz7k1zQe/xh0i2sNjgo7Ic9iVW3D7NXz3b8Wa6OVXTCY685fwmGhs7Dt+qiaa5FXxHKF1AFc09k1bomI8SuhC3OyA/2iqtgqjVCAE37TJaHC+wR3+SlHX3SB+AL6Lbnj7aSGXGXZE7+OWwkgq8hWCAvkrTAkFFkV6BznsnUIGwCu3+lNuu4IvKaFYoSmL1uUtIzwchqI8/hpFt+GZytj2uIt8SdzWrf/Efm7KG02rTIv9fqRvFjMkFMj+JjRWYtMZXspFgBkCvIoeazvoG1YmnDs3JxoyXceK50AaIcQHPZnheGIdtjncImWAeh+SOENNXr+AL3udJhKKWvnnpzHMOYuKMAizLMFnDgKzi482/vM5fF5asEEoPn5zAf/B8uVZ7PeAbooecwGgCRkuG9lANtPG0+ibh+ojWPEbnhykcW+p+rC0nzMvvG/z0KO+pM5RQ5YfMoak94fWVc0/a/MR07OsVwGobg6qNNRERjVIQfE96torin0CY1cFksMUecb8jA4aoj7FCB7EZlAR2XzOlm0ZSL7cwF9W7kJnm4U0ekA8RWXxEdW5UDmOyTmwplNHZ9X0Rz/EEUGGXXSWexo89dEL7Z/7DlOvTA43eFKzV9AMUbZMSaadmlFRyAbPNu1bYBSlMUxiYwwsO9xXsnjmgfQiKOPC8UVTJZIIcc0N4E9K7dh+sbd1KaanA6JRM4yIo1NTyoyZK5lYpFdtDf9OhRMLDROMBE3HB96amG40Gr4D0cLy7LYUeAiWeyCJnxFNPVogU7gA9Wqshml2rWRwZTdw9LxyhBrnleh8Je9Z/djBKsH+hBAuTNIfbiVIxPteqnPay26VpjsRLmL0EYFJkCvtkUev7tdlLWBWnT4PbHp2ODKhVGq/q2s2/I5Qu9DfEMyEs1juTQs36LknNpNJc4LeO+pSjaNGs1QOIaC2xDjh0IR6dcnPy7Lha55Vrpgc8PGTqfgFx2/ZBBX/SPpC5F/ouQ1kuNgQ0gweRl/rL3dnk5N0VnJVy9ph350VzJXC8zGVKQddyp7PH6ZvrUdD37Ny9KrOBZiSKYj6Fnu8nRun6khXwJqswqbhAvI7Q7ulnKGrpobJO55LkBItzmXVin2pntzwf716w0w48L63EA0Ku4VCJXpYAPzcTzb/c/OhQjFDmA9/ePdSlyM7SRbxEvKZxEEzVDMFErrpbO37r/NfjiD7uWIhITtqrfPzWxjogvphLds4DwTbhjYbMTEi0BJIXsl9JeUiIf+fFXoq762Jk68SL8QRnNd2+LQHLee+aY8WwrMab1h8JA65DzmijlONUOfgML5c2cuT83bfZNcZRF+1Aybd69mx8cwzra5I8dbxOZNdx6W60K6nwz0F3Ka+SqxxyLsFbFL1qsGbNUAnF73jSQQptsAAYBnmZYBAHUwOtaxxGf7AgAAAAAEWVo=' WHERE catalog = '093624979357' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4BeYEIddAEABDna2OQMXSBl2IgBAphCa50VdN4wi3z8WyqKuBSupwOvz9u89eC+oVd7Y9T4bM+TtUiurH89rGh8ErPLC0JSk8d2k/i5b2UPm28f7sIT13kX5hosxXd9jtugCS7p95jbctyyCelsaLL5FYOpX6oF7rRv3+L7eAsy7KjbCjU1MmLT5hslEYLixnFGNfQMFgQPFJEtI4OzcKaAnmIyROoodiGfbdjjCpqIneqG+gynjqBvqH1DMp6qBf9kiQ7B8+Bn6tUXaGP0Rq+JoXddb7nI+FhxtdeQZH68XZ3HICxx0RRy05xP8zmIj1o4iAMW2kfPA7OGhOSFPORoeXeTsSNrAO+k1Lo8Lp32ziy5lCMQWHsS8N89cRKwxHDBDGzjGfUcWjpy6hdP+1bAm0U50VW/TmEuvDBeubXnXLLACsB54uD+Wa6Qx0w+eUlhVbN0CfMoybDPgEreDrvEPWXNow3HVS/ETFPijRxItQm7/V/tTRE3ftATydl+xZPkj7m2z8wdaAairkyVajJ0l+hBxI3aRlUNhK1nA43xlNzUhaZxIXfxGmL8qkVXwSwH4A99Xesn/+nLxpZRxTjRhS5N/2aG9lRLTiVqwPq25MQZQsgoI11CaQwcY35Qf7uE/NONddPVVVhCr3Qsk96bSZ2033N+FHmLlDA+uBl6SU388FK4J2t/LEgArq4fZAlWTfuTjQqjf6Wg3ZGx4oVPlK8VVsdYoUpmpWUjg+4vDZNu8eRfqs9/SK0WFUSMFNoPd8DCMN68mx1JZ1204K7bEjep+Bf2cSorpIHRuBgeKbmKkybAneBqmlAkq5BMIILtMNMGM15vENyRTKQ2tda392L3sCg3Cr0CasulJjviA2Od5WLFMkagtD6ruONHPwRKfR9JuHt4ZuCy79QyACkjyaIRarxZmDPwZl5gLLAbxS+52RU9cuzmsfLh9XXZ37Uztb9vU+ykDWN1WU+dO91bkug/09bXBXpMWtKCpl4wI2XdWAKRZx2pwNynHVr0PcwDKr/zWSU5X4MxLluFCwQtuJQcAIInBQZhAGc7vIgsmxOu4AFxdHGCi0v9wKWp//kG1+1CxbFMg/qprGkrKjptRwiOZpkOwoQxuqQxugy7EDD83glTL3rxMWW7KYoYO4GH89MaHQ+jndm/kiDFOqfh2Ml61Tp699NbswJQbzoKoQu7Qyykd6oVmBbBCxDabrtRmK5G/5Hn+CuTSdB9V9N89QDx40MyNYu/nQN9pHbFLmURpLE+U/NDqofgDxP2QSyXEw/kROwu4xQf9y+MpO+E5U9deXk7+l3hbH+CAZqEZWCNo9TKl4/4pDqjLFR2ZeMqIXGoFG3zV6s9B6br+87PZ0p62CK14QQPg1xlKttwVIWtxytOm/E5UsrWJqCupt2BlaQ6zZ/FAaWr6fJ1p5LtDb0riWpOg4OFmSDkN6KebC7I66qg0ZcXG4TE0pallRFCT8GtZF/ZQxUSWxwa3h8aO2VzSCvfiDMQL0NnurQABrXezlBEsTbPfKzSsQuz2M9RzbRKp/PHAF7xT33jzLfM4+6iqeAboy4qxJn+rnc27f763BylRJTgpcIiKZW4u4WWNBwTvCWSnyzOgGZXS61yHPx79/obkaFMfAFxk4z6NWOLNekTFsKC6DHhbnqgg8QkH2fAu4nZ4k3WgrSV+QgQYQ5eDjCF96iMdF4lWBLQOOqtUb4hk210odCYk/DNxOyC4g9Uz3HTU9n9CMM4Q24Ju4db3n8A9HOrgpiuG/whrtX4r8+iIMcLNQxprx+1usKw7BxAwn10BVvRoYw+OMkb83K7mzBniGrwqDPv60XKPiAmrypl1OcnK7GtEfuP5uWTwFGvl+QLRXhXWiBhAccbyrg6ZYKtDLr389o5JKdktBwKXIZDTczsvkQ5HJE+E4Aeq7SpvXiqvHsfvw2whobfIK/l1hUtHK3We+Y/c85CJ0v2wY84edorT/Mgdw4NGiFuLZzbTHFNwNo4OSQ7k3mBGcJp8fmNgY44MISzA1Zp0GssbE54fQfqytCNPpLK/qnRTM4CD2fRBjz2kijATKEzUm7z9cqch5OplNCgTH3jwrHmKRO2LE8LMoBSJpF0NxfgKgNterHpZIDGidvkPAfqczWfsb+g4447ls/MKxEnqgL8DLfCllojBZt8+YLAF18JjBmbZF/zPsv4i6E27GkRcukndxylV/NQvA/jUbgA5JaUidX5Cd42QK/m5y3XPRfpW/LTKKyCM2gs0dCUoddz3VJonoMsw/26KsZmiJEO1tA7ghN5SVKvWFVBN4haEJEeMBOgeAxtlxK/SVjc5QJWM/0bl3MSRg8X3jGO+DajSsaF3p3Xbn6Qef1rEB6YRUFsMHSpxo1W/oQVwc78wuyBLZxg6VmMZMF7SQdg2uOcCRojDR/9PrMMR/dPE1jTh27hVyH6aDTMMby/CuTUkieYKMw3rY8sWcxZUpZyX3NYG/3zUzbK2k/ZSDOSJzSSHlyPjzEcxGJ9Yy6S90yesAklwi5Qm4OTbRV5gAo+UtNND+HaafZlWzjaMZ1yNz05sh/nFmAksSwDPmwyyAo+teF/Y9Qs+SZFpxgxFu/fv3MtLJTtCenV5u6tU7qTpH+pzTRYrUXMSpexyTwo0Kyj3YxTJYoe1RlxwEFdYT3Kd/1c3LWl4c4ZelpPhTz53RCz1cBHTQXqBcvXuNDI2cOcmPZu7iHhZwJQknNd1QeyhEvmoRgGP9u4PzNU+lEV67J4RwxRQ28tc2PE/xhvSBBa1pu5sa0saF1b8lJODpkygHl+IMLsb7OW33YgilbAgI25OrDi/kpCIQjatgCa0ouWFxBIMnL36YMU0zxyfMCPkMK3eD9Dfb4bBVnxr8RZlUScs4bQ7wjNTBxMSL0W3icreordHKW33noJnN/93sO8fwVKh4GevvpYYZDZthgUm+6u80ubHCpKk7HbACPLrlnoL5F1DAfzdd50dUhC6e6ZXbOKIAZiitrnOeAYMqegFyPUqsWEzVL9ZVpGk0v5sBqOxavN5PI6G4u0/zxX31dcfz+q6h1vK5DbRLkNI3+25vnrTmzpOdFWPiE+TtfqyZAzmuahgVeL9BwNbvgovMMtwNZ2GFZyxHj123SWtc/bdOtDBS7Mn14mRubGSacC2lJXU5M+4YQj1aK7o2qliVByhKycB0ZwiwF4nJ3A9BRR0R+FL2xLznMx5P46oHNoH9+c8PbhklskPDzf0C19eRnavWw9C+UEyTIyHUu1j6ghKPxkQqUyMzSuxRK2wMdtctRchtn5js4RN3Pwv05KOyL8PHz9GGpaJ7poIwsGILS6ChgFpE9YsSiQXIPF5e0uI27hj9W00Yd98bIf5ROc1D56u1SBOxAI8I2EbJLX30plyX+2GB5rtCobiJr1eiB1CL2AD6nLAyqap8hpVOu5L4z1Cp+/iZ0p/0vQqE2/DLvmTP4c/rbgm5WhogAWWeW0HYU7wUDXCM/RcKj6MsIMpflSRuaouZYV4eX3CxYzhfn8p0Bh/TFkIoyd3uGtM4+FpsS0YcwMDTAYIGGKZHCvHXoOxagU9/aBm+la90y2DZAH6QvarlVZunqZuwBIuqlMzbq0egzSpdt5JCw6A6JGQSeV99GqYhQKp2VT/oLON4gStFDXwmkyGGpbtNlH0qHmSclJFXS26dA33hjPylFIGRxa5kO0mA2IS2q2MR/bz+F7BLNtSkNG8kiF+dpJYrnVDnZHxQhRmT4HIkFDtvz81dcr8gS0dGVprqJuJPQ4JF5Ioyp7lgjrdfOfgRrq4nl2Zjpxlc/EMiEpx8+NuT4WoNeYAa48BvJnbTLUvzmmMQGRRug3aBkREYhwGmu6JAtLJPXaFUYF9l/cIUcTUCG6gbEudpuk3gq6qEIvBrt0oMhV2YyPE1M714QY6XgYW4QaN3m0KZZzXsjfluEVQyM6fSLwa2XzbrBxjl5PaKnYcYAHvnJgJNIrDnF5DsO6nsGQ6j2JWAVMT3CbJCmXwaLc+/x8FcrBRiyhjY/B6R0Ab/c96beZtqb27jsXUqNFI3bisvNBxjCHpazI+XPjAQPOgwHTSKZyT7acCxdS76wWvNq1rFDIFUpGqbjLljI0MOMdmZc2V1HCE42cvrTkaYDTghhEYZKjbmNX7w/YtLaLHXNRqQH6neJ9tVWKpIig9EXSJm1FHjS8Is+6fkLBp2XKtubPFFzsofHLKo95YvIDyvsiX3tPQuGCDz7KYM2+PNJRmUqxlAuY06TLkeuig3EUwety9cuitLS+LhZMfTn2+RwufCUoapWL/jXov/FgwrCty2KlwUasnWxR59mj5gqFCoARx9xra1h+ofHs+gMTPXc8R6F3pAC6n05Q8Knxb8qj7VxVKL0Zy7DBW4za6OhtRSx9U0wC5EjBgk18eP6NaE2INwccu7aTYZ4yD1t8Cr07k+9s6I0TUgM7Ng6KSB97XE+T2RquTJ57Pej5V8xZDWSGYsHrtDunQLmsjqf/MO1dY78hEyqAsan1EEwOwAnRymKnEYKFMPgpm/ehG4r5Yhyx5ZaJiljgFVjNJboMfMEdmzP/AATGr043DCuOa9rkm0g9/J3kjmChrwoEmbcOro0UAgRIcK8ZkHYfNM6LBl+rVvVrUQQtILDvLoiK0sX/NlBa6Vn2srk8oTvYxgzaNcBpWA1mAOQSmC9+MUZjAHsLrEDLz8PQpU4qi7s002jQ18NJQKEUFQWWG5LGQhkb8HIIXszB+3hesvpNkX3hyAmFruaEDvkz1rsnIgoRv6zpuEi3Ow0QtIriJm+hQJAVkrgLZIFuVTQt+6RgUBlIoqxlxbfbV9MG/DgUHhET6Yg59LJ8XRfoygIi7IQuQitZXR9SQglI4H/IgAtpY9RQQX6I0TjAX7aLjVgTNHER3ujJElwHXZ7n1AeDoMaKir0/j9cBsKyMW01K76Och3sCHAO0nRnLhRwX4TcYamJ91tDMGoXx6l9A1Xg/7/V1ZAi+XW9pd2YxnNnX/m1fmOfugIxJrqO5wKHpOnW4D83e46qoPbmnlrTreekgVx6W3hdNvvyCvkb8ontZHr2BL8Esk3z4JVZ2n6IODID0RBE+PcFl1mQ/geXtzMjrKhMsVNCieIKBvUz8L/cdfv+1UPPGJjM7paq23EDSEXL2xagbkOaGd/WvluoD8apet9OMWaUPKPK+4e5GIPs2lesK6tZeHZES8HLH76+br69IwtjhhPiuUeIBZdDw4NdZhzwmuOY32QOqLxqIxL/vp6snfvIZNjTEzjCNEBbwG3ZxNstGnb/4VlQI67lSeta8aMolhmXDRWrBJH7wQjm51ltevvnB0ngXTHSjwuwDoAlqUCHpKXTkU6dlZD7ORmNL+ZhdIjknzlgYtMLqSJXKokPb1QS/9SHX/Meq8/oVdMng4BWCCi4Q4RgcT26ZjkvrfkihMhnUYPMtqAibs2yiZnqHc3k/Et8ZPubXccXBUFRgTqC3tMNPhlKpWoCes29sDYN66BTtpioAOUkTTasaVunIuz/WpiXf7zmRx/iclNWAQHHlH0Igewt4EhKW5xd/nZ9fbHzv3WzTey3fLlxjAOr2xE5d1OAb6wQKaBE2TK8guvUj1x3yLYXm7vn2CwgWllFZr7nDnjdMoYb9EOwNZ8aNjwjjDRU+GgwAAACTMOIOnyzuMAAGjIZkvAADaHiVTscRn+wIAAAAABFla' WHERE catalog = 'TestCategoryNotaReal 001' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ICZYAtdAEABDnbKHEBnwhuNh/CLvm33bEVdN4wi3z8WyqKuBSupwOvxJhzTNuHofroPh1rRpvvrbGK8lr/5zVUmdCeiOckEswCGFiK0oisNpQEiVjeFOmWj6KrzWKin9wcda2r04XJwNCO60/+Emnl7jmbN6d/SqgOov39ZEaQ/CqoqMGSkNqoaz5EjNvSk0QzHiZ0zZW6E6jbzPiE6TeJxbEUdQkd4sGRyTaquVU/NC0bQZpavNNelBkX3ZOKX//XVD5MkoIXIIrgVhk/i7NZ3dLmhNnSOZ6jKYpPyZYrD3Nhz5sd3MdnVRYtJF7v03VBGUV7z/ce25fbhFaVanBtbRy4LcwXwe0gqSGZv8r4W/89noDez+Br4k81/CslIBEa5Qceh4yAN2xdbKx5CwBl816l76sU6ThzFEpCU29Rq5zFOdxh3IblJrsDt8uDI+NQlMHXfEkJz1xkZ2oPS8ZlgYzN4IuNzYVh9q3jUPbwJmKTOtgVlo8bUqvKoqwCvXJ4CxIwx/ouSQ2R7kbUVzmfILMK/T1D/zMieA6rcVQTuUo4GQIqsr+j3Q+geoKOMBElOWOPW+vDLhuCZGamg7IT6DDvRQFj7SMdYWX9WWjcQ+hLCI0fN6dFyVpuQF7ldFXqfR95IgokqaLxrcoQM6pUyDD2svRPdFyaf57phDwFAEsA0qlmHNyTIl7DFucPNajvZYvt4NjI6N7FMZIYs2L4RHau0p2kvD21YvgY99BgRKIBLfqIfiVJWmFo/BeVjdcXomcaEO9mIFNMMXozPyQa01gK99En1DeofEqYoVE/hAJ3wBC+gGaH+idPAI3/jVYk+e4xFhD4SkYV8fs6WS1bDFlCWx76PnM6qNFPRNHo5jyx9KpTZp5PFsYaQ37CS/PHxVVrkvQoICjyErnXlvufIxXa8aNG5kijfdRPGimlZNqFP2jSSPQh/h4ZsgDb+8IeXFMVV2CdztFBl6BL/4e0CxXMAtKowN4Hv/q4S9pSwNVW54Q1OQcShgO+3a3IyVQcSK09kZX2a0/zZr1f3MY9pCliaKvLw1azXLIJkum8/5HU4QVUgiUPqrTWwt4oTG6c5F6D82aOAVgt8p1mcjLVF3i80hvRKvpRBUzN0Ol4PbcSZ7bJs74Ji3OrSS1/FgC9pn1t4l3IePiOC/v6xSBhBh5+igxmGnrwRZfWwS4lcBkNaaggOnHf9NYqzNKZMYEWJQAZoTw7kfaTqohaPKBNIl5mNsuDpS532rQvleSCQ+XbEIjiqsfkNnybjbpSbJBwg+tPRVy53v2vWZQD4Keee0gWppCd5DTOKyli59SJ6RnXympmeNaOo+FR+aRl3ijD1Wo8U0rxQZHOCCyAX27kZJ0Uoiu5Y7Z4KNwQ4uvjX8aGg0iATg4GwRYadysEorlLl0bxQC3A8mgSabrl2+v0aTsAlrMTnoUBtV6syUTBhuuCzFyy46s5RSgiMYxMd4p0ifp0bhxSZOsh+kQ8I+y4XMUaLMsvUBoZGixy074BXXRDv0r6Pcaxd2HtDT3tl+3c6wgOJC897MXJL9gLdA11ja8R5JBVDgJbjaKebA7wvZfIvjSKpDSRlncgoAB7Ba6dufqbZzSLkVbNIcrRqBFECqzIHcHyGbzVjVf6SLKzpy6DwfjVU/lD4DJimxzvcHUtGaHZybAJkMaTlVXUofmkcXZAY9CuhCo7CCFF7cgX277WTcS4aajWlWFlP+JdvgPXqWREFK5CqnQWXimn486E7gGSZQc5pT43HMaLAyHeJm7tsGP9gTjOG9mlNN1jDJWdAyuddsROZ2tocizaHnubm0t3y/JhP1FP/ImOibF1/684MwltgXLb+qDD7jm7S9cWt336pLU95drs/P4m7b6+Zrd5DH4RtgsPQlmXzzsBcqAStLOIZlXqwgbfWgAmvZQgdCoOQrol0JOrdPxSpy8wKdIVbWxTWaGxtpHpezv6oiqPZtZyJzLaL9JnHPjE2GArwRly6SvOxlujidc3Fd2glgy4JJIKdTE0QPU3gt+NMRu7Lh6ea90uP+MWRVHLEJP+6Vbp4aLWyhRMjL266IUoAfqnUcHJ1pxR8W4STfth64DAov+ug392wwEGztP/I41+FWyLrldKqNZspiMX7e2r7vdWY592MPYjb4tKnY0Io8CxBllhkIcy9F9RBQtkOisoi1m90eOGVTLkVOapAWz/x93lC6LDljUDDXH0q+TDi48J2fqs64DjlDHA5RIU93NMQ7zq4d4ulPodDUFhdQp1RN2K2FgmrZP9bm3pq4ehmXI0q03/TA7GdqIBQQ5WzWVgEQDiPTTWeQ2HHJyoWLU3WNtJ/1+EEHrVMQXNy7/CaagXU4w42iuKM2GIcgNpqpI6mhbhxMV6tACKFipUerHfqIW/5JTZNbUuZ8tTBn9NdPeP5IAsTizxhmBtUjHYXZiuipiLK/qds78brauthvzJ7CNT8wA0fAETSxvCm19nYq+JkKaPPfDQRA3+rxKLti08trq3cM9kMaj4eoW30b8LnIfsPA4RcOUFK4TY56YU3QfLQNhVC8dc8V+6KijHu3bYEOTTY93qoyXYnNVxk4Fjg1g/0+lX4Dt0oT6SmmPNnZRdVXrUDMnEyRe7yWU48nkK7iYhopYiWYWDkuJI/6cyGbMbFZ1DExnS9d7oKCiDhxYK8XBPB+oMm8cDoDsGHv8j3phlU5f6ES41iuxoIgTohIpTzYIc0x3D7aCRscDAmhB164XUiocHjqBuuDmpktfpFnc4Co7V0xKVlyYXEGt7TQrQ6Jeei1tmpW8AARuXfWDJUG8L2NYV+Wz8JnBOywo66XOyoxNteJVxmDyjkmy6In6V1R0CP4d1RSYOWK8dxFGlJojtYjAltd0UKOvGjVVA/G/2rKF4t/y3wvINCm9fYqjv7kWdGLKGSH5Nu/DGWSHSPco+Fv8in00Fhn7s5WtSKRfiA9mvYY3Rar0q1s37Aqufw+Im/Wg6axFZSSKRJgLoB4F3nVi7EOsMA0QcuHSkbO0UErQhn7G5iSfP/c2e8xl16JAiQuq1RssFcex8zNrViYYLAg3bzeQA2HT900NjxHTfDgS7EoU+CHvDlfyPqVXuQjoW9pn04woPb+nOYcg8bfmH+zpR5W/IRtVFbc/vVoS/bZ9X2D73hqrTO9W6SuVtOlyrMCKHasUOOETCLtcmBkryCKpPQeksL/vN6EMLzjJmotJKpfQaPD7yFkdCn3lnEhOWVf29DEia6ya90uboy8xg9MY3XzHWt98KBOLlAsyMEgHcdZSPPjSuXRGHLebUQ3efcMZ6Xm+EBMqSzJ4bCbnNqE34W6e2MMzw1GqVt39JaAdjyfzts79IaKWvCKO7uqM7n4zFkmQpPUz+UlzWB79toXuZR8Ba6vLNxscSPrxR1WRIuwv5ADuz/uoAep4hdKCD4lyHGIa4WqtkMyhy7ly+HG+NJUXBr/ObtNVtIQFN5zCQrEUFX/n/UQB8WoPh1k7Ci2fDPjPVJFz3wGEty2+ZQ1LA8Q8bVYWEFUBft5q97Bb9DuiAeF3SqO2N3ApOQ0behs4JdQ2NkJBwighRL5Svggq3Zu9+wQbmiIWMB0GIvzn0cUERF5iZuQRkTOpxeZvBA4Ptn//Hz4Zcynba9xhZukV78Ha4PWYbfHdb4xi2D0Dz/iZS5PSWskebTibDODp3GpE3cAyjiE7q9U2V3NCHHoF2IJCR1fdSfpNv+bgqARKaJltgyAvYSakkZPoUe7U7sAcpU+nHXr9oSIdtyMgZZTK0I2o2lerEM6TNK/o4DYCkXqs+cw+5AlBqqL5pGGaZw22ny3JZ6nJZEwS8v+1V0Q5MumZ8m4cHwwYCEU8IJ9RD82hPLJhrWERKRk+tN2jyggdB9j7Y/CUUbLmNipj6aM1Ux3sIFB4vgMP5Cc6YD7X6w71GxqBgubjwu7GhF0D65kfj1KPfhfZDD4h9GWPdnwdXSIYrLQVAsdPrI9iR42t7iSCIdL2KsnMiu/Cnayiu7vljjNuhBsBZNyxQOQ4svhsR1kx6hMreCss94WrOl2778WJCwp5VUD7cN9mTXhA9X1V1lMSZ8zaSlA/bh1ve1ioYd73sx5xsuhtTU12/8xZ20v7Av6xB98+87W5AMKPP1xHdafbrJ7Fn74e9dUOuAVY/Q6FHXjW8HFICyBdP5HadlWukrnTZcYwuoqgIhpqn3H21X25WkKwelmsbyhyg3IpTHwjXT82pWIZ1BQzGHZqqScofAHfcsAPFLrZtGGm/FGyA0J6+NM0YcmPfngds35ZlHvVQLzWWsTfi1GqND//1mBf17BhO3xLVnkcozuWafLMC6xscF20pf27AHaKYHB9J5rDZbglKRnQnSJ4ufyYRmJ+BFT4zqi4j4+bhJ0kUF2fSK+qw4aodAXh+sQdQ4URFHm/j92o+4XQ33vC1QuxqKnc0BByio/q2dRQjyWAcU16s2jXWipRtlzVDmQhx06q2YgmmvILZMfhHHL7+LylWrfQoagxT17DJbIx8TuYG8ynEj5Qc8VtCoIBIumPu8nlmi5XC9Liuz90z2IRlJ1we1SwJPtOAN+5BIVSk01Du542ppEeVV2b2P7z7JD0AY21Hchifd144B17u4pAv29RGyBEremMEfz5beoyDrnBKJSBTtOu9/m/OqxJbQ+Nt4nTvYw+8/SgrI6u3ntypeshAmjP2wctfMfGOzM25VQxnG6/3232sZZoM4jFSi31BE5RK4M3r/atg5RxiiHjwFTRB/gCb9yT5W6lhVCqvWO9bHC42isSy7MtRIvxamYR96FNIEpzVx16O3pifsoi7uzcr5iwWUfE9saZiQgBXAgnkTOQ4M8H1FzggC7sl9sGOzb4Mxu3pgRSB7Egud1SrIWIHYe9jmu2cc8kk6p6GkGJX1enV99uAQ5JB3RdAQ0cNRdw1AeEeryVw19rN49NhHvKB4zAAihlxNsA1iiLjwFt3HWAYlSxyBCwPx4EtmFAbMgZGnv+sKoQ8tr/A/m6GBBPKCNkjuR25xBwTRW/afeFyVodwki65CFd7m6MrBirJY7Nv8/14hmBaPu2q6P2a4dHAG7/wGbLEmxPjb0BHSBiinF6vOtjMnRqE8h2pnxOQcbZl1cUk4DSFMZ6jL3zs5LjTnq0ksj8/EZ3vFC59Xm5zjFJSn14faEs4ZgKS84VUyqFufun5yyMdiR1TB6GgaBSt4tDyJ21Yst8L1S03VgWritPIgTSbZLlTVrixCyXsdcYwypJcX1g5EOFNinw0zl0jTosrXuYecMS7DnmdiGiBCyCXztOcAYOUgf2UrFhow5KGEsBarHcxQAlgv7dNHGKZiLq4XYYfWTgdRkDNRbfbl7ZPjXNoNc/i3qGzYiUv3bBivxM4fJVnae3wsud4Xxxy0+8L4Ju2jjbAkIZ1akyux1Dwic13dGvPVehJTHAaGQ9ng8MgUwkWx3VhQLEvAN9vI3Alpk/lv01Xsqa4xx/wWnQaIQ4Do2MMyR7vlP7U5D6eYuqlpUj9ozbYkJZAGc0zuwu/UuicZ3WGWFxzxZvFOZMwpYJwGnxd+tfdxbtqmOHJO6N4Tp2AYI7INQthpoVc6M3LLT761EFhBZLgy/acSbQsXez1tc2pw1fbDeDC6TriRUYaKtYDHjJx9330i+w5XJRCXq3eTPXi5+THsWog0aKW2aHnTKaYZQVlCc7WC1TTdoQnc1MMAj+QtXjvWX8kRUBcra+8jmPwY9YdSlC+p6+DXrgyn669r5U4w4H3bSjI8EOYa0lLvBiyiXfe7/38eb9cCcQJH1U3KOXTSS5xrF2NRyFS2h5kcRB2D81Pwka0GBM0BbzO1gltbVfWk0hfaZyy+YxJrBcOALfpPqjGFFVg2QAk+LwTbL+lgn1dOX5MRJfE/K3nEzcofC+tL5bdhWgpJxwi5OJQc+3DdpmtrqU2aGMOhJFLFoSkwM+5sQdl6AsUjeS3gyAPpERb4KozqstyqwnYST2YPo4ZFxwxruqXYNdjM6kDQzRt5epY7t49mWsm9jhJ1XdwIURxUo+f3VftH4FWiki13xwgBud/vBga7hTk2h3iOwaSbtkaqBeW8UOItUEf7Qj79iQaweqg0qHAdiUyaevBXLPWB3iBafF790ybWgIf4Ak+p7JOYTYN88OCL2NDFYi2GUlgkV+ZMw1QfjAWPxO2xzdfEeu4sUEkYzeMSM6kN9NDPGzebgQ81SnvBQLa/SWgaeGI4xSubT6fC9HiCHMM/4ugqUuiMsy1kv+jx80LSPvJrvhJnuvAZr+rCo1gaRof769e6z9zvBmu/8bxO26nNxWWxBZJjfozl13cOw2DIPIgO8sFmXMZ4xRWCRXria1pc7isFztEVlgLAzta2N1VEeRhrGGHQtV/+s1JyMC1ARVX5RODpWpGZwxRzEkbmX9Yi0RN57qWKamFDh/JzY5Us57tw54irbQMmojkZfD/71UDContIxJShdvaokhdSTe721T2R6X/A7bnKi2yRIzz28I0/hHj5hYfHU7fkHudMl67UxbZ5e2ULSbtETJS3x4EOG4SG5tZfirpuLMdYfcQps84+q+EiYMxDyZXo+kzlgbp9h46Wh0xgxtD6wDGh/gLrH7aBlXayYP8SAeL5u/rXhUp4+h193xS6v5IJP3BTDcKZ7m46tFfL393zDpRqLM8JcTJhHaZFtyabjSHPEHYzBnVAG4ULnWplaXjhudrgveOO4n8sv+Ui+TKrkAVUp8kzYg45zDPOPa/2AzBjQ+vaTBJkTTmxxXYP4jW+jrlYPflufG6R3fSidk06FOVOyrH4ryVlkCwWIIzh7rnxpYoFtaLs2EmOuX/laXEVWOkZY8GQDUmx4fNtcqjNmCsk8M5gdYYf2ISDX427TF3lLCqC56z8VLnjPaYlJ9mYNb+0pT2LonLVHYshvMaq16unkw9kW9+vpD3NNqwNDuib8XM5monrVyRZ5bNb24Aq7olknhgGP/xhrFPMzKrrkvwD85q4GKWtHddxTodEgYyyofVIMk07v+1AElau+hNop4GFuJ+112N/KdFHHAu8ao2QjN1tkLcecXljbwIU5KWfKxGnjI5+dmWwYVYBYQUA8P1X8k1YWq1n0YodAssjAT97M4sjJJw/bc8kyx2Tlt25AscBxu8w3cwXKhdVTXCoYVXaB94EqntwXU7PpaXwwwUxfvYzc3gHnDvB4CNIleTiR8wu6kJljxZoRLUkXhOuJdA0jz3C5FISNKrvq7VF8ACsX0fAU1A0SkvR7vsLNzovAUhPjRd+/uwIn8XlEjlQ6MppXq6osA7SjOWJeauSx6S3ewdjTRq74YdJS+6ZhEpUtaGIV4lQmwp9EdUxjsAPqJjt1FH9qWVixA+girIDVBmnaaHuG/1aai1dE94ihNzfZH/6IzLdNmnhTM626UBUAIaVay3Nxciy5/UwEH57VoAyPBLUM747Bkmta6npXQroEnyinEzGIb4a7BRkLONfuCZ/MEVgxPXxiBSH5+jM8rgu1dc2fVNH+TIXbMGHY8utpdb/mjoo5dvFFrE4UGa8lmeFH12eG+E4NLxouO6HSu0VLuXqbRK1NBS6SUZUQvUrZQRKxEaM0wjkAjIlB53YpKbEoMbqn+0BZ4Pl/8UhiKVj0DbENfks0TAYuh/FWnNbA+7DvVLNy9XFxOb+KtMYViI/e5N9sg3KZv7zl7gishZ2lrW6r8zYm0i6s5bX/imWnFEZ3G9y0vNeFd0YNnbnZVeNmY70VaJh4KRXKnIzs0mnQ9BH/4mR7xjZLkbPMcCdISKQCA2439I2VKzqCn6yquodlFxpJ7IKlJ0aa20d6DpHwKI8fEwmGrhrZ9bQw0RPKZ/+LJ+xsrRE2H68C7MxWm14nj488VHw3DxzWb/jhk8QGoFLAHlEjyARrlWSz4yn11Nnk4MklpCAuNqAaTr4NDJuyaj13ls0Lq9bqcB4JN8HpDmaub5AZdv6IAo854dBVTCx5dC+zaIJFIqIbTQ+qS2sZZPrEPwlo7UjZk78uuV2U3BZ+E5IQOP0b2gFe72yMlkNecQhLRbRG9IrwzEVi9NdHoc1Y79g74QHnlwyVwZbG3aKtBX9kM2/6LMRx6NslhorvBgCVWcOqlYiMY3Dn/6oKYCBd3MugHgYM/g3lsh5oefFY4PXERnFecZ/5K6Q8000Z9sNzGVsD8yX7PenbtxW9G/VIGY5D6g0oRBvgX4EnNLJ/D9aOt5nCClqsapjy2RV+Y+oUCYVeNyjHuQtlm+wHz/1pvjiSvq/sbl2tpg6N2eq0nr1S/4ee8rdHpAKBAFs5Ygpf5rYqh7Pw0r2YtEf3q1RdLYdM/pPcxRVATrozQ+MxCm8k2GgSS/P185ynHw1j2zAf9duHnT6d2pmzd5Td1R0rADgBbHjGwD+C1S8z64DqmeWhk40vntK5t1Bh+ddlP8qNVfIjrhjMaAIqNkKpeetPvqfUWH+eCXt+g/xofieNEIj0tvVK+cRUsU1avOnV5tsgRseXg52SWwSO9+bgebheu8rjE7q/n+4bexuMVbuuBZvIJ4COn0I3cFJ7pPAvNOgp6Fka2wQIpg1uZKv2chev80ZXHJFKAaNZWX8InSIZXd3i3ks5mMpWgbkn2n8nBCS16uJjVKnOhNRqS1wF2QoREoH0/CQyz8swwpGfqA6c2O2pcO6YLFL3shlcSK/290t3grHxCt8FgckR/aWwBDEFC7+HO7kuG5KO+zrt7j/jdx7S/puaWRhP6DUkfV+KS1CBM1EVW7XPEpMNr7FhjOo0z+OlMq3enXZ/e1HTAWo4ABqs7aLNTEmtPZmlsDGpHbCQkH1sl/ufnRYmwuMb2pJyhbAmJukN5pC1RzIetPMaBezGtQ+S4X8ya8aM2BSX1glOYmFgCrzVFUdsriONa2ZkaOd+MM4ZqSlGmr5Bgla3+IiQc/2FysVur33YNLf5WUlRbHvQYPoc6CwMl3taoqQYsipI6UFo0T99K94xUsur1k+K6umpoxG0ODz38alst//7zCgxB2aOQRvMYNwJ8xuxm74C+MM+WrpKBfOTDv2UeLb75fwR9pTKPAHcVGvwDEt4JcFWO2C6O8TVdKEPkCZPjdc6lu2fDmAT1Wxl8vbKYBEETX+DMDjvo27ScfJg8B5oJLqGCe2gxTwF3TQ041zCKzV0cqq4+Pt6++8AE0fA5m67l+A9XgWUKhxvaly80Tpz2s0Sz8FaRip8drnrPO7r4S8A1YE7M4ifZw2pwtNWhdTVQEW2gZzPNpAha9EBRWhKUa0u1cP9nqgl4rvj79+vVI6PDBC7iZLRqcEOuUpG1Unwj8EQHly4s9axfG5NGx3kDO++iK7I0cWkS7Az7JiDycr3Zparo6NLRnQc6wBFz6MBsMz+vSEvrq+oAAFVyqteMOxxzyjXBwrxLBpNfnxtRH4RxbxGjbkNmeucq53XoGKSEqSuiopfx6qeWVByDpOmxN95T52xRDOwsNrbf8Op/MDzy/btqch7RPr5bT4y8R6d4LLFO4vMGaU71yYsKzayfONsSL4YZC+kLRsFYPvSw82SxtLoBzcOvwHhjT9NGrCP0StcU33f/svPks6PVz5AIDeOPG0+tK1QT1lh1mafTK+tV4cSqGwK2xw5LVWlf3OjmiQq1pNxmGmozscRqnz34fPMYUphNQ/E/hLX98t2FWioWq2cgNb8ukXHM6f02reyDPy+rQulv7c+6RZnHa00g//xsaYf1iqzIWcQxlPEaIhaRQBR/jCzjoTbeh3OlsvRk7/Kd/uG5CtL0xh+k1k/dvCERAgxD0usAYP60tkwzkT+2RJuFjMLQs4lzy361Pv7tMyM3+Hsgug+TS0RMTyXULlTFCIk/S31I4/HjXIb8zNQzDXQ0wBGhXKPkU+c++lVsBR6aBVyRvAdQaMcaItQKE/Tic5B9pEZ3jK+leZgt1c9LeBzj3ibA5vqmKlbfm4E5JofSB2+5ruh0X7CzId+expktY++CguHH7/wsQ77txjRbw5NE5vbwKGuyAVbvK9SEWN+WxXNdtSHNjWQZY74HYOSRs1pjoGVzDcSYiTTBQLEClFIyey5cmrpfwMKjeSwQYSX+Dpmah09yzu9zxpZeeOXWxV3p6JgxgrxqCdkzwZfIOOxHdBuhZH8zdl/Vu0SJo+rUjFbnIfmjNV7Hn5+DsjmWuDb2oHk7B2FD4r12WauGGRsPR5PDIdRIujH6qHipxSba88hoGpovzwSGngVmGSWxfy3m063am75R158m4+rSOIu1q7GqmYiJyhqUk6gEIk8TSpc3UQB2dLwzCaHyqp8kaEYM21R5icMKFJh2vpzFbA9KMafoQKIDkvaxwwqpd8GMc+/osckxOWumj+KiCP+LhdnQsXWHLMMyGi0vBTupf4AZ78/tousTINXQoFcz9kRHc3IeAXSBO5dX95GyYz6M5irJEAp5WFV0vBs2LR1U37PqwR+xPrRnrVKKEOhx1HMF6e5URQerOvxHmWB/l//htLmQhG6NcOZeZf2TTbwUW7UEzbv0CJOyubc6k0bzW4kU0ON46WyE5igmetdJpIkH02SNYmOeekadIS8B1ZXOMIKuDWvc0OQWP8AAlNBK94caVIRABQgCsimSY7AQgPywxjImTaRk741xqAmpllWBd9OaT5Z2qlrOc0m++bZB+tlXsAqujrjaVU8RFdmhkFqL07irq3UHrDkdKVvMExYTg6gsRylL9AA/q+NbzRMks1iYiFOYUCKEeE7Uk3YyJ8FYO0d7HMyiGREFOEVq6PizI4Rz4L1/iYwYlYXRvvZt2JBDX0/9f/4Nb7cETx21zFQ3iuLXSyKyfGYuOoBr33MMHMMIvytulrFyDtKc8zlS6eyk7sWNRZVE+IJc7atFJkiVUPEG4ul+mMM5fvmPM0/iwyRi9Ht6GJ1+XzcILHmRY7Yd1zZPhdOA9GWufyTGWynCts0tUNAYtRU/FNAZnfkuXFlKN7DR3xFAlFmP3IQFiUcW/D4YfwF/7zEnSBl0A2sU8uBxxnU7YwwytKI8J2svA1K3yu7yGW1nchkf2x0oF/AonY68CjCCsg6NRTZjDRrfcJdgvQgPnNRNUvJhqWOqQ9zoNfMK39ijBnyAmTyAivNSrC0XiRZ8GwxlbKH1qfsU09a280pX2V57QRxmeSQkmIjNY966fpKzZvXLa8qIyUqUgDga+sO58zDKUFk2031ECV1Q13iGGsPljwPyIG9xc/dPRkKrA/zHs2UPAi1iYIOulD+vU3JNvdcrWNCP+b3iU1IRi7leFSb4ir5W44brBZl+CR1rCzmEY+t4hXFFFN9OTQGzL+RjXGgkj9/Qyb+CAU0uQdYGUW4UTtVexxvM7zW5m5OAqmEfyGfxfYzrVgaPwb/++8+sGParw1qR2snXj+/EOFg5eEFMyLCScFvoXrSFAPJRSNUJrN/wXL/Uo3OpTMiMU2PBOP2/Oh2Uh8jWGXDZm2hTRAV3UzDi+DgP05teI+yYkgF6W4yyyXqQBECRmrMQ+PzlqargibJeP1xq0GfUYo7luri2cvAnjKtp/k/kRoFySO0ZG3uFE9woXQPrfIhYuB3eMVbomlRINeH1Um9uhzGcDmogP4KOZqMOLUJMdW+nJuhwv3zJJI7i8E3DzE+LBuzXC7CGCiLqkJTzFoV/E73sm/BKAhdXQ3ugft7S6zoleailow3TRLBjg0xXD6L8zBiZfhyyexQcsb1F1+OOnLX7htmLU05ZsVmeA3Jw9ZtAAzxn6SDUab6w7SP5RUzWYpEcx2Pbx0rIUVpl0RJKcHj8EySml+JlIRxYDx54Xg1yQwYRbGh9yI7NTAEx6Ihc8R0mOZNgBs5WG1dw+ETy5oq71J8iCH/+PgwABcJu9LP8bl9fpa6TL9T3nVMjMzNuxyD8PLdcilLa2nDRUKUDBuNB8WrVtQgxHyGqX/ua9n1dfwYhxJgG2XwaW0z9Q2BqVUTG40LEHvkeNmm+oYsoGu7bA/cvdKEC1kCX5aIXA5yRad610bAq/f6em1rKu3zA1UmrJ37tv3Hj2uMOwdIaJf4s9nAG/KhAe5WqqFGBxX6yxZEh/FM2n+fA1pXxDjiiimZYnFZJXa6Tcl2zHMg8KDSPxm6Po1UVvJpgHUC1N18IzI1GRNpRF4l9X92eDSiErPhLI9UsWid7XBcCd6D3qW3cmdn4YrEiYiNXGppwQ+2XAgemcNMZZfS6rJ2BDoWyEw60Dr7VpZDULgVZmGLkRuSSvMpRqnFs0AyIdTjLVkvm7tBDSN4Brx2xdfd8bjnJr/Zx4qJesQL/Rkqll2Qd6m/8/owWumFlPqpkoz+Ul/2cUk0UNLI8hDM9/K+NeeNuJlVzfB8mb6Fs5nTYyeJDL86gu8vXPPCUfJRh20OMSlKs+ARsa6Tk+ROaZWZDYbSutq8kNVpsX1ejetOVdI1lF7/iIVSv3pYYCeQCsLeuFhJL1YXRwQkg5MCNA1xqyz2k08p2dI46f0F3p20Sbhzh8U18YmPpSb204UpBbk8zYbmdXGV7Ol+/+lfNj7iZ80WuzXvXATID/1pkFN3YpYn+yxkc8oZEi4wyw0nD8zD90NHisrY72hYS5rWdl2DkUzaKykMrqWCsIx3V69E3/FLYhh6FQgaSpjG5JUNGod648YsqckdRm+EpQFvXZXq4r3dzqriEaIlhViAQrkeSVC/VRBrHrncFyTNlKireZtg/srZ9PjqmPcXqA12i98klr+huaeRrBU2xzmYNk6bJLsfVkZbeVauS7at40ZCm212X2tC01hCzHivNpN+zFDfnjBrpEVrTCTy2JT498nl5bmYAibXBpjf28aqIP61awJA3rn0bV9+OWUMA0AhJuznmFQoR5P0QifE7LLZ4C2PX6VXgH9PI/kQAzazo5pMMujGlhh8AbydP2kXHiMG8IHOdKxLlsLOAif5+FuhEkbBFkgx53LrZK4oKcI/w6nlm56Io3fhz48BWz5rIqGMN/t+lPKJYHCujULamuomzTmgPOzR9EzOPRKaxFylCq4zYNsAjbvvvE+thyUFx90rgPov2MAjCS2PPLSOfgO6gAgq+yzGmPN0nJclhuR5Vli1MPaPDBC0LXhMzhDTVKA22nskLOKft7jNzwHpELI0AD1kjpZoLcEx2HQU3IUzubxjV6v8n/RCrJrU+WuWy/kAvc2hHZboGvQxZk8qIPamFI6HByqK/I3Dwioqky3TTq6qolODbiiIz7Tc0dw76Isc4PW4SEFViiOHlHz/pijtlDoM0hWcmP7fVC0xIP9RlV2PFGd6E7SbjN6oqIjyKOqq6DkIZAOd1DhiaEpxR9O9A4Vbb6WUdRL0cKoSkgVyP8zIR1ZOuC3B8unyoV3LQkgYPeov17U2xvjkxVUjKT0cSJLJ2lg6R6pf+txcMHHLKHFI6Qsnxmu/lNKGdOgwzBqo1mfqEK052nTLGf5SSLQbReyaNVa2tIVMMPagt3WTGPh+ztqx1K9dHXL0O00I9kryFH7xMbH1pn382KIdYpZ8GnsqiZ9z0ZlGXqQ2YcB5HcevSl030xQ+IVE1/BxJ/aUr5tZo4Hm1UuC8tnQn8nbIDMxzPOSnvEw9HHAQnMjwBMbR1IO7N0huGKwiFdUwDKfSHXAyQWwaBv+Jt79d5AnV5WeijKqjbKzdY1pJeRDzObhnnMl8n8AHo2vA76cEMyQSEqpj6V2mN4STHuu365lGLHV9ZioxDN6kSTV4TQ+1GRCEJlKXzYzMGajTiZe+F6ghZVxpWwlUyNc0r5MofcZ5nQMX0RYDqSv4jOlS/Gq94RENBVd8+4TfYBbgzN2rVp9Aib63HezJ1R2vfRldUhbUWxLF8myhAVMvaZRzq4uYx4Rnl61eAJn1y5m6t8H3rI/TBcgrAqJUvWet8uuYHInV0XcWOrUzEjfq7nqyVNME5CspfNnKjpMLluuUNZCDpcZT+WmcUJFpacD83oE0XoThKcqPCQ5Hgv1tix3e7g0vtUQWKH+pJwJ7KaKPLgmwrFgGaa3aOpMhetrUeVk6b2BmZvZX+q3OFfWEUjhl8ksG/Y5i7NhP6TOXzRt/IFDsPbErZxtfE2kFz6Ln9LIhF8Z+VoYfQBGPZ9k4DhN9dChVZJgrqiKwAofNaxWVUrVK/gmdwtReB9XibTB/npkrQce097/nrmvp/p4nO6QUmOeOeQjcK3vvAb4DBzDDuT5w6dqowDTSzyyVrWoQ9WVvK2Hllch7y122JbH3byQIGiT4B6+Laf9Gy5SBNJJ6J6GEh8HdpncUz6RrDFTjxHEeCR33CvWenbpvr9kq04aTgfFoogoEDrNbE7WKHINWs/VAEnD7bH2LFc/F8I/boEzVJ+aZ59KTY02JqaYoyb7Bec9nX88wFBM5Rt9khV3ZscsZPGoaRh3HbHXiTo8c7bCIX7eX4W9vsgvW5f2LuMuC01Vtknp8tp6crsB1khxF2IimMZuchQ2Hjbz5TXkoDZeQ6nIfqwtMKje9+PQ0aLT1g2CK75SMP0swEXyuwbyTHYVRbMcuUD7UaUwfbv2iCifzvkZP+cgICozDHjecWmLKEo4VmJSrfgaVqJE1h370m5+VNVhbMfyyuMBjvPfrhFS5kNPmVg2OGI8/vpyuapD0oVoibQd9WxtKXlAkUEGQTX8GFAiZRd1OFFwqN3g92kwqerVafXxrHWQRtwMn+sbtLt/VUhSnRYZ99E1AIS7IcUxJZw5MfYRqobL1FzLMdZByTnzJvKG7muMdKL35YGU6FUYdP7txeGqaAorQwFyT+xrUO/o3qaJVV6iNKv8zffygEc+80+ekO2/7bi3YvRDTWtKYgbpHfbIGsrBlQahkYJZF3WSZY6FCjqV8Y2GV4eQMd3wi/z0tIWLDRx4I2lxTlaDe0oREaEfVmaBZLq3hoSTQcoZ95NWqA7aAUtjxyDUkh1yJsSKbVht4pyvT6xAWptEEqhjU0uW3T77DnhdtTn5GuSUFUTe3dw6AnhyxTRHUvxNXNEs40D2WAEMEjaJu7GmYtExsDMmmBTykgjVrEDrpg49O5w3BdhL+sj1zftVoQ7ySPKiDERWLU8gevwuf5O1Q3sBsXCF9RPHaiSCk2RXcdHDCn7g+UMNx2JN0n11MwpIg2TE9AaYULkBUK/ueUMxPR0RWdGnKsJNIabp6qtKJO9HUEpSBWVn8pghRyMV9hpqZQUv2E+vaYMoAQPJE+xsZPwbhN4FbfnQ1tcm/jUf8bIHi73lAvq+QfNs29sFZLTeaquuz5hpx3Im3iPdWVwkM2sfhiU+btS+di1T3RpQQKBnv6Vbh+9gG0uKh5/hgJ7+/dmtYKTcn5sOCMuOoygSNooKAtrCEuthcAEtm/LHG0ZOPWIieCfI8nDT2RrxLGHi8kmnfXCPj6D68qiSEvGQtHpuHQYO4gyeI0aCMg8NbPLvxusb/R14pqzwi+tfTEf2998vcnBSFAKH7eScNMmSAyYi6TmnO2DbXhT4UPULDOOCBjX7Abp2rRoG+F8q7O3OTcPUJVJFELgchypQY/1uf7gpObwbnhMh9uOldS3xC5hm3dTfvEZAQ41bzy/0CMVSNjJHZziguGDZzjUGr7El6IMBqbrPUrZgqr0aje+s5FllYVOOhe3Yxwe2SUwn9xJHs7QLrbsJ9ShAlGABiBdMG0/24zszjo8tFti1S9hPwNKlMMeEuWW1XMfAuGYhK6GTbTzuYOlSNMYSnupcaQa3BYAyikOIvyQltDbGyorVDU/GFeGk1uRQLhNBaBPIGXyTJj7kAyq0Rc1A2PGDXNqHC4F7h2GibI6hbSY+W0H1jpBxc3/L504L40iKj/OaffjY5PE5sLOTgiW4G4zI1o+KxpEozNNzLFghrxExxwgKJ1Jmsnsjt/wADib6DHeVn9oUSNEH+Np3aYHmCkUx/kC9qCoriNVgB8+/G+FqVWd5MDxx9VW1LV6jxpH781SGP72CQkrYy9hRZoQF5+pJLTSGl2r3i0Mw7aamZEoQ8MbX2kozFbCF1NVORA6MUtFRAyo1EBF7ik9VAag6343dV7S7lMygxKGQL9il+VhMmUHD2vVTIPFG/+aVWWJlUIG0YTbPGC8tvyjcPf9ahjygJ8rlXEo14WnM/UNn62u20GIH5EvRMUPHKVDgS2fpQp3HmCPqPE7+/w4nuxZNbGCAKQQaB+VBCKWGrvL1uDZ7LWUGdLfuVYE3BbJ7tSW9IXC8Emm+8NSmcnngwbmN2HCzGER1ZD6VRPDQX288F+Mt0oKbx6EhfmT3KT0JvhE8//DPuHiARFfJ9YMVy+Apevlf4FBDA7x/IuHRCmUZYiMOS9u/mcMnqzM9sqNjicKPnrUnzUhzCH5z2x7VihATr5v52i5ZdaTPq+LgNHgUhD1J1hS/IHtvxxj5sLHdbFfX8r8Vq2r46usQLypIdMr7xH2ZIm71v6uN8+xxHUyoXXRXMd1ytMjjdHnKcJuNDreCMZgCHKkFdFEXwJLN+oXpeP4g6sS1lVoG5o5HoP9hGhsR6+0zzgreUBwKus5oIJPUuo9RRewSNIpn1xzn6UpLsYeCufRtg8kbxZj8btvh5zgbo962kYwnB1d+TyzU01j9B4FMK2qI0QHDNZegMvotF1mU7+VeCPzKrRVRBlahKqCbJD8+xKC1nqkQteuPJN9/viBiab8AX4j9+S6VglTWcxvTNMQPw0oafMTiHb39tMUe8F6pHl4TE7h8/v3IBQDwXOFSgnFCq8ly6kpuxj9BTJPIMpyvxrnaIC/RxGK3PU3qda/zxavM5fOamdNDaqR6lrZtqAZHn1dO4+hJNASURLup6CABIWzJGUtFgAl87GOQrHv3i0H/NIhjkkUKnGFWzUrzZYSJT4TjVEkzDcNWIP6ngOyVZ+PG5KBCWJ45qwcFovqE+0a3Fh5vMCU08yugdFPzJ0s4ApIwhpcw7ioeNc0B1mGk+wlHcaAWnlxoXJTL5xWNh8CVNesQNmg6ZH0meo4DLeTUIAyXL4WgwJdKJGCf86aJ6obwZ5Ql1gLWowl4LsDWrv8IuGGZseUiXRHG+fTJx876v9vNHhOWJHkf0MIuo4CYn9JH6fP7w4GlHPjPorgpwFZa9qi9vGYHHQ5n7DpLif5OJ+ut9wNclhCgVmCb7quxfrTkkeHWZxZ3KeLxmz18FB9MqYVHVnzqi2Esgah7HJr4MC8GWmsRQ2g9cVHJLPOubC+WVwCbxUzoxgzhDwaeY6oFtTI91DQKKzUFkr9Fs31dkWxvY6Y8J6HgBFtHqzzxmpHuDKOtCQb4Zuslkexk/QoaG+0EimZnFlBK4cgo/cXBoEV+hX17iIes7+0ywCeA0PjhZsjE4XDhJ8pji97r62QlpQIU+6dFs83kpez775+o8kPsNKVxt6Xoxl122u4ipmQ8CTSnsu72eHEWxHd3ik4j7hqYDi/Yt8ALAF3dtjHpcG6l0p6ElOA8wodadyEJLI+UiYrP5EpErKTRXbCbj7imVoe4PIQ74Um/H3IC4piT90Ag4kA95MoPavvsO0EKIzPd5l3MsV12VOoyiyomXU9WdA8Mq5G/wiTf0A8VS/y1iOSXwRgO3+mluRYJQiDyYEzHI05hALcNaNaijhVgYAJB+jObGcqWLFBMVa/bR/fOs5F32JfAcbfK4Onqz04lO4/OJvZEeds/hh2+vngx2QT4+KCQsI12dxdGU6pAIPXNxosu7HTcjU9YRpVd4genWHobRfUmFS0AXqJmwooohXVRGTY/ngePNdHrHw4Evjl2eGVn/4PckP/UD0ZYHUCdOYeMvU8mlNqpWiUiCTISiWeyzr/o6LUpTel3+mTSdVV+hNUlkX59bWcEV0AB50Jqf1JRUiV8vyT+W2iKIE8jYv0Jq4EhEbYm+bs4vqBXhVBdKyUdPpnLRV9xqWzlyOlkauYBHpTXpSkGd2CDpE+DajmW6Ls5wd1oF+7DeebMPs3+w9qi300rAMxIwWVE3PJ0Iq4y5xFH3TmgaQFhmnESmJy/f8zdmTPtW6gPebs3FwmgwXcXvCSzBqk+waAVjbonMZgsIlgl6DO0ec7U99QWCe000dzPojLPy1IUyzL0aCwxPmST6rdj0PX4kOtnJi8IAJ3HbMI+sqi9Ek4aE3hTwSvHitmer3cMmttZDrbR3RFSQpXY0IkGy0+O1wVedC830a2xcjjurdJo5E3gdFhyGJEekXLJOhwjy+018Cl0nIl3W4GjLY376xM0F8waotSSyhwROy/mjpSUsjRqFNEc+fIfuleldpQQzyalLZVb/67hDfr3dgoelBqP4jn4y1rralsiQxaP7ZDhNyG3dPWOLTu372k5gXtSDSL2Ciwa9ijVwe/wpaGndK1HW9wgBZTSP9P7gm6shY9DoDMaNhJP5fut4grUOq5X5DqZ372jUAPEx3skFRJVQar7ssWmRp47KS05oMA+5tT2Vl0sDil5mgJF5CEMRHp7aIbrrI+EEGxtnoDDkueFlQfM+TB1jimPsrGhNR0eyJg6jkpnz8v9mvu1ad6y+2Eto5Ut+2fh48nlqawR81iYyVWiC8fS6z2nv8bAx4u2Fd26z5tNfqLFB3HOjodbDePWf48h/DcTg6NVVR3RJCgZ1EvkWMhG1TdwDEVteCoQSsBJYuEnpUL29uFeTDiQewLfQ76QWx+CQhDO7ZD+0WMGc2bMzkBRCeGCSM4dw+2detsWk6e+ta6FEk9plRfXB9gf0ZDLJc6CedJ7KzNvoxAWmKOdZIi1qrtaRFVeacH87RScjAQfMj7f7hToomPDC/Dhl2fGywrUhrelL/AjYpk3NZFDjdV0IWNfs376krltPYP4T1LJq8dHcaqTHyNIrXuUlTImD1MNr5isez1zWILy/brYLd8Ewu7IZbw2uDvZPtZNJkeJuHU6pdyX5fDPwpaHeP1m6EDdUt+p1E9UhBCsqrQ+YlF6OPiHGuwKyZ0P2uYZF66xwbNYsGMOUFp/RpEXd/ROny527QDI/5+co3FPqCvSxP5/7WCnXt/hxAqrCnY8W5CbcHHc7ZsoXQEVQ0Znr9EIPM9+9M/k32QUHta4ULYxWyhmJZBOiwPOQdSojt4+jvv1NN79qkrn6UvqdBeqs0w1gCBZ1gmMpGzwQGXgEBmXUlXqgJC6d1UdkBfXulzA2+uaYfF2QucCmt3rfhxBJTvjl7owLJs7Hr4OZQeEoVQBi8tSh4xUnx+62hfB5MLhOHMo4OIq/Sych8V4xAFNULUGt+hOtQfyfFTmDcUxZlfUhG/VrCdhGjwCNx0/snhemt6bRZSe5o2QBhnv9zg6Bwbpz6RbMFcxNg6xrMcjJXdy7Y8B2idlorYwCkaICtKfrUcA84JbltgUeLPrxXcF9UszTXE/mjyFwHn3PXhSshh5SPW9fzyjT/68rvRGyNw1Z5NsloAVUHfRVU+t+uORoNRY+2C97L1D+4/nMtZrcIcW/xQk4H76FzNrDvoR2tGai6MjRn+rci4PdPBoCX4lmkMeduTspTr6pF3geTT1zO7mR0XTR7/k+Y4NWptrAL5EIwBkA24218Rr5Gq1V+9wbgui1fnmxGl+rL/5w//DmM1iXsnku8idtWjaYMh4p6lscJZ4V3hOtMf+9CQBlQjjetqgK2YusTumhgeaJE6IJZmRsxNGLNZ1DDSPIyMjnnxk/OCjI8/BmEYchpwv23Q07tmhIGeIb9/3rn2dp4sAW+gurCFMxJQj//BSWRs3tq+tJcz0QaZThw/5/inQjswicY/FxVcww8zq2U6S24F4YKs2nohw+igJhu+bWVZHbkZk00WySVsF2FmXAfaaWmT/HAA8GT672/6M21NwcmlDqtVjIK5xawqAO+JYXiWPDXeRUWIYyGMXvz1sScXZDVoCxvXkKholfrNE6zt/i5GdzI6O0euPzTGiRRdcmCjRftSveIvh9G1ThgMbSO9qtl1BmLXPpJPAWsWXmDiTTJZotfJ3SSWlOtrdEMgYd4zWHrhgUc9SFQjcLYLhY4g1bkjCwJgpYzOGVbkcDJK9LrJ6mZujSmCdBrNTqIPl+N6QNQN5h/MQtGkCpHwbcrq2gumfqA8RFqyvADG59y2394FTXyA6btKePKwwU9TTPO4xknYfsxE6dBHcc+gRYMZAbKef1lNw9cr41BikMZXMmcC9nwERihg2yuXoLUNHZUWCNSZSeBU1yoJu3/XIpUyAZtIhwHvuBL/vge6bkXZL6yHJ96ZoNF1JrXY/IIWmh7KjWUHBFLF/PKaLNxakq14NaiuoXBjYIRULgtM+Wqd1o3EYtmuNe76iBIB0tyGQteaNYJkyz2mfsSPHdYhFfY0y1dbGJZtV4KaRcdrXQUoCGhaqMnUqP/d1KcsHfThig7umCCDrW0iOcaJsBZPYyQHzZ2IbbawNLf8iAA9y4FL2AcwYielNb1l13wzGWObUpjf/hnXWuZqiMYyXY/hM3qQWbSrP8mNaVa7hMajFYAoOylHdW0bD0MI2fb6gIWhyJ7SPnjl13VEZ5fgkFNeMEpEIermblVM9sBfL1zze1qDOFNL3rdmYfn7/RnFYr2XvBPWiBIxQoW4/7Ax6n0DRpgeiMYquD0zmSZOlQ4+Nr15sXsJOT5pXcpfsNFE3XhKH11xjAWS20JY4Zie9vfGUDrvcFeLc4dWsJXVIotVY3O7MMENnK6YyhdhJcnTaHscm0RWzkQqu0hlJFw0Q2Jhxc6MH5yXMxTfsZI7pyHAJLkoQeszj4eHhbUxpRV1afJBUNo+VGEBSwkfhaq1qoOf3FFpSUaE5vSU4p8rFt0KOWy+GvvMREIpctdk+NKHnDVO9yKnLfQpbzZy4EH5PRVW4eRFbDQ1iReEFbEQ0ibNy3UnElwWR9OSIbIFjs6KsAPWk3cP90HpyH+fTLV04klO3aIsC9EUMw/hHjk3RqAuT8DsnDaiN4Px1Z1Frol0pp35Q2Kwy6uBOYxuNf6rjaKATdrhUrY5aZfi242LW9DjYVtOZxIsIx3XbtJnvlweLMXBMsHpXXJMYimJGtPRoxawZ4a4mE3SpbR7WXa2qjcZ7Ris6EDc/+cwmfBpacrIJ15Hy3MgdSDB5lKiY+uWuY2Dh8w2eZEB16rrbI980ctA+npUYUYvMQ1NhaTbiwq9zn5b8Lb9KcdxVtFlepB8rRNlYwONdA6+GeKtPjmOvsONCo9rWaMAZWAIlC8t5A9wniCRX6LyvxsyHut8vAm/Rv08QXSSSxWxCCaAUF8F/dj7aRsS/84XyteQ//1IPuLyiuT1qxB58wayLFN2N5DwpFjBvfmRVjNdP/WhC+S6NIHS1Sk/xs2AiRo7X6raA8ZDMAUeSBeHIFiZeHQURUtFgBrCoE4BRqT7S8iM/Px61hPHtm6QrJWm/eVVdCXjzX0TGAVl0L1RX1AxZqu3caEvpZRTVgoHQ47ZeBcI46H+EvTQV+LwAE6LV4ShIppeDBL+B2RRkeL9/gNcSRQh7w6w76+fy0+9UVWsAaYEbmbzCb+RhUb0uMQZ2XQmZosIuDO6Byr4LSDGCIiBiz+SY3I12nLO1Gi8ei6y+AqpkP/dH4JZw+3eJwobpe7aBj6CF85e5OQoNNKr1A/tQPswbBxzEPOyljIabuWd3wXNuGJw6O0JJhocygxR9EzqysfGx+NszPCYOT9QQMZFELACx8eD22VZHcIiXlXYAQwSKUsh1kdkLnCONoqGX72eg44dSKP5LA6y97wdS4xdCp8N/NAXvwhBFJwujs1mNoLbLahkXd+yZDy1e80IXdq2iJjEg4BWCMygq4ZfQmC9kcmBLlS5hlcBxTOk//rO3rmQ9ytzgRh4LXsSeeqpnmUOZU2bFJUtFS0WgM3Xu5w1UpkMRtwSiUmQDwKsFF3+qiNtixjFKs1RnVw9CCCUJrzDt9LhhvrZUmOGF5Xe/CAt8u8lmnBRu/ga7mb2w83cz3ecqa78LtFUC9KPTuKzPtStxhws3X1fnT2dtAK2RrYn3p6t3k78oFRFABtL75mmltdtLqJn5PBCVKDINE2NhjRIzl8vHL2JmCZP9Fssq+Z4SAh+fw27Sc0o8ZfvdediMiSxKgAN9pZJvqdaNQadiUZiQZyrUZqepZxj0dSapkyvFrszGpibPM3+8sHskmz8LXGrhMYzP2HBX4D6hVMldTezD3buBHO8UTWct0YYO3wyPGHeCCYmuc118MfutswJMozIgFr/WJaypFQKNcwi2WY+Sj6iZWI8MctYHJKBz7K5iKZ1Bzj9VLIXi4aWPe3JAs2xH/rqg098J6rS03hKAX6w4hSQ+T8h5D8S+UgIMzGufYFE4tbz/7RtwD+tuy19373p7dFNoYHC66qrY1TDbcXDYHOmLPUL9LREn1wWBrdY5jLCbjW5xtJwjkla4P975GJwqlNfybngG8T8UwNjp9AKOKpn5u5XrAeC8rcQZNXwfQPaRbxLrJ8xzsZthBgKHQbUHY/OS5Lg/vD5GgY2wMREF1QJmANkc1HytrdHm0nPXsuqalCrZu/B9Yxb53in7t6koYX2A5S5bN0ZT74Ca7QETS/JbdrgN9vmaALQVqWMdyH2vd21Nh+Ys1tvDNg62O8I0S8q0DO5/ARJVdWN+QfSupQyYZ1cZE7zERAHknND9T7o071Jhah0SoEj1ufY1163GO57wWMuwpJYNlJGJy9R4Lnvmy8dcSXxEfl63n6ajMNfo0MLiXwZpdjxdHDoRWBJP0KQhxIgSa/3wjUvCvNNLz9vKekJzx6UzZ2N+HGmDYIf5zz4OfY++xrZOVF2oi9by82ctcRB9Xs5aZjyEwdHEA7s4rSfNNNbggFslqbHDo+wyqJFEzUd9E+1j/x1y91Bp2UV4A4HkKqxNTnvnoyGLHHQ/4Ms7+LdIH08U/sd8W2bgmows7V7p+uMYQjeQE/ZGYExYKdXv/QkuKLgASNNTnV6O2u2O5W7h9Lbir6GNAklyBUs9MqplOFu8OuRt5sTlPLXK21SdKOIisxWn8nKWKnqWPvbhCiJsLxjBFoNQ09qvboCq5063OUEz96B7A5AfcwEkFeZ6N1zjnN9b3/fj94p47OTykw52xBgorGjNapc9tqO3e3BuSGcBNOxzd1YC7P25dHpYEsKwm6CUP9xQWN6rfCWH0US3tAVnZj4iBqc3jfGWq7B9U0FMIffmnvHaKPXVhQN3oqks2obQT7zzOzplqAGZXUv8IwZw34DvlLBFrpY4nx8LR1AROCjzwWRCHZjsvyZz5vsoLiNKGvhedDsCmP61OOTf5L8ES5/KO1lPM9BwkR1TQ6LYxzQjqVYBSxfH+PiB3WYVVC/L8rtpyAwijiCSIqq30hjxZgWlyvF4VrVRioRSccpKmO+bko22NR5kSbDUGy1gTBzqMGwfMky1tBnhsT4KDvlf+H98huRGEg1JXc2wbRmibUsGOJAUM9ZXuNdIq9Iv4zT6tuTgFRkOMV+s4Ue8gnmmzjDxkt4b9g6p40Kb9lH+qZGDmlNFJ6EJQIrINIIcSisf3AmKg59h3JGlKGSecwstTU9Eymhrv4kqj+ZFDFmpOw6Go8MDov3YNxkY8W3iGx0YIKhM6oq10ugfJPxOa7Id0HqQYiumIOZCTV33mp00y/AWGqLfYlS7iOGzM6k7+br/I9byvnG+5GwOLAZEVGX1HF/v+YQkxLfbE+djkDrsw8tPGy/6pnyeD0DjmSH+tt+xrDbZmZOfffkkWprdz6dZoOEY4Qa3cDPvrzXhbgzHp1EtBekTgeKOavhhgZXlUmvLqPqFHYAGjFdmHw2ed4+nqjN472PmquejsJOLAIFq0rxwdL8sv21+NeToYT3bGWJ4HYe7XeSBL3UoD4PGkS6rTEhUNqHGxB0mIKSFti9BYcuXiq8znEF1vpBA+EyE8msv2pOAkG2LEaNqX86d4DWyW2jSAKG6RFpRvUiES2H7IdCEsO5I0vBrgHbUd7YwaK2Qgasgu2G3dusCbqDgd+SU3Hi+dnnRz7TE9JUJxW3cHw8GTxyIiLgRH1BUe50iptcbl5JrS9FkMN0ZiJ6Vwqs7iRE58EdcI8ruZpH9lslw1sWX5Iayryg1WDwAC2HYh0kDy3nyqas04+M1FOdDuYMxIzIiTgkliBNhrCu7MLNyszMo2VaT1hxusRp5LB2joaFU6Os/I9mn/H68Pd4BgkTstFF4EjNK0Pd7fOq5nlyQ0DWkR8l97jgZkDesgRRdLeCR91Gdx8AG3gn/sbIrzdKSI/I/7ik6gUM4QojRs9twleglL255J2jS8AgfJLWfXXqZK1DMUVG+wZJLSpAust+/z01dUdys6N4KaxLsvjuYJsZiGvr1yuIi7JY4kItAkZvCYlzA9YVIpDFluWY8mQa5KsOxD+WL9CLzsiCEU2IoT7YtQANA4SsHs9cjH/b/BdFa0OtUBggecVX7D4QlRer3AgzNVS/okWlY+9ck+7ZBXLtUiKIIR1q5F4p9PdbqqOFPtHkW5+k8tkCPb+XEtcThg7sJMbNE1weis6tlnCpnJ84bkBF5p49ENFFYtZfvu22NT6cIyFX9L+pE2pSGO2wx7l1N7O/VOq02K/YO11X0GM99f6MO4EIAX5l5W6iF2hkgsy04kz3iBWIwkV5sr/F0LlQvUql/0yyh0ACKJk/zOQoT7eqocsQ9dlFOVao4XOLwhrtzH/hPeIOJ7Ni1tFb11QUSaz4tTwX/SSHkDDDkvWShTQpyeE4UsV8objdNlP3MrAvAXSxUgrDQMmv97rvQDN5tmMFULYMYRSEq4/XDezS/Ct+bflnBjnkTRhM0gxg9jlsnBnvT9BfAvuxpFpS6LoTn8tUhc93q8Tc4cDUA2+1uWkb607kDoUe4rIhS1EKutK9WdehKg+jv0TIJ9xAJOWyvmDW0kihNHB8vjFK91Zr0/eI0MZoMDcpZtRSxh7hlSLyZo0DG5xHrryoWawF0SSZ6ts1J8OWECeYl1bD+XIghMBROQ7qfemaS43RbsyYEJ1d5amHb8kcmf+y0BwMwoKss7aLJ7fyewYkLHnsy9kS4YVIMoEfWfXvqD6hmWGpt8ZL25bEdXX3OPEGU69w/JNvyWiJFzB0SaxyxwX+ExRD7KqncSAC2WD11IxSsEDA73TLXAZZ8JgUjAqvCm5eLRHmuVQ8A5PelcGz3ftNMPM5rT8xpuSpnR+YhBkYq+u5hbU4u/sGP7CcIKcmkssMvCwUZKXLgH53Oc8OQvUWvDjwBc+A6+L+2syWbfHUWV7kG9UFJrU9vbuBF73Gctwp5o3OOxzxdTA8DsqGFrsMCrgO+hmhupYeEUUwWQBey/wYiLKQFG1BYZlJlrF2m7EElCO2zieH/o8PwV6n5Z63EnNo6Zqirl++dZv1Nc93tVDFed7jWcRpR9zT1zmb2WvIMaIOYEnajhEzVUgyVAkyUdNjXjzW8O4C43AT1+KBrZJMLDPVxmF0Eko9gvuuLVy8vD+eLmFpWMPsGt4v9qzJ9KH+uugzuAerHBrLgaP5fUxyuElpL0HadxWgwc7K8Q10GKTWQKGVtRD6SdRK+6F2ken6KMmeUIiyb8FocVXd9sHOkfKgTZwW0pVkXWuZapixjlsdEjtK/ePfu07zZ0AplyNVM/r+Rglveu0za/Z+GKsn6z/Sz4zef9KR6hfjF7ewiFdDBvTyXWXnmERtY+pOEDd7GrmhDxGrQqieAChIed6851DCUFmC53uReOw/wGnYRF7b2uv6MQ9BzdNxaMorKW4DR4sdMOSb1maeEASJg4GosUJBRwS05H11EbBThu81TBCV4vhcxadR4yfOAXYRU9dO9vRiLYMHfO/Z/VpLyOIv4BjT35xLRM2M+n5lruKEtQxebMlSkrVWQ8t7WbQk1+Vt72uOoZqGRoiiMQeQ21Nnp6PRQGe/dnPj9Bma2XIQJtUAymaE1o8K/KYxbw8FUtTelKaYsexGFhegWcNCnOwAqhMd9EP7yq+5bVqbflDyANPe5PtZXcuFthpI4ALKNycT4c76OGtYjzMsAD1+O2LCxJonwA6OPY3e3T2sKN/JLRLty/mM/O+PlgEphis4kLpTET60GXGuVGQMW09QDa6HFZve+Df9RbVEFOW6w2F0M6SZRokkw4bWp+a/e0H4esWJww8ZEABbkt2tKyVEX34W+aCyuCxNC2RFELw8XS83r82ofxoxU+v4Oh1s7WEkuVvlh7dBrGJNwd9ls8mzQcL396w7j3xpgaXHMWhd/EgTQ7PKlEH4bh9wIhcT6EmitcYVpAC2x5q2E+8UNtlWrtQOJTT8oNe6uSk+CtWx/DHuRcJxfsrcq8Ze2xNnF4k2z8yfhHYtGAllLeo/6ZeLud9CYbMA4eHxzr9i0pMUUnU0qwLiFZS96DfkFdbtzlwqXKyV0vE1ri2kT8zdTsku2/eVKa8VMwGnXzvOsIs3ZWzOGVyJwzRLgoPQj1YwCLsSclCPRZoHrmyl/5siGvbahxNiPF6egzzylB+DpajaRe8d5yuQnPRz2IVu/u8iD70UB6bFG+Dc+rCf6CzgHBiwQn7C4HbteL+D5tsOrKcDmzwgnBKJb6T/ZLS0wdwgf0Wr4MT4vgIVeMfDzbJi1wmITIbdrq8gcDPSjaPHSPZUSUOEfciJit82nPNDaKhbJQEZzbigApmPmp3y94SNYaWaIhgH1jK/8cUWbqDT+o7QVVrXCQ3TSl8XHbeaOCXTxPZ+CCBG/j0SiP13JM5+bKGcZaMv4qV528Q+tw0tkOG8hfSdjF647EOk3pTkTH/xzMNvlk8ZR17S9v6cCjcjtPyYog1WfIXJehzZ7/nRa0kKWZeI2Dc3fkYMTpmR69FgvoGLPgoAXTUpc7K1E3vvIM7Top2L4l0AjikKGG2Vn3bTqhPDN2wHsMrgrzAd+S6NkOcImEBPYHmd5B7jqsgaqQ87vV9rNMbhwZfMA43X0eG2+i2BOlUAUlM8DYxFlHMT6oSkKWPmH4RqERTnGNMg2izDiQ8dWK9h1DupKKTbccCD9KApFI5JciUWSDirFnPSVeIq0eckQbiMUPh3y6cGLzhPm7BNznCGOPiE6qbfgNT8iab6O/TLHnpgmY/tbKibB6rf0swlvYVX8FXaFcHcXXDJnikyRsBPSvX6cFYd4gY6xeYYMYF5DlzlcIxYVl8YvoHR8Mv3itOV1WCmykUA5Jd7mYcb7YR/Y1alejRCBPLotti/8hZKPXUyCF+Z91WRfIStzWATF2fO4Fv6hOBDwWCLKnV4K8cKd7Z9My7O8tlQfcQQCnuucOy/0hPEhRfqnzb6O4hZSg+omqpyd00o8NQY71lqlWDGdpOfBuK3/FZJAOOS5ns6jXmyFUeva1aj75IwOMAMmRopd0QvtjzoH/Yf1a6BxUXyoxZKTXQOhdJEESFdfFSLI1DMkFeEC+qdnI73lcv4lpCSrRcLuezP3mahuKC1LEwXNt9Ryyjw6RMDY/OjOD7nN+DpCMAF05k3QNEPpx5K/Dlpj7SZ8wVh1JsI4+mv6qRoWvpgVGsvzVZtnBrdYC0bkMiBdDS6vMRB5KLv87uQojWKI7lYaJJnYVfmBUQy1mtgnWaBt3XVor8dxi6o64U32PBnGKGsbSKbHO57DZK4vh/NqLHlg/XTl2f/5Mb5yDhpCACueUMWDdvAwLajUuvwNU3q1S8757FOPrCKZ2mQN2FUp3FYhRckB8iI6t+NFV0ixsbdejrzDxZhhI2kQiJ9FdTjmgvSsS1EDcgzmJd1XlLtiNxGcVt+DIYdnU1IWzT3F5rgfF88mnE6nm9TooN5VhxoFzg4hB0kJF4Ih32+nWoXqmCWiu0zSwzMPUuzgQbL2jMSZuP9sRYtOIyMnm5usV8mf56r6Ia/0wX2MrRafdmR3uTLGq8tSJR6NF/8MAJrBBC0Jv8I9ImeLPSTTU/MNsYOYDHizqsA1ejdrCpdesuO3zZo+qoWObZvpjZcYnjpS0jqghycTqJQ4IBq7MQ846eTtU6+hQjnC05cE/4gm2inf8uW04JYNUta+aoQWHh/ngc6fIdG3O5du5W1nBweszGNT4H9EGPR3TuNeQH/d6K2mIkJd4ROziZuo+DAXTi/mRVR2cn8lX3D1BR/pQdpaNxI4Mhw1bJYjDMh/rwSR0ThIKdoWVY+5Pa5yUxLesXPytRLnSBoOcBC3JWSgmWSiB3tSG4scEQCbmlxcOBcXS3mD1EMLoo02qZpku2QVkdB70xOcw8IFcVvyAFGxZXcSOdQ6MQnOvnNzBzB90qJbHc9ElbzuKIcB90d4Tw5+beluHhi20E7J/P6Vm3ZzhISNNrUHBqJeTWB6m/0WTE3bAhy/31kvRP62zcvdvvG77tELlnr6INLoE8ao8HUS4OVYIUmLfwlgXVw3hbsIz9a6FKqzc85HNb1U2K6xbGvaBYMGxcpykQYiLBrfGlQyuJ14LnK8W5Y1zd1SCBSkHzwJTMXVVNTSBipxTQopYN3eKetbOsyfVAKEWGPkC7K4BHWbHDP0YEo4mGxggyjS9dq0VG4jqUMt78LtmFikQkG5EVbH4yn9Y7Q35OUG+bYUUseDApgYAunLy86N2yzsx/5ZyKRkGfOw3GvMEn4RxBBaWRmYyGLpJ+wOsaOFyuTbEZcDKp+yLoSr/aYd6AAUCOklrwYt49V5jUJQTHlkDttqE3H6CB+5OtGbbEGt7TsTTFFq0TaGqnlMhP6g6IK6ydIL8d10ZD/bp+1cGYa2StRSYaaIQjx1yU7tL7IrX/6K5vin5fNT5eBPwrGca+X347rsAVoXHLScJnV6ou6RhH6IedksJUHyubhvGIMuVIBIFJrBouHQC9I+B/qUyW6dujGgaqKicYuP3jM1cpfUcivbRs75FTeJ38wJsihfl4oBhdjssFRihNu/dsHR7rQi4i8O9zu+m8SmAEsbncZUnhHq3ReJ5M1rgCV86fopB5aScpEZTmnZOVPMpuUjqcz9z/WjozDsT9rV+iDOEj3vJcAoACTp8Glp81KJPen2fYZSpbMDyXnqjbFaNxmZWn7VNcHeg/dTBt7Fu+2ByB8iAKg8fAa9uoxkFd3NGYoZAjaY4TstxfeZhwoGWhe/v9duCklNBbhRZwjXzS8T8RyJopZ3c565/nlcj9Sx2hh7csDlSC/36bHf5kCrU4KRK0JNEAdZ5MwVt0YZX0earhbJSgg7XCMceqchBbdLdamqiy0TyPoJq26cVGZNwIiWMdBakb0p1WDuc9y10iWxWNaGZUrGZHG0X5L40D6My2yBLF6E7gccbwq7KmCJxW5o2KZw3yH3rHqIsN04iitmn9DuSRHc2UX7iUVifzzUVc8wp1iVYUIXWxC/chO3SpbgNIrc0ZOqRH6PH9TnrsoN9BXUtHwbVo70xV8ATdWIuPpOCBdImve9I/QWmxOmT6lT72bpF+MzgTnKMHXMrcE4QcbbKz2NKe7JHt0wSKGQ/5RMZteGN0+z4xj+fROUotYbOuR05l0L7YAnJxmvfhXXBiWaDIuugdP3ZND/uoCvv29iWPTSr71/Ku54F8AbGnAkEKrZ2ZmkpbPhY2CakpO4Aox5YXEpjMwLPp+RwalRzUaFbaXiDs17/JRYRk9RqyAmp5Xs6QtzQ8yg8FASq6hLR2F6wLZRcezN/lnjfdEfejoF/LkHQ/afiZE3UWPQlXIcyjLXUlFG3VQVEMbidRABk2V90THOIN/6U6hBMnynVFkIisV9ow6gCZhilDt1OHVeaXYzj71WbY4P5IwGgqAhZesiZhSHsWbHdPWdIFonYZWRln8bwNZc7uOUtSGeMZ0o6tM1ybVAxHiObd0Bw9vAfBni1VGDdueU+XwaUojh2Z4tqYvUEEVPkfJ0OH1w8Oxq+cqVhWnOFN33MI7Ag5zgWjKmmbDBIsbsdtKSCrkTVbP4Rqpu+Ij6E7D5TevzNyi5rPRcUyUhITnGMMN5ZDuemqDySLI61TLPfPgZpI7mi5V46GHSsQlNw+MFyYJZ02YJovHTFbMOXgqySogoev5sNaIz1GWMYnSewNFmeHYvwlLTwfnfOY7DMmTkP22ibW+SQCN/U96bKaM24JjCd2mAGt1QY6T2nVbY1yZ80nGRlOX2HFqTA4D/1Xyr3MHexn3vIFlRjdyBgK5bFlCpqSfCBvwxIpXubAzL5bKycvS0y/EDj1Neup9D5ga1AEVaLrsKnRTOY32rDAL6Tbgx+HR7ShHFmhLC0v1ciXFa4HE8Huh/NZstYioEbOM1AUfVLGGDky4nzHc4bIFupLhwXupGOqp6suvg4ydz9ekPPuxQcAW/UAXDMTBFLov7+tlbmmwYXBtmJVmI2EJlNPkQ59utyrvvQngcUeP68qNqKdas/MHPqH4eqDQfMMy1lXG+hFc9QWe67ueBzcTCv0egXEQ1UwbUO8NCSW63PsKPfw9k1yfOR3FQEQPZTmq6IfPYhHgux3+Z8Osdy3+bjZTbDeOsG6IaOcm5HljY5Bur0Pv6Ox/+p7aX6bGpTuGuYR/SwkDnFmCUMcHVPz+VwBsJFYcbryz2KUVnXNmvCv1RfDYcLRT8ERjTScSB+tM3mg1HJAYiC61LS74GbF4xJkkmJ5bLcgOzrx3u/CL1nplgLJz/f6DdSKOCIFDJopdqks5F1hv6+lMBtTEkHVp73B+ha3rZNyFgNjvA38ZJkFnErO8duwuCfxxt/A3i010/N5nZz4fg74mOgP1o4eYbbQMh3/vCnp94T7ebE9SF4vwYet1KwE5Jrx/72jNxAELaMzV5I2r8yI7pS9FFDMO2eTq1WjX1o4LcQaYZkZt7osleRakPZLLleoXvj4uoGFrUHQvsdl4zf0mrpcdnWe7env5CR7qHWei/Fnn9C8W8Kv39+6zdqtIt040qVQU9pBc6jQWtVbDtTsB9XQZCeMaR3TPQChraS1tAaqi5cjsLcZ4vZ0ppUixH9GzEW/y6kERq1itvYt5t306GU8638XkmQECA9/j2/OsjEOKD/DK40LIdc23x7vHDqmwXR0SyTwP6sev/cBENfkdcvcenVKeUmo7CN6o4wFRWU2ebChMexOkKXru7y+FbPIGC8ouq9+Q/+2qreeXulb+o/dItvYOV0Mk34OmVAmxKtf6NFqhvRguJ6dx2z+mvwE7NBRmzvTmhr+J7wDYm17tUbe8R4O1SmqLRmVkylVB0Kqqcll+Nf5a5Y9XaqOYLo2dUKBsyxw8KcJDicxKQzNxJr+5+dGWV1aZlN4eJoptV8JrdBpicAAvhl3XZPvplvq9jO7Zeg3z6WE1SEAkjOqrvJT437zQwi9ykkecW/Hq4s2bH56k/iCqHNtvDoY9HSyfHhqK6Vz6RXOuBvTUQlv2OU3WG1uObg1QRSblVA+zH8q4TV7/yMu6mlCmPz0G+5ywP/rDCO0pizqf2gC7KWy1iAWQPa2LlykNj9zqsqZlA02wQqeJs8BCsmdjGzBcNUjMtnfyCTHRkVtQJq9zZjirStzo1dFlolaZ8mtyIiePOJ1s3z8rkUq0qRzlfmvyyeZB5prH7DzbLP4Yjb085M9q6NLlBIhgaqphMnJlGocHpJuW7VDdXucokQ7MEDjB/a0eovvGl0fhqx9b+kdYbqZOgCewac4iRyPl3TpMCut3MXJp0oQYLsi1JQ7c6viJazx+26GBYrFu+PwVZCtnSvrK+vkjjKL66DzLZ1iZNR5az8j3eO2SNF0ppi349ALzhwlUp6JeZBxzWzjXw1ZYUGpo8syD3cpmYFZWw5srfDnFnNzkS+cKXD4dUT6sBRKAMzDMyefCyff+k8NyPMmpU3kO5qytXaVXeHFvgrnrFZA880iYb3LEYnSqj9C6/tJclDj0U3RJt3DoyqPg8Qh5XY7ZtOr9M0RlsdfaLts7duw0y/nWhtjJkCLXe6LoAGJSc9D7Duf7R6FX2YM8dBWVx/FUjv2b8OCG2TAXmJr3O9NUgbqzp6SjLb87vTFKyHKBO76rZPxyyYg6/MbUFS1BF0mhatQg1r7GyVtuUOkPoyk5I4zywsHKHyJXMEaT+IDT2ZMWEawJLot7q1U8dOpXrWIFuNEVK1aPDciNRxwxXHuyLAENEHUhnGI5rGRSq+hAyu8LRdHcvz9Rh8S3RBLb8BOr6YBERXXkWRnkYoFlUNG1OiFIVqvzzRlHAKNau7JjzgANC2HSGEwZLnCFXKkw8x1sVy7QTSS1PYcPT9rgrokO05PZLfHFpvHZ0Rjt8PGWPpP7DRrtOdTINntiuLr4DWc5wtEtutN1mTdTnEl3BO+NNsFGnIkWNdotSaSq6KzJBGOIWhPyYM99wI39n5o+mjSBuP81UKNN/rogwxWZgSxkVRYFFumK1R+EAxLBlPcxP6GojZuxQD89VpNqY3sGWGMCYLlwX7ft82c9QOymAAtlHOpgcps3OUNlcw2/TIsTQEn9nod9ThdevnD1/tkisQoYs0mCYD//Iwud6+nKZT3UDCjsU5++57ERw2K4FW3QRUek4cFTlmQ+SNoz2EyiEUpX4/QehQQHG9Cqgn86QhC2jP/S6nUKafkxLLDs72Hum68zP84WlQfe71k7ejZNhhkRXmQddnUIUOl3dNC1clXhty5+AuDfg1dBZN4jnSceBFxJiJtw/t9yO+3g+tX8qLm4Jb6gYrbW4y7VAvk1Ug9xcsHxVKDQBu2pbHxyZfYtdpAJvL2UzBIyH00zTMlsLjsEPFu4WrNLS4ltM0yEyI5ITGrEOu5DFYo2b+FQ/HCXyWYyEy8ZKr28RCAL57DmYVwUXQ/d7/zGfFBBBYmxw13SlwQBAC2bzkGnCwH+WJs1nG6QGTMvtpoxbzMB6a9etUfewe6xWv/AyFpZI3wVvLOypZx06xxmb93Xpn5+UOdR8/W79516T+HPwUtHrO+DyUoLY1wdI5IByoj4mOJFryZjIGPKv1MOo5DaYprt6PmhvJGdvpCwmtBCTAQPGXY0zgx/UpMWC1d7KWNIAAABgne4O6OLHSAABp8ABmoECNY/3qrHEZ/sCAAAAAARZWg==' WHERE catalog = '06・5P-74' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ICZX9pdAEABDnbKHEBnwhuNh/CLvm33bEVdN4wi3z8WyqKuBSupwOvxJhzTNuHofroPh1rRpvvrbGK8lr/5zVUmdCeiOckEswCGFiK0oisNpQEiVjeFOmWj6KrzWKin9wcda2r04XJwNCO60/+Emnl7jmbN6d/SqgOov39ZEaQ/CqoqMGI9PGj017UskHLJzKbaK8pUXmxuJMzHJRP5VnbEwiMEPAL46cTjAtIaUg5r5CFXTEz6Yv1n5ETK3lNKdjA0r1JeBLxhfrdzNzwfMuMRQ8nXWy0obFgj/oAADZW0a1qGaneZJErIRFYrRGaWrH+4qyZXtnOL+844basnR0f3cp+M7j+liBiUBOSo6kYpsolxcg35S6hXLRp1GQC38dzYQq7i6PLxFDxWPt+MuiLGwurkZ3qrhQJuNDmaDM5TmR3ki5VALmtaXS7KRmNu+9PtfUxR/DFoZ22km/G8SCnCW4t7YgVexU7Flh/Rtaj2Cy4kDgWisgaGGvwbDwWNvi4Ey5loX2l2xIe89k4iBzxMuKMBL41yr4Yq1Gw+YCrq/n2QeSafIdMtcDb+wNNxD3yauqM3vMHxmyHjngdV3G7y+tXksMeQcgFr4cyM4X+jQo8rFOAf4evEUvldy83Chx9WWBCsRNHW2S8YXfiNQRo+qJPRkQXe5vIltK5qzB+YKa6g72so6eFDMokvSHUd3W347TlhDh19ZcEmFLBw6mfWgK9VVv2KXg4R5pnSQR2r8pRuUnS6nQ4q8jcRfQUb7hNb5Hv5Wwysw3+TbIO+UaUU7wvB5jBwXPR6Ghf0FodoNyd48OwQhlIRfa9X6Eguk5v5b4+Mh963PycTfukwiccdYIu8j+Ssiteb899BLAX85RQ8f5JbE1OmFycCqyBYpuHBH3Tpy9O7pdnILcZEr8LOcm1K6Wn199fpVf9hqyUrQgEVYFzjKyDRv5Lndn4HI8SCvei1+bj+sZaOlISVzG5Ly3urUEJg7CwJFEkqfSIHPd3qGRwWvZKv+algR/tnN0OMEeYmeN37Gi7CvEBwlsmh0hAI9I4b2vEkycJG75GP9w6qsXxkfXlkYu/SLTUmSD/6VzO5I8wQmvO/f7dUWh/2T9lpsX3454Djk0zb+ELgayUtkufJTebkVbYNpS2WZdA+24wBUOLPb4Ip4D5MGB6oHyNFirmUM7vpsiUt3qhdGEFimBl67a3g2Je1fGdsIvP2TOiV9Ox3WwDj/jkcSR12PJzg2XAi1BNEozXsGXgjgn7hEsrhY2UvAz7ZdvyK0SkvIhWd8P0knDYrJZP8tdxrWxVRoamZwdHM+/nq935fVUUMoyUB+95I+YxiBSjaZwrQ3LZAphlyvDrtiGNVEor/j+mETcOTx8E/9xonf0WsCpK7sw3NQameU8hWGqOFRmXWee7m8ov+WLWGfmyYSRMzPcdzn4tUcT0SSdUDiRzyWvVVNYmCeyqQCkpsmYoTwFaaQd3KMm7Gs7+l8nkIT+IAJlyzcvfNnfPgrs/gNQKLSRjiMDgO6jNZDJCYklYnD/2fBQDtbzIvkwXk1o2LA/aGf/oOYHDPCbq8ejsg7ltI0UpQL3udmA/OHTAgsfKcZUoN8Pk07I0PirXVduCjg2a1iLyXbxVvEVHwNzH+QE3fvhwKoaxL+brAIkV3UPVmkfabAnKyE6rXaNr6EtTV7IPYFYLGq6VhOkPCbE3inkMWonDKybefikEO8tM/lyub8URuRVYpLmXJxoti5f8uFzuK9DyuH0Bhv1aDEbElMoxjJGJgrcq4rIKp2cAq4DgAPYh7W0evQ0hwIHGEIO//hcuLeRKwbeTM4+aeeY1v6sZ2TqGOY7m8VJIR/aNClKyCn9EYjgK+yF/cz0cGXpsQaEzQNX54vWz8guYPWVig5nNStzH0M4Lpm7vO0otXDXc0EhwFrxmbdZEVUURsE34KjXeYWF34qEOTh4orLp3IRnKxo6RggQL0ULGJkBbh92D7G0BHEn7EXlx7YqL2j9smxFF703kg8UA+2pn4bjyMRIIOvw2Lrnz/14KwjeplhCHvz5R+WVPRuZyEtrSi/SEv3Vuuv9I4XH4feeqcUImFEc9amk9xo3b3Q7sTttqsiBRloKWUamQI9wobksQ45Zzdyd/WgeSCKggEMEFRM8M8P1jpEqk+DE2aey27SSx6FFjYR2OH7YtVY3/Q7w9LmRPem0zekyGv7kZ7sglFvge0hiQnfSvB2BRupSqOjCJGbrRISm/wlbr4KWzPcqY8UxO57d4+/xwQFu8Qb5gdZtG652vscZKW0EfQIdSoESKzuw2k9JYKIGQ/MjQ0w0Ix64lAXppGKsm51uVKfqO05gIA7o3mrkUwDcl/s+5ATb6AZisb338ZL/A7JSCJg1DUsF0w7EvauJtQd20iL+4YyG6Qy6+nd4FreSFQbRghWZ+ubwlCMDGpnIG9fqX2vFwsJln6x76v0asIu5Q/ijWFxdwVNptU2ifuYS/XZR/SoAw4oKpk2xdSPVVWD/6hP+JFUjF5IjMUtCcI3Mq/OSAkEtqIdt9TJpwJaQ4IPkVNO4MQWwHeycszEITQjovnTT8DLSG3kTAcpXS1jSJ9HJ927ws70+6Yzgpzga8D6h83NzpXa/sjANhfyxyhRKdanKa+f6wnKtLrY7DKxHkYr8fx86RVUmDcfd5RvwUlueKG4kRCniVSeWZWBWhipNBwsS0oA8wxEiP7VslFvaS67RaHxKK8enX5sQPNioC+amhUzdHhFwbSUmCnGPvghzX+Y3lcmR+V/FFZZNohfo8ANwQySVcoFUZXFxCZJ2U099L701vdVqGl+FoXC8li/DCmPjoa1AW35O3+AfwzJkUlEI7QlAq2FUhXhXrodjYZbXgdgAeMsdelcTJKm6Hg5XgF8zit7niSc6EWRMHTYuhzNw0SYY97x/fBnj0Xv/5Qc2VGzvqkprbPel4M6Wgg/6aLaUgO7IkBgipym/cLU4ajAUHkIo1Jyob2ymmeTANmnCtwXqXL6ToPdJXnyQkvCyrUhq3NfOtFKAMX2HbVHuhIgC6iv+On2pmu6aT5NJ88vr+UNT82jdt0+f0dNOwnZwLG83T8eCnB6hTvQUtAN6yihx0bBteQJXns5n3FExH6khA52VnPadqwY8Kwyi9atlBs+7p4zwpARieTMruew5c11vKvyz4Koz5hGyWlNmPyyWCvGtpkfVw02pDE7SgIXvzhYQWp6KK7t1H0dLcWwmAeRg8Tyw3uKWaSm8NUNY8DIfrvgCY9NR3DY6OBHTAh+WtmvTFAJAK59yZZYFKkRpPLL728e945jRaori2tog1tvFQAHuqLGc5nXnu9M8i8P0v2C1ARVio9WBlWwL09gHfe8j/VPFo83rM2DOi5k/unXf/h2+Pb6ngevQridFt36S4+uDjt3cLqKs5MgHnz6LQ16wFZ8U7QbSFGTTZ3JxxyvAXExhDnNcSgruNR3rhLORhSwEqxJoUGmqXzeMWTPp8JIG84lIFrb4OhXFkDgkVLrNmQvvSX0g8148dWSXWl2vZUiSbG27W9tC4KYZld9U0l9oiOltg8U4EcwU/9qexN+2JILbiy4EwcA0JIJIH/1LQw1p+H2jjue01MnU8w/WReuJ8b6+qZm40Hn4KLX/jbS430/X5RWmIaXyMuhOgwHxOmJIdrwqnky69FUtt4hr4ntbPgCQ67gWNPygiLCHKaTjzE5dUHiIRzZF5XRKx0GGR21h89hGmVy7W8klLPPFp54M6WDA3fqXRiaOEiKu7zU66lf06X/6OfzYz5hDPqM5wnNnpBgG96cKScFxtdEzqAJ9StDzHZEIJWGYsA3E9U/Ckrx6Kr/dgTIotQLM4N7t+7kVPvh4gMbPmHuD1xzNLljKgjmYV57uDNga9iXmb+AkjH9JgS3G1uzVJ6TXNen8s3cr37rJ+q5vHJKVZc2E72ZoIzkoyVFortzne0Dahjr2NLGjpqeEHpwpvSlBTZx9txRRkJNSrjZ0NVh9RqMaS4ywdcPkW67k7X2Jow3wYUDtShIQNzjc6b3KK9T1Gz5qdKVXjJ0gkdRMb7R7DpSVL9kIxKCPBfCOXIUDmY59QQQDG3K+kFEhNr3d1JN6c1mlOuMfi03oQPlbcUmjtspZ1EMGzt/+HZgO93spPMh7U6cv8t21+hY/tLq4gvQ+ujYUivkILRgTUFoowzsqdJWHFGCat7COtRfqBJGuYBjteG5jqXeFu8SaboPeJ4d3Bj8b3wKnsex1kwBxiTmiGfg+EAazbr3M9H+CnpT/v5RmfzVsESwu7sQGu5ZR2PwH76bwUtuBOAhRGq91Io32ZFXfBbyhycgUhzJAM8iVjW2/0SWfarMYQq7BNDHV1cgykjZXEBeJFis9pB4IJND2pKmu5pNo1Xwx5kqJNeAiE57vzSRiF3sQjysJ+sZoAx57UkUBKQXhWNrq4MmwU4NCuJAosbnpzAYnyA/1jeXIINqXsVpwF3BsiQSBsHQBGfQEijNOvH9llT92/0FVWXQCXrn+nSRYNLcrqsphPAlQKVoSB7SZc9cnp0H1eaqLX8e9ozt5QOj20xNkyTiAx04TzAnY49w2a0woOrJoCeNzP9snVcpfli065eMWttfagBAyuGjUlApISxpJUOEf1aeZVEbV/KrZVgriHApKDj0rf98QDeVxcMQUVRBxLSAea29SX6VTweGezolzZ8ahcOz6mRB+VFXPLR5UZ60q2VqQdE+lnM1yyeffs6GiM0L0ArfTuC6rWmRYrOamxTFl5ZdzpIo/kjErz2HCDrP1ySo/B5Kfr6yvYnrKpXkDTriKmPUOn/Pf2+0tA/pe9Lk7gv2NAfRq2/ikbdiXRaD7fT8zV4U3e7u2xirpGMMHc8TY6tLQ8bSGMXmyvzpE6OiAbVFQ0nczlXsfWEC9yo58WBPCwsFE/5lT6OLYlrCdLMC4z2ynpLptSm1r/VNBZ813+dUrAItrHB+kNerFHxqWW0GwSgBqXyIu2vNgTbBe6zuakqv4PzCwZr7Lu0IrVCsr3I3zVwzLfqXfKfYJDZm82A2/2ONR5oX0oJuws4Q2J8W/9fuvvBfu39e9wcuz899lI2GRaw5Qm5UG5bJ5068P9Zh+1o8f/fHTaQaPVivczmxZA9vb9GO94OkftQkxh4/GIlmSeFAzVKQJNyLLWrZEWikju9wsIlBQlV5uVM/5EIOUaXflb+9urwBeb/7gxj9qVUyN6x6RJ3RyyN/KR3R30HydLj1HGYCYlAiaidCSAdKSTOyl8su4JaRk2Mc1ZlHQZD+lt9gA/uyxlDMloinT/aYBG0EfCKiY0mFyFo3Wf3rKaNvMFT+Tnii+yXi/3c+vL0ber5MilTefANEhE5j19gU6s1ouDeuUs4JUS4xzLh2XgItB2n8qplBkeDd8Ar8piKx02CCjcugmV2QYhQsZhGQkWPzqxiXLlxsR/qdVbuiLiWwmZsXkhvNDs9GWyo58Ybr/sa1hsI4uqoQf67tlHNRUxm5LYpYxbXpyxrrofpKVGkSGy9AqWqCTYUsyXBfWaMMDrJWk5HJO5TW1F93A0uNUcz0TWWWY4Faq92vWAtnBCAgQrz0WPdzKzE4JinjluINanu6k0O1MjXYzPTwfJuXPhl4sFzxSUG4RwNAMlcLIas8mNEZ6A2hHrqVINCjBQlvfq2JJDVH3hKNcnymGoxGX3M6TcvBoX29owRK7YhPbM1W/CgkOGLEOaS2EhrZ/AUV7Re6ajEpDdTX5Pub2BooMXCLuaZ0BWRuUOia0IlVzCxt2Waom9LQ78yOua8xkFnWB3pRyKnyBYYECAR87HjZRx/7ksbz9dwWN8gM+2lQa7YLT87WJMnalfVLs0Ur/i7BlZFljpuAliimHNSbcqB4W1hs7x/igH8v98Y0BKyaFpFoW7zyv1lzQu4ySyVEwVcWpixTytSBd3q+INKTfm2/x4/ZGxhZle4RYmU+h1frE7QVN9TEJ/ZP6U/ZkSl2lnm3xZVo+IvcvIViRIeQ2XIXT5wYVER1mYnZnkdm7RAIBteLoW/hk9L5sNy3PIIXVpU8/aed4ot96P6W//+0QFGkfeNqZTpcLG7VxmETCTbZ5aiWxzpgUP0smwgSWSBH5aJCyhEYktrxRgeL0e6nYQ01XiMe6z+TfiYkT0f7kPrU5gGZaXCXBIbzI0h8cMGTeIG0wBmWjufbJ9wJ6PXkb49y4BBgIKnbVAtKrn+ry8JDHT7iafGSnsj/gEL8S6YmMWVF2TxKvLKnBXYxU96TbntyaVfWKEOi5G7AoSeb35znz/mYf331vj3+kCWq1qcZTwJ/VqPEdcrrQYk+ut66OmAoC6JsTrYPIZj00N+2XRrwhltUSQrDMlYU5gqN5eyfpJOWvdgV0Tw04YkO0ogJoEUC6xO3zpva18c6/gh89UUM+ZiAU3Ylk+WvMp+JQm4ZO8+3Qx0gT9WWEYCKpLEHzSyTg0ICn51mdMlpqWIsmwUrPlXFpnaW+VlvhRfLWGS9Q8kFagje6B4Txhpyu99cSRv7KDC+1YJYPNHufwDKhhAtH5VoGlcTlwARv2eHprPceg3SZ6I7E9/nLyvIyoJHvQnO6mTU5e4/ZsQb0sptbzqTX00O7EUnxq1r5RsIx9EQMKkodCea60bfIktAfrmyFEPK+QYCAP6YoSQoFVtBpuxvOENCND/el3c3FXJxqrqqjVVhSY2gSMhcN0CdcJNAwj2ppT98Bh/7iahc2HpYNkd8wDJGXFr2Ft9RLuwSwTS8ClxyzLCj7Ek9hswVQM1lyxWia8Er5CvR5FQLT9mwSZJ0Pix6N+CfajdTliP3J6zbIgAtt5Q6SnfS+/hFPQdcbQWFNchay3IUmU+qz+8TX2QCSEDPBKtF+HrQbErU+awwl3R6GCby4p9RucyOGbKI/wB8XqrbD/x9HArMJOTJBcN5hddXY1CRd/zHvYr+h/UMx7NF/EWwL9dbLbZ1WqwZ8KHX8i1nyLc2wn5ws0IIJloDoou5F4lwt86MOX9FOhG7iYHMMxpqWCpdNlKXTDPz+29mKyS5KU2Dle2yesKlsMjO0jIGRkVDjCHh54zYl+iykam0Sen15abA98dhZ6k3HGN6fTN9JpjOrwIel5aQnoPipk6N7WiOku3XwW7anuwmEWmhwS1PVx0qAwK0qfTkz51+ZXfrekGN9Y89FlYtq6V9oHsQFuh7+fUoOa3oaFMidlZ6z/uNM7gX5GpC1ZxgGzVSIMGOBvSIErP3LFMP2tysklAj4xUfxpq1jy9GbkCxpxg7wLW/hYo2j9jl+icgskcRF09Bj8EnnHLSe/J7jMRuBltgtU3D3vpUOB3R+XL3R+y655tBHDBtZtE1xw/Q/WyTE27s3Dd3rA1HqLfENcX63fxMR8wMptZ/thLvhySaZZ8mM01gkdxvTYD+zLI73aKzUolGAkDjLRVMPq2NWvT5IaTdTivJXC9FxG0c3uTmzoffIQuQYNy+TcuXiei3+sepjWRfg4Xo7T6n0f1vO/1xsVyUzFoOYXsKsqP7RYX+ozLPcg0r+R6ugW4OpGnlAbqVJ/7DPDsRurvOYosvB1SzbpC2RMSgdMUtz5bKQE1HNc29CTV1DeOizUNgWXapey/9CWBHIQTgT26xxY04wp+mEmj3jG5d6Aunx73/nu9A2swH0+RjpK6WNfGW+Wo/IFqoQs0TbSpv4+oIbESAba9ls3G/fBOmyngKK1nEfYbGBJ0iJRtLjM2YBN6Gj9HhEpIJswHF9gabc1EdKB1esUFqw+TUpYYhSgAjsgqpS3WaGARJXHPrdmdlhDWe8AlILqT/yUKWc7tQkobjixb2HdzyIiPzFmjPP4fKbp8+YH3jUj9ZW9HyAmjfaXeHbbWAiY6h47uWZk3ISy3wt18qozQvrQQH1BEpJbQSuN8yF3cBnU0HSpWomA8kUs8lIVMDIbZI650vR7Lke+Bkb61Qh/eM1uAOSN3KqWT/MHMscwSXmyIuI/vrkmqC04JcXD5EZEZskl5udIQWwNzAp/ljDaZBRsJA2wYhqPwHxaKL22SxRbkyhf/ywAStM9vkbyYyPQ0UAuKqESLS6Ztic+tll4pDNGBvt65kzjODtgNSNa7ZRrf3mokli096uGxjaq9uj3PvMRMvE4g8cAUt7B/i28OM8j1Lxp51RJcPU102/TjkIPYFtPIRLFiyN8n9m5VeP8yUW4D6pu6G1RkkT9/quRi3Mc0mXo3lOnHaJdDRw4Pb9/QJjZ/Kd72lvN4AL876sup5SDMINtu4m8bcDLpPbXLGe+oFsquPVIzw+ljAgX5Ig1XtvRPwGlSvag7bmADQXp3XP1fwQHCCsHaNQ6WcYdWhiVzHVUWoZNsdj8aig2bCJ4IwLNJw1s19GJA4QuriTVMSD54oBw2g+MZri3jQF7na6K00kdcWHOGPE4AKDImpPL9vh48lkVTV86+4Mja0AYkCie9QyXwWAbgAK6PCkjQWoyQUuT44fifPv6o9aCPiAh6kp2aStDd7wVNnv1svhmE45NgPazSDaN+RGzqi5uHrNF7JO7gtohXKacjVKXS312tXNC3AncqlTxth2bRCCRPoCeZ1luX6Wa9Pjf8bomlkGv6XexJKZhNjW8L14xZiILbLKLAuZkRWJpubItCPS4hdC7t8zlQvoGSArCf7Ii6LUAGX/eHUf2+0l2gttpy2Uo7gX3WtL45SKTLzQMqEaLgy9E9O3iXNJPbHxUUBXX4Lrvp5H4zSBjtMHDMvakWmYAIrn4dGtXol6o8EUdYqk29DjOX5B75nAWDZBnUC22AicR/AYMZTksozP+DG4PfVUZHhKE7eLF2Luw+aIIN/hCc4HTr+Sx8Ag8cwOkhHmpKXQX/f6fqQBjIZ9PJl03R+GZAJDwanKP+stEGsUVbk0YZ7uk4JgIx29y8drgbrAJ7tiJM06+FZrUPxpFhSw7ilEciK0Kx12FlXttep6xeV5hUSE3HsydpcFJPjiRJm5mJQ0pxklmj/s35mkp95M1hHtsfR0CAXSyx1+e32gBO/xy5agJopr2O94HJCDnCHna+iXATYLNGQlf0tg/SJNt74yG2tUIIpkRS3LyK1vtVZPnzVNKSyqRWLPk+8oqzYMETAK3H4TsrXid0FNifq+LKu9I+XPQZ2+AyruPMmfapcZXL5rfOjoyPDUsFXumSv9TQ2jTW9uesdQodfPKrSc18cz3kkKrxnojz/pC10Fh2m+CSLhu5zi7zjwPRf8FtqITZlVBL6KDZsQlLmIP1MJQwTs7p0gh5uSPwxddRQtvllcFBIvFyh1f7RjG2IDbmDSoV0kJcSdw2xNMb9bMjkk40tf1UbwJSn7NMNR3ghxS9nmi77DcR9mqz3oH22gM8E6SIlkiy5oyXp9bfjzANwU9YzkrZIhQOSKS4n7JYRHaqAFoSBPP6wDQgj3aiebHDo1atWVnruJ3ILKvjX6z2wx5f3g1lEr6gnLUJaP+RsmsGKh6VIPywlxyUAJefihMtB5keBOU6OthsHzD2nk8kZe5bGz8xhtjZ88jUuhLKmINEmJM0eyw9opJak6spkFEe/c6g00seV8KrijeCGPO+vHl8ey1P9jhxSeYVc/BBkU+BNum1AhFrdou/Q+mKVFEPUJ6HOBH1n1AjZAFOpT5ITSlB65zf4KgZ9HmAXvEmeqApxTO97shEvLx4nar9v2029no2n2tHobhn2Fim2uVrszFWJpQ6HHETsH5WkWyLF3DxgWjEUV1YzT54gshOOVzNm7zbpYCb3edvKOdaIWPG0C/qIuNs/plpli43ryurmfALIbsKyofewZqJXtBz0DJnEG2qlvYpvuUzzdxi3zLCGxhFr5sp9+J8w1rN0zj/s3uzCqtc/4W5yABV8PiskrpvQ0nuGmewRw/9CCvIgGI+Uya7al6zaqcKSC5ZANinmw1XT0/BFb07zUT5fZsz7CMWbwNFagWYGrK9cGuEKaTsV4rdVWCrzd3rpvtzpB8Q/lhqU8pyOhDp9rhp4hzKseuH7t111f8/NWWFyUmMzPUbJVr+++1AwpYTpoIW4mpzyMynLapyZvq0goJ7yXIxbnjLpXNJ1ECqeHHe73TponWEvRgWhNtOloW70cxiunPx5T3+VP+pwlpTMyo+ng2/wfhO7/GIv3tD4Rk+iGawUNhpKHKW0HArlG7ssUUUkBnJEhWgJv4YaeD3t848RaaSxzgu4nerdLDkn8H+0mNQ/pisIgOdId3ObMZuaMjbkHaOfTdVskeBVrH9/TgBVAxxfWsJIoDIyCbP9O1MUG51vYOiSdV5gi8aXmx1tssBgptfjIxRJStSEMOKcgy8Pv+isrFVEvQKsO/xm5FmLstO88vr5PON5n0L5xarNjX4PKVRPALfmxlqGtVfOS15RBien799vG+/LnO3VCo25tTGjyRnmHu/1EZhi3HtOfKxn9aaNhanHRW2bWx/FhTQXERyVl0qYxkXK3PXV1wI51HDarC0WrT6lF/hhI5/SrKnSDZISVFgxigJm2WWEJ8eqXvjtN/bs5wgfEfvyH/NS2UtX6HhyPEpmELojDboi/06n5ZcAYDYmFYk/L0ZRtC9fk7KpBOE7uD7H8XGvTAjdZ2KxODvOrHTwfr899UuNFrHK4Lqw7ibZNTp8R7HJMFw+odc+ky6Wcz3Xq4AA4aWhXMeQ5HkOMLXcqt4GzpZoecrJHH8KxaL3CCxaNei0RtFZ8AU/lRlCR1nQ38nhc9g+MxZjje/kyv0j+enkJKkZbl9fGZII2IxBm5gHAO1AQ9bfWqt5BNT209Jx1jO19V39wxLLmcHfL1YpyfRcOXa4X94vVx9/lC9Akc9hgoZG8ykqjL0aMX2mALvtQ8NaFPw89J2/I3TaQg30ttC220KcoOqB4P1kftNsUv2uyjfPSYJTtdzZ/ToAF2+ykXyOCmpEahGDRvHEJaMRcV785uF3lTfSnNg7idaVH8d0gd3UDtmYqZ/BklzIg9si9JKuPmcP3bt9+sVGBFGDDxnK0/+oa3Bmqmf/b0geiwdLZlZtVI6MuRY5c3qz6WhHh77n6TzLZnR05LMdL9bugt7gUnZiq0uqlI/UzIbPe0WaHZfJxazfV+Rwi4Vbae7UWinyIUZvV0q9Eoh6M3U1Lv0mzDXvwrhHislotxobL3r4J/vHFGlrOQIDeX595Xsjf/xcdy//u37pkUmxsF7FbNyRjOqM+88PhJJk/gIHS9DChfjiziwaHgdSJbbrthFJ8KIWaeckzpgloyeftyMnKJ21/2dQivf6UbQ3xIcnk1LPK7xZomVYgLpQtzdA24ZboQkVVvU1pQF7ApmCGFs6KbC3PvqsFYGp3tPvWAtUz2ak7I7cbt/r8VUl8G7v/hPu2oEdXWOpKe5PElGa25czTOkQVvMWJksNqNDWar0WYDC0NFZ8YMGIscJBoJN4pmAe5vU3EHLPkSZGCDLd3QRlvkwaL7cJ7JWtWz54S/1B4Bm/Zx5pyUPPZg2y4HGoLJtnd6ESO80ZLp3cgMIPe4lJX6QeQrYMnB0Klc97xR+KEnNaNDawznmLSDOy9KDZmzurE3kyXapi4VGFnJFMUlJBJxkm/9hVbyHnFnYBBJbM7pbxfRUkzbOKCsdv9Ss7XHIsSd7/E5tOI+rnLUMpsM0rGyVXSpY2160ordHDRxhhg9/NZmoQv4STwcT3P8iTgjWc+6/r8PRWWA9npMYvvo+Eku62HyPFhJA3RbH4WqDBrlr/FYMVOniM3TspOQTx3D+AeQJtJ/G8ETMlhNtRY5VgUHEeQuTk8iISB/tLNfgJncB4cKocKi8vhXbYShXyAAbeBf7zsj0OTsKAGFgvpnV7y4NyXlCPP7TA6B5ZY2KGAjUgftAlTS4NKZU7M6jCjpFyRB3QhKTHTR5nmdKI3p0hIUS1FlnDdGRi71m0RT+mbxjpTYJtePfTaNZO3ybFvdNrC/phvKNg96ZJBEDbJvJGpbSrK96FJXQ/R7LJHvd5p3+U5txPYH5WZMepT9YN9yWuhzARDHdeRr0iNeImFXpVBjXceRiBQqKOQvuVkeNvucCS2wyZy/JqNsGYb3YbiV1YpU1PH/5b5Rt8XAldQ0CIg1EcS+Zcqy+tqXlXsfBZvy256ui9liSP12rcIpCUzmgNOaGXKlEfMWCoG6z9qp9G6PF39coYeVOzC1a/lGrv7GZ3NovA/tRtcZlE7nU9XtDOheg4tcqbNJy6tj6rO54tvK/NsA1RjCHHT2lTHaiOxalnZ6TNvOXtlVTZfhjvPylLB4l5hsPm8TdiNoerU/2Gf7Lth3+f9mozvPArAH1DxCNlSrusMwL5396tItrOTeXgWsTPjnWGqb68qetym+vdW/PuF5SBUcNwjPPgtkTfHK740oHDnB++5c52GjuYSHm3MpqXZ+VyFaJEZuPOd/CJI2S65zfO4b5nBDU1AKP63OghZ//lHUBrvHIJiMaIUgYd3w/PGHDiXOTCztylYEvFVeiB+csPeECatP58Lkbm8LmTfUAxCcZrAlL0FtOMTTYLrnMnPPbv6CXemjyJfS6HU/Q0mCVDMmxCFzSGjPpSaW9XJ5qO6k48sEFDaqweONrf5heZqTyaTMzQmdQTRchLRz0DYWhL1Idq0Y3nh5P7tvtqhTdgy3E82Q2LVrOXzavUXRkk6GPTPExYxiDytJX73hASf3ySBeJ6QkprvmcJHwGzDFfUwlT3HaW/vz623KNB8iW3C/MYg4/uXBSnAwA9U8ftR/ynh0URLb+6/gyjJpx5YKU/BKmI/zoR3BeyOT94UxFZU9GMiuV/2NvWCMPdnBPbmw5E+32frX97k0m1W+ELaQ9Ip+1xd92DXvXw+S884G0P+ovJjViDn0PJ6uohBHwVlQmpe8qtK9sCYMj9WfCYgToKxBxQHuXhVcA/oBRfDw0T2vulE+pzD93OXHbsWGaKUGnAJzk6MMtMCrFZ49j0TIwIee5CGkkqZKq+0C+OwljnCT8PJNVX9T67Z5l+48pscyUvJOS7taIFM2dMvAANw6xprLufYvFZdMvlqJns+UbzyulJCZBAsDq1fEHVSza6m/6JJZ2bXLncNTJf0ynurCO7/jUrGIIzAYwajgfsb0mcIJ3yp2/WYjCNlJ+eHjsXni45HyUTKkd7vdbTvBqJuei/BHf3Nu8aLruZJpfwHVIVnh+S0p7nIUbSVjWbuP1GHZYD5SUUEwlOe9XZvxfNHmdOakLyvoZq+daURkB9TY1wkK0/bNkBkMGzKIUQlq8n1JGg2+WRahsFSYx17VHfk/VIh26UoPOLNIT1hIVaZuyhwIDoZnA3pyJdleWB1Vlpb8wtd9w9T66CoDF2x0OtN+rYMgtgDy4E9ZjaW944AYB5YzVHj26yOihG7RZ1jpfIjhctMPatbBVb110Z3v/BrKarrotaY1IYKmpZf3vScO5RXTXgYTJKIGEKARUOBznWYiTF99hFkiJiFod2MaNYo3F+HJ0t1mn4YnFCuTs5oaZxZoUHcC+sSXZIe/fKv2OcMYCJJT4eQR2h6pvK7+OfByp1W2nDNy5t8TAwshFeq0dEKKwBj2N5tAPcU3giIAnWqk+uN88/k/I6VIDgErGptivSv1RtAMD2zyjOlL0xignrACW/57bIE93fBG3rGDJvvjXXjcabXoCEa7viMKJ2OtB6OKdUc64R06KT5hSi/UrjIbLPqHxwEgV7RKtj2yr0DuheJ8iucExKODimSzHMbx8H28UvZ4n2J4b7Z6A1ImhZdZ85p2wb8xDTLs+v0hsnfrwa+QarpWM8vFiF0/w7xCPjcflqDCQMVIXFRkF93KIiB52Gn9M3mqtpl1llEvB05Kn01Y95WzaVjV12vVxtI/r5cFmYMZXJgOk9Fur6uthv/sK3182uLk03pyaa+Fqj8smJOkk2VeWhbypdUOPgZmVYPkVxMy/BgRMFFidF5FxjKYkZrSEqVY0Pas8snPK4L4Sh56I2hq+jCFjG5XPjCpWNRLLqbvCuQol/qVxfcG0OvIrPKnCsVaBlBxQC8cLsamIROpORmB2gam8a1/OT+fAZOuYnXo7r0MduFBF/q1zv93KmbewSmnENuye5ji9aLlZIwnvbEDb8w7gTkxioxfKMOfhO3IUEosmE73k+8ItJRGTHab+eSGXvh+tKgjsl4EXwUaiTW4dkgAQoI2WE2kMnQ+7JvYP06dOI/QS6OBDtoyLi4c7iU8urIq13YTkwHCl97zM4GfZXmepKA1RrV4iHTVwlEkNFucwQxWtrJe8N19mpVdyEwfug+nxOGznPQ3lpKjt74Gc1K0CLNvOSnlBsbSWtsQCALDJgejTA4ZXBe3czHr73vAq9S7BJnH9P1coo+MDqrfh/XHsZTLe5g/Tz233XIUMY5bSiv9pI4Xj88Xxe4L7FNP9I7/GGZ9FSw7e0PB/T+8sa0QK8fQ9Roxq581rMfTk5ySsbBNi14H0+SbSNEXq1qgRuHv36KqEGCzxeQQwT6Ik3+ZVPgEfLN5dXUTZYc8+xsBUCXOKWneDHmAgURROP017Qa/Sv0+kmnkatbqaUhBlAzhoeSfrDvbCWp47R/n4Vn6JqI22FCHj+5xzsDpWLDuW+vgOiWIvS/q5NBQ5oa8ntrwl89vTV8wMz37tt82y92Solw/vmCc/Wp5Ws6b/13vraSC8S4Ym86ZXxdPz8urZDgemTTUduH+GZi2zdFREqAK5d/OOFB13LRxQR/mScWNlr+y82Ej1OyCN0ptqnU8AU5uvvn9sF3+awZmyT1nrpI7V2jE+7Eva5lEb9RtqYuE1g75pUKtSmomCj/DA3ck3uSsExZZ/rIrml/4uf9tmE0No8l/HVjCWvs99rkj/IkzsT+LBsl1CHn42IHKginzxqBjLSRxH7Lo8mbMIh/5twodJIod1Ny5CftE9oOzxVYjF/UHkWXoRwbpAwy/iagHUdH7QNJQZhBRL0/qlza4TVVkrxHvsG51RIBK7qOiLsN5eECPEMmRlZnPTIN4wgK4y+yFq349CrEtGxUTj8AkWoQtgCYi6bu73v2gNZYVbnhb7eQiVPsnmRgkXxLKE/GKl21RVxfDbq1mt0ODDgOR5sbA/qhcmmgkuTk5wY655z9PlwlGlDuX6K+sN0JFZzluzbLvHHnJy/mFbupcrNDr8ntZBWRoQKX3r9ld/eQCZwnYIeqU2jm6c575ko5Hqb0NJnRC9KDQ/4u369DVR5z0YLpjR7JQahnKhW3lRjictcfEVujCLDSIMjAZJVITFDonPwejjCvUYupwTwN/MzzofMCggcpI9H9qAMB8JYXKdWIO2cigwknE0fjpWSy5QF6CnqdruzmrNG+m7TsoMMDlXwChquhFJolzyVCpj1E3CLnv4RjzRQo6b7LhuWDhvSZIQu1a0BD17iaMchOUqjPkAtcHDmQ35u9zhBnrI10heHHPfJTd2GXktumejczCd7z+6tIh4tXjhRe2wj14q8Xt+l8WNtPy4WxnXKv2HhFFYwk2IK3IR/S0JuE5MVSwmyg0kMY8rU74mSD3jTM2rY98NeCdIXnXGjalZ1DSdaN7qIzRAiFUYuwgCms4J2NsGEk/Duk5FvVpGZtfFyLCXUStWhhHFukrnOiFdFD8ObLHeP79llHchR7cuta6tz5ObRR9lBOARhTgKcZixxeauUnIKGmeUoi026cjuvriot7SBhvBifmDfQwycbGYAwGrAgrS6tVQz41ODR6cpMXuVb4a7jAPUNik2SSJHFxHEIigDf867zv9fDhOFGEcE3jq434jTgs4n9iz5mdRQi3GCUMEefM8J5EbL9m32xiTPVztb6/sWZVPlD2xznH58RLP0YprWA2/AgUete4KjAuE+i2sJyutB2BCSJWR23kwvtf0tfrsSzFN63kBN31NcMkyL+TTtIB9exQiSqoidCza2hIBCL6+YUbw6wp1dsqe7ci8TS6V3Z5TmByYlpnfAP5+sHT3r3N+k1+wlt4Xzz6ehvBguB0UArvMjGgFLecQzX5InuYl4/XsAqVresX08fjXbv6B0Fbf6JxjkCbJjVOscYRkZnzszH/K5HSmDUZWvl5DmsQ69s27cRDPyQUWN/dffkGdKYMky3aXM6ewBhVntjst1u46LcSvz2PeWDZHwIVJohwL8uKLQwo+RKQuj7aG5ewcgApZGtvM8vOjEHtqatbdXdKnPcKnk+qMl8zyrzElPeV9l5ofbYzCPEbttW2uPpNTE5bEoK7nfWYz5e9ghgkT2+SlEUhZHrFv9FBMXDV+OQck5QK9Yd1Vp4CWuIjExU7KEhxqC8aEllYg6s4QZIhOAYR0ocRlBYXiUuccm3+5RJIMB3wonEQgq6qeppiCOcKG7tsWlnLI4eLeNmOZGxgMJUsr6J69pDWmClClNifxDjDxElaEuzBZCi7qPS4Ym8nHAZA9dv8gdtvU6F0LmgR2XvrdK/oFAe23Nhyh4yS1qh79xP7M0/kpjctLZ6EemPiS+KaqjEBZ4zURKuiVnBjXLqhnESxxKKEnfIBM2DpAqxIohjefyMVIhL8LXchs8Cc7nX2SaDWyl4Df7K5UYzysSAbqnUXTuE5gVQkwxaak6ikuYP611ba8iZ4/yBYWpu8FRPrDCnhKl88zqPWYDdj//+bBnVjWV19DE1/ucpFIWiwM+1jcERVDTHk4ESD4cJ2hpGLyTPhG5e+TaG8hIGJhcCIlpUTczRPl7832F7+CWY4ZPYGTylqIGszVuOQfAyYrDJllNDZTy6+WtlYxdEOyjCbmzJyg97629tw254LCdexEcO6W19UfV3e0QRjydIFKWN4zfprlq9T/DoMQ/vcDdO9LqLGxVe1z/eBZt0l8pvwDXNnrmnpP9X4F/dJ5N1szhty2m/9KaKmCbcilNj4Wunexk8BQaARsDohJMyeoAgGSiEm09eRUQS8Ro4xm3rLzwRm9L+o0eK4GMMbkM/DpkAtplZMApv/73ybuihBvLsnt6UbROMf+GOE0vvdpXdgP7MUH5tm2i2YF58gPGfrrcYd0QfK5y7UShzJ5OvduAjvZe5GybmVeeCrpjnyLeiGzyVCoVnbH2x9COwtrcxSWWJhPn2mfEujB8qbKpDj40yDwsKoC9kOA0AhR/JfQ7QdKl1A7ogsDScVJadboMb3g6PdEBukAgalo9DI0v729ZOyCBt+holKL9Fl75JB6EkmPVUU6dM+78xsF7uu7c1+nI9lmT0rBBjtoY3J5tVOjNTUQSEDB2fDMb6P51mBOsYwxTzqvSr5IGF9nCAScACFmnc6rUHJAeVqeqOpchyNCjZKXuXFnqgwN5QVZuGi+iU9bEAgE4cz4nHh1B1ERxATrE3gvvnS4AfgkJXwdtBmqKoifq7Q5C+mlG5juTh+KozJ22HSuRk3wRm4AbyKI/6JEiRqCGmKjfXfGAPlS6kZh/1oG6Ehqf9bUNcyP6oloJqS67tCkJFtOlFUlhRbbmn4BFiIxiJSrCLnOOIWLFmPEWLUYznasM2TRu2kgI6SQyqgPWeVwsPXvq93RO7lPLpufvln1WY0TdqZwP08oX5aHSO+EaM7OAEap50XRZpb1e4NWTCLMHoT/hRAQFlHBr1hCUMqYFwegzlvFHsgq/3a5C4q/ik3+IWil1ocaMmvSYNJxsN7gDgsDHrKHwd5v8BIBGBsEerRbe3tJE7W/iCxhbUuizzCcRJenOlEzi3y3sTiZDZ02OOLAscm/d2XEzqmO4DXw4nwFaT2KRCQCQckjaebgIs2yOmg7p8YCQE4/ZIwpeMV/TFBYoIutFRu4OYJF1oVI5wmC7dQOu1Cmvv/gTWy+3LIRN+E8agcu+Ty1KAoFBGTiDgVf61+xZ2pSkPxJSLtdyBLuiAyD8HABPKwJqqg0ePTRM0css5JGdgjhKew6KYOLgu8X6cjHxTwaz93f3vyk+22QGzDuDe1gT2WCTirAY1ZrugzXvW5FEEecnpGJ5b7G2re0d9Aheq3Wp/QG40uAuRlk0t+CpgrPVb1B4gYBtMSism45JdcqHizdn5IyDMr+JIEkVgG3JQsexpQ0tIA2rMnRvti0nmlEjBKX7nHfKHNIJmzWle5ZS+dBlGZPJqtOkuRR5W5s1vJPMVQJqOnVDlkmvraa4yj8oTpNuvdSP7mYuAVTGj91QyfEqDFdDO1klN6qANFSK/P0WQTAPt5EFM4/g/r9MywbtBdoMd8+PiFD3GHme0/1xEQL84FDQkCmc8NEeV8/VZ7pCyqS4iqHYFC+NptT+N2nApsXi1Extg+B0Hv8BFaLGvF+KQJhRlp08nJ10xSG5n5gdJSMe7IjBtXUzOb99H+Y1i0R1KdLJe+UBePkTF3ZyJJFrth1ssrrzx45CYibhfEt66JPmtnCcbTN/Ob/2XU3obCVkMYUWx1+MAtBlVJXR5TGgtRHd4vXuJN+t9xxNqeLsn7kTnzur28UlrFQdeL5c+RxO6ROoM+nlbbw1lS3yHa2upErvSs+jgUV0re3ZoS4327haJnUHcaSZYj3ib07lbETczlm5bYU4B5HJOvfzMctUdKHFSx7bOkshwywLZpw8+Piq002ESvhXhravaow7E5KtnAeeYdNQVdWBCR9M0wcl48fRjSVXFs82TBE+CzI9gWyKq2P8s6hCLcbQ0ldX4GFpmwj0SGOhc+GEu1lMgoeuwYiitUSooHVDkbJ8OGioKoIUJiXnxsiWParr0IHZCMdjQWebMVnyPi1I8vZ/RqTStHjVVlIV2cg9zo/1tDw2/OXoYrG4R78KnbKNyOyWlgxN+x+73Ze9t1G7qAFv/hFB7rIGroHWHU3m5+o4FZS0nMdCtZewJq9fLrB73d1h+MKVdleKXEZ62L1c4/l6Yup/h8N6mrWbThESNJsYWQPHFmVTW3ZwvwLfbmsuVmJbo4cbcikBXy5aTkfBteFM2j/yfkguSCM6RVmB5KvvnM0Iv2dfmiMIflhmnTQJvMV7EvzjWLGaGxVI8fmVDZrnaLiNXrZ3m8Bj7hfierXQb9X4vRCdjMX15BLWdkrzOD7quHY8nxXIvvZh1bBr4/mzTqLyl1REy07IKb9TaHTijgC+thTZrQCyoxZeCsV6s9ON2DF6BBVtPrcHNtH7ZUei9FptQUBEHepitIbWbZUmZtngqy1Bby+0pPulIE6zTpD/Z8jXWz4jyMV5bv7YzYSj7NDXoBVmrEcjtsFW5OBnjD2R2WqWSm1CNxA3ZV8Uq5OVZVSoniM3N+nGZcePj7SOnDyYdnja5GU135NQIVkAlHj0gSgS75XoeyiUCrs7y3LjWne/sUUNIISRuamEOGrdxPzJkDvl7qJ725bIU7ZmZ4s6VXfUXtobf3mA2tXopQvQU2xC5maEmR/JVetT+IonPDR7GmoGhTSDWVTRVOX1DSslu8X8Vui11EQui1NWxN+VuAzqZQgBjY86bz104AC3HzC9mPwLWT8cV/fUsKujWRENoy8jvnrySe90rUP1hSsEWbDgAv6oS172xSyXkn/wXXE4SE52rkdmVZbCBE7pcGef1bVg3PICTNr/PtdNQFSh6G8TsmNFueTEb5E/QYKl88KK0q8HCgQL+aN9mAbxJsc0ZTznhBEskSOyN8BlHXh2rl/flSmLiAy14zBvU2TB47k63x6/hqi/9mFltBecuU/dkelnoGXykoL7hfKviFPy/nvFukyKzC75D18zC7Zn/dP6x110nbqykqhdakvYcHRVvI0PWligT1kCOd1l648UFt+RMfpiCMJa70irorob98IJVvMOO0zK1C1HMmV8m/UxZLUMWbrecNeRKDNHc4uYO6xUgQjurVZ/WPlchf/92xnyoGO/2TMB5iS/5TalDOeogvh4pjPF2AMAyoorbnzV/uhZT/bnCXu+K9dedJYmRMPB3x0Ff93O2CkJ4nwzt9SB41SaCEYDI+zz8vTJB6qdu0iD4aEr+/kmzMCFdpICiRThCQQ8ghmNYxEfShraDh3c9tlEwDI6ZH3gKH+BtE2nPWF1cW8McQxHpIqUpEV3OpAvG19M8BlbZXFOGkmZS3zWDel9XQK2fe4HSQK7Vx+kLhtRPvxx558Gfhb4rjzj7c6qPYpZxY74eVWKd8JhMXz5NkCSxpMSj5JKM0IP31ZBDnaGYKEUkV8xH2++3FtJ8fjPlQXGU4nI/j5R0LWkyLDqOuroE5dYAvU+Zh5Ez/0Ep4H34bjk5lnIycdIWVKU7Fa8Grm3PUi/ejLGSqC/rjdWA8S4JNi9fQwUpGPKNd8V//6gI1GMKkTSGjdadpZM3tUmToqA86jHLUXG9J0e7rD/eMV0hHLWsSlRMmoCvObxnMpNC6WQq8TfLzJ1OBMm+Z7LcRP9POf+7F0un9ac48dPBDGtZOL7qqnoQ62ZnQE2GQjcIKUvVWsowMmzWxuX3NUqCVa9viNyK3U0qIGSo8+tIxwsSKjNuR5+UBD+uGOdJEoJBUfJCyoYkexRadp28N5k28XfbcxGPXkJGkbXtcN3C/PFMi0EnNqa2BJtekQ73JzBZugbJ9/W/y1nxJGXVehIdtWbvpkIv7MjPWt95Z0BOfcmXAfRZzLyc17sLTgi3XBLCVH3nBx0Iq1/DB5izAAzKlO9uf0q9hx7bhJbxC4PAiQ0Xkj9kzqCIPCxSWE0B83EBhunIrj/gvYLMMMT2VRC5f3s2J7BBoXmKkHYFWcQ9zeGI+zqu8ft88vD6u47tVITrl89UzY969HBKcbYDuhope6By8suCw/m9D9xuRQuzK2PjtGp/YL/pkFFkwzxCNe5sMuRR+N44l3czXbcJs2A/ONc4ikiqaiKKKuZd4xl4Tnj/3CHhcHqLPfhZzr/ksde+SrDR4s+nWMKP0TsDXL3oXVBBcpIZgQgDWz5CxTlBn7sSDQ2Wt3ee+GXA6SPAz+fbuMp3ip6j5sgtoaMr9+iStF35WKAfrWnV+VUQp1pgK9C50VEx1W9mCObbgF8k6OQVoIAOYB+fxe1y7l5S4cuCNNZImx6baoZVXbnJ4EvCgwrEO2gp2NO/P6Loy7jXlOwrJtCb7Sy5hiKkO5Jz4Qe+gVnQ6ysG4HICdnJbfB8NP50eTmeDb5JfgM8yefm9kIU5X71+Qw/oZK5f+83TJJVIkuIrv7+WNggNAdMxy5QbF6jU4ZHFs6yp4GJfV5bHOy8BpSgDNKXLpezogC3GkfH1w7vjVi+qhiPR2K6mxi71nV9ikjdflD8USr2V6h9YkebVVpsOt/OZ3M9YGT6GcCJPz+vAm6O23jd1zbJfQW/k4qfM1eilT4E8eypZ60IIJbwhIvCWA7iW8DA3na1N1OMgHH1MwPoYsbicjJ6QiD9w8g+TtfwpJpnPvsn1UgZCZbNlXGZh+97ozZkKV8+QyBpfqQuac08LwqGJoRX1mj4qGsRggwbyL8nuN6sLGb9SNVGmQqi3W7PeM54i9NiZcqcy5BF0cIWSLBOfdM9GAUFuU6TuNq1zzL/QXdmd76sXNQjrIuJyvEI3U5HX60qoCJsNYG1FNkf2ywqSjuF0Ri4BtpppcBUyTprKyimelZgcze2iPJsCo5upEa7qSMMB8bDENDklmQmvBj/uFwLgPX2dXo3nLMKrszvQrYoQfUB/fegh/YfAPt4mRqKG+EO6MQlEsCzek5Bf0mTt3p751COBd2Y9Nb/Wsd0pM/+i6kjlt57Lf/5urNtzOXF+Nnuo68rFcZSBLEyfQbrURhzmK0uqjoQnRWV1iyFr4K/Xfww3UgNl3AmPIdxZZHDtAPxwv9rI4yD5dGyPRXopgjv8CNR+9Vsc9sfCNpXMWgf0VnJeuc43xc/qYiSFLieugEWhvPesSTmlYybqXNJkK5B2hruXvsd3COa9YSM9PZsT4FglerqQ3FV06BipaeIUAKT+7wP+Es8Pycqyc/Sg9BwS+GOC+NTN1S8e0amP+tyR45+axX60KjOI+4YFFjtFeGgMl9Uwpt116deIBt3liHDMIn9pEABPsOpMLhZYnhKezyIbS9bV9GXWyKlkwgVmHV+HPblTgUn0vyIIIm2o0uVfSa1DwwOTCdWEeW5lRwiqyqRY9g2nczMy5VkTm0+M2my/YjQO90lxGwbli2cSxqgJmCM5DX7sr6GdOkNPUu0xEIhsVnGw85+u+IG6w752OykK5NNujxHI1N/KxwFo2QGGmYyqxpF3W7NcPtdpq+9ojjuDnQd3Ad/ymRGNe9kIpmIlU05dhW8UFv+hFuhvfh1CD+MRkXRm/HXiMw24Q1ewMPbd7u97hz4lnWgJZ0PGVmkDLdVayb56Vco76Wm9MmLWtO8RnMoLGhVSyoD2PpV8a8OXi2KRbTmrRdTmduXTOyVn+Aqwy6IRs0ko16wBWKxYTeySmA5j2/5RsWHDyGHL96E+C4vWi9OdeYzP93OzOrTFIljUuWsDhJWTiUwCzUO59b6WDsXFX7DkuukaGkIjDuKTthPWbP6UQ8+qaqZLpLtVBQs2G9YQSVuD4M+PmiQIlO1Q61vykAiI9zNHLhg7XyBCcefiQGe0YtjTErBRwpyg/EeE2kEj6lUHWvIAjMOIDnDjC8UPHdD4Ns/EumxOW24slXm+BmFFKkhA93dKyupug9a3+oDY0oKHck3Dp4V01XAJ7c6QoGi4H5Ig8G+tBNzpLAZ3uKNN0BEAaL+HUCZL4lOj+4BFiMf/N5iKHfp36TvtvuoXfBxG9WYl93ax6NboEYhSrrCzzJIlXwxyFuH9tQTJDxf5Nd+zECq92vEUKYqbvbQzMU60P1iCv7qUtMDmditp6dTXAF8q7mlPaGBvIP5O60VgzFH5yv2IpAM/dzkh2Hr0qV+lp3p15qj6OMQ4udhnV0er6POKqVSccbuk/LkpG3y5OO2UbpPjEMq6YhFCaUn7VNGZpRDh+N19HZ2EffLydLv5FvZ2skf142NlMIhIouru9Ztc9C8inLiaHqwqU0dWvJppQWx9MbH2lmJEJFysFnYjLkusbu6Tvl8TxYHCL1V4Jml/Jr3rYNR+m+Lh820tvrZDag1bKv/j1aYPAVf7dHAByKGu3xfc2bLi4h8uX1ZL2I247NrvKmcEtIno48bNXYb7wG7zaC7iQ65BVLb29g4uI8pJIp9xmHqHwDy7q5C/w7yMT1HYN9+i86+W/UgH/Z5giFYTN4tRX8xRHexTVOBEfZtDDOaDMWPRAzwzS9D2hzX3ZuR5QvtkdwIymPwYmKa1yV9CPTmh0PFLq/TNpRS8hF6yOKaCe0wOZ9M0AvfLb7d1MApAh3oh7nHZv+8te9eT5Qe/fwn1KCXIuz/AK8fQZ1+h0w6Zdzk00DsSg7t4/+nxPGmqV/vrVcCb+T3wEe2dzWXKmNAyWkhTWWo2YLnxoQD87RpTZeQE4lVkesOiz81mFQtHYjXppNfdFjGqlhmCb3TafgiAMgLckaflpUYH5U4omDnGyItar2tosrrfRwdm4R2HELfE/0luRnOqh+oYpx4A/seWPrGBumVUhF8TXyPZaBJQUfh7s1kDh3ktOn09CZvsev+z16GvksPhJiirYrky083FMnFYUGAl/LSrhefYEX2nnVrfKJkB0TIb4KYxlFBgcbd/2gn+FPzzKGTYTgaEnQqyR623FHp9rFvoHRyJtkSB6Mzb8J/C8WJ7R1BO8XXVYDnhO34PQTmMsQJi3dY62DoKp7pZYLX2RcQhZTqhy2ZZnYGvYQ3CAeWsB/lOehE10pYSXU6VkO83FXxYEz7WZftuJleS7TFfSmmBzA/TwIvo965fG5xPuspkQWU9IGpC+0QuUWgx6vMyFbXRujEBl0kZdIFjUl7lw+z45K8FMjZ1ImoPdP4XqgMJ3nU4tZJu9Gd2hYMAMUxx1V9Vq89K6IBUWx9r/B9DzTvOdQ2SBkabv/81QzsNzorrMdqNFeaocCp1LbkaEQROd1eYUeRrLW6BWm2ozWIWttqNU5rZahs26xryOIaxEt02+H2oXuXeqN5ncdlj3TvHfPAWxM4lcBrQ8c93WeMTUb1paNBpbPB6fFa9n5TC6GI+bLsI0tKgWlLfbj4WyX7HZq4Y/GtzlsuZfhFiXM17Ek2VqZVk+chtaEpUKBCOJgFJE6stOoEJLbRRUVwlq1M30AqgX2YO5SlxzMy5W6r9uWa5bwfqq6UoQS9HVbMymwJPRYbD0JRQI3f2TevuwJTAA1qgh9SRS1+0zByVONcU7IyU7YrMcWo2yQdpPDN3McrkwzcEERIu/lrmtK8CYejshEBocMH46xJTTp0T/+RoEQ+OSuG9dWYtvm9+hZy8YPgN1x1MlFwCSEC148S05Zj5wZXdboN94YraVLtq66g1hd5arA8QX5BnN5yhaSuE/ZE01zde4CHRjtQ1kJqo3Aa9TlZQRqJs5tedFH1Tm8BfPABygVMbJuX5vXpB4OzP0Q0QFU6d0OSp2NdfadXEh+755HLDAmHODBYmGYKK4uPwO0YxgSU14q7CPAfAmQ0V1PL15/Ne2sAZMwQX4uiEOjSMZPQ8a6ChJ3gZ/ZvTjV0WNp5VByx3oVARuG8hUM0lpI/qsP2ZAtZ9paQ6HMYT7NX0VEwHv4j3Qyizxe5gyWuaCx9o243/oRICwmsORPKd7fuAEMuj9gI9qgkozBgcsCV+7syI1H/LP59QMRoIt5G4XYImrTeiLxXUmyx9k0EFxGh3PrOHShvQIPNbmjXKix4vCO5BK0oX2GkJZDTL4EfM/k9HuczOOpNC3i1SDII48siI0EhnfrOpadzwz3t7lJ7Yfc8lCK35vkB4vFVnKyxElgpVY0o4IdVKsZiZxI5h0CBpHa6lgI33GpkHxkD0IPyc+6LtybVslzJlqOx7xlLAl3p6D3g4HhY9dFp1v3AIp6ye0gpbm7NslBrtF35s0+6FwLHnxYL0rhAaw+LfeezI74/nRaqQCGiVcanPJlckDxzdFO7K+HZcwRFIKZ+g9pYWflHOah0pehnZpyxYGin14DlYZ8he1QQ8rTLYuGqRclesUw9aJ+OJS5vyT8yPwarUitw/ddjjkVGp1hA7nKrtCeY3sZpK3Ge7SXbksUZ//4YAEJtBBMJHDQLXy1AprmQhLOT9f6a+Py6rQglKd4XGva3D3MJx5pJx0OSusqctSXESftraNCtkGWnwIVUZ9/5UgclQoHK3le2oFGNwmN/Vp+MsrF9QWDZvhXKsopd0OPWWnDtesuZdPYSkyKb5E+nsRgNnZoX7TdchaAm31n8taJYoF+KA19fk5THCbYTRrFJ3vq0NqhWRaJFRDGizamG2pU9DfhOLOvAo3zenTBQxsqGUxGvSmdpUJm8cp2Qn/PmFpMrEq4AS5tkb1mWLVediq/MRp6ObmK3w3Co4DYXfBKdpzm2d68Nlcra72mOc6iYxrgalZVQr/ZA2YnUWBLXDRjehGEnmlUf3P2r69HMmSpZXdQQpI3QXdVcG49ecpziZQ9zhppwg4pqgmwdzYsYWlHY4Mpo7lEYOa5h248mDFih6XjkQS+EphtGdUH9o4q9QEIExB6fBlZNgzUQ6L6/kYgdF2u75AIkMl9fEeJMCLLTsPq+o2O7SCJ+RlYxKXzsUMcWAsz0hX5R42cplLZwcB9B79Ii7IQWd7yLsd+22L8kxPVlktQOZC0J6hvGsKt6UesX7idOwkI4/mWXAmwSpe/GlG47dYrpDwUPqoJaQ3huzeNN8R6GnYjN9b/85T48NSWtWo/Btfm0oAjTo3h5QQZLxTwTmK1+CO1OmRA/NwVlk7CplyJBpufeacUtTnO+zDhe5t1Ly2vKbYsZskLGmz/FzrIwgBrEjVnLvZQFiOrR4JBsmRnle8xNE0omDc7pROhHxoWgRzsHblzm7k0cRX/nck0NFeSAOJlcEd2RdjBjSLW+Tp4lji2GDFUaUXPBJsH4csY+RPL+jF5EltJfFJ2GEkaphTyxvs7BUYZLmaAXzkAMu4tRhCtgjid8VK4j6IrEPBcRHDIchxXGaJ4nGu1/S9A8cjb3ZYMINd23nZfCY7igspvnpTt5eeM9xJOeWvvd/8jLIq8lG6IGBPEpbbRdMjfa0bIwx3DWjLPDNaPMRO4tM+v+KqTCKwPf91MhFZJWIwfsEpBryc/3lLl19uNd/iboj/B8uV0R0opD5TQqkxWtyF3W+Uz0Tij7OKNYDcs5FMCC2wAZ/wL7OhMWi1ANbeNH40BYqe7kQjjgzPbiHLimvOgBJsfr5W5wHR+1c5e3RoJmKZ8jxlKZ//+1iCuMcssz1NWA01sVUghIpdbwYShbmJOWQe6ImChJRUic7YIEPtatSy1YLasyiiG5QQDRfStoznP8D9QjDJg4DW2ou0V3hmaGRN3xBXFZV4yRjm9RFkJRveQGqtaUEy4zsKsyinq5kwYz9LSSLPV/q4dmc4OMhQothmmMN+mCMQYP9v8vuhxpyeU73i6Sh9TIzWuHsvmwxUATQKgiJfz3vKvlhoMFjwx9GWrggBPpAQjIVUHpkgDeaBUqk+A6Xp+qaE79vnVzDw75a7LjeUAgUL2VdC9MUcHXtE6GYhQvKIZXiCsahY733Ik1BPmHt3c5+QhjUbleckEco4lrlz8RlYkr0n6pRABxjXukoV3be6TdSvSU+0DyRCZ89O16NjM9qUojmVoyhI0YN6gMawwjJTAzFwvabg5czsIHrUt+SJJNA8XTqsfj4WJ1H9CjxGnuWlgBsxgIE6I1s5ZVCheIPwG0GXFWcI/2wGDVI/7NKbqkuzSXGe4mnJIdjyX0yetvtW5vzvpH3dpHnTrgzrd/1thgfhDVuDPH4GAT1D10hw42kra3cP9AiZ6E7jwKCor9d8nj2Pw/1pUyBDuZTGTLeNHIrxRpmoM2Q38UD/BCr/0vGewtI9DPbqfl0LncbZUUGBe8sYnlPAXcANkW8E49GcfsPvc9G1I8eF1XOsxCD8WxSPfRn+1M99wHU5DqnIxGOc0pkvjNzpw8WlQxPRtB4N8zUdrDE+yRtBZp8oXwEmZaKQ62iUPBUecs0uAJ/+rojq6l1c8AKHcY1xgnstnEeGLEWBCbps1XWhFhSr1v3NcvjGRR7avAij+60xJk0Z5RBUzXPOSFOBBNJJZKNHeAomUFXY3lNYkhPLcRW76lu8JEXnRSiiD3IiHL0ue4cP2eKGvY8Q5pEJOfUT+KJGeDsrX1cRNNLEw72oQyAaegZfvaIfnX/8JsFN7/5Cby6zWkqx+7apZzH+ZLJXwRSHIbExp0UXz/+XmP6SK6aOoHCakcyJFKSa2bFq7hTStUXgBSYMu+am3WbxY0ub4a5tlUQB639zwNrQ3L4yH24AaH/F8Ud+ReYLNr6oWBhxFVRLYX86CLVs0jmn5mVv23R6IHeXF7Vr4Rz5palYKidXJJLILuQWJPsdK6wQItvrZrahlP5raMSSpMMMwM73mks7/g/+tq4Z+asDwSGN8k1C7SgsM5iUslJTuIQ3GNbEqPbA0x6HGKIsndi4O9re02M0+nAmoAsLXedM1hU028gDnY2mNPH8pGJsOz6OcRm9TpmBrSuoW4rZHKtW7is4hypTYTgbc1WpJMVGG8JhUk3ev8z1VlV7+jGd7uR+0vtyvBR8zms7cUMCJrnUdMG+6UWIFzeis82DceHD6MOUfWu3dzeMJqjRZS6UfVquYZitWSIvBSB1WU46cP0vgNVq5K5koYjIZ56a3PA0/hg+LyQdpVvoiMxg90CMq74rXOf+nngf/B8b9+umoR1/53LU5fUiLoiWQv2aSrlYuuPlr35LXCyVtD0EyDccG4IB47VT/DHw5KESdOb5HpDe8nlKNMQkn+aKJAIpHw64bXmFua6xbPbjh/2wB5e5qLQwzV2qv1/UTzacKsGRH+jEyxCZz/am0oOwLTG0WbLlq+GftdHX4zh189+S/y3kMfCfszSMYyj8GlpWXObQrpdXdeAz8hxiSTgPIFRPuEwxhaIvP78mWAmtv4rbcItnHX8PGmMRVhSNr6jteoWItKlSHUTtr9jHF/mafO95Xi5sHXoC3hnEi9TATFR3YenoVNwXlfFYqXP71q9Z4jmnAxUCpgDxie86TZPZIdciWhnvxAS1EIKplORirPuWy1GMfsQEET4VaBjgiOx9Xn6wyT/H1sgE0QLUVhLcB3sOj95Wjis2qWrDDpkb2FcXBNuE+NS7SJposFKKU6XNeSzEQSwyPF5QPAXYXoIpSr5NYZ2F+YK4nN1IFWCpF+8ctJX+i5Q5dWF+NYsGKdY5zPxOwuW/++ws2rGuIAC2LJiWlrelFm8WGErxBtirIUKPZOVFkGKG9FlXY0ziehQB9l25aC8v2qXK6CS+sxBI8/yvt/Ffw4XHLhRdyZsgm3mB8YMf8t+xrp2jBeuhUcAgwqioO3QJXSA6Er5mMXv3aNEQcYrnKJiK4ZUR4xak7MVeqISda+l/5bX2aRv2mZugc50a4zUMG85YxeP5xah5rjWCOHeHRwa5ASemVJ1tCvDhVWABPDFM+7N3iQiyzOPIiwgnkvz0lAYaZuexk5omMImObL2LDiuWCwPBymMJUHHLnI6WTseCXq+f8OKLJXeBEC0SYb2Ca5paoivi2IbYB2dHIZipWwyfmoEUHEJFsViJQqgJ0PwearJ8hqsnMhWjAa/C65/FCGBzngSdHRKtIseuxGzGsmodrzudJ9ZoNky/05mPKREZ6Hjpk3Dn/lbuPUhnFu59iAP4JKSUwSQd7PE91+1qdVhHXzPTYhnI2SL5Cu7i/4CGEv/1RuKhH4bDxC3L5ABXVpct3dYsN7Viczf0Z3PdeSUlyZDOAPQHkzqh649MxMePUljfvH45pZQS9G3LQ3Xbzvh6j0mko8CldeSI8NjchbCHziTkk9smb7nLDY99IYmnDOUIqNszQWH4q/3eoItk7C2xbD/qX/YtDw+qtwWLhy6cD8IBCFvItkEekG5AY91PBG/Jd9GKJCX54OPyRv2lxeaXOOnj6PfzAQufgwqFCx2ijS2vW5OuDwk/qAClRgtYv6vTyiZCV2fsGgaU9v20X6bRFwsZNhrngvbTIM4/aJXwdEB4GaIoe+tKNOwyUtcMifRN6qqU+OxwvBivXNIUdgX3kAOmP7LzTK6wWWYf2IYZUKn05hLGgk72FdSmFYfVRVIkFHqXCNjUexNkofyOax8X2pa4X3FHsr2uLeMyNMR+Zk9e1aEiZI28q8TOj4xDp6j3tSpyxiV7rO3a+8OF5+gjMLKUhR2r5NbGSkbZcwAqmB8WO9DtENrfeF12S/woQVPvOZM9I3h2F9A+x47vXlv4PcJtQFc48Gr/WIN1KXQA46/RKxjC+9sh/X34+XB+utY7Gmww4qlgfBcwBh/wghWvnzHJ7F9HqhRlbBn6JktinPkwN2t9AG5SY849iCFmUXZYmDVHGJBlqu9C1CeetcFav8vNWwe/lpCwyA5oIui4RWPR8c3VPB+1FF3DBLJjDwj6atGhETikYU54s92KiylY9JQSiBL7zWZrP+8KQ55aVClK5BLM5rXjEEYwe7Z61UlYz7fGi3fqBr4OZX1S2P1D8h8JOLRLQKcT3xSkAH0bzX8u/SKhWqI8/p5Sk6DNs1MxeIIZLFztgH+WQ7joJY4Xrn5Vum2HW66kOhlEVIdl6GSZ2oQpRofac7wf/uQ100ruPd/hYwLD70gMNl0kb/3xbEDSsoOPl3Ka+3aU+/P4uMcywnESIkACSw4mh6JsgXl6InwSTsT4r9Ypri1Ob8ikYhFNL9eZpPFz/Lc65Gz0LFbPS2U1Ao3etwJUPuvwSGncpcJL6H3HT2/HZ3Guxa9k3DXG/xtwneBZhwJlHhG9UnrbHpUaiCTfq8AJHhk5VqvIEVPuzZSlGaFdbeKfjRaQRDhEo3n8rKy2UhNG/ESCOBmgEfTHuUrpwU59JNtoxcRDhaey47D5UJgKkfw9Mu/HDWX0nf6gvFORsKmy3vIRfFgdLilQAN9tQXUwvWSR3257efpuJWvFp++L59xg+U413oyjJFy7yUaeu2ad5sDu+D9XsX3pc0+HNb0HJRn0Eo++auP6TC9glVfeo5b1yVbcalpOuU2B1iPIZc2Y13KksXlu2mYsDh1b03OJeHTlfC4OfKZseCR4uKGV9cKSDvYHVBjCm1l86mPNKp7Twd5Hgd1VK1d/vI1kSKw2cPykgSQcf0079W9MYdBxHcIr/9k6RPlcUPxxmmiw6aLev38yoXAb1wu3S2Jcs3kr59n3aZCQvTOA16ZX0wbds8dmbRh2EaZg4BgpKS5bi4bPXucCaaWtB1vwqwyVRepTBLBfRCROIUjjIQ7jp+0IYS2H9CppZPkshiXhJ4F334N1wEoNqhsiG+3XukAd6ZIy5nueKlHGgXaOw9EfIEFHZ32y05McLSVjclaUkOgtTgvHIIToHPijgfy11Yxc3zBTg96+NEjqFmjVJN38GI820HsDORo1VORGF1vsi3VA1LLCBQwszlCjGej+QRp/U1046AVgkYTkZpyDaRBceeCPVFfqDA04CNc2dkAUeccAuZetFQhonsmXX8ZxrbvhDjeQZp3PeckwLsTFYwVRHamTOBRAsDAkCuH39vSFBgrU5IVdf+z4apphcvxujz0CnT0HH5uBf+RK6BH3C3phg0mXWRAugDsSL4cLteNiTmvhYMlD6kALk6CDaOitoj7oE2N6NM7ZkMD0T6ps4L0eaQFzFGE8hjpGmMn9U57mlt/HrNv2wlH5ERLJNraGUABdHeO3zYFA9O+F1FIgpfNN/zkmUuOca6pb52BNJE2iNGfHgV1C1cZsQZbjUzKxrxiDi+IERFr73bc3RAimWzQWxCYHFABfnFKReFXo7eYLWHoX2kxLw7gxPYAcr/fs9sL10GUlJG13aORh8/LUBJVqn/ux+sg3eWbGhfW/WDo5XWoWsWkEToS9WYx+PrullgN9buzyqvV3m+2+RwqKQBYl6GFTh7uLwoI1S1IprsBIyIA+V8pcyB4A7x3U1rwYumo27jGdtS3HFMfRF/PWddI4kQhpKr8cR+SP64MvnkfTlXvxT7rFVUURU9olVcBnP8d7vRr7a7FGSICtlbWCHzezJ3BKP+jUUCnSaOrzN55wMkLf7HZ58rA7+n4OL6cUyblW5QB4ev4xyigcvDWd50dbxujfgJVwOnhV0p2qpPzD7tBxz47ztjZzh3BZIcQ9ZDg3bhaUtorDr+JU380/C7EPUbPE58ExqrR7vCPr5TGxYy6JHcvtEvSkl3PLBxdmdfqAHH/Mc5h46E6HKLKSJ51OPovYO7KOabQ3ktADRC6NL2Q6ZF/yN9mkbxc7/SrIJURROIspXaFfGrAelHeCVcsu8ieqvoNA5JWJ5AsuIfzTPao30A4JkJBPMqeSd+56Isre8elq/Rg7vraEW1fx1TYgQp7ClUYo3Wc6LKib/HDQvpDdpUHhUuNYC6cImuqHR/11AcP4pbBT/tr4hJnEB90/tJL9vZipBWMbI0lXUMMmiGsVq0VdVPUZTc1GAvGzX+Ysn8EAM1Yj+DNygiIE7IVmNMLlm8y3PuBezyY9cG0XplkgGngqXCUDmIlTRIhPBid+qv0QS9SG+0g43StR1oKAJhQYscu0fJEcyXWlFF2Dw2fnloWHE7POpMU6xUcv7xuF+5ucVi1B5xll97riq3duXOyKvpi7MwmMDw0eK2tlVw8hneHfA3ZXLrSxirE0GHMQef9JQ010+Pv8m9DYa4C01EsCogr+divJvxb8FyhHFxetX2+NGxRqROfaDXiY+99OLb4YdA4yaOYqJhOv0r1N+eC9AXgXIzo6J96T1yVV4DjmmIbTgietZJ/tXFOCrLT7Kt3kLHgwgokYSaMYBYvERK/Lnq6k8qhRKjQj/c4fF+COipbDgylMi5Br8W1LNI6q02RgH2hp+w2Mjojft6hRMqcfJ0CZokI5Z/AOXTvZrcqKNJ12zA9IXwMCbGJHmG3mDUh+nf3NgStGCI6NCC5vWfSMV57v5ukNm6mjWzauATYxplBLu2D6goFaMjaZF1z7FlvOIZhq3Zqe/YcAPIqGXHgRV9aAdnVPWCSw4FGDt4BT7iJ7u5jjKfqQ/1lQCGNPx0owvj+4YoDiHB24MULPlBROcsRI6qjaJ0LHget8+olTYr7KUh36l9T8S+pxBY8lkpvq6F9IvxIAL21Its9sD3Dd4qHXrC/k3QTIQLMBlnQCqfUpJ37m94ba7uOe7Ust7QFpzyzeHjPZ7CxWiVNZ8pBdFFfBe6pI8r/ivTVZzX5b1nN8Qhxz7tW1XeSYtd61qZgdVtd9RJBu+EoQc1Ik6cjCNvTDv8VbvWYg1rhuNvXCapUypkN6QAGqxhUL8/YHnHplgxntTa4EVcW3/3W/sbwEW7+UG69J8GE32/cTGhTZ58kWePyUVcfryOQeN6wh6PswimdlxpVmBc/wzJ8Hd2d8J/rgvqKLFWmNGTpJd6VbEOZvdtrYrJNsLqOy583eOCw0WwcPxqf7Rix/kdfwlbBir8tpC+K3vUgZMlOctCLAUtmfndCW/yNJ1iAV8na8Wy4dIy8voCQOvbXgukYxth6YpDhvaO8amVQ2r20n4YzCy4+lK/N7ZlbZ+m10p9YKUzzq4BdDtLGq4aFSj1arMhve5dhzoS0rPu8PZY5WsfG4/hhRRA4hkcx6kj/P7MdQkGRLAzdUylwehuQSv44c7uBjwfGmEcMyVBA/j3+7tJZKTKBrGWMXasbJ8pbUy9gPiNVc2zmKx9JX17GRFGngx0uHiXBuudBB6/68Oe7Azr8CowfzmOIN/G4kMG7Kv40vFzRN6SUoiF6b8tko7DFeT4lx6hg3NJy5DPkhA0LBFHvFjtGNfnB1eqOz3qV6EHGd/WX1Hfjel9847rh6mdlwYNettpmmmRBv6/EUXTNxPfTc0AZewAAABXownUXbikUgAB9r8BmoECeSOnFrHEZ/sCAAAAAARZWg==' WHERE catalog = 'OL 5670' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4GCYRU5dAEABDna4ncpk8qT2P4HPGHDQfw78KKkvEs8nEfB5h4XX/sTOqrh/HiewYYXS9MxvpY5OjVJc7G0EQ9by1DeBlxMWN/7bLquJDCv3ekV1Pr72nJrCSC6PzcVPCmiLsPMfhtiGRbAUWzkJu2W0/2waETDCcstcnjOWvU5XTQyRqajz7cQTQd3lFD03cJ+LRuVNtNw4lOsQXW5/JrOYK1udJ260yYpNpqF88gSraI++we98J0cCUaJCBfZ012loQhScjFm9MKlzf/ZmJtZRiinB8ppVIZAVZMu3Pskv+pFX1Xm+s+N4WU5WoH9IouSWnu+192AoyZZs83j3ZJT2A3MGpUy8eMF60Ob8UlrNfZG9DlVQ3CXzaGV4YT9fuLNCGdFKsjg1R9wLjqBI/X6mltgJaiHLqeOwAtlP6ITSIHH7v24IEiu9pNFJgvF/Us7JdBd48nKMwtRkBQKDTAb8xUSzgTH/cvsVasQDVVmoCBegWHVxiGG3RJN/nmEwGNszs6v0kETWqWaPyQ0y9+hvGNBKllauiJiX3RmnY0LArX3ZT8NLNoSHtsHqMkaFo0aQ3l9StMyQ6Zg0Gv8ZuCx33wm1CjkZjXJjCn4pUCF/L6HjxyYbl+xkaMN65TKfF6ndTPlIKiVj8VOQmL0ZXR/7k5j7l6IPRi/fUK6VlpwF9IyMzA787rf6zgK+EXTvYWGMEGl6egiZ+HoVW/JbLP/t7DfjqVNTlG2yCwt4HV7H3DC1DNoZi2CoiXqgeB+ca5EQ8rwSzBRaO1XxthTJ7DYm+tZ7lJWLffqS404AE1yz9o9VWN969Y8Xr/W4p+GHKAhy/gXuvqmrgWBVU2IvKPRr5DQt/evmkxNrCJBiZSDDiPLCKDxoktr7QQqyE96BlR5MJ6/UAdzr4VrRgWdQk7SsRwqBbOATi3sBqA8Lo74yj5OG7k9Zw8BIdW9XDhYMJUP4emOaNOsaFEAI8JaahTjJ5vJcR7zCgk24fsX+MyOpnKj0D7kHXJNvUseUEaTvqNB3e7cOxH9tLvpKTkdHT3yntROL+7sIkML0Ixeoi/bAlk787FnHNQbRP4AqmntjsH+1TT591qGW3b3PKWOrieVeSxT5PlUyX9qacd6FZokgWC+7Irvm35Cg1V99dZvFRgt08kogXA+aWhi4ZkddcKCUx75OmrcOe13aJiRzWdgoi+nWlmk3dLIO8IdSrUJSjTlekaxt/fONwyg+Nv5AJ7wAl8Xlz+llSrF51si1TxNAmkqmDtVEzfnQOHsIAqVj5RFvEaHYhwAncoUM4hOfefzKQ/BvW6ZNxY3Soocu9SWihiVXOUQNlok29S5eIq/Agz/FIpEkHdCNj0+VNukmaCVwCvaLVSmO/H21jMUTagjIhALXAG3SI/RvYKjHfqlu08wVh+uGjgZoh4uQUCree2JYMbc8WeUDJ0aBSUriG6Dru1oE5aek3KQXutJiemqNGI3/3Rg/EPwUNghSTHTkirXUw2N/p1Xp7dypU4Uj/Cn4XxP+G3DfjsZSD/tPhCR0uD6OqFvT/rvDnuXOTX3fH9kW/9lBByi6OzWaC3eGlGRRdMOJOlHop7ykm5wQ3pAVtkNHFtWydHKaGzhqdzyq2MLBIDhPxagor1iDDSBGBXEsguOKcroPjnIOXzmz2TcIW72XC0h5vl0wVq0hc/lGK8RxaspXyzrTNc4e8SZrMen+DbPp5XZLwoZIN2asLsd1X4tw1sniQV6dhPO3BoOkNs57pfyk8neb/5CeBH970iOCDL5vRBR5bOzf6IKOcmDGzblCKERzDTd7CD2EVgUxmCiyfdh6Zegx5cDtA52BQVH0CYY6Yfd6/GCdBRbS10AFQnTK4HBGiI/6URBdjFIsEp7RUaJ614lgVOf2y3gs/AUrG1OV07jL2BS97iizYWo+ZDjzMPkQgF+Wa80EmWMjtBTYkncuqwprN+7cowGTOuIwfGTTWt4N29Isbb8k1TZarFF0DGdlfTrreQMCbnis1dPpxi9l4lLnOpeWm8pub0lelZr3mE9vZymVjcx/DF5KHojvSz9OPexO4qeNf2lfmT5MAyQyFNLV/uJyD/3Q9qXJmJHcI4tHQhDtRr21qpLgY3UvwD9cEDqeY2upjkpVhEC5islQxhiJA6MskasgOPYjKJRXVI2UrTg9jriXtIJHyMt5EnYirf9hqt+IsdT0J0VE0VuFijqo7UTNbnukHqIMWc4zxxaUJqR1+2qXH74HQ/ecob3D5NfGe4QMxMY+IRQDUq5+as/kQ6XoY9ENqRTFKSdU+0fBDrkTOXCzbB69kDBQrKUgp2oPVAjslDM763r+NShzAcmzGKcl0QzG7ufQWp0p8wj97ocwTI8FpprBv4PPDO2XocUR6oLgcUiJ9xiBB4Ge7rLyTMZ8/l2HX3P/6FhbRAcEOELQqCLDd0rS8g00Lzis+yCHHlifWVwqBs85+uO8ufrr85+NQ5+VEPem0by4IgK3OYxhWHraz7zbcg0V/XaDvuOo386AShft17oa1qivS2ZnX2fPf9i1IVlEIoZLScFoqymNPrX8GFAeDJ/s4Y0NGvF+L4k3rEP4t6BVufwnzmAuu3ggNoWDnGLAxXdm5Vm35Ndo/fh2dkbbl51z+V/25gpeiL+LAYNyPMMNPoetU7x1b0wSjVBS954S3IHCg1iMTyEwbXyFK4GiEwFQc9moSYH7F0kJRhFC3t2cZNTXdatNjQRih6hcsqMLZd7YpsMoEqCJhYinc0KMWDdMeE3OTpiNKDgfAne+4ktGT1oNb3Cl0iB9qfwEzfRT1SByIEAf5s/X/zvDxC5UQ0fdZlR9qvldMnfPUIoCy1AM9Yo3zBQIiXhZMt1VX0ZhiZjRI1HQwHfLVuT3rT1Haz54nHdj3Mwz+qMGlL/fnUjao3tX5kQqeA8tZB8VkEiA4P2zgF9ADzyZoQMue1917ErKN/qCkugZsVVYaAtcUUT8oY3E7H61Nv8ooDqarjHksmfaLS9vqKk88OCIzfofgN3MY8lQTZACNZHYEuopSahiKwTMfBE6ROI8qC1tUJf6PtyeBDdWJNeSdmu0Q18GJcYwbeOD/6wpTeKohI9/+3phi7brTshejv9TxSHZhg1HqjHetIYJjGQeBSqfpqYTGzILopcyDHSkGHySYgmFnVHiMF8P4OQwN+0IQU3fFfQjhduo3lBQBMI1YpKCGE+CN6HxcSDr3GZaw0xKthNgJa7oatNwdKbQ+KNKPd6HMAOayggXDMa59lndiFn5vcMURGrIpQIOcKHclzisUOHGzhbI6Hk6SH1vu8NjGLAqhR61rCOZDBUICLwrZn76hXzlXL40rduHCjuwygic2hSWSv/LAwmJxgJO/i2cM8ikTXMTU0aIaiH3CJvXOWhHCVCilF9lAY012HBvXppEOKt4rM+XJIe4Wt9FJdsM3Io6XEHPDg4QooW3xc/pLvhZ1yZk5ojQOAoKyxIu5kPby/2gL9KKapOawKfK1CKZREoyLFBxqCCjKp/nzOCg3savfgKNdAAMqfGLJECDKU92c+b1zXGQQHxQ42nOe09lVwh8Vyt3l+NKKzeWT/9x0FX97ZFX//4bj0S6Fi7kp8Ub87uiQm4Kf7nV2GH1Yy6ouGLtKXJOcu71uikGyRBJJ48OmdwyvHtzQrQpVhwVzPftoxZia1oTqp9qGK+DRqpKgqX23LSK2gyYK2+VyGmBeCWLvx/HLTBvXxZMCDzaFKbcRfBRqAdJWuibLfULvK6e8MuW35cDJQXsde6PUhs6clfftwLIHPpYmWWtEtMdeMuIwH8MOlMG8rmdgKHbNYi1RDL9qdkfUzIAq4gH0+1ofp0MaKSkJ9VKi+Axoo109GRK60m19mq3gQIoHgDyoWpjKp/U5HFJgRLJliTfOfb6oG0fQy4bmIrNkcuvJqXMxR/gPg2p1+HdqsuHDY7GV525xuN3lSMCHeeYxGqATYHkto+gop4uXacpHFQjOt9PjdzFvYe9ZjLr/LTQmeR/kFXw2JfNKKnlz7R23Vf85X1m9fGI8i4k8vusDZZJfK5bWcsKKj3p7adMXzdzhaUv/mbnaoU5tjucvUygcTUM/9/zeyzy87emgJypcVzPbxb/F6NutLsQiRPq8Ei5xiLs/bcEOIgIy1beAvIVrD/kUcg+wHC9SEyFKqfMr/GubbZEWcBYPcb74slzcQrgUFy9ezW1s6rie6BGyEyKRgnsuqh92AvUJdWVU2BtTGHuPizTI0mIE+Ef4428FFqlY38VdARaNWFBtNzasvkvOG3U0ZwYVrsQ80SwPRjQCubtZceCsLgMhYs4cBLGOGRe/qINzoy+Ycjitub+TK/kBnmgUvcO4RjgFnnxqdSRpWCJR6aoEvuWsjkNYFIzKMWm9XJB4xJtldkPz+pz46K1sDfGRWJBUQ5FPq+lXqcQzSTeSIxsETmzgKLXabPDrbFAy6xFadSFWlvMhNK4DfIrh9Fke8otJzMaXejjYbSogJYep24i9feqHtmrNfsqngYHfRGMoVuN/lB6Q/am1sqi8FSFGzjqPXu2sJV24FLhvjr5mnenDXo+oZEONQC90q8tB3o93ysohWJ1kSVrf56CqiNCj+j1YUiP4szvB/aUck8d4A5sfPMPYCNlt0lG/9IkBLsi1FSF8T70TE2FDMVIkav3vxjtOY8laHB/QBaeZZKY/20p4I3Y2TwuvAxWoAm5GlFq0MhX57mbQpYM5zpo2H+lsUrZ0XIuWIFfMXIHtit/n92Zy7ZRt/bWoLthQ0mIludBr2JXkmuLJrOxwF+HsvAUCvp172eGuhlcmsAloJ+KCWdFnoRoIeNj7ew/GyN1dnrCGngurTLeo99g+yKFwu3t7r4vSpHmnP7HqGrkMDADqBk7XedWaSMbPwIPlkHH6FB7Odx73yhuqQk7npBKXjgxrt2DsCbUln2BJmPgvmmyx2DTVuSf6mJUzaexU7lOFlqtr26YJFeQOth1mUryvN62SvbEz7JfpmFkAABWE13VNO06HxgE4x6ccC990kfTIenHDBgLGNsiYV/QE+L8fuydRDlmszHsz4+mlO46BbvLHUqkWF3tfDw9oKqwqrkNNVxXTFhKTbL9mIF8eDrMlJkdAEoWIrHlSYcWlu/HOrzlZY8vmI/k2LFMWzHtscy0VF5iG6XwMeKTaDvfh4ZvQE63HGeX6s4lNndNCx2p46+9EV2PoTAaCzH/5+7H6icqBPZ1qDFTdujaJQkUYNOM/YbeSAxVIVEtqPkYPc4kNqs52JCa5dEJcO2dsEndKwjrqfIoxU8mAC5iWLTmoU5esaN+ROg7kbKJnRz1zKpWfacQMueKnuVjCF4VcznYsFkVFxpnd26MKX3RmcAJ/GsiIE+0Pu6fR20N+Sf2hSr9xyPsRBzNlDov2qD0y8DaDaOuX3tHZMxckSn0aCNvAdrzqozXmRHumuGnPpk0CcQMv8PEq+lDOaHAKy8My12t5A38ktOBxladi67cj0RTAPmrOHzgebmSSwSRKW622YYsg1rwE24XwnaV7kQRNyck0PYc3+IrH+x+qRx3iVw7bN9Jt023oT+qTU17fT8fZWYU6+tb4PXz8LkfpxCUtoaKQ8g3EcXMn+hPnUYgcoHL76qT5PMjay9aCANOR+ij7UPGmfgipEUUYgNFMfZgC327xNxNHjOpM8YzhHXin2HxtCFj8XqMeQG0eD/7tXXcPq+JJciYRMT4KlxoAtL5J6GwOhe5GZ8M4fKaWhyxkcLzVoV9X3JrgH0Eg+TLxgiViOhA4CtJ+xtfF1B5WrXFZ71DPeMjNhy/WkHNbL5C1Xj8gdBNP34RXPUd+8zowrJ0ngl7XZPtDXxrql147E9nhRiH23KM29C+T5h65mZe3xhkBHjvho6G+2LfDU0wZmrdNIfyEn3U/x3IVSfksABy/szokVA2KMnlieIssvR+QIpb4AEduj1M5gSjZ7qy7ZEx/mZccZimU6ecjkRrv4CxrXahJFheyO6KJdGcXSXHz7ZIK9dGtukT3faUvtlK0RDXzr2L2qSVe2d6Omuu5na/5spxEKed09v7PQjo7Jey3uSbM5RSGGVEEuU1IQqH5RXanPOETZQQ2S/Qj2TpEw05oyGOcyda6NIohVwxHwftDUgpb7QmqtXid1T25CNmblX97fBVJcdOgCPyopVLQ0csAWk3a+KvTy5gNzu+ZiiR16iR1HVbUw4lohKe8Gh6p8u29iWO13ASjHNblv633N6u8BNHN6F7sXFzJDsSPwNK87oO5qZbPtM4AU9SNYd/+FftNsWSxnIca7hsGJ7YRhfKI9HYQI7yPqHngkCRmB3f/JYz21kaK9e/qeN9l2qjgj2tMZ2hIR/hwuYX/c5P6FdisocsIq8LDshmDIFvqjApiPySzfNorNFDNTwjITT+dRyaydhr1B/8zBorZcADt6lnp2Z5CE0HMQnZea5iBJme5dkr3fbwRNclC9jksOYsDxjBkh2tnVGoh2j05j879XljgMcWpnRkZvVwGiVeBHTYTvScNU/fckD0ZylK5rBwafrrKsKcNUdE2u3dJgRU62qgE4caHm8YIRSn3+MUoQfVcZFGOwAoPywaLJS7WiZgHf3xey2Xf39gKIoNXEcb9GWroOCXrxL6cJiJYbeqTih5RA1topYW6AzsRak9HFLM84mC+AmurfMxlqb5yfyQnznHtBy8/aIpMP46bvex9SuqbieaXHCwGGcPw1vraRY3zwBA0ua9ptctjneSDJawhhxUAkM9CzGfbfxOo8DKGgO7Q03PUvUi3mQelfA3+E6g93XXrhllkC4V4yCRTOI0p/1/mYpjh/YDZG4/M9bb+gki8q9PwOx5p7ZudoSIGs8iKnjGaum4WgFG7rbKjOaZrWklQb569WbY2FLUiYWqo8rrimKwpIqpQ9OkprOXh2CBmMdo6EZsHkMwetJPjFuOgazepdAURbIc4ms91q83hXq3ug1c5lI0XEqFCAjskyL1iF4AibKiYuWXuIZhaxRYac7Wy6TfPzt1CKbz4MP3SkDmbdkkMgMJBo4QTgGl4IpnQxhgHuFxcmWPhXMbfaDHEbkWS8yWnqTwe9Q01DwSuq5eo8F7lj6wfpA3A9/viQ2tE38+06UNVfhYgv54ml7iYTw/xWiSAY93MfqKGlQaNrGl4tpJ1B4uU6Fdjy15OOjqYu1YG3aTfJBQr40hSav2a+zL2KKVAi+Xs9dJ5MtHI9lj3MGIp6w+M2st8MPYPoIVo7DswsRSgu37+OHFhYjcsbZlMPmvMxqjprixBk8Trzv6Jvg3lMJAhwnPCVxHxDruyw+Q3g1chTKlmJG9k/SzE8s5ZJxxUOivKPWVTqfmScAl+6UfNnEgwEc/1AFBEWavQkvRlt55rWZn6uJwmINbEDEQz3K/GqHKmPiMtbtlY5v6GZM2P/fYcC5ouBV74AOgVS8uJgzj7cBlcC6j4FifaI+BLLp9W8JVCtW9C/CVcNeQFXGkB2M+Aq+nWegFELzaLMFx3tqg7fiyQ63w6Fit9dBO6DDVXWAvt9P69CVGa+6alU7eHm+8uizyw8N1FnN4OYJBYEUTKNEjpwzeRnD0+iy4lPsvYEaTA/pVMG2ydviDWPQt8jbwb6L7jRy6E309LgA5bb6slKD+wpmZSrnUqfOplyqFPtEy/AsuSkecxXYY00+twLyoOdpeCESBjDZ9AVfZfdAMTfqFm05WTVJfULffwUtAfQWsotDF2kI3NW4AdLHlwR+OnQ3U2ce3nCYwzZl3nJ/32gP7285dKJ+bOMpAGFjDvd5onePYMDyv9ICNgxAJCA8J1HGhRsDe+sYthIO/uFOm09BKZ6oUpRx4bkPj35LExbTnqiBTFEI+C+H4m/3IpXgaNIoX121/NtwMw0HdR8LfWO2u97vR3aKLIQJ+SmlpIdlqgfQ7A/NcthgspmwlsXWbJyjXpxS0f7CPaog7XshJjjkS3zBV/Y3/X2NvgKKa7CQx7KGQ7NPTYiDm4Z+fiSwzzx12fcIcBL/LxLKRpeI5AFEruOPhO5ymaT56I2KfJUN3iHXZJWKdOLv3VWlhDY4ftJtOtfxOLrCoUWG4/SjVk6m4lqCaf8vKc5D7pvNQD2lCUUvvz1KUufTJQc/mt/GdJOHOvdOjTab+/5xDky1g0687eZ4zNzEI0UnqauGtIDKTgXqTUR/qWfjSYbfKCYEiSxIMW6+CQcaj2/48tJKf1Su3v60xS/DBPT9Ekj6iGZMc6PFtDXaugT2KkZ18JlRVmhSwsDrPiiVbTy0s+GNwQnlkI+ZQUtOGwUgn+JsILCSf5TjlOTvKlURWK+BzJD7+izd2S8xUFVmP3LhKUVXyjc4x4kWULzT0oCl2v/AP7F1kGqCrq4n+VPEwoa8ENi+MwCjBAiOBb0cIfCo6+L8FoUzHBFtNwMNKYeqtnsVltfwpqX6TkaXZmecjvZoO41S9i/zCWWugC9N3ve604lJgI+r7Q5f/1yLgACa1ot4zwdWCG5SKD7WhKMN/qqq1CplkgiSylLP1ZA3eDpVizrBhoIs6+DrW+Zhhzb2fxo3QTkNHdmDcK0ygJjn129E1gXgQC8eIs00x3hG3eVxS2uDH1p6Ag2ZvUN3H6Jlc1NBPfGe/FUknUdPBmcK0Tbo3sgo+Gz3coMxYDh/7WvKYQIekHAs6iA4d56xxAmo3eSKEL9PwBx4aAdr4+Bv0KsddWE3KLNmTMg4dvznU0kqjXaQIsGOMc/M9G/zKyDM6fna8joVQMKz70F3E3cKDmGeKC/sbO4dKymJrZu4fimLpdv7UjDsy/ryLsw3XrrJ2j5GYAkNoZmU+9DLkD3Fw9hbGr/C1CHZIzZL501I0oMCyLbNFQzjAr7TK4ejdh7dEHnBT0cQtP4AkrgdGN56wwrhaV48J1Ji5yCP15jRWV+vkJplyLTPmE5hH6TtCKhF2xcFU7thAQmCItijwH0MiFDKQhvydqSt5c2FcTgNOp4rgSaS8Q5IEIcFX6F+9O5C8AYYWtu0koKSLd4BfUIgX3mLTbz8K0PfdykML/mJyjVSw7CuhXxNIha6SXI6yJcOkaIoe7+b36M3GtUyhV+tsVJyFDZn8hcUDwaCWo0EI/hvFn6Hx8okyfLs/h9WwOLt6qEIvfb8PXy95vKGD4OS52aaGnUTmzrsMV45pAiVrldckykVTwxEYFYFa8Aws8H2+4k89BjK9+ueoOM79j9RfTxBu76ZznkS8o+cG/mdF2vfeVjYT1Q49trYtaM6c7tG9B6e5m3afESe/vfl2MKycyBQbXA4IX7z9eCgiohGK9C4g6UOn0Jd8th3jIiMHQfgPk5gGILojG7CAeGvw75sJc3lTUNTF5KZ7f0+eY4L9ZnfSJV17a8uDU9nIKfJijn+sZS0ZIFgatMiGCs2dpnblnfmDerA7vgY8mq3ETuaoq47ky4rrZuTUREC7oamb8b1b4Y2H1dwddZybRss41L3V5G7BxF1rRCQczkWpWwNPirEZU/SzqQFLKcWkBVyH+5fwlxLjFnhlTEhfWiBulLmk0o9AV34HBfAmz3FpNZ4bG80Vr8RF8UDXoexwgbmCUQJm7Mv+rK0vAR6WWc6Hs20MY3Y5WSg9nBmb380YBi7ZU+eH+LVSDpHGy15ryIICMAD0A40vj2sgIyEwMx3F2YcvD03RMEO4wHrbEnLzx27NHheMEha4bbW8J36yffxgNnt70ayqPjpxWdcmCvDBJmwOvwX952LqwKdzfKC6DpILpaE0sgbYZMml1WzAsmUDodUF/YADmOLfythMPxfhxOhXGm3Bf+DhCUTQbSXuk8/ZmxxB1aCaCPaUEknmVzqbnTTdlI48Mq2i6AU70ms1wlJlwrJ2b7t+gL3NZ4uSRCK2KlVcE2r/lCIgMwNVnRZOq3JNZrol5mDLFarZkiXxWuHdrRaKpynOzGZnT0sf5MvMxMH0d16K3Sh0Nk40Ynp29Nwzw3UPplJlPtgeIYUeSnDnenw7fGXHJ2v0Eu1w/7C0Z0UJwgw/hNaJg5VBz0wrRaTnZDw18ZnV2MglAxjKJAbhKIH79HTuwlljmhIC60X+9z9lnIRNAW1CYTKYnMUS8OssN3QikgB06hNCtEsi5Yi2ouKiUUMuwtOKMg7F4Qg2ZnDsaffjaa7c9r/Ij3F8jSIRQIE2IujeEasTmRfod/3EVwwWKehekhMuFVw0FZ18ipnWn2LI6HR1vtCxrGqgoR6Ij8POlli2uYy8k3nUCmC/PvxjmcF7e/ZJt6JCFlQLgHEfEk7OPMdlIZdkbnQ9wcsBce/hJKiDgfAJMANdSTPJy7tRu2MErceZFX6zB+82udDewD9y+PDXAbu3Z8PtlSpAd3sDQhNPkBZrzkZ90NGJEnQLN/CfwbZN7P7jtiqbfZKyUWpLeqFx6ECQFFBnpqkxEGU1MfNQuR385A7bXm0xgnIBQBm/CO3zVeuL3FT4kdOrV9kgEi0zt05nKWI/Nbzcoa6G9yhcRagWSSE1gB8SePxC7auJewKzXJQIvnDR7LcdToSah2E+oc6F29ZPF+FEMzbsozNzHhN5LTkwwyEqCx6abGuRdF7b34jnGAefNrtn+dQBgBPVOMEk3yPbPBGzLXPnpab2RxjAumFs4UHhzX9ey3mZOYcxfqWfyM+N04INQBHrFG3dBvb6XN/DhYNNkzyaIFvhKzxRHFAwlFL2cI6Ye39ohkcVtNL7Is0SRvxJCL67HtbJ5BtexnsLRzOP8v0rNNJEpTW8EdCtCT1cvrc7XyPpPdPqhcTqjE7+bnL14WPGY+g1I4+5dkyPY6mfd7lNclVo8YLN/eUqdg0WlO4GRH3nYzXKMPEooQsMXq1xXrjZDCquqXo3H+zfbVpqccyCcM16dhaZC0BH8jrJCW8dKyVidGUqQ+XpkcTC3FTDn2OivK2Ej4YGdOU3xsC98NJBnw88b/Ou3brb+r9pzMtZanF6wQUeu6sbjJlc+IH8yuPfvTddtoD1L40qRLX9LwVSaATrdDGfIT46WHiw55jAVtk8A9C8i/8Rd2a6Qh97wB1emetOGky9Z9R+ZJv1M8SI40Pq/H7t/QMvWgW1vqd47c45YMbgVo6CLnZAHyRnoz1plBQRW4BPi1Ybrm4rnDm7Uc37X2ZceuNOUtgcYOsrjjGL3rj7QHKP5/muwz/a+TyZTaA2qi3ep/KrDGoWLNGY9EMYPMTGng0i9ZCSSMHgAH0BUuGfamachSaD+nzp09h8eTUgfoxM9nyWZxNuZpzSn5pLR3Oer/e0yTDO9fKEneuI97f259Wew8F4q95z513EvhqQ2G9lO2p5t+rL7O/NyxNmwPaqfr9UnN7kzvM7TrKkGb4vGK5tDtpajygd72Li8X+UhyECRtxi5vxsH0QuyiniyNjU+0IegkvUMjSdV+qP9rQ9vuNBypkmohZeKugoQAnw9ox/wpJeoqafYjaGe6D/mGZfvplWmbyzr4t2ttAj+pF4nfBJftkFjsoAuRAzbR1JP6Gm1ItZQUAnKL7E6duT0kixi3pwrrTgF9VgoVlPdJ6fTbWrkxantjvRjRoAo9QK4BFmDCUsw+hnlGii2jNVlYbajlM496UefqaSrYGhV1kd9xyKhWy5KyGNdOPgL4Y43olSpTVJy3tHYqLzdzMvWekMstOhkxUOwtySwjaoIDyz5uFAiRm/kxebFTc+yNdArkAupAEQlylZ0w/n4o/IKoVI2Tr0VYsQQKPqBfXj+5Jzq0O9vOkGR+nlvQfuR9nKgsiK08u/gCVEKv62M2V3QfZ3I3neiIX4bQAgBmATmbf0c1FCx47Fg/NrRwHCNdS0nwHdgMumW6M2D5gwSaWb5UVjfVgwfJV+7STJSu07lbgrGjCHZ80YawvPTLKesKahKeEwA+PPPO1lKRj4oepTvPwNrzUkzZTI+DWCgtjZZhmWDgdfpfnyUQVVL5+cil2iOSiW8RhhhfxjKaaT3wj0Y6n/rRxRHh7ry6YP0fDEigF8lmuhgtfhAiyu/e1a54bOS3WDY00Q/sfy9xNXFyzk96+aFXDH3RoOKP45h4O0oRwdL4H1Y0sIreqjQTK12HCIrzs5twDd7i9MlMd0enTuGSTAimgH7iMpLdYPtnb3St0c+vczjmiBvUJowZgPK0GkThYCrOBfND+iSYmBUKp2J+l0KOhwjOttCT2UjssG0A8Adw9raoOJuGVg/J2nQZG86ju+b3R9R5+vlbSGTqBD9D8EHs3jn8ZLrFTWJEwcI6X5PEEQtnh7if/2SIx2UG4rkkzl3KRVeDlU9V5FJVWq39spEz/ASmWL3kSeyeSLxtBOVexb9xAI7d9bV16zWjkstPfmi03k7c0dodr3Zer8JkZY3lv86k/gyaV15M56J0hRUjHPoWjKbTGmx02mR0v3nLuBI2mBzXoWOJrRI5rmMQcmaaGAaPP3KDYP+AxMpTF9tgCMhX09tsglRe3dMwOEfraV5bCl58nnlxtI5za1PhKucP7IIm0QNmmX1fEL9uKyl5vd14R7zSK7QTFZpJd0sOooRQ8B6KhL1HdeIDZt5s/jp2M2xCdb44sAnGia9r5vQET87a9duWSE/cm+bWRJIThRL+gTt7g71CCgy2/Ew7lYSsseRPKCh6HAnAPx/2vu2ps4mg71oywnS/MMyXfrkdweiJwFcgUagqqImwLSd/lJBjqTxSBsMdkPsRWcCfSqDkVquHReeYtWhzm2zajTtltDlNzatt5pQzee4iv+xUpPtJN5NUWGLzSPc4s2Wp251PzIF6OVSz0RvE/3hCTX7QM7auB7dlALDdq7/D1u2+hcxvtimjsmwsSyDL+kvmYfu8W5YRTz66G4Xbi5sJ4qCnSfGg2HZyU7YB1Jn294EnTicVPt0DTyIwbKAF9eLW06jIBuvrj/iqeW5Uf656SJiwyU9ITW9dY3QsYOCGI/Lk676tDMtLNWtrmeUjhTQd5AKhSgLfbC3UVVGVqsdtY/yzzXIh8C1olwmUpizIkOJKBI4xnLADWDPmRM5JV1xQtibJVAqjPt2X9SuwKhCPkOjC9axySmLOMyuLA6FqSrQk6X8OKfor5oNplj4vijwEloyaetWsZe7sUvA0B9qqZS/aqqogkbhcON18+OuJFcjMyi5QS6zv9mZc2Jid6/0ilUwMJtuFzgnekmBZ7JLjHrvMXVimtlxY8AW1wgx0Y3VNKWOExyX+AAET43GKKV7lyruki/QDpQirXJO0Dzc6ySZgX1S0VHig40e9zyY20uumTyEmRhLWV7q3tcWtR/sVh4K56/wyQmBJ3QJXREwP+IqR3pAnF47O49dqP59MMv3cfg1Yb3GSwkZtUmiH3aKLlJ2sQ9dGVPm7SS/2Jh+e2fE1TlO/gmyHLHdRu6epyJIno2c84SsDCdt2NZbHzMLrJx3JE4WPMbTdY7DK4GZQJfLekZJ9bjs8fBQtQhD9KDttGfgd/bD9NT1nmmflvj4ZUvrAPOFICGYV0ztP73sqqHU81m+ZrtDtOM81cO5zKan7aGN68AcvC/tJOa7DrUbzAsyZ0/pijR88DAX6ZIfxAgx+0Q1G8iNUggCb/Cq3Ln0fbHpl9pKPrraIY1uFama+MGXh1fXDfxsd3wALuQBk2p37tZIvrROzx/hdxURjPlu2opKsckmqajBymYPtDdmt+s4Mq/fDa6E8cTSl2jxBlLCjF6jIyG1sJhCFihfd0Jvykvhy3z8E7GB1nt/ydhTXhWgxlcdofWVmro43eSJ9+u6Gl3eM7zGYb6CptzIpg30mLEgSyAvDNBZ0/McKxNs+i8uinoNviVF964ULXVMy3+FaIF/MMbqU1wqL05plgVpOUUdV75j857QosLxjfqpdKIE8yxIc2r/4MV3eh/pXL9uWcKnh7dK7pltWnZc5tazpSuQmwsOJwrdjcB8Jw8Y3fGA80viWXnbC9xl7DwkMQdSL7CiIBYfoUGNlJUGzpWgXCk88O21v5tC8E4P5IL+Ty+O6oEQ8S0aMVanD/CtWqZm6n53zUjzhwFUGWmrGeRpshkvN5O8Q6jLNpFFlLTwqOSUstwpOnJAT3MYsO0JGjxj9wYhjn59cLh7PqvsGn3s4Yskrv2Wc7eb7N8aY7KdruAh4UaTJAIUsOaSn92abZcDffYvw6ByMzE4uXcA14fT8E84cNlxTbrOJxX1V+mL5Lv3In7m+hOS+ExwXQWrU2p+tHr6KZv0caT8hRJZhBa8ifzU1jTS/rqJngyBvfZZVjZCevtDs1wQd4uPIec9oYK3pGTnjiaJiFfxlIG7TYxnRpg6h29xk5Hxlr4v3aT4wto2bKrVZqHyC9kHx1em8u3sEpGh1vKu/mKSWD7/8en3Q0zUwo6JPBYQK6pj0WzQJGyLIrQPdWVR/G9z953qpmEpKnLFwSqFsD5xFP57yDz5wYbklmYXI+T1CwB5AXWjtMXQS/rl3fZUkU1nxuHqu5vSocACswGcm5TceSB/MSFfjLFUVajn1sj5BJb28paHAsnkg3YsGUJrWx0TpdkKOwOz1Vyj5m00AHutUqBYMHBmHh7iZ5kCQp5SXok2xmTwMiM3ow+HNT2zOPGt9ysK7hfP/U5r2BNpuK2t5RO30XMAQFVeBXJvNTiZr24Nkc2JO/3h5lU5P8T30xxlAvVJtlqirmLuAWkWlVegOFRRxixfDby7QKIhz8tMwTdVD9PMODxIhgA+nq6jlabZmpcGaoOFoeuDzmh4ntSNQk6J4dKMLcBIuXkl6OPHB/e4QIVgipKy/ULY0Lw0UlC4raW9uMQq2hR2eN+vfCTcwhWmQQw8Gt3rs571CSHeGdqEnQ1BP6AM/CD5XPoKBkCTqQtsgJQtQaT4Mc6v0/QRptXpcLRAL0C49YBkNl2qevtFyw2BHsbMKYukA2/7zVZuD+SlvwcdRv4nW1kCCzUY8NENvoTnICp4LHHIkbXt9tbMKmzbTZry17l1sKx5WRigVou7k+Yf9hu7yLHnbbWfSTBWJVmapUfzBNpWSrSWcsVgEYDM85RPY+xVEFAI91kJ/y499nYtQoccRGn8wnKiE4pixFXTpy+Xziay8qPra/g9CT8kCHag/MKTMNsilNikNGKNc304UlnZ0FdKn8WWcgoiyfSxtwLBbFtEOR+xsDyyfIzUTglQMZ8Lz94iMiithwbmu5/QIlb/OaGqHQ36VtmxPzioEq5PZMsZHiX1bT2Kz/mE1EPdEbJq2QxvqHrjcFQA4Ud61cNkgDsWPeJpVCt9Ul5+RLFIusXJThqqhMLlbpS1RS1hR+/5UWlvLW2bO44kto3ysbzPvMQlFoUqRf5fD70jvq139lSfKoSaeOYh1OZPSTnMgNzZL3FEBUFZ0gLn0QMX+N5OXKGv62XowHUZdenhxUnQArEKize7mJ2K1cp5XFt0/sHz64khhngS1IYUXX04daOu6Uz6VOUEaycP9tVt1z1qdxN+DuxpL1Ul4R0js1vSxeVvQ/r+T6v08zHHd14K7QRexmJrVaSSV2HDXx7GHnjiu/bNJq2zB75CVUQEIHwvvVhQ3heKv7N0dnwUKk22nxYtk9bXGgFaaB4DRGxoIXCJsjjC+dYAqkLzPopAj+UXfag1ny354QG/wCosBRGDVF1n1MVyLx6wDWM7uKs7kBfHBi8COdIO/8F2MEmNW7Op/OJoVifMHgoYfbH2xBmqXxR86/kivK7fzyLDgOmLOTU1V1JQx7RvXH/Re2U2LcolTlu9bQEtbO7IXS0mtR9alhFuCp4OF36sCyrEB3nzvB0Uq7Ivipi4W+zkopSkp5hDsfNR4gpEN606F533slvyFpBDXCs3QnSTEZlBAmBhpWa0CRJfOE8xD4mABLyQXwGgGD46MdcF+qPfospBv5WMZmQ4spW0egsYfrJJ5FjjkEXGa2QPgooersGH6LLLDmwyVKT64FaIBuWJTL3kSsoqTynk3u/9erlWICskQA5db2uhkpSzihJ9V3Q7nAkryGF9xoFRZ+6sE3sb0WqC4Mbnvs5pBbb9M1VXYx4dHXAK3f286pcn2FdmsLf2JOEg86Ys78vwdMl3ezpxQyrm4JPzyP46hWEWFAdblUE0uCUn7z3rZoAr1RZiACEQBIyUEM57xeQ3R5/jsFl+ddIexQTxD6VLJwa/H/J9z7kxhhZjB6+G7OXODet/aIw/l2TP0i0YRD2sB0ZJO/M5FhtTJJvEt73p0rHXaVfKbEf8sejQCdO81AbR0LpLJgbOwJjcl7cjdsddOkSp88AnejPXi+4XkFu+Vz1wNCrO4noRAcAyr+sPjrsVtBpdIEMdnZBjakB1V+rFPapTZpQ2Uep1XufSD0raTRBniNTxQlygsx2E/C1GBmj40rQuBqPwpOT0FDAiDbqzqqpSYadR1A5uGpYs/BUTHW47v6X1LcAmfTnPnEBf0ihLaX2Ck2QdwRUHIVcLR/qbU0y/bbnCVmPwm+8QaUUrsMDNX9ITZSx+XYWd64tDUQB0ufHhadW6dnKGdTG+erZuHQ8nPLI5OdBmsSKkrVVI7bIf+R24fyVYIVQ4n1aeKsWre56QMhm0SmC37ARNhsYaCzP5K0WtPauPsUocYiLg6sFDdoDM11cAXSrceVulO75xamw8usgl+ppkw3CZ45a2doO86R07ZH+Q7RYnignFXI0f1FgF8ThRN14kwGGYOSzT4G3lFO0KOhBcb/aLKmDyYtoO22RRYn1di4bsoHAB61K1sRqRsF8yqBISFnsNOAptTCSpVfXi/urmz0r/wRmYi/WOwqEt6ImJ9xebX8bzmCqd5gWV9VA/hyyfOnXnDjAN8dBb/oxNlCc0OUrANTGFJxCUhVx/sMRZKyweDnWIDfB1O87K+U42ATJM6/wojOaASzjlG2EXW0oG70b3GBClhV3Osg3Wtz2FmU9wZfi+6EY01LniWY6TdIwchcb4gjVSQj4tYvD7Pkl5do26GAZOqvwEDkuau6E+KbkBSLkOLTJBkJBzc7Jyi8dCVd9vZNarL5flK/w9lxBHXXHcNlGx2SJi+DO45j+/UlQZGPHpkfnBkUzWVtO+bmrNljLhoiAyelGoJm15JlO+3oiwp7a8CCPpd4WhEXO/P1Qg37V8DzIh+op46cz/QanOmlRFpS0zuAz8gRDGnBU0TI+aNEI4cNbyK4qpXC+yy8RdBPCacnvQ/+qA/xblwNk9stAiVyikCORSLsNEfIde0x/1PF3AjVdpYEASNMgPxoP5zsjKTpf9KYAtSPe2H9AN+bx2Sjb8HHqtLni+Btt1jxAeK4b21DKmGoqIobbN0KC5iOzxf1nS1tmEpcRAJDRDl6v6pZDcK/jpHzqhxiyTOv7+KdzhWB51B6Xsy+Eq+dR5PiBrNEp0hafLimOShsAczGlGSBhIxGJIGEq5q0DM4xk9t1aIEBOz74+oC29Mi1z/jJbgMf/fhDIw5COq6L0Imqk+xjDL7JjtWpdoxGe0K8rn0ohWPMPq+xXZOKJYqK6kVVEt7oN5r/cqkgQDu9TADor/3ZXv4m9fCMpsGYqPM/pghVXwg79sOg2HVVNHNuDcNH7nM/OlEohoDv8Sk1SNOLBDkYHX+LRizMdiL5XdlcjpDdLQQ3S4X4H5Pl8PbU4zcFuXdjwzUE+MzMc0cLiXBkGtDQDA4KavrF0qqmCsiejgtBiH33oyREGnGRfDJOwkA7g5hxbYPmGUo8UrdYQNXLFbQEBxsAeQH/PNG4F4sqZ47KZhI0eizBIZF85WZTNJFb+i1AapNTZFq59xIFzwFb+IMmeYULwHJD/3juWxgOPZT8xKMjlr9WSaworhiHRjJM5uhN65GSMsluigBGHG8DM7Y9KpyZ4xSCLU040u6dGdBx/KL23fJ7GujQ0dzstpJha+tAmx1qQIDMByiCy7p6yelSz1UgvsgULDF/B+D8YymNFE0zZQeCIr9dCVH2P7M2LI4t2n9R9lmGZjtsUDFuaUClEhePKwZI+awJ40DKLFtUbYTv0fvg+xXBJOUDwcMoAXOLYZSKtOqJ8alJf0aQNP/NxzWx1uR8SFVLYAsdkSkfqajnwUFcYIW3pKPvDIPGUIZ0kLIguCcp1Kwcqbiz9MR7KpVvVBeqE3jdSOVZEALMk3mbSk2j3R+fszFBOt+X5fN5KEPX6XHRNjL/QG9c+m3hVpA2Sk6uT9jXI+YfmAc3zB7SPUc8HS/cZXbZy0KXRj5V/wKtt0Ndvxy92KDAaBjVFmqiW6ySKFM0GWyiV8AGVMC+B7NXK+6Xv2kzc+4mVbVeEUewfusN2cSHVdNMm1KwbibgvZZ6fYcc3HFpBgWWR3uCaiRpYbPM3NLj+Sw6q7Qy6TjRAfvmMk9rtYAvb1UatjtlEb0TqQmVvxfCQL/H+BVvqs2tP9BWq+/w4bAg3CoKgavvJvDMpI4LSOc+JU/Ru98yLuqZny7J5lJHt2wmivHtygdxx8VmCz/UK4E2BRnQTe5xRjwue29Nxh7oiJuqhabME7+MG2Hi+x47sInfcxX2lD9Fe3L3bKFlS0AfvwrJUYNPZTL3cgVwxVAj8GkOdn5lThE46a2Sn8qfz/3Ou1mWp0TSPC2ygj/E9yM1KcWe/Yi5HuSvI6sf3rPSnPCQZX84Z7TzsmNPmwEeyTaV0E7C6fKxb6q2+3CeK/WI5fq/GFRtVeWbvdxwpBMnWBGBa99EUbxro8mEKpiekGZi58trACAh5Cf7PexiHdrogC8fwO5/dkkcO20z5lVAOgGlngZH5mvJyjMAM6G9jB0Bv2jCrbfA2XsFiLWGa0iGVyWj5BmB8jERjzBDIbMjzpFyiLctDORdgUhSxPPPSUmv8kRRFXdGTbVpQhKOztQ3oyXnMtClRJ3BYnq72OqEE83InShABjY9KnpxrfwlJfBQWQ53dmtBGM8JqfXeSYEApurEr9iLvvNgnPNII0DOGGT81XiB49GNPYL+j9ZY5q3twdDwj0gKsb6yreJ7JlaSw7gfDh6v49Lm9i6e9QOd4OnKK30+QdUfYglF3SgKy3ci3LR6bj0Rnq42AiQK0IhioVTuWr5FDZA7kHeGHpab9BRbj7NGUg+0SbIZL+BxD46yEbaXrPUC6d278ZKuKke0L61iZZmD9X5IdEL7oAVBieiPcAoo+TaTMgpslWKS0liRwjWMUh9fkJsaTrQM2qFg641CWsxWdI+l2yPLydIzXX7/qw/loSPic+XA5XD9eDw2qUYLOAXxvjuJ9dUw1Iy912JfaXfdyixVY2OteAWE986VBSkhIh/kX5uzlsoAgMmkQZnvMzJv1khfhvCkItwRLMyZUF8TA09pZ4nBGqmWD8u8y3k04mfCK/wgiVKHr3sFGLW8D9Pu0FRAa3PaFwVbV/euTjGU2/w2RNfpukzLQHMdlconDmcuGs446G5aAkPHG/6NSdE9uHXzpE009FoumL3pZh5aovFGoasCKk37kZUQanSWH3auiG8A8cPi4UbzU6BJLy72wmfLgl5Ota6rsPjNwv5fUoQxMk2pKBjAbQlAZG9qlI7OKI0C0/jMMqxSti98yJtHCMH/8A/YDO9Y+ofDsGVHa/EHagTay4Q3530UvuWfq8r6vshjjaee6HKeU2wvGfRomTcHxpzGml412hOFIMIG0PLU65dYNAqILCxqgnar1T2qBJirDESOoR5er5cMjDCe1+YepHyV7t5UfSww9a88zVQy7Rq+ruerLKS6s0/pl1YXPwLjV9sb6IaMEHwXivhZvVBysKde5z7wU3CVI/l+IZ28Ed+yg2QXWEv0b9Sd38oVlxS5o0eESpKTHIIxG4usZJPCiGOoz3qBJKfsFxKkAfkCTX5y9JC2vdn8qKGIMbBtu1XjIERrmgb8bTVdeujFwilTbqESmQuquHcQ03yNK8sYWKN1Ug2NUCLDZehsRbZU5TojcTpNNHAjSPxZ9TmDVCIuPhbM0WCmo/qTL7Hx/snZN+7MfjLTWizZ6NS6/oyqnIxRAn26XC5lXpG7R1iLzFKD9ypuYEXhDx1S+bJev34XofLNr3CYtz2UYwJLEj8fONYyPA914FMrDOFeKbgnWccBDAsfquO8yf8vdDZ8Vqgw3Kan23hxmIkDu+3+MjlkYBcuAB+/OopSFl3h9qA/7VLRDXpqkOB4oKTAWTFCr1LTGIJHHJ/nhnk3kmKcqTR6R8pFGQafph0BWOTHk0onS5/f1veL+69Kvk7xMsJXuHCrmv+dTU7e9xFuGKSsVEVU6wNBJ8pZ0KKNe1CPX/G4U2vGrLC84lIqze/AfdpqjgAaMR/ewP3+PrNL+PzOGLxFtF0C1FEcgW4a2kp+O2B3TjZyce7pBEtMvAqung2gyvm1DUl4/VJPYU0yb/PBzNuFzgmJPngPhWnCrsbZfpRVS6FcFlasyQ/nkUV86B6+9M5+qn4lcfJKi3zKxY/VuUDTt7UN4eoucGTAXcWD8ZW7rSNx0H5jfzKs1yVC5jTJqu0DbC2mjsSQ3mx/ryf4gVfZvmB0TWhu2lxnRSu1bWSSIx3uoG8b9NKSJ+QFTv/3MP4K9UUVTetfrgg+7lq4/wbT8vY5uS3L9xkAxM68fQWm7azPHUOnTZrI8WpsKHEa4oRq23+H+7W2QPDhpnV55kluUpAhZ89MDcakHaCmiofW0KKXZqODIbxjCk34VKB6t1GYnGdSGhR5T+OsFqnnJPo6JLY7qVHVH0zsBsak7pv+HpSJrVs4v+V1u8ygzZ3ywsplI8o7Y3nnuqfK4BAJhBFqD0OATfhO1MTDT71z7AsYaH0551AUwvwlBt6/WBY15BJNu5NlnXNEsG0oVkvVFITSkWQi6buu+9SLoQC8iuIK+nycKSrlZijUQcOAFtOpzbL8HM7XpS5qq1TH/IsGT3SxjT2RBMRi/Vpb3SmwxJtg69u1otvD9yP/dpb93jpqf6rfFDdnYCog8nUlGLh/ZiiiUDuNowdlMMMV4kAVoSglSH5RKLpKf8ozkx4R4ls6gOaoK1V2qvGmSChIaHrzg75GUBZg06UlmZ4duwiAW0frB1/JIAlew7FCKbV9EuzSk3ueUwCwZpTQQKA7Rc4wQSxmxxy3shvqgONpupRSFTJ4rk887Rza8Il3Zly2193fzJWv8014tgVyctVZowAgNIlN2rmmTxJ0X64kRDDG1WZltx3qfxgxEcLuSyjkDtMZExZUU+1vPjhnosH8JEVd4jY+ZktHovDuElagFVFpa0OVD64TjJGxzJzaTPA+1rzSUPkqo6wn1JaRz/08RHg1Bmm+COQ/qNdPummFvQ9yWF0Kp7sz+oSZUR0SZVFKcKdUZtMLnp90w4MflNaRGds/eGRt5yYWhd0Ei2o1EUeQ9PaT/aGBFWTGUgMSZXmTuFnX4vyJ7KoIsejv1gasrIfSxx9Ty/OQO6QuAyp/r8yRelLXxcRn9Cb+Cj3GiEoXB3tAWJFTPI9M2uZ9oSJ9UqfpULPGGO+jvvkdur8DzjT43z7MgW6bFsCWsCYVpM8T6vGCb7jT0WzH4PcNggpZGrTX+rEa8yLuL2wbfrlFpTYFX0uWyKOqkVbQlcs/zmghYSfVs8mFENQ0ybvrQhNzyQ/RZZ22Ve09n++1EqnAHfnn3AXoOiLbhIc1hkbMdI9dNiNewmVBcvXF1CQmds6BGwf2+TtPp2wtsyxyUiqUQqh3dPiGDDMqHzPdoF9sMPLW3ly64JURgRJMLchgjHsFMoaGcvFEbL82Ec+LPYzK8tbTMW/hK3RybsDiiJ6UVkbxaAOHhR/uKJuo6pyNEbnjNBMA2VIzSO20dQ8//h2AV581jW8SvrlVNAF+ME3Xfft0/ZGm48V2kMgT4ztual7ZEAD10nGDn7v6Za9N9bTeAKeW5Uuia8oSeND800t95OQxHfwg/RpwxbJ6FXYu4ZuEa3j2TnH74cAOQMVDsgfuRouBbX4O9WXt6rXU0AgRdO8INw6IhLJtMyqFlGFRCSr7dLEqKn4BG/2oW0UWnW8S2MFg/fp9hGs4MPk8NilHu7s9gt8dNMQ0bbrHLMwCp2yrbA5+x2iCm+qmWyIuPHLfq4WhYX0H190ve+G1F31iJY2tMpIoggjabuicOtT2sLq8FGsyvSMkH9WxVyVZtZzFzs4DeZ4IZQrhVW6BvYUvMEw9xdqdB6bpdOuW2Br7t2DvTVtMqa6h980wDMb2ERAQk9z9qzOb9zpHPsszUbJ3+Ku3FDbs3YHOCzIJTVrBmhTbulG2yG2VwM4FHypTnUyDEZNywQGkEtl7p3LU8s9N32W1m2rLxXR60mBomfCuel4jUaW5W9rQp8Qo3lYzrtVw0I/hljida+yczjxmQ9y6KVnPDnE9KP2GD8QGCj5cBmLjnQmxkOqGBCmwmgvcEfghobywgXDISdzJnJfOSHKIIl8QGiu7F0GuNopO4v18DVs9wNGFjdp3Lo24vnjMi2NHMz8B8h9URjAuR9yLGLsDyAPRJ71IZ2Ear78UHkU/cUyFvpLLmoDUxtJbiKQhNSTsLQZCLBZnZQGTxGA0zN1R4gXH5cTwlsl1rCPbSi8tiFGoEtHnoakGvAu14UNjWFp4CtWZbd7zbwGuvhERmrizuxfMOjke4SCGow/FVkv4tXcmPFTA4+3ZCR0IuND7nqSAGyXgYkr0TQMQVp/9HlNX6zZPvaEtlA4Vq0jxNMNWh9fKQMS0nFpf5c/10bm4D4aguxjS6ZaXm5lkhpPlwy3G6eQ4tyAmsrI70hlfgL7ctAgDuhvSRUKqFTRI4PyiY6tg+3iVrlDCn3qf9jWIRjSWsxYEoOg6zIika647fThK6IoMCulvkoRpJLm3rzrKG4JjJJKJMwl2SdbXlIFv1eOxaeGN9iN5/KC4qUpwaDj3QP7SuD66EQt0AWIFfYpRT/oh8XGmWht9VnlPRO97N7EmNyXrHWrWV3g0JpDuWtFa/Y8MWYlYvg1Q2SX2OAAlHMO2mMAWfABZXTPCBoCc2nEowylA+ctdVHuBZcsvrPPBfPzovbvn/0gLs9j/nZBjKtrdngZbeOT0spfZcbJVs9pUAeTw1AvUu1LTLXjRQ8cfU2JtU1Nq7DSdKj8kWeVl+HWuZhyY96+EtdIWqsmHew2iIEG/AeX0g9etOHrvCDdDi7VrQBLwRUa7v7TaC2qOzCL34duODQqsSlh4sfhwrH1PxDlmD9/kpbmtPN05aUrJt8e1SvHpeqcRbZopOwYKWt9i2JWo0reZxaXSFg0Nk+Fe9daFYBmzqGWgelp0YVlJHUqmypnSG7RpkGYUw3jU1tTck01p9cgBIrmH3Whxk6zOiV+CX/xUCfpY7QbbNgSjEGNOkkxKC7tIY8tpFUZNShx2lnZdgRStqw0BANhq6d/gb+xnAYPVxHeT/g+bt6/RxPlSSpC5cxcOJ79ddQjSUz+qifKt3zutjMWchs9vFu+1deBbNJrtRZ68Nkp/8L3Eqy0PicEmxHcJ/PVCpekixraX0VWRsFG6IM1IERMxb7dBpZLShLYCocxMoNALDhtGaI843KPP7TIxDQWymf0kwGcgVdLhq6eAcOPto4YflbqeyyMf5dGZpZa+FhBEIkyjtPNZjiH4VDVT+fA0JQdQkoBipkJ6cJfAt4p2wCHoE6clnfvBGB3XRlhAkwhp4B8rH7sHVi+7NTMLfWsdjvVg5cxihYWIqenNaTs71mIQwGME0Kk/PyuVz8FVOJhwsMBcmqGtbNQsMPmn00R6yOrQ8Bv6sxFmgMOaHtA3aWIIN5wk1izjrzA4X6Xgl2VdSoudtZpq7kZrqzs5TCIkbAAAAAIrM0MnWUw6CAAHqigGZwQGJdkRgscRn+wIAAAAABFla' WHERE catalog = 'SP-70040' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4ICZYF1dAEABDnbKHEBnwhuNh/CLvm33bEVdN4wi3z8WyqKuBSupwOvxJhzTNuHofroPh1rRpvvrbGK8lr/5zVUmdCeiOckEswCGFiK0oisNpQEiVjeFOmWj6KrzWKin9wcda2r04XJwNCO60/+Emnl7jmbN6d/SqgOov39ZEaQ/CqoqMHM8Zz+bzgydjANa/MITAE8dGKzgIH8vYMk+TmftZp3k3XfFvHqvuYhxWbqAC1mCTnmO0VAMggGmQq6x9ZbTTkt7gSS4Etk1s+nAuR0UBg6+PvSpQgEbCpJWz/A9OUgp1iZ9CBL4Ll4+HPao0pvWhcrcvGvwUDnZqhBdflcrIoqM489lY9FbMLzy+aX5Vwy565Cl1GNTbdsgzCfXzCUVtF+DX2S/HyI2UXTa3FzrHE2MMGUbkvuujqj5MSicEUrdyV33NYSHyPRerknATeWeVKEBOfQqcowihl720RQIE+qnnolHP/avgmRPeHU/u3nLhxvham9TB7RET6kTKWSVzflCiFgeOAdfMnc0phIDv8HvcUXmYY7N2T3MERweyiD9MxrhxVPF39XcCkfa1n0v4ah4c/AN+CWUB5u1hXHPj8XcSH8roia9MJjeD7ubBJIWUInuZTxsDtyqKmPIEa1CQvq3y4sDphA4DEPqiTqFXdSahj9SQ8sIR+Vs44dlbBMiTNDUybX5fEMR2vMzkwY5iwRRoeD8EseNwM+Z0G8Z1Oe22jEEDaoPQIUlabiiciyz8G5XiPK2UakDGUQ5uSn4/J5F6qlaIrhY5iXVAKKFZ3D53kh2nQVXSxAVcDuY50KZ8mV6+7Vi0bPLDAeUcktyp73IiQwVc16s/VL7IRLmQTNZ3o2pwx5n3hr7iIGacKYcEzOcAxWFKeDZZHyZ9iEe+kvr5bjuvLU02NQRXBY3DvZCOIhX/bFPIanP3o4t1uZmj/i2jungTGyXZF0CV8l6iUfjOlEc54UFVyRoFGvgwoOgjkJJGv5WDG57SKpZlQJFrZxtf9feLlJUlWCy2LD83usxIVRL7uUogUDj8kI3SxWhjH+s8I/gaFUzLfh0VVkMe4QqJlwBb8j8ogmP5mu8yWbdzQJoifg+72qaexQXOEkdRLvXv7W/f8yuQkTBuUMix6Gb6toCQ2e52ThzPhu9pXYHjLwg9iSineQJSVzQyuAnlv2c/vGY++Ee4yOxKH0d9WF0VkzkNVzwPzGKEMYOHHSuOhBVrZ55XDRoUVxV5MjqiQQ2reLKKyf5NnprE9w8BVzwnSQx0uHONptopxIU4mugfsUzVZozJaQufX35z3NoXEeuLaK/Mmmgfw8j0+0Sezy+9Bbk47Yljb5357tyKVQsAAQAIzRd86C4JmHK/3uUnKCwTMXLu+bzmikPfDDyWPeexWQUOqq4oKdm4IJN6LkWTp7fgV7PoosnG9ZBQZ7skTff5vSZHQ0lHrKGq/GbxbX2eJGYvld8yfQ/tW0MX/0f4vY41hm8TMMfKVv6fdZmEAhetAWotLHL5edquVlJ61ZQm4ZAa+W5MDYUuwxeAuo+Tb5WoEBA6oBj3hkzzncr9NV5A50ERSSII7dXuA4OazgHU1PVI3aARwA+6kf8x90qfs1cXN4jMnL3mdv/EN+jRCw/qVqTRlBtzCQR1JlO69pHOTAecrkDI9h8XBx9U6slxNCctqRO49eyWqBnbrVY9XBuVBZzaTXsW5F/6yrE9kFwxDM7I+WUn47zJyhQpXOWoufRO6l1ichbXoYG5FOQnjx3jOR4I6CMkTzTZkVDeqzGaucGinHsAr0uO8qJ61Nue4EbM16u9TD7irmHnNbAxcNGUadjWcPFpLdszKlmTnjIipoJwFE0+yORdTF1y9Kfj/EBd5M04l3DKbNxYgTjq9gwpCOVA47A3AJqrScMQlq6Cgvjt04phuX90DFqdyMzxaY52GYhRgateY8Zzn/LflCfTIsD9sTU6OAOC5chmU1OwPgvJJJAsB8n0lbvGO3+Z9yGOIRn8AS3CvHa3PfhSWV6VP41W+agwx0MmLBvldjuCGZaj7eWCrlAT65Om6MWJ1f4Z3tr7lAPwutLU1moU6nx9DH7oHKj+q3NNnEV0g8YlRvxbL1J1tnVn2dP59abIoQsuhvQBTuM9fp/S2weocatrqFg20IH4npwM70I7RaHEeN4iO3NBOO/8Dfc0V2q0XfrUB6gFPaLUmXHILICXnLprFMZI6gnK/iiiXSvpWDiVEg5CyHW/4Wve+BHhBS4UmCc6HfkZzNMibciBmnua0yI1wKdrCsyIPJ4TiRBc3isNL02SOQgnvBayl1iN96leazaBBA44DUcaCyVqI/RbALVebA/W6PbeT/5/m7LQ1pfMrFfsXUOSFmaAxM7A7B9kM98xQiBBpaoW6mFZeiixTl6k+lwd5HeN+9KRXYThpaTNhZuUGoaBvoZZqKiOXuJHU83jKAGNvCkg2pnOGAkpz+3bpPpM9HofFGBt9h8HvTvNeSbwMmv5tr/N+drgRhyfLJReDRAs9vBjDUVN7QrssxH6eLdZP6VMd8V5GF68UxouANFVRQY+GsG4wHWS+VzxL2U3fJaM1FKASAOkFN7L1juQ58EoMJ42t4WKMJDsBHpaP+ONQqpGDnHjjL4xL/uLiDRWGy4X6jNUjByLtvdv6peZGln0lZsfoRxf/UVqzjho9/OiiedCZnnUpzJcYhoGZi28zATZeOFknrBo0kljKM6VjTbeP0+zrLjXapEkVxoaup4RArEkezjtV1VR09O5bqUeFWT852RRSi83ICAOgDin6DpLuHOuN8Y2iz8uPQHqnBC5WyY+95IVeMJ2krzfGP3egqNZUfuEtef8sp/WdWIFnGnzwuTk66BoD+a6F13XOt3OySrvEg3aIxy1sG0oz/DsgnMnRmE8OwMhWXB0sYQSi6KJy/ha9/deITNo2XhTkFJURIY6FGPNdQndM26Y00ykpez2TjnU2TH0Mu3AT+r+CWn8fEOGWPS2vmix8jMYPHnS222/T90kHJhPbW0gApeN8+wQNCHm5QB9FX/5GXcMa4d05D5txd+qb+qfJFM2dgixlx2ihH+fSInhBudy/Ta0Yz+AGNK5VhG9B+dQ7D+TXOTLK8C3BcIfvxCSV93pA3MU4ZZ76FBAxqlh+1y+5ba/zEqVN7QfGg4RB/KnKzftEQIKJyVn4I1PoZyE7mDgwfFBMb9yKzkpPeLM6e6aGbyZbmjf9TLOMwBmaeXbB4Iaft59AjjeNyLg7TKkXASZEjkUmCf1tDhlLTc2hAheTODqFN0QVKlrJYIEXSOcbryhScntlxidZUhOkRwcTFp/9Y6cbpNttPk5nEfwum/LgoJap3EZuzaYXxMg8MDYzanO1snNqHWkpkscDL+pnMKHhm57pYmsrZzjx5oYc9ualeMp9Z7RJO/GMuh1zURRVRL8M7pQ+XrtCUcPGq4WoAc/nzxh5HKyPrVkhCE5P/0iZPPOuziBQMy1yUZvc8OA3+d25XSznlqqYFKO0a9lRiVHk3KzTHoj5RQI7SnU2gf2Bp8liya45BxEHOFihIFyJifowNVjYs1iFTBbd8T0XJfUftthLhsZKO3Dq42USl9iih0ylSJQfaelRwosyEvVuxQDpyS4BvBlsovCsIoMzJQoDxlWsYfEd45DfTatqjBbtuHchJDbpKii+r4mG5R+FsSm2ahvRwyVAXtwzgdOx2GFLey4hdq7Hdmw4bkbZ3OfT5gE5LdbbH4c0bv2JS02ilfDS6ZAoUfEDDgh/ci+QbosE/RiKWnWnYeQq9PlZM4Be7USm2wLQgga461VLufLUU0mvLmkRY//CERyWJ1xg5j5s0FXL6xMaI1MxvBjMjtmzjOCtWEBN7hnyiB4KWCr5JSBU2Y5Ss0vSqAw92syS/iaYEcBlLMX487lWgCAFmX9JHQ2tZgBQbPLIMHapNC7qcbmJSevIiOeEmNyJ67EkF3sUUaiXPIZIcHMH+UDgzS0vjNNCWLbOlEHlLj9pgwqtGq/wYHDwNM+l36DN1kq8pOMrOydZPEwWun2Qe61gdtLZ4vHzErYbYtNA4iUpaQjpX/QlPvSGHWS9QcyiMu+ggzgOd9lAXBJkK5heEU8D7NxnCIj0uWZXxxzqXdpbfJD/HPUsYGiDpvSXoIenSn+IlcDkBvWGUWYgOuxlzETerM+XJ5lr/HWPvh+v5u0NPy3XBbVZUOSBGbTrMjtvZvbKfyNzCsnMmW2G4dQCN50GIyF/eRAi0BqXXn5sJG8u12BSZ/gzzWDVHOpj6w1BoFWuFaDU/X1Z8VmW26rINEP8WstfBHbl/UlQAiK+gAVRWZGIwQ1jJLT57XHWJhIpPZpdmUirbPLN9V0vXoK50aqYW4xhc8oQBqE3Ba+Zb3Oc08UVQGyiNxULi8C7B6shQ2cXbJjpwti1Qv/Opmas9Xo5MgNyIo9LwlcBOVv4sbm9+btA1kmA9d56p8C8WR4Ezoi4lkp8AH3fsXCSFBZSyRzDq0l/V67vzG+3F9ScXnPKfTW7vhsI7xuz0hO5xNok0ZuddkMMJK7+u9pfoAcaxgCDMCt4ZelseJszWaBqthzBFvldDsd2If7X8QG2ZrclMpp15L5AkLlfBGVtyfanVsBNzN42xrPVe5pCJ5nx2k7Ko9Frtdfv9ZuB+bGq6qbNtLcsPQTXulqjV/o2XsFz2QFYqOjXcKMIn6AaoLxw+a5naxTC/DRb+NFIHOv14zPyOvYkerN4PWAlObLAKK5w6Pvr9aTVHBuoiBUgxXBHqWdFJRKWVnEbaYZxu4Ws1AyVOTVkO7kqC/iNePS46z45C49dpHSBokBRs8v2JGTBE1E6P4RB4vz9i/3S6AhVSsPJhU/gh2GbQDCTccV/W011Zd+S8W2TkRqGyUTYJQRKhtkuwhgS10zBaU12E4m6xUyMX7lq4eVu7not0Wa/KBp+TdKkkuUxVl4RLsXtKxJuqbNNppvGZLw0rOjCQM3sMiECljqTgzVCsUjt1RjpAYQY2qH4sXJP/Q5JNUTEHYcZ2R7+qV3VDLTh3SQzFiSKaoXeO6sl0TYgVqMSqcN1CAww6sAJ7QCyjJeJWDm+D14htT7v4Zr7jSVUnhH/lnklztNtxDpY8FomTJmZgWyyzF2Ks0Y4nhUifxRm2OEeIp2pHc4Di6r/u0Om4FYk3QxgWgUUDdsg7wBaiWG24cVmJA2kUqHCcPmN7UWyMtHAZnn0AV/hywwowF+6G901fG5Y3Blqmu8JJjv4NYmsIQchR7WSURw8LfO/jvQqsb87UNfVTDn1ncdavWV/PgARo3Pk7ULYPo9UKtImpka9ABqN6sv9uzvXMHVUY4p45umJBO01gq2g8g6xo1tVTnQ0ScR2psqxGu0lyQCTxVk3IzPT2L9dxOOG/96YJBe1p+/LsgCM9e5WgpupU0imS3onyoFicn0T12tU2DQUEw4wKFB4tbku5oTMqtgIBhyc/K5aFkhqBVwAl6PfM618N+KEi8CKpnPD82r6HM/eG+XrVd81xpOVACK+/wqbRMm2V7cggYPEhJ6i0faoNrObVz5djMjo7E6VUTJFEYB2JRLplg5Pngnot+OiBpC7fkgbwADQi5yghnas1XIsqxGaIi+EAWXd+vZX1rnFLhdH71f7M0B2+qMQCsKVmHFFbgK+6Acs6+K0Y+64DSsE8YKDRK1S/10yZWFwVJR32JScvBFzInwclyAsujQE0ZZ2itgFLtOf/Y7tRvKSCeslcZ6yCTUjCeB3pcEZtqMymB/jHCLLwG4iB4WcXrloYn7R7bhCxnbw9u1PenkuW43PMxOQWEqqCYg4r6LuJqG3cfTUXrWHd+N4Qyw7Takuu87hGD5CaDIMGTUFEHJWQkaM+6+H59CvoPuIUA/sR49NDT+CPYeOGBIYdPm6eDcqViRQKJKgwQRJmqqjuwCjJEmi6/Cj8Lv7jMifog9DuZGjONljqWVVT0d5ro6OAuIj1eX6y6lTPzS1lPkTUH1VDBRVMPLbEH++6rYlf9Mu2Z5TtpeOAe6BuM6k5M6tMNS0Tsw9a4Jlmiphy0VvqPLJI8KRywGdSqtGGAF1FBRijVSQHYYoNjjujMHh6y7Ty5tIqNKEv7n7N4GCCKeyEcoNU3dtJe2TH1SfsukLxdtnXHrKLwYHNErjRq9xX4BXiIABpbYXeHWhcg9q+oNVE178IiB45B+nZ/sMLwGi+ecofJNYaN4QfCJuAKQEWFYLx1lA78aHO9suRgTI367ujcRVrYf0tHbnNoaucIW2GFeS92EbWc/UBDYxy4Z7Hvt9y5QA9fsvGAs+rz0w6WgQwKdS0WnOXJK1DtQCN4+GToygEjfGXjs+NEESCJYr93SgupzRf/VYFQAVA4FYm+6U9knqc06CdkUX0qR9yeU6oCEjP/JQL47jBcE2dSZvxoLVAaF/ZLD2KZIvqk+5mtCLEKlG6BoPlaIsptL+uw/27Xse201M6UgzkmDUHJDV3Fh6/CMXcEUND1qQmkQLOvsSQKIdqTi2HmhEYGpvmO7A69M0tM2Rj34gciz6LvFHK7bLazO0LUGNiuKwDlEEs4cqYwxqnfEvEcGcVGGk9YZTHaPqWZF/NZjOQExEfTovTnyVZ49NZKX5foa71IqfCsopto9gTsy2TwaQOQ/Uv5yRGw4i0R/Cqf0vnj/VDt4nkVnptQ2RvQKyKgeTldjplfpDo8htZs1QYeIpHP6UQgwXnZ5I4xV4++GmU5cqEbJD0UO+9laJ5L1pNa7x/qpEnH+I7kHosE8D177zeyRFJrtxvaSCm+YQagSCXAED8cjmEkAdtdGKZFcUrFuwnjt0SgHAeCwAPtO29Q3SBDOy+cX3CCARRBPLwPWUA5SyLG6qYUPWbn0XnVBRB8OlrvwpvY4cxzzxhmemWxCk50JXdptR7NKD+jpqfeOItcDkT1XqCXQip8AT2tiNbPkcJPjhgZ61KajfV8xLUTgq5PdKZSpZxkCnEgz8PVwFhgHpHk4wlWiOUKODHzaHhzz6sfynbO3u1N9XgBMp0XvC+JwUM/+nifkJKmpkiqHEa10Px3JTdh6QuwpXhgWpiZ+DcKd6tabCypcvEKCVvuoZGcQpUMY9pz+ZsRwPyKFxiOaOPPcaSxZealeIcafZ417YeytKdW5Yqxzu5/3dsvg/OwlX3Hw77UQrbODRNixJyHk4g0bw7IOy56e4LnZ8EXWyVxvUyb1lprLPmn3pnbYUNevrD6FPqjejj9r56OM7T1i1hVD+kRY+D7FBfL+PrRMgXLvGQg6KyNb8m4KGxAxcdqud9nqZXswL//BRtR2pnuls6EES9TY9Flo+AAeNhrDsFRGHN81TDjnynDiQw2T8LGe8NZHV0nqxuaA6drhYUIk5YwuzstVjYsUJYp9RhzwckEbF5vNKmSXi0O5tW5ErXs1EnYmknaTQZsKpV2xucOeC/lvUVHL5Rq2g2SlCQ6d562iGXucazXg7mJbMT5PnAtHyXT+B42zDlp0mzS0NRYTR4s27kJUSv/hCHDLKCWmyuTrgXwkT+Myhh5Pos/J+kZY3uBApThw+9gFr6dVdKOdv+5An1RGNB1XIBoHP6dhuX1nqYQoO3Trmb7Oknp9mWCX+t4K4wFfh3++qxkbiDVzRMhjZnvqs+ggFvR9QZJSiWJY58c0tEMPeTUi1So1dUSKCGiEluRxkMruLM77uBIkxXImCHjzFSPZhfTPe1T8c3aX3ybCjA6cpPNhkbfT3xnN6efdWdyPZ5gBlmsDu58BG+7M0LKcoKfvU/1ZirqQQrw5I7tSH7b22xLUXwmlieCoBBn3xGoa1bCZPRXxwOPrr+XwnZPEBvZAaazuP2JV/esQ+zpr6tqDJjger2jRsjz4xXRR6+vzzr/X2lTvzakLO1p3tKywlI9gn0WyG8HgvKy0AYUwMQgDgDMIbq43VZ9AgZx2vdndxR7nVR9nFkVbbGypX6a7RRfimEdghoACcbId3Mg55eNUnd0esGvHQDCz7JUuR8hlMuU9FWHg3i6FzDsnAKg1MJ5ywvX/6kZEkXMfdenh5STKNGN3pStO/2FoxTtQBx/2YD5Tao6D+dFsUE+xRyGeIOqNyQdPOjzJazjctHhJfnzSdtd21oLvPHV1pNFPHOTGHbWyk5ffTKAXg5ADeGnhtvJMTLS2jXLnkeQdWclH9/y1dA+d1lvhYpcogy5gWFIhAnwUNNULxylFON71ZGwPctXqMLtjc7sSoitCUJMq6Qg3m9Mo19XkmFcRuSg+DVFiNwtX/RfWKKU5PspDHtFT3MubHrFGYoquZpi4vB5Uswz93FEk3YwY/ZmOkBb+gn5lMcho9o/85F7MLVA96VbL+39cOZJNJKLgHiaQy5iQmonNotWEGEUezJJr2I2Bb94hF0Nu7NO9r7449adVYC7OXDnmKi/OPCGCNpBzegbwippMZ/9sTwYnJesiO3mbp6qhZ4lGQ8yYaBIguz4eMKedVmR7k1u/DpTShyLN9vvs/8D6s7RdyVfB5sgaWXi04x1wImr0gAD8bs4nfxDGmYNxJK2W29/lSAaXCUHMDmYsmkh9rXMsuvAoRPtlkQ63gtW9ACc+6F+9oBYxYsIJAbNvW0Kz9d5E7QwTr6kbKOQgMCGoDQXwKroau2hxLX0gBndHeZxKlM7c6r6h7jyQBEHHHAst+bDMpOXIKT03ihu+j7pcm0EJH3CF7hB9L4CwKQKmdVpKzkEuB1OUqGKU7Awtta0BwFIwZJnTYGCl0gI0uogQdAs4hCQAuyGk+5dFMvQV7biSIbiR39LorQvbiGqhAQxs1qsT027XMnMuiYUusBEuxzUSg1b6coYmCrmA/wJn3GB+pp6ngylEZonoFvlxwxtI9BTiQpuCShVk8cgAGGtR1pRMy9+gOkgxG2AscvFGNPlDLzK+IehYjTG2cOoWg5z6PhdsVTEFtUyYxCyGgJq7xkONfTNMLQzaIcp26c8Am+0DZ21SHpGitIgqIqDq0nWksR2EmAC0mRukIvVxmA67P1iXJxQ547dWcZgrsnBEcsSIbeIEGuXntRUQUCia+vNFQVeHuH4IjVOM5AI6/EKmkbcBivQXz92T1ZACgvB43Oo97A432JvsWr1F6SJTlMNxWo+S/PwL7rvrUDBQAK29cQVyqsULXjugp9aVHK92CcuNwFu09cOVenFSO9HzIDo5658IzoVsz64/M+ARgEAVW1KX96ruteNgYd911Fh0mmE8lZeoeLXOCEwQcAcFrJguXnItn+jBPHqTSK2mGouKvmI2oe/TgQfsFKoBslO12VmeXyG6cu+JoRIN8sxWs9O/YAEVvv6vPY0LzGC1q/LJkD/+iz6uQwiMNZVv+LMVRieK0zThRSzDHwOSLlQET8AmjhYvj/FrByOBEh6mq21+CECA4bm6q2S7UQyr4w9nFOWOxOg2bzJ3krOYKapV9l0yewkzYd0T5SdIrCUpGtkxcl1Xt435YNRC2505lyhqar5fJgQGXL54Ak6WgG1GBAjCPxslxC8QmSXlCppKWmT0ff7YgfJcz0ElPCSfhBIsmxPVaom6zu9jZLvB3+LuG2KgGxmzNdzHe4/j26+UYDqzZIqJ3zzGiasx1w8UnDV+36b1ZwgFTnrAqIyR58Fr7Ua+sJeO1Idwpj2g1zN87FyYT6JUmjBqwClBMCO9gJ6gzogOk9GxoT7m+0XohGMPJmbatTo5dTQZBgFUOvDLpjpJ2Y+vWU+LM32JF6rOEZGW8/N1Nzr8F82bTuOiCCh821LTZPh3ZN15i7amzxJXEgakU7qJ+cOP3sjppRN3occr40a66ak0BC7uGJnhVlqb6sbCimp47n7euJKQYcXcKsyRQOiCHlmb6fmEg2/nRyQy/1JN/WqRE7Qq8Nx/BwZRz9nEGEQG0Xwl7UFneWIrlaCu+gVaaRJhuQTIWi8bza96BwW+3Js7Xx6dg0tgCzV/G2oQ5VAxNndhp3Aqx4w9wrsENl43eN2ccigeLpQ5p1isyo+XNUJQjHg1XrYbM7idpwxsU/A/m9phKnMbLNRsf/Ji501v3qC/fvgQkl44RPc1vNODymon9HVNYFJmUdDimtpRC/+4o3xBrLHhaJnTYpwM7Fj0QU7NI70wTjH0cTkbSmg7P83GHjhMm9mvuJSarG9HXziq1ZSEC/rdG0HYilYwUzAQ0mnqWqwfQgIReyL5ZsUAiPOlZXJdNVnix3i7cfdWwilPy2d0Jh5jozORyKHajFce5z/rNIvyH5yZx5Zatga2PIqLG3lSTIreOfEWW//JVXnNFfM3EECt1H3Upvq+HTiFwY+K/YGZLdPH15UM5a13rr4p049ZbFQ9fuRuzQVL7FMqKAHA6ellFFkbDeGiT7j4By+VUHiAjh73zjWK6STmbvv5oQomI1R0wRJ1qRaL2FKgNHdt6Jmx2/C4gHnhYC3Otq7InFzaefya/Qmw0DhUYx+xg/6jNfw+7tPO0Edq3tm31fwcoPR2VL3zmGqfuP3zoGuI0HnnJEMfQ6UshiSCaS/Fak3b6lv3lLbBcc8TaysegFL10LpRNXO4EKICkjBsob1Bp9HoLGjS2/MX+2O06DcNJsBpkjIpLVFaGH8P5ePKncnHUpvmAd3XsuZgrEIGzMBKgjASNAtNR2CT0wwyx5wGII2nenwE/x6HuMO7wmP1l5BqBtV0Fpu4gE+2n5b18tA33AzCpec7wOvgMY4tp8Ei5c9ad5oGX0w+BocwNit8U9GiqJ6/JsCwIhDlM/jhHp5mXV+LD6mdiaF/BjkcQlCa6RRg08Uf73NosLNHiUdFL13HbCujae8vtNpk2bgmq0wsyCWrfbiSsnlRk7c59eGOBIIySUzkadx4TILde8l168NY01CmvCjc4S/mnMEcWeUozZPPl6fzMJLJ+58HOhZ00hVQxph9FVQ2FBVzcFeCEakzsqgkbCFEY9wwOjLswklgqJiy/8qz605OKY3lta3ZbA9J/46dQLcmlO4vlsHjVs8z4TUQyasYXyAhZSytyh35XE1kVoKjNqsl0UUVIs6fg50sVV79obMdp4bSrqsgTr+wDGEqS27ySb9is/ls5zNF1+iajKD0aUBuhmapxd7wzwy6akERPkTO/eTRCwNhJKFjppb7ES2TPSOZZYFvOHvCEvOG6Ou1mgHkcm82OVnDPpetRcUNH68fghwDI0bK1UBkRgpwxHMoqVqE7+VxOqt2SX68pMowQIyWM6ZOMuE4v97nee8H3hcuLMqDO72yAytFKmMq94a6R5d74UCjVcZJJ7ZDTSqRJS9fg7I/OYoW45TmgwfhYyeCGZZuGP6OklRty48c3snuvhQm86tj7u3z/nyfyG6fuec+9DQ5Jhq9HVfcfgYT462DdfxmbSgwZov04Ar05G7KG2MEEWf9CaevWu9NPMwr/6yK5ybeAcT4M9bgWN6hvtdoyvMrPww7QO1Fwgfp1NI0RdwI1E/fDweFeI1SiLbi4iVp0OUF5bPAThjRKARWvxzB6yHANx9kB/5r0GJfrq/cuUlpPSGhKBao/ZTVlZ1eNtB2u7Q8eWtu+93MSP3v5h8ei+XVSB+YC/8coHdHZEr3spYUlscE1jl/BKDs5/j/J8NWVOttd3fDMREYStqXzF8d+Qu5kYfD7Wcfjiv/nCNznxsnvBDOjTiiEot9MLDzrbJEB9rbJNg5Yyp0d5PHsYnx0GYD49cuZkGqyzz76VnloHHfaxnZ6brLho/tW9YzUzwVrAlqEZUyXj93DGAZBx8yRTVhr7XX/AQl+7+zsZuGNHDubxuK0RTTI8e31SBSt8XDoZtqGmBnrP1/tj5U8+TWI3W+GuMpWQYp5iSNKqbQTeHh/Pr7Rchzr627ZhqJHvmnDE6DaIdpF7GgFl7Z2JtiOygv1ag8y3MUgY0CXz+zZJMTg+ToidlWa34Si50JTtrYuh5IT0Wx2U1QAgzK1PzLMXA1Rnv7NU1/kHiNUqcc68z8ILf/sQiL815vsGR+utbEAasB03jMMgfPPjEJgmaANxVfIBjg8JYyf0los+oYQVypDUczJCtDrhmDzbeRq2yzRWxmzZIMougj9nVQAQxKjAvdHhA1SXxeNb/JmD7alxi4IyxSzHwQBI3J1JuI3KcpkuNFXANrQ4bINIjCytukHbWJgCyE7WnqAvu8QmDiSM+u0EuClvubwPck6p9lEtnhnwsWZi2ChbphGrocBDZCuD3TYBwqh1GuPDyVW/2thtUnThCx3vJhNOCTOZubH/elF5k2F8lCzxNsHc42Tu23LQ6Fo2Ma2JzqHomh429yLO+QdxRBvSp1zkdLs1Qb+zwMnTW82ewmL1j05Yu9VN/+ABvBohRpMPDYZxE8c8xV4greHt3TwSr8+Jk+yY4t8PQvyp+biqK06/JbmXtqp79pc86qE8kyndVSu3lsitGqsjaMW24vOPtQ+iZZAWQ9Y8SRA8RviwhmSgDqXVpi0wp/ABN83HLA8HwATUEDiupZN00rdtgJknBjfi3QDoxASLUArnTL5VY5xih/Jh6pBlzMYabYZ2/gnq3JsPqHmW0vZEzfOrM2ixtJXBGMIZMTEr/naXwZuSHiPGUfvGam2h93Q7xqdtlLBa9/z4Q+NCudMxhRGXOAGdq93dmShWQIc3TBksWz+yqDNqkCpx3z1gc30k1Av4w2YC9Rja7Ine0KCz5CrnqAo5PAoM5Z8J8Le7ILEEmeUHJQiy6BVY98AHVNAbceCSqpIdXpvFVxxF8xSr5Q80xkFEqAn0jdn7kWFQDNdAC2I6XzDCsOo8KIeRH7FrpM+7f4Ci69K8deP/d+GiL9RDEOCRrF9zQPvCB91K8WjGAWtLvzjospX2Ke7GHaUd1EAJLMXPO/e+4i0IN5wrCp+V1VgLeoiDw58D7NBk8WcxrWNzIfGGqLBkjpWPSWFyzRbar9bqabgsGWtvekVwsCyWPUo+smTQSRmUmfkNBcStceZFMEDnGlvp9MXha24Ajw7F/rbV/wjUi30ebr9UkQKWG4mLSO6WOcXbxQ5WzzKW6JRNn3x6Wa5t4CeSt7rziQj+1tqT1bw72AZc5r1gzfb6tc3Lr84gWbUZ56kJ8rBHUQEJeQH7m83E9r2AvahTnLggdDTnNW1AQzCHry/aypXOjEEZ9itiLEvCND7klGfTUsN3sUJsbMGJM4VBsPHGEmsQoQVqN4sY7+qzlw18CRS6yDocp/DMpxoZEfqCRH19TWsckVc2ktlR7KanCOfD4QB+3F6JzlkUYRWIQJfyyYYIji+6al5uLV4kH4lBY1OK/3tLJTX8EYSzj16Mun7sHhMrvG3uDdx7WTTBJe3CABluSVRM/LzaoR9SrfoPKPJb2yWD7jfA5EvwwcLiTHlKfDLbDGHPMLvXI4yeII2DyaiYfanZu6QKLhldvKcW5bndb5IGb+Gd/tdYTK+7hyJEKzPdklQkxojQiXB+cqCrj8qqo400KBwB+huFtQObnfiXFOGXZ4hbCTLMhW1RcHk/nrGBN7zOxYB8D79T81pqDB6nwR+ZaY7c+FFhoKP0Cl8Cb76CFMNQeM0WavJXLqtEqEeBhOnWOyZXwXEoVHrnPO+N3zDgKd1DtKLtbVXBDyElZXdIVXo6wt19B6y1v/m19255n3MmdopNv6RE8CN2Q9eZWS+RfdBcSvKhuySTo6N5tod34p/3V/0v24QX239wYI/p3IrMOnh8TW3QxucGe+IJO9fNcqVFKvfHh4hb/kT6ysltxIruOOSc68wAsHe517fNvXRaDqBdok5U/7Uy4iiFwV5+xaUwDbWGaMO5CJuthqBegXy0Wh2YAOxLCN8wgpihLntEP48VkT/hh+pBjeuw/EXySPuvbj5KnsSXHjEifENPy0SWehYel70abdpFGr52PDVX0Xp0J67HaX6sPAKmPJWA/mwhM0pRfaXvxFvG7VeNOFu3U1BJLlINHf8ZbOakbRFUaglcdHhj8DpoigZIY3clRl+r9qHCpZF99JFiUmKcEHKaUxhUVraW58f9pxP4dlfo1yrKT9qtJyRSyPj6sNyq9wf3YsAYmBT5MbRV7jWuDKW2ovjoFk+C5brO9WnpryQJSHq79NpQPsC0xlJAaCkN8sqIuglqedLSZAgl5CM8+khFwEFUH0Zf4yPJS0/jb/ttodrVcJrKiH90zL8ndOwz0HKN6kMQiOKcUYtm4IZTgA9uRVS+PIYPSJvBKSxwwsBp0yC0bFytTqiCjBAUlkdeTqUdqcBHRQ873vUhFADwTRblzqWeg2k5W42qHYkoLp0o2czGQ3zdIPzdNZ5ILqKeKnK7MnJje43SO2fuGSsxsAYE7rg6JllUXfZLcUMUecUPDkFf03+vIq2SEodgmgMIRvIyzU6ZuE883zgKOLLX1MvaNCJEHq3rTqZ/5jQvqBKo6uf94aXktOQkzS9l1ezQd047zW5aJI5w6whLhhVMXyjKyS8XLExbdBX40vlPbpRynmzh6+9qbzNXjxrQE4+ZsZHzKY/d8ZB+ZbDy+fhslj8Gt7k+qMGvbnyJiITo9HJoP453wj38gD/SNlkDNeYGeS4uF1BU1ZwM3wbrpjgx1dz3WDbDu/QhF3CPEFFL0W2DNRLT67K07wLmFWgJ+DmYmPgWkR8HzBXnMSyHiSjLrGEUFlzbhfUIkM2fQjAkRmWW4nc3TRyuHaG2jx/L2ptyZBLbr5YtQzjYKcyOWuOV0yzPalbQp1oq5OvQse5RgYw20YhBFHIOMP+PYaOxJTaTpti5lHu23jPFRvcv0ktuUPW26I1v2equzUaOAVj7XAiPu9e4D3wTxvzme16IWZVI1JsvfYUUtw/ZDvV2hBbN+hnpxxSE1pEc1cqV+wPXL10701RKNkfDQsDgHH/zNlC+p4QKclQiXLQXcyY50ZNaEnzSiaLnK9emH3L+5az2P+UqCO3LVJF6GRGInIMkIiSAn+hd2r3nZWYWAHNI8RhrC+DHu586cWBdELSLQOaD7K5hpbDVjuz+R/zpOXV7tBUGfqwTKUMiRFLqFi/34YW0RnpY8JFGxzReKbwRJZ2SP/Bg740QCaJRFgTfD3DjMmemQZ8ExRqPbZsXj9+TAmCpxWVzOUFdZqu7eLenURUdfdYnbpU53PgZu7InMLuDE3sThH+NmhykjDYT6C0uS2Kf3h4yTfIOEkfLb4hX63as0PjkcggVZa6CqzdU7r5ik6Wfd3aqwNEFXEHzoqJnI8UYZdn/nWf8FSvwg68DpSfIwi/99oQr5mzaSSCk2RPGwrgQe9b9VUCufb57KgiQThFgVAS2DZD/oeFIwbFeziFrfjpx53DeBGTEj88FacT4jIjEKrIBuXXcte0M5o231xb9BSxdSDtYHuLueR8cGnCzlC5CdRoRdC4UqjXm9/BXmQEVU3k0AsrL7Dk8UVERDyxjPgy6k0Pa6s4BD6i3ZfvXbAmwShOWE4o1hU+EuzrbNyk2ShApaqU+4TNg26YBDABJplWm2F/hLmzobrYHLBxG9VtVLCIUdeLIcVCJOvp+Tm4wwU/lOmdirpAmkEaTp4r9YgjCQM6pSc0Oc8vpYcbflGfdgr55EeCUWiUAg66TC9YrZOfg+lsEu+sjjG4xoQNvE6InuipWsIesb/of/iokcOQvKsMJcDppSdQhg6AM68c0MINXSqGVpro2RYxHjzVnL2Mv/R6JOhMYkAexDskXMlsullRnKvy0kjLI2TJjTQrTMSmXo//+v+ElJzFMOT67nIziKiSL3+uyxcJASzZmWcGIOQO75q4UhMipaczmpbFrsAnBhPjE23/x9CbnAdcxugYoJn2uqJi+9CmZFI9RrC2QKxtxEugAl2xi29d+TrECnwslvFag1cCbapetyx2l6GYH+Y/kjxvYNMepZNeIFd2SmGPcMVPZX9qpVDTknut/R948XUTInLUSOvXGMoOJND0oiCBb7E+nG7VNDiDrc6EOAHVRGbvzs7sooCnf963rddbvhicsRXP4vkzRU8ZnS0LFInuIcb8B6waPZ9PFOk3D1kRTsqz8kRA2C855QZwlETacJAkUW5RDiLFkX9ukT6gMR+I/TConHJ6d/weFpGjew80BvnINsHk/pbuJPPmlluexJVIR7loBhQLprRiXSDGJubdGT7teyrwgbFZ3OzwRwkkNF/wqy6Ax73Scc7JEPs0VhAQTipaA+2QiJJZDea66/2cxNDJ71OEaWHvNH8AyxCC/lg48xguqFFDL8bqJ1Y5cCIKoJsSENwjJZ6ZLpcY4Q6Ij0u+L+BX/uI2gA/Yc23P2a3hlIQNG6gq7z44N9QMIjGOwEgf4If4RiUIM7wJ/D9AtK/RR0Lv/F95ntUhBHyzcOQ8J2KqWZmA2BH89SYAgiNMQPIbyZVAtErPc2zEUXcSNFkSUzVXatLDzQP0yAn1lejHNqWsDpK4WvNVHtIH4+LmodlecJPq6Ux1SPmPdq9Unb61w76DDQ2ZMtjyRxeeJFe13w4b2LJAgec9/Qm+7RdOT3lUpTVELJpsHdKyV/YH3DJPihqUd8lIddhpt7uz5mhkpF4NDthHteTMhsakaIrWi+4z31JTWqBeV2F9hTt0e73E/hS80uU51VDRPlPm2cetPWMcMDkpk2/RdLD2aT59mCSf4luHA7oxb94gfa3KTHMqCiwxTcFSUrd0ooE7TWIJnxxLFvCNtxFjHL5P+mJ/SK5wXofyfL5s0hQU5MI5J6Pze/khfz9CgkqcJXm+pceCJlP8GD6VMNFAFuIL7906DZ6cwupFewHcq3KrSro+48ZISFg4kFRpvIxzWsBlO6TU5x6xjtmiOi9zQKrMBQjTz3r8kJq6s5BnBMN7kIzl6NPzjEE6MNfSWOfuKVrCuaX8gIXiikpRKdeWheNjStSs67QzhQxyb+HbmJdidsMZwOgSwPa4QKYGboEv78HklImp+lE5f6mBx2/0WfR48lVAtueYWYPRIdPNszl74vI5Pymu/DQkEyjLt4M0DUkNMX9EYlJsX5cfx45q77bU+P5J70Adm6pEB4dye1PsUrjF3pidWwR1c70bi230xqXhHTrXV6kE2fQwBgeiHFawv+kToRnyTCg/WM6ORwUPQMBk/4cPAE5ZCXfX0LAHnA+BXWYjg7uMgWIKFuOX0B9ZVZJlBZgKfxu7ptZM/Cj3C7lX+DUt+0UFXq2yyoheyemzoZe9OZqluZWOwQfY+oCUNEmZ1weXyUSCEsK8VxhECjpTwTIGC1ND8PR+YaiXV9LS+bzkaPQt7+PxLQZOCvrBnFST6wqh5YQNG64ZQO9cqcTAGMNqqn8d4TyTmu8eMQTX/hbR1nforXI/VMshlsSEjUpx+vEYq0YIgD5fe/bfKTYozkdhJjEUB5X2V132gd1G4ORQAT7Cq4DAkpuPRO34u1IuoSIKKb9/VRoLingpBE0Qx2anS//2/A8JFGIWw4HvM2d/e8mq/9LJIsMSqiSUSEn0Cv5Wt8sun5ahFefld7dMHhKtwSXhj0VZ+owzp8Htd/8U5M41ajFsV43rdy9k4uY6Apk0UoBVlBsGF8cb2xWKWm0+3gI4Or3fN77jGeH8Aqh3LN+mYw/iy2AqeWLk+9p1rzqMNBWxvIBNTWDjU5RZBjIqMx7PbxRG7faGoI5X/WdEUp5WuCsK+Ldn4oVZ2Rxcg5/CnFH9qVQmgQzxUY53hijD60EZPlnBWetGzHvMG1hvYU1NOs5n5ftk9n033m2rnnOiReoJiLYxCP8d6g97DSgD8nujQxKaGIEFkLCeGuND94z98IR1gkyy2VEyYO8DhF8Amd6Fji1tekIDG6qg/ZM7WcNETP/G6sJqbHG4cGp3jToBmi/Jh9rkd2qm1jSHx+f0MyTfk8HYl66WSK2hqfBT2QLly1Zux/ySbyy7pmaLOCJwsZW5hYissF1NBXyVhfsfILGMZc2/Z1iPG1p9NqNqG6GrRDa0VCMbP/RpWrOA+EWpMBBd2auVaFJUb+5woJ4Vn365hCMVNh3HxvNeoNsSdtJ/MIGrBZdNP8OD9gdRD6jr4VBiy6rB8/ov9/045k/D+37ny5f4zJ96ofbKTp42e8ylLxrHmuBXzYt6UnEmEXLihBnJaKCl9quf3lpUJmBiTExhdR348SbiWG4pDGcgLea0O3olsPodY8j5xb3TbkjZ7VGqvhr0TE7N4SiNGaudE7c5dwpcpPEm5BXGPazpmbAy6KV9H+MQ0URV9siNQqYcBeakamLGXAFfIG3N3ruwxlUxFRSQXTmRV8rhzen+LS+mAGPloAaIY8ZsjiaOzW6mkFVvwC4UgLQKxnysbIqc6PxKIEc5NhQcq5LaTZ9ZuzxxnYqB7xseQfEfksRfx91RS+TvZODtdu/3BUNAFEy9xY48zV+zVwmxB7VrPjqlUsJ7t5FhdqP2xViGzHpdmGsEM78PpXau1hzB264a/SyosGQV7/T6X2mm+fDWKlYBu38rUpxqhQRFghdfWiSycsr1v4pwokxITJ7rr48agpDu7N7HYVAZ2nFnNXhEGqfcAJ8G6gRmZBfoAejWzPIO6Rf2z4wQ4gfxHQQ/5wSeTHWidndLj/CyLC/7OHoFjc5y+9pVPzFGMMKr1tTrGWMbOUKoCpfE6VyjZ7c7O1UsldW4gymDJSmV3xysPsDayjh60b9qbFoAirQGJHbToldIzswqGjeN59I2dypkMAWuPdORAnXWRVrBPgYLvvayTMl2mrgEPPomy80vKs4k4zrPB0YSUgCxonYQUl+ufROU6zzV/e6bx1ND0BNs5R5JOanPn5QPmU/GNPh5y+5s9xSWhY9Zj2hjoah7IZRlSB4+waL8R4pYaKTPKTE1kC704rTQ86a7DAhJp/l25KuYNdvXrF7GHXMDkwWlEIMQl9JHS/MIekzAdZDyDK0a6w3Sj5hFWIzybcclUzR7uM1BGF1FsDj9c32UXckdMV2ddacoCzJGIsVEYrk+v70iagYM8bgyfnF/UcmNZY8QNNxuxBbaT0UEUtyoiJiWya0zr9oZfSvPjkF5LQa2XL2u7sNNpbacOMwNBpqf/FkesqeeoqIZUuufoUTorvJM1rfpHS4+TaBaTYrf0VdUV2NWInkTSWAB7xw5JiJeLGciLA64do95cd+DeAIrhR2mmWMlQ3Tid1tLxP9ddu7DdrIpZoBXhQc5SpxTlQptJAnfAJNpkQ55AwLAlkmv6KHQZbgVkyRX2hST0hipuIwZOZDPN3fXbGpA0yWXwscV0DZzc8v92N0+oynxN2X9MKkr8L1dHM4WOTcus6B8QIAz+o4rqlMU+LrESrgABqbCia+3FBghiX2CFaTHJwp7ThHrdg77nLbJfkiSnTJAXm4vvwE04+CO8QFkrwtXGLwQSt7NS8iFaT0AK4gEuE+L39bEGcOCqrO699ouc2WfOIvApDPzMkwgqYOYpybYbQFrUUrBPEW9JGNLv5r3u8ycT3qiy0FZgoXdllnD3q9Q600gO++ZaYSXO//yX0OskYSFrkSvf4Ke7/0FoM2rqA/t8oIMQIRs44tHONqvFdimdRuDvgmspEDt8PyWg3UN1PoFj72pKchaD/MG1FzrESP2DdmrvIKMVcRgfTkZ9/cphk8ndPYH8WkdfczsXO/7GplUu4BhcPkCkOrsGYIp7ujISyHCeF7j0q21DFtBWwTMsJt/atSW2cpNV6Y71i1uPyYUvpKgh1yjo4BeCB808NZ4VmGsbxsTbYJ4L2K5Ky2pfWrizkT+J8Mpt9YyrMvVgyNv6ya2I6jT7LLo23FpDL3qRmey6y6iwyno9lDp2DBpxVuxvuvqq3E8/Zl5RpyCMp/5xOnnV0L68fxrNYxdryvMA86PY6WQAmXl5bqF0vg6977RxYNzlvmKyAd+W5ohh+P1OWEvN0CYaV+3IEIuyWEvxHWYYSDGzcpICTCxpObG2yjuT4q77Bre5GyouShdWPOzwn7gOQmYWvFmLx9Zyk4Qff7EOo0cHf3Ty3KjJcko8lMPdbWrWg++9FNevUdBpQ65hlyibTTXb9MC4+RiOdKi6AKqzq0AvBvGd3tWgC/OKJn774Y2JrDMF4+tj9e04AiSPCpUdLObWSVjK8445k+mzeaPx7OaWoEwMJ3mhX5DJgMqmIcsAGExFeam/fioNuxLDjbXvaucPSK4Ow+JLIDcO8LrLkID8yqZMyXx7xDWOPBWQTvzaxUig25SrEQY8XrjmNWQHToPFIWysi+6J3G0jnivMPLjyDdOaUTPzWd2AlUGl5cNKTroj/Xq88BSIkxYTBQ+XCNFCtk6Ck7mIiC0N7+58gFFGYkSeh4GYdAjeKJ3+Pxqq/XZUwe9lYVqD/4OyUeMlJTzmR2UsAx3T4R0sMe9eXLvB388LfaaZbSpuiI9glAKxtQ5jTEZK8NeJhhchYRFFYr0TC9+WusaFkCMf05zwF3Yxu4ZCCc1ELaTVyUyIS2OtG4tiOi0vJQfzYqfeHVuR9DQghbdiljk7da7V206ar0WP7iMqp5595RzBbuSJfScN87R+dNs4+ACzNZlLjgPoc3mp7GLp597l0Gjc7fVLUcp3eJTsg8Oz9qT9ez+N0eEK+9HzoMBntX9tlPzP4cLrUWV3UqT9naXAl2ATWGZMwe7dxuOR+7flpFDrBj6KT9+pV8+fz2f5xBidYpaUYT7il/W1eN7S9DlDKGDq3DxE1aVdFPO21VPsR+Q6iZyDfMp2QfZiBE7s7LLKcGpBIMl/ZVaHdgglKAWjoFJbjci/hxtgIHySBV2gOMDl5J2j1CMoMBS3VCGPXFS8PW7sM1w8O/g7+tlbHuDVibmb6wc9HY4qIV4x841UpU6n5hntBYD+v8G6Lq3XT6zTOXsB9/xY9ml1n/SHxHwbggyYJN6pTXQFVp7fm+K6Gyc3iBICGOclKqIZMmw0YyEHg0rdhF5h5cUWUbMyjER9IG14rPg12XjPE6gCmBYG/0lK5YpC22aeDJdlEwykOIGrQuC7IHJpwHEcE5AdU82RS6LYVmftm4JoYhs+gNchherGuVIES4rKFhi2xq9UijKqrTk4q6JHrdcHecXV5gINcVJ0zgHkqM0gv3FgxeRGzCHABurj2mBsoP+nrWPCu/fky1QzkfFRcYLGpRo58E1XY3U21oJq8UBShNEsf5v68nGVHs/ecxdKfm4upeX9GVPweo7K1qTStwdPBL3pnfYCZGR6VnO6oAhnBdhYb1l8LHTV46vcXrThg9WiStv2IcHcEzz19mZUhN1zBN6cJop5+wzR6cWI1mRAhyOTRToC0fg4csir5MrJ2bmK84ntvAHM9ZdwL2ytEcGGBRVFKuQdTnqKIP6OoCr1miCIhvMnHtHrwiUeYfXAGVTSjle/VXpQkv3XwslR8Bq9dL/bpSCJoN6GmRPvmhD0ikcdSO9dgQonvqncLCXgn4BmiNnDal7j9jiOd+I6ZYZNC4T2XO7P3uBUjiRNcYppA5cipd3X8UUMOtDVi1+WUofXf/0QY5mwxlAEivGnha3n6ker+p5KCCG5CugbA8PFp+L0jwIKtsRaLvDqLyhraAyxP+EQBS7VPXkFno/5rLPElUCC2pGea4xnsKZju24/2qXQqXecKZr4joUUCCzUSxUa7ED5XJE3qI4/RaAQKJ20XVbS94y68rSTJaESTE4jF00R6Rvw7muuZYdDXA9uhDxRr/Dv2ou44IC1MiWF8AsLyRfVe2IiGJbWbhacmszLX71XI4Nvap/3k7pp33Uon553N1ZXk63jcQes9Opar/T56tZupolDG53eivuTwOrtCvfXjsa/Ylzn9OOsQGCU/LsZQfTb+h8VqUB/5LzYVeh0LwEijLfVtMiU/pSSp46fWVd4fuolwWJtCz5a8dW9Midj2rGGXjD5rrM0v24UtgFRs84RSHSMw12Zf5RYzB5qTEWhkOGAu5KnZG94pmSYHwjPVZSeYH8rC7OhGNoEfHFC2zQ222jGzLCN8NVAQj/E3zc4ZmH/0WMj2aPtPHEep8MmPi8ETtHV6jmdGmxuiBhcx2QkwVrDafE+UTF842XXixTiasYMnZR2tTRvmrqtxbIzwnOtProEfEz9BGoTu5IDQvR4OH4VZAxxm3jjrDYb5wjv2ma+iWngCLkiz8gzVuqQOOIlsonb5EFKhH7PWCaw7Q1gdDAePDMbF6STJe12JnDVdI8hBm+NXHwdh8Q0vO3OZtNRsV1AWm2PLmjyG2aWuUlYrltwoUBLgdwyb8OdKBBCqeHa+gbyCUjht3JR9AAK9olmg6uiwM5c8PHN45hkdK660/PwP3HDmgAyfDhpby4mom58zgGpJdhBbuGi+x18aUt3JDba+Ix4mruNFakMR+yjKZ/PqfhivGTwz2AgvvdIG5XhnQ8D/PLjFo3lPChs+KVB+neCDzuuz49IZdHHI4FBbJQu92pkV6umicOQ4sOmhnXsZVpiAKhWgCwUEURnjsjJLxP3GNtFs8YkcSMerczsjM4tbjggpG00DTRyDa+TZJVaeaTYd32Aq7Y3VHE6AbDctQNfBm4kecBTh/wuqjRqxp++S1Q1d+CfRcBMFSEhYhzjNXPoydhT0LFL2l1hywfAGcJQ4QeLeJAtqcwc0AK9hBVIhYRr+0MBYMHPe9tp3PDgXQHzttcqEqHQUgglgFhCpS0uTr1ZfthgcnBAnYw4TfK7QM8K8vMolNw5yLJ2JPurxGhwUyekRrC1PGuldG8wlLWq027QLa6u8GuzBDnzQsxRn0NTghdx12duH0tZH44BR74Vlko8ov4tY5UquJM2x4CtjCxymnVLv1LCcTylR/gc0u2mf7mI4UBqXN8vjQegJK5ZtFl98BcqXLyj5KUJUfbjB4BRMxhAksTYKR/NxtkwtMYB4ExjsmgtoLuj1UF2tctfRqdYZPww066xgX4HCnvqfU4at9J46/RGqnBrkrRJupIit6t8OCR3vsLgcz1cY2djJO6Tx1Qmg7O/XPgkQlxHjIvCDZPdy3mt1DaUB93tTJXfuad7x+ssbcT9IaerDA08he6TscgzrdU0sgIZ5pSPvkDkgaVX/uoIXAc+Wb5JoCWB5B6JC+Zq+famrV6ylSXqftMP1OcoKDlLOXPfv4tlfSgT9Vv4V1Wu+Ndyr/X4VJaFXtVqkm7hfYjPE+gLgX6e40CxRQdpVDbJGYcYF/gjrrArjTWP5lFHQAYZWZQHCmcPSX5VET1teTVaxQeDXyXZcc0qrZvMCbGjPtEBvxuZZp85rX3okdGfI8gpVNVgMYxlHA2EDBYZoWjbUhBaTBvAdCDkjoCcVVkRIrIrk6PX/F7pbsv9f5bkqbWHy/zahHbINQ3W64pp096cHnxiYSAiiMOk/hKSEhblbwsggWLdTuUgHaJmogidX9Zq20iu7xSMz3tEDVZAWbhnVaEtrwORsk+BxWGzTcOu7WhnWHW4NlFhsdD33TvnxYk8hpjSYBWdDqawGBnwzOtf/3B0SM9OJ0T+lwIlB3IyXg+nLUvt1OAUAGDOijBqsutrkoupwVHfNyYscOKQ/j88FhU3rtmeQ3Vcu0eDYp5iLtNiBJVHb4EGJTv+hJnnSImlWwnv6PrBVprdP3lt0sGXJCJVV1u7r4uwvA4tstnyDUkqhCn/aJWoDF/ytVn3feS4aOvSo8wecMVtalJxXEmjl1cjpHqahNaqu5GU8XtEYPPUlxEY4JXMJhk/abvrEalNogrS8VM/mm0FbvvJ5p+v66mzzA2Gg6nhUmdC9R6mYlHm31OyrWm3sPcZ0ke6VG4RT7vJsEO5lMCwmfBzzpBBHjanbPdEt0GqXF2LdsMsQhwQtHs+SCaisHK1ppB8a1i7I9v9zQgeskU42r5mjYSGs/3n6+//+AUCaHdvEI3s/t5xQFUgdAutHTQ+xRuHId/yNY1siEGdl3/gMyI1tvOr8GmcTSS9xX623sFHkKHFBrfJ9Fx9rD1YNMC4qm4Y3fLmHnmEe8soJel7R1t6XB01rGQGT1QUeyR1OuKYGTSKvlgInVjZJAb2KdUC9qIi4SXKEEm6Ub2dydJx/LvLDUpSrp2xdPj5mrAsTvD2gzSN1weLKKhI+dP4CU/jln8Zze0lF5S0wPYjiArXzKK4P1jCPm7JRdnnc8YEXu78nQQt69RUotA6LE/x25Syt2BQOv8RMiO1schLr8cBaC3R2B5ZtjU2XC5GHKg1T4EeQ+JH/+h0Okkw76pycAp0O6tQ9gIley7adl03BL/cykKMW/OGgWNRgBsr7gVzpJ1pKCa9LKfSgv753E3MC3F/K/GfTkEStNPZXYaAr8NUcsuRvUFU0+Z/18XB/rCJ4aRtAO8vxIG0rgOQUtw8sKm8LQrvbSO8hplhnVoG+bfYLGRmv8Ic6uge+M2zPBd4aQZun0InKWg+YYEWk/3wbrSKEK+ptu49mGxT0b5OY1r/+eJiZtWbZcIox67gQ1fA1kwauqiLVXSH3K4mhFi00fpondX+PvUxZ2O/JECbIqLE+HrSa8g/xYNqVBct3B+qNNKOpw0qrXhv4qrgQF5KK4BoPdCIWxY3gN+QKQYxadT7At5iJPnrksdcp8ww5QQAHPJAsqzEo71r0ngiA58jQNljW8DyQFGWN60Zn8yv7zvJJoQ/s9Y62YcsBD1B7DHsVlbSwZbMEO8iKe4ygVVUllTkCzM2fyXMe/PpKVQ1fI5Qs80lv/EZy4n//7wzn05/FPn7kprVvSbnAWAVNQ+CwNJQO9ylFcEFkrz9iwEZ6bjMZwKL0CshbYMdQN/BvV2UTVa5kenxLdMlYqip+RhSpb7olGqzzsHOX1SaBlRXUvhsRZ1QWyFBcsj5F6MsB5eEd+LcnuI+cjH+1P/wqDexeO1/VqtfguD+h5ZEZESSES/pc5JOfR97v6+UW1WYPiay6KaJPdmuphmFk5rANl/m/25IvPvb9/IEduWbLV2sojMee5mPqpAZN7efWq852go77qH9afAtt29ZuXxTpGGoOoneTYte5zqlyrMcam/2pBpIUtKTkX/r/tsi1unKm1F22tDoi1NNN7YHQp76CIXIHMRHwHvLdCd34RGJz9dASBeN9kkZjnifnL+LFjJ4bEkVXrkrnJsqYAVECd4+iIMnEcey50kBKV99Tk4Xx3RQqAlhyMScWQ8P0dD6YdujvYSsJRn/ciBxyz60VF/6VgC3gxiQRBC+j1WEa/P1pN3pMjqLx+RWT8uQC1zAsOKcY8Hcd6LSNQLQMQCocH4CVJtQgtJrDKiEat0thlISwRpdDBnXLxKLU5kaaKdUuEZnObRzZEckZeACCmHPgPUSV+6i8r91AcLmlHjOcZIwX56j6209hWX6YTduz3lpUrhXSvOuhHGHxXky5mjZ2aE9WheW7TJdIrVKwQdQkYZuJpjnC8i7O/qj0AF4GHDvH9369RUPOe9UMJkkMtv9HZ7ftmWoPuGq+uhNZx+i6kUvwZi1PcKrlqIk9abuFHdMxmrkvPOlIG92t++ATaVKVikO7DKqsnoNUn26E9SsqH+LYCQ0pkrDNLPTps/I2NXCOeT1Oc56Vns3m0+w+dF16wxAAuelqSnxuRiAW/HApFy/jjoFvrDh+dy8+NBl8GwNUHIAY+kHZC3uCbmYVafpWpyFEviAlr+gwE6vDH6sP4sLVdT9OHn+mr19LfTPbWo6tjDCZd9n293DNWrwlR5tRAWIiGMzXSnryDEg6iZWNb2dlTgVDyH6N0x9ZppPlgGQUGlBf1jU3PY0gE47tkSNLlCXZ09/PvKJ8q0n8KSowHJpRHevv6AJYY6bCaa91QTwV4JEdbR6CD1eBhqU0QfJZzl054G6mh7BC+ynGlvBFrNOPvBUFUDfkJYVtBLoix/kVYl5RphGcu2Q55zzKw8c8VLSAe1yWCEFXyswavyekpm+3emK/CCFVLfEEn0WRBmleM1QuSlhOeHPDQGYpu7MffgwwSbQi26k6u++VhUw+7VQ/hiC+N663bArMBXs1cu+sgw19KPqcw+N99N1L3g+ENSb77X4bMXp8g2MzJfI3wn2SSso1pyY8XCYPmDijesefRJG5dYxLqCpZS3HV+xeYEFYo3KEd79K24oC4Zr40nmhwpTG4P5QMQ9LDDkvDJTU1cFy4VPYCTOZUY/JDwaNoRWxr0Ol0IX/6PxcD7aY9US+Pm3dI0gqB+QDJcj/NZi4syQBs5RJi/lCbJm833t8HA6UFGgW/5+fXpvUa9CQPHVjlVGtLi/ZC+YxuMLKXjYWArjVQNohpImgmoVm0U/hr3G9IxaHzFZFez5GtgEW98nCZ192Jaf+2xawM4SgH/QeaV0KHcWzJQmqMXrLtUzr22rKuW+gJDXG5hPSlxyuHNTvUHkOq/o2K9/Qoahs+mm8tJy3vPdXTIBm/HDqzsohc9l3ObgYmOMy9zDf6RHrf4OHyGGnX1pywAw+nEHi2ajqLrP2ips2jds41xqGRoxFFYqvLgQWLGwsO58MFwcJ2qKeISmPNkuQGjkj/gLG6ZH94fE0Svr/lkSrPknx0D/P6m5JWKKoz3hfYJ4yAJL11xQNHtS6u+UoQlQfp9Klz7Xay74pxtI97Mv0aZZRDFr5/WNyA2SzCS2hMobseqH69SGQPKv3oNuJ9WqK5hutRw6sIv/R1I8DIVODGFxATBRmSgeRfZG3qKxW46XZjB2WpAomefB5JxDEMNXTa2fUF+0vNaLWN0hVSeOnXR90a3RqR97IbdkkN5KcL0s8afEOd+gom1rRKV9xadkfXko3ZFKe5kTPCqcTMynYnHltQiYw50Y+l686gX3ufxrIBDCRfkfxqHGjcFSfH578mRbXiECRPEzv+M7NE9+LjR5MvhtvTkB813FuoujPSdOUKjSHynJrJusLxGmBPPuIjs498mAfD6h7Z601/k60xh3QLM02JHK9GWtqjQKnSPdbr7v1IoGvdta1S4qP9PKA/7IJH3847LeGM4eI4bih4cLOZve+AWon0Q8ZQt1byxMg/bI/LOotlxz7WxY3zw3i+EfQly59IL64TBsrBUmXrxk9iUF+yE6Ef3Hnzd3YP7D2+PlN4lqSCeDhXgjtWh/vDZLSWbhcU+PHmJ+iwXuCiFbL6RVVhWH1tB1erGKBjnwRk8h4PDcD6hQWUEibHI1rf1mh4oIoqi7xZ1H1Mmyc+9KYgXVarAT9lolOd9nHTLfQ/9sbf39LEHQtnbtIR3CM0Nzx2JXWMhgsxT684pOK97AiAJ/flVJMYvqcSb3vURVO0u6crpVN1471Ore1yiGuSOuUqG9XL6dM97duSWOVlHhhJTgCK9XsNi/F+DA1+r4vm1iGbw53iQPRyy++JGSn8Mz2KvUxaFY7UVFOM4xZtgqDJyjAZoROEom3KgIMFczaF5Lyy33K7zElhFQU8AOc7Sq6scXaA15sR3IUzr5lSgJZPWwt7Nk15qXBkWa5CrLbD6Iy0vqrS8GqSroxSVDttupg675ihYmT1EtcSF+bq/spLDJRy6CGg5r9yRkv8dY6cZGllJ9LcClrImnN3s8P6P6oV0WxnQZ6ewhP9xyJlwcdq1DHXWHrvgSizMriOUH0/SNegS5Y7ZGssW4k9v/4DPDeWVlGm5veWiw6iB7hmw3OSKXTGJ35Qbn0+iO2OSRl+SximkLRW6tSq3KYC4TzcGPlQ0KPesre35qx/bBXaVHg4s9xn2q+UUmrk6OoCCTYspWR4d6uKQO12hkC8Snv2BXksQbgAYYyp8QtZrfN5kcAlw3CyYP/jWCgLwfwLidNiu++mKKsCIzk2c1c4SKwaE4+LFBUy9GCl0wFOKE17sgvQfyJL9JHdESBBX1CG0LDCm4yTkUXK/CjfcWHt3aonPHNAYC5IUGvVqhnTuevFeJsctbG5G3OsKE2TYJJGMCXCBKfeStQV2eSQfA4/W9Tfcgceo5Wt6By+XYCweOAlN0OXbM1ONerRP9QabEbHUHt17i40crGaFyy4PmKnz/2OxqeEvl+8+qocrd/qrEl5iKDMAqIc2D3D7at7fFYYIR0XdywKI0uHq8HVbAJx4DctlxODTrvwZX2lWCuqwawVPJAwswm0/C+opC96Rdm0II5J+HoS7pIpDUBG76rLeehOajTfcNHPIF+zIL/3jtpIH7iMQMAkd+BljGjt1wAWoiXSjXJR4Sot77/EmAY9W6pVpHgBBFwB4pM8uH3Iop8ATtgvFeCh83s/XrSJMYHnmsXHC8WR0wj+T6rrkz09jPvjDi4giM3C8s62V/3BteNFAhbIZ8nYt7LHhZSE98yytqE839RXxeSfpOPP34hAf7zqz16H5rA1z6rBgkL3ojm28XVphEluGCqSSHLOUzchbx7MHDW2aGX5m0bp9UPradLWxHdjvWcxbgpMI4+bKkttp7UfDSnSqn5Bx5oFz1EAgTCJP/0ODOCPelxrEDWjVxPoucNkFdZv/z1oXhCXDCZNvNeCoTM+8A+datsTbNJvoXqIbxfE3ZaKuANUKfgC+5Oe1rp0QH3s6hx7NZ7MxPGck4MmLoCyOq9OzfhpTZhla8QN7dTn3fjjeBEHpqDgjLCKdjWb3RX9Gb8D8u6dpezNqPZ9L5i8e7kYUScily3Ih3sbxzABSH1xRIXNBQCoDwpMfm3Haq3UaUsHsgBa1HqL5ajLqWvOLKfof/y28bw1DPvWtGfWh8mej3VoFPtOOCI1iXanNt5lNzoudDhnMUwW9kHTsOBDKghcXrX4Rnr4FMsXHYNH6vXc36ql35yvjqMZ+pbEClfO5JcBI2AhD7L4HoEHlv8BhYhQCblG2GdJ+XSG18+cWYkRbxd3ioOvaJVOnluGOLNC2xImwlrH/dkFrBvRVB5SeblWpswmIl+2ajAtmL2XXDsqdnRWgWJgaXN2HSzB+Vol4zK7q9kmNQ99FhQI9FXz1hasWX8xU1b/hbEOrfeqq8PhQIY0tVye8p4jiDp4ml/D08GQwdiQQ4rk2tt3LrytuOrxLyrkDhsvD2uP4u/KPSP3G/metrj9TmuXm9f6VG8i/8vE7sUkS1wdW9I4W/fbMhyOV/rAYr7je8pN4myxv5waNKSLcblEDpXoDQ3Dk5Y+o+HZOFsMWUhcdVOMX9r2427tizjfQejcJQVGek6VMMDbPza0tFF6whPku1VPKIzQIJTe59R41JjE+gBP098jpVftinFRr80niYNLr3+J/NzynrBESyUk/Xco6yVStS45wlP9g2tMbEU1Rlt6qZm8TDttuxW87COqZ7uczersb+Al0pbkeQ6Pma7pyUJZX3HbzoGWDkLj3ZdZYQBPJK5/mhqIywh7fQsXb764dWbNzZV4L+PXJ+DAJ5GZ/rRP88ia4H75THdfZevXnKO2Q0bQ42DUncI++8QFcxBlHzrSHNG7MG5oq+odw/s+sJTrbDtc8yFY9CfTu0rLE1lYQtemcwT8Qff3gUZC8VyQi7Gnk86GJN39d1rLcSWRQ3UCVEz+FbMbsGo/Qgdj2vgb9w9+LBwLQZ34mJKHPXfFu8a5UBleZJghG59IWoBaUzdhfjXHfUBC0uLbb3+7miB5OEUPtvg9gAI0S5Ne9/R6GcSWkEhGpJhKDo4HfLWPgpf096ZtFaSti+0EpmCL9c2xZFqQ0rJJUO8uOGppML+AEgu9D+K5TDY9EQbHRBHGs/vRZL0CFX9iwbX+Y8uM1jlZHkRoW71KFxUZjwd8RQCYasEkByhcEGRmrxUoMS9bzxlF1FyTJXEMKKCgMnARgx4/hXyJewqEXt1K5q1qQrqNe6UGsqf+QgkGmKG8Jtwey5OXnXa3PNgZYX1U6Jv9bSBQYYyg9fimR2BxiulMFj+K3oLNO2T+3eLxCnA5NfJDJO5j2K8b74Hzeoggjnz3Z2PdRnJP3SR3QD9wcHnq2BZ6l0bzmXNpgub04o2r4zK2v+XJRaNekBo2GkYBeq82mrtf7FA4t2xrOVFE2PjJumaknUnVYHHWLQBjqbW20+XmmgKb2GecF3Zq5gFa68aHuu5stv7ues5L3jsdES7JrdmzVJFKaiK1VWYWykXXf//WpPd+ynZRmB0xwmLJoUyYuIUnHRTkea8PSYoiO+EiPhiHm7wAQzBr4qbq0aNnFYrvtL0+Cwux0Vn8Du8mP1433ZEhBYIWkPrZLuOnY0ylMFpFw0n6GL1b7V6KTQWNDnuT3xvvaebMU1AJvCYPVu2Vv89lx8c5p4T40JF1cG1QE+/joRlEC4e0SPQZmQjDFAoS/ICNW3pfG3WtiXhdbpLylQgcBYAvl8/H2OUI0iUOCijSCRda27cvfWoG9olbd04nY5UBIb03vqtUMBO31Ych4FmSSZhnTZuu9VUbTp8GjxsEfwx2YCWCDY6rz0cJjPF/uwSQaTDTEpFHTAUeyW16jrGeLWkdrmBI+BTMF5IDXHnBiSX7rgk6aC+v8Q1y+280UEoZSWvi4YH7GQdBnKdrTpEvXECgVHBYiEUuNuzQTxmNDnMm31MF3OA2hlzuQMEOyJLfYjSJkiP5vQJxUyTyZv4mSo0HbvgyElacWxWQ4q/TkLnxJJAch3SBHbZIqLHEs7uk84tDOYXQMdw7T7JBzv7iEtYzO2sf9aNH+cQsoyoRE0PhbmoJi12keGdaKRIweHlxy3uj+8pAJmFyglOWbJhFvaTj4oeFWldtosgXeW5MqVjUQO8bvRtnzK7pQABYvu4ignRfkxLvKMF+RpLmAhRBqBamEFM6q498CNwe5D5D8XJLSgruruRt+VtOz0N5h7dR0WzNfl0Kf2JW4VXjXkr4c2T1ZHAapNXVNamPeceKLmRw8k8kf0vuW7h+0oYGFRRMG19CbIG/2SJGut+zQCPu9kE+QXL9zmufh5xJNa2/WhA6pS+voq/jQ+QE49fTpm+ui6ol5RYAB7wXHmkaJaKzyksGnwFAycB1+cwB7ZxTC+IVxToVfszW2Dxra74nPzlgB28eBA2GhK9mq34ZJT/DIVMG5WG9PjgXcVrYt+P7FSJXSnT1QSRCe4H7xDdPsyxFIrXXWfTOZp2Z74Q/LSDV3PGtXYdAC86w8R5U5okj0OI1kCC9y2tqT4DkigGgbWFoSUBGsMAgvae3OPHz5Sf1fIwyK8M6Xk309xJF5S2cj1mm15zeucdsNU5EmpT5ftphZ5BcHY/3/MADjDY6yFbKNo3UR3P2PsFMLOzKofjqCbQiVgR3tigOL/26o59hek1D9Z9CEZVM50nTdq/nV+EqX4UwdO+D6MSU4mo7FLcvagA/guJqC5M49+HoGB0qi+8uH52/Z/YY2y6V3IkokexUBcKcowNXtnAMeqVvEEcXN3djq7fsB8IR3+/aOy2mNOPDVju1Yr+j5lLh/WClp8KA7dojCQL8HOqilzNRKVOBQXngnOwQ6pOInMhi4aT8DzQv2jRHkN5baVx2PjRg6yBgEah9LapHuN3LWAowXlAHpu7rjqYGhJnFpanEPcyDBT0Ln5shUXWsM2F/jOi1So0Mwr+Hh8kfVmeKwBlhl3/Gld4ddVnC3NxPsBxv7HaaRCX9gu3ouGnudaqtRvT4YBUKe0r6RQRiQ+4xysBQT3aDgtPgg6wlkk43t62xM4eQNTkAtUdOXWZy4961w42avdc48rWOhyme3okJ0NHsz4yTimixG9NYVuqPE+q90OCWwDMxGnS8T/l/OGnc8L68mCz8gcm50noJpaBKAvnLvsDyMFIz/nKK6Z2ATs6S1bQIZyyyYaURcvF4rhScdBqgWJgGouANekgk2XcMCWK6w+BiS5MjJvTDti5+88TONsffT8dVTNrAzaEifeyo/Q6NjZHwWlLWCExghdvMFSFXkgwD1xpgn1Ido0K90d9CpMuACg6TD6ct7doZhLanQYzgBuv1COFVcR1UF3VrA4maQfR4zz3g0/3hySDMrQ1BzCvVIBQ1jBfyJHfE/FTHbKvDo8iCJTYH9kPdW4cgulhP90LYSj6lam7uPZ1+Xxf2oXQCothCpKSRD90M+be3vNmqUA3sP5BfRHIpP+X10XRYl69s4qaQHpNBptKWmCA3P75HmiKdzuSPdD3Y9M5zCmtxPvhzC32PooKUuE8uum0UbePnGpSGyzoaTAdx+dD0WPPGH9MHjDe+LGWZuiVkx7j3wTZD1QBnsi4lDZwtY67mE7/bdnoRgMk64kHOWWnUrrm+O62wRPsTGgOcOgSI0R1gRjZ/Ygev93V27F52riSnE1KGfssPd6MDtFi9tL+bVNDAB4A/SPCQ0DPiT42ZdKhe4fv5BBcom5ZiHHn/6KTpsc728nOupQZroVKIjfKQbbPDL1PlEQFC+5tLBT7NDXKDrTZ0ebf6u0UAVIVj2rWBaT4+yArQc7jw/Wcr0OiHoqkLCenf3CKDDxB/hl9mY5IH48KBWvAxXVqXFWZ5pBvz4IIKHab8VkOj8nAQ2nGJuTxh6cfYYiRWe915DH4AZ++uVohGxBg0frTDWct33NDDbLs9NREEEeZE6un/0VT7aZAWck497BGP992bY1vVOukBfXZiNjAT4ONHBzTf4WsDrlv1rAgy4s4ZQ8TReAWZq2RxzKtSt4ERNy2ButzT6sLyqO38gj2GmAoVVuNC0j/Bp4uo0i5y/yHy7+44AYsu9yOYhmEJY2w7ytxSLwmKvRNYCxOKxDDfm+HZKcqqmFh4FrAv5Z2ATnfHEuEARlbehWTaqcK23Z3YSR5gO5CCjp2fpG3a0MsbWxvLTsCRX7T/kVfZzCgcSm1jFfWgVfn8Onb+oYhK++ZL7BnhzblgCvi0EzCZH7X2SnLI2HXb632OzUP5e6CZDSxyXRq6K4cf4WLnefXPyt9ylwZV82UPAp1l21FHs3eFcWXouH/MaY9gesJdVKYxcFIim7bCMXfpgXK2s71s+l5O72m99gaKgLmu3BIy/UFVvPPWxH2HvlHdkVFTZvxALQpVEGxzEsxMoxreesSiyFRVvVNb7QHdaASRcMRWZ95n4XqAQMrkrf7qZiB/n0g3ZFjeiEDIaoTZtlY/Etg5YOzqXGSQ+l9s7DPu/Rr3uszru0NQ6sijty2f0o5Ow0C93MPEJprvdO7s6NH7RjaQ95VW4e7w7zVmAXsT77yT7Qv2pwwrsgAAAADLpQqhZoRaFAAB+cABmoECsuZznLHEZ/sCAAAAAARZWg==' WHERE catalog = 'TPLP101' ;
+UPDATE albums SET descriptor = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4CaYGW1dAEABDna2uoJhMF73Ko0yy9Fn9C4YwIU/WsNBpylI3suPMsPl0l3OfYidxe1zOeVcjYiqm2y4xxw+Un/VVku2bCru/eogNjLql7+8lg9kV7ntiyP5/PFm5NgmYK+uTowKroky1DaV4A0ovOn31C9oR9k/VHnC01BBAckYkZgQOWUibSvd+FdngmL5OhE4HjnYGmaAqXpafiosL9oOVpC/1WMiOad+6Zvt3N4k+GP35DbI4l8Fo0nhX1KuYA2bbJyD/dObigbrblOv9TYtpBS+MiO9ej8/lR8bg51GjAbnT8DZYKsDihDUxZLGFCfCG19+j6xKeSuMc+hH+w7RRguu4WCiJNQRd3eKRdi8RIdkNNEoGguddFxbk/Jxqy8p/43bLp0KWxnHo9RqG9Rsi13AAVVXGjb2o97ktmBC+m/pZSpXKN4YylgOf9rqACn3QI5mBj8OjSjjDqh0bMS/4/S8JLDP2JiUcgzypDU2jphuEiQhpT5nUYtlxbj1Thu/mSnu+j7y3sdf4/uuCXeJEeSLojeegvj9FTtDClGxrfMZo9nUWJTHdiDJQTxnlfi8afASivsQnouDeEwhkZLvRDRODi22AoLx1Yu06OimUxYxoXMEV5FK+YaWPrO25M+7TH6Sgoh6wOD62OH9GLuTEGZoBbhB/c+Qv7dXcRw/Wed5c3nIh0PsPDPzohNHjXo7cClQVXEZMOcBrdSDUNh1c264+uen2SiqnwhN2Qo/l2jxo0Z0KrLAzoDzC4UnK2jvwnLGBg+OOT6+yOEXb1MHX1f7Z0gE7B7jouFqYJypZTnqtYvaWaiZLdn9UcBQc37gsDA2fE52GhHNM3IYRlbiJi8IlqwkrBYmpD5CfQmCk3RmlfeYZDfpU3n8R4caDHooAt177/4jWb5VmKnhQMm3kU3UK/8F5r35pIqaqozPAReuJCrT00pX3bLEdFDXTpuoZggedBx4jZXygmwXWMdHaqXoEGyzAvTnMxcpzkEpuA1ZX+OS9wKP97RDN3v9gflpj9axkD/DNfSQ6cAOY6uStDVpsjNij7qkQ6M2wVWdbhvfiEyXaKgFNhRv2zqe+GrILTUweP3XPGbJyqyLwupjGq+BfkfQqdRBpJhZfqYxIQGt7VT9eSw8nX6hy+qBTzM5VURojh9t2QF/Z6m0iZh+1PCQjH/i7qBPfR4lBUGLyrZIM3PSN6Vl1fdVX0wdgl3rzaXBUzmvPQKe/M7rGvGb27zChyD1N9euy31dxFABHmYEzXYCCh9O9AURbKXF4f6bPffngS7gDmtRfwOrlu0B6AGyXFZrK8nh7WIXjq1LTDAa9WbY/IsOl9hA6hP2JcOsXIK8aq3fHgfoLPRScGWL8vvom9SDMgEQFvE0pihM8UEwCmYO/sQJyWWe8S/2XW4cbIWlWSiDl3dcKbCfUgMNz/golNsu8HfkV7hVOPcjvMuGxcvJer/9iXopg0PcV64yLowliqNIoNztkDZfZDyQ/E1NXp41mjPiWCpzOsX556nxo0DyX1/7aky2D1TvdmC3cQzPUsH2BOw8bAYZGXCkOTmGCHhIo6W/0JYvjaJIEtYr7wGmW7G5v9x/O26v12Efgtt1MZ0ax8A4vrOeMG/TCZCgOllJbNvwqHS+DkHnM5lpQcW/3bMKhgexc8buiQNeFvstcEcOGSUH4q4+KpUtGhYEp837UisWFxr+YjUPNgfZJX44A5FH97cI+WDI8y+baDAZwz+GRDVYYrr6EIJQ1S+aVhVMVSVDHB4ez13r4plFMzBR2UCFeSFj6LQRhMCZ80uF1sLuUMfkdruXdVKxkvf1zyuTfTEuH60zegX+4bszXUyZUuvwAg92fW4+tddNup8CysCQUZ3E/UrjRbcPHNh8zvftOciJTCg+dORAemwF3ci1uzOZvHKoa8tO2RIKjw2Ux9HjkIVC8qNsHMbRyySYzuYouXCuoHlq+uYlWqHmNUtK7AXqdwQMAb/SIJmTlRPghmzWj/b/YX6kc9GLwLJELxgyDNRzuC5BLsfJiDiUd9Wy10HnMcoAcS5us8NTwRP+Q07ohDlTZD2i7hsfg6dAQw0QvlA8EuOff1nCPsMdoF7YNN9to/wci2BQHIMqpMH1ZSVB+TQ8XgNSIb6Uoj4jUVO38W/jDClXuSuDVSmSvXrCE2y6RR7Jdd6cqtxOCYKvtPTlOpzujDBrl3Pv3nKsmklSvBgRiAyRYpJR9R62gL4S4xOtMCWj1EC1awc+pOHgWmBvb3lSqFpoJiP7Fh7TBSPUfe7Cwigx6izybCceFye1mySelAfbQPjpSrcx6SA+sQmTq0F6EWRrRpyLPQM1OJ0IueOh52FcNuYQcKVddD8BjzC8WtUkM+6jfp9XzLJA5jV9HwAjo+5dVWAq8+h1xfOeSbUR5fET+7GuxlbD5rhjVD6qvkCgmAffhxm1M8Gw/d9RvUD/zbnikdu8H32zBjHBbClLwvwAylXZBouJ5dnqaIDpoVbfY/OvqYNuY3nbWkeVwvHkQD+yHItXKcrM9iSW2Q35oCdbywqR8THsD/6ux653RpPAntlpCRYzbOi7bdgBPIX45IYzUAf2g3JcnVB9BC+V2+IkPWum6TdYh4ygT3SHkBcOPyIL8zJvJmnYZkOFtkHJYeH+5HFOcRkoAHIWpS+OVF1udAdnmaK4tifJPT3pnj/nMLbRjP6BzYYyeiXUKFkSfa1+kDz6qTOG+ubEtc4YuseHWUFCoEJ/OUXLdfwqa6vV2CRlzj28gZd1R2JU21KvMt/zf5N/XaUlQDHBJXANW5I9PQahmbXABncu4ybC5MevBYqW/6DHLW+xwEUSPSekssJ+Vko2bbaA6tma1wVttiOD6eVXslCJBTv3YKQb/5Wi4CqXNyqMBmxFeCE1bOzxUy3qovD+T3oOI6lnGmxsZc+Ep269yNIJ2N7w2ZNXtHqunVFpuhyBKEa47RowxIuRxTWul3r2hbkSa6G5pvEHzapnH3COrkFxMdGcEol8fxEpUDzIfYNprP+zUJ5rMZ5as8KYi5Ku3v3lEtAejcKrlJNZAb/U5XdY0sFnAd2k7JDUV5koTl9jA3bh9pHcaqT99oRrz7XyOPfAVQdsaOzCKnHOhD554Hj3SAc6/Y+j194XqjNK2yzfgw4x4GOmyR4pNsB7NisYrVbqG5cUbLqQvO6rxBfMMN1xCZgHuOc5XexRIibrNH7dSbhocsscekcmyMpx8HSIzkmZvxUuBcb/32Myxtdc0LaI7SSKqIx1TvvVd/yEoMN7f9z978bcxkh55aCuOBGdJVwTtHbm0vwNNKzKg9oXs3GwjRYPuQtHnN2MufqDZzTl/Zqb516nIYL9u5JWNzwThpIB/wWS7i8Acrt7o0LvxO0v1NjPkNmWEtWw9NUYvRLu+doSF83Fpe7BR3WarkXX0CyzkIoIpo4aarIL9gnj/2TfZxETffQqZlPHVIlSWO2ojm24KYzB6cVFGoc6bmtZcakpntTdwxpsQjCvBbNS20BHKot/8wewNYa1bbSm3sl0YNi3Yvrd8AvCEjpcDGwCAo1gGrf23jK9P155x81A68XyilDb7f6wNqOqLyqNnOItEe8CIEMGDykU4dlwLRYw6fdc9slXLaI6uQ34wqwEJwor1drIr3y3x2u/2cgc+edQGSHboYX1GrcKNMDztCAEs4zOFbT1H/h4FttAvQBrNnfbb+AQG5NN2aVCIqbE5ujk7qO7Nq5EDT5RVhnXVAb5mDfHLgYb01FuUVnKLad89WfVbYs6QAP/PVVzFFNJDhyiiUjX0AXnoOzCHu3lJJ7ukg87SJDeEfA3j7AgIiUP59HRKNB9CrE/QsdcVQIM/uPqGwXm4XBzvu4i7a4yTgaiOHb5xuO5mOPxcW3e/8N7ZiepJHSZZtYhRnsUUp7Px5iRfi5VK2N6Eds8jffRpf9ZLdsMHmKVcvwxd/OM4++zdqJceaRKcxwoByBv2NgwMqW9ZPsaloRN3iT7iU9XFI9TxSYmWy28F6cU23vvuJhjXaLtOYJG30rUO2sWaMPLs+SS48GtqQFO+dErOXKLOJ7KEbDadSTlm1ZyQv1E9ThEG2sAyuMXL3Z29f/ZSUooiW8b1t0rY8+ya5kT5bxhlZhcnR56HhHtnuu9S1k0wMs57ubrNWv5/tE0S79wPjeLbpoMYzH1uQwrtbttEzY+8QP4QgEG0iHgvaKJBDqa0i1UVVTxbK1yoWH03cQmwJybUjYKaRNDPK+2qaF1PDW7t53jqIX35P/3Izo28UPQve1zAXZeCk0RWG8O7CplLDN5MWLC5zIM2+CcD0ydvC+2p31PDpJM9MQ1coVXXFIacL135IViwGJkSHKFS3Wu0gGMLvPsaeIHwixjFfGYaQjK841CG727om6NPih7Ip2iY5N5hvLbr68bVNMScNPD133yVx+XmAj15eb8SWBV7Up09yiRIkHAnjn9gJqYQZHzSSxQ30ahDsUxfhDuYdXq5wkeZAbjtZ24VNSYnfJu9/WZepGeHwVJNS4WvJqx/ZSt1X2Kznu2fBb4CoK/6ALJCg0NsY+5ukLK1/fcoNnGjv9bhwHe+QsqfKL7iovdcEMiAMXbIy5eKrKFKOy+LX9oZXre85D9Rh3xELTsrHxO+OvpXCDbifn3JHJMmLsZIJy6l6jlJaungVjFyCpT/HkzT3vIwCB2vI+j8ZvbsW9C6yljr/d2qccjD8ZnHe5yH/gSiDxr+ujaZfEHBcoxW/G3ymeRa5aaVDfzGS8BO/CfEIZlPc+YFnpdKjgESOyJVhXfKUd6IEfpJbVxhdvfjp6Y663Ja2p3Gx3O3g8Po0MUidwD3PCi9ZyZUbVZV2eF/JXv4OaQzsehJ0fnHtCX8eqLbP7ARHS5dp//uam0mhRN2opK2ORuu+8KbypimN9w1GPaPlTdwPeuPL2QGYM/Q9Qak8uqrRfDC1ibD+hZ8u+TXwLai3gCoA6FjtbJ9wDYLke9APWVCt+GbH69aJVV4msQf5dWP6EwH+cvlvYd2U60GVhsujn4gNBOSoLJIDPwQ4jtMixS4DkxfLPoWq0Pq2sTzpk4CQj4QilPBGllRjMFr2HRdAGzb3J9fVmOXHA2PuDPqc0wc8G/b6WWWh8+Kix1YBQKOnoTJ3RDkyBvvFGvKb2yFz3N7A2fx3Yqq3XZRQ912XMkrLvh1Yft4+tsLNc5BYL1RA5LbGEshVQoSVY3+GmSrx4iTkzfkUCG8s17A8ULOZ3A+I1wJ0hMWpHagEAb5b7gwYXaG2OPmXOIltFlleRzwTFbGLW7N45CnU6+bJejUFQdfMIs7BLusmbv6TBGrDIDRwBOPetfSnB9oNjaENdrM8EQtIkT8sD4dF8aTWoIrX0Ouzfx+hZYubmuGMKdOgdTbz7VvCD542QL+s2Yk2h7glDP1lh4NfWkMzE5rgjA2ONpQJHyZsF4bsh4CevHg4A6GNW/6qiMKpwgRUORa4HXLTLWyMwPpEdRtHRNHFZt8uc+Q05ueNC6vpAeuvlAMf4DCxutHwrUgcaSxP9TGUrFiI2XZpZvkGgkW2beX0JAHbtcJP6cblqFAzdgVKOEhJTgRaKcqEHm4J6v1EA2L/n7Evb6oPrtM0fvRHdeeV+d0IvU7ksHSFt3E/31YNUuSiHkCPmIuLRnRtht/2DvKBkcmj0YdIaHKcQ+a32btmpAdVEUNXB5U0WlKq/eTDUTVeTMjoWo6VFfowZpdz3Jx6lVAj7Ln3oTGTUnLQD3rpviHCLLO5yYG1szL7WWUoboe4AK56q/eDpOKNdb+GbNJr4Cheg08NN0+y3q+0R1sEj6mzGoL451JHxPpr446yBGEhIHh86b+wcXLP8+jfBfRpz5ssQcRDUElEgmQR+jKrnm+fBeaSrf/FGzx7EqKNIpz6PuVRdg4iCI4qJy3LQwD+lli2WTsMhp/oszdsk3nq9Z7eWgJ/X1JxecQIGQZjTrhCNYO2Geefjj6k3X/IOwMeW4y8cKI2y2PLN/XB6kSifsFEzYd3EcP/37RqJhCrSAI40/Hbmp7v+Hj793gkx/UVvG0jZDtlE1Fj29mso24azEwcuTIb+t+lsllIdv4DPDbxX+6n26AjCER/xzn7ugfMj2L0TU49ID/GFpn6c1KinXRRE68TUwS5AwB8fvwwykQnGzPbftjErZPyoKmlRfIKqt644K7NYdu+kaw4JGyW6OOetvEl324lkJIDeHQsuot/P9IwzhBgwy2JQwTTM6CCdq+7GktqG5jrOcdbYTjO+DiRObStCnE98mSjAX4qfB4csisSN9NEUKvJ9wcfQogwIP4tVa+ZiMoVbqDW83uWcEE0pOMWl9awJ+HEb/qW7d+6WUmMkpQvLhcHO2z2DPmk2ndHm0QbPs2T2RR5mGTgLOowUYMWnF2kySXNwt3ZfSxl763jEonAwL1Zt6NDKvGBmBC0Wz04e7JOQAwJSD9Ne0G0WsXwsXlSCH7sGI/vhb9sccWxsguphUcmND2b30MWFbp40WnBLp+YyNEV8HBL9r7GoMDc1+8y/U7fLAuQe9z4L1ufjUYl5icPaQoyqgMtnZWeuL1N601M6EGJJDr35RV/iILtmsQmlZO9RAC+JIZCStfSF4u3TXJbKuDTY9AJdwKQ/IjOdV0g1j3/5rV/juo029trRHSpu8W/FOcXEHq+0lQhPT9h7d/AtV5yN4tyGszx9MqtLO1BQI8NOYfAXCwLgjyh1Tz+RlpPC5dvB5NL0rzeMJTspzQPY2zkaVJeGJaYwtNR8eW2i6C45rI3y5tipLTIsWuTbRDTXT8V8m0hM3fSz/JVjLC5Q9CQlBFqoprYw0ItgEdL0IoK9pEy7cslQYOgyHuP2CAvOyq9f58o738OQOiB2xY9kV+Ntx5BBPpdVZH8fm62DR6qx38HmP8xDHFb35ujrjazzacshjLfcGwzyDFClWAgOyS+jJoeHiku7VLZ70wf2p++a04gp7gX0MfrpMti+vwnole9Ana3hqWd9YlG/skHNUsPsmdUPVOP5bUmUUTuGmsy9efGXbEq6WycEmaiyoo9ih+W4Ym4U1oQNU8uIK8bDODrTnRn1GcRPdlLwSLK/yww0Dy+44i5TRqPmpupc92HSuTDVLJ/JmuvTl05X6jae6fcmZ98h6njCyTjPM8tk8aMDf60PMHpRNWrQ38jmv7LVVExYJtCk9hJAjlQMaK1fO4FMVCVL9GO5n8RyVwdLhkShwMoYI4C75qW+CWA0AvIA3/xU62DwYXaAq/9MSI/S2+rj9Ws+B7PuTJSzEOdm6xLWfUJK9iAWtDl+JPBUC64cUEQnsVuJ+K8Bawkf258JH4BUeT0h38hBZ4FiZaBgpH2/+kw4qjFHB1WkEkg+UJDPZd8KmYxVBgKGdavZlyWzRSGoWuAf/HWOZdeFnLSqH+AgBbD1MiSSaV8Qf5A6rV1vTTOWTLEo4AQF9P1gxZ63uL/JuGZN1fUx3Ud2dsPlvRxiwJjNNeVN6DudhmN4k91CGVzU10HCfg7PCJOSH9oKf5xGeoRMm4HXQEwEGOoEW1nnAP27kvvx84p5JN1T1xFB++IGcRgMXf5mUf1nn9Xs4M1H1cOwwt/44Oesz0Fsa+nFt6mgiA4axrbltnW1SucFFdMzxxLWGUROmX46a9KHnttWv3pzYGS7YIwqGwLTgueJx3DqxAusPEDz+EnmZKMG4Zyhybo5iY21uBck0DNBdQSatWEghl+j+qCR1vJOWIK2vgcsX7q2pOUOZ8lL/NfPhK9jMrLH3tSNyGBi5YX3ohWjVSYtPNoz9F/V4Yu/eXBcMPGdq9RRCLX3UPnY+R1iwRx31kxgdTVsyyJTpvrPsQqQ9EvRb1yu5J8dzTugqUo3cwB7YDtElffzSSMesYxk5haPY7nXGLhTTgAvAFgPCXcP9cJE7NC9fZAa36TgIdKNMdDbRdDPRQr6dp05BgKGO0pYUTVscuaMQJj2wIdloCogaDDTz0Q5WfIYDvPY1aiu5vppTDOfckwtu5VrDqopdd3PJbTvaBB8H+TzDrY3LweS2NgQ55zHgdcEM6E67Gklk1hsP4EeROON4MPJ/xvIr3XlO6Epb2JiZz2xw7G5iklNNnBR/M06zAknOZSJWrDHJEUTFGhEwXo/Gqasv8CSp05nJECtpzJEYmnGswA4KZybxkk+fP4TSuExtaHIzLvU+qgganBNakDgnoEQXDwvluee7qzRGXnrh3wLNowjG0jSUxjfCzuuQFVg33VMb80rRn2gOt4T3AYd1FCeslvZH3gaeAfKI2CsTva+Hy1Xl3+QCYA/7Z8vzm1tvIqTGAibGcrZeGld3pKsue+ObU9v2yyH81NVz/FGPAerueXdv7sygt9nbEyabQ0ig3Enwc9ic6Y4Owf0FgKlP510jGhrwlhZhYO9aDx1+uwcNSEYTMHu+pC/MRs1uGpnVfoDokxf9NKzyLQtnLrpJGiz7ERHAcYlf3mnVPvOd5VZXLUVP1nlkAevoRLzbO/0TV5HehORVrZ0HiQUrhGy2jt41BWAEvyhR0/2Vkd9SeRXU39AuM0szkbzROK8wFXlX0Mqaft1mUNewA9dV5LH8HPBq5rQ/NdISCSRXUlO47pF04fHh4zJqOw5Mvu4d8EzR67gHdrilB+ifB23k+KCtL40fUbEyUWhRDMa44rmMsENhcdLMiZLPnR9qWOi4hYVvOgnJkoqiKgup73rggJp1AAAAAExoa1qXPkI5AAGJM5lNAAAm42GkscRn+wIAAAAABFla' WHERE catalog = '19075965221' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AF3ATJdAEABDnSMPSUE6+N9ce2rbujgm4iBzLetYIfqdz8e3qcGDO4UQgmhFVr2HHNh1FL9OKBVkcTztHHuE67S1ciubeeCNSOZfgDZA2vHxOFpfY0XXYJFZWI2PvrLKqw4te+c//B0zlRey2x2PNif77Wyh9m2EEBA4jrKWiZKZ1QpQPYDV0L5KTvsaQ50QHVfoSzuv3QbZmh5yZNeJDSbq+8OhnSuI6hHQ7RG7k3Lyssc/z3bEgxe65sq+xulx8EyKdpHA1Ji1qEgUG35qBmVOFznWggst6bQjvw9cHl34mDTBgxKYTW/u7Pwi6B01sxavsbXKMhjjwT1+1DObB50kMy8qRn2woLEYTnIMtN271MJ1YM/X0k6DTiazpR1rgDlHfBencDuYcgK2yRbzHzq3q8c/ypphQAAAOYQbpkWcnOCAAHOAvgCAABfEiHSscRn+wIAAAAABFla' WHERE catalog = 'CAD 3420' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AVKA+JdAEABDnGQNqnE0Pg0nEuaNM8aiOHs2TxHFrkpKB98Pnu1CJBWHu2texH0/0T1HDNUfCUKkzDsIsH2VVKhLspCvh/syhctBjcN+6OlRzi5K/sYH8eBjtdQEpVZIbC4/rN3sZsw0Gz8W7lphBZ6oFTPE+x5mI8NWXr2gAup1okNC9APpxMQ0KmGgHsEPDW8O1Y1mkaeGdxCeXZ7U7zwuM0wAvDtVQJY8oKR4AfKfGZUe71HB6dMexA0b8WJZnsr99LC6KIscjSDl5zi2BsQUxCleACiv0gP4w1KF9Ya2hzoc5FDvS+1B2i/wt2Wsnv3XXDcS0Qxv7Tbl2O9H6eLPBt3WeV/LhysZHxtBjkqo6QJ9D1CBwjcOAVJTeEZA8+7XDNlbrAJyNHSWCj3fxxdIKvLkxr+vkesZY8Enf8bvG/J3qjkvBLzXYuay1JFGKVx1WZxcb1dQe6CqRr8VVqvCcs085XiJoSuezOSakA1re1VWj8g4/k+o0IhoMfes6rrEJG24xaSRxnTG1Mgzj6JbWmHpSDXAI08CKSWeKuLYvGN2PjrIgTHS/3k02lWBIyvjAcSOUw8/O7rV9s9/zp90DQWrNB6UAvrH/M9la6Et6WNOopGEQ1RIelImVuufBWnmjqofMtosGizKVW/hm5XTg1r+sBP7teR04rJEnaeDCmPSsxPgzMqm9s4L+g243smGA6LfzjSCzsj0Ul35QjIwfeSsaGYTg7D9dxJR9eU9X0cfsb6GkeAu+5FH45kNp4+Dy4rmrCG4vvLfsa7JUofYz8rt+hAbfEvJZVgCd2uNzxffBICtNZYeAn49WR47gI5WhLEltP/erLORPvBz5nc8NsUr2byvDfIKvAjBtoC+L5NKhJ01DznNJQ3mK0a+EJM3+BpOd9HXAjSZRie6LzXaqegEu0bE4TGTmW6bkZ+5vo4wN6ESphB92f1E/bgR7HLyibZ9PvF8vc9G90xjlWOyIht7TkDEmISHfnz1bkMK5IbGppqyP01U3OfJqsG/UtKgL+Qv4U/qx/S5YGh8yHoXFqSUUL0r0ucRvTzypgI8oouM0drNqNfsCPreFBY2CYos8aW6dJ0BMEYBogB1fDC8sFDbnVjBApg7vbgCzCNpndm18CjNbi+EOzPPAdW6ZzUfK5cKa68EEx39r/M8MkZvdg8+MwoSHXX0X3p8NYQTe9eVu+v2Aljsr+hA9PIVkmVsBmruVTn8XXdrWX5O91dPnWMDXjagrZL7jfI7LLGvDFevWcRetU0okYH5N/ykK7tv6esGJDbZltPfP0cyhqjuQRGTAxtA6HD2AiLrRKBz5V/+ezPbyQAAABWP6N1fTZTNQAB/gfLCgAAdZw28rHEZ/sCAAAAAARZWg==' WHERE catalog = '093624979357' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AISAZ9dAEABDm2pyEm7bQ+4R9oSYE7J4YFRKbypiSmYAqn8/mecY+B8LD6eV3B4D/LI80uO+yhTabV2ffOaj3zFddzrUz9gyJOg/y56mzGMiiz6SIKxG7Alu6HEYYFS/hrQvs8iofj+bk5aUlr9TbKq8JkPFTIFidG6PEHLTSkoSOaT+KBRrXy9h3IJ+Thgq4ibThecldA4pVdNvPIsoQCcThhCdI2Fgkta04ua/tBgChPS96Og0fpYo8X5t/PfHcS7a7fvFySGGM5H4WvqE9ep/eSsPuz3j45KLBB4wKi9d3HSu39uox13KqMpau7EJgek1ROQtgPX6CvVVxIIwHJHtgnj3z1aG4IgD3GsrE32w711w3g1E6szxwnWmCGQES7BEQBGdU/hsVNOXoaRlPEd+JhoEglHt4l71ndCW772MDi26h5f9tWnNUDzqqlHdl0jfMFJmo2fSZ05EVoDCNKCcnoXeqtTvToDLcWKFXU7G0iqnFTrIjreVpCMp+IDbTz3c4CR59v6P8hXfJ8Ef0zcXBHUsPZQG31xiUnRMyt9No2EdoAAAF3fCDcCWzk2AAG7A5MEAAAtqwRcscRn+wIAAAAABFla' WHERE catalog = 'TestCategoryNotaReal 001' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AijBfpdAEABDndq1kApFNayNVrFi1DqnSQZzViWiv/jq+T+h6N8XoedExurhv/6OBnfL97TfoGUO1iXmVGSA7CvfM8YQN9FpP/EgXSakyq3G8Y0Ptmqu5m6R02CxNSh/xnRW0I331PSojxoYYBCA0JXkIjL5GnCvG71226VpRfSP+uMjPQs3OzFGje3c4+oeHm9s3d+xOe5oWfy7GKiWpoFc+UeHQDLsx2krcTDR+gxcfw6J6ZynpHUp5R0rfT+gZMyrkZj4X+T2vWUyRuVssapspHhBeqB3j98HQLNel26drqPVhaKFZnrfhaVxgeLZTnvqwgJxEByp39zD+0rMEK8n2dINHxXB5ZnLHIgSR4bal08BPAgfK36AZwNzc3cuxdVea4qBl+34wsCo/ASWFYCY+Yge5Va2vlFHs6qt6EeBBr6ykzBJ1aQuHHrSbNDNt1V5nQ2dgMMXmE3Bref3aPA78V92dA1v+2rrMMH/4uDpyLj5YhZTCE6KWjdFerY03FDWYb8VjEIbboH+JrrOWI8jHYgrP4nCOM3NcoY9Io5XDsNVwbW9+u5f65bTmM1hFK7at3dwJvrmUevcGB7O21h+Hjuw3Ixb8xE/Bj57xLu/rGzvKxSYKa3HazXOcUzkfjiI0mDbCdDdmuP4mZFu2MgLL8CYjvI8Q+Ls+58eGzDvSWlHfU7BDXQMz3CS/Egqgj7XI/OLsFD6ZznvjZ/j/cpOphfTzrUmqRnqPcZyfjn+sksnMBL0NKV+C75cmWQ64Gs7yeArGRP0XN6h0kreWqYlDoL/q4MosObqFV7DNaLA/UkpAMSf9ewXTHazKfRGVpqIv7UpFgr7nsptkFEMc77kb14mXQ9xyspysyXaJiWqiXT7rpc0tFxb2lvmJlsh10XWEmCC8syo21lTR71dodnt99CXoEMqAGBPOTeCqKslacJC82jH0WRsWgmy9tADaf5+nbUldHk8wgjBh2fVn0MvtAb4MLgJLAC25rMoZQ3xcGs5OKJVXdrnNi3bIGVgDH/34pizm6+6DPobjOjJGM3QSG9H7J4fLYANZTbt56idCgw84CnlVMXSb0OnB/UDBdqI1h5jizXCFQgq9nNlAC8z9DtDY9YPaOYfaHWwDdhgR6Uja/9YegaCa1odVPak3wmKR8I8I+L2WQeyptvGpsKVeMfuDu1mk1wA/oxsk00CYr09TM7G3YgJEbdNFBzGvoRPCY9UtYhHMeDcYComPG/t8VQarQW+NCAWZNkzptI5mtkEcWxe1l7/gR7RARpo1CHVaTqdSQGtyk1dPQkxa8L/rwoVqk7NBl6B7Jf+oxp9wv/Tb/k7iONmjKpqdJ0sSfQoARf5RpvRl5nyHQdez1tN6hc2pCea+xe2rmW2OaglFGm5BXaiwaV/i0EbUwuJb14TGSjisrq8tJ+OIDJJ8QfSWxA4R3DXw15CFXd3pA3qUxHwDRySDP5BONS33j+Zq97yfIDzeA3P78ebF6NikZEvBYuwJ4vqUYW2OLYJGHbzz+TuBsUqEywjcWTFMzjhwxQqj1ML2AQDmjIJewbUZvNpa/2WHl+SfK+kCBWbbeb21ADppNgk7eewyEcQLl9ZCB8+fUKj/L7kNyLIycNu3rrPlRXLkOu50YZoDS3axWHoVol7nfUtPGyz5VN8hxB7AN/jLKl5YDToIGwBsYj+efiR01Jior4bMjoBhO63Tf+wZWRwowem77ywolpbqGfjDKBoqhBk1cr5Kj+v+6TALSAMsBKvh5XdVBTw6PRqZ3cLG+mEAe9zJUHXsfK4NYn0lx+ACRJubszf3vHBRIQYyF3DFS+h8AfQvT4r/PgSzZKFc3HK7eNkOj2xvLhxdCkSSWmDqwuvhVkKrtGk13jq01fogtuY22NT8IxwCCT2U+KyeF/tAVdLVeyaTd8a3+KbQHwkI3x1B1rEcSvQ0VPzyKC+ptdRDwLWW7pTdXARK9VbuJrELde697FoMgtwKmDE+Z3kXEr7SUOeuE/aA6sFv8UEW3FV6y94BDRuGjR7EfjiFrQTWxpdqDeGYLXYyPjHgAAAG6dlTYnVsKAAAGWDKQRAACXi3cSscRn+wIAAAAABFla' WHERE catalog = '06・5P-74' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AijBjxdAEABDndq1kApFNayNVrFi1DqnSQZzViWiv/jq+T+h6N8XoedExurhv/6OBnfL97TfoGUO1iXmVGSA7CvfM8YQN9FpP/EgXSakyq3G8Y0Ptmqu5m6R02CxNSh/xnRW0I331PSojxoYYBCA0JXkIjL5GnCvG71226VpRfSP+uMjPQs3OzFGje3c8BYGFetEq7kMQn74+fAuKYdPo8HT7YNlUKk2i2nP/78GflWEjdKth3ThpUMAIZc6v6F4i9OHWAzOvS1lcincZ6Uyj03yWkiqklJpriSO8+PjnUEg4G0WIa1xtZGoKQ/loI5ToCZATytdeKFvyL2fU55fmRI6+eYyA8jLIKWvKyv/D14cwRERrtR5uQjzUwTQzEBsnSZlsWyV6zWMHHnkp4444HLlS2jyeQ3a6sAzbtJyHLIOHIMlbrVNoBkzPN0aVKAKZSJ/JMWUVXPA1WFktkF+UAHlppLPBMjqb3OHD5nxkNYybfu4cuz2JeRn7JdM9MnTnN6BAgXCAs7RK+g0oUfJqy1EaFOnHoJBBV62ETFQORMjCDHROE6y5F6dYJSXpZB+OcNb1p+cA7hX4aBPjKb/B7fB+EeVyBtNHwjcR1Jt5aF6yyjkRHwqpKIPHmRc+ahzlWTa9T/DDszJvSWUXiwttFRTsUaMnC1aKydMRC1Qvi8ZtiFeny+rW+aOv4bwJh4A37BjpvYEyV+c84j9qECsA8b8TA6/Crh5SJP+qzejVwOqgw76Bb0XR91pOmb9KYjnEyZD1+5pZkKDle8SJ15iJqaLEE0kWq+LLkJupBuveEL7KWI2ONxUbmCXvUC20rLZvTVQoHz1osCnE34DlMTJaQLt8Ulyt585/U8N3RKPSxtzOV8PKil7D+fYXj6zeyRI8YP9HMpClqKGsMclULgDq22cLdSK5eO+vz8I7628vZFRrNX0clN69fIteefsb4dR5uNMU877dVeXf6TRPrKJDTWGg5KSLpifijHRPTbPfSbNEPFxJ/SjvvWQJQZEoO5DGnJ1yGqk2U4DhQok1ADH/yK7/gL+jAP/yy9YhqRjaEnbX8B0LlmhWt3C7ePRizNEXL+5U8Zpc1/XHYWnUPCKKiasXVUQ+cr2Gya7mF6VSb0DGbd/bkZ4b72K8iM1OceifMthO8tYOhEfBl4ghubGOn4FY6ahxTSRwpgDBqQ5TD5fTqLemBbSMhxi49VQXM+6tmPxPg1xJ2B8wmU7DujzM075tEvJLcjAQm9cjEyubnYFWVd6I6sgwEc2uRo6ulUWdYFyngPLox1CzHObH/bR87R8DN1UUHCUnCHcUFxZ7fwUtS6vxCATuiDnLyzxLjssz3sHi68eoyupbjVTSsdSL8JX8NWhPpa6vgu7CJeVGlf8orTvtXU+nT+zm+XQxcOG3YAP/kls3Xbjy4z4a8kjR2K0N3VRZSlZe3iilPLYIn4EHUVEUEJiJ+d0kD7f+WVXAcNEqV00WJ04XMEq9qUB9wtplGRQ4HIPG465Q5hD+OOqsOKbMwDAvZYuw0oofAGjwjkNpeddWlWKc0elmwLXqYgSAsSD+Ry8ThuNPO5GsSuY88pq3ddHuKYDVS6zfWXQwEh21FtndMu0hxUXjcdyfEYGovVD0AMxSiDknpcEcVeaiXp250gYs1wNXyzBqSPLlYT5HKNvYFcIGDeHuxodcWHPhHucV48gwxPX31rZhpqJ61h77cplW4mnUYyZuPImaRdjTRAae6thQDkLuF6zAhUmlrXg94NOFvazfq4Qv+IDXKPlTkF5TePSFvvdKKn0uz6IUc9XQnEHLYrh9wAKQ8yRhb5alup2zM6tVjas979+PfsHUEvEv3KSIzwbLv+xUXgCcnquDIj2ArXMqzJju/GSLCuUXIZYdWdk294NjRCqCGH+ynISJ7dQFzimZXgRrxmSiwuZpg7xNavm9Vd3y4eI6McYLlFfdH0v0HpqDRIL0wzjkeV28JVDAinSuP8PoYEUscVUJrU4237T7Z08xAlBwyRRpebnmCkzRLmuelYswbQu1THMx4Vx7mFlUnxWaaD2PGDxvQAaWzzBTPKtbPwIpTmgnmq0wTCFSFutyyECCisY7hlkRLzEBMurzeciaWpN0ADs+drHG86hk6SPgg9AABf29+r3Yx1ZwAB2AykEQAAi+AlJ7HEZ/sCAAAAAARZWg==' WHERE catalog = 'OL 5670' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AaiBOxdAEABDndaS5YMtQGyJ4xZbtRlAsQoo4r12+dAHBmGzO0bf61+E78M/K7MfLMwi4FSff9pB0kLgLATjvRlrN0+BiqI5ZUXGqzFEQOLobiEw9fvmkxmCC2hcqr0j7u6Wotfc92pv1AC3FlraJrmjFbuMJ/gJJyECjIPWfBRKzJOwG2MxHn3mY1THX3oBhdwWLzIe5MC6/UO7deLel3Mm7QO+APnb79Kw73EOTdirQ3LFe1RJVANGv6a0GfchhyE/6QR0R4SQUf5/qmwimdgXl8D8ihPOuwc7sItakugVOq3K/Px5RGQmKCzi2jmKlAuNB2CbkApVspXPKJW+usIkX8GwxtS14nIRg+VqRn9f2vyxPtS7RUq8726NFC0h4ZlCqlPOSvi62p3JcvGCrNucGK4pJi84QIHqQ9KdAal7F5akHK8U8hSD4L/QVzvzDutPSLDQfC46YBNumwqaglH64lzAOGSdnukltkgT9ATzSQ70C86mt4JLs7Zbt3stsc+J6F/LfnnX9gcSlmwE27ivw1z0vC43nGa/+Q1EGU81JRQME7aK3L9yWz3wGTUU2eO/peYZuKWOk8H82IkJo9Lf6mptir98DLsX49ibgKef+mzNjJacJwRpf9n96pKf9NtHFk0FqqyYRLjZjBZ051oRCtg0+PbWiQdASUXJ5/kAocWuxAXbogMheLTVMkiU+yQPL/Utu7fTk956pV8u6KQEjJGuw9QhbD94z4M1gpVWuwV6UOdDBcDEVIpERYFV1Jp5Za1x2HO9TNpZmjL6GCajtrfLOfaJUGNeZX9SksJnUVRbwq27mb9K/icUeefQb34dow6nWvkoXnH0o1dquVPvgLJ/CgksUEEc7ZLWzVdJr4DLErH8nv1ihRSbPl4iM+q+EBQJ1xyTNFQt0IaUEmPG4aXggts0H81e+FWz4ELLK64kE/q2Os1aUwgMc3zwdLAkjnl0irwaOHWZqJrCyU/SryaGPn1vNws5tpHCj+Y2BGeI3Hgl/P9vz7QTm66u1Rz7WGIhlcu9tOWQhRHbLQJBDBXHbpLRcCL0PmUuidycP7KJYjUczrnjYuYE1ywXKjljR+bT+6SPDndPpKPuQiS3ChNqEVdMHm2Q+pQPNjuDPMpkyj7B9mcPOb0w1covOLsYck4ayIfd6+xaROAt+qfVF8jmqbIIWlck/d5TrtNEaD5Atg668qIzDSzHhzx/toMMAJFaj6LEsQqcFdYarWvYHhBWYB81K6TCgTkplVwyXowqg1HcbdkO7exYmrfjy4NojUj1UV2TiTczfps/H0IcJ1aS94OvywVuhPJxOwuaGWBFnxpBW0pqrwGp+1Z36OUP6uJHq+zXjLWT8T9aOKQF7aocZZSrrQfeA1Lm/6D3GN8C/uf0uEd2M1wV/eCgQlreGOXu9qdDqZBAbNmmwq3/wcd+ZuH4gQ6mksmLpMtV6aa1hUJjEMD7DVOKuNN4aJKTinefCWl0QCa+eR2/IK1cacFaCH/mDetU3/8HSSIVjMFQ+jCgTbww5AmqYF9UJ2NsXHCeimwdmbJysH131aQwStLtleou16dFVF626Ax8v4eVZBfcCIrc6hoZKpDmNjv5NxKF/RZsfDeWLDc94nbn0wEDOCpdQLJrqf188xzzJenIerSehZ1tNbMlOtsT4A5Xwphpai2MbkVVTht/NvvAADkjNFQ3GDG0wABiAqjDQAAcX8ALLHEZ/sCAAAAAARZWg==' WHERE catalog = 'SP-70040' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AijBjBdAEABDndq1kApFNayNVrFi1DqnSQZzViWiv/jq+T+h6N8XoedExurhv/6OBnfL97TfoGUO1iXmVGSA7CvfM8YQN9FpP/EgXSakyq3G8Y0Ptmqu5m6R02CxNSh/xnRW0I331PSojxoYYBCA0JXkIjL5GnCvG71226VpRfSP+uMjPQs3OzFGje3c3i0b4Zsg7Dl0f2QoLbqIjfh2WsYiw9cuxNHfIy8pLNcx7keavle3nMX2sYCnbtVavXVFXsAH+DZGeFavLlt1NoNzW4xFDzku5efOBDqTRxyZ76cy0TN1A29pr65UqqoU2BYV9RAYdAthcGPJucP9UHSPB7JMEIbui9XYl7FuJf2qrqpKmkXNwtXw3MiObpxyXFba7jc5UL/ibzo1Lk7pkVHeu1x+qeYPKSAC7xuh5jpfKMUKWa7hqfXlJMCsCFThf8ijDI8aekClG0+T6Cqwc0BHwXuGkHAMj948Hor9qoVGGOprDM5Q3EZ8ZdYfUa7vlrsx0rH9iYBTQyzLchqjWgNuUXp8J/r/tLBfvE7oO4l4eDVDcc32OeSLORKTcVyVNJ3lb1ubB+O+xLzzEHJMv8UYfkkefWCsMn2DbpXyzxAbU+QuHt4Hht6REUY+kqvCK4fwMzW1lhtN39PbgFuzRZ5UxVWhMkiM5aoO5lz+uqtyJNgohO6wAwePhtK8krtbBPkj6ndkpD2Plrt4OL1yoLTV0WTFp92h6YGlw0J9FYIg7k2w+1KfcYFYBVFbTeaicDs+PhnrULHPowUbAY2zszorSJ1oaR2juPn1U3WOciUudnC9Yo12xaEZzQmzqsVJqFToqmUpnXlP2/dPmigXmGm9jrl7RpDGKn2pN8chmBYTN6mPa4Le1tXx4yDjtOlwaAXwv/uk/Ua9ZvHx+YCRe7aEmOnFjEoeWlFjhsLWpjltm/IdhfaQ3pe9xLO0HPwuOSROv8rHWtPdtL6GJbgzKb0pwwB0bfoxa/6WrfsPV1GK6BfO+F2PmRS512JTFshWzzPjQJHBcUyGM8jokoeN+n8HqvJiTUo9JnXahke6yTP4/tshAtHaLBX7BzHpHbW1rl8qpoHbChfamfduhAv/0pgRbwTQK4i1BEleBlmvIHe9eIHzMRc3kmr88dcqWkyuxRqze1rl56i/Gx6qUAVEwWcR2BXufk3JClOwSNAJ+XGzYn81gvthoWUt2qVtIBe++xzp33T/x/CibItbvsSH55FkyvXjki1VLEvIzNlREs3r7BkmTeW2uFAadF9CswqotOftPCRJmf33BZglHLlFnfthcoAN4gqCJ4wW0Edhi3Mw5nVNfId75AVcYRXCZwlJaqsTb9fC6voLmtjhOl0laFyJM5oz8oDWuUMe+xPMDSso1fBwW6fTnZrdA16OSv9+QxBQh8g0+ecKszAux5cYG5GNB9n3tvU8hJLu2fz0MMH4EBRHlBY7+Rwvs5yqNxuzLipJA4cROaWpU3I3suox6oKNbbsgej4+7N4yldkRgtaSOaNLimYzLIcIEaGnuu4TKPso/vJI0tML8PMElM/u/ovOToMvw/LQZE21Uk5zX+boiou+RaO8hKiZqIFp2FmkSm/Ul4yKI5kFHqaf0LJINjR/4ymyVWTRRLP7QEfCn283BCnE4LnF4Zz3WJmldgfOs0xUHh37LNdfVDNY3oQ2zrC6Vxr4wOOnc7H9r43L+TPG7DW03/3MlT9MAlCnkaNPhNRptNwZyqngRbol8VaRdcWWKAvgv1gg1VPa2VmcuaD+eSNCWoUvlU8ywLpybhiZs/qsVF5lN1Te7akBmGz1KAZILMD5jK6zSv5hThbKEpO0dJz7tmOsdipZZ1Z3+poglNMrlNmQ27DBuYP92tqoF6d4pAFW6BsDLcz0tCV8h5bmQ15HyAUk9VyYSK2TBGdLneZ/sEQkFtp3QyKKZY/3FxPl+kR4VyWUx0KoJl+mv4nc1a9qsvSXWhGLi28Qhg35OTsfM91Q5zwbR4liO55D4rbaA6/jWN+LRgsm/WHmBQ8XlNE+H+WMhLyFkBHJU9e1HkIWQt26lUP93Obn77iMWvqQuR9y8uGDlO19ZYEe8LYUF2lkKhDo+OrDViL1tZpCZNtJ7uMEwsDcQBcXn1+aJRXpAABzAykEQAABqBiv7HEZ/sCAAAAAARZWg==' WHERE catalog = 'TPLP101' ;
+UPDATE albums SET keypoints = '/Td6WFoAAATm1rRGAgAhARYAAAB0L+Wj4AMCAnRdAEABDn2G8v5phHtjJvt87vJVOirph7vwoHypp7fJF+guMpRXnNURZ8qayOah7WSRGLTDct75GBgzEdok5+YIWYnHBwAv5n6PX6I6VUCifws58trajJGKoLIh6pI8jPuLMSOssg0QsNzFq/3pRRh4zx80Oo6v5w7qLM0Ge4Ybtn3P/BZ78wVvM+NAuGLr+Z3jZS8QEq5R8a4iGvgFHoN8SDLtwXNsrJXdNnIoYFe6y1I3sodbLJ9SE/cNJW+M7K9IV/oJb44SrtwbiBamwKozMjpvBp91CHy8Ynq/igVSjj3cbPn6k8iOW1vLT6hiFiOHfgMm5ikv/YBSNlRX+Z7pfuEJjIbE52wkkJ8qyEIfDba9bkYXz/HPQSN4FLa9sGNuMfREU/DacmtrYE6TdnU8AhI2ruYMoYCGL+bbQDEUUq4ykoI216BOLGKaOXBP+YO/F6IuNvDcMJZRI/z/NF0q4pljDY310qpdoxWbtNRcM0reHgvZgN6P3ZC7CkW+sCYBU5pQ0MdQWuScb/XX2IluCOG8XkDRTQU0BUzR0TUUQmS7gtlXPzxUtJZSRRa/LB2r0cLb41b07o/BAhxcVcotY/KiUqxVXHCaoHRp25QQyCxFMsqNp9mr02AyW8m7G7BayoWSo07tkEo1CWQXc9OalHhMMY6TiVyi1100pHbqszbYhx8bX4cNwVoTWPwEEPl9lUVG4TpZ6kO38UEfkQ0BauuehRQFYOXGMcewD+WDaiPfeIS8eVcQCN4zbn1rgTmsJIrfmSbaeGIM28PxWavgwLkimAO/xs/Z+XFOIuq3GSll8GtKzrG1T2xNxaqge908V5+9S1YA3yng4GrBWXIAAZAFgwYAAIkosu2xxGf7AgAAAAAEWVo=' WHERE catalog = '19075965221' ;
@@ -0,0 +1,11 @@
+set -e
+
+db_url="postgres://$VITALS_PSQL_USERNAME:$VITALS_PSQL_PASSWORD@$VITALS_PSQL_HOSTNAME:$VITALS_PSQL_PORT/$VITALS_PSQL_DATABASE"
+
+# a new db has no albums to budget, so skip starting the app
+if [[ $(psql "$db_url" -tAc 'SELECT count(*) FROM albums WHERE descriptor IS NOT NULL;') == 0 ]]; then
+    exit 0
+fi
+
+# keep at most VITALS_ALBUM_KEYPOINTS keypoints of every existing album, 256 by default
+flask budget-keypoints
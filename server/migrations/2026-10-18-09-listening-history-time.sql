@@ -0,0 +1 @@
+CREATE INDEX listening_history_username_time ON listening_history (username, time);
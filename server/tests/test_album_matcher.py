@@ -1,3 +1,4 @@
+import io
 import pathlib
 import flask
 import pytest
@@ -12,10 +13,10 @@ def test_test_matcher(runner):
     assert result.exit_code == 0
 
 
-def post_query(client=None, filename: str | pathlib.Path = None):
+def post_query(client=None, filename: str | pathlib.Path = None, **args):
     if filename is None:
         filename = queries_dir / 'SP-70040.what-is-beat.png'
-    url = flask.url_for('album_match.query_album_match')
+    url = flask.url_for('album_match.query_album_match', **args)
     with open(str(filename), 'rb') as file:
         return client.post(url, data={
             'query': file,
@@ -90,3 +91,138 @@ def test_QueryAlbumMatch_BasicQueries_MatchesCorrectly(testuser_client, query_fn
 
     album_match = response['albums'][0]
     assert q_catalog == album_match['catalog']
+
+
+@pytest.mark.parametrize('query_fname', queries_dir.iterdir())
+def test_QueryImage_BasicQueries_SameAsPerAlbumMatcher(app, query_fname):
+    """the stacked library index should rank the library the same way as one matcher per album"""
+    library = vitals.db.db_load_library('testuser')
+    queries = {query_fname.name: vitals.album_match.imread(str(query_fname), vitals.album_match.RESIZE_WIDTH * 3 // 2)}
+    *_, q_descriptor = queries[query_fname.name]
+    expected = vitals.benchmark.query_image_per_album(library, q_descriptor)
+    actual = vitals.album_match.query_image(library, queries, query_fname.name)
+    assert [(stat, album.catalog) for stat, album in actual] == [(stat, album.catalog) for stat, album in expected]
+
+
+def test_QueryAlbumMatch_K_ReturnsTopK(testuser_client):
+    """/query_album_match should only return the top k albums and a cursor to the rest"""
+    query_fname = next(queries_dir.iterdir())
+    response = post_query(filename=query_fname, client=testuser_client, k=1).json
+    assert len(response['albums']) == 1
+    assert response['cursor'] == 1
+    assert 0 < response['confidence'] <= 1
+
+
+def test_QueryAlbumMatch_Cursor_PagesThroughAllAlbums(testuser_client):
+    """following the cursor should return the same albums in the same order as one response without k"""
+    query_fname = next(queries_dir.iterdir())
+    expected = post_query(filename=query_fname, client=testuser_client).json
+    assert expected['cursor'] is None
+    albums = []
+    cursor = 0
+
+    while cursor is not None:
+        response = post_query(filename=query_fname, client=testuser_client, k=3, cursor=cursor).json
+        assert len(response['albums']) <= 3
+        albums.extend(response['albums'])
+        cursor = response['cursor']
+
+    assert albums == expected['albums']
+
+
+def test_QueryAlbumMatch_MinScore_DropsWeakMatches(testuser_client):
+    """/query_album_match should not return albums with fewer than min_score matches"""
+    query_fname = next(queries_dir.iterdir())
+    response = post_query(filename=query_fname, client=testuser_client, min_score=10).json
+    assert len(response['albums']) >= 1
+    assert all(album['matches_stat'] >= 10 for album in response['albums'])
+    assert response['cursor'] is None
+
+
+@pytest.mark.parametrize('args', [dict(k=0), dict(k='a'), dict(min_score=-1), dict(cursor='a')])
+def test_QueryAlbumMatch_BadArgs_ReturnsError(testuser_client, args):
+    """/query_album_match should reject invalid k, min_score and cursor"""
+    response = post_query(filename=next(queries_dir.iterdir()), client=testuser_client, **args)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('fname', ['album-covers-original/OL 5670.jpg', queries_dir / 'OL 5670.west-side-story.png'])
+def test_ImageSize_Header_SameAsDecoded(fname):
+    """the size read from the image header should be the decoded size"""
+    with open(fname, 'rb') as f:
+        data = f.read()
+    h, w = vitals.album_match.load_im_from_buffer(data).shape[:2]
+    assert vitals.album_match.image_size(data) == (w, h)
+    assert vitals.album_match.image_size(b'not an image') is None
+
+
+def test_Reduction_LargePhoto_StaysOverResizeWidth():
+    """the reduced decode should never be narrower than the resize width"""
+    assert vitals.album_match.reduction((4000, 3000), 225) == 8
+    assert vitals.album_match.reduction((600, 600), 225) == 2
+    assert vitals.album_match.reduction((300, 300), 225) == 1
+    assert vitals.album_match.reduction(None, 225) == 1
+
+
+def test_ReadBuffer_BytesIO_NoCopy():
+    """an in-memory upload should be viewed, not copied"""
+    stream = io.BytesIO(b'image')
+    buffer = vitals.album_match.read_buffer(stream)
+    stream.getbuffer()[0] = ord('I')
+    assert bytes(buffer) == b'Image'
+
+
+def test_QueryAlbumMatch_TooManyPixels_Returns413(app, testuser_client):
+    """/query_album_match should reject an oversized photo before decoding it"""
+    app.config['QUERY_MAX_PIXELS'] = 1000
+    response = post_query(filename=next(queries_dir.iterdir()), client=testuser_client)
+    assert response.status_code == 413
+    assert response.json['status'] == 413
+
+
+def test_QueryMaxBytes_UnderProxyLimit():
+    """an upload the server would reject should get through nginx, so the client gets the server's json 413"""
+    conf = (pathlib.Path(__file__).parents[2] / 'nginx' / 'nginx.conf').read_text()
+    limit = next(line.split()[1].rstrip(';') for line in conf.splitlines()
+                 if line.strip().startswith('client_max_body_size'))
+    assert limit.endswith('M')
+    assert vitals.album_match.QUERY_MAX_BYTES < int(limit[:-1]) * 2 ** 20
+
+
+def post_batch(client, filenames, **args):
+    url = flask.url_for('album_match.query_album_match_batch', **args)
+    files = [open(str(filename), 'rb') for filename in filenames]
+    try:
+        return client.post(url, data={'query': files})
+    finally:
+        for file in files:
+            file.close()
+
+
+def test_QueryAlbumMatchBatch_BasicQueries_MatchesEachInOrder(testuser_client):
+    """/user/album/query/batch should return the same result for each image as /user/album/query, in order"""
+    query_fnames = sorted(queries_dir.iterdir()) * 2
+    response = post_batch(testuser_client, query_fnames, k=3)
+    assert response.status_code == 200
+    results = response.json['results']
+    assert [result['filename'] for result in results] == [str(query_fname) for query_fname in query_fnames]
+
+    for query_fname, result in zip(query_fnames, results):
+        expected = post_query(filename=query_fname, client=testuser_client, k=3).json
+        assert {key: result[key] for key in expected} == expected
+
+
+def test_QueryAlbumMatchBatch_BadImage_ErrorInResults(testuser_client):
+    """a bad image should fail on its own without failing the rest of the batch"""
+    response = post_batch(testuser_client, ['/dev/null', next(queries_dir.iterdir())])
+    assert response.status_code == 200
+    bad, good = response.json['results']
+    assert bad['status'] == 400
+    assert good['albums']
+
+
+def test_QueryAlbumMatchBatch_TooManyImages_Returns413(app, testuser_client):
+    """/user/album/query/batch should reject more images than it allows in one batch"""
+    app.config['BATCH_MAX_IMAGES'] = 1
+    response = post_batch(testuser_client, list(queries_dir.iterdir())[:1] * 2)
+    assert response.status_code == 413
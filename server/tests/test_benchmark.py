@@ -0,0 +1,59 @@
+import json
+import cv2 as cv
+import numpy as np
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def test_bench_library_index(runner):
+    result = runner.invoke(vitals.benchmark.bench_library_index, ['--sizes', '10,20', '--repeat', '1'],
+                           catch_exceptions=False)
+    assert result.exit_code == 0
+
+
+def test_bench_decode(runner):
+    result = runner.invoke(vitals.benchmark.bench_decode, ['--megapixels', '1', '--repeat', '1'],
+                           catch_exceptions=False)
+    assert result.exit_code == 0
+
+
+def test_bench_matcher(runner, fresh_db, tmp_path):
+    output = tmp_path / 'report.json'
+    result = runner.invoke(vitals.benchmark.bench_matcher, [str(queries_dir), '--output', str(output)],
+                           catch_exceptions=False)
+    assert result.exit_code == 0
+    report = json.loads(output.read_text())
+    assert report['queries'] == len(list(queries_dir.iterdir()))
+    assert report['top1'] == report['top5'] == report['mrr'] == 1
+    assert set(report['stages_ms']) == {'decode', 'extract', 'load', 'match'}
+    assert report['latency_ms']['p50'] <= report['latency_ms']['p99']
+
+
+def test_bench_matcher_UnusableQuery_Rejected(runner, fresh_db, tmp_path):
+    """a photo that fails the quality gate should count as a rejected miss instead of stopping the run"""
+    queries = tmp_path / 'queries'
+    queries.mkdir()
+    for query_fname in queries_dir.iterdir():
+        (queries / query_fname.name).write_bytes(query_fname.read_bytes())
+    (queries / 'OL 5670.blank.png').write_bytes(cv.imencode('.png', np.full((300, 400), 128, np.uint8))[1].tobytes())
+    output = tmp_path / 'report.json'
+    result = runner.invoke(vitals.benchmark.bench_matcher, [str(queries), '--output', str(output)],
+                           catch_exceptions=False)
+    assert result.exit_code == 0
+    report = json.loads(output.read_text())
+    assert report['queries'] == len(list(queries_dir.iterdir())) + 1
+    assert report['rejected'] == 1
+    assert [(result['rank'], result['error']) for result in report['results']
+            if result['query'] == 'OL 5670.blank.png'] == [(None, 'blank')]
+    assert set(report['stages_ms']) == {'decode', 'extract', 'load', 'match'}
+
+
+def test_bench_projection(runner):
+    result = runner.invoke(vitals.benchmark.bench_projection, [str(queries_dir), '--dims', '32', '--repeat', '1'],
+                           catch_exceptions=False)
+    assert result.exit_code == 0
+    header, full, projected = result.output.splitlines()
+    assert '100.0%' in full
+    assert 'smaller' in projected
@@ -0,0 +1,74 @@
+import cv2 as cv
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def photo_of(cover, corners, size=(450, 338)):
+    """returns a plain photo with the cover warped onto the corners"""
+    photo = np.full((size[1], size[0], 3), 128, np.uint8)
+    h, w = cover.shape[:2]
+    transform = cv.getPerspectiveTransform(np.float32([[0, 0], [w, 0], [w, h], [0, h]]), np.float32(corners))
+    mask = cv.warpPerspective(np.full((h, w), 255, np.uint8), transform, size)
+    photo[mask > 0] = cv.warpPerspective(cover, transform, size)[mask > 0]
+    return photo
+
+
+def test_FindSleeve_PlainBackground_FindsCorners():
+    """the corners of a sleeve on a plain background should be found in clockwise order"""
+    cover = cv.imread('album-covers-original/06・5P-74.jpg')
+    corners = [[120, 60], [330, 80], [310, 290], [100, 270]]
+    found = vitals.crop.find_sleeve(cv.cvtColor(photo_of(cover, corners), cv.COLOR_BGR2GRAY))
+    assert found is not None
+    assert np.abs(found - corners).max() < 8
+
+
+def test_FindSleeve_NoSleeve_None():
+    gray = np.full((338, 450), 128, np.uint8)
+    cv.circle(gray, (225, 169), 100, 255, -1)
+    assert vitals.crop.find_sleeve(gray) is None
+
+
+def test_CropSleeve_NoSleeve_ResizesWholePhoto():
+    """a photo without a sleeve should fall back to the whole photo at the fallback width"""
+    gray = np.full((338, 450), 128, np.uint8)
+    img, cropped, found = vitals.crop.crop_sleeve(None, gray, 150, 225)
+    assert img is None
+    assert not found
+    assert cropped.shape == (169, 225)
+
+
+def test_Rectify_Square():
+    img = np.zeros((338, 450, 3), np.uint8)
+    corners = vitals.crop.order_corners([[310, 290], [120, 60], [100, 270], [330, 80]])
+    assert corners.tolist() == [[120, 60], [330, 80], [310, 290], [100, 270]]
+    cropped_img, cropped_gray = vitals.crop.rectify(img, img[..., 0], corners, 150)
+    assert cropped_img.shape == (150, 150, 3)
+    assert cropped_gray.shape == (150, 150)
+
+
+def test_DecodeQueryImage_Crop_SignatureOfWholeSleeve(app):
+    """the color image of a found sleeve should be all sleeve, and that of a photo without one its center 2/3"""
+    app.config.update(QUERY_CROP=1, SIGNATURE_CANDIDATES=3, QUALITY_GATE=0)
+    cover = cv.imread('album-covers-original/06・5P-74.jpg')
+    photo = photo_of(cover, [[120, 60], [330, 80], [310, 290], [100, 270]])
+    (img, gray), _ = vitals.album_match.decode_query_image(cv.imencode('.png', photo)[1].tobytes())
+    width = vitals.album_match.RESIZE_WIDTH
+    assert img.shape == (width, width, 3)
+
+    (img, gray), _ = vitals.album_match.decode_query_image(cv.imencode('.png', np.full_like(photo, 128))[1].tobytes())
+    assert img.shape[:2] == (int(gray.shape[0] * 2 / 3), int(gray.shape[1] * 2 / 3))
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryAlbumMatch_Crop_MatchesCorrectly(app, testuser_client, query_fname):
+    """cropping the sleeve should still find the query album"""
+    app.config['QUERY_CROP'] = 1
+    q_catalog, *_ = query_fname.name.split('.')
+    with open(query_fname, 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    assert response.json['albums'][0]['catalog'] == q_catalog
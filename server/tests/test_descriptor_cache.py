@@ -0,0 +1,84 @@
+import time
+import numpy as np
+import pytest
+import vitals
+
+
+@pytest.fixture
+def cache(app):
+    return vitals.descriptor_cache.DescriptorCache()
+
+
+def fail_db_load(*args, **kwargs):
+    raise RuntimeError('the db should not be loaded')
+
+
+def test_LoadLibrary_SameAsDb(cache):
+    """the cached library should have the same albums and descriptors as the db library"""
+    library = cache.load_library('testuser')
+    db_library = vitals.db.db_load_library('testuser')
+    assert set(library) == set(db_library)
+
+    for catalog, album in library.items():
+        assert np.array_equal(album.descriptor, db_library[catalog].descriptor)
+
+
+def test_LoadLibrary_Warm_SkipsDb(cache, monkeypatch):
+    """a warm library load should not go to the db"""
+    library = cache.load_library('testuser')
+    monkeypatch.setattr(vitals.db, 'db_load_collection', fail_db_load)
+    monkeypatch.setattr(vitals.db, 'db_load_albums', fail_db_load)
+    assert cache.load_library('testuser') == library
+
+
+def test_LoadLibrary_InvalidateAlbum_ReloadsAlbum(cache, monkeypatch):
+    """an invalidated album should be loaded from the db again"""
+    library = cache.load_library('testuser')
+    catalog = next(iter(library))
+    cache.invalidate_album(catalog)
+    loaded = []
+
+    def db_load_albums(catalogs, extractor, projected):
+        loaded.extend(catalogs)
+        return {catalog: library[catalog] for catalog in catalogs}
+
+    monkeypatch.setattr(vitals.db, 'db_load_albums', db_load_albums)
+    cache.load_library('testuser')
+    assert loaded == [catalog]
+
+
+def test_LoadLibrary_SmallBudget_StaysUnderBudget(cache):
+    """the cache should evict least recently used albums to stay under its memory budget"""
+    library = cache.load_library('testuser')
+    nbytes = [vitals.descriptor_cache.album_nbytes(album) for album in library.values()]
+    cache.clear()
+    cache.max_bytes = max(nbytes)
+    assert len(cache.load_library('testuser')) == len(library)
+    assert cache.nbytes <= cache.max_bytes
+    assert len(cache.albums) < len(library)
+
+
+def test_LoadLibraryIndex_ListenChanges_ChangeElsewhereDropsIndex(app, fresh_db, monkeypatch):
+    """a change to an album made by another process should drop the indexes cached by a web worker"""
+    monkeypatch.setattr(vitals.descriptor_cache, 'LISTEN_TIMEOUT_SECONDS', 0.1)
+    app.config['LISTEN_CHANGES'] = 1
+    cache = vitals.descriptor_cache.descriptor_cache
+    with app.app_context():
+        stopped = vitals.descriptor_cache.start_listener(app)
+        try:
+            assert vitals.descriptor_cache.start_listener(app) is stopped
+            # let the listener connect first, it clears the cache
+            time.sleep(0.5)
+            vitals.album_match.load_library_index('testuser')
+            assert cache.indexes
+            db = vitals.db.get_db()
+            db.execute("UPDATE albums SET title = 'changed' WHERE catalog = 'TPLP101';")
+            db.commit()
+
+            deadline = time.monotonic() + 5
+            while cache.indexes and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert not cache.indexes
+        finally:
+            stopped.set()
+            time.sleep(0.2)
@@ -50,3 +50,77 @@ def test_codegen(fresh_db, fs_library):
             .execute('SELECT descriptor FROM albums WHERE catalog = %s', (catalog, )).fetchone().descriptor
         db_descriptor = vitals.encode.decode(db_descriptor)
         assert np.array_equal(descriptor, db_descriptor)
+
+
+def test_EncodeDescriptors_SiftOnly_StoredBare(fs_library):
+    """sift-only descriptors should be stored the way they were before extractors could be chosen"""
+    *_, descriptor = next(iter(fs_library.values()))
+    stored = vitals.encode.encode_descriptors({'sift': descriptor})
+    assert np.array_equal(vitals.encode.decode(stored), descriptor)
+    assert np.array_equal(vitals.encode.decode_descriptors(stored)['sift'], descriptor)
+
+
+def test_EncodeDescriptors_SideBySide_RecordsExtractor(app):
+    """descriptors of several extractors should be stored side by side under their extractor"""
+    descriptors = {
+        'sift': np.ones((2, 128), dtype=np.float32),
+        'orb': np.ones((3, 32), dtype=np.uint8),
+    }
+    decoded = vitals.encode.decode_descriptors(vitals.encode.encode_descriptors(descriptors))
+    assert set(decoded) == set(descriptors)
+
+    for extractor, descriptor in descriptors.items():
+        assert np.array_equal(decoded[extractor], descriptor)
+
+
+def test_BackfillDescriptors_Orb_SideBySide(fresh_db, runner):
+    """backfilling an extractor should keep the existing descriptors and add the new ones"""
+    sift_library = vitals.db.db_load_library('testuser')
+    result = runner.invoke(vitals.encode.backfill_descriptors, ['--extractor', 'orb'], catch_exceptions=False)
+    assert result.exit_code == 0
+    orb_library = vitals.db.db_load_library('testuser', 'orb')
+
+    for catalog, album in vitals.db.db_load_library('testuser').items():
+        assert np.array_equal(album.descriptor, sift_library[catalog].descriptor)
+        assert orb_library[catalog].descriptor.dtype == np.uint8
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'float16'])
+def test_EncodeDescriptors_Compact_SameValues(fs_library, dtype):
+    """sift descriptors should be stored in the compact dtype without changing any value"""
+    *_, descriptor = next(iter(fs_library.values()))
+    decoded = vitals.encode.decode(vitals.encode.encode_descriptors({'sift': descriptor}, dtype))
+    assert decoded.dtype == dtype
+    assert np.array_equal(decoded, descriptor)
+
+
+def test_Compact_Inexact_Unchanged():
+    """descriptors that the dtype cannot hold exactly should be kept as they are"""
+    descriptor = np.full((2, 128), 0.5, dtype=np.float32)
+    assert vitals.features.compact(descriptor, 'sift', 'uint8') is descriptor
+
+
+def test_ReencodeDescriptors_Float32_Compacted(app, fresh_db, runner):
+    """re-encoding should compact albums stored before descriptors were compact"""
+    library = vitals.db.db_load_library('testuser')
+    db = vitals.db.get_db()
+    for catalog, album in library.items():
+        db.execute('UPDATE albums SET descriptor = %s WHERE catalog = %s;',
+                   (vitals.encode.encode(album.descriptor.astype(np.float32)), catalog))
+    db.commit()
+
+    result = runner.invoke(vitals.encode.reencode_descriptors, catch_exceptions=False)
+    assert f'reencoded {len(library)} albums' in result.output
+    for catalog, album in vitals.db.db_load_library('testuser').items():
+        assert album.descriptor.dtype == np.uint8
+        assert np.array_equal(album.descriptor, library[catalog].descriptor)
+
+
+def test_BudgetKeypoints_OverBudget_Recomputed(app, fresh_db, runner):
+    """albums over the budget should keep that many descriptor rows and their keypoints"""
+    result = runner.invoke(vitals.encode.budget_keypoints, ['--max-keypoints', '100'], catch_exceptions=False)
+    assert 'budgeted 0 albums' not in result.output
+
+    for album in vitals.db.db_load_library('testuser').values():
+        assert len(album.descriptor) <= 100
+        assert len(album.keypoints) == len(album.descriptor)
@@ -0,0 +1,67 @@
+import threading
+import cv2 as cv
+import flask
+import numpy as np
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def test_GetExtractor_SameThread_Reused(app):
+    """a thread should get the same extractor back for the same options"""
+    assert vitals.features.get_extractor('sift') is vitals.features.get_extractor('sift')
+    assert vitals.features.get_extractor('sift') is not vitals.features.get_extractor('sift', {'nfeatures': 10})
+
+
+def test_GetExtractor_OtherThread_OwnExtractor(app):
+    """threads should not share an extractor"""
+    extractors = []
+    thread = threading.Thread(target=lambda: extractors.append(vitals.features.get_extractor('sift')))
+    thread.start()
+    thread.join()
+    assert extractors[0] is not vitals.features.get_extractor('sift')
+
+
+def test_DetectAndCompute_NFeatures_CapsKeypoints(app):
+    """nfeatures should cap the keypoints of a busy image. unsupported options should be ignored."""
+    gray = cv.imread('album-covers-original/06・5P-74.jpg', cv.IMREAD_GRAYSCALE)
+    keypoints, _ = vitals.features.detect_and_compute(gray, 'sift')
+    capped, descriptor = vitals.features.detect_and_compute(gray, 'sift', {'nfeatures': 50, 'threshold': 0.1})
+    assert len(keypoints) > 100
+    assert 50 <= len(capped) < 100
+    assert len(descriptor) == len(capped)
+
+
+def test_Anms_BusyCorner_SpreadsKeypoints():
+    """anms should not spend the budget on a cluster of strong keypoints"""
+    cluster = [cv.KeyPoint(x, y, 1, response=2.0 ** (x + y)) for x in range(10) for y in range(10)]
+    spread = [cv.KeyPoint(x, y, 1, response=0.5) for x in (50, 100, 150) for y in (50, 100, 150)]
+    keep = vitals.features.anms(cluster + spread, 10)
+    assert list(keep) == sorted(keep)
+    assert np.count_nonzero(keep >= len(cluster)) == len(spread)
+    assert len(cluster) - 1 in keep
+
+
+def test_Budget_KeepsDescriptorRows(app):
+    """the budgeted keypoints should keep their own descriptor rows"""
+    gray = cv.imread('album-covers-original/06・5P-74.jpg', cv.IMREAD_GRAYSCALE)
+    keypoints, descriptor = vitals.features.detect_and_compute(gray, 'sift')
+    budgeted, budgeted_descriptor = vitals.features.budget(keypoints, descriptor, 50)
+    assert len(budgeted) == len(budgeted_descriptor) == 50
+    rows = [keypoints.index(keypoint) for keypoint in budgeted]
+    assert np.array_equal(budgeted_descriptor, descriptor[rows])
+    assert vitals.features.budget(keypoints, descriptor, 0) == (keypoints, descriptor)
+
+
+def test_ParseOptions_IntsAndFloats():
+    options = vitals.features.parse_options('nfeatures=500,contrastThreshold=0.06')
+    assert options == dict(nfeatures=500, contrastThreshold=0.06)
+
+
+def test_QueryAlbumMatch_BasicQuery_ReportsKeypoints(app, testuser_client):
+    """/user/album/query should report how many keypoints the query photo had"""
+    app.config['QUERY_EXTRACTOR_OPTIONS'] = {'nfeatures': 20}
+    with open(next(queries_dir.iterdir()), 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    assert 20 <= int(response.headers['X-Vitals-Keypoints']) < 40
@@ -0,0 +1,256 @@
+import dataclasses
+import os
+import shutil
+import cv2 as cv
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+@pytest.fixture
+def shared_index_dir(app, tmp_path):
+    vitals.library_index.publish_shared_index(tmp_path)
+    app.config['DESCRIPTOR_INDEX_DIR'] = tmp_path
+    return tmp_path
+
+
+def load_query(query_fname):
+    *_, q_descriptor = vitals.album_match.imread(str(query_fname), vitals.album_match.RESIZE_WIDTH * 3 // 2)
+    return q_descriptor
+
+
+def test_AttachSharedIndex_NotPublished_None(tmp_path):
+    """attaching before anything is published should return None"""
+    assert vitals.library_index.attach_shared_index(tmp_path) is None
+
+
+def test_AttachSharedIndex_Published_ReadOnly(shared_index_dir):
+    """workers should map the published descriptors read-only"""
+    index = vitals.library_index.attach_shared_index(shared_index_dir)
+    assert isinstance(index.descriptors, np.memmap)
+    assert not index.descriptors.flags.writeable
+    assert vitals.library_index.attach_shared_index(shared_index_dir) is index
+
+
+def test_AttachSharedIndex_Republished_Reattaches(shared_index_dir):
+    """a worker should pick up a newly published index"""
+    index = vitals.library_index.attach_shared_index(shared_index_dir)
+    vitals.library_index.publish_shared_index(shared_index_dir)
+    assert vitals.library_index.attach_shared_index(shared_index_dir) is not index
+
+
+def test_PublishSharedIndex_Republished_KeepsPreviousVersion(shared_index_dir):
+    """a publish should keep the version it replaces for workers that read it just before the swap"""
+    first = os.readlink(shared_index_dir / 'current')
+    second = vitals.library_index.publish_shared_index(shared_index_dir)
+    assert {first, second} <= set(os.listdir(shared_index_dir))
+    third = vitals.library_index.publish_shared_index(shared_index_dir)
+    assert first not in os.listdir(shared_index_dir)
+    assert os.readlink(shared_index_dir / 'current') == third
+    assert {second, third} <= set(os.listdir(shared_index_dir))
+
+
+def test_AttachSharedIndex_VersionDeleted_FallsBackToUserIndex(shared_index_dir):
+    """a worker that finds the current version already deleted should match the user's own index"""
+    shutil.rmtree(shared_index_dir / os.readlink(shared_index_dir / 'current'))
+    assert vitals.library_index.attach_shared_index(shared_index_dir) is None
+    index = vitals.album_match.load_library_index('testuser')
+    assert index.masked_from is None
+    assert len(index.albums) == len(vitals.db.db_load_collection('testuser'))
+
+
+@pytest.mark.parametrize('username', ['testuser', 'emptyuser'])
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_LoadLibraryIndex_Shared_SameAsPerProcess(shared_index_dir, username, query_fname):
+    """the shared index masked to the user's collection should rank the same as the user's own library"""
+    q_descriptor = load_query(query_fname)
+    shared = vitals.album_match.load_library_index(username)
+    library = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library(username))
+    expected = [(stat, album.catalog) for stat, album in library.rank(library.votes(q_descriptor))]
+    assert sorted(album.catalog for album in shared.albums) == sorted(catalog for _, catalog in expected)
+    assert sorted(
+        (stat, album.catalog) for stat, album in shared.rank(shared.votes(q_descriptor))) == sorted(expected)
+
+
+def test_LoadLibraryIndex_Shared_Cached(shared_index_dir):
+    """the user's masked index should be cached with its trained matchers until the collection changes"""
+    index = vitals.album_match.load_library_index('testuser')
+    assert vitals.album_match.load_library_index('testuser') is index
+    vitals.descriptor_cache.descriptor_cache.invalidate_collections()
+    assert vitals.album_match.load_library_index('testuser') is not index
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_LoadLibraryIndex_AlbumNotPublished_Matched(app, monkeypatch, tmp_path, query_fname):
+    """albums added after the shared index was published should still be matched"""
+    q_catalog, *_ = query_fname.name.split('.')
+    db_load_albums = vitals.db.db_load_albums
+    monkeypatch.setattr(vitals.db, 'db_load_albums', lambda *args, **kwargs: {
+        catalog: album for catalog, album in db_load_albums(*args, **kwargs).items() if catalog != q_catalog})
+    vitals.library_index.publish_shared_index(tmp_path)
+    monkeypatch.setattr(vitals.db, 'db_load_albums', db_load_albums)
+    app.config['DESCRIPTOR_INDEX_DIR'] = tmp_path
+
+    index = vitals.album_match.load_library_index('testuser')
+    assert index.masked_from is vitals.library_index.attach_shared_index(tmp_path)
+    assert sorted(album.catalog for album in index.albums) == sorted(vitals.db.db_load_collection('testuser'))
+    assert index.rank(index.votes(load_query(query_fname)))[0][1].catalog == q_catalog
+
+
+def test_ReencodeDescriptors_Shared_Republished(app, fresh_db, runner, shared_index_dir):
+    """rewriting descriptors should publish the shared index again"""
+    version = os.readlink(shared_index_dir / 'current')
+    db = vitals.db.get_db()
+    album = next(iter(vitals.db.db_load_library('testuser').values()))
+    db.execute('UPDATE albums SET descriptor = %s WHERE catalog = %s;',
+               (vitals.encode.encode(album.descriptor.astype(np.float32)), album.catalog))
+    db.commit()
+    runner.invoke(vitals.encode.reencode_descriptors, catch_exceptions=False)
+    assert os.readlink(shared_index_dir / 'current') != version
+
+
+@pytest.mark.parametrize('shared_match_fraction', [0, 1])
+def test_Masked_SharedOrCopied_SameVotes(app, monkeypatch, shared_match_fraction):
+    """masking should give the same votes whether it shares the matrix or copies out the rows"""
+    monkeypatch.setattr(vitals.library_index, 'SHARED_MATCH_FRACTION', shared_match_fraction)
+    library = vitals.db.db_load_library('testuser')
+    index = vitals.library_index.LibraryIndex.from_library(library)
+    catalogs = list(library)[::2]
+    q_descriptor = load_query(next(queries_dir.iterdir()))
+    masked = index.masked(catalogs)
+    votes = index.votes(q_descriptor)
+    assert [album.catalog for album in masked.albums] == catalogs
+    assert list(masked.votes(q_descriptor)) == [votes[index.positions[catalog]] for catalog in catalogs]
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_Masked_SharedOrCopied_SameFlannVotes(app, monkeypatch, query_fname):
+    """flann should not let the rows outside a shared mask take the query's nearest neighbours, even after the index
+    it is masked out of has trained its own matcher"""
+    library = vitals.db.db_load_library('testuser')
+    index = vitals.library_index.LibraryIndex.from_library(library)
+    catalogs = list(library)[::2]
+    q_descriptor = load_query(query_fname)
+    matcher = vitals.library_index.get_matcher('flann')
+    index.votes(q_descriptor, matcher)
+
+    monkeypatch.setattr(vitals.library_index, 'SHARED_MATCH_FRACTION', 1)
+    copied = index.masked(catalogs)
+    monkeypatch.setattr(vitals.library_index, 'SHARED_MATCH_FRACTION', 0)
+    shared = index.masked(catalogs)
+    assert copied.descriptors is not index.descriptors and shared.descriptors is index.descriptors
+    # the kd-trees are randomized, so both are trained from the same seed
+    cv.setRNGSeed(0)
+    shared_votes = shared.votes(q_descriptor, matcher)
+    cv.setRNGSeed(0)
+    assert list(shared_votes) == list(copied.votes(q_descriptor, matcher))
+    assert shared.trained_matchers is not index.trained_matchers
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_Votes_Flann_MatchesCorrectly(app, query_fname):
+    """the approximate matcher should still rank the query album first"""
+    q_catalog, *_ = query_fname.name.split('.')
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    matcher = vitals.library_index.get_matcher('flann', trees=4, checks=64)
+    _, album = index.rank(index.votes(load_query(query_fname), matcher))[0]
+    assert album.catalog == q_catalog
+
+
+def test_Votes_Flann_TrainedOnce(app):
+    """the approximate matcher should be trained once per index"""
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    matcher = vitals.library_index.get_matcher('flann')
+    q_descriptor = load_query(next(queries_dir.iterdir()))
+    index.votes(q_descriptor, matcher)
+    trained_matchers = dict(index.trained_matchers)
+    index.votes(q_descriptor, matcher)
+    assert len(trained_matchers) == 1
+    assert index.trained_matchers == trained_matchers
+
+
+def test_QueryAlbumMatch_FlannMatcher_MatchesCorrectly(app, testuser_client):
+    """/user/album/query should use the configured matcher backend"""
+    app.config['MATCHER'] = 'flann'
+    query_fname = next(queries_dir.iterdir())
+    q_catalog, *_ = query_fname.name.split('.')
+    with open(query_fname, 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    assert response.json['albums'][0]['catalog'] == q_catalog
+
+
+@pytest.mark.parametrize('extractor', ['orb', 'akaze'])
+@pytest.mark.parametrize('matcher', ['bf', 'flann'])
+def test_QueryImage_BinaryExtractor_MatchesCorrectly(app, extractor, matcher):
+    """binary descriptors should be matched with hamming distance. they are not robust enough at this resolution for
+    the oblique query, so only the straight-on query is checked."""
+    library = vitals.album_match.get_filesystem_library('album-covers-original', vitals.album_match.RESIZE_WIDTH,
+                                                        extractor)
+    library = {
+        fname: vitals.db.Album(catalog=fname, title=fname, artist=fname, descriptor=descriptor)
+        for fname, (_, _, _, descriptor) in library.items()
+    }
+    query_fname = 'OL 5670.west-side-story.png'
+    queries = {
+        query_fname: vitals.album_match.imread(str(queries_dir / query_fname),
+                                               vitals.album_match.RESIZE_WIDTH * 3 // 2, extractor),
+    }
+    index = vitals.library_index.LibraryIndex.from_library(library, extractor)
+    assert index.norm == cv.NORM_HAMMING
+
+    all_matches = vitals.album_match.query_image(index, queries, query_fname, vitals.library_index.get_matcher(matcher))
+    _, album = all_matches[0]
+    assert album.catalog == 'OL 5670.jpg'
+
+
+def test_AttachSharedIndex_Published_HasPoints(shared_index_dir):
+    """the shared index should keep the keypoint geometry of every descriptor row"""
+    index = vitals.library_index.attach_shared_index(shared_index_dir)
+    library = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_albums())
+    assert np.array_equal(index.points, library.points, equal_nan=True)
+
+
+@pytest.mark.parametrize('k', [0, 1, 3, 10])
+def test_TopK_Ties_SameAsStableSort(k):
+    """the partial sort should pick and order the same positions as a full stable sort"""
+    scores = np.array([3, 1, 3, 0, 2, 3, 1])
+    assert list(vitals.library_index.top_k(scores, k)) == list(np.argsort(-scores, kind='stable')[:k])
+
+
+@pytest.mark.parametrize('matcher_name', ['bf', 'flann'])
+def test_Matches_Sharded_SameAsUnsharded(app, monkeypatch, matcher_name):
+    """splitting the match across shards should give the same matches"""
+    monkeypatch.setattr(vitals.library_index, 'MIN_SHARD_LIBRARY_ROWS', 100)
+    monkeypatch.setattr(vitals.library_index, 'MIN_SHARD_QUERY_ROWS', 10)
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    matcher = vitals.library_index.get_matcher(matcher_name)
+    q_descriptor = load_query(next(queries_dir.iterdir()))
+    rows, q_rows = index.matches(q_descriptor, matcher)
+    assert len(matcher.shards(index, q_descriptor, 4)) == 4
+    sharded_rows, sharded_q_rows = index.matches(q_descriptor, matcher, shards=4)
+    assert sorted(zip(rows, q_rows)) == sorted(zip(sharded_rows, sharded_q_rows))
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'float16'])
+def test_Votes_Compact_SameAsFloat32(app, monkeypatch, dtype):
+    """compact descriptors upcast in blocks should give the same votes as float32 descriptors"""
+    monkeypatch.setattr(vitals.library_index, 'BLOCK_ROWS', 100)
+    library = vitals.db.db_load_library('testuser')
+    float32_index = vitals.library_index.LibraryIndex.from_library({
+        catalog: dataclasses.replace(album, descriptor=album.descriptor.astype(np.float32))
+        for catalog, album in library.items()
+    })
+    index = vitals.library_index.LibraryIndex.from_library({
+        catalog: dataclasses.replace(album, descriptor=album.descriptor.astype(dtype))
+        for catalog, album in library.items()
+    })
+    assert index.descriptors.dtype == dtype
+    assert index.nbytes < float32_index.nbytes
+
+    for query_fname in queries_dir.iterdir():
+        q_descriptor = load_query(query_fname)
+        assert list(index.votes(q_descriptor)) == list(float32_index.votes(q_descriptor))
@@ -0,0 +1,106 @@
+import threading
+import flask
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+@pytest.fixture
+def jobs_db(app, fresh_db):
+    stopped = threading.Event()
+    worker = threading.Thread(target=vitals.match_jobs.work, args=(app, 2, stopped))
+    worker.start()
+    yield
+    stopped.set()
+    worker.join()
+
+
+def submit_job(client, filename, **args):
+    with open(str(filename), 'rb') as file:
+        return client.post(flask.url_for('match_jobs.submit_match_job', **args), data={'query': file})
+
+
+def poll_job(client, job_id, wait=10):
+    return client.get(flask.url_for('match_jobs.poll_match_job', job_id=job_id, wait=wait))
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_MatchJob_BasicQuery_SameAsQuery(jobs_db, testuser_client, query_fname):
+    """a finished job should hold the same result as /user/album/query"""
+    response = submit_job(testuser_client, query_fname, k=3)
+    assert response.status_code == 202
+    job = poll_job(testuser_client, response.json['job_id']).json
+    assert job['status'] == 'done'
+    expected = testuser_client.post(flask.url_for('album_match.query_album_match', k=3),
+                                    data={'query': open(str(query_fname), 'rb')}).json
+    assert job['result'] == expected
+
+
+def test_MatchJob_BadImage_Failed(jobs_db, testuser_client):
+    """a job with a bad image should fail with the error"""
+    job_id = submit_job(testuser_client, '/dev/null').json['job_id']
+    job = poll_job(testuser_client, job_id).json
+    assert job['status'] == 'failed'
+    assert job['result']['status'] == 400
+
+
+def test_MatchJob_OtherUser_NotFound(app, jobs_db, emptyuser_client):
+    """users should not see each other's jobs"""
+    with app.app_context():
+        db = vitals.db.get_db()
+        job_id = db.execute("INSERT INTO match_jobs(username) VALUES ('testuser') RETURNING id;").fetchone().id
+        db.commit()
+    assert poll_job(emptyuser_client, job_id, wait=0).status_code == 404
+
+
+def test_MatchJob_QueuedBeforeWorker_RunByWorker(app, fresh_db, testuser_client):
+    """jobs queued while no match worker ran should be run once one starts, and polls should not run them"""
+    query_fname = next(queries_dir.iterdir())
+    job_id = submit_job(testuser_client, query_fname, k=3).json['job_id']
+    assert poll_job(testuser_client, job_id, wait=1).json['status'] == 'queued'
+
+    stopped = threading.Event()
+    worker = threading.Thread(target=vitals.match_jobs.work, args=(app, 1, stopped))
+    worker.start()
+    try:
+        job = poll_job(testuser_client, job_id).json
+    finally:
+        stopped.set()
+        worker.join()
+    assert job['status'] == 'done'
+    assert job['result']['albums'][0]['catalog'] == query_fname.name.split('.')[0]
+
+
+def test_MatchJob_TimedOutWhileQueued_NotRun(app, fresh_db):
+    """workers should not start jobs that are already past their timeout"""
+    with app.app_context():
+        db = vitals.db.get_db()
+        db.execute("INSERT INTO match_jobs(username, created) "
+                   "VALUES ('testuser', CURRENT_TIMESTAMP - interval '1 hour');")
+        db.commit()
+    assert not vitals.match_jobs.run_next(app)
+
+
+def test_MatchJob_QueueFull_Returns503(app, jobs_db, testuser_client):
+    """submits should be rejected while the queue is full"""
+    app.config['MATCH_JOB_QUEUE_DEPTH'] = 0
+    assert submit_job(testuser_client, next(queries_dir.iterdir())).status_code == 503
+
+
+def test_MatchJob_TimedOut_FailedAndCleanedUp(app, jobs_db, testuser_client, runner):
+    """jobs that never finish should fail once they time out and be deleted after the retention period"""
+    app.config['MATCH_JOB_RETENTION_SECONDS'] = 0
+    with app.app_context():
+        db = vitals.db.get_db()
+        job_id = db.execute("INSERT INTO match_jobs(username, created) "
+                            "VALUES ('testuser', CURRENT_TIMESTAMP - interval '1 hour') RETURNING id;").fetchone().id
+        db.commit()
+
+    job = poll_job(testuser_client, job_id, wait=0).json
+    assert job['status'] == 'failed'
+    assert job['result']['status'] == 504
+    result = runner.invoke(vitals.match_jobs.cleanup_match_jobs, catch_exceptions=False)
+    assert result.exit_code == 0
+    assert poll_job(testuser_client, job_id, wait=0).status_code == 404
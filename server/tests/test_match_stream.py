@@ -0,0 +1,126 @@
+import json
+import struct
+import cv2 as cv
+import flask
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def camera_frame(fname, width=320):
+    """returns the query as a low resolution jpeg camera frame"""
+    img = cv.imread(str(fname))
+    img = cv.resize(img, (width, width * img.shape[0] // img.shape[1]))
+    return cv.imencode('.jpg', img)[1].tobytes()
+
+
+def frames(*images):
+    return b''.join(struct.pack('!I', len(image)) + image for image in images)
+
+
+def post_stream(client, body, **args):
+    response = client.post(flask.url_for('match_stream.query_album_match_stream', **args), data=body,
+                           content_type='application/octet-stream')
+    return response, [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_QueryStream_SameFrames_SkippedUntilStable(app, testuser_client):
+    """repeated frames should be skipped and the stream should stop once the leader is stable"""
+    query_fname = next(queries_dir.iterdir())
+    q_catalog, *_ = query_fname.name.split('.')
+    response, lines = post_stream(testuser_client, frames(*[camera_frame(query_fname)] * 10), k=2)
+    assert response.status_code == 200
+    assert response.headers['X-Accel-Buffering'] == 'no'
+    assert len(lines) == app.config['STREAM_STABLE_FRAMES']
+    # the leader of the first frame is confirmed by matching the second
+    assert [line['skipped'] for line in lines] == [False, False] + [True] * (len(lines) - 2)
+    assert [line['stable'] for line in lines] == [False] * (len(lines) - 1) + [True]
+    assert lines[-1]['albums'][0]['catalog'] == q_catalog
+    assert len(lines[-1]['albums']) == 2
+
+
+def test_QueryStream_LoadsLibraryOnce(app, testuser_client, monkeypatch):
+    """every frame should be matched against the library index loaded for the stream"""
+    app.config['STREAM_SKIP_DIFFERENCE'] = 0
+    loads = []
+    load_library_index = vitals.album_match.load_library_index
+    monkeypatch.setattr(vitals.album_match, 'load_library_index',
+                        lambda username: loads.append(username) or load_library_index(username))
+    query_fnames = sorted(queries_dir.iterdir())
+    response, lines = post_stream(testuser_client, frames(*[camera_frame(fname) for fname in query_fnames * 2]))
+    assert loads == ['testuser']
+    assert len(lines) == app.config['STREAM_STABLE_FRAMES']
+    assert not any(line['skipped'] for line in lines)
+
+
+def test_QueryStream_BadFrame_ErrorLine(testuser_client):
+    """a bad frame should end the stream with an error line"""
+    query_fname = next(queries_dir.iterdir())
+    _, lines = post_stream(testuser_client, frames(camera_frame(query_fname), b'not an image'))
+    assert lines[-1] == {'frame': 1, 'status': 400, 'message': 'bad image provided'}
+
+    _, lines = post_stream(testuser_client, frames(camera_frame(query_fname))[:-10])
+    assert lines == [{'frame': 0, 'status': 400, 'message': 'frame is truncated'}]
+
+
+def test_Tracker_NewLeader_RestartsCount():
+    """a new leader should have to hold the lead for the stable frames again"""
+    albums = [vitals.db.Album(catalog, None, None) for catalog in ('A', 'B')]
+    tracker = vitals.match_stream.Tracker(stable_frames=2, smoothing=0.5)
+    tracker.update([(10, albums[0]), (2, albums[1])])
+    tracker.update([(0, albums[0]), (30, albums[1])])
+    assert tracker.leader == 'B' and not tracker.stable
+    tracker.update([(0, albums[0]), (30, albums[1])])
+    assert tracker.stable
+
+
+def test_Tracker_OneMatchedFrame_NotStable():
+    """a leader should need two matched frames however many skipped frames it leads"""
+    album = vitals.db.Album('A', None, None)
+    tracker = vitals.match_stream.Tracker(stable_frames=2)
+    tracker.update([(10, album)])
+    tracker.hold()
+    tracker.hold()
+    assert not tracker.stable and not tracker.confirmed
+    tracker.update([(10, album)])
+    assert tracker.stable
+
+
+def blurry_frame(fname):
+    img = cv.imread(str(fname))
+    return cv.imencode('.jpg', cv.GaussianBlur(cv.resize(img, (320, 320 * img.shape[0] // img.shape[1])),
+                                               (0, 0), 10))[1].tobytes()
+
+
+def test_QueryStream_BlurryFrame_SkippedWithReason(testuser_client):
+    """a frame that fails the quality gate should be skipped with its reason instead of ending the stream"""
+    query_fname = next(queries_dir.iterdir())
+    blurry = blurry_frame(query_fname)
+    _, lines = post_stream(testuser_client, frames(blurry, camera_frame(query_fname)))
+    assert lines[0]['skipped'] and lines[0]['reason'] == 'blurry'
+    assert not lines[1]['skipped'] and 'reason' not in lines[1]
+
+
+def test_QueryStream_MatchedThenBlurryFrames_NotStable(app, testuser_client):
+    """frames that fail the quality gate should not count towards a stable leader"""
+    app.config['STREAM_STABLE_FRAMES'] = 3
+    query_fname = next(queries_dir.iterdir())
+    _, lines = post_stream(testuser_client, frames(camera_frame(query_fname), *[blurry_frame(query_fname)] * 2))
+    assert len(lines) == 3
+    assert [line['skipped'] for line in lines] == [False, True, True]
+    assert not any(line['stable'] for line in lines)
+
+
+def test_QueryStream_VerifyCandidates_SmoothsRawMatches(app, testuser_client, monkeypatch):
+    """frames should be ranked by raw matches even with verification on, so that the smoothing has one unit"""
+    app.config['VERIFY_CANDIDATES'] = 3
+
+    def rank(*args, **kwargs):
+        raise AssertionError('stream frames should not be verified')
+
+    monkeypatch.setattr(vitals.verify, 'rank', rank)
+    query_fname = next(queries_dir.iterdir())
+    response, lines = post_stream(testuser_client, frames(camera_frame(query_fname)))
+    assert response.status_code == 200
+    assert lines[0]['albums'][0]['catalog'] == query_fname.name.split('.')[0]
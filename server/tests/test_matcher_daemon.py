@@ -0,0 +1,181 @@
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import flask
+import pytest
+import vitals
+from conftest import resources
+from test_album_matcher import post_batch
+from test_match_stream import camera_frame, frames, post_stream
+
+queries_dir = resources / 'queries'
+
+
+@pytest.fixture
+def daemon(app, fresh_db, tmp_path):
+    socket_path = str(tmp_path / 'matcher.sock')
+    server = vitals.matcher_daemon.create_server(app, socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    app.config['MATCHER_SOCKET'] = socket_path
+    yield server
+    server.shutdown()
+    vitals.matcher_daemon.close_server(server)
+    thread.join()
+
+
+def post_query(client, filename, **args):
+    with open(str(filename), 'rb') as file:
+        return client.post(flask.url_for('album_match.query_album_match', **args), data={'query': file})
+
+
+def test_Query_Daemon_SameAsInProcess(app, daemon, testuser_client, monkeypatch):
+    """the daemon should answer the same as matching in-process"""
+    query_fname = next(queries_dir.iterdir())
+    response = post_query(testuser_client, query_fname, k=3)
+    assert response.status_code == 200
+
+    app.config['MATCHER_SOCKET'] = None
+    assert post_query(testuser_client, query_fname, k=3).json == response.json
+
+
+def test_Query_BadImage_DaemonReturns400(daemon, testuser_client):
+    """the daemon's errors should be passed through"""
+    assert post_query(testuser_client, '/dev/null').status_code == 400
+
+
+def test_Query_DaemonDown_MatchesInProcess(app, fresh_db, testuser_client, tmp_path):
+    """queries should fall back to matching in-process when the daemon is not running"""
+    app.config['MATCHER_SOCKET'] = str(tmp_path / 'missing.sock')
+    response = post_query(testuser_client, next(queries_dir.iterdir()), k=1)
+    assert response.status_code == 200
+    assert len(response.json['albums']) == 1
+
+
+def test_Query_DaemonTimesOut_Returns503(app, daemon, testuser_client, monkeypatch):
+    """a daemon that accepts a query but does not answer in time should get a 503, not an in-process match"""
+    app.config['MATCHER_TIMEOUT_SECONDS'] = 0.2
+    handle_query = vitals.matcher_daemon.handle_query
+    monkeypatch.setattr(vitals.matcher_daemon, 'handle_query',
+                        lambda message, image: time.sleep(0.5) or handle_query(message, image))
+    monkeypatch.setattr(vitals.album_match, 'match_decoded_query', None)
+    response = post_query(testuser_client, next(queries_dir.iterdir()))
+    assert response.status_code == 503
+    assert response.json['message'] == 'matcher timed out, try again later'
+
+
+def test_Server_BusyThreads_QueriesWait(app, fresh_db, tmp_path, monkeypatch):
+    """the daemon should not match more queries at once than its threads"""
+    app.config['MATCHER_THREADS'] = 1
+    socket_path = str(tmp_path / 'matcher.sock')
+    server = vitals.matcher_daemon.create_server(app, socket_path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    running, most_running = [], []
+
+    def handle_query(message, image):
+        running.append(1)
+        most_running.append(len(running))
+        time.sleep(0.1)
+        running.pop()
+        return {'status': 200, 'body': {}, 'num_keypoints': 0}
+
+    monkeypatch.setattr(vitals.matcher_daemon, 'handle_query', handle_query)
+    clients = [threading.Thread(target=vitals.matcher_client.query, args=(socket_path, 'testuser', b'image'))
+               for _ in range(3)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    server.shutdown()
+    vitals.matcher_daemon.close_server(server)
+    assert most_running == [1, 1, 1]
+
+
+def test_Listen_AlbumUpdated_DropsIndex(app, daemon):
+    """a change to an album should drop the daemon's cached indexes"""
+    cache = vitals.descriptor_cache.descriptor_cache
+    with app.app_context():
+        # let the listener connect first, it clears the cache
+        time.sleep(0.5)
+        cache.load_library_index('testuser')
+        assert cache.indexes
+        db = vitals.db.get_db()
+        db.execute("UPDATE albums SET title = 'changed' WHERE catalog = 'TPLP101';")
+        db.commit()
+
+    deadline = time.monotonic() + 5
+    while cache.indexes and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not cache.indexes
+
+
+@pytest.fixture
+def handled(monkeypatch):
+    """the kinds of the messages the daemon handles"""
+    kinds = []
+    handle_query = vitals.matcher_daemon.handle_query
+    monkeypatch.setattr(vitals.matcher_daemon, 'handle_query',
+                        lambda message, image: kinds.append(message['kind']) or handle_query(message, image))
+    return kinds
+
+
+def test_QueryBatch_Daemon_SameAsInProcess(app, daemon, handled, testuser_client):
+    """every image of a batch should be matched by the daemon, with the same results as in-process"""
+    query_fnames = sorted(queries_dir.iterdir())
+    response = post_batch(testuser_client, query_fnames, k=3)
+    assert handled == ['query'] * len(query_fnames)
+
+    app.config['MATCHER_SOCKET'] = None
+    assert post_batch(testuser_client, query_fnames, k=3).json == response.json
+
+
+def test_QueryStream_Daemon_SameAsInProcess(app, daemon, handled, testuser_client):
+    """every frame of a stream should be matched by the daemon, with the same lines as in-process"""
+    query_fname = next(queries_dir.iterdir())
+    body = frames(*[camera_frame(query_fname)] * 10)
+    _, lines = post_stream(testuser_client, body, k=2)
+    assert handled == ['frame'] * len(lines)
+    assert lines[-1]['stable']
+
+    app.config['MATCHER_SOCKET'] = None
+    assert post_stream(testuser_client, body, k=2)[1] == lines
+
+
+def test_MatchJob_Daemon_MatchedByDaemon(app, daemon, handled, testuser_client):
+    """match workers should have the daemon match the jobs"""
+    query_fname = next(queries_dir.iterdir())
+    with app.app_context():
+        job_id = vitals.match_jobs.submit('testuser', query_fname.read_bytes(), 3)
+    assert vitals.match_jobs.run_next(app)
+    assert handled == ['query']
+    with app.app_context():
+        job = vitals.match_jobs.load(job_id, 'testuser')
+    assert job.status == 'done'
+    assert job.result == post_query(testuser_client, query_fname, k=3).json
+
+
+def test_Query_Daemon_WebProcessSkipsOpencv(daemon, tmp_path):
+    """a web worker whose queries the daemon matches should never load opencv"""
+    script = textwrap.dedent(f'''\
+        import sys
+        import flask
+        import vitals
+        app = vitals.wsgi.create_app(vitals_testing=True)
+        with app.test_request_context():
+            login_url = flask.url_for('user.user_login')
+            query_url = flask.url_for('album_match.query_album_match')
+        with app.test_client() as client:
+            client.post(login_url, json=dict(username='testuser', password='password'))
+            with open({str(next(queries_dir.iterdir()))!r}, 'rb') as file:
+                response = client.post(query_url, data={{'query': file}})
+        assert response.status_code == 200, response.json
+        assert 'cv2' not in sys.modules
+        ''')
+    result = subprocess.run([sys.executable, '-c', script], env={**os.environ, 'VITALS_MATCHER_SOCKET':
+                                                                 daemon.server_address},
+                            cwd=pathlib.Path(vitals.__file__).parent.parent, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def load_query(query_fname):
+    return {'query': vitals.album_match.imread(str(query_fname), vitals.album_match.RESIZE_WIDTH * 3 // 2)}
+
+
+def test_PriorCatalogs_History_CurrentAlbumThenRecentPlays(app, fresh_db):
+    """the current album should come first, then albums by their plays decayed by age"""
+    db = vitals.db.get_db()
+    catalogs = [album.catalog for album in vitals.db.db_load_library('testuser').values()][:3]
+    db.execute('UPDATE users SET current_album = %s WHERE username = %s;', (catalogs[2], 'testuser'))
+    for catalog, days in [(catalogs[0], 200), (catalogs[0], 200), (catalogs[0], 200), (catalogs[1], 1),
+                          (catalogs[2], 1)]:
+        db.execute("INSERT INTO listening_history(username, catalog, side, time) "
+                   "VALUES (%s, %s, 0, now() - %s * interval '1 day');", ('testuser', catalog, days))
+    db.commit()
+
+    # three plays 200 days ago count less than one yesterday
+    assert vitals.prior.prior_catalogs('testuser') == [catalogs[2], catalogs[1], catalogs[0]]
+    assert vitals.prior.prior_catalogs('emptyuser') == []
+    assert vitals.prior.load_prior('testuser') is None
+
+    app.config['PRIOR'] = 1
+    assert vitals.prior.load_prior('testuser').catalogs == [catalogs[2], catalogs[1], catalogs[0]]
+    assert vitals.prior.load_prior('emptyuser') is None
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryImage_PriorHit_ExitsEarly(app, query_fname):
+    """a query of an album at the top of the prior should match only the first tier, with the same best album and
+    matches as the whole library"""
+    q_catalog, *_ = query_fname.name.split('.')
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    queries = load_query(query_fname)
+    tier = [q_catalog, *[album.catalog for album in index.albums if album.catalog != q_catalog][:3]]
+    prior = vitals.prior.Prior(tier, [4, 8], min_matches=1)
+
+    rows, _ = prior.matches(index, queries['query'][3])
+    assert {index.albums[i].catalog for i in index.row_album[rows]} <= set(tier)
+
+    expected = vitals.album_match.query_image(index, queries, 'query')
+    all_matches = vitals.album_match.query_image(index, queries, 'query', prior=prior)
+    assert all_matches[0] == expected[0]
+    assert all_matches[0][1].catalog == q_catalog
+    assert all(matches_stat == 0 for matches_stat, album in all_matches if album.catalog not in tier)
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryImage_PriorMiss_SameResults(app, query_fname):
+    """when no tier passes, the prior should not change the matches or the results"""
+    q_catalog, *_ = query_fname.name.split('.')
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    queries = load_query(query_fname)
+    prior = vitals.prior.Prior([album.catalog for album in index.albums if album.catalog != q_catalog], [4, 8])
+
+    rows, q_rows = prior.matches(index, queries['query'][3])
+    expected_rows, expected_q_rows = index.matches(queries['query'][3])
+    assert np.array_equal(rows, expected_rows) and np.array_equal(q_rows, expected_q_rows)
+    assert vitals.album_match.query_image(index, queries, 'query', prior=prior) == \
+        vitals.album_match.query_image(index, queries, 'query')
@@ -0,0 +1,60 @@
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+@pytest.fixture
+def projected_db(fresh_db, runner):
+    vitals.projection.forget_projections()
+    result = runner.invoke(vitals.projection.train_projection, ['--dims', '32'], catch_exceptions=False)
+    assert result.exit_code == 0
+    yield
+    vitals.projection.forget_projections()
+
+
+def test_TrainProjection_ProjectsEveryAlbum(app, projected_db):
+    """training should store the projected descriptor of every album under the new projection"""
+    projection = vitals.projection.load_projection('sift')
+    assert projection.dims == 32
+
+    for album in vitals.db.db_load_albums().values():
+        assert album.projection == projection.id
+        assert album.projected.shape == (len(album.descriptor), 32)
+        assert np.array_equal(album.projected, projection.project(album.descriptor))
+
+
+def test_Train_Whiten_UnitVariance(app):
+    """whitened projections should give every dimension of the training rows unit variance"""
+    descriptors = [album.descriptor for album in vitals.db.db_load_albums().values()]
+    mean, components = vitals.projection.train(descriptors, 16, whiten=True)
+    projection = vitals.projection.Projection(None, 'sift', mean, components)
+    stacked, _ = vitals.library_index.stack_descriptors(descriptors)
+    variance = projection.project(stacked).astype(np.float32).var(axis=0)
+    assert np.allclose(variance, 1, atol=0.05)
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryAlbumMatch_Projection_MatchesCorrectly(app, projected_db, testuser_client, query_fname):
+    """matching in the projected space should still find the query album"""
+    app.config['PROJECTION'] = 1
+    q_catalog, *_ = query_fname.name.split('.')
+    with open(query_fname, 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    assert response.json['albums'][0]['catalog'] == q_catalog
+    index = vitals.descriptor_cache.descriptor_cache.load_library_index(
+        'testuser', vitals.projection.load_projection('sift'))
+    assert index.descriptors.shape[1] == 32
+
+
+def test_LoadLibrary_ProjectionOff_SkipsProjected(app, projected_db):
+    """cached albums should only hold their projected descriptors while the projection is in use"""
+    cache = vitals.descriptor_cache.DescriptorCache()
+    assert all(album.projected is None for album in cache.load_library('testuser').values())
+    nbytes = cache.nbytes
+    index = cache.load_library_index('testuser', vitals.projection.load_projection('sift'))
+    assert all(album.projected is not None for album in index.albums)
+    assert cache.nbytes > nbytes
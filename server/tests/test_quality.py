@@ -0,0 +1,60 @@
+import io
+import cv2 as cv
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def decoded_query(query_fname):
+    width = vitals.album_match.RESIZE_WIDTH * 3 // 2
+    return vitals.album_match.decode_image(query_fname.read_bytes(), resize_width=width, reduced=True, color=False)[1]
+
+
+def post_query(client, data):
+    return client.post(flask.url_for('album_match.query_album_match'), data={'query': (io.BytesIO(data), 'query.png')},
+                       content_type='multipart/form-data')
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_CheckImage_Query_Passes(query_fname):
+    assert vitals.quality.check_image(decoded_query(query_fname)) is None
+
+
+@pytest.mark.parametrize('degrade, reason', [
+    (lambda gray: cv.GaussianBlur(gray, (0, 0), 3), 'blurry'),
+    (lambda gray: cv.convertScaleAbs(gray, alpha=3, beta=80), 'overexposed'),
+    (lambda gray: cv.convertScaleAbs(gray, alpha=0.05), 'underexposed'),
+    (lambda gray: np.full_like(gray, 128), 'blank'),
+])
+def test_CheckImage_Degraded_Rejected(degrade, reason):
+    """blurred, badly exposed and blank photos should each be rejected with their reason"""
+    error = vitals.quality.check_image(degrade(decoded_query(next(queries_dir.iterdir()))))
+    assert error['status'] == 422
+    assert error['reason'] == reason
+
+
+def test_CheckKeypoints_FewKeypoints_Rejected():
+    assert vitals.quality.check_keypoints([cv.KeyPoint(0, 0, 1)] * vitals.quality.MIN_KEYPOINTS) is None
+    assert vitals.quality.check_keypoints([])['reason'] == 'few_features'
+
+
+def test_QueryAlbumMatch_BlurryPhoto_422BeforeExtraction(app, testuser_client, monkeypatch):
+    """a blurry photo should be rejected without extracting or matching it, unless the gate is off"""
+    extracted = []
+    extract_query = vitals.album_match.extract_query
+    monkeypatch.setattr(vitals.album_match, 'extract_query', lambda *args: extracted.append(1) or extract_query(*args))
+    img = cv.imread(str(next(queries_dir.iterdir())))
+    data = cv.imencode('.png', cv.GaussianBlur(img, (0, 0), 30))[1].tobytes()
+
+    response = post_query(testuser_client, data)
+    assert response.status_code == 422
+    assert response.json['reason'] == 'blurry'
+    assert not extracted
+
+    app.config['QUALITY_GATE'] = 0
+    assert post_query(testuser_client, data).status_code == 200
+    assert extracted
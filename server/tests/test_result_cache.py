@@ -0,0 +1,77 @@
+import io
+import cv2 as cv
+import flask
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def post_query(client, data):
+    return client.post(flask.url_for('album_match.query_album_match'), data={'query': (io.BytesIO(data), 'query.png')},
+                       content_type='multipart/form-data')
+
+
+def test_PerceptualHash_Reencoded_WithinRadius():
+    """recompressing and rescaling the photo should barely change its hash, another photo should"""
+    img = cv.imread(str(next(queries_dir.iterdir())), cv.IMREAD_GRAYSCALE)
+    q_hash = vitals.result_cache.perceptual_hash(img)
+    reencoded = cv.imdecode(cv.imencode('.jpg', cv.resize(img, None, fx=0.5, fy=0.5),
+                                        [cv.IMWRITE_JPEG_QUALITY, 50])[1], cv.IMREAD_GRAYSCALE)
+    other = cv.imread('album-covers-original/06・5P-74.jpg', cv.IMREAD_GRAYSCALE)
+    assert (vitals.result_cache.perceptual_hash(reencoded) ^ q_hash).bit_count() <= vitals.result_cache.RADIUS
+    assert (vitals.result_cache.perceptual_hash(other) ^ q_hash).bit_count() > vitals.result_cache.RADIUS
+
+
+def test_ResultCache_Get():
+    """a response should be found within the radius, for the same user, options and generation only"""
+    cache = vitals.result_cache.ResultCache(max_entries=2, radius=2)
+    cache.put('user', (1, 0, 0), 0b1111, 5, 'response')
+    assert cache.get('user', (1, 0, 0), 0b1111, 5) == 'response'
+    assert cache.get('user', (1, 0, 0), 0b0011, 5) == 'response'
+    assert cache.get('user', (1, 0, 0), 0b0001, 5) is None
+    assert cache.get('other', (1, 0, 0), 0b1111, 5) is None
+    assert cache.get('user', (2, 0, 0), 0b1111, 5) is None
+    assert cache.get('user', (1, 0, 0), 0b1111, 6) is None
+
+    cache.put('user', (1, 0, 0), 0b10000, 5, 'second')
+    cache.put('user', (1, 0, 0), 0b100000, 5, 'third')
+    assert len(cache.entries) == 2
+    assert cache.get('user', (1, 0, 0), 0b1111, 5) is None
+
+
+def test_QueryAlbumMatch_Repost_Cached(app, fresh_db, testuser_client, monkeypatch):
+    """reposting a photo should reuse its response until the library changes"""
+    extracted = []
+    extract_query = vitals.album_match.extract_query
+    monkeypatch.setattr(vitals.album_match, 'extract_query', lambda *args: extracted.append(1) or extract_query(*args))
+    data = next(queries_dir.iterdir()).read_bytes()
+
+    response = post_query(testuser_client, data)
+    assert post_query(testuser_client, data).json == response.json
+    assert len(extracted) == 1
+
+    vitals.descriptor_cache.descriptor_cache.invalidate_collections()
+    assert post_query(testuser_client, data).json == response.json
+    assert len(extracted) == 2
+
+
+def test_QueryAlbumMatch_PriorChanged_NotCached(app, fresh_db, testuser_client, monkeypatch):
+    """a response matched with the user's prior should not be reused once the prior changes"""
+    app.config['PRIOR'] = 1
+    extracted = []
+    extract_query = vitals.album_match.extract_query
+    monkeypatch.setattr(vitals.album_match, 'extract_query', lambda *args: extracted.append(1) or extract_query(*args))
+    data = next(queries_dir.iterdir()).read_bytes()
+
+    response = post_query(testuser_client, data)
+    assert post_query(testuser_client, data).json == response.json
+    assert len(extracted) == 1
+
+    with app.app_context():
+        db = vitals.db.get_db()
+        db.execute("UPDATE users SET current_album = %s WHERE username = 'testuser';",
+                   (next(iter(vitals.db.db_load_library('testuser'))), ))
+        db.commit()
+    post_query(testuser_client, data)
+    assert len(extracted) == 2
@@ -0,0 +1,59 @@
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def load_query_signature(query_fname):
+    q_img, *_ = vitals.album_match.imread(str(query_fname), vitals.album_match.RESIZE_WIDTH * 3 // 2)
+    return vitals.signature.compute_query(q_img)
+
+
+def test_LoadLibrary_TestData_HasSignatures(app):
+    """every test album should have a normalized signature"""
+    for album in vitals.db.db_load_library('testuser').values():
+        assert album.signature is not None
+        assert album.signature.sum() == pytest.approx(1)
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_Shortlist_BasicQueries_HasQueryAlbum(app, query_fname):
+    """the query album should be in a short candidate list"""
+    q_catalog, *_ = query_fname.name.split('.')
+    albums = list(vitals.db.db_load_library('testuser').values())
+    shortlist = vitals.signature.shortlist(albums, load_query_signature(query_fname), 3)
+    assert len(shortlist) == 3
+    assert q_catalog in shortlist
+
+
+def test_Shortlist_NoSignature_AlwaysCandidate(app):
+    """albums without a signature should always be matched"""
+    albums = [
+        vitals.db.Album('A', 'a', 'a', signature=np.array([1, 0], dtype=np.float32)),
+        vitals.db.Album('B', 'b', 'b', signature=np.array([0, 1], dtype=np.float32)),
+        vitals.db.Album('C', 'c', 'c'),
+    ]
+    assert vitals.signature.shortlist(albums, np.array([1, 0], dtype=np.float32), 1) == ['A', 'C']
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryAlbumMatch_SignatureCandidates_MatchesCorrectly(app, testuser_client, query_fname):
+    """/user/album/query should still rank the query album first when it only matches the shortlist"""
+    app.config['SIGNATURE_CANDIDATES'] = 3
+    q_catalog, *_ = query_fname.name.split('.')
+    with open(query_fname, 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    albums = response.json['albums']
+    assert albums[0]['catalog'] == q_catalog
+    assert len(albums) == len(vitals.db.db_load_library('testuser'))
+    assert all(album['matches_stat'] == 0 for album in albums[3:])
+
+
+def test_TestMatcher_SignatureCandidates_ReportsMisses(app, runner):
+    """test-matcher should report how often the query album is not in the signature shortlist"""
+    result = runner.invoke(args=['test-matcher', str(queries_dir), '--matcher', 'bf', '--signature-candidates', '1'])
+    assert result.exit_code == 0
+    assert 'missed' in result.output
@@ -0,0 +1,31 @@
+import flask
+import numpy as np
+import vitals
+
+
+def test_GenerateSyntheticLibrary_LoadsAlbumsAndQueries(app, fresh_db, runner, tmp_path):
+    """every synthetic album should be collected by the user and every query should be named for its album"""
+    queries_dir = tmp_path / 'queries'
+    result = runner.invoke(vitals.synthetic.generate_synthetic_library,
+                           ['--albums', '20', '--queries', '4', '--queries-dir', str(queries_dir), '--workers', '2'],
+                           catch_exceptions=False)
+    assert result.exit_code == 0
+
+    with app.app_context():
+        library = vitals.db.db_load_library('synthuser')
+        assert len(library) == 20
+        assert all(album.signature is not None and len(album.keypoints) == len(album.descriptor)
+                   for album in library.values())
+        assert (flask.current_app.config['STATIC_FILES'] / 'album_cover' / 'SYN-00000.jpg').is_file()
+
+    queries = list(queries_dir.iterdir())
+    assert len(queries) == 4
+    assert all(query.name.split('.')[0] in library for query in queries)
+
+
+def test_AugmentedQuery_SameSeed_SamePhoto():
+    """queries should be reproducible from the seed"""
+    cover = np.full((60, 60, 3), 128, np.uint8)
+    photos = [vitals.synthetic.augmented_query(cover, np.random.default_rng(1), (80, 60)) for _ in range(2)]
+    assert photos[0].shape == (60, 80, 3)
+    assert np.array_equal(*photos)
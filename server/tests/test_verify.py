@@ -0,0 +1,90 @@
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+def load_query(query_fname):
+    _, _, q_kp, q_descriptor = vitals.album_match.imread(str(query_fname), vitals.album_match.RESIZE_WIDTH * 3 // 2)
+    return vitals.features.points(q_kp), q_descriptor
+
+
+def test_Inliers_Homography_CountsAgreeingMatches():
+    """matches that follow one homography should count as inliers and random matches should not"""
+    rng = np.random.default_rng(0)
+    src = rng.uniform(0, 150, (40, 2)).astype(np.float32)
+    dst = src * 1.5 + 10
+    dst[30:] = rng.uniform(0, 225, (10, 2))
+    assert vitals.verify.inliers(src, dst) == 30
+    assert vitals.verify.inliers(src[:8], dst[:8]) == 0
+
+
+def test_LoadLibrary_TestData_KeypointsMatchDescriptors(app):
+    """every test album should store one keypoint per descriptor row"""
+    for album in vitals.db.db_load_library('testuser').values():
+        assert album.keypoints.shape == (len(album.descriptor), 2)
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_Rank_ObviousMatch_StopsEarly(app, monkeypatch, query_fname):
+    """an obvious match should be verified without verifying the rest of the candidates"""
+    q_catalog, *_ = query_fname.name.split('.')
+    q_points, q_descriptor = load_query(query_fname)
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    rows, q_rows = index.matches(q_descriptor)
+    verified = []
+    inliers = vitals.verify.inliers
+
+    def count_inliers(src, dst, min_inliers):
+        verified.append(len(src))
+        return inliers(src, dst, min_inliers)
+
+    monkeypatch.setattr(vitals.verify, 'inliers', count_inliers)
+    ranked = vitals.verify.rank(index, rows, q_rows, q_points, len(index))
+    assert ranked[0][1].catalog == q_catalog
+    assert ranked[0][0] >= vitals.verify.MIN_INLIERS
+    assert len(verified) == 1
+    assert sorted(album.catalog for _, album in ranked) == sorted(album.catalog for album in index.albums)
+
+
+def test_Rank_NoKeypoints_KeepsRawMatches(app):
+    """albums stored without keypoint geometry should keep their raw matches"""
+    q_points, q_descriptor = load_query(next(queries_dir.iterdir()))
+    library = vitals.db.db_load_library('testuser')
+    for album in library.values():
+        album.keypoints = None
+    index = vitals.library_index.LibraryIndex.from_library(library)
+    rows, q_rows = index.matches(q_descriptor)
+    assert vitals.verify.rank(index, rows, q_rows, q_points, len(index)) == index.rank(index.count_votes(rows))
+
+
+def test_Rank_CandidateFails_RankedLast(app, monkeypatch):
+    """a candidate that fails verification should rank below the albums that were not verified"""
+    q_points, q_descriptor = load_query(next(queries_dir.iterdir()))
+    index = vitals.library_index.LibraryIndex.from_library(vitals.db.db_load_library('testuser'))
+    rows, q_rows = index.matches(q_descriptor)
+    expected = index.rank(index.count_votes(rows))
+    monkeypatch.setattr(vitals.verify, 'inliers', lambda src, dst, min_inliers: 0)
+
+    ranked = vitals.verify.rank(index, rows, q_rows, q_points, 1)
+    assert ranked == expected[1:] + [(0, expected[0][1])]
+    assert isinstance(ranked[-1][0], vitals.verify.Inliers)
+    assert not any(isinstance(matches_stat, vitals.verify.Inliers) for matches_stat, _ in ranked[:-1])
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryAlbumMatch_VerifyCandidates_MatchesCorrectly(app, testuser_client, query_fname):
+    """/user/album/query should rank the query album first by its inliers"""
+    app.config['VERIFY_CANDIDATES'] = 3
+    q_catalog, *_ = query_fname.name.split('.')
+    with open(query_fname, 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    albums = response.json['albums']
+    assert albums[0]['catalog'] == q_catalog
+    assert albums[0]['matches_stat'] >= vitals.verify.MIN_INLIERS
+    assert albums[0]['verified']
+    assert not albums[-1]['verified']
+    assert len(albums) == len(vitals.db.db_load_library('testuser'))
@@ -0,0 +1,105 @@
+import flask
+import numpy as np
+import pytest
+import vitals
+from conftest import resources
+
+queries_dir = resources / 'queries'
+
+
+@pytest.fixture
+def trained_db(fresh_db, runner):
+    vitals.vocabulary.forget_inverted_files()
+    result = runner.invoke(vitals.vocabulary.train_vocabulary, ['--words', '32'], catch_exceptions=False)
+    assert result.exit_code == 0
+    vitals.db.get_db().commit()
+    yield
+    vitals.vocabulary.forget_inverted_files()
+
+
+def load_query(query_fname):
+    *_, q_descriptor = vitals.album_match.imread(str(query_fname), vitals.album_match.RESIZE_WIDTH * 3 // 2)
+    return q_descriptor
+
+
+def test_TrainVocabulary_IndexesEveryAlbum(trained_db):
+    """training should store a bag of words for every album"""
+    inverted_file = vitals.vocabulary.load_inverted_file('sift')
+    assert len(inverted_file.vocabulary.centers) == 32
+    assert set(inverted_file.catalogs) == set(vitals.db.db_load_albums())
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_Shortlist_BasicQueries_HasQueryAlbum(trained_db, app, query_fname):
+    """the query album should be in a short candidate list"""
+    app.config['BOW_CANDIDATES'] = 3
+    q_catalog, *_ = query_fname.name.split('.')
+    catalogs = list(vitals.db.db_load_library('testuser'))
+    shortlist = vitals.vocabulary.shortlist(catalogs, load_query(query_fname), 'sift')
+    assert len(shortlist) == 3
+    assert q_catalog in shortlist
+
+
+def test_LoadInvertedFile_AlbumReindexedElsewhere_Refreshes(trained_db, app, monkeypatch):
+    """an album re-indexed in place by another worker should be picked up once the album change is heard of"""
+    inverted_file = vitals.vocabulary.load_inverted_file('sift')
+    catalog = inverted_file.catalogs[0]
+    db = vitals.db.get_db()
+    db.execute('UPDATE albums SET bow = %s WHERE catalog = %s;',
+               (vitals.encode.encode((np.array([0]), np.array([1], dtype=np.float32))), catalog))
+    db.commit()
+    monkeypatch.setattr(vitals.vocabulary, 'REFRESH_SECONDS', 0)
+    assert vitals.vocabulary.load_inverted_file('sift') is inverted_file
+
+    vitals.descriptor_cache.descriptor_cache.invalidate_album(catalog)
+    refreshed = vitals.vocabulary.load_inverted_file('sift')
+    assert refreshed is not inverted_file
+    position = refreshed.positions[catalog]
+    assert [word for word, (albums, _) in refreshed.postings.items() if position in albums] == [0]
+
+
+def test_Shortlist_NotIndexed_AlwaysCandidate(app):
+    """albums added after the vocabulary was trained should always be matched"""
+    vocabulary = vitals.vocabulary.Vocabulary(1, 'sift', np.eye(4, 128, dtype=np.float32), np.ones(4, np.float32))
+    inverted_file = vitals.vocabulary.InvertedFile(vocabulary)
+    inverted_file.add('A', np.array([0]), np.array([1], dtype=np.float32))
+    inverted_file.add('B', np.array([1]), np.array([1], dtype=np.float32))
+    q_descriptor = np.eye(2, 128, dtype=np.float32)
+    assert inverted_file.shortlist(['A', 'B', 'C'], q_descriptor[:1], 1) == ['A', 'C']
+    inverted_file.add('C', np.array([0]), np.array([1], dtype=np.float32))
+    assert set(inverted_file.shortlist(['A', 'B', 'C'], q_descriptor[:1], 2)) == {'A', 'C'}
+
+
+def test_FromBows_SameAsAdd():
+    """building the inverted file in one pass should give the same postings as adding the albums one by one"""
+    rng = np.random.default_rng(0)
+    vocabulary = vitals.vocabulary.Vocabulary(1, 'sift', np.eye(16, 128, dtype=np.float32), np.ones(16, np.float32))
+    bows = []
+    for catalog in 'ABCDE':
+        ids = np.sort(rng.choice(16, rng.integers(0, 8), replace=False))
+        bows.append((catalog, ids, rng.uniform(size=len(ids)).astype(np.float32)))
+
+    expected = vitals.vocabulary.InvertedFile(vocabulary)
+    for bow in bows:
+        expected.add(*bow)
+    inverted_file = vitals.vocabulary.InvertedFile.from_bows(vocabulary, bows)
+    assert inverted_file.catalogs == expected.catalogs
+    assert inverted_file.positions == expected.positions
+    assert inverted_file.postings.keys() == expected.postings.keys()
+    for word, (albums, weights) in expected.postings.items():
+        assert np.array_equal(inverted_file.postings[word][0], albums)
+        assert np.array_equal(inverted_file.postings[word][1], weights)
+    assert vitals.vocabulary.InvertedFile.from_bows(vocabulary, []).postings == {}
+
+
+@pytest.mark.parametrize('query_fname', list(queries_dir.iterdir()))
+def test_QueryAlbumMatch_BowCandidates_MatchesCorrectly(trained_db, app, testuser_client, query_fname):
+    """/user/album/query should still rank the query album first when it only matches the shortlist"""
+    app.config['BOW_CANDIDATES'] = 3
+    q_catalog, *_ = query_fname.name.split('.')
+    with open(query_fname, 'rb') as file:
+        response = testuser_client.post(flask.url_for('album_match.query_album_match'), data={'query': file})
+    albums = response.json['albums']
+    assert albums[0]['catalog'] == q_catalog
+    assert len(albums) == len(vitals.db.db_load_library('testuser'))
+    assert all(album['matches_stat'] == 0 for album in albums[3:])
@@ -1 +1,3 @@
-from . import album_match, db, encode, utils, wsgi, user, discogs_auth, discogs_sync, mock_discogs_client
+from . import album_match, benchmark, db, descriptor_cache, encode, features, library_index, utils, wsgi, user, \
+    discogs_auth, discogs_sync, mock_discogs_client, vocabulary, signature, verify, match_jobs, \
+    matcher_client, matcher_daemon, synthetic, projection, match_stream, crop, result_cache, prior, quality
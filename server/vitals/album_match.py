@@ -1,24 +1,54 @@
 # https://docs.opencv.org/4.x/dc/dc3/tutorial_py_matcher.html
+import concurrent.futures
 import os
 import io
+import mmap
+import struct
+import threading
+import time
 from pprint import pprint as pp
 import click
-import cv2 as cv
 import flask
 import flask_login
 import numpy as np
 import werkzeug
+from . import crop
 from . import db
+from . import descriptor_cache
+from . import features
+from . import library_index
+from . import matcher_client
+from . import prior
+from . import projection
+from . import quality
+from . import result_cache
+from . import signature
 from . import utils
+from . import verify
+from . import vocabulary
 
 album_match = flask.Blueprint('album_match', __name__)
 
 # settings
 DEBUG = False
 RESIZE_WIDTH = 150
+# albums per /user/album/query response when the client does not pass k. 0 returns every album.
+QUERY_K = 0
+# uploads over these limits are rejected before they are decoded. the byte limit leaves room for the multipart form
+# under nginx's client_max_body_size of 20M, so that clients get this json 413 rather than nginx's html one.
+QUERY_MAX_BYTES = 16 * 2 ** 20
+QUERY_MAX_PIXELS = 50_000_000
+BATCH_MAX_IMAGES = 32
+# downscale factors of the IMREAD_REDUCED_* flags. jpeg decodes straight to the reduced size with DCT scaling.
+REDUCTIONS = (1, 2, 4, 8)
 
 
 def init_app(app):
+    app.config.setdefault('QUERY_K', int(os.getenv('VITALS_QUERY_K') or QUERY_K))
+    app.config.setdefault('QUERY_MAX_BYTES', int(os.getenv('VITALS_QUERY_MAX_BYTES') or QUERY_MAX_BYTES))
+    app.config.setdefault('QUERY_MAX_PIXELS', int(os.getenv('VITALS_QUERY_MAX_PIXELS') or QUERY_MAX_PIXELS))
+    app.config.setdefault('BATCH_MAX_IMAGES', int(os.getenv('VITALS_BATCH_MAX_IMAGES') or BATCH_MAX_IMAGES))
+    app.config.setdefault('BATCH_WORKERS', int(os.getenv('VITALS_BATCH_WORKERS') or os.cpu_count() or 1))
     app.register_blueprint(album_match)
     app.cli.add_command(test_matcher)
 
@@ -26,40 +56,101 @@ def init_app(app):
 # Library functions
 
 
-def get_sift():
-    if 'sift' not in flask.g:
-        flask.g.sift = cv.SIFT_create()
-    return flask.g.sift
-
-
 def imshow(img):
+    import cv2 as cv
     cv.imshow('album_match', img)
     key = cv.waitKey(0)
     print(f'key {key} {chr(key)!r} pressed')
     cv.destroyAllWindows()
 
 
-def load_im_from_stream(stream, flags=cv.IMREAD_COLOR):
+def load_im_from_buffer(buffer, flags=None):
+    import cv2 as cv
+    flags = imread_flags() if flags is None else flags
     try:
-        array = np.asarray(bytearray(stream.read()), dtype=np.uint8)
-        return cv.imdecode(array, flags)
+        return cv.imdecode(np.frombuffer(buffer, dtype=np.uint8), flags)
     except Exception:
         # wrap all errors into bad image response
         return None
 
 
-def imread(file, resize_width=None):
+def read_buffer(stream):
+    """returns the contents of the stream without copying them when the stream is in memory or a file"""
+    # werkzeug spools uploads into a SpooledTemporaryFile, which wraps a BytesIO or a file
+    stream = getattr(stream, '_file', stream)
+    if isinstance(stream, io.BytesIO):
+        return stream.getbuffer()
+    try:
+        fileno = stream.fileno()
+    except (AttributeError, OSError):
+        return stream.read()
+    if not os.fstat(fileno).st_size:
+        return b''
+    return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+def image_size(buffer):
+    """returns (width, height) from a png or jpeg header, or None for other or truncated images"""
+    header = bytes(buffer[:32])
+    if header.startswith(b'\x89PNG\r\n\x1a\n') and len(header) >= 24:
+        return struct.unpack('>II', header[16:24])
+    if not header.startswith(b'\xff\xd8'):
+        return None
+
+    # walk the jpeg markers up to the start of frame
+    i = 2
+    while i + 9 <= len(buffer):
+        if buffer[i] != 0xff:
+            return None
+        marker = buffer[i + 1]
+        if marker in (0xd8, 0x01) or 0xd0 <= marker <= 0xd7:
+            i += 2
+            continue
+        length, = struct.unpack('>H', bytes(buffer[i + 2:i + 4]))
+        # SOF0 to SOF15, except DHT, JPG and DAC
+        if 0xc0 <= marker <= 0xcf and marker not in (0xc4, 0xc8, 0xcc):
+            height, width = struct.unpack('>HH', bytes(buffer[i + 5:i + 9]))
+            return width, height
+        i += 2 + length
+
+    return None
+
+
+def reduction(size, resize_width):
+    """returns the largest IMREAD_REDUCED_* factor that still decodes at least resize_width wide"""
+    if size is None or resize_width is None:
+        return 1
+    width, _ = size
+    return max(factor for factor in REDUCTIONS if factor == 1 or width // factor >= resize_width)
+
+
+def imread_flags(factor=1, color=True):
+    """returns the IMREAD_* flags that decode the image reduced by the factor"""
+    import cv2 as cv
+    if factor == 1:
+        return cv.IMREAD_COLOR if color else cv.IMREAD_GRAYSCALE
+    return getattr(cv, f'IMREAD_REDUCED_{"COLOR" if color else "GRAYSCALE"}_{factor}')
+
+
+def decode_image(file, resize_width=None, reduced=False, color=True):
+    """returns (img, gray), or None for a bad image. see imread."""
+    import cv2 as cv
+    flags = imread_flags(color=color)
+    if isinstance(file, werkzeug.datastructures.file_storage.FileStorage):
+        file = read_buffer(file.stream)
+    elif isinstance(file, str) and reduced:
+        with open(file, 'rb') as f:
+            file = f.read()
+
     if isinstance(file, str):
         # file is a file path
-        img = cv.imread(file)
-    elif isinstance(file, werkzeug.datastructures.file_storage.FileStorage):
-        img = load_im_from_stream(file)
-        if img is None:
-            # bad image
-            return
-    elif isinstance(file, bytes):
+        img = cv.imread(file, flags)
+    elif isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):
         # file is file contents
-        img = load_im_from_stream(io.BytesIO(file))
+        if reduced:
+            factor = reduction(image_size(file), resize_width)
+            flags = imread_flags(factor, color)
+        img = load_im_from_buffer(file, flags)
         if img is None:
             # bad image
             return
@@ -73,8 +164,24 @@ def imread(file, resize_width=None):
         new_height = int(resize_width * aspect_ratio)
         img = cv.resize(img, (resize_width, new_height))
 
-    gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
-    keypoints, descriptor = get_sift().detectAndCompute(gray, None)
+    if color:
+        return img, cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+    return None, img
+
+
+def imread(file, resize_width=None, extractor=None, options=None, reduced=False, color=True, max_keypoints=0):
+    """returns (img, gray, keypoints, descriptor), or None for a bad image.
+
+    file is a path, an upload, or the bytes or buffer of an image. with reduced, the image is decoded at the smallest
+    power of two reduction that is still resize_width wide. without color, it is decoded straight to grayscale and
+    img is None. max_keypoints keeps only that many keypoints spread over the image, see features.budget."""
+    import cv2 as cv
+    decoded = decode_image(file, resize_width, reduced, color)
+    if decoded is None:
+        return
+    img, gray = decoded
+    keypoints, descriptor = features.detect_and_compute(gray, extractor, options)
+    keypoints, descriptor = features.budget(keypoints, descriptor, max_keypoints)
 
     if DEBUG:
         # see how many keypoints an album cover may have
@@ -84,83 +191,364 @@ def imread(file, resize_width=None):
     return img, gray, keypoints, descriptor
 
 
-def get_filesystem_library(folder, resize_width=None):
+def get_filesystem_library(folder, resize_width=None, extractor=None, options=None, reduced=False, color=True,
+                           max_keypoints=0):
     return {
-        fname: imread(f'{folder}/{fname}', resize_width)
+        fname: imread(f'{folder}/{fname}', resize_width, extractor, options, reduced, color, max_keypoints)
         for fname in os.listdir(folder)
     }
 
 
-def query_image(library, queries, query_fname):
-    q_img, q_gray, q_kp, q_descriptor = queries[query_fname]
-    all_matches = {}
-
-    for album in library.values():
-        matcher = cv.BFMatcher()
-        matches = matcher.knnMatch(album.descriptor, q_descriptor, k=2)
-        matches = [
-            [m]
-            for m,  n in matches
-            if m.distance < 0.75 * n.distance
-        ]
+def load_library_index(username):
+    """returns the user's library index, masked out of the shared catalog-wide index when one is published"""
+    if flask.current_app.config['LISTEN_CHANGES']:
+        # the cache must see the changes that other workers and processes make
+        descriptor_cache.start_listener(flask.current_app._get_current_object())
+    index_dir = flask.current_app.config['DESCRIPTOR_INDEX_DIR']
+    shared_index = library_index.attach_shared_index(index_dir) if index_dir else None
+    # the shared index holds the full descriptors
+    current_projection = projection.get_projection()
 
-        matches_stat = len(matches)
-        all_matches[album.catalog] = matches_stat, album
+    if shared_index is not None and shared_index.extractor == flask.current_app.config['EXTRACTOR'] \
+            and current_projection is None:
+        return descriptor_cache.descriptor_cache.load_masked_index(username, shared_index)
 
-    return sorted(all_matches.values(), key=lambda p: -p[0])
+    return descriptor_cache.descriptor_cache.load_library_index(username, current_projection)
 
 
-# Commands
+def get_matcher(name=None):
+    config = flask.current_app.config
+    return library_index.get_matcher(name or config['MATCHER'], trees=config['FLANN_TREES'],
+                                     checks=config['FLANN_CHECKS'])
 
 
-@click.command('test-matcher', help='test the album matcher')
-@click.argument('queries_dir', metavar='QUERIES', type=click.Path(exists=True, file_okay=False))
-def test_matcher(queries_dir):
-    library = db.db_load_library(username='testuser')
-    # assume query album will take up about 2/3 of the query picture
-    queries = get_filesystem_library(queries_dir, resize_width=RESIZE_WIDTH * 3 // 2)
-
-    for query_fname in queries:
-        # do query
-        all_matches = query_image(library, queries, query_fname)
-
-        # print results
-        print(f'matches for {query_fname}')
-        pp(all_matches)
-        print()
-
-        # check results
-        if not all_matches:
-            raise RuntimeError('no matches')
-        q_catalog, *_ = query_fname.split('.')
-        _, album_match = all_matches[0]
-        if q_catalog != album_match.catalog:
-            raise RuntimeError(f'Expected catalog {q_catalog} but got catalog {album_match.catalog} from query '
-                               f'{query_fname}')
+def query_image(library, queries, query_fname, matcher=None, extractor='sift', shortlist=None, verify_candidates=0,
+                k=None, shards=1, prior=None):
+    """library is a dict of albums or a LibraryIndex. if a shortlist of catalogs is given, only those albums are
+    matched and the rest of the library follows them with a matches_stat of 0. if verify_candidates is set, that many
+    of the top albums are verified with a homography, see verify.rank. if k is given only the top k are returned.
+    shards is the number of threads that match the query, see LibraryIndex.matches. if a prior.Prior is given, its
+    likeliest albums are matched first and, when one of them passes, the rest of the albums are not matched and rank
+    with a matches_stat of 0, see Prior.matches."""
+    q_img, q_gray, q_kp, q_descriptor = queries[query_fname]
+    index = library_index.as_index(library, extractor)
+    rest = []
+    if shortlist is not None:
+        candidates = set(shortlist)
+        rest = [(0, album) for album in index.albums if album.catalog not in candidates]
+        index = index.masked(shortlist)
+
+    q_descriptor = index.project(q_descriptor)
+    if prior is not None:
+        rows, q_rows = prior.matches(index, q_descriptor, matcher, shards)
+    else:
+        rows, q_rows = index.matches(q_descriptor, matcher, shards)
+
+    if not verify_candidates:
+        return (index.rank(index.count_votes(rows), k) + rest)[:k]
+    return (verify.rank(index, rows, q_rows, features.points(q_kp), verify_candidates, k=k) + rest)[:k]
+
+
+def shortlist(library, q_img, q_descriptor, extractor):
+    """returns the catalogs that survive the signature then the bag of words prefilters, or None to match every
+    album. q_img is framed on the sleeve by decode_query_image, so its signature is of the whole image."""
+    catalogs = [album.catalog for album in library.albums]
+    num_candidates = flask.current_app.config['SIGNATURE_CANDIDATES']
+    if num_candidates and len(catalogs) > num_candidates:
+        catalogs = signature.shortlist(library.albums, signature.compute(q_img), num_candidates)
+    bow_catalogs = vocabulary.shortlist(catalogs, q_descriptor, extractor)
+    if bow_catalogs is not None:
+        catalogs = bow_catalogs
+    return None if len(catalogs) == len(library.albums) else catalogs
+
+
+def confidence(all_matches):
+    """returns how far the best album leads the runner-up, from 0 for a tie or no matches to 1 for no runner-up"""
+    best = all_matches[0][0] if all_matches else 0
+    runner_up = all_matches[1][0] if len(all_matches) > 1 else 0
+    return (best - runner_up) / best if best else 0.0
+
+
+def get_int_arg(name, default, minimum=0):
+    """returns (value, error response)"""
+    value = flask.request.args.get(name)
+    if value is None:
+        return default, None
+    try:
+        value = int(value)
+    except ValueError:
+        return None, utils.jsonify_error(f'{name} is not int: {value}', status=400)
+    if value < minimum:
+        return None, utils.jsonify_error(f'{name} must be at least {minimum}: {value}', status=400)
+    return value, None
+
+
+def decode_query_image(buffer):
+    """returns ((img, gray), None), or (None, error) when the upload is not a usable image. with the quality gate, a
+    photo too badly exposed, blank or blurry to match is a 422 error, which spares the extraction and the match."""
+    config = flask.current_app.config
+    width, height = image_size(buffer) or (0, 0)
+    if width * height > config['QUERY_MAX_PIXELS']:
+        return None, {'status': 413, 'message': f'image is over {config["QUERY_MAX_PIXELS"]} pixels'}
+
+    # assume query album will take up about 2/3 of the query picture, unless the sleeve is found and cropped. only the
+    # signature prefilter needs color.
+    decoded = decode_image(buffer, resize_width=crop.DECODE_WIDTH if config['QUERY_CROP'] else RESIZE_WIDTH * 3 // 2,
+                           reduced=True, color=bool(config['SIGNATURE_CANDIDATES']))
+    if decoded is None:
+        return None, {'status': 400, 'message': 'bad image provided'}
+    img, gray = decoded
+    found = False
+    if config['QUERY_CROP']:
+        img, gray, found = crop.crop_sleeve(img, gray, RESIZE_WIDTH, RESIZE_WIDTH * 3 // 2)
+    if img is not None and not found:
+        # the signature is only of the sleeve, so the color image is cropped to where the sleeve is assumed to be
+        img = signature.center_crop(img, signature.QUERY_CROP)
+    error = quality.check_image(gray) if config['QUALITY_GATE'] else None
+    if error is not None:
+        return None, error
+    return (img, gray), None
+
+
+def extract_query(img, gray):
+    """returns the img_data of a decoded query image"""
+    config = flask.current_app.config
+    keypoints, descriptor = features.detect_and_compute(gray, config['EXTRACTOR'], config['QUERY_EXTRACTOR_OPTIONS'])
+    return img, gray, keypoints, descriptor
 
 
-# Routes
+def check_query(img_data):
+    """returns the 422 error of a query with too few keypoints to match when the quality gate is on, or None"""
+    return quality.check_keypoints(img_data[2]) if flask.current_app.config['QUALITY_GATE'] else None
 
 
-@album_match.route('/user/album/query', methods=['POST'])
-@flask_login.login_required
-def query_album_match():
-    file = flask.request.files['query']
-    # assume query album will take up about 2/3 of the query picture
-    img_data = imread(file, resize_width=RESIZE_WIDTH * 3 // 2)
-    if img_data is None:
-        return utils.jsonify_error('bad image provided', status=400)
+def rank_query(library, img_data, k=None, prior=None, verify=True):
+    """returns [(matches_stat, album)] of the k best matching albums with the configured matcher, prefilters and
+    verification, and the user's prior if one is given. without verify, every matches_stat is raw matches."""
+    config = flask.current_app.config
+    extractor = config['EXTRACTOR']
     queries = {
         'query': img_data,
     }
-    library = db.db_load_library(flask_login.current_user.username)
-    all_matches = query_image(library, queries, 'query')
+    q_img, *_, q_descriptor = img_data
+    return query_image(library, queries, 'query', get_matcher(), extractor,
+                       shortlist(library, q_img, q_descriptor, extractor), config['VERIFY_CANDIDATES'] if verify else 0,
+                       k, config['MATCH_SHARDS'], prior)
+
+
+def match_query(library, img_data, k=None, min_score=0, cursor=0, prior=None):
+    """returns the response of the k best matching albums with at least min_score matches, starting at cursor"""
+    # one more than the page to tell if there is a next page
+    all_matches = rank_query(library, img_data, None if k is None else cursor + k + 1, prior)
+    matches = [(matches_stat, album) for matches_stat, album in all_matches if matches_stat >= min_score]
+    page = matches[cursor:None if k is None else cursor + k]
+    next_cursor = cursor + len(page) if cursor + len(page) < len(matches) else None
 
     albums = []
 
-    for matches_stat, album in all_matches:
+    for matches_stat, album in page:
         serialized = album.serialize()
         serialized['matches_stat'] = matches_stat
+        # matches_stat counts homography inliers of verified albums and raw matches of the rest, see verify.rank
+        serialized['verified'] = isinstance(matches_stat, verify.Inliers)
         albums.append(serialized)
 
-    return utils.jsonify()({'albums': albums})
+    return {'albums': albums, 'cursor': next_cursor, 'confidence': confidence(all_matches)}
+
+
+def match_decoded_query(username, decoded, k=None, min_score=0, cursor=0):
+    """returns (response, number of query keypoints) of a query decoded by decode_query_image. the response of a
+    nearly same photo is reused from the result cache if the user's library, prior and the projection have not changed
+    since, and then nothing is extracted. a query with too few keypoints gets the error of check_query, with its
+    status, as its response."""
+    # the generation changes with any album or collection, here or in another process, see descriptor_cache.listen
+    generation = descriptor_cache.descriptor_cache.generation
+    user_prior = prior.load_prior(username)
+    current_projection = projection.get_projection()
+    state = (generation, None if user_prior is None else (tuple(user_prior.catalogs), tuple(user_prior.tiers)),
+             None if current_projection is None else current_projection.id)
+    q_hash = result_cache.perceptual_hash(decoded[1])
+    options = k, min_score, cursor
+    cached = result_cache.result_cache.get(username, options, q_hash, state)
+    if cached is not None:
+        return cached, 0
+
+    img_data = extract_query(*decoded)
+    error = check_query(img_data)
+    if error is not None:
+        return error, len(img_data[2])
+    response = match_query(load_library_index(username), img_data, k, min_score, cursor, user_prior)
+    result_cache.result_cache.put(username, options, q_hash, state, response)
+    return response, len(img_data[2])
+
+
+def match_image(username, buffer, k=None, min_score=0, cursor=0):
+    """returns (response, number of query keypoints) of the query image, matched in-process"""
+    decoded, error = decode_query_image(buffer)
+    if error is not None:
+        return error, 0
+    return match_decoded_query(username, decoded, k, min_score, cursor)
+
+
+def match_buffer(username, buffer, k=None, min_score=0, cursor=0):
+    """returns (response, number of query keypoints) of the query image, from the matcher daemon when one is
+    configured and reachable, or else matched in-process. only the in-process match loads opencv."""
+    response = matcher_client.try_query(username, buffer, k, min_score, cursor)
+    if response is not None:
+        return response['body'], response['num_keypoints']
+    return match_image(username, buffer, k, min_score, cursor)
+
+
+batch_executor = None
+batch_executor_lock = threading.Lock()
+
+
+def get_batch_executor():
+    """returns the process-wide thread pool of the batch route. opencv releases the gil while it works."""
+    global batch_executor
+    with batch_executor_lock:
+        if batch_executor is None:
+            batch_executor = concurrent.futures.ThreadPoolExecutor(flask.current_app.config['BATCH_WORKERS'],
+                                                                   thread_name_prefix='album-match')
+        return batch_executor
+
+
+def batch_query(app, username, buffer, k, min_score):
+    """returns (result, number of query keypoints) of one image of a batch"""
+    with app.app_context():
+        return match_buffer(username, buffer, k, min_score)
+
+
+# Commands
+
+
+@click.command('test-matcher', help='test the album matcher. see bench-matcher for accuracy and latency.')
+@click.argument('queries_dir', metavar='QUERIES', type=click.Path(exists=True, file_okay=False))
+@click.option('--matcher', 'matchers', multiple=True, default=['bf', 'flann'],
+              help='matcher backends to compare. the first one must match every query.')
+@click.option('--extractor', default='sift', type=click.Choice(features.EXTRACTORS), help='feature extractor')
+@click.option('--signature-candidates', default=0,
+              help='only match the albums with the closest signatures. 0 matches every album.')
+@click.option('--verify-candidates', default=0, help='verify this many top albums with a homography. 0 skips it.')
+@click.option('--shards', default=1, help='match each query on this many threads')
+def test_matcher(queries_dir, matchers, extractor, signature_candidates, verify_candidates, shards):
+    index = library_index.LibraryIndex.from_library(db.db_load_library('testuser', extractor), extractor)
+    # assume query album will take up about 2/3 of the query picture
+    queries = get_filesystem_library(queries_dir, resize_width=RESIZE_WIDTH * 3 // 2, extractor=extractor,
+                                     options=flask.current_app.config['QUERY_EXTRACTOR_OPTIONS'], reduced=True,
+                                     color=bool(signature_candidates))
+    shortlists = {query_fname: None for query_fname in queries}
+    if signature_candidates:
+        shortlists = {
+            query_fname: signature.shortlist(index.albums, signature.compute_query(q_img), signature_candidates)
+            for query_fname, (q_img, *_) in queries.items()
+        }
+    report = []
+
+    for matcher_name in matchers:
+        matcher = get_matcher(matcher_name)
+        num_correct = 0
+        num_shortlist_misses = 0
+        total_time = 0
+        # train the matcher on the index outside of the timed queries
+        query_image(index, queries, next(iter(queries)), matcher)
+
+        for query_fname in queries:
+            # do query
+            start = time.perf_counter()
+            all_matches = query_image(index, queries, query_fname, matcher, extractor, shortlists[query_fname],
+                                      verify_candidates, shards=shards)
+            total_time += time.perf_counter() - start
+
+            # print results
+            print(f'{matcher_name} matches for {query_fname}')
+            pp(all_matches)
+            print()
+
+            # check results
+            if not all_matches:
+                raise RuntimeError('no matches')
+            q_catalog, *_ = query_fname.split('.')
+            _, album_match = all_matches[0]
+            # a query whose album the prefilter dropped cannot match, so it only counts as a shortlist miss
+            missed = shortlists[query_fname] is not None and q_catalog not in shortlists[query_fname]
+            num_shortlist_misses += missed
+            if q_catalog == album_match.catalog:
+                num_correct += 1
+            elif matcher_name == matchers[0] and not missed:
+                raise RuntimeError(f'Expected catalog {q_catalog} but got catalog {album_match.catalog} from query '
+                                   f'{query_fname}')
+
+        report.append((matcher_name, num_correct / len(queries), num_shortlist_misses / len(queries),
+                       total_time / len(queries)))
+
+    print(f'{"matcher":>8} {"top-1":>6} {"missed":>6} {"latency":>10}')
+    for matcher_name, accuracy, miss_rate, latency in report:
+        print(f'{matcher_name:>8} {accuracy:>6.1%} {miss_rate:>6.1%} {latency * 1000:>8.2f}ms')
+
+
+# Routes
+
+
+@album_match.route('/user/album/query', methods=['POST'])
+@flask_login.login_required
+def query_album_match():
+    """returns the k best matching albums with at least min_score matches, starting at the cursor of a previous
+    response. a cursor of null means there are no more albums. the matcher daemon answers when one is configured
+    and reachable. a retry of a nearly same photo is answered from the result cache. a photo too blurry, badly
+    exposed, blank or featureless to match is a 422 with its reason, before it is matched."""
+    k, error = get_int_arg('k', flask.current_app.config['QUERY_K'] or None, minimum=1)
+    if error is not None:
+        return error
+    min_score, error = get_int_arg('min_score', 0)
+    if error is not None:
+        return error
+    cursor, error = get_int_arg('cursor', 0)
+    if error is not None:
+        return error
+
+    config = flask.current_app.config
+    if (flask.request.content_length or 0) > config['QUERY_MAX_BYTES']:
+        return utils.jsonify_error(f'image is over {config["QUERY_MAX_BYTES"]} bytes', status=413)
+    buffer = read_buffer(flask.request.files['query'].stream)
+    response, flask.g.num_keypoints = match_buffer(flask_login.current_user.username, buffer, k, min_score, cursor)
+    return utils.jsonify(response.get('status', 200))(response)
+
+
+@album_match.route('/user/album/query/batch', methods=['POST'])
+@flask_login.login_required
+def query_album_match_batch():
+    """matches every 'query' image of the request on a thread pool, through the matcher daemon when one is configured
+    and reachable, and returns the k best albums with at least min_score matches for each image, in upload order"""
+    k, error = get_int_arg('k', flask.current_app.config['QUERY_K'] or None, minimum=1)
+    if error is not None:
+        return error
+    min_score, error = get_int_arg('min_score', 0)
+    if error is not None:
+        return error
+
+    config = flask.current_app.config
+    files = flask.request.files.getlist('query')
+    if not files:
+        return utils.jsonify_error('no query images provided', status=400)
+    if len(files) > config['BATCH_MAX_IMAGES']:
+        return utils.jsonify_error(f'more than {config["BATCH_MAX_IMAGES"]} query images', status=413)
+    if (flask.request.content_length or 0) > config['QUERY_MAX_BYTES'] * len(files):
+        return utils.jsonify_error(f'images are over {config["QUERY_MAX_BYTES"]} bytes each', status=413)
+
+    app = flask.current_app._get_current_object()
+    futures = [
+        get_batch_executor().submit(batch_query, app, flask_login.current_user.username, read_buffer(file.stream), k,
+                                    min_score)
+        for file in files
+    ]
+
+    results = []
+    flask.g.num_keypoints = 0
+
+    for file, future in zip(files, futures):
+        result, num_keypoints = future.result()
+        results.append({'filename': file.filename, **result})
+        flask.g.num_keypoints += num_keypoints
+
+    return utils.jsonify()({'results': results})
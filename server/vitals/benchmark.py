@@ -0,0 +1,383 @@
+import datetime
+import json
+import os
+import subprocess
+import time
+import click
+import flask
+import numpy as np
+from . import album_match
+from . import descriptor_cache
+from . import db as vitals_db
+from . import features
+from . import library_index
+from . import prior
+from . import projection
+
+
+def init_app(app):
+    app.cli.add_command(bench_library_index)
+    app.cli.add_command(bench_decode)
+    app.cli.add_command(bench_matcher)
+    app.cli.add_command(bench_projection)
+
+
+# Library functions
+
+
+def query_image_per_album(library, q_descriptor):
+    """the original matcher: one BFMatcher and one knnMatch per album. kept as the reference for benchmarks."""
+    import cv2 as cv
+    all_matches = {}
+
+    for album in library.values():
+        matcher = cv.BFMatcher()
+        # albums are stored compact, see features.compact
+        matches = matcher.knnMatch(np.asarray(album.descriptor, dtype=q_descriptor.dtype), q_descriptor, k=2)
+        matches = [
+            [m]
+            for m, n in matches
+            if m.distance < library_index.RATIO * n.distance
+        ]
+
+        matches_stat = len(matches)
+        all_matches[album.catalog] = matches_stat, album
+
+    return sorted(all_matches.values(), key=lambda p: -p[0])
+
+
+def synthetic_library(num_albums, rows_per_album=100, seed=0):
+    """returns a library of albums with random SIFT-like descriptors"""
+    rng = np.random.default_rng(seed)
+    library = {}
+
+    for i in range(num_albums):
+        num_rows = int(rng.integers(rows_per_album // 2, rows_per_album * 3 // 2))
+        descriptor = np.minimum(rng.exponential(20, (num_rows, 128)), 255).astype(np.float32)
+        catalog = f'SYN {i:05}'
+        library[catalog] = vitals_db.Album(catalog=catalog, title=catalog, artist='synthetic', descriptor=descriptor)
+
+    return library
+
+
+def synthetic_query(library, catalog, num_rows=300, seed=0):
+    """returns a query descriptor made of noisy rows of the album and random clutter"""
+    rng = np.random.default_rng(seed)
+    descriptor = library[catalog].descriptor
+    rows = descriptor[rng.integers(0, len(descriptor), num_rows // 2)]
+    rows = rows + rng.normal(0, 4, rows.shape)
+    clutter = rng.exponential(20, (num_rows - len(rows), 128))
+    return np.clip(np.concatenate([rows, clutter]), 0, 255).astype(np.float32)
+
+
+def synthetic_photo(cover_file, megapixels=12, seed=0):
+    """returns the jpeg bytes of a phone-sized photo of the cover on a noisy background"""
+    import cv2 as cv
+    rng = np.random.default_rng(seed)
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    height = width * 3 // 4
+    photo = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    photo = cv.GaussianBlur(photo, (0, 0), 8)
+    cover = cv.imread(cover_file)
+    side = height * 2 // 3
+    y, x = (height - side) // 2, (width - side) // 2
+    photo[y:y + side, x:x + side] = cv.resize(cover, (side, side))
+    return cv.imencode('.jpg', photo)[1].tobytes()
+
+
+def decode_stages(data, reduced):
+    """returns {stage: seconds} of decoding and extracting a query upload the original way or the reduced way"""
+    import cv2 as cv
+    resize_width = album_match.RESIZE_WIDTH * 3 // 2
+    times = {}
+    start = time.perf_counter()
+
+    if reduced:
+        buffer = np.frombuffer(memoryview(data), dtype=np.uint8)
+        times['read'] = time.perf_counter() - start
+        factor = album_match.reduction(album_match.image_size(data), resize_width)
+        gray = cv.imdecode(buffer, album_match.imread_flags(factor, color=False))
+        times['decode'] = time.perf_counter() - start - sum(times.values())
+        h, w = gray.shape[:2]
+        gray = cv.resize(gray, (resize_width, int(resize_width * h / w)))
+    else:
+        buffer = np.asarray(bytearray(data), dtype=np.uint8)
+        times['read'] = time.perf_counter() - start
+        img = cv.imdecode(buffer, cv.IMREAD_COLOR)
+        times['decode'] = time.perf_counter() - start - sum(times.values())
+        h, w = img.shape[:2]
+        img = cv.resize(img, (resize_width, int(resize_width * h / w)))
+        gray = cv.cvtColor(img, cv.COLOR_BGR2GRAY)
+
+    times['resize'] = time.perf_counter() - start - sum(times.values())
+    features.get_extractor('sift').detectAndCompute(gray, None)
+    times['extract'] = time.perf_counter() - start - sum(times.values())
+    return times
+
+
+def run_query(username, data, matcher, extractor):
+    """returns (all_matches, {stage: seconds}, number of query keypoints, error) of matching a query upload the way
+    /user/album/query does. a query that does not decode or fails the quality gate has no matches and its error."""
+    config = flask.current_app.config
+    times = {}
+    start = time.perf_counter()
+
+    decoded, error = album_match.decode_query_image(data)
+    times['decode'] = time.perf_counter() - start
+    if error is not None:
+        return [], times, 0, error
+    img, gray = decoded
+    keypoints, descriptor = features.detect_and_compute(gray, extractor, config['QUERY_EXTRACTOR_OPTIONS'])
+    times['extract'] = time.perf_counter() - start - sum(times.values())
+    error = album_match.check_query((img, gray, keypoints, descriptor))
+    if error is not None:
+        return [], times, len(keypoints), error
+    index = album_match.load_library_index(username)
+    user_prior = prior.load_prior(username)
+    times['load'] = time.perf_counter() - start - sum(times.values())
+    queries = {'query': (img, gray, keypoints, descriptor)}
+    all_matches = album_match.query_image(index, queries, 'query', matcher, extractor,
+                                          album_match.shortlist(index, img, descriptor, extractor),
+                                          config['VERIFY_CANDIDATES'], shards=config['MATCH_SHARDS'], prior=user_prior)
+    times['match'] = time.perf_counter() - start - sum(times.values())
+    return all_matches, times, len(keypoints), None
+
+
+def rank_of(all_matches, catalog):
+    """returns the 1-based rank of the catalog in the matches, or None if it is not there"""
+    for rank, (_, album) in enumerate(all_matches, 1):
+        if album.catalog == catalog:
+            return rank
+    return None
+
+
+def summarize(results):
+    """returns the accuracy and latency of the query results. rejected queries count as misses, and each stage is
+    averaged over the queries that reached it."""
+    ranks = [result['rank'] for result in results]
+    latencies = np.array([result['total_ms'] for result in results])
+    stages = dict.fromkeys(stage for result in results for stage in result['stages_ms'])
+    return {
+        'queries': len(results),
+        'rejected': sum(result.get('error') is not None for result in results),
+        'top1': sum(rank == 1 for rank in ranks) / len(ranks),
+        'top5': sum(rank is not None and rank <= 5 for rank in ranks) / len(ranks),
+        'mrr': sum(1 / rank for rank in ranks if rank is not None) / len(ranks),
+        'keypoints': float(np.mean([result['keypoints'] for result in results])),
+        'latency_ms': {
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'p99': float(np.percentile(latencies, 99)),
+            'mean': float(latencies.mean()),
+        },
+        'stages_ms': {
+            stage: float(np.mean([result['stages_ms'][stage] for result in results if stage in result['stages_ms']]))
+            for stage in stages
+        },
+    }
+
+
+def run_queries(index, queries, matcher, extractor, repeat):
+    """returns the result of each query, as bench-matcher records them, of matching the index. each query's time is the
+    best of repeat runs. query file names start with the catalog of their album."""
+    results = []
+    # train the matcher on the index outside of the timed queries
+    album_match.query_image(index, queries, next(iter(queries)), matcher, extractor)
+
+    for query_fname in queries:
+        q_catalog, *_ = query_fname.split('.')
+        seconds, all_matches = timeit(lambda: album_match.query_image(index, queries, query_fname, matcher, extractor),
+                                      repeat)
+        results.append({
+            'query': query_fname,
+            'rank': rank_of(all_matches, q_catalog),
+            'keypoints': len(queries[query_fname][2]),
+            'total_ms': seconds * 1000,
+            'stages_ms': {'match': seconds * 1000},
+            'error': None,
+        })
+
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timeit(f, repeat):
+    """returns (best seconds, result of the last call)"""
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = f()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+# Commands
+
+
+@click.command('bench-library-index', help='compare per-album matching with the stacked library index')
+@click.option('--sizes', default='100,1000,10000', help='comma separated library sizes')
+@click.option('--rows-per-album', default=100, help='mean descriptor rows per album')
+@click.option('--repeat', default=3, help='best of this many runs')
+@click.option('--shards', default=4, help='threads for the sharded stacked match')
+def bench_library_index(sizes, rows_per_album, repeat, shards):
+    print(f'{"albums":>8} {"per album":>10} {"build":>10} {"stacked":>10} {"speedup":>8} {"sharded":>10}')
+
+    for size in map(int, sizes.split(',')):
+        library = synthetic_library(size, rows_per_album)
+        catalog = next(iter(library))
+        q_descriptor = synthetic_query(library, catalog)
+
+        per_album_time, per_album_matches = timeit(lambda: query_image_per_album(library, q_descriptor), repeat)
+        build_time, index = timeit(lambda: library_index.LibraryIndex.from_library(library), repeat)
+        stacked_time, stacked_matches = timeit(lambda: index.rank(index.votes(q_descriptor)), repeat)
+        sharded_time, sharded_matches = timeit(lambda: index.rank(index.votes(q_descriptor, shards=shards)), repeat)
+
+        expected = [(stat, album.catalog) for stat, album in per_album_matches]
+        if expected != [(stat, album.catalog) for stat, album in stacked_matches] \
+                or expected != [(stat, album.catalog) for stat, album in sharded_matches]:
+            raise RuntimeError(f'rankings differ for {size} albums')
+
+        print(f'{size:>8} {per_album_time:>9.3f}s {build_time:>9.3f}s {stacked_time:>9.3f}s '
+              f'{per_album_time / stacked_time:>7.1f}x {sharded_time:>9.3f}s')
+
+
+@click.command('bench-decode', help='compare the per-stage time of the original and the reduced query decoding')
+@click.argument('files', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option('--megapixels', default=12.0, help='size of the synthetic photo used when no files are given')
+@click.option('--repeat', default=5, help='best of this many runs')
+def bench_decode(files, megapixels, repeat):
+    if files:
+        photos = {}
+        for file in files:
+            with open(file, 'rb') as f:
+                photos[file] = f.read()
+    else:
+        photos = {f'{megapixels}MP synthetic': synthetic_photo('album-covers-original/OL 5670.jpg', megapixels)}
+
+    stages = ['read', 'decode', 'resize', 'extract']
+    print(f'{"photo":>24} {"path":>8} ' + ' '.join(f'{stage:>9}' for stage in stages) + f' {"total":>9}')
+
+    for name, data in photos.items():
+        for path, reduced in [('original', False), ('reduced', True)]:
+            runs = [decode_stages(data, reduced) for _ in range(repeat)]
+            best = {stage: min(run[stage] for run in runs) for stage in stages}
+            print(f'{name[-24:]:>24} {path:>8} ' + ' '.join(f'{best[stage] * 1000:>7.2f}ms' for stage in stages)
+                  + f' {sum(best.values()) * 1000:>7.2f}ms')
+
+
+@click.command('bench-matcher', help='measure the accuracy and latency of the album matcher over a query corpus')
+@click.argument('queries_dir', metavar='QUERIES', type=click.Path(exists=True, file_okay=False))
+@click.option('--username', default='testuser', help='match against this user\'s collection')
+@click.option('--matcher', 'matcher_name', default=None, help='defaults to the configured matcher')
+@click.option('--repeat', default=1, help='run every query this many times')
+@click.option('--output', default=None, type=click.Path(dir_okay=False), help='write the report to this json file')
+def bench_matcher(queries_dir, username, matcher_name, repeat, output):
+    # query file names start with the catalog of their album and a period, like 'OL 5670.west-side-story.png'
+    config = flask.current_app.config
+    extractor = config['EXTRACTOR']
+    matcher = album_match.get_matcher(matcher_name)
+
+    descriptor_cache.descriptor_cache.clear()
+    start = time.perf_counter()
+    album_match.load_library_index(username)
+    cold_load = time.perf_counter() - start
+
+    results = []
+
+    for query_fname in sorted(os.listdir(queries_dir)):
+        with open(os.path.join(queries_dir, query_fname), 'rb') as f:
+            data = f.read()
+        q_catalog, *_ = query_fname.split('.')
+
+        for _ in range(repeat):
+            all_matches, stages, num_keypoints, error = run_query(username, data, matcher, extractor)
+            results.append({
+                'query': query_fname,
+                'rank': rank_of(all_matches, q_catalog),
+                'keypoints': num_keypoints,
+                'total_ms': sum(stages.values()) * 1000,
+                'stages_ms': {stage: seconds * 1000 for stage, seconds in stages.items()},
+                # the reason of a photo the quality gate rejected, or the message of one that did not decode
+                'error': None if error is None else error.get('reason', error['message']),
+            })
+
+    if not results:
+        raise RuntimeError(f'no queries in {queries_dir}')
+
+    report = {
+        'commit': git_commit(),
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'config': {
+            key: config[key]
+            for key in ('EXTRACTOR', 'QUERY_EXTRACTOR_OPTIONS', 'SIGNATURE_CANDIDATES', 'BOW_CANDIDATES',
+                        'VERIFY_CANDIDATES', 'MATCH_SHARDS', 'DESCRIPTOR_DTYPE', 'PROJECTION', 'QUERY_CROP', 'PRIOR',
+                        'PRIOR_TIERS')
+        },
+        'matcher': matcher_name or config['MATCHER'],
+        'username': username,
+        'albums': len(descriptor_cache.descriptor_cache.load_collection(username)),
+        'cold_load_ms': cold_load * 1000,
+        **summarize(results),
+        'results': results,
+    }
+
+    print(f'{report["queries"]} queries against {report["albums"]} albums with {report["matcher"]}, '
+          f'{report["rejected"]} rejected')
+    print(f'top-1 {report["top1"]:.1%} top-5 {report["top5"]:.1%} mrr {report["mrr"]:.3f} '
+          f'query keypoints {report["keypoints"]:.0f}')
+    print('latency ' + ' '.join(f'{name} {ms:.2f}ms' for name, ms in report['latency_ms'].items()))
+    print('stages ' + ' '.join(f'{stage} {ms:.2f}ms' for stage, ms in report['stages_ms'].items())
+          + f' cold load {report["cold_load_ms"]:.2f}ms')
+
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+
+
+@click.command('bench-projection', help='compare pca projected descriptors with the full descriptors')
+@click.argument('queries_dir', metavar='QUERIES', type=click.Path(exists=True, file_okay=False))
+@click.option('--username', default='testuser', help='match against this user\'s collection')
+@click.option('--dims', default='32,64', help='comma separated projection dimensions')
+@click.option('--whiten', default=False, is_flag=True, help='whiten the projections')
+@click.option('--matcher', 'matcher_name', default=None, help='defaults to the configured matcher')
+@click.option('--repeat', default=3, help='best of this many runs of each query')
+def bench_projection(queries_dir, username, dims, whiten, matcher_name, repeat):
+    config = flask.current_app.config
+    extractor = config['EXTRACTOR']
+    matcher = album_match.get_matcher(matcher_name)
+    library = vitals_db.db_load_library(username, extractor)
+    queries = album_match.get_filesystem_library(queries_dir, resize_width=album_match.RESIZE_WIDTH * 3 // 2,
+                                                 extractor=extractor, options=config['QUERY_EXTRACTOR_OPTIONS'],
+                                                 reduced=True, color=False)
+    descriptors = [album.descriptor for album in library.values()]
+
+    print(f'{"dims":>6} {"index":>10} {"latency":>10} {"top-1":>6} {"top-5":>6} {"mrr":>6}')
+    baseline = None
+
+    for num_dims in [None, *map(int, dims.split(','))]:
+        if num_dims is None:
+            index = library_index.LibraryIndex.from_library(library, extractor)
+        else:
+            mean, components = projection.train(descriptors, num_dims, whiten=whiten)
+            index = library_index.LibraryIndex.from_library(
+                library, extractor, projection.Projection(None, extractor, mean, components))
+
+        summary = summarize(run_queries(index, queries, matcher, extractor, repeat))
+        latency, mrr = summary['latency_ms']['mean'], summary['mrr']
+        line = (f'{num_dims or index.descriptors.shape[1]:>6} {index.nbytes / 2 ** 20:>8.2f}MB '
+                f'{latency:>8.2f}ms {summary["top1"]:>6.1%} {summary["top5"]:>6.1%} {mrr:>6.3f}')
+        if baseline is None:
+            baseline = index.nbytes, latency, mrr
+        else:
+            line += (f'  {baseline[0] / index.nbytes:.1f}x smaller {baseline[1] / latency:.1f}x faster '
+                     f'mrr {mrr - baseline[2]:+.3f}')
+        print(line)
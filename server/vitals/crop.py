@@ -0,0 +1,141 @@
+import os
+import numpy as np
+
+# settings
+# queries are decoded this wide to look for the sleeve, so that a small sleeve still fills the cropped width
+DECODE_WIDTH = 450
+# the sleeve takes up between these fractions of the photo
+MIN_AREA = 0.05
+MAX_AREA = 0.98
+# the crop keeps this fraction of its width around the sleeve, in case the sleeve's corners were found inside it
+MARGIN = 0.05
+# longest over shortest side of the sleeve's quadrilateral. perspective stretches a square sleeve this far.
+MAX_ASPECT = 1.6
+# the largest contours of the photo that may be the sleeve
+MAX_CONTOURS = 10
+# approxPolyDP tolerances, as fractions of the region's perimeter, tried in turn until it has 4 corners
+APPROX_EPSILONS = (0.02, 0.04, 0.06, 0.08)
+# closing then opening the edges with a disc this fraction of the photo's width merges the sleeve's artwork into one
+# region and cuts off the lines and thin shapes that touch it
+MORPH_FRACTION = 0.04
+# the region and its quadrilateral must each cover this fraction of the other, which rejects circles, triangles and
+# other shapes that approxPolyDP forces into 4 corners
+MIN_FILL = 0.9
+
+
+def init_app(app):
+    # 0 matches the whole photo
+    app.config.setdefault('QUERY_CROP', int(os.getenv('VITALS_QUERY_CROP') or 0))
+
+
+# Library functions
+
+
+def edges(gray):
+    """returns the dilated canny edges of the image with thresholds around its median"""
+    import cv2 as cv
+    blurred = cv.GaussianBlur(gray, (5, 5), 0)
+    median = float(np.median(blurred))
+    found = cv.Canny(blurred, int(max(0, 0.66 * median)), int(min(255, 1.33 * median)))
+    # close the small gaps that glare and blur leave in the sleeve's border
+    return cv.dilate(found, np.ones((3, 3), np.uint8))
+
+
+def order_corners(corners):
+    """returns the 4 corners clockwise from the one nearest the top left"""
+    corners = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+    center = corners.mean(axis=0)
+    corners = corners[np.argsort(np.arctan2(corners[:, 1] - center[1], corners[:, 0] - center[0]))]
+    return np.roll(corners, -int(np.argmin(corners.sum(axis=1))), axis=0)
+
+
+def aspect(corners):
+    """returns the longest over the shortest of the mean widths and heights of the ordered corners"""
+    top, right, bottom, left = (np.linalg.norm(corners[(i + 1) % 4] - corners[i]) for i in range(4))
+    width, height = (top + bottom) / 2, (left + right) / 2
+    return max(width, height) / max(min(width, height), 1)
+
+
+def regions(gray):
+    """returns the mask of the densely edged regions of the image, such as a sleeve's artwork, with the thin parts
+    cut off"""
+    import cv2 as cv
+    size = max(3, int(MORPH_FRACTION * gray.shape[1]) | 1)
+    kernel = cv.getStructuringElement(cv.MORPH_ELLIPSE, (size, size))
+    # closing merges the edges of the artwork into one region, whose gaps the fill then closes
+    closed = cv.morphologyEx(edges(gray), cv.MORPH_CLOSE, kernel)
+    contours, _ = cv.findContours(closed, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
+    mask = cv.drawContours(np.zeros_like(gray), contours, -1, 255, cv.FILLED)
+    return cv.morphologyEx(mask, cv.MORPH_OPEN, kernel)
+
+
+def quadrilateral(contour):
+    """returns the 4 corners that approximate the contour's convex hull, or None if it is not close to 4 sided"""
+    import cv2 as cv
+    hull = cv.convexHull(contour)
+    perimeter = cv.arcLength(hull, True)
+    for epsilon in APPROX_EPSILONS:
+        quad = cv.approxPolyDP(hull, epsilon * perimeter, True)
+        if len(quad) <= 4:
+            return quad if len(quad) == 4 else None
+    return None
+
+
+def find_sleeve(gray):
+    """returns the ordered corners of the largest convex quadrilateral region that may be an album sleeve, or None.
+    the photo is aimed at the sleeve, so the sleeve must cover the center of the photo."""
+    import cv2 as cv
+    area = gray.shape[0] * gray.shape[1]
+    center = (gray.shape[1] / 2, gray.shape[0] / 2)
+    contours, _ = cv.findContours(regions(gray), cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
+
+    for contour in sorted(contours, key=cv.contourArea, reverse=True)[:MAX_CONTOURS]:
+        quad = quadrilateral(contour)
+        if quad is None:
+            continue
+        quad_area, region_area = cv.contourArea(quad), cv.contourArea(contour)
+        if not MIN_AREA * area <= quad_area <= MAX_AREA * area \
+                or not MIN_FILL * quad_area <= region_area <= quad_area / MIN_FILL \
+                or cv.pointPolygonTest(quad, center, False) < 0:
+            continue
+        corners = order_corners(quad)
+        if aspect(corners) <= MAX_ASPECT:
+            return corners
+
+    return None
+
+
+def rectify(img, gray, corners, width, margin=MARGIN):
+    """returns (img, gray) of the quadrilateral warped to a width x width square with margin around it. img may be
+    None."""
+    import cv2 as cv
+    inset = margin * width
+    # warping does not filter, so the photo is shrunk first to keep a large sleeve from aliasing
+    side = np.mean([np.linalg.norm(corners[(i + 1) % 4] - corners[i]) for i in range(4)])
+    if side > width - 2 * inset:
+        photo_width = gray.shape[1]
+        img, gray = resize(img, gray, max(1, int(photo_width * (width - 2 * inset) / side)))
+        corners = corners * np.float32(gray.shape[1] / photo_width)
+
+    square = np.float32([[inset, inset], [width - 1 - inset, inset], [width - 1 - inset, width - 1 - inset],
+                         [inset, width - 1 - inset]])
+    transform = cv.getPerspectiveTransform(corners, square)
+    return (None if img is None else cv.warpPerspective(img, transform, (width, width)),
+            cv.warpPerspective(gray, transform, (width, width)))
+
+
+def resize(img, gray, width):
+    import cv2 as cv
+    h, w = gray.shape[:2]
+    size = (width, int(width * h / w))
+    return (None if img is None else cv.resize(img, size, interpolation=cv.INTER_AREA),
+            cv.resize(gray, size, interpolation=cv.INTER_AREA))
+
+
+def crop_sleeve(img, gray, width, fallback_width):
+    """returns (img, gray, found) of the sleeve rectified to width, or of the whole photo resized to fallback_width
+    when no sleeve is found"""
+    corners = find_sleeve(gray)
+    if corners is None:
+        return *resize(img, gray, fallback_width), False
+    return *rectify(img, gray, corners, width), True
@@ -11,8 +11,11 @@ import natsort
 import numpy as np
 import psycopg
 from . import db
+from . import descriptor_cache
 from . import encode
+from . import projection
 from . import utils
+from . import vocabulary
 
 
 def init_app(app):
@@ -54,6 +57,16 @@ class Album:
     album_cover_url: str | None = None
     created: datetime.datetime | None = None
     descriptor: np.ndarray | None = dataclasses.field(default_factory=lambda: None, repr=None)
+    # keypoint (x, y) of each descriptor row, see verify.py
+    keypoints: np.ndarray | None = dataclasses.field(default=None, repr=None)
+    # encoded tf-idf bag of visual words, see vocabulary.py
+    bow: str | None = dataclasses.field(default=None, repr=None)
+    bow_vocabulary: int | None = dataclasses.field(default=None, repr=None)
+    # whole-image colour histogram, see signature.py
+    signature: np.ndarray | None = dataclasses.field(default=None, repr=None)
+    # pca projected descriptor, see projection.py
+    projected: np.ndarray | None = dataclasses.field(default=None, repr=None)
+    projection: int | None = dataclasses.field(default=None, repr=None)
 
     @classmethod
     def load(cls, catalog):
@@ -99,7 +112,19 @@ def does_db_metadata_exist():
     return any(table.exists for table in cur.fetchall())
 
 
-def db_load_library(username):
+def _album_from_row(row, extractor, projected=True):
+    """returns the Album of a dict row of the albums table with its encoded columns decoded, and the descriptor and
+    keypoints of the given extractor. without projected, the projected descriptor is left out."""
+    return Album(**{
+        **row,
+        'descriptor': encode.decode_descriptors(row['descriptor']).get(extractor),
+        'keypoints': encode.decode_keypoints(row['keypoints']).get(extractor),
+        'signature': None if row['signature'] is None else encode.decode(row['signature']),
+        'projected': None if row['projected'] is None or not projected else encode.decode(row['projected']),
+    })
+
+
+def db_load_library(username, extractor='sift', projected=True):
     db = get_db().cursor(row_factory=psycopg.rows.dict_row)
     albums = {}
     query = '''\
@@ -109,9 +134,34 @@ JOIN albums A ON A.catalog = C.catalog
 WHERE C.username = %s
 ;''', (username, )
 
-    for album in db.execute(*query).fetchall():
-        album['descriptor'] = encode.decode(album['descriptor'])
-        albums[album['catalog']] = Album(**album)
+    for row in db.execute(*query).fetchall():
+        album = _album_from_row(row, extractor, projected)
+        albums[album.catalog] = album
+
+    return albums
+
+
+def db_load_collection(username):
+    return [
+        row.catalog
+        for row in get_db().execute('SELECT catalog FROM collections WHERE username = %s;', (username, ))
+    ]
+
+
+def db_load_albums(catalogs=None, extractor='sift', projected=True):
+    """load the given albums, or every album if catalogs is None, with the descriptor of the given extractor. without
+    projected, the albums' projected descriptors are not decoded."""
+    db = get_db().cursor(row_factory=psycopg.rows.dict_row)
+    albums = {}
+
+    if catalogs is None:
+        query = 'SELECT * FROM albums ORDER BY catalog;', ()
+    else:
+        query = 'SELECT * FROM albums WHERE catalog = ANY(%s);', (list(catalogs), )
+
+    for row in db.execute(*query).fetchall():
+        album = _album_from_row(row, extractor, projected)
+        albums[album.catalog] = album
 
     return albums
 
@@ -165,6 +215,9 @@ def db_reset(migrations, to_version, empty, force):
 
     # need to close this connection before opening the postgres db connection
     close_db()
+    descriptor_cache.descriptor_cache.clear()
+    vocabulary.forget_inverted_files()
+    projection.forget_projections()
 
     # then clear the db
     try:
@@ -230,6 +283,8 @@ def execute_sql_migration(migrations, fname, version):
 
 
 def execute_sh_migration(migrations, fname, version):
+    # the script may connect to the db itself, so it must see the migrations before it
+    get_db().commit()
     exit_code = os.system(f'bash {migrations / fname}')
     if exit_code:
         raise RuntimeError(f'migration {fname} exited {exit_code}')
@@ -287,6 +342,7 @@ def db_load_test_data(migrations):
 
     if fnames:
         db.execute("UPDATE db_metadata SET has_test_data = 'yes'")
+        descriptor_cache.descriptor_cache.clear()
     else:
         print('no test data to load')
 
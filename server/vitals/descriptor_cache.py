@@ -0,0 +1,262 @@
+import collections
+import json
+import os
+import threading
+import psycopg
+from . import db as vitals_db
+from . import library_index
+
+# settings
+MAX_BYTES = 256 * 2 ** 20
+# the channel the albums and collections triggers notify
+CHANNEL = 'vitals_library'
+# seconds between checks of the stop event while no change arrives
+LISTEN_TIMEOUT_SECONDS = 1.0
+# seconds to wait before listening again after the db connection drops
+RECONNECT_SECONDS = 5
+
+
+def init_app(app):
+    max_bytes = os.getenv('VITALS_DESCRIPTOR_CACHE_MAX_BYTES')
+    app.config.setdefault('DESCRIPTOR_CACHE_MAX_BYTES', int(max_bytes) if max_bytes else MAX_BYTES)
+    # 0 leaves the cache to this process's own invalidations. tests turn it off so that changes of one test do not
+    # arrive in the middle of another.
+    listen_changes = os.getenv('VITALS_LISTEN_CHANGES')
+    app.config.setdefault('LISTEN_CHANGES', int(listen_changes) if listen_changes else
+                          int(not app.config.get('VITALS_TESTING')))
+    descriptor_cache.max_bytes = app.config['DESCRIPTOR_CACHE_MAX_BYTES']
+    descriptor_cache.set_extractor(app.config['EXTRACTOR'])
+
+
+# Library functions
+
+
+def album_nbytes(album):
+    return sum(0 if array is None else array.nbytes
+               for array in (album.descriptor, album.keypoints, album.signature, album.projected))
+
+
+class DescriptorCache:
+    """process-wide LRU cache of albums with decoded descriptors, keyed by catalog.
+
+    the catalogs in each user's collection are cached next to the albums so that a warm library load does not touch
+    the db at all. each user's library index is cached too so that trained matchers live as long as the index."""
+
+    def __init__(self, max_bytes=MAX_BYTES, extractor='sift'):
+        self.max_bytes = max_bytes
+        self.extractor = extractor
+        self.nbytes = 0
+        self.albums = collections.OrderedDict()  # catalog: Album
+        self.collections = {}  # username: [catalog]
+        self.indexes = collections.OrderedDict()  # username: LibraryIndex
+        # bumped on every invalidation so that loads racing an invalidation do not cache stale data
+        self.generation = 0
+        # bumped only when an album may have changed, for caches of data derived from albums, see vocabulary.py
+        self.album_generation = 0
+        self.lock = threading.Lock()
+
+    def load_collection(self, username):
+        with self.lock:
+            generation = self.generation
+            catalogs = self.collections.get(username)
+
+        if catalogs is None:
+            catalogs = vitals_db.db_load_collection(username)
+            with self.lock:
+                if generation == self.generation:
+                    self.collections[username] = catalogs
+
+        return catalogs
+
+    def load_library(self, username, projected=False):
+        """returns the user's albums. their projected descriptors are only decoded, and counted against the budget,
+        with projected."""
+        with self.lock:
+            generation = self.generation
+        return self.load_albums(self.load_collection(username), projected, generation)
+
+    def load_albums(self, catalogs, projected=False, generation=None):
+        """returns the albums of catalogs, from the cache or else the db. generation is the one read before catalogs
+        were, if they come from the cache too."""
+        if generation is None:
+            with self.lock:
+                generation = self.generation
+
+        library = {}
+        missing = []
+
+        with self.lock:
+            for catalog in catalogs:
+                album = self.albums.get(catalog)
+                # an album cached while the projection was off is loaded again with its projected descriptor
+                if album is None or projected and album.projected is None and album.projection is not None:
+                    missing.append(catalog)
+                else:
+                    self.albums.move_to_end(catalog)
+                    library[catalog] = album
+
+        loaded = vitals_db.db_load_albums(missing, self.extractor, projected) if missing else {}
+        library.update(loaded)
+
+        with self.lock:
+            if generation == self.generation:
+                for album in loaded.values():
+                    self.put(album)
+
+        return {
+            catalog: library[catalog]
+            for catalog in catalogs
+            if catalog in library
+        }
+
+    def load_library_index(self, username, projection=None):
+        """returns the user's index, of descriptors projected with projection if one is given"""
+        projection_id = None if projection is None else projection.id
+        projected = projection is not None
+        return self.load_index(
+            username,
+            lambda index: index.masked_from is None
+            and (None if index.projection is None else index.projection.id) == projection_id,
+            lambda: library_index.LibraryIndex.from_library(self.load_library(username, projected), self.extractor,
+                                                            projection))
+
+    def load_masked_index(self, username, shared_index):
+        """returns the user's index masked out of the shared index. it is cached like the user's own index, so that a
+        matcher trained on the user's rows is trained once per collection, not once per query. albums added since the
+        shared index was published are loaded like those of the user's own index and stacked after the masked rows."""
+        def build():
+            with self.lock:
+                generation = self.generation
+            catalogs = self.load_collection(username)
+            index = shared_index.masked(catalogs)
+            missing = [catalog for catalog in catalogs if catalog not in shared_index.positions]
+            if not missing:
+                return index
+            return index.extended(list(self.load_albums(missing, generation=generation).values()))
+
+        return self.load_index(username, lambda index: index.masked_from is shared_index, build)
+
+    def load_index(self, username, is_current, build):
+        """returns the user's cached index if is_current(index), or caches and returns build()"""
+        with self.lock:
+            generation = self.generation
+            index = self.indexes.get(username)
+            if index is not None and is_current(index):
+                self.indexes.move_to_end(username)
+                return index
+
+        index = build()
+
+        with self.lock:
+            if generation == self.generation:
+                self.drop_index(username)
+                self.indexes[username] = index
+                self.nbytes += index.nbytes
+                self.evict()
+
+        return index
+
+    def put(self, album):
+        # caller must hold self.lock
+        self.pop(album.catalog)
+        self.albums[album.catalog] = album
+        self.nbytes += album_nbytes(album)
+        self.evict()
+
+    def evict(self):
+        # caller must hold self.lock. indexes are rebuilt from cached albums, so they go first.
+        while self.nbytes > self.max_bytes and self.indexes:
+            _, evicted = self.indexes.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+        while self.nbytes > self.max_bytes and self.albums:
+            _, evicted = self.albums.popitem(last=False)
+            self.nbytes -= album_nbytes(evicted)
+
+    def drop_index(self, username):
+        # caller must hold self.lock
+        index = self.indexes.pop(username, None)
+        if index is not None:
+            self.nbytes -= index.nbytes
+
+    def drop_indexes(self):
+        # caller must hold self.lock
+        for username in list(self.indexes):
+            self.drop_index(username)
+
+    def pop(self, catalog):
+        # caller must hold self.lock
+        album = self.albums.pop(catalog, None)
+        if album is not None:
+            self.nbytes -= album_nbytes(album)
+
+    def invalidate_album(self, catalog):
+        with self.lock:
+            self.generation += 1
+            self.album_generation += 1
+            self.pop(catalog)
+            self.drop_indexes()
+
+    def invalidate_collections(self):
+        with self.lock:
+            self.generation += 1
+            self.collections.clear()
+            self.drop_indexes()
+
+    def set_extractor(self, extractor):
+        if extractor != self.extractor:
+            self.clear()
+            self.extractor = extractor
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.album_generation += 1
+            self.albums.clear()
+            self.collections.clear()
+            self.indexes.clear()
+            self.nbytes = 0
+
+
+descriptor_cache = DescriptorCache()
+# (pid, stop event) of the listener of this process. gunicorn forks its workers after create_app, so each worker
+# starts its own on its first library load.
+listener = None
+listener_lock = threading.Lock()
+
+
+def apply_change(payload):
+    change = json.loads(payload)
+    if change['table'] == 'albums':
+        descriptor_cache.invalidate_album(change['catalog'])
+    else:
+        descriptor_cache.invalidate_collections()
+
+
+def listen(app, stopped):
+    """invalidates the cached albums and collections as they change in the db until stopped is set"""
+    while not stopped.is_set():
+        try:
+            with psycopg.connect(vitals_db.get_db_url(), autocommit=True) as conn:
+                conn.execute(f'LISTEN {CHANNEL};')
+                # anything may have changed while there was no connection
+                descriptor_cache.clear()
+                while not stopped.is_set():
+                    for notify in conn.notifies(timeout=LISTEN_TIMEOUT_SECONDS):
+                        apply_change(notify.payload)
+        except psycopg.OperationalError as e:
+            app.logger.warning(f'library listener lost the db, listening again in {RECONNECT_SECONDS}s: {e}')
+            stopped.wait(RECONNECT_SECONDS)
+
+
+def start_listener(app, stopped=None):
+    """starts listening for changes to the library in a thread unless this process already is. set stopped, or the
+    returned event, to stop."""
+    global listener
+    with listener_lock:
+        if listener is not None and listener[0] == os.getpid() and not listener[1].is_set():
+            return listener[1]
+        stopped = stopped or threading.Event()
+        threading.Thread(target=listen, args=(app, stopped), name='library-listen', daemon=True).start()
+        listener = os.getpid(), stopped
+        return stopped
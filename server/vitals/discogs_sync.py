@@ -9,10 +9,16 @@ import flask_login
 import discogs_client
 from . import album_match
 from . import db as vitals_db
+from . import descriptor_cache
 from . import discogs_auth
 from .discogs_auth import discogs_routes
 from . import encode
+from . import features
+from . import library_index
+from . import projection
+from . import signature
 from . import utils
+from . import vocabulary
 
 
 def init_app(app):
@@ -63,7 +69,7 @@ def print_sync_plan():
 
         for query in transaction:
             if callable(query):
-                sql, args = query('DESCRIPTOR')
+                sql, args = query('DESCRIPTOR', 'KEYPOINTS', 'SIGNATURE')
             else:
                 sql, args = query
             sql = textwrap.dedent(sql).strip()
@@ -315,15 +321,18 @@ def plan_to_download_album_cover(collection, catalog):
     album_cover_file_location = utils.static_files() / static_path
     album_cover_url = f'/static/{static_path}'
     # TODO: do not call the lambda with None
-    return (lambda descriptor: plan_to_set_album_cover(catalog, album_cover_url, descriptor)), dict(
+    set_album_cover = (lambda descriptor, keypoints, album_signature:
+                       plan_to_set_album_cover(catalog, album_cover_url, descriptor, keypoints, album_signature))
+    return set_album_cover, dict(
+        catalog=catalog,
         cover_image_url=cover_image_url,
         album_cover_file_location=album_cover_file_location,
     )
 
 
-def plan_to_set_album_cover(catalog, album_cover_url, descriptor):
-    return 'UPDATE albums SET album_cover_url = %s, descriptor = %s WHERE catalog = %s;', \
-            (album_cover_url, descriptor, catalog)
+def plan_to_set_album_cover(catalog, album_cover_url, descriptor, keypoints, album_signature):
+    return 'UPDATE albums SET album_cover_url = %s, descriptor = %s, keypoints = %s, signature = %s ' \
+           'WHERE catalog = %s;', (album_cover_url, descriptor, keypoints, album_signature, catalog)
 
 
 def get_discogs_collection(collection_id=0, *, discogs=None):
@@ -401,17 +410,21 @@ def sync_discogs_collection(*, username=None, discogs=None):
     for prep_plan, transaction in plans:
         execute_sync_plan(discogs, prep_plan, transaction)
 
+    if plans:
+        library_index.republish_shared_index()
+
 
 def execute_sync_plan(discogs, prep_plan, transaction):
     if prep_plan is not None:
-        descriptor = download_album_cover(discogs=discogs, **prep_plan)
+        descriptors, keypoints, album_signature = download_album_cover(discogs=discogs, **prep_plan)
 
     db = vitals_db.get_db()
 
     with db.transaction():
         for query in transaction:
             if callable(query):
-                sql, args = query(encode.encode(descriptor))
+                sql, args = query(encode.encode_descriptors(descriptors, flask.current_app.config['DESCRIPTOR_DTYPE']),
+                                  encode.encode_keypoints(keypoints), encode.encode(album_signature))
             else:
                 sql, args = query
 
@@ -423,15 +436,32 @@ def execute_sync_plan(discogs, prep_plan, transaction):
 
             db.execute(sql, args)
 
+    # invalidate after the commit so that a concurrent library load cannot cache the old rows
+    if prep_plan is not None:
+        extractor = flask.current_app.config['EXTRACTOR']
+        vocabulary.index_album(prep_plan['catalog'], descriptors.get(extractor), extractor)
+        projection.project_album(prep_plan['catalog'], descriptors.get(extractor), extractor)
+        descriptor_cache.descriptor_cache.invalidate_album(prep_plan['catalog'])
+    descriptor_cache.descriptor_cache.invalidate_collections()
+
 
-def download_album_cover(discogs, cover_image_url, album_cover_file_location):
+def download_album_cover(discogs, catalog, cover_image_url, album_cover_file_location):
     print(f'Downloading {cover_image_url}')
     content = discogs_get_data(discogs, cover_image_url)
     with album_cover_file_location.open('wb') as f:
         print(f'Writing to {album_cover_file_location}')
         f.write(content)
-    _, _, _, descriptor = album_match.imread(content, resize_width=album_match.RESIZE_WIDTH)
-    return descriptor
+    descriptors = {}
+    keypoints = {}
+
+    config = flask.current_app.config
+    for extractor in config['INGEST_EXTRACTORS']:
+        img, _, album_keypoints, descriptors[extractor] = album_match.imread(
+            content, resize_width=album_match.RESIZE_WIDTH, extractor=extractor,
+            max_keypoints=config['ALBUM_KEYPOINTS'])
+        keypoints[extractor] = features.points(album_keypoints)
+
+    return descriptors, keypoints, signature.compute(img)
 
 
 def discogs_get_data(discogs, url):
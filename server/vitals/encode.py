@@ -3,7 +3,15 @@ import lzma
 import os
 import pickle
 import click
+import flask
 from . import album_match
+from . import db as vitals_db
+from . import descriptor_cache
+from . import features
+from . import library_index
+from . import projection
+from . import utils
+from . import vocabulary
 
 PROCESSES = [
     (lambda x: pickle.dumps(x), lambda x: pickle.loads(x)),
@@ -15,6 +23,10 @@ PROCESSES = [
 
 def init_app(app):
     app.cli.add_command(codegen_descriptor_test_data)
+    app.cli.add_command(codegen_keypoint_test_data)
+    app.cli.add_command(backfill_descriptors)
+    app.cli.add_command(reencode_descriptors)
+    app.cli.add_command(budget_keypoints)
 
 
 def encode(obj):
@@ -31,17 +43,192 @@ def decode(obj):
     return obj
 
 
-def get_test_data_descriptors(library):
+def encode_descriptors(descriptors, dtype=features.DESCRIPTOR_DTYPE):
+    """descriptors is {extractor: descriptor}. L2 descriptors are stored as dtype, see features.compact. sift-only
+    descriptors are stored bare, the way they were stored before the extractor could be chosen, so that older readers
+    still work."""
+    descriptors = {
+        extractor: features.compact(descriptor, extractor, dtype)
+        for extractor, descriptor in descriptors.items()
+    }
+    if set(descriptors) == {'sift'}:
+        return encode(descriptors['sift'])
+    return encode(descriptors)
+
+
+def decode_descriptors(obj):
+    """returns {extractor: descriptor}"""
+    if obj is None:
+        return {}
+    descriptors = decode(obj)
+    return descriptors if isinstance(descriptors, dict) else {'sift': descriptors}
+
+
+def encode_keypoints(keypoints):
+    """keypoints is {extractor: (x, y) of each descriptor row}"""
+    return encode(keypoints)
+
+
+def decode_keypoints(obj):
+    """returns {extractor: (x, y) of each descriptor row}"""
+    return {} if obj is None else decode(obj)
+
+
+def get_test_data_descriptors(library, extractor='sift', dtype=features.DESCRIPTOR_DTYPE):
+    return get_side_by_side_test_data_descriptors({extractor: library}, dtype)
+
+
+def get_side_by_side_test_data_descriptors(extractor_libraries, dtype=features.DESCRIPTOR_DTYPE):
+    """extractor_libraries is {extractor: library}. every album stores the descriptors of every extractor."""
+    album_descriptors = {}
+
+    for extractor, library in extractor_libraries.items():
+        for fname, (_, _, _, descriptor) in library.items():
+            catalog, _ = os.path.splitext(fname)
+            album_descriptors.setdefault(catalog, {})[extractor] = descriptor
+
     queries = []
 
-    for fname, (_, _, _, descriptor) in library.items():
-        catalog, _ = os.path.splitext(fname)
-        queries.append(f"UPDATE albums SET descriptor = {encode(descriptor)!r} WHERE catalog = '{catalog}' ;")
+    for catalog, descriptors in album_descriptors.items():
+        queries.append(f"UPDATE albums SET descriptor = {encode_descriptors(descriptors, dtype)!r} "
+                       f"WHERE catalog = '{catalog}' ;")
+
+    return '\n'.join(queries)
+
+
+def get_side_by_side_test_data_keypoints(extractor_libraries):
+    """extractor_libraries is {extractor: library}. every album stores the keypoints of every extractor."""
+    album_keypoints = {}
+
+    for extractor, library in extractor_libraries.items():
+        for fname, (_, _, keypoints, _) in library.items():
+            catalog, _ = os.path.splitext(fname)
+            album_keypoints.setdefault(catalog, {})[extractor] = features.points(keypoints)
+
+    queries = []
+
+    for catalog, keypoints in album_keypoints.items():
+        queries.append(f"UPDATE albums SET keypoints = {encode_keypoints(keypoints)!r} WHERE catalog = '{catalog}' ;")
 
     return '\n'.join(queries)
 
 
 @click.command('codegen-descriptor-test-data', help='Generate SQL code that sets the descriptor for each album')
-def codegen_descriptor_test_data():
-    library = album_match.get_filesystem_library('album-covers-original', resize_width=album_match.RESIZE_WIDTH)
-    print(get_test_data_descriptors(library))
+@click.option('--extractor', 'extractors', multiple=True, default=['sift'], type=click.Choice(features.EXTRACTORS),
+              help='extractors to store side by side')
+def codegen_descriptor_test_data(extractors):
+    extractor_libraries = {
+        extractor: album_match.get_filesystem_library('album-covers-original', resize_width=album_match.RESIZE_WIDTH,
+                                                      extractor=extractor,
+                                                      max_keypoints=flask.current_app.config['ALBUM_KEYPOINTS'])
+        for extractor in extractors
+    }
+    print(get_side_by_side_test_data_descriptors(extractor_libraries, flask.current_app.config['DESCRIPTOR_DTYPE']))
+
+
+@click.command('codegen-keypoint-test-data', help='Generate SQL code that sets the keypoints for each album')
+@click.option('--extractor', 'extractors', multiple=True, default=['sift'], type=click.Choice(features.EXTRACTORS),
+              help='extractors to store side by side')
+def codegen_keypoint_test_data(extractors):
+    extractor_libraries = {
+        extractor: album_match.get_filesystem_library('album-covers-original', resize_width=album_match.RESIZE_WIDTH,
+                                                      extractor=extractor,
+                                                      max_keypoints=flask.current_app.config['ALBUM_KEYPOINTS'])
+        for extractor in extractors
+    }
+    print(get_side_by_side_test_data_keypoints(extractor_libraries))
+
+
+@click.command('backfill-descriptors', help='Store the descriptors and keypoints of an extractor for every album')
+@click.option('--extractor', required=True, type=click.Choice(features.EXTRACTORS), help='extractor to add')
+def backfill_descriptors(extractor):
+    db = vitals_db.get_db()
+    rows = db.execute('SELECT catalog, album_cover_url, descriptor, keypoints FROM albums '
+                      'WHERE album_cover_url IS NOT NULL;')
+
+    num_backfilled = 0
+
+    for row in rows.fetchall():
+        descriptors = decode_descriptors(row.descriptor)
+        keypoints = decode_keypoints(row.keypoints)
+        if extractor in descriptors and extractor in keypoints:
+            continue
+        # recompute both so that the keypoints line up with the descriptor rows
+        album_cover_file = utils.static_files() / row.album_cover_url.removeprefix('/static/')
+        _, _, album_keypoints, descriptors[extractor] = album_match.imread(
+            str(album_cover_file), album_match.RESIZE_WIDTH, extractor,
+            max_keypoints=flask.current_app.config['ALBUM_KEYPOINTS'])
+        keypoints[extractor] = features.points(album_keypoints)
+        print(f'{extractor} {row.catalog}')
+        db.execute('UPDATE albums SET descriptor = %s, keypoints = %s WHERE catalog = %s;',
+                   (encode_descriptors(descriptors, flask.current_app.config['DESCRIPTOR_DTYPE']),
+                    encode_keypoints(keypoints), row.catalog))
+        num_backfilled += 1
+
+    db.commit()
+    descriptor_cache.descriptor_cache.clear()
+    if num_backfilled:
+        library_index.republish_shared_index()
+
+
+@click.command('reencode-descriptors', help='Store every album descriptor in the descriptor dtype')
+@click.option('--dtype', default=None, type=click.Choice(features.DESCRIPTOR_DTYPES),
+              help='defaults to VITALS_DESCRIPTOR_DTYPE')
+def reencode_descriptors(dtype):
+    dtype = dtype or flask.current_app.config['DESCRIPTOR_DTYPE']
+    db = vitals_db.get_db()
+    rows = db.execute('SELECT catalog, descriptor FROM albums WHERE descriptor IS NOT NULL;')
+    num_reencoded = 0
+
+    for row in rows.fetchall():
+        descriptors = decode_descriptors(row.descriptor)
+        if all(features.compact(descriptor, extractor, dtype) is descriptor
+               for extractor, descriptor in descriptors.items()):
+            continue
+        db.execute('UPDATE albums SET descriptor = %s WHERE catalog = %s;',
+                   (encode_descriptors(descriptors, dtype), row.catalog))
+        num_reencoded += 1
+
+    db.commit()
+    descriptor_cache.descriptor_cache.clear()
+    if num_reencoded:
+        library_index.republish_shared_index()
+    print(f'reencoded {num_reencoded} albums as {dtype}')
+
+
+@click.command('budget-keypoints', help='Recompute the albums that have more keypoints than the keypoint budget')
+@click.option('--max-keypoints', default=None, type=int, help='defaults to VITALS_ALBUM_KEYPOINTS')
+def budget_keypoints(max_keypoints):
+    config = flask.current_app.config
+    max_keypoints = config['ALBUM_KEYPOINTS'] if max_keypoints is None else max_keypoints
+    if not max_keypoints:
+        raise RuntimeError('there is no keypoint budget')
+    db = vitals_db.get_db()
+    rows = db.execute('SELECT catalog, album_cover_url, descriptor, keypoints FROM albums '
+                      'WHERE album_cover_url IS NOT NULL AND descriptor IS NOT NULL;')
+    num_budgeted = 0
+
+    for row in rows.fetchall():
+        descriptors = decode_descriptors(row.descriptor)
+        if all(descriptor is None or len(descriptor) <= max_keypoints for descriptor in descriptors.values()):
+            continue
+        # anms needs the keypoint responses, which are not stored, so the cover is extracted again
+        album_cover_file = utils.static_files() / row.album_cover_url.removeprefix('/static/')
+        keypoints = decode_keypoints(row.keypoints)
+        for extractor in descriptors:
+            _, _, album_keypoints, descriptors[extractor] = album_match.imread(
+                str(album_cover_file), album_match.RESIZE_WIDTH, extractor, max_keypoints=max_keypoints)
+            keypoints[extractor] = features.points(album_keypoints)
+        db.execute('UPDATE albums SET descriptor = %s, keypoints = %s WHERE catalog = %s;',
+                   (encode_descriptors(descriptors, config['DESCRIPTOR_DTYPE']), encode_keypoints(keypoints),
+                    row.catalog))
+        if config['EXTRACTOR'] in descriptors:
+            vocabulary.index_album(row.catalog, descriptors[config['EXTRACTOR']], config['EXTRACTOR'])
+            projection.project_album(row.catalog, descriptors[config['EXTRACTOR']], config['EXTRACTOR'])
+        num_budgeted += 1
+
+    db.commit()
+    descriptor_cache.descriptor_cache.clear()
+    if num_budgeted:
+        library_index.republish_shared_index()
+    print(f'budgeted {num_budgeted} albums to {max_keypoints} keypoints')
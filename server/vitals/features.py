@@ -0,0 +1,170 @@
+import dataclasses
+import os
+import threading
+import flask
+import numpy as np
+
+# settings
+EXTRACTOR = 'sift'
+# extractor options for query photos. a busy photo keeps only its strongest nfeatures keypoints.
+QUERY_EXTRACTOR_OPTIONS = {'nfeatures': 500}
+# dtype that float descriptors are stored and indexed in. sift values are whole numbers from 0 to 255, which uint8 and
+# float16 hold exactly.
+DESCRIPTOR_DTYPE = 'uint8'
+DESCRIPTOR_DTYPES = ('uint8', 'float16', 'float32')
+# album covers keep at most this many keypoints, spread over the cover, so that the library holds albums x this many
+# descriptor rows
+ALBUM_KEYPOINTS = 256
+# a keypoint is only suppressed by keypoints whose response is this much stronger than its own
+ANMS_ROBUSTNESS = 0.9
+# keypoints whose suppression radius is computed at once, which bounds the distance matrix
+ANMS_BLOCK_ROWS = 1024
+# the values of cv.NORM_L2 and cv.NORM_HAMMING, so that the extractor table does not import opencv
+NORM_L2 = 4
+NORM_HAMMING = 6
+
+
+def init_app(app):
+    # the extractor that queries and the library index use
+    app.config.setdefault('EXTRACTOR', os.getenv('VITALS_EXTRACTOR') or EXTRACTOR)
+    # every extractor that ingestion stores. list both while migrating from one extractor to another.
+    ingest_extractors = os.getenv('VITALS_INGEST_EXTRACTORS')
+    app.config.setdefault('INGEST_EXTRACTORS',
+                          ingest_extractors.split(',') if ingest_extractors else [app.config['EXTRACTOR']])
+    # e.g. VITALS_QUERY_EXTRACTOR_OPTIONS=nfeatures=500,contrastThreshold=0.06
+    query_options = os.getenv('VITALS_QUERY_EXTRACTOR_OPTIONS')
+    app.config.setdefault('QUERY_EXTRACTOR_OPTIONS',
+                          parse_options(query_options) if query_options else QUERY_EXTRACTOR_OPTIONS)
+    app.config.setdefault('DESCRIPTOR_DTYPE', os.getenv('VITALS_DESCRIPTOR_DTYPE') or DESCRIPTOR_DTYPE)
+    # 0 keeps every keypoint of the album covers
+    app.config.setdefault('ALBUM_KEYPOINTS', int(os.getenv('VITALS_ALBUM_KEYPOINTS') or ALBUM_KEYPOINTS))
+    app.after_request(report_keypoints)
+
+
+# Library functions
+
+
+@dataclasses.dataclass(frozen=True)
+class Extractor:
+    name: str
+    # name of the opencv function that creates the extractor
+    factory: str
+    # the norm is set here rather than read off the dtype, since compact sift descriptors are uint8 but still L2
+    norm: int
+    width: int
+    # the dtype that detectAndCompute returns
+    dtype: str
+    # keyword arguments of the factory that the extractor options may set
+    options: tuple = ()
+
+    def create(self, **options):
+        import cv2 as cv
+        return getattr(cv, self.factory)(**options)
+
+
+EXTRACTORS = {
+    extractor.name: extractor
+    for extractor in [
+        Extractor('sift', 'SIFT_create', NORM_L2, 128, 'float32',
+                  ('nfeatures', 'nOctaveLayers', 'contrastThreshold', 'edgeThreshold', 'sigma')),
+        # binary descriptors are matched with hamming distance
+        Extractor('orb', 'ORB_create', NORM_HAMMING, 32, 'uint8', ('nfeatures', 'scaleFactor', 'nlevels')),
+        # akaze has no keypoint cap. raise its threshold to get fewer keypoints.
+        Extractor('akaze', 'AKAZE_create', NORM_HAMMING, 61, 'uint8', ('threshold', 'nOctaves', 'nOctaveLayers')),
+    ]
+}
+
+
+def get_extractor_spec(name=None):
+    if name is None:
+        name = flask.current_app.config['EXTRACTOR']
+    if name not in EXTRACTORS:
+        raise ValueError(f'unknown extractor: {name!r}')
+    return EXTRACTORS[name]
+
+
+def points(keypoints):
+    """returns the (x, y) of each keypoint as a float32 array"""
+    return np.asarray([keypoint.pt for keypoint in keypoints], dtype=np.float32).reshape(-1, 2)
+
+
+def anms(keypoints, n, robustness=ANMS_ROBUSTNESS, block_rows=ANMS_BLOCK_ROWS):
+    """returns the sorted indexes of the n keypoints with the largest suppression radius, which is the distance to the
+    nearest keypoint that is clearly stronger. this keeps strong keypoints but spreads them over the image rather than
+    letting one busy region take all of them (adaptive non-maximal suppression)."""
+    if len(keypoints) <= n:
+        return np.arange(len(keypoints))
+    response = np.asarray([keypoint.response for keypoint in keypoints], dtype=np.float32)
+    order = np.argsort(-response, kind='stable')
+    response, pts = response[order], points(keypoints)[order]
+
+    # only the keypoints before a keypoint in this order can be stronger than it. the strongest is never suppressed.
+    radius = np.full(len(order), np.inf, dtype=np.float32)
+    for start in range(1, len(order), block_rows):
+        stop = min(start + block_rows, len(order))
+        distances = np.square(pts[start:stop, None] - pts[None, :stop]).sum(axis=2)
+        stronger = response[start:stop, None] < robustness * response[None, :stop]
+        radius[start:stop] = np.where(stronger, distances, np.inf).min(axis=1)
+
+    return np.sort(order[np.argsort(-radius, kind='stable')[:n]])
+
+
+def budget(keypoints, descriptor, n):
+    """returns the n keypoints picked by anms and their descriptor rows, or all of them if there are no more than n. n
+    of 0 keeps every keypoint."""
+    if not n or len(keypoints) <= n:
+        return keypoints, descriptor
+    keep = anms(keypoints, n)
+    return tuple(keypoints[i] for i in keep), descriptor[keep]
+
+
+def compact(descriptor, extractor, dtype=DESCRIPTOR_DTYPE):
+    """returns the L2 descriptor as dtype, or as it is if dtype cannot hold it exactly. binary descriptors are returned
+    as they are."""
+    if descriptor is None or EXTRACTORS[extractor].norm != NORM_L2 or descriptor.dtype == dtype:
+        return descriptor
+    converted = descriptor.astype(dtype)
+    return converted if np.array_equal(converted, descriptor) else descriptor
+
+
+def parse_options(options):
+    """parses 'name=value,...' into {name: int or float}"""
+    parsed = {}
+    for option in options.split(','):
+        name, _, value = option.partition('=')
+        try:
+            parsed[name.strip()] = int(value)
+        except ValueError:
+            parsed[name.strip()] = float(value)
+    return parsed
+
+
+# one extractor per thread and options. opencv extractors are not safe to share between threads.
+extractors = threading.local()
+
+
+def get_extractor(name=None, options=None):
+    """returns this thread's extractor, created once per thread with the options that the extractor supports"""
+    spec = get_extractor_spec(name)
+    options = {option: value for option, value in (options or {}).items() if option in spec.options}
+    key = spec.name, tuple(sorted(options.items()))
+    pool = extractors.__dict__.setdefault('pool', {})
+    if key not in pool:
+        pool[key] = spec.create(**options)
+    return pool[key]
+
+
+def detect_and_compute(gray, name=None, options=None):
+    """returns (keypoints, descriptor) and counts the keypoints in the request metrics"""
+    keypoints, descriptor = get_extractor(name, options).detectAndCompute(gray, None)
+    if flask.has_request_context():
+        flask.g.num_keypoints = flask.g.get('num_keypoints', 0) + len(keypoints)
+    return keypoints, descriptor
+
+
+def report_keypoints(response):
+    num_keypoints = flask.g.get('num_keypoints')
+    if num_keypoints is not None:
+        response.headers['X-Vitals-Keypoints'] = str(num_keypoints)
+        flask.current_app.logger.debug(f'{flask.request.path} extracted {num_keypoints} keypoints')
+    return response
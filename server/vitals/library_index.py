@@ -0,0 +1,471 @@
+import concurrent.futures
+import dataclasses
+import fcntl
+import functools
+import os
+import pickle
+import shutil
+import threading
+import time
+import click
+import flask
+import numpy as np
+from . import db as vitals_db
+from . import features
+
+# settings
+RATIO = 0.75
+MATCHER = 'bf'
+FLANN_TREES = 5
+FLANN_CHECKS = 50
+# use the shared index when the user's rows are at least this fraction of the catalog. otherwise copy out the rows.
+SHARED_MATCH_FRACTION = 0.5
+# matching threads per query. 1 matches on the request thread.
+MATCH_SHARDS = 1
+# smaller shards cost more in thread handoff than they save
+MIN_SHARD_LIBRARY_ROWS = 4096
+MIN_SHARD_QUERY_ROWS = 64
+# compact descriptors are upcast to float32 this many rows at a time, which stays in cache
+BLOCK_ROWS = 1024
+
+
+def init_app(app):
+    app.config.setdefault('DESCRIPTOR_INDEX_DIR', os.getenv('VITALS_DESCRIPTOR_INDEX_DIR') or None)
+    app.config.setdefault('MATCHER', os.getenv('VITALS_MATCHER') or MATCHER)
+    app.config.setdefault('FLANN_TREES', int(os.getenv('VITALS_FLANN_TREES') or FLANN_TREES))
+    app.config.setdefault('FLANN_CHECKS', int(os.getenv('VITALS_FLANN_CHECKS') or FLANN_CHECKS))
+    app.config.setdefault('MATCH_SHARDS', int(os.getenv('VITALS_MATCH_SHARDS') or MATCH_SHARDS))
+    app.cli.add_command(publish_descriptor_index)
+
+
+# Library functions
+
+
+class LibraryIndex:
+    """every album descriptor of a library stacked into one contiguous matrix.
+
+    row_album maps each descriptor row to its position in albums, or -1 if the row is not part of this library. points
+    holds the keypoint (x, y) of each row, nan for albums stored without keypoint geometry. the rows of an index with a
+    projection are projected descriptors, and queries are projected the same way. masked_from is the index this one was
+    masked out of, if any."""
+
+    def __init__(self, albums, descriptors, row_album, extractor='sift', trained_matchers=None, points=None,
+                 projection=None, masked_from=None):
+        self.albums = albums
+        self.descriptors = descriptors
+        self.row_album = row_album
+        self.points = np.full((len(descriptors), 2), np.nan, dtype=np.float32) if points is None else points
+        self.extractor = extractor
+        self.norm = features.EXTRACTORS[extractor].norm
+        self.projection = projection
+        self.positions = {album.catalog: i for i, album in enumerate(albums)}
+        self.masked_from = masked_from
+        # matchers trained on the rows of this library. only matchers that do not train on the rows, like brute
+        # force, could be shared with indexes masked out of this one.
+        self.trained_matchers = {} if trained_matchers is None else trained_matchers
+        self.trained_matchers_lock = threading.Lock()
+
+    @classmethod
+    def from_offsets(cls, albums, descriptors, offsets, extractor='sift', points=None, projection=None):
+        """album i owns rows offsets[i]:offsets[i + 1]"""
+        return cls(albums, descriptors, np.repeat(np.arange(len(albums)), np.diff(offsets)), extractor, points=points,
+                   projection=projection)
+
+    @classmethod
+    def from_library(cls, library, extractor='sift', projection=None):
+        """with a projection, albums stored without a descriptor projected by it are projected here"""
+        albums = list(library.values())
+        if projection is None:
+            descriptors, offsets = stack_descriptors((album.descriptor for album in albums), extractor)
+        else:
+            descriptors, offsets = stack_descriptors((
+                album.projected if album.projected is not None and album.projection == projection.id
+                else projection.project(album.descriptor)
+                for album in albums
+            ), extractor, projection.dims)
+        return cls.from_offsets(albums, descriptors, offsets, extractor, stack_points(albums, offsets), projection)
+
+    @property
+    def nbytes(self):
+        if self.masked_from is not None and self.descriptors is self.masked_from.descriptors:
+            # the matrix belongs to the index this one is masked out of
+            return self.row_album.nbytes
+        return self.descriptors.nbytes + self.points.nbytes
+
+    def __len__(self):
+        return len(self.albums)
+
+    def masked(self, catalogs):
+        """returns an index over only the albums in catalogs, sharing this index's matrix if it is worth it. trained
+        matchers are never shared, since flann trained on the whole matrix would let rows outside the mask take the
+        nearest neighbour slots of the query and change the votes."""
+        positions = [self.positions[catalog] for catalog in catalogs if catalog in self.positions]
+        lookup = np.full(len(self.albums) + 1, -1)
+        lookup[positions] = np.arange(len(positions))
+        # row_album of -1 looks up the trailing -1
+        row_album = lookup[self.row_album]
+        albums = [self.albums[i] for i in positions]
+        in_library = row_album >= 0
+
+        if np.count_nonzero(in_library) >= SHARED_MATCH_FRACTION * len(row_album):
+            return type(self)(albums, self.descriptors, row_album, self.extractor, points=self.points,
+                              projection=self.projection, masked_from=self)
+
+        return type(self)(albums, np.ascontiguousarray(self.descriptors[in_library]), row_album[in_library],
+                          self.extractor, points=self.points[in_library], projection=self.projection, masked_from=self)
+
+    def extended(self, albums):
+        """returns an index over this index's albums followed by albums, in a matrix of its own. this index must have
+        no projection."""
+        descriptors, offsets = stack_descriptors((album.descriptor for album in albums), self.extractor)
+        in_library = self.row_album >= 0
+        row_album = np.repeat(np.arange(len(self.albums), len(self.albums) + len(albums)), np.diff(offsets))
+        return type(self)(self.albums + albums, np.concatenate([self.descriptors[in_library], descriptors]),
+                          np.concatenate([self.row_album[in_library], row_album]), self.extractor,
+                          points=np.concatenate([self.points[in_library], stack_points(albums, offsets)]),
+                          masked_from=self.masked_from)
+
+    def project(self, q_descriptor):
+        """returns the query descriptor in the space of this index's rows"""
+        if self.projection is None or q_descriptor is None:
+            return q_descriptor
+        return self.projection.project(q_descriptor)
+
+    def matches(self, q_descriptor, matcher=None, shards=1):
+        """returns (library rows, query rows) of the descriptor matches that pass the ratio test. with shards, the
+        matcher splits the work into up to that many shards that run on the shard thread pool."""
+        if matcher is None:
+            matcher = BruteForceMatcher()
+        if q_descriptor is None or len(q_descriptor) < 2 or not len(self.descriptors):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        if shards <= 1:
+            return matcher.good_matches(self, q_descriptor)
+
+        parts = matcher.shards(self, q_descriptor, shards)
+        if len(parts) == 1:
+            return parts[0]()
+        results = list(get_shard_executor(shards).map(lambda part: part(), parts))
+        return (np.concatenate([rows for rows, _ in results]),
+                np.concatenate([q_rows for _, q_rows in results]))
+
+    def matches_of_rows(self, q_descriptor, library_rows, shards=1):
+        """returns (library rows, query rows) of the brute force matches of only the given library rows. each library
+        row is matched on its own, so these are the same as the matches of those rows in self.matches."""
+        if q_descriptor is None or len(q_descriptor) < 2 or not len(library_rows):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        matcher = BruteForceMatcher()
+        bounds = shard_bounds(len(library_rows), shards, MIN_SHARD_LIBRARY_ROWS)
+        parts = [
+            functools.partial(matcher.good_matches_of_rows, self, q_descriptor, library_rows[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        if len(parts) == 1:
+            return parts[0]()
+        results = list(get_shard_executor(shards).map(lambda part: part(), parts))
+        return (np.concatenate([rows for rows, _ in results]),
+                np.concatenate([q_rows for _, q_rows in results]))
+
+    def count_votes(self, rows):
+        row_album = self.row_album[rows]
+        return np.bincount(row_album[row_album >= 0], minlength=len(self.albums))
+
+    def votes(self, q_descriptor, matcher=None, shards=1):
+        """returns the number of descriptor matches that pass the ratio test for each album"""
+        rows, _ = self.matches(q_descriptor, matcher, shards)
+        return self.count_votes(rows)
+
+    def trained_matcher(self, key, train):
+        """returns the matcher trained on this index for key, training it with train() the first time"""
+        with self.trained_matchers_lock:
+            if key not in self.trained_matchers:
+                self.trained_matchers[key] = train()
+            return self.trained_matchers[key]
+
+    def rank(self, votes, k=None):
+        """returns [(matches_stat, album)] sorted by descending matches_stat, ties kept in library order. if k is given
+        only the top k are sorted and returned."""
+        return [(int(votes[i]), self.albums[i]) for i in top_k(votes, k)]
+
+
+class BruteForceMatcher:
+    """exact matching of every library row against the query descriptors"""
+    name = 'bf'
+
+    def good_matches(self, index, q_descriptor, start=0, stop=None):
+        """returns (library rows, query rows) of the library rows in start:stop that pass the ratio test"""
+        rows, q_rows = self.ratio_test(index, index.descriptors[start:stop], q_descriptor)
+        return rows + start, q_rows
+
+    def good_matches_of_rows(self, index, q_descriptor, library_rows):
+        """returns (library rows, query rows) of the given library rows that pass the ratio test"""
+        rows, q_rows = self.ratio_test(index, index.descriptors[library_rows], q_descriptor)
+        return library_rows[rows], q_rows
+
+    def ratio_test(self, index, descriptors, q_descriptor):
+        """returns (rows of descriptors, query rows) of the descriptors that pass the ratio test"""
+        import cv2 as cv
+        # same k-NN as cv.BFMatcher(norm).knnMatch(album.descriptor, q_descriptor, k=2) for every album at once,
+        # without creating a DMatch per row
+        if index.norm == features.NORM_HAMMING:
+            dist, nidx = cv.batchDistance(descriptors, q_descriptor, cv.CV_32S, normType=cv.NORM_HAMMING, K=2)
+        else:
+            dist, nidx = l2_knn(descriptors, np.asarray(q_descriptor, dtype=np.float32))
+        # compare in float64 like the python ratio test over DMatch.distance did
+        rows = np.flatnonzero(dist[:, 0] < RATIO * dist[:, 1].astype(np.float64))
+        return rows, nidx[rows, 0].astype(np.int64)
+
+    def shards(self, index, q_descriptor, shards):
+        """each library row is matched on its own, so splitting the library rows gives the same matches"""
+        bounds = shard_bounds(len(index.descriptors), shards, MIN_SHARD_LIBRARY_ROWS)
+        return [
+            functools.partial(self.good_matches, index, q_descriptor, start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
+
+class FlannMatcher:
+    """approximate matching of the query descriptors against randomized kd-trees built once per library index. binary
+    descriptors get an LSH index instead.
+
+    the search runs from the query side, so each query descriptor votes for the album of its nearest library row. the
+    trained matcher keeps its own copy of the descriptors of the library's rows only, so that the rows of a shared
+    matrix outside the library cannot take the nearest neighbour slots."""
+    name = 'flann'
+    FLANN_INDEX_KDTREE = 1
+    FLANN_INDEX_LSH = 6
+
+    def __init__(self, trees=FLANN_TREES, checks=FLANN_CHECKS):
+        self.trees = trees
+        self.checks = checks
+
+    def train(self, index):
+        """returns (trained matcher, the index rows it was trained on)"""
+        import cv2 as cv
+        rows = np.flatnonzero(index.row_album >= 0)
+        if index.norm == features.NORM_HAMMING:
+            index_params = dict(algorithm=self.FLANN_INDEX_LSH, table_number=6, key_size=12, multi_probe_level=1)
+            descriptors = np.asarray(index.descriptors[rows])
+        else:
+            index_params = dict(algorithm=self.FLANN_INDEX_KDTREE, trees=self.trees)
+            descriptors = np.asarray(index.descriptors[rows], dtype=np.float32)
+        matcher = cv.FlannBasedMatcher(index_params, dict(checks=self.checks))
+        matcher.add([descriptors])
+        matcher.train()
+        return matcher, rows
+
+    def good_matches(self, index, q_descriptor):
+        if np.count_nonzero(index.row_album >= 0) < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        matcher, rows = index.trained_matcher((self.name, self.trees, self.checks), lambda: self.train(index))
+        if index.norm != features.NORM_HAMMING:
+            q_descriptor = np.asarray(q_descriptor, dtype=np.float32)
+        matches = matcher.knnMatch(q_descriptor, k=2)
+        good = np.asarray([
+            (m.trainIdx, m.queryIdx)
+            for m, n in (pair for pair in matches if len(pair) == 2)
+            if m.distance < RATIO * n.distance
+        ], dtype=np.int64).reshape(-1, 2)
+        return rows[good[:, 0]], good[:, 1]
+
+    def shards(self, index, q_descriptor, shards):
+        """each query row is searched on its own, so splitting the query rows gives the same matches. the trained
+        index is only read while searching, so the shards share it."""
+        bounds = shard_bounds(len(q_descriptor), shards, MIN_SHARD_QUERY_ROWS)
+
+        def good_matches(start, stop):
+            rows, q_rows = self.good_matches(index, q_descriptor[start:stop])
+            return rows, q_rows + start
+
+        return [functools.partial(good_matches, start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def l2_knn(descriptors, q_descriptor, block_rows=BLOCK_ROWS):
+    """returns the (distances, query rows) of the 2 nearest query rows of each library row. opencv's L2 distance of
+    uint8 rows is several times slower than of float32 rows, so compact rows are upcast to float32 a block at a time.
+    the distances are the same, since sift values are whole numbers."""
+    import cv2 as cv
+    if descriptors.dtype == np.float32 or len(descriptors) <= block_rows:
+        return cv.batchDistance(np.asarray(descriptors, dtype=np.float32), q_descriptor, cv.CV_32F,
+                                normType=cv.NORM_L2, K=2)
+    blocks = [
+        cv.batchDistance(np.asarray(descriptors[start:start + block_rows], dtype=np.float32), q_descriptor, cv.CV_32F,
+                         normType=cv.NORM_L2, K=2)
+        for start in range(0, len(descriptors), block_rows)
+    ]
+    return np.concatenate([dist for dist, _ in blocks]), np.concatenate([nidx for _, nidx in blocks])
+
+
+def top_k(scores, k=None):
+    """returns the positions of the k highest scores in descending order, ties in position order, like a stable
+    argsort of -scores[:k] without sorting the rest"""
+    if k is None or k >= len(scores):
+        return np.argsort(-scores, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    # unique keys so that argpartition keeps the same ties as the stable sort
+    keys = -np.asarray(scores, dtype=np.int64) * len(scores) + np.arange(len(scores))
+    top = np.argpartition(keys, k - 1)[:k]
+    return top[np.argsort(keys[top])]
+
+
+def shard_bounds(num_rows, shards, min_rows):
+    """returns the bounds of up to shards contiguous shards of at least min_rows rows"""
+    shards = max(1, min(shards, num_rows // min_rows))
+    return np.linspace(0, num_rows, shards + 1).astype(np.int64)
+
+
+shard_executors = {}  # workers: ThreadPoolExecutor
+shard_executors_lock = threading.Lock()
+
+
+def get_shard_executor(workers):
+    """returns the process-wide thread pool that match shards run on. it is separate from the batch route pool so that
+    a batch thread waiting on its shards cannot starve them."""
+    with shard_executors_lock:
+        if workers not in shard_executors:
+            shard_executors[workers] = concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix='match-shard')
+        return shard_executors[workers]
+
+
+def get_matcher(name=MATCHER, *, trees=FLANN_TREES, checks=FLANN_CHECKS):
+    if name == BruteForceMatcher.name:
+        return BruteForceMatcher()
+    if name == FlannMatcher.name:
+        return FlannMatcher(trees=trees, checks=checks)
+    raise ValueError(f'unknown matcher: {name!r}')
+
+
+def as_index(library, extractor='sift'):
+    return library if isinstance(library, LibraryIndex) else LibraryIndex.from_library(library, extractor)
+
+
+def stack_descriptors(descriptors, extractor='sift', width=None):
+    """returns (descriptors, offsets). the descriptors keep the dtype they are stored in, see features.compact, unless
+    the albums are stored in different dtypes. width defaults to the extractor's descriptor width."""
+    spec = features.EXTRACTORS[extractor]
+    width = spec.width if width is None else width
+    descriptors = list(descriptors)
+    dtypes = [descriptor.dtype for descriptor in descriptors if descriptor is not None]
+    dtype = np.result_type(*dtypes) if dtypes else np.dtype(spec.dtype)
+    empty = np.empty((0, width), dtype=dtype)
+    descriptors = [
+        descriptor if descriptor is not None else empty
+        for descriptor in descriptors
+    ]
+    offsets = np.zeros(len(descriptors) + 1, dtype=np.int64)
+    np.cumsum([len(descriptor) for descriptor in descriptors], out=offsets[1:])
+    descriptors = np.ascontiguousarray(np.concatenate([empty, *descriptors]), dtype=dtype)
+    return descriptors, offsets
+
+
+def stack_points(albums, offsets):
+    """returns the keypoint (x, y) of every stacked descriptor row, nan where an album has no keypoint geometry"""
+    points = np.full((offsets[-1], 2), np.nan, dtype=np.float32)
+    for album, start, end in zip(albums, offsets[:-1], offsets[1:]):
+        if album.keypoints is not None and len(album.keypoints) == end - start:
+            points[start:end] = album.keypoints
+    return points
+
+
+# Shared Index
+#
+# The catalog-wide index is published as a directory of .npy files that every worker memory maps read-only, so the
+# descriptors live once in the page cache no matter how many workers there are. Layout:
+#
+#   DESCRIPTOR_INDEX_DIR/current -> <version>
+#   DESCRIPTOR_INDEX_DIR/<version>/{descriptors.npy, points.npy, offsets.npy, index.pickle}
+
+
+shared_indexes = {}  # index_dir: (version, LibraryIndex)
+shared_indexes_lock = threading.Lock()
+
+
+def publish_shared_index(index_dir, extractor='sift'):
+    """build the index over every album in the db and atomically make it the current index. returns the version."""
+    library = vitals_db.db_load_albums(extractor=extractor, projected=False)
+    descriptors, offsets = stack_descriptors((album.descriptor for album in library.values()), extractor)
+    points = stack_points(library.values(), offsets)
+    albums = [dataclasses.replace(album, descriptor=None, keypoints=None, bow=None, projected=None)
+              for album in library.values()]
+
+    os.makedirs(index_dir, exist_ok=True)
+    # publishes run one at a time, so a publish never deletes the version another one is about to make current
+    with open(os.path.join(index_dir, 'publish.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        version = str(time.time_ns())
+        tmp_path = os.path.join(index_dir, f'{version}.tmp')
+        os.mkdir(tmp_path)
+        np.save(os.path.join(tmp_path, 'descriptors.npy'), descriptors)
+        np.save(os.path.join(tmp_path, 'points.npy'), points)
+        np.save(os.path.join(tmp_path, 'offsets.npy'), offsets)
+        with open(os.path.join(tmp_path, 'index.pickle'), 'wb') as f:
+            pickle.dump(dict(extractor=extractor, albums=albums), f)
+        os.rename(tmp_path, os.path.join(index_dir, version))
+
+        current = os.path.join(index_dir, 'current')
+        previous = os.readlink(current) if os.path.lexists(current) else None
+        current_tmp = os.path.join(index_dir, f'current.{version}.tmp')
+        os.symlink(version, current_tmp)
+        os.replace(current_tmp, current)
+
+        # a worker may have read the previous version just before the swap and not have mapped it yet, so it stays
+        # until the next publish. workers that still map an older version keep their mapping after the files are
+        # unlinked. anything else left in the dir is from a publish that died.
+        for fname in os.listdir(index_dir):
+            if fname not in (version, previous, 'current', 'publish.lock'):
+                path = os.path.join(index_dir, fname)
+                if os.path.isdir(path) and not os.path.islink(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    os.remove(path)
+
+    return version
+
+
+def republish_shared_index():
+    """publishes the shared index again if one is configured. every command that adds albums or rewrites their
+    descriptors calls this, since workers match the published rows of the albums it holds."""
+    index_dir = flask.current_app.config['DESCRIPTOR_INDEX_DIR']
+    if index_dir:
+        publish_shared_index(index_dir, flask.current_app.config['EXTRACTOR'])
+
+
+def attach_shared_index(index_dir):
+    """returns the current published index, or None if nothing has been published or the current version was deleted
+    before it could be mapped"""
+    try:
+        version = os.readlink(os.path.join(index_dir, 'current'))
+    except FileNotFoundError:
+        return None
+
+    with shared_indexes_lock:
+        attached_version, index = shared_indexes.get(index_dir, (None, None))
+        if attached_version == version:
+            return index
+
+        path = os.path.join(index_dir, version)
+        try:
+            descriptors = np.load(os.path.join(path, 'descriptors.npy'), mmap_mode='r')
+            points = np.load(os.path.join(path, 'points.npy'), mmap_mode='r')
+            offsets = np.load(os.path.join(path, 'offsets.npy'))
+            with open(os.path.join(path, 'index.pickle'), 'rb') as f:
+                metadata = pickle.load(f)
+        except FileNotFoundError:
+            # two publishes went by since current was read. the caller matches the user's own index this time.
+            return None
+        index = LibraryIndex.from_offsets(metadata['albums'], descriptors, offsets, metadata['extractor'], points)
+        shared_indexes[index_dir] = version, index
+        return index
+
+
+# Commands
+
+
+@click.command('publish-descriptor-index', help='build the catalog-wide descriptor index shared by all workers')
+@click.option('--index-dir', metavar='<dir>', default=None, help='defaults to VITALS_DESCRIPTOR_INDEX_DIR')
+def publish_descriptor_index(index_dir):
+    index_dir = index_dir or flask.current_app.config['DESCRIPTOR_INDEX_DIR']
+    if not index_dir:
+        raise RuntimeError('VITALS_DESCRIPTOR_INDEX_DIR is not set')
+    version = publish_shared_index(index_dir, flask.current_app.config['EXTRACTOR'])
+    print(f'published descriptor index {version} to {index_dir}')
@@ -0,0 +1,242 @@
+import os
+import threading
+import time
+import click
+import flask
+import flask_login
+import psycopg
+import psycopg.types.json
+from . import album_match
+from . import db as vitals_db
+from . import utils
+
+match_jobs = flask.Blueprint('match_jobs', __name__)
+
+# settings
+# threads of each match-worker process
+WORKERS = 2
+# submits are rejected while this many jobs are queued or running
+QUEUE_DEPTH = 64
+# jobs that have not finished this long after they were submitted fail
+TIMEOUT_SECONDS = 60
+# finished jobs are deleted this long after they finish
+RETENTION_SECONDS = 600
+# the longest a poll may hold its request thread waiting for the job to finish
+MAX_WAIT_SECONDS = 10
+POLL_INTERVAL_SECONDS = 0.1
+# key of the advisory lock that makes the queue depth check and the insert of a submit atomic
+QUEUE_LOCK = 0x6d6a6f62
+# submits notify the match workers on this channel
+CHANNEL = 'vitals_match_jobs'
+# an idle worker thread checks the queue this often even without a notify, e.g. for jobs of a missed notify
+IDLE_SECONDS = 5
+LISTEN_TIMEOUT_SECONDS = 1.0
+RECONNECT_SECONDS = 5
+
+
+def init_app(app):
+    app.config.setdefault('MATCH_JOB_WORKERS', int(os.getenv('VITALS_MATCH_JOB_WORKERS') or WORKERS))
+    app.config.setdefault('MATCH_JOB_QUEUE_DEPTH', int(os.getenv('VITALS_MATCH_JOB_QUEUE_DEPTH') or QUEUE_DEPTH))
+    app.config.setdefault('MATCH_JOB_TIMEOUT_SECONDS',
+                          int(os.getenv('VITALS_MATCH_JOB_TIMEOUT_SECONDS') or TIMEOUT_SECONDS))
+    app.config.setdefault('MATCH_JOB_RETENTION_SECONDS',
+                          int(os.getenv('VITALS_MATCH_JOB_RETENTION_SECONDS') or RETENTION_SECONDS))
+    app.config.setdefault('MATCH_JOB_MAX_WAIT_SECONDS',
+                          int(os.getenv('VITALS_MATCH_JOB_MAX_WAIT_SECONDS') or MAX_WAIT_SECONDS))
+    app.register_blueprint(match_jobs)
+    app.cli.add_command(cleanup_match_jobs)
+    app.cli.add_command(match_worker)
+
+
+# Library functions
+
+
+def submit(username, image, k=None, min_score=0):
+    """queues the job for the match workers and returns its id, or None if the queue is full"""
+    db = vitals_db.get_db()
+    # without the lock, concurrent submits all see the same count and can overfill the queue. it is held until commit.
+    db.execute('SELECT pg_advisory_xact_lock(%s);', (QUEUE_LOCK, ))
+    row = db.execute('''\
+INSERT INTO match_jobs(username, image, k, min_score)
+SELECT %s, %s, %s, %s
+WHERE (SELECT count(*) FROM match_jobs WHERE status IN ('queued', 'running')) < %s
+RETURNING id
+;''', (username, image, k, min_score, flask.current_app.config['MATCH_JOB_QUEUE_DEPTH'])).fetchone()
+    if row is not None:
+        # delivered on commit
+        db.execute(f'NOTIFY {CHANNEL};')
+    # the job runs on a match worker's connection
+    db.commit()
+    return None if row is None else row.id
+
+
+def run_next(app):
+    """runs the oldest queued job that has not timed out and returns True, or returns False if there is none. the job
+    is matched like a query, by the matcher daemon when one is configured, see album_match.match_buffer. a job that
+    times out while it runs is failed by expire, but its thread still runs it to the end and its result is dropped."""
+    with app.app_context():
+        db = vitals_db.get_db()
+        job = db.execute('''\
+UPDATE match_jobs SET status = 'running', started = CURRENT_TIMESTAMP
+WHERE id = (SELECT id FROM match_jobs
+            WHERE status = 'queued' AND created >= CURRENT_TIMESTAMP - make_interval(secs => %s)
+            ORDER BY id LIMIT 1 FOR UPDATE SKIP LOCKED)
+RETURNING id, username, image, k, min_score
+;''', (app.config['MATCH_JOB_TIMEOUT_SECONDS'], )).fetchone()
+        db.commit()
+        if job is None:
+            return False
+
+        try:
+            result, _ = album_match.match_buffer(job.username, job.image, job.k, job.min_score)
+            error = result if 'status' in result else None
+        except Exception as e:
+            flask.current_app.logger.exception(f'match job {job.id} failed')
+            error = {'status': 500, 'message': str(e)}
+
+        # a job that timed out while it ran stays failed
+        db.execute("UPDATE match_jobs SET status = %s, result = %s, image = NULL, finished = CURRENT_TIMESTAMP "
+                   "WHERE id = %s AND status = 'running';",
+                   ('failed' if error else 'done', psycopg.types.json.Jsonb(error or result), job.id))
+        db.commit()
+        return True
+
+
+def run_jobs(app, wakeup, stopped):
+    """runs queued jobs until stopped is set, waiting on wakeup while the queue is empty"""
+    while not stopped.is_set():
+        try:
+            if run_next(app):
+                continue
+        except psycopg.OperationalError as e:
+            app.logger.warning(f'match worker lost the db, retrying in {RECONNECT_SECONDS}s: {e}')
+            stopped.wait(RECONNECT_SECONDS)
+            continue
+        wakeup.acquire(timeout=IDLE_SECONDS)
+
+
+def work(app, threads, stopped):
+    """runs the queued jobs on that many threads until stopped is set. each submit notify wakes one idle thread."""
+    wakeup = threading.Semaphore(0)
+    workers = [threading.Thread(target=run_jobs, args=(app, wakeup, stopped), name='match-job', daemon=True)
+               for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    while not stopped.is_set():
+        try:
+            with psycopg.connect(vitals_db.get_db_url(), autocommit=True) as conn:
+                conn.execute(f'LISTEN {CHANNEL};')
+                # jobs may have been queued while there was no connection
+                wakeup.release(threads)
+                while not stopped.is_set():
+                    for _ in conn.notifies(timeout=LISTEN_TIMEOUT_SECONDS):
+                        wakeup.release()
+        except psycopg.OperationalError as e:
+            app.logger.warning(f'match worker lost the db, listening again in {RECONNECT_SECONDS}s: {e}')
+            stopped.wait(RECONNECT_SECONDS)
+
+    wakeup.release(threads)
+    for worker in workers:
+        worker.join()
+
+
+def expire():
+    """fails the unfinished jobs that are past their timeout"""
+    timeout = flask.current_app.config['MATCH_JOB_TIMEOUT_SECONDS']
+    vitals_db.get_db().execute(
+        "UPDATE match_jobs SET status = 'failed', result = %s, image = NULL, finished = CURRENT_TIMESTAMP "
+        "WHERE status IN ('queued', 'running') AND created < CURRENT_TIMESTAMP - make_interval(secs => %s);",
+        (psycopg.types.json.Jsonb({'status': 504, 'message': f'job did not finish in {timeout} seconds'}), timeout))
+
+
+def cleanup():
+    """returns the number of finished jobs deleted"""
+    expire()
+    return vitals_db.get_db().execute(
+        "DELETE FROM match_jobs WHERE status IN ('done', 'failed') "
+        "AND finished < CURRENT_TIMESTAMP - make_interval(secs => %s);",
+        (flask.current_app.config['MATCH_JOB_RETENTION_SECONDS'], )).rowcount
+
+
+def load(job_id, username):
+    return vitals_db.get_db().execute('SELECT id, status, result FROM match_jobs WHERE id = %s AND username = %s;',
+                                      (job_id, username)).fetchone()
+
+
+def serialize(job):
+    return {'job_id': job.id, 'status': job.status, 'result': job.result}
+
+
+# Commands
+
+
+@click.command('cleanup-match-jobs', help='fail timed out match jobs and delete old finished ones')
+def cleanup_match_jobs():
+    print(f'deleted {cleanup()} match jobs')
+    vitals_db.get_db().commit()
+
+
+@click.command('match-worker', help='run the queued match jobs, outside of the web workers')
+@click.option('--threads', default=None, type=int, help='defaults to VITALS_MATCH_JOB_WORKERS')
+def match_worker(threads):
+    app = flask.current_app._get_current_object()
+    threads = threads or app.config['MATCH_JOB_WORKERS']
+    stopped = threading.Event()
+    print(f'running match jobs on {threads} threads')
+    try:
+        work(app, threads, stopped)
+    except KeyboardInterrupt:
+        stopped.set()
+
+
+# Routes
+
+
+@match_jobs.route('/user/album/query/jobs', methods=['POST'])
+@flask_login.login_required
+def submit_match_job():
+    """queues the 'query' image for matching and returns the job to poll"""
+    k, error = album_match.get_int_arg('k', flask.current_app.config['QUERY_K'] or None, minimum=1)
+    if error is not None:
+        return error
+    min_score, error = album_match.get_int_arg('min_score', 0)
+    if error is not None:
+        return error
+
+    config = flask.current_app.config
+    if (flask.request.content_length or 0) > config['QUERY_MAX_BYTES']:
+        return utils.jsonify_error(f'image is over {config["QUERY_MAX_BYTES"]} bytes', status=413)
+    if 'query' not in flask.request.files:
+        return utils.jsonify_error('query image not provided', status=400)
+    image = album_match.read_buffer(flask.request.files['query'].stream)
+
+    cleanup()
+    job_id = submit(flask_login.current_user.username, bytes(image), k, min_score)
+    if job_id is None:
+        return utils.jsonify_error('too many match jobs, try again later', status=503)
+    return utils.jsonify(202)({'job_id': job_id, 'status': 'queued', 'result': None})
+
+
+@match_jobs.route('/user/album/query/jobs/<int:job_id>', methods=['GET'])
+@flask_login.login_required
+def poll_match_job(job_id):
+    """returns the job. with wait, waits up to that many seconds, at most MATCH_JOB_MAX_WAIT_SECONDS, for it to
+    finish."""
+    wait, error = album_match.get_int_arg('wait', 0)
+    if error is not None:
+        return error
+    deadline = time.monotonic() + min(wait, flask.current_app.config['MATCH_JOB_MAX_WAIT_SECONDS'])
+    db = vitals_db.get_db()
+    # once per poll, not once per tick of the wait
+    expire()
+    job = load(job_id, flask_login.current_user.username)
+    while True:
+        # end the snapshot so the next load sees the worker's update
+        db.commit()
+        if job is None:
+            return utils.jsonify_error('match job not found', status=404)
+        if job.status in ('done', 'failed') or time.monotonic() >= deadline:
+            return utils.jsonify()(serialize(job))
+        time.sleep(POLL_INTERVAL_SECONDS)
+        job = load(job_id, flask_login.current_user.username)
@@ -0,0 +1,244 @@
+import os
+import struct
+import flask
+import flask_login
+import numpy as np
+from . import album_match
+from . import db
+from . import matcher_client
+from . import prior
+from . import quality
+
+match_stream = flask.Blueprint('match_stream', __name__)
+
+# settings
+# each frame of the request body is its length then its jpeg or png bytes
+FRAME_HEADER = struct.Struct('!I')
+# frames are low resolution camera frames
+FRAME_MAX_BYTES = 2 * 2 ** 20
+MAX_FRAMES = 300
+# albums per frame response when the client does not pass k
+STREAM_K = 3
+# albums of each matched frame that the smoothed ranking tracks
+TRACK_CANDIDATES = 10
+# a frame whose grayscale thumbnail differs from the last matched frame by less than this mean absolute difference (of
+# 255) reuses its matches
+SKIP_DIFFERENCE = 4.0
+THUMBNAIL_SIZE = (32, 32)
+# weight of the previous smoothed matches against the matches of a new frame
+SMOOTHING = 0.6
+# the stream stops once the same album has led the smoothed ranking for this many frames in a row
+STABLE_FRAMES = 3
+# of which at least this many were matched, not skipped. frames similar to the last matched frame are matched anyway
+# until then.
+MIN_MATCHED_FRAMES = 2
+
+
+def init_app(app):
+    app.config.setdefault('STREAM_FRAME_MAX_BYTES',
+                          int(os.getenv('VITALS_STREAM_FRAME_MAX_BYTES') or FRAME_MAX_BYTES))
+    app.config.setdefault('STREAM_MAX_FRAMES', int(os.getenv('VITALS_STREAM_MAX_FRAMES') or MAX_FRAMES))
+    # 0 matches every frame
+    app.config.setdefault('STREAM_SKIP_DIFFERENCE',
+                          float(os.getenv('VITALS_STREAM_SKIP_DIFFERENCE') or SKIP_DIFFERENCE))
+    app.config.setdefault('STREAM_STABLE_FRAMES', int(os.getenv('VITALS_STREAM_STABLE_FRAMES') or STABLE_FRAMES))
+    app.register_blueprint(match_stream)
+
+
+# Library functions
+
+
+def read_frame(stream, max_bytes=FRAME_MAX_BYTES):
+    """returns the next frame of the stream, or None at its end. raises ValueError for a bad or truncated frame."""
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise ValueError('frame header is truncated')
+    size, = FRAME_HEADER.unpack(header)
+    if size > max_bytes:
+        raise ValueError(f'frame is over {max_bytes} bytes')
+
+    frame = bytearray()
+    while len(frame) < size:
+        chunk = stream.read(size - len(frame))
+        if not chunk:
+            raise ValueError('frame is truncated')
+        frame += chunk
+    return frame
+
+
+def thumbnail(gray):
+    import cv2 as cv
+    return cv.resize(gray, THUMBNAIL_SIZE, interpolation=cv.INTER_AREA)
+
+
+def difference(thumb, other):
+    """returns the mean absolute difference of two thumbnails, or infinity if there is no other thumbnail"""
+    import cv2 as cv
+    return float(np.mean(cv.absdiff(thumb, other))) if other is not None else np.inf
+
+
+class Tracker:
+    """smooths the album rankings of consecutive frames and tells when the leader has settled"""
+
+    def __init__(self, stable_frames=STABLE_FRAMES, smoothing=SMOOTHING, min_matched_frames=MIN_MATCHED_FRAMES):
+        self.stable_frames = stable_frames
+        self.smoothing = smoothing
+        self.min_matched_frames = min_matched_frames
+        self.scores = {}  # catalog: smoothed matches_stat
+        self.albums = {}  # catalog: Album
+        self.leader = None
+        self.frames_led = 0
+        # the frames of frames_led that were matched
+        self.frames_matched = 0
+
+    def update(self, all_matches):
+        """folds in the matches of a new frame. albums that drop out of the matches decay towards 0. every
+        matches_stat must be in the same unit, raw matches, since verify.Inliers are on another scale."""
+        for catalog in self.scores:
+            self.scores[catalog] *= self.smoothing
+        for matches_stat, album in all_matches:
+            self.scores[album.catalog] = self.scores.get(album.catalog, 0) + (1 - self.smoothing) * matches_stat
+            self.albums[album.catalog] = album
+        self.hold(matched=True)
+
+    def hold(self, matched=False):
+        """counts a frame in which the ranking did not change, such as a frame skipped for being like the last one.
+        frames that fail the quality gate show nothing of the sleeve and are not counted at all."""
+        ranking = self.ranking(1)
+        leader = ranking[0][1].catalog if ranking and ranking[0][0] > 0 else None
+        if leader is not None and leader == self.leader:
+            self.frames_led += 1
+            self.frames_matched += matched
+        else:
+            self.frames_led, self.frames_matched = 1, int(matched)
+        self.leader = leader
+
+    def ranking(self, k=None):
+        """returns [(smoothed matches_stat, album)] best first"""
+        ranked = sorted(self.scores.items(), key=lambda score: -score[1])[:k]
+        return [(score, self.albums[catalog]) for catalog, score in ranked]
+
+    @property
+    def confirmed(self):
+        """whether enough matched frames agree on the leader"""
+        return self.leader is not None and self.frames_matched >= self.min_matched_frames
+
+    @property
+    def stable(self):
+        return self.confirmed and self.frames_led >= self.stable_frames
+
+
+def frame_response(tracker, frame, skipped, k):
+    albums = []
+
+    for score, album in tracker.ranking(k):
+        serialized = album.serialize()
+        serialized['matches_stat'] = round(score, 2)
+        albums.append(serialized)
+
+    return {'frame': frame, 'skipped': skipped, 'albums': albums,
+            'confidence': album_match.confidence(tracker.ranking(2)), 'stable': tracker.stable}
+
+
+def match_frame(username, buffer, k=TRACK_CANDIDATES, last_thumb=None, library=None, user_prior=None):
+    """returns (result, number of keypoints) of one frame, matched in-process. the result is the frame's error, with
+    the reason of a frame that failed the quality gate, or {'skipped': True} if its thumbnail differs from last_thumb
+    by less than STREAM_SKIP_DIFFERENCE, or else its thumbnail and its k best [matches_stat, serialized album]. the
+    user's library index and prior are loaded unless a library is given."""
+    decoded, error = album_match.decode_query_image(buffer)
+    if error is not None:
+        return error, 0
+    thumb = thumbnail(decoded[1])
+    skip_difference = flask.current_app.config['STREAM_SKIP_DIFFERENCE']
+    if last_thumb is not None and difference(thumb, np.asarray(last_thumb, dtype=np.uint8)) < skip_difference:
+        return {'skipped': True}, 0
+
+    img_data = album_match.extract_query(*decoded)
+    error = album_match.check_query(img_data)
+    if error is not None:
+        return error, len(img_data[2])
+    if library is None:
+        library = album_match.load_library_index(username)
+        user_prior = prior.load_prior(username)
+    # verified albums would be scored in inliers in one frame and raw matches in the next
+    all_matches = album_match.rank_query(library, img_data, k, user_prior, verify=False)
+    albums = [[matches_stat, album.serialize()] for matches_stat, album in all_matches]
+    return {'thumb': thumb.tolist(), 'albums': albums}, len(img_data[2])
+
+
+def match_frames(username, stream, k=STREAM_K):
+    """yields the smoothed response to each frame of the stream until the ranking is stable or the stream ends. each
+    frame is matched by the matcher daemon when one is configured and reachable. otherwise the library index and the
+    user's prior are loaded once, on the first frame, and shared by the rest."""
+    config = flask.current_app.config
+    tracker = Tracker(config['STREAM_STABLE_FRAMES'])
+    last_thumb = None
+    library = user_prior = None
+
+    for frame in range(config['STREAM_MAX_FRAMES']):
+        try:
+            buffer = read_frame(stream, config['STREAM_FRAME_MAX_BYTES'])
+        except ValueError as e:
+            yield {'frame': frame, 'status': 400, 'message': str(e)}
+            return
+        if buffer is None:
+            return
+        # frames like the last matched one are only skipped once the leader is confirmed
+        skip_thumb = last_thumb if tracker.confirmed else None
+        reply = matcher_client.try_match_frame(username, buffer, TRACK_CANDIDATES, skip_thumb)
+        if reply is not None:
+            result = reply['body']
+        else:
+            if library is None:
+                library = album_match.load_library_index(username)
+                user_prior = prior.load_prior(username)
+            result, _ = match_frame(username, buffer, TRACK_CANDIDATES, skip_thumb, library, user_prior)
+        if 'status' in result and result['status'] != quality.STATUS:
+            yield {'frame': frame, **result}
+            return
+
+        # a frame that fails the quality gate, like one blurred by the moving camera, is skipped too, and leaves the
+        # tracker as it was
+        error = result if 'status' in result else None
+        skipped = 'albums' not in result
+        if not skipped:
+            tracker.update([(matches_stat, db.Album(**album)) for matches_stat, album in result['albums']])
+            last_thumb = result['thumb']
+        elif error is None:
+            tracker.hold()
+
+        response = frame_response(tracker, frame, skipped, k)
+        if error is not None:
+            response['reason'] = error['reason']
+        yield response
+        if tracker.stable:
+            return
+
+
+# Routes
+
+
+@match_stream.route('/user/album/query/stream', methods=['POST'])
+@flask_login.login_required
+def query_album_match_stream():
+    """matches a stream of camera frames, each sent as a 4 byte big endian length and then the image, and streams back
+    one json line per frame with the k best albums of the smoothed ranking. frames too similar to the last matched
+    frame, or that fail the quality gate, are skipped. the line of a frame that failed the gate has its reason. the
+    response ends once the same album has led for STREAM_STABLE_FRAMES frames that passed the gate, MIN_MATCHED_FRAMES
+    of them matched, with stable true, or when the frames run out."""
+    k, error = album_match.get_int_arg('k', STREAM_K, minimum=1)
+    if error is not None:
+        return error
+
+    username = flask_login.current_user.username
+    stream = flask.request.stream
+
+    def generate():
+        for response in match_frames(username, stream, k):
+            yield flask.json.dumps(response) + '\n'
+
+    # tells a proxy in front, such as the repo's nginx, to pass each line on as it is written
+    return flask.Response(flask.stream_with_context(generate()), mimetype='application/x-ndjson',
+                          headers={'X-Accel-Buffering': 'no'})
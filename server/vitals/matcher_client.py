@@ -0,0 +1,110 @@
+import json
+import os
+import socket
+import struct
+import flask
+
+# settings
+# seconds to wait on the matcher daemon. a query it does not answer in time fails with a 503.
+TIMEOUT_SECONDS = 10
+# json length, payload length
+HEADER = struct.Struct('!II')
+# a message is one query image and its options
+MAX_MESSAGE_BYTES = 64 * 2 ** 20
+
+
+def init_app(app):
+    # unset matches in-process
+    app.config.setdefault('MATCHER_SOCKET', os.getenv('VITALS_MATCHER_SOCKET') or None)
+    app.config.setdefault('MATCHER_TIMEOUT_SECONDS',
+                          float(os.getenv('VITALS_MATCHER_TIMEOUT_SECONDS') or TIMEOUT_SECONDS))
+
+
+# Library functions
+
+
+def send_message(sock, message, payload=b''):
+    data = json.dumps(message).encode()
+    sock.sendall(HEADER.pack(len(data), len(payload)) + data)
+    if len(payload):
+        sock.sendall(payload)
+
+
+def recv_exactly(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(min(size - len(data), 2 ** 20))
+        if not chunk:
+            raise ConnectionError('matcher socket closed mid message')
+        data += chunk
+    return data
+
+
+def recv_message(sock, max_bytes=MAX_MESSAGE_BYTES):
+    """returns (message, payload) of the next message on the socket"""
+    message_size, payload_size = HEADER.unpack(recv_exactly(sock, HEADER.size))
+    if message_size + payload_size > max_bytes:
+        raise ConnectionError(f'matcher message is over {max_bytes} bytes')
+    return json.loads(recv_exactly(sock, message_size)), recv_exactly(sock, payload_size)
+
+
+def connect(socket_path, timeout=TIMEOUT_SECONDS):
+    """returns a socket connected to the daemon. raises OSError if the daemon cannot be reached."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def exchange(sock, message, image):
+    send_message(sock, message, image)
+    response, _ = recv_message(sock)
+    return response
+
+
+def query_message(username, k=None, min_score=0, cursor=0):
+    return {'kind': 'query', 'username': username, 'k': k, 'min_score': min_score, 'cursor': cursor}
+
+
+def query(socket_path, username, image, k=None, min_score=0, cursor=0, timeout=TIMEOUT_SECONDS):
+    """returns the daemon's {'status', 'body', 'num_keypoints'} response to the query image. raises OSError if the
+    daemon cannot be reached."""
+    with connect(socket_path, timeout) as sock:
+        return exchange(sock, query_message(username, k, min_score, cursor), image)
+
+
+def try_query(username, image, k=None, min_score=0, cursor=0):
+    """returns the daemon's response to the query image, or None to match in-process, see try_request"""
+    return try_request(query_message(username, k, min_score, cursor), image)
+
+
+def try_match_frame(username, frame, k, last_thumb=None):
+    """returns the daemon's response to a frame of a stream, whose body is that of match_stream.match_frame, or None
+    to match it in-process, see try_request"""
+    return try_request({'kind': 'frame', 'username': username, 'k': k, 'last_thumb': last_thumb}, frame)
+
+
+def try_request(message, image):
+    """returns the daemon's response, or None to match in-process when no daemon is configured or it cannot be
+    connected to. a daemon that accepts the request but times out or fails gets a 503 response: it is up but
+    overloaded, and matching in-process as well would only add to the load."""
+    config = flask.current_app.config
+    if not config['MATCHER_SOCKET']:
+        return None
+    try:
+        sock = connect(config['MATCHER_SOCKET'], config['MATCHER_TIMEOUT_SECONDS'])
+    except OSError as e:
+        flask.current_app.logger.warning(f'matcher daemon unavailable, matching in-process: {e}')
+        return None
+
+    try:
+        with sock:
+            return exchange(sock, message, image)
+    except (OSError, ValueError) as e:
+        flask.current_app.logger.warning(f'matcher daemon query failed: {e}')
+        message = 'matcher timed out' if isinstance(e, TimeoutError) else 'matcher failed'
+        return {'status': 503, 'body': {'status': 503, 'message': f'{message}, try again later'}, 'num_keypoints': 0}
@@ -0,0 +1,117 @@
+import os
+import socketserver
+import stat
+import threading
+import click
+import flask
+from . import album_match
+from . import descriptor_cache
+from . import match_stream
+from . import matcher_client
+
+
+# settings
+# queries matched at once. further connections wait in the socket's backlog, and time out there under overload.
+THREADS = 8
+
+
+def init_app(app):
+    app.config.setdefault('MATCHER_THREADS', int(os.getenv('VITALS_MATCHER_THREADS') or THREADS))
+    app.cli.add_command(matcher_daemon)
+
+
+# Library functions
+
+
+def handle_query(message, image):
+    """returns the response to one query or stream frame message. must be called in an app context."""
+    if message['kind'] == 'frame':
+        body, num_keypoints = match_stream.match_frame(message['username'], memoryview(image), message['k'],
+                                                       message['last_thumb'])
+    else:
+        body, num_keypoints = album_match.match_image(message['username'], memoryview(image), message['k'],
+                                                      message['min_score'], message['cursor'])
+    return {'status': body.get('status', 200), 'body': body, 'num_keypoints': num_keypoints}
+
+
+class QueryHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        app = self.server.app
+        try:
+            message, image = matcher_client.recv_message(self.request, app.config['QUERY_MAX_BYTES'] + 2 ** 16)
+        except (OSError, ValueError) as e:
+            app.logger.warning(f'bad matcher request: {e}')
+            return
+
+        with app.app_context():
+            try:
+                response = handle_query(message, image)
+            except Exception:
+                app.logger.exception('matcher daemon query failed')
+                response = {'status': 500, 'body': {'status': 500, 'message': 'match failed'}, 'num_keypoints': 0}
+
+        matcher_client.send_message(self.request, response)
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, app, socket_path):
+        self.app = app
+        self.stopped = threading.Event()
+        self.threads = threading.BoundedSemaphore(app.config['MATCHER_THREADS'])
+        super().__init__(socket_path, QueryHandler)
+
+    def process_request(self, request, client_address):
+        # stops accepting while every thread is busy
+        self.threads.acquire()
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self.threads.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.threads.release()
+
+
+def create_server(app, socket_path):
+    """returns the server bound to socket_path with its change listener running. call close_server when done."""
+    if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        # left over from a daemon that did not shut down cleanly
+        os.unlink(socket_path)
+    server = Server(app, socket_path)
+    # the web workers may run as another user of the same group
+    os.chmod(socket_path, 0o660)
+    descriptor_cache.start_listener(app, server.stopped)
+    return server
+
+
+def close_server(server):
+    server.stopped.set()
+    server.server_close()
+    os.unlink(server.server_address)
+
+
+# Commands
+
+
+@click.command('matcher-daemon', help='Serve album matches over a unix socket from one resident library index')
+@click.option('--socket', 'socket_path', default=None, help='defaults to VITALS_MATCHER_SOCKET')
+def matcher_daemon(socket_path):
+    app = flask.current_app._get_current_object()
+    socket_path = socket_path or app.config['MATCHER_SOCKET']
+    if not socket_path:
+        raise RuntimeError('pass --socket or set VITALS_MATCHER_SOCKET')
+
+    server = create_server(app, socket_path)
+    print(f'matching on {socket_path}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        close_server(server)
@@ -0,0 +1,104 @@
+import dataclasses
+import os
+import flask
+import numpy as np
+from . import db as vitals_db
+from . import library_index
+
+# settings
+# the prior's albums are matched in tiers of its first 16, then its first 64 albums before the rest of the library
+TIERS = (16, 64)
+# a tier's best album ends the query when it has at least this many matches and leads the tier's runner-up by this
+# fraction of them, see album_match.confidence
+MIN_MATCHES = 60
+MIN_CONFIDENCE = 0.5
+# a play counts half as much after this many days
+HALF_LIFE_DAYS = 30
+# only the user's latest plays are scored
+MAX_PLAYS = 1000
+
+
+def init_app(app):
+    # 0 matches the whole library for every query
+    app.config.setdefault('PRIOR', int(os.getenv('VITALS_PRIOR') or 0))
+    # e.g. VITALS_PRIOR_TIERS=16,64
+    tiers = os.getenv('VITALS_PRIOR_TIERS')
+    app.config.setdefault('PRIOR_TIERS', [int(tier) for tier in tiers.split(',')] if tiers else list(TIERS))
+    app.config.setdefault('PRIOR_MIN_MATCHES', int(os.getenv('VITALS_PRIOR_MIN_MATCHES') or MIN_MATCHES))
+
+
+# Library functions
+
+
+@dataclasses.dataclass
+class Prior:
+    # catalogs most likely first
+    catalogs: list
+    tiers: list
+    min_matches: int = MIN_MATCHES
+    min_confidence: float = MIN_CONFIDENCE
+
+    def matches(self, index, q_descriptor, matcher=None, shards=1):
+        """returns (library rows, query rows) of the matches of the first tier of the prior's albums whose best album
+        passes, or of every album when none does.
+
+        tiers are matched exactly with brute force, which matches each library row on its own, so a tier's matches
+        are the same as the whole index's matches of its albums. with the brute force matcher, a query that passes no
+        tier then matches only the rows that the tiers have not, and gets the same matches as index.matches."""
+        if q_descriptor is None or len(q_descriptor) < 2:
+            return index.matches(q_descriptor, matcher, shards)
+        # row_album of -1 looks up the trailing False
+        in_prior = np.zeros(len(index.albums) + 1, dtype=bool)
+        matched = np.zeros(len(index.row_album), dtype=bool)
+        rows, q_rows = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        for size in self.tiers:
+            positions = [index.positions[catalog] for catalog in self.catalogs[:size] if catalog in index.positions]
+            in_prior[positions] = True
+            tier_rows = np.flatnonzero(in_prior[index.row_album] & ~matched)
+            if not len(tier_rows):
+                continue
+            matched[tier_rows] = True
+            rows, q_rows = merge((rows, q_rows), index.matches_of_rows(q_descriptor, tier_rows))
+            votes = index.count_votes(rows)
+            best, runner_up = (list(votes[library_index.top_k(votes, 2)]) + [0, 0])[:2]
+            if best >= self.min_matches and best - runner_up >= self.min_confidence * best:
+                return rows, q_rows
+
+        if not isinstance(matcher or library_index.BruteForceMatcher(), library_index.BruteForceMatcher):
+            return index.matches(q_descriptor, matcher, shards)
+        return merge((rows, q_rows), index.matches_of_rows(q_descriptor, np.flatnonzero(~matched), shards))
+
+
+def merge(*matches):
+    """returns (library rows, query rows) of all the matches in library row order, the order index.matches returns"""
+    rows = np.concatenate([rows for rows, _ in matches])
+    q_rows = np.concatenate([q_rows for _, q_rows in matches])
+    order = np.argsort(rows, kind='stable')
+    return rows[order], q_rows[order]
+
+
+def prior_catalogs(username, half_life_days=HALF_LIFE_DAYS, limit=None):
+    """returns the user's catalogs most likely first: the current album, then the albums of the latest plays by their
+    play count with each play decayed by its age"""
+    db = vitals_db.get_db()
+    current = db.execute('SELECT current_album FROM users WHERE username = %s;', (username, )).fetchone()
+    rows = db.execute('SELECT catalog, sum(power(0.5, extract(epoch FROM now() - time) / %s)) AS score '
+                      'FROM (SELECT catalog, time FROM listening_history WHERE username = %s '
+                      'ORDER BY time DESC LIMIT %s) AS plays '
+                      'GROUP BY catalog ORDER BY score DESC, catalog LIMIT %s;',
+                      (half_life_days * 86400, username, MAX_PLAYS, limit)).fetchall()
+
+    catalogs = [current.current_album] if current is not None and current.current_album else []
+    return catalogs + [row.catalog for row in rows if row.catalog not in catalogs]
+
+
+def load_prior(username):
+    """returns the user's prior to match queries in order of, or None if it is off or the user has no history"""
+    config = flask.current_app.config
+    if not config['PRIOR'] or not config['PRIOR_TIERS']:
+        return None
+    catalogs = prior_catalogs(username, limit=max(config['PRIOR_TIERS']))
+    if not catalogs:
+        return None
+    return Prior(catalogs, config['PRIOR_TIERS'], config['PRIOR_MIN_MATCHES'])
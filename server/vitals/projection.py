@@ -0,0 +1,148 @@
+import dataclasses
+import os
+import threading
+import time
+import click
+import flask
+import numpy as np
+from . import db as vitals_db
+from . import descriptor_cache
+from . import encode
+from . import features
+from . import library_index
+
+# settings
+DIMS = 64
+# sample at most this many library descriptor rows for the pca
+MAX_TRAINING_ROWS = 200_000
+# how often a worker checks the db for a newer projection
+REFRESH_SECONDS = 60
+# projected descriptors are stored and indexed in this dtype
+DTYPE = 'float16'
+
+
+def init_app(app):
+    # 0 matches the full descriptors
+    app.config.setdefault('PROJECTION', int(os.getenv('VITALS_PROJECTION') or 0))
+    app.cli.add_command(train_projection)
+
+
+# Library functions
+
+
+@dataclasses.dataclass
+class Projection:
+    id: int
+    extractor: str
+    mean: np.ndarray
+    # one row per output dimension. whitened projections scale each row by 1 / sqrt(its eigenvalue).
+    components: np.ndarray
+
+    @property
+    def dims(self):
+        return len(self.components)
+
+    def project(self, descriptor):
+        """returns the descriptor rows projected onto the components"""
+        if descriptor is None:
+            return None
+        return ((np.asarray(descriptor, dtype=np.float32) - self.mean) @ self.components.T).astype(DTYPE)
+
+
+def train(descriptors, dims=DIMS, max_rows=MAX_TRAINING_ROWS, whiten=False, seed=0):
+    """returns (mean, components) of the pca over the album descriptors"""
+    import cv2 as cv
+    stacked, _ = library_index.stack_descriptors(descriptors)
+    stacked = stacked.astype(np.float32)
+    if len(stacked) > max_rows:
+        stacked = stacked[np.random.default_rng(seed).choice(len(stacked), max_rows, replace=False)]
+    if len(stacked) < dims:
+        raise RuntimeError(f'not enough descriptor rows ({len(stacked)}) for {dims} dimensions')
+
+    mean, components, eigenvalues = cv.PCACompute2(stacked, mean=None, maxComponents=dims)
+    if whiten:
+        components = components / np.sqrt(np.maximum(eigenvalues, 1e-6))
+    return mean, components.astype(np.float32)
+
+
+projections = {}  # extractor: (checked time, Projection)
+projections_lock = threading.Lock()
+
+
+def load_projection(extractor):
+    """returns the latest projection of the extractor, or None if none has been trained"""
+    with projections_lock:
+        checked, projection = projections.get(extractor, (0, None))
+        if time.monotonic() - checked < REFRESH_SECONDS:
+            return projection
+
+        db = vitals_db.get_db()
+        row = db.execute('SELECT id FROM projections WHERE extractor = %s ORDER BY id DESC LIMIT 1;',
+                         (extractor, )).fetchone()
+        if row is None:
+            projection = None
+        elif projection is None or projection.id != row.id:
+            stored = encode.decode(db.execute('SELECT projection FROM projections WHERE id = %s;',
+                                              (row.id, )).fetchone().projection)
+            projection = Projection(row.id, extractor, stored['mean'], stored['components'])
+
+        projections[extractor] = time.monotonic(), projection
+        return projection
+
+
+def forget_projections():
+    with projections_lock:
+        projections.clear()
+
+
+def project_album(catalog, descriptor, extractor):
+    """store the album's projected descriptor under the latest projection"""
+    projection = load_projection(extractor)
+    if projection is None or descriptor is None:
+        return
+    vitals_db.get_db().execute('UPDATE albums SET projected = %s, projection = %s WHERE catalog = %s;',
+                               (encode.encode(projection.project(descriptor)), projection.id, catalog))
+
+
+def get_projection():
+    """returns the projection to match with, or None to match the full descriptors"""
+    config = flask.current_app.config
+    return load_projection(config['EXTRACTOR']) if config['PROJECTION'] else None
+
+
+# Commands
+
+
+@click.command('train-projection', help='learn the pca projection of the library descriptors and project every album')
+@click.option('--dims', default=DIMS, help='dimensions to keep')
+@click.option('--whiten', default=False, is_flag=True, help='scale every dimension to unit variance')
+@click.option('--max-rows', default=MAX_TRAINING_ROWS, help='sample at most this many descriptor rows')
+@click.option('--extractor', default=None, type=click.Choice(features.EXTRACTORS),
+              help='defaults to the configured extractor')
+def train_projection(dims, whiten, max_rows, extractor):
+    extractor = extractor or flask.current_app.config['EXTRACTOR']
+    if features.EXTRACTORS[extractor].norm != features.NORM_L2:
+        raise RuntimeError(f'pca projections need an L2 extractor, not {extractor}')
+
+    library = vitals_db.db_load_albums(extractor=extractor, projected=False)
+    print(f'training a {dims} dimension projection over {len(library)} albums')
+    mean, components = train([album.descriptor for album in library.values()], dims, max_rows, whiten)
+
+    db = vitals_db.get_db()
+    with db.transaction():
+        projection_id = db.execute('INSERT INTO projections(extractor, dims, whiten, projection) '
+                                   'VALUES (%s, %s, %s, %s) RETURNING id;',
+                                   (extractor, dims, whiten, encode.encode(dict(mean=mean, components=components)))
+                                   ).fetchone().id
+        projection = Projection(projection_id, extractor, mean, components)
+
+        for catalog, album in library.items():
+            if album.descriptor is None:
+                continue
+            db.execute('UPDATE albums SET projected = %s, projection = %s WHERE catalog = %s;',
+                       (encode.encode(projection.project(album.descriptor)), projection_id, catalog))
+
+    db.commit()
+    forget_projections()
+    descriptor_cache.descriptor_cache.clear()
+    print(f'projection {projection_id} projected {len(library)} albums')
@@ -0,0 +1,52 @@
+import os
+
+# settings
+# thresholds are for the grayscale query as decoded for extraction, about 225 pixels wide
+# more than this fraction of the pixels in the darkest or brightest CLIP_LEVELS gray levels is badly exposed
+MAX_CLIPPED = 0.5
+CLIP_LEVELS = 16
+# standard deviation of the gray levels. a blank wall or a sleeve's plain back has almost none.
+MIN_CONTRAST = 10.0
+# variance of the laplacian. photos of sleeves are in the hundreds, a photo blurred by a sigma of 3 pixels is under 5.
+MIN_SHARPNESS = 25.0
+# the matches of fewer query keypoints than this are noise, see verify.MIN_INLIERS
+MIN_KEYPOINTS = 16
+STATUS = 422
+
+
+def init_app(app):
+    # 0 matches every photo that decodes
+    app.config.setdefault('QUALITY_GATE', int(os.getenv('VITALS_QUALITY_GATE') or 1))
+
+
+# Library functions
+
+
+def rejection(reason, message):
+    return {'status': STATUS, 'message': message, 'reason': reason}
+
+
+def check_image(gray):
+    """returns the error of a photo too badly exposed, blank or blurry to match, or None. each check takes well under
+    a millisecond, against tens for extraction."""
+    import cv2 as cv
+    hist = cv.calcHist([gray], [0], None, [256], [0, 256]).ravel() / gray.size
+    if hist[:CLIP_LEVELS].sum() > MAX_CLIPPED:
+        return rejection('underexposed', 'photo is too dark')
+    if hist[-CLIP_LEVELS:].sum() > MAX_CLIPPED:
+        return rejection('overexposed', 'photo is too bright')
+
+    _, stddev = cv.meanStdDev(gray)
+    if stddev[0, 0] < MIN_CONTRAST:
+        return rejection('blank', 'photo is nearly blank')
+    _, laplacian_stddev = cv.meanStdDev(cv.Laplacian(gray, cv.CV_32F))
+    if laplacian_stddev[0, 0] ** 2 < MIN_SHARPNESS:
+        return rejection('blurry', 'photo is too blurry')
+    return None
+
+
+def check_keypoints(keypoints, min_keypoints=MIN_KEYPOINTS):
+    """returns the error of a photo with too few keypoints to match, or None"""
+    if len(keypoints) < min_keypoints:
+        return rejection('few_features', f'photo has {len(keypoints)} features, fewer than {min_keypoints}')
+    return None
@@ -0,0 +1,80 @@
+import collections
+import os
+import threading
+import numpy as np
+
+# settings
+MAX_ENTRIES = 1024
+# queries whose hashes differ in at most this many of the 64 bits are the same photo
+RADIUS = 4
+# the hash compares each pixel of a HASH_SIZE x HASH_SIZE thumbnail with its right neighbour
+HASH_SIZE = 8
+
+
+def init_app(app):
+    # 0 turns the cache off
+    app.config.setdefault('RESULT_CACHE_ENTRIES', int(os.getenv('VITALS_RESULT_CACHE_ENTRIES') or MAX_ENTRIES))
+    app.config.setdefault('RESULT_CACHE_RADIUS', int(os.getenv('VITALS_RESULT_CACHE_RADIUS') or RADIUS))
+    result_cache.max_entries = app.config['RESULT_CACHE_ENTRIES']
+    result_cache.radius = app.config['RESULT_CACHE_RADIUS']
+    result_cache.clear()
+
+
+# Library functions
+
+
+def perceptual_hash(gray):
+    """returns the 64 bit difference hash of the image, which survives re-encoding, rescaling and small shifts"""
+    import cv2 as cv
+    thumb = cv.resize(gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv.INTER_AREA).astype(np.int16)
+    bits = (thumb[:, 1:] > thumb[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+class ResultCache:
+    """process-wide LRU cache of query responses, keyed by user, query options and the perceptual hash of the query.
+
+    each response is stored with the state it was matched at: the descriptor cache generation, which is bumped whenever
+    an album or collection changes, and whatever else the ranking depends on, such as the user's prior. a response is
+    only returned for the same state, so one matched before a change is never returned after it. stale responses age
+    out of the lru."""
+
+    def __init__(self, max_entries=MAX_ENTRIES, radius=RADIUS):
+        self.max_entries = max_entries
+        self.radius = radius
+        self.entries = collections.OrderedDict()  # (username, options, hash): (state, response)
+        self.lock = threading.Lock()
+
+    def get(self, username, options, q_hash, state):
+        """returns the response of a query within radius of q_hash, or None"""
+        if not self.max_entries:
+            return None
+        with self.lock:
+            # a retry of the same upload hits the exact key, a nearly same photo is found by the scan
+            key = username, options, q_hash
+            if self.entries.get(key, (None, None))[0] != state:
+                key = next((
+                    key for key, (entry_state, _) in self.entries.items()
+                    if key[:2] == (username, options) and entry_state == state
+                    and (key[2] ^ q_hash).bit_count() <= self.radius
+                ), None)
+            if key is None:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key][1]
+
+    def put(self, username, options, q_hash, state, response):
+        if not self.max_entries:
+            return
+        with self.lock:
+            self.entries[username, options, q_hash] = state, response
+            self.entries.move_to_end((username, options, q_hash))
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+result_cache = ResultCache()
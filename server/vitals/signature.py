@@ -0,0 +1,93 @@
+import os
+import click
+import flask
+import numpy as np
+from . import album_match
+from . import db as vitals_db
+from . import descriptor_cache
+from . import encode
+from . import utils
+
+# settings
+HIST_BINS = (16, 4, 4)
+# assume query album will take up about 2/3 of the query picture
+QUERY_CROP = 2 / 3
+
+
+def init_app(app):
+    # 0 matches against the whole library
+    app.config.setdefault('SIGNATURE_CANDIDATES', int(os.getenv('VITALS_SIGNATURE_CANDIDATES') or 0))
+    app.cli.add_command(codegen_signature_test_data)
+    app.cli.add_command(backfill_signatures)
+
+
+# Library functions
+
+
+def center_crop(img, crop):
+    """returns the centered crop of the image, crop of its height and width"""
+    h, w = img.shape[:2]
+    crop_h, crop_w = max(1, int(h * crop)), max(1, int(w * crop))
+    y, x = (h - crop_h) // 2, (w - crop_w) // 2
+    return img[y:y + crop_h, x:x + crop_w]
+
+
+def compute(img, crop=1.0):
+    """returns the l1 normalized hsv colour histogram of the centered crop of a bgr image"""
+    import cv2 as cv
+    hsv = cv.cvtColor(center_crop(img, crop), cv.COLOR_BGR2HSV)
+    hist = cv.calcHist([hsv], [0, 1, 2], None, list(HIST_BINS), [0, 180, 0, 256, 0, 256]).ravel()
+    total = hist.sum()
+    return (hist / total if total else hist).astype(np.float32)
+
+
+def compute_query(img):
+    return compute(img, QUERY_CROP)
+
+
+def shortlist(albums, q_signature, num_candidates):
+    """returns the catalogs of the num_candidates albums whose signature intersects the query signature the most, plus
+    every album without a signature"""
+    signed = [album for album in albums if album.signature is not None]
+    unsigned = [album.catalog for album in albums if album.signature is None]
+    if not signed:
+        return unsigned
+    scores = np.minimum(np.stack([album.signature for album in signed]), q_signature).sum(axis=1)
+    order = np.argsort(-scores, kind='stable')[:num_candidates]
+    return [signed[i].catalog for i in order] + unsigned
+
+
+def get_test_data_signatures(library):
+    queries = []
+
+    for fname, (img, _, _, _) in library.items():
+        catalog, _ = os.path.splitext(fname)
+        queries.append(f"UPDATE albums SET signature = {encode.encode(compute(img))!r} WHERE catalog = '{catalog}' ;")
+
+    return '\n'.join(queries)
+
+
+# Commands
+
+
+@click.command('codegen-signature-test-data', help='Generate SQL code that sets the signature for each album')
+def codegen_signature_test_data():
+    library = album_match.get_filesystem_library('album-covers-original', resize_width=album_match.RESIZE_WIDTH)
+    print(get_test_data_signatures(library))
+
+
+@click.command('backfill-signatures', help='Compute the signature of every album cover that does not have one')
+def backfill_signatures():
+    db = vitals_db.get_db()
+    rows = db.execute('SELECT catalog, album_cover_url FROM albums '
+                      'WHERE album_cover_url IS NOT NULL AND signature IS NULL;')
+
+    for row in rows.fetchall():
+        album_cover_file = utils.static_files() / row.album_cover_url.removeprefix('/static/')
+        img, _, _, _ = album_match.imread(str(album_cover_file), album_match.RESIZE_WIDTH)
+        print(row.catalog)
+        db.execute('UPDATE albums SET signature = %s WHERE catalog = %s;', (encode.encode(compute(img)), row.catalog))
+
+    db.commit()
+    descriptor_cache.descriptor_cache.clear()
+    flask.current_app.logger.info('backfilled signatures')
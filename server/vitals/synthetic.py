@@ -0,0 +1,210 @@
+import concurrent.futures
+import os
+import click
+import flask
+import numpy as np
+import werkzeug.security
+from . import album_match
+from . import db as vitals_db
+from . import descriptor_cache
+from . import encode
+from . import features
+from . import library_index
+from . import signature
+from . import utils
+
+# settings
+COVER_SIZE = 600
+QUERY_SIZE = (800, 600)
+# fraction of the query photo height taken up by the cover
+QUERY_COVER_SCALE = 2 / 3
+MAX_ROTATION_DEGREES = 30
+# corners of the cover move by up to this fraction of its side
+MAX_PERSPECTIVE = 0.1
+MAX_BLUR_SIGMA = 1.5
+JPEG_QUALITY = 85
+
+
+def init_app(app):
+    app.cli.add_command(generate_synthetic_library)
+
+
+# Library functions
+
+
+def random_color(rng):
+    return tuple(int(c) for c in rng.integers(0, 256, 3))
+
+
+def draw_clutter(img, rng, num_shapes):
+    """draws random rectangles, circles and lines on the image in place"""
+    import cv2 as cv
+    h, w = img.shape[:2]
+
+    for _ in range(num_shapes):
+        kind = rng.integers(3)
+        (x1, x2), (y1, y2) = rng.integers(0, w, 2), rng.integers(0, h, 2)
+        thickness = int(rng.choice([-1, 2, 5]))
+        if kind == 0:
+            cv.rectangle(img, (int(x1), int(y1)), (int(x2), int(y2)), random_color(rng), thickness)
+        elif kind == 1:
+            cv.circle(img, (int(x1), int(y1)), int(rng.integers(5, max(6, w // 6))), random_color(rng), thickness)
+        else:
+            cv.line(img, (int(x1), int(y1)), (int(x2), int(y2)), random_color(rng), max(1, thickness))
+
+
+def synthetic_cover(bases, title, rng, size=COVER_SIZE):
+    """returns a new cover made from a random crop of one of the base covers with its hue shifted, random shapes and
+    the title drawn on it"""
+    import cv2 as cv
+    base = bases[rng.integers(len(bases))]
+    h, w = base.shape[:2]
+    crop = rng.uniform(0.5, 1)
+    crop_h, crop_w = int(h * crop), int(w * crop)
+    y, x = rng.integers(0, h - crop_h + 1), rng.integers(0, w - crop_w + 1)
+    cover = cv.resize(base[y:y + crop_h, x:x + crop_w], (size, size))
+    if rng.random() < 0.5:
+        cover = cv.flip(cover, 1)
+
+    hsv = cv.cvtColor(cover, cv.COLOR_BGR2HSV)
+    hsv[..., 0] = (hsv[..., 0].astype(np.int32) + rng.integers(180)) % 180
+    cover = cv.cvtColor(hsv, cv.COLOR_HSV2BGR)
+
+    draw_clutter(cover, rng, int(rng.integers(3, 8)))
+    cv.putText(cover, title, (int(rng.integers(0, size // 3)), int(rng.integers(size // 6, size))),
+               cv.FONT_HERSHEY_DUPLEX, rng.uniform(1, 2.5), random_color(rng), int(rng.integers(2, 5)))
+    return cover
+
+
+def augmented_query(cover, rng, size=QUERY_SIZE):
+    """returns a photo of the cover rotated and in perspective on a cluttered background, with glare and blur"""
+    import cv2 as cv
+    width, height = size
+    photo = cv.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (0, 0), 6)
+    draw_clutter(photo, rng, 20)
+
+    # the cover's corners, rotated about the center of the photo and jittered for perspective
+    side = height * QUERY_COVER_SCALE * rng.uniform(0.8, 1)
+    angle = np.radians(rng.uniform(-MAX_ROTATION_DEGREES, MAX_ROTATION_DEGREES))
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    corners = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]]) * side / 2
+    corners = corners @ rotation.T + rng.uniform(-MAX_PERSPECTIVE, MAX_PERSPECTIVE, (4, 2)) * side
+    corners += (width / 2, height / 2) + rng.uniform(-0.1, 0.1, 2) * (width, height)
+
+    h, w = cover.shape[:2]
+    src = np.float32([[0, 0], [w, 0], [w, h], [0, h]])
+    transform = cv.getPerspectiveTransform(src, corners.astype(np.float32))
+    warped = cv.warpPerspective(cover, transform, (width, height))
+    mask = cv.warpPerspective(np.full((h, w), 255, np.uint8), transform, (width, height))
+    photo[mask > 0] = warped[mask > 0]
+
+    # a soft bright spot of glare
+    y, x = np.mgrid[:height, :width]
+    gx, gy = rng.uniform(0, width), rng.uniform(0, height)
+    radius = rng.uniform(0.05, 0.2) * width
+    glare = rng.uniform(0.3, 0.8) * 255 * np.exp(-((x - gx) ** 2 + (y - gy) ** 2) / (2 * radius ** 2))
+    photo = np.clip(photo + glare[..., None], 0, 255).astype(np.uint8)
+
+    sigma = rng.uniform(0, MAX_BLUR_SIGMA)
+    if sigma > 0.3:
+        photo = cv.GaussianBlur(photo, (0, 0), sigma)
+    return photo
+
+
+def encode_jpeg(img):
+    import cv2 as cv
+    return cv.imencode('.jpg', img, [cv.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])[1].tobytes()
+
+
+def make_album(bases, catalog, i, num_queries, queries_dir, extractors, dtype, max_keypoints, seed):
+    """returns the albums table row of the i-th synthetic album and writes its cover and num_queries query photos of
+    it"""
+    # each album has its own generator so that it does not depend on the number of albums, queries or workers
+    rng = np.random.default_rng([seed, i])
+    title = f'Synthetic {i}'
+    cover = synthetic_cover(bases, title, rng)
+    content = encode_jpeg(cover)
+    (utils.static_files() / 'album_cover' / f'{catalog}.jpg').write_bytes(content)
+
+    descriptors = {}
+    keypoints = {}
+    for extractor in extractors:
+        img, _, album_keypoints, descriptors[extractor] = album_match.imread(
+            content, resize_width=album_match.RESIZE_WIDTH, extractor=extractor, max_keypoints=max_keypoints)
+        keypoints[extractor] = features.points(album_keypoints)
+
+    for n in range(num_queries):
+        with open(os.path.join(queries_dir, f'{catalog}.{n}.jpg'), 'wb') as f:
+            f.write(encode_jpeg(augmented_query(cover, rng)))
+
+    # encoding compresses, which takes most of the time, so it happens on the worker too
+    return (catalog, title, 'synthetic', 1, f'/static/album_cover/{catalog}.jpg',
+            encode.encode_descriptors(descriptors, dtype), encode.encode_keypoints(keypoints),
+            encode.encode(signature.compute(img)))
+
+
+def load_synthetic_library(username, password, bases, num_albums, num_queries, queries_dir, prefix='SYN', seed=0,
+                           workers=1):
+    """bulk loads num_albums synthetic albums into the user's collection, creating the user if needed, and writes
+    num_queries query photos of random albums to queries_dir. the albums are made on a pool of workers threads."""
+    db = vitals_db.get_db()
+    catalogs = [f'{prefix}-{i:05}' for i in range(num_albums)]
+    if db.execute('SELECT 1 FROM albums WHERE catalog = ANY(%s) LIMIT 1;', (catalogs, )).fetchone() is not None:
+        raise RuntimeError(f'albums with the prefix {prefix} already exist')
+
+    rng = np.random.default_rng(seed)
+    album_queries = np.bincount(rng.integers(0, num_albums, num_queries), minlength=num_albums)
+    os.makedirs(queries_dir, exist_ok=True)
+    (utils.static_files() / 'album_cover').mkdir(parents=True, exist_ok=True)
+    app = flask.current_app._get_current_object()
+
+    def make(i):
+        with app.app_context():
+            return make_album(bases, catalogs[i], i, int(album_queries[i]), queries_dir,
+                              app.config['INGEST_EXTRACTORS'], app.config['DESCRIPTOR_DTYPE'],
+                              app.config['ALBUM_KEYPOINTS'], seed)
+
+    with db.transaction(), concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        db.execute('INSERT INTO users(username, password) VALUES (%s, %s) ON CONFLICT DO NOTHING;',
+                   (username, werkzeug.security.generate_password_hash(password)))
+        with db.cursor().copy('COPY albums(catalog, title, artist, num_discs, album_cover_url, descriptor, keypoints, '
+                              'signature) FROM STDIN') as copy:
+            for i, row in enumerate(executor.map(make, range(num_albums))):
+                copy.write_row(row)
+                if (i + 1) % 1000 == 0:
+                    print(f'{i + 1} albums')
+        with db.cursor().copy('COPY collections(username, catalog) FROM STDIN') as copy:
+            for catalog in catalogs:
+                copy.write_row((username, catalog))
+
+    db.commit()
+    descriptor_cache.descriptor_cache.invalidate_collections()
+
+
+# Commands
+
+
+@click.command('generate-synthetic-library',
+               help='Bulk load a library of synthetic albums and write augmented query photos of them')
+@click.option('--albums', 'num_albums', default=1000, help='number of albums')
+@click.option('--queries', 'num_queries', default=100, help='number of query photos')
+@click.option('--queries-dir', default='synthetic-queries', type=click.Path(file_okay=False),
+              help='folder to write the query photos to, named for bench-matcher')
+@click.option('--username', default='synthuser', help='user that collects every synthetic album')
+@click.option('--password', default='synthetic', help='password of the user if it is created')
+@click.option('--prefix', default='SYN', help='catalogs are <prefix>-<number>')
+@click.option('--covers', default='album-covers-original', type=click.Path(exists=True, file_okay=False),
+              help='folder of covers to make the synthetic covers from')
+@click.option('--seed', default=0, help='the same seed generates the same albums and queries')
+@click.option('--workers', default=os.cpu_count() or 1, help='threads that make the albums')
+def generate_synthetic_library(num_albums, num_queries, queries_dir, username, password, prefix, covers, seed,
+                               workers):
+    import cv2 as cv
+    bases = [cv.imread(os.path.join(covers, fname)) for fname in sorted(os.listdir(covers))]
+    bases = [base for base in bases if base is not None]
+    if not bases:
+        raise RuntimeError(f'no covers in {covers}')
+
+    load_synthetic_library(username, password, bases, num_albums, num_queries, queries_dir, prefix, seed, workers)
+    library_index.republish_shared_index()
+    print(f'loaded {num_albums} albums for {username} and wrote {num_queries} queries to {queries_dir}')
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+from . import library_index
+
+# settings
+# reprojection error in pixels of the library cover, which is RESIZE_WIDTH wide
+RANSAC_THRESHOLD = 5.0
+# a homography with fewer inliers than this is noise. any 4 matches fit one exactly.
+MIN_INLIERS = 10
+# stop verifying once the best album has this many times the inliers that any other album has or could still get
+MARGIN = 2.0
+
+
+def init_app(app):
+    # 0 ranks by raw matches only
+    app.config.setdefault('VERIFY_CANDIDATES', int(os.getenv('VITALS_VERIFY_CANDIDATES') or 0))
+
+
+# Library functions
+
+
+class Inliers(int):
+    """the matches_stat of a verified album, which counts homography inliers rather than raw matches"""
+
+
+def inliers(src, dst, min_inliers=MIN_INLIERS):
+    """returns the number of matches that agree on one homography from src to dst, or 0 if fewer than min_inliers
+    do"""
+    import cv2 as cv
+    if len(src) < max(4, min_inliers):
+        return 0
+    _, mask = cv.findHomography(src, dst, cv.RANSAC, RANSAC_THRESHOLD)
+    num_inliers = 0 if mask is None else int(np.count_nonzero(mask))
+    return num_inliers if num_inliers >= min_inliers else 0
+
+
+def rank(index, rows, q_rows, q_points, num_candidates, min_inliers=MIN_INLIERS, margin=MARGIN, k=None):
+    """returns [(matches_stat, album)] where the albums with the most matches are verified in order, and those that
+    pass are ranked first by their homography inliers. the rest of the albums follow by their raw matches, and the
+    candidates that failed verification come last with 0 inliers. so matches_stat is in mixed units: the verified
+    albums' are Inliers, the others' are raw matches.
+
+    inliers never exceed raw matches, so verification stops as soon as the best album clears min_inliers and has
+    margin times the inliers of the runner-up and of the raw matches of the next unverified album. albums stored
+    without keypoint geometry cannot be verified and keep their raw matches. if k is given only the top k are
+    returned."""
+    votes = index.count_votes(rows)
+    # the verified albums and the next unverified one are all within the first num_candidates + 1
+    order = library_index.top_k(votes, None if k is None else k + num_candidates + 1)
+    row_album = index.row_album[rows]
+    scores = []  # (inliers, album position)
+
+    for n, i in enumerate(order[:num_candidates]):
+        if not votes[i]:
+            break
+        album_rows = row_album == i
+        src = np.asarray(index.points[rows[album_rows]], dtype=np.float32)
+        score = int(votes[i]) if np.isnan(src).any() else Inliers(inliers(src, q_points[q_rows[album_rows]],
+                                                                          min_inliers))
+        scores.append((score, i))
+        scores.sort(key=lambda score: -score[0])
+
+        best = scores[0][0]
+        runner_up = max(scores[1][0] if len(scores) > 1 else 0,
+                        votes[order[n + 1]] if n + 1 < len(order) else 0)
+        if best >= min_inliers and best >= margin * runner_up:
+            break
+
+    verified = {i for _, i in scores}
+    return ([(score, index.albums[i]) for score, i in scores if score] + [
+        (int(votes[i]), index.albums[i])
+        for i in order
+        if i not in verified
+    ] + [(score, index.albums[i]) for score, i in scores if not score])[:k]
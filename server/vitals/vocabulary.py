@@ -0,0 +1,242 @@
+import dataclasses
+import os
+import threading
+import time
+import click
+import flask
+import numpy as np
+from . import db as vitals_db
+from . import descriptor_cache
+from . import encode
+from . import features
+from . import library_index
+
+# settings
+WORDS = 1000
+# sample at most this many library descriptor rows for k-means
+MAX_TRAINING_ROWS = 200_000
+# how often a worker checks the db for a newer vocabulary, and for albums changed since its inverted file was built
+REFRESH_SECONDS = 60
+
+
+def init_app(app):
+    # 0 matches against the whole library
+    app.config.setdefault('BOW_CANDIDATES', int(os.getenv('VITALS_BOW_CANDIDATES') or 0))
+    app.cli.add_command(train_vocabulary)
+
+
+# Library functions
+
+
+@dataclasses.dataclass
+class Vocabulary:
+    id: int
+    extractor: str
+    centers: np.ndarray
+    idf: np.ndarray
+
+    def words(self, descriptor):
+        """returns the visual word of each descriptor row"""
+        import cv2 as cv
+        if descriptor is None or not len(descriptor):
+            return np.empty(0, dtype=np.int64)
+        _, nidx = cv.batchDistance(np.asarray(descriptor, dtype=np.float32), self.centers, cv.CV_32F,
+                                   normType=cv.NORM_L2, K=1)
+        return nidx[:, 0].astype(np.int64)
+
+    def bow(self, descriptor):
+        """returns the l2 normalized tf-idf vector of the descriptor as (word ids, weights)"""
+        counts = np.bincount(self.words(descriptor), minlength=len(self.centers))
+        ids = np.flatnonzero(counts)
+        weights = counts[ids] / counts.sum() * self.idf[ids] if len(ids) else np.empty(0)
+        norm = np.linalg.norm(weights)
+        return ids, (weights / norm if norm else weights).astype(np.float32)
+
+
+def train(descriptors, num_words=WORDS, max_rows=MAX_TRAINING_ROWS, seed=0):
+    """returns (centers, idf) trained with k-means over the album descriptors"""
+    import cv2 as cv
+    stacked, _ = library_index.stack_descriptors(descriptors)
+    stacked = stacked.astype(np.float32)
+    if len(stacked) > max_rows:
+        stacked = stacked[np.random.default_rng(seed).choice(len(stacked), max_rows, replace=False)]
+    if len(stacked) < num_words:
+        raise RuntimeError(f'not enough descriptor rows ({len(stacked)}) for {num_words} words')
+
+    cv.setRNGSeed(seed)
+    criteria = (cv.TERM_CRITERIA_EPS + cv.TERM_CRITERIA_MAX_ITER, 20, 1.0)
+    _, _, centers = cv.kmeans(stacked, num_words, None, criteria, 1, cv.KMEANS_PP_CENTERS)
+
+    # document frequency of each word over the albums
+    vocabulary = Vocabulary(None, None, centers, np.ones(num_words, dtype=np.float32))
+    df = np.zeros(num_words, dtype=np.int64)
+    for descriptor in descriptors:
+        df[np.unique(vocabulary.words(descriptor))] += 1
+    idf = np.log((len(descriptors) + 1) / (df + 1)).astype(np.float32)
+    return centers, idf
+
+
+class InvertedFile:
+    """posting lists of (album, weight) for each visual word"""
+
+    def __init__(self, vocabulary):
+        self.vocabulary = vocabulary
+        self.catalogs = []
+        self.positions = {}
+        self.postings = {}  # word: (album positions, weights)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_bows(cls, vocabulary, bows):
+        """returns the inverted file of [(catalog, word ids, weights)]. the postings of all the albums are grouped by
+        word with one sort, where adding the albums one by one copies a posting list for every word of every album."""
+        inverted_file = cls(vocabulary)
+        catalogs, ids, weights = zip(*bows) if bows else ((), (), ())
+        inverted_file.catalogs = list(catalogs)
+        inverted_file.positions = {catalog: position for position, catalog in enumerate(catalogs)}
+        if not catalogs:
+            return inverted_file
+
+        words = np.concatenate(ids).astype(np.int64)
+        albums = np.repeat(np.arange(len(catalogs), dtype=np.int64), [len(album_ids) for album_ids in ids])
+        album_weights = np.concatenate(weights).astype(np.float32)
+        # stable, so that each posting list is in album order like add makes it
+        order = np.argsort(words, kind='stable')
+        unique_words, starts = np.unique(words[order], return_index=True)
+        inverted_file.postings = dict(zip(unique_words.tolist(), zip(np.split(albums[order], starts[1:]),
+                                                                     np.split(album_weights[order], starts[1:]))))
+        return inverted_file
+
+    def add(self, catalog, ids, weights):
+        """adds or replaces one album, for albums indexed after the inverted file was built"""
+        with self.lock:
+            if catalog in self.positions:
+                position = self.positions[catalog]
+                self.postings = {
+                    word: (albums[albums != position], album_weights[albums != position])
+                    for word, (albums, album_weights) in self.postings.items()
+                }
+            else:
+                position = len(self.catalogs)
+                self.catalogs.append(catalog)
+                self.positions[catalog] = position
+
+            for word, weight in zip(ids.tolist(), weights.tolist()):
+                albums, album_weights = self.postings.get(word, (np.empty(0, np.int64), np.empty(0, np.float32)))
+                self.postings[word] = np.append(albums, position), np.append(album_weights, np.float32(weight))
+
+    def shortlist(self, catalogs, q_descriptor, num_candidates):
+        """returns the num_candidates catalogs that score highest against the query, plus every catalog that is not
+        indexed yet so that new albums are never skipped"""
+        ids, weights = self.vocabulary.bow(q_descriptor)
+
+        with self.lock:
+            scores = np.zeros(len(self.catalogs), dtype=np.float32)
+            for word, weight in zip(ids.tolist(), weights.tolist()):
+                if word in self.postings:
+                    albums, album_weights = self.postings[word]
+                    scores[albums] += weight * album_weights
+
+            indexed = [catalog for catalog in catalogs if catalog in self.positions]
+            not_indexed = [catalog for catalog in catalogs if catalog not in self.positions]
+            indexed_scores = scores[[self.positions[catalog] for catalog in indexed]]
+
+        order = np.argsort(-indexed_scores, kind='stable')[:num_candidates]
+        return [indexed[i] for i in order] + not_indexed
+
+
+inverted_files = {}  # extractor: (checked time, descriptor cache album generation, InvertedFile)
+inverted_files_lock = threading.Lock()
+
+
+def load_vocabulary(extractor):
+    row = vitals_db.get_db().execute('SELECT id, vocabulary FROM vocabularies WHERE extractor = %s '
+                                     'ORDER BY id DESC LIMIT 1;', (extractor, )).fetchone()
+    if row is None:
+        return None
+    vocabulary = encode.decode(row.vocabulary)
+    return Vocabulary(row.id, extractor, vocabulary['centers'], vocabulary['idf'])
+
+
+def load_inverted_file(extractor):
+    """returns the inverted file of the latest vocabulary of the extractor, or None if none has been trained. it is
+    rebuilt when the vocabulary changes or when any album has changed since it was built, such as an album indexed or
+    re-indexed in place by another process, which the descriptor cache hears of, see descriptor_cache.listen."""
+    with inverted_files_lock:
+        checked, generation, inverted_file = inverted_files.get(extractor, (0, None, None))
+        if time.monotonic() - checked < REFRESH_SECONDS:
+            return inverted_file
+
+        # read before the db, so that a change made while the postings load is picked up at the next refresh
+        new_generation = descriptor_cache.descriptor_cache.album_generation
+        vocabulary = load_vocabulary(extractor)
+        if vocabulary is None:
+            inverted_files[extractor] = time.monotonic(), None, None
+            return None
+
+        if inverted_file is None or inverted_file.vocabulary.id != vocabulary.id or new_generation != generation:
+            rows = vitals_db.get_db().execute('SELECT catalog, bow FROM albums WHERE bow_vocabulary = %s;',
+                                              (vocabulary.id, )).fetchall()
+            inverted_file = InvertedFile.from_bows(vocabulary, [(row.catalog, *encode.decode(row.bow)) for row in rows])
+
+        inverted_files[extractor] = time.monotonic(), new_generation, inverted_file
+        return inverted_file
+
+
+def forget_inverted_files():
+    with inverted_files_lock:
+        inverted_files.clear()
+
+
+def index_album(catalog, descriptor, extractor):
+    """store the album's bag of words under the latest vocabulary and add it to this worker's posting lists"""
+    inverted_file = load_inverted_file(extractor)
+    if inverted_file is None:
+        return
+    ids, weights = inverted_file.vocabulary.bow(descriptor)
+    vitals_db.get_db().execute('UPDATE albums SET bow = %s, bow_vocabulary = %s WHERE catalog = %s;',
+                               (encode.encode((ids, weights)), inverted_file.vocabulary.id, catalog))
+    inverted_file.add(catalog, ids, weights)
+
+
+def shortlist(catalogs, q_descriptor, extractor):
+    """returns the candidate catalogs to match, or None to match every catalog"""
+    num_candidates = flask.current_app.config['BOW_CANDIDATES']
+    if not num_candidates or len(catalogs) <= num_candidates:
+        return None
+    inverted_file = load_inverted_file(extractor)
+    if inverted_file is None:
+        return None
+    return inverted_file.shortlist(catalogs, q_descriptor, num_candidates)
+
+
+# Commands
+
+
+@click.command('train-vocabulary', help='train the visual vocabulary and rebuild every album bag of words')
+@click.option('--words', default=WORDS, help='number of visual words')
+@click.option('--max-rows', default=MAX_TRAINING_ROWS, help='sample at most this many descriptor rows')
+@click.option('--extractor', default=None, type=click.Choice(features.EXTRACTORS),
+              help='defaults to the configured extractor')
+def train_vocabulary(words, max_rows, extractor):
+    extractor = extractor or flask.current_app.config['EXTRACTOR']
+    if features.EXTRACTORS[extractor].norm != features.NORM_L2:
+        raise RuntimeError(f'k-means vocabularies need an L2 extractor, not {extractor}')
+
+    library = vitals_db.db_load_albums(extractor=extractor, projected=False)
+    descriptors = [album.descriptor for album in library.values()]
+    print(f'training {words} words over {len(library)} albums')
+    centers, idf = train(descriptors, words, max_rows)
+
+    db = vitals_db.get_db()
+    with db.transaction():
+        vocabulary_id = db.execute('INSERT INTO vocabularies(extractor, vocabulary) VALUES (%s, %s) RETURNING id;',
+                                   (extractor, encode.encode(dict(centers=centers, idf=idf)))).fetchone().id
+        vocabulary = Vocabulary(vocabulary_id, extractor, centers, idf)
+
+        for catalog, album in library.items():
+            db.execute('UPDATE albums SET bow = %s, bow_vocabulary = %s WHERE catalog = %s;',
+                       (encode.encode(vocabulary.bow(album.descriptor)), vocabulary_id, catalog))
+
+    forget_inverted_files()
+    print(f'vocabulary {vocabulary_id} indexed {len(library)} albums')
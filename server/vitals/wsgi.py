@@ -8,11 +8,28 @@ import json
 login_manager = flask_login.LoginManager()
 
 from . import album_match
+from . import benchmark
 from . import db
+from . import descriptor_cache
 from . import encode
+from . import features
+from . import library_index
 from . import user
 from . import discogs_auth
 from . import discogs_sync
+from . import vocabulary
+from . import signature
+from . import verify
+from . import match_jobs
+from . import matcher_client
+from . import matcher_daemon
+from . import synthetic
+from . import projection
+from . import match_stream
+from . import crop
+from . import result_cache
+from . import prior
+from . import quality
 
 VERSION = '0.0.1'
 USER_AGENT = f'vitals/{VERSION}'
@@ -82,12 +99,29 @@ def create_app(*, vitals_testing=False):
     login_manager.init_app(app)
     app.test_client_class = flask_login.FlaskLoginClient
 
+    features.init_app(app)
     album_match.init_app(app)
+    benchmark.init_app(app)
     db.init_app(app)
+    descriptor_cache.init_app(app)
     encode.init_app(app)
+    library_index.init_app(app)
     user.init_app(app)
     discogs_auth.init_app(app)
     discogs_sync.init_app(app)
+    vocabulary.init_app(app)
+    signature.init_app(app)
+    verify.init_app(app)
+    match_jobs.init_app(app)
+    matcher_client.init_app(app)
+    matcher_daemon.init_app(app)
+    synthetic.init_app(app)
+    projection.init_app(app)
+    match_stream.init_app(app)
+    crop.init_app(app)
+    result_cache.init_app(app)
+    prior.init_app(app)
+    quality.init_app(app)
 
     if app.debug:
         secret_key = 'development'